@@ -1,7 +1,8 @@
 """Pytest configuration for stable doctests.
 
 This keeps doctest examples deterministic by intercepting network calls to
-example.com that appear in documentation snippets.
+example.com that appear in documentation snippets, and leaves wall-clock
+benchmarks out of the default run.
 """
 
 from __future__ import annotations
@@ -14,6 +15,26 @@ import pytest
 from _pytest.doctest import DoctestItem
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--benchmarks",
+        action="store_true",
+        help="run the timing benchmarks (tests marked benchmark)",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip wall-clock benchmarks unless asked for; they're noisy on busy machines."""
+    if config.getoption("--benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="timing benchmark; run with --benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 def _is_example_com(url: str) -> bool:
     """Return True for doctest placeholder URLs."""
     parsed = urlparse(url)
@@ -16,7 +16,12 @@ from .schema_utils import (
     get_request_body_type_schema,
     get_success_endpoint_refs,
 )
-from .utils import camel_to_snake, get_template_environment, process_endpoint_parameters
+from .utils import (
+    annotation,
+    camel_to_snake,
+    get_template_environment,
+    process_endpoint_parameters,
+)
 
 
 def generate_client_classes(cwd: str, data: dict, examples: list):
@@ -241,9 +246,13 @@ def generate_client_classes(cwd: str, data: dict, examples: list):
                     if not is_required or param_schema.get("nullable", False):
                         if not param_type.startswith("Optional["):
                             param_type = f"Optional[{param_type}]"
-                        optional_params.append(f"{param_name}: {param_type} = None")
+                        optional_params.append(
+                            f"{param_name}: {annotation(param_type)} = None"
+                        )
                     else:
-                        required_params.append(f"{param_name}: {param_type}")
+                        required_params.append(
+                            f"{param_name}: {annotation(param_type)}"
+                        )
 
                     call_arg_parts.append(f"{param_name}={param_name}")
 
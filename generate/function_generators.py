@@ -67,6 +67,11 @@ Examples:
     return base_docs
 
 
+def _is_local_unit_conversion(fn_name: str, path: str) -> bool:
+    """Whether an endpoint can also be served by the offline converter in kittycad.units."""
+    return path.startswith("/unit/conversion/") and fn_name.endswith("_unit_conversion")
+
+
 def generate_sync_function(path: str, method: str, endpoint: dict, data: dict) -> str:
     """Generate a sync function implementation using the sync_function template"""
 
@@ -146,6 +151,10 @@ def generate_sync_function(path: str, method: str, endpoint: dict, data: dict) -
     # Check if there's actually a body parameter in the args
     has_body_param = any(arg.get("name") == "body" for arg in args)
 
+    docs = _generate_docstring_with_examples(endpoint, file_info, request_body_type)
+    if _is_local_unit_conversion(fn_name, path):
+        docs += "\n\nPass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."
+
     # Create context for template with all required variables
     context = {
         "func_name": fn_name,
@@ -155,10 +164,13 @@ def generate_sync_function(path: str, method: str, endpoint: dict, data: dict) -
         "has_request_body": has_body_param,
         "request_body_type": request_body_type,
         "args": args,
-        "docs": _generate_docstring_with_examples(
-            endpoint, file_info, request_body_type
-        ),
+        "docs": docs,
         "file_info": file_info,  # Add file operation info to context
+        # Operation metadata attached to each request for the transport stack
+        "operation_id": endpoint["operationId"],
+        "tag": endpoint.get("tags", ["api"])[0].replace("-", "_"),
+        "path": path,
+        "local_unit_conversion": _is_local_unit_conversion(fn_name, path),
     }
 
     # Add pagination-specific context if needed
@@ -252,6 +264,10 @@ def generate_async_function(path: str, method: str, endpoint: dict, data: dict)
     # Check if there's actually a body parameter in the args
     has_body_param = any(arg.get("name") == "body" for arg in args)
 
+    docs = _generate_docstring_with_examples(endpoint, file_info, request_body_type)
+    if _is_local_unit_conversion(fn_name, path):
+        docs += "\n\nPass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."
+
     # Create context for template with all required variables
     context = {
         "func_name": fn_name,
@@ -261,10 +277,13 @@ def generate_async_function(path: str, method: str, endpoint: dict, data: dict)
         "has_request_body": has_body_param,
         "request_body_type": request_body_type,
         "args": args,
-        "docs": _generate_docstring_with_examples(
-            endpoint, file_info, request_body_type
-        ),
+        "docs": docs,
         "file_info": file_info,  # Add file operation info to context
+        # Operation metadata attached to each request for the transport stack
+        "operation_id": endpoint["operationId"],
+        "tag": endpoint.get("tags", ["api"])[0].replace("-", "_"),
+        "path": path,
+        "local_unit_conversion": _is_local_unit_conversion(fn_name, path),
     }
 
     # Add pagination-specific context if needed
@@ -295,6 +314,7 @@ def generate_websocket_sync_function(
         function_name=operation_id,
         args=args,
         url_template=path,
+        tag=endpoint.get("tags", ["api"])[0].replace("-", "_"),
         docs=endpoint.get("summary", "").replace('"', '\\"'),
     )
 
@@ -315,5 +335,6 @@ def generate_websocket_async_function(
         function_name=operation_id,
         args=args,
         url_template=path,
+        tag=endpoint.get("tags", ["api"])[0].replace("-", "_"),
         docs=endpoint.get("summary", "").replace('"', '\\"'),
     )
@@ -253,6 +253,77 @@ You can break out of the iteration at any time:
         if count >= 100:
             break
 
+Or let the iterator stop for you. ``take`` never fetches a page it won't
+need, and lowers ``limit`` so the last page holds no more than is left:
+
+.. code-block:: python
+
+    for item in client.api_calls.list_api_calls().take(100):
+        print(item)
+
+Whole Pages
+~~~~~~~~~~~
+
+``pages()`` yields each page as returned, with its ``items`` and the
+``next_page`` token that leads to the page after it:
+
+.. code-block:: python
+
+    for page in client.api_calls.list_api_calls(limit=100).pages():
+        save_batch(page.items)
+        print("next:", page.next_page)
+
+Adaptive Page Size
+~~~~~~~~~~~~~~~~~~
+
+``adaptive()`` lets the SDK pick ``limit``: it grows page by page while
+pages come back faster than a target latency, and shrinks when they don't.
+Large exports then need far fewer round trips:
+
+.. code-block:: python
+
+    from kittycad.pagination import AdaptivePageSize
+
+    for item in client.api_calls.list_api_calls().adaptive(
+        AdaptivePageSize(target_latency=0.5, max_limit=100)
+    ):
+        print(item)
+
+Resuming Long Crawls
+~~~~~~~~~~~~~~~~~~~~
+
+``checkpoint_to`` saves the iterator's position to a file or a SQLite
+database after each page, and resumes from it on the next run. A page is
+only delivered again if the previous run stopped before moving past it:
+
+.. code-block:: python
+
+    from kittycad.checkpoints import SQLiteCheckpointStore
+
+    store = SQLiteCheckpointStore("crawl.db", key="dataset-42")
+    conversions = client.orgs.list_org_dataset_conversions(id="42")
+    for page in conversions.checkpoint_to(store).pages():
+        save_batch(page.items)
+
+``iterator.checkpoint`` holds the current page token and item offset, for
+``resume_from`` without a store.
+
+Columnar Export
+~~~~~~~~~~~~~~~
+
+``columns`` reads chosen fields of every item into NumPy arrays, one chunk
+of rows at a time, without building a model per item. Each chunk converts to
+Arrow with ``pyarrow`` installed. Needs ``pip install kittycad[numpy]``:
+
+.. code-block:: python
+
+    fields = {"created_at": "datetime", "endpoint": "str", "price": "float64"}
+    for chunk in client.api_calls.user_list_api_calls().columns(fields):
+        writer.write_batch(chunk.to_arrow())
+
+Nulls are marked in ``chunk.valid``. With ``checkpoint_to``, a checkpoint is
+saved after each chunk.
+
 Memory Efficiency
 ~~~~~~~~~~~~~~~~
 
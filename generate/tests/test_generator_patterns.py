@@ -47,8 +47,8 @@ class TestResponseValidation:
         client_file = Path(kittycad.__file__)
         content = client_file.read_text()
 
-        assert '.model_validate(json_data, extra="ignore")' in content
-        assert '.validate_python(json_data, extra="ignore")' in content
+        assert '.model_validate_json(content, extra="ignore")' in content
+        assert '.validate_json(content, extra="ignore")' in content
 
 
 class TestRequestSerialization:
@@ -60,10 +60,49 @@ class TestRequestSerialization:
         client_file = Path(kittycad.__file__)
         content = client_file.read_text()
 
-        assert "from .types import serialize_request_body" in content
-        assert "content=serialize_request_body(body)" in content
+        assert "from .types import encode_request_body" in content
+        assert "content=encode_request_body(body, self.client.json_codec)" in content
         assert "content=body.model_dump_json(exclude_unset=True)" not in content
 
+    def test_shared_macros_use_the_client_codec(self):
+        macros = Path(__file__).parent.parent / "templates" / "shared_macros.jinja2"
+        content = macros.read_text()
+
+        assert "content=encode_request_body(body, self.client.json_codec)" in content
+        assert "serialize_request_body" not in content
+        assert "response.json()" not in content
+
+
+class TestWebSocketFunctions:
+    """Ensure both websocket templates connect through the client."""
+
+    @pytest.mark.parametrize("sync", [True, False])
+    def test_websocket_functions_use_hooks_and_routing(self, sync):
+        from generate.function_generators import (
+            generate_websocket_async_function,
+            generate_websocket_sync_function,
+        )
+
+        generate = (
+            generate_websocket_sync_function
+            if sync
+            else generate_websocket_async_function
+        )
+        endpoint = {"tags": ["executor-term"], "summary": "Open a terminal."}
+        code = generate(
+            "create_executor_term", "/ws/executor/term", "get", endpoint, {}
+        )
+
+        ast.parse("class API:\n" + code)
+        assert (
+            'OperationInfo("create_executor_term", "executor_term", '
+            '"/ws/executor/term")' in code
+        )
+        connect = "connect_websocket" if sync else "connect_websocket_async"
+        assert f"return {'' if sync else 'await '}{connect}(" in code
+        factory = "ws_connect" if sync else "ws_connect_async"
+        assert f"self.client.get_websocket_connect({factory})" in code
+
 
 class TestMultipartEndpoints:
     """Test multipart endpoints produce upload_* with file: SyncUpload, correct multipart code."""
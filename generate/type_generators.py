@@ -35,17 +35,11 @@ def generate_types(cwd: str, parser: dict):
     path = os.path.join(cwd, "kittycad", "models")
     os.makedirs(path, exist_ok=True)
 
-    # Open the __init__.py file.
-    file_name = "__init__.py"
-    file_path = os.path.join(path, file_name)
-    f = open(file_path, "w")
-    f.write('""" Contains all the data models used in inputs/outputs """\n')
-    f.write("\n")
-
     # Generate the types.
     data = parser
     schemas = data["components"]["schemas"]
     generated_files = []
+    exports = []
 
     for key in schemas:
         schema = schemas[key]
@@ -53,17 +47,17 @@ def generate_types(cwd: str, parser: dict):
         model_file_path = generate_type(path, key, schema, data)
         if model_file_path:
             generated_files.append(model_file_path)
-        f.write("from ." + camel_to_snake(key) + " import " + key + "\n")
+        exports.append((key, camel_to_snake(key)))
 
     # Add the base model import
-    f.write("from .base import KittyCadBaseModel\n")
+    exports.append(("KittyCadBaseModel", "base"))
+    exports.append(("KittyCadRootModel", "base"))
 
     # This is a hot fix for the empty type.
     # We likely need a better way to handle this.
-    f.write("from .empty import Empty\n")
+    exports.append(("Empty", "empty"))
 
-    # Close the file.
-    f.close()
+    write_models_init(os.path.join(path, "__init__.py"), exports)
 
     # Consolidate imports in all generated model files
     for file_path in generated_files:
@@ -71,6 +65,46 @@ def generate_types(cwd: str, parser: dict):
             consolidate_imports_in_file(file_path)
 
 
+def write_models_init(file_path: str, exports: list):
+    """Write kittycad/models/__init__.py.
+
+    Models are loaded on first access through a module ``__getattr__``, so
+    importing the package doesn't build every pydantic model. Type checkers
+    see ordinary imports.
+    """
+    exports = sorted(set(exports))
+    with open(file_path, "w") as f:
+        f.write('"""Contains all the data models used in inputs/outputs"""\n\n')
+        f.write("import importlib\n")
+        f.write("from typing import TYPE_CHECKING, Any, List\n\n")
+        f.write("if TYPE_CHECKING:\n")
+        for name, module in exports:
+            f.write(f"    from .{module} import {name}\n")
+        f.write("\n# Public name -> module that defines it.\n")
+        f.write("_MODULES = {\n")
+        for name, module in exports:
+            f.write(f'    "{name}": "{module}",\n')
+        f.write("}\n\n")
+        f.write(
+            """
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_MODULES))
+
+
+__all__ = list(_MODULES)
+"""
+        )
+
+
 def generate_type(path: str, name: str, schema: dict, data: dict):
     file_path = path
     if path.endswith(".py") is False:
@@ -366,6 +366,52 @@ def extract_imports_from_examples(examples: List[str]) -> Tuple[List[str], List[
 _template_env = None
 
 
+_MODELS_DIR = os.path.join(os.path.dirname(__file__), "..", "kittycad", "models")
+
+
+def _model_names(type_str: Optional[str]) -> List[str]:
+    names = set(re.findall(r"\b[A-Z][A-Za-z0-9]*\b", type_str or ""))
+    return sorted(
+        name
+        for name in names
+        if os.path.exists(os.path.join(_MODELS_DIR, camel_to_snake(name) + ".py"))
+    )
+
+
+def model_imports(type_str: Optional[str]) -> List[str]:
+    """Get the import statements for the models named in a type annotation.
+
+    The client module only imports models for type checking, so generated
+    code that uses a model at runtime (e.g. to validate a response) imports
+    it locally with these statements.
+    """
+    return [
+        f"from kittycad.models.{camel_to_snake(name)} import {name}"
+        for name in _model_names(type_str)
+    ]
+
+
+def annotation(type_str: Optional[str]) -> str:
+    """Render a type annotation, quoting it if it names a model.
+
+    Models are only imported for type checking in the client module, so
+    annotations that mention them must not be evaluated at definition time.
+    They are also qualified with the lazily-loading ``models`` package, so
+    ``typing.get_type_hints`` can still resolve them on demand.
+    """
+    if not type_str or type_str.startswith('"'):
+        return type_str or ""
+    names = set(_model_names(type_str))
+    if not names:
+        return type_str
+    qualified = re.sub(
+        r"\b[A-Z][A-Za-z0-9]*\b",
+        lambda m: f"models.{m[0]}" if m[0] in names else m[0],
+        type_str,
+    )
+    return f'"{qualified}"'
+
+
 def get_template_environment() -> Environment:
     """Get a shared Jinja2 template environment with standard filters."""
     global _template_env
@@ -377,6 +423,8 @@ def get_template_environment() -> Environment:
         _template_env.filters["pascal_to_snake"] = camel_to_snake
         _template_env.filters["camel_to_snake"] = camel_to_snake
         _template_env.filters["camel_to_screaming_snake"] = camel_to_screaming_snake
+        _template_env.filters["model_imports"] = model_imports
+        _template_env.filters["annotation"] = annotation
     return _template_env
 
 
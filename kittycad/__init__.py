@@ -1,8 +1,8 @@
 """The KittyCAD Python SDK"""
 
-import json
+import functools
 import os
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
 import bson
 import httpx
@@ -25,6 +25,9 @@ from kittycad._multipart import (
     upload_json_multipart_async,
 )
 
+from . import models
+from ._adapters import TypeAdapterRegistry
+from ._transport import OperationInfo
 from .client import AsyncClient, Client
 from .exceptions import (
     KittyCADAPIError,
@@ -34,194 +37,210 @@ from .exceptions import (
     KittyCADServerError,
     KittyCADTimeoutError,
 )
-from .models.account_provider import AccountProvider
-from .models.add_org_member import AddOrgMember
-from .models.aggregate_usage_collection_threshold_set import (
-    AggregateUsageCollectionThresholdSet,
-)
-from .models.aggregate_usage_collection_threshold_view import (
-    AggregateUsageCollectionThresholdView,
-)
-from .models.announcement_list import AnnouncementList
-from .models.api_call_with_price import ApiCallWithPrice
-from .models.api_call_with_price_results_page import ApiCallWithPriceResultsPage
-from .models.api_token import ApiToken
-from .models.api_token_results_page import ApiTokenResultsPage
-from .models.api_token_uuid import ApiTokenUuid
-from .models.api_token_with_full_token import ApiTokenWithFullToken
-from .models.app_client_info import AppClientInfo
-from .models.async_api_call_output import AsyncApiCallOutput
-from .models.auth_api_key_response import AuthApiKeyResponse
-from .models.auth_callback import AuthCallback
-from .models.billing_contract_upsert import BillingContractUpsert
-from .models.billing_contract_view import BillingContractView
-from .models.billing_info import BillingInfo
-from .models.client_error_report import ClientErrorReport
-from .models.client_error_report_accepted import ClientErrorReportAccepted
-from .models.code_language import CodeLanguage
-from .models.code_option import CodeOption
-from .models.code_output import CodeOutput
-from .models.conversation_results_page import ConversationResultsPage
-from .models.conversion_params import ConversionParams
-from .models.conversion_sort_mode import ConversionSortMode
-from .models.create_custom_model import CreateCustomModel
-from .models.create_o_auth2_app_request import CreateOAuth2AppRequest
-from .models.create_org_dataset import CreateOrgDataset
-from .models.create_project_share_link_request import CreateProjectShareLinkRequest
-from .models.create_shortlink_request import CreateShortlinkRequest
-from .models.create_shortlink_response import CreateShortlinkResponse
-from .models.created_at_sort_mode import CreatedAtSortMode
-from .models.custom_model import CustomModel
-from .models.customer import Customer
-from .models.customer_balance import CustomerBalance
-from .models.dataset_s3_policies import DatasetS3Policies
-from .models.device_access_token_request_form import DeviceAccessTokenRequestForm
-from .models.device_auth_confirm_params import DeviceAuthConfirmParams
-from .models.device_auth_request_form import DeviceAuthRequestForm
-from .models.discount_code import DiscountCode
-from .models.email_authentication_form import EmailAuthenticationForm
-from .models.email_marketing_confirm_token_body import EmailMarketingConfirmTokenBody
-from .models.email_marketing_consent_state import EmailMarketingConsentState
-from .models.extended_user import ExtendedUser
-from .models.factory_customer_catalog_option import FactoryCustomerCatalogOption
-from .models.factory_job_response import FactoryJobResponse
-from .models.file_center_of_mass import FileCenterOfMass
-from .models.file_conversion import FileConversion
-from .models.file_density import FileDensity
-from .models.file_export_format import FileExportFormat
-from .models.file_import_format import FileImportFormat
-from .models.file_mass import FileMass
-from .models.file_surface_area import FileSurfaceArea
-from .models.file_volume import FileVolume
-from .models.invoice_results_page import InvoiceResultsPage
-from .models.ip_addr_info import IpAddrInfo
-from .models.kcl_code_completion_request import KclCodeCompletionRequest
-from .models.kcl_code_completion_response import KclCodeCompletionResponse
-from .models.kcl_model import KclModel
-from .models.lenient_url import LenientUrl
-from .models.ml_copilot_client_message import MlCopilotClientMessage
-from .models.ml_copilot_server_message import MlCopilotServerMessage
-from .models.ml_feedback import MlFeedback
-from .models.o_auth2_app_response import OAuth2AppResponse
-from .models.o_auth2_app_response_results_page import OAuth2AppResponseResultsPage
-from .models.o_auth2_authorization_decision_response import (
-    OAuth2AuthorizationDecisionResponse,
-)
-from .models.o_auth2_authorization_request_response import (
-    OAuth2AuthorizationRequestResponse,
-)
-from .models.o_auth2_authorization_response_type import OAuth2AuthorizationResponseType
-from .models.o_auth2_code_challenge_method import OAuth2CodeChallengeMethod
-from .models.o_auth2_scopes import OAuth2Scopes
-from .models.o_auth2_token_request_form import OAuth2TokenRequestForm
-from .models.oauth2_client_info import OAuth2ClientInfo
-from .models.org import Org
-from .models.org_dataset import OrgDataset
-from .models.org_dataset_conversion_stats_response import (
-    OrgDatasetConversionStatsResponse,
-)
-from .models.org_dataset_file_conversion_details import OrgDatasetFileConversionDetails
-from .models.org_dataset_file_conversion_summary_results_page import (
-    OrgDatasetFileConversionSummaryResultsPage,
-)
-from .models.org_dataset_results_page import OrgDatasetResultsPage
-from .models.org_dataset_semantic_search_match import OrgDatasetSemanticSearchMatch
-from .models.org_details import OrgDetails
-from .models.org_member import OrgMember
-from .models.org_member_results_page import OrgMemberResultsPage
-from .models.org_skill_response import OrgSkillResponse
-from .models.payment_intent import PaymentIntent
-from .models.payment_method import PaymentMethod
-from .models.pong import Pong
-from .models.post_effect_type import PostEffectType
-from .models.price_upsert_request import PriceUpsertRequest
-from .models.privacy_settings import PrivacySettings
-from .models.project_archive_format import ProjectArchiveFormat
-from .models.project_category_response import ProjectCategoryResponse
-from .models.project_response import ProjectResponse
-from .models.project_share_link_response import ProjectShareLinkResponse
-from .models.project_summary_response import ProjectSummaryResponse
-from .models.public_email_marketing_consent_request import (
-    PublicEmailMarketingConsentRequest,
-)
-from .models.public_mailing_list_membership_request import (
-    PublicMailingListMembershipRequest,
-)
-from .models.public_project_response import PublicProjectResponse
-from .models.public_project_vote_response import PublicProjectVoteResponse
-from .models.saml_identity_provider import SamlIdentityProvider
-from .models.saml_identity_provider_create import SamlIdentityProviderCreate
-from .models.service_account import ServiceAccount
-from .models.service_account_results_page import ServiceAccountResultsPage
-from .models.service_account_uuid import ServiceAccountUuid
-from .models.session import Session
-from .models.session_uuid import SessionUuid
-from .models.shortlink_results_page import ShortlinkResultsPage
-from .models.store_coupon_params import StoreCouponParams
-from .models.subscription_plan_price_record import SubscriptionPlanPriceRecord
-from .models.text_to_cad_response import TextToCadResponse
-from .models.text_to_cad_response_results_page import TextToCadResponseResultsPage
-from .models.token_revoke_request_form import TokenRevokeRequestForm
-from .models.unit_angle import UnitAngle
-from .models.unit_angle_conversion import UnitAngleConversion
-from .models.unit_area import UnitArea
-from .models.unit_area_conversion import UnitAreaConversion
-from .models.unit_current import UnitCurrent
-from .models.unit_current_conversion import UnitCurrentConversion
-from .models.unit_density import UnitDensity
-from .models.unit_energy import UnitEnergy
-from .models.unit_energy_conversion import UnitEnergyConversion
-from .models.unit_force import UnitForce
-from .models.unit_force_conversion import UnitForceConversion
-from .models.unit_frequency import UnitFrequency
-from .models.unit_frequency_conversion import UnitFrequencyConversion
-from .models.unit_length import UnitLength
-from .models.unit_length_conversion import UnitLengthConversion
-from .models.unit_mass import UnitMass
-from .models.unit_mass_conversion import UnitMassConversion
-from .models.unit_power import UnitPower
-from .models.unit_power_conversion import UnitPowerConversion
-from .models.unit_pressure import UnitPressure
-from .models.unit_pressure_conversion import UnitPressureConversion
-from .models.unit_temperature import UnitTemperature
-from .models.unit_temperature_conversion import UnitTemperatureConversion
-from .models.unit_torque import UnitTorque
-from .models.unit_torque_conversion import UnitTorqueConversion
-from .models.unit_volume import UnitVolume
-from .models.unit_volume_conversion import UnitVolumeConversion
-from .models.update_custom_model import UpdateCustomModel
-from .models.update_member_to_org_body import UpdateMemberToOrgBody
-from .models.update_o_auth2_app_request import UpdateOAuth2AppRequest
-from .models.update_org_dataset import UpdateOrgDataset
-from .models.update_payment_balance import UpdatePaymentBalance
-from .models.update_shortlink_request import UpdateShortlinkRequest
-from .models.update_user import UpdateUser
-from .models.upload_org_dataset_files_response import UploadOrgDatasetFilesResponse
-from .models.user_admin_details import UserAdminDetails
-from .models.user_feature_list import UserFeatureList
-from .models.user_identifier import UserIdentifier
-from .models.user_org_info import UserOrgInfo
-from .models.user_org_role import UserOrgRole
-from .models.user_response import UserResponse
-from .models.uuid import Uuid
-from .models.verification_token_response import VerificationTokenResponse
-
-# Import WebSocket-related models that may be referenced by endpoints
-from .models.web_socket_request import WebSocketRequest
-from .models.web_socket_response import WebSocketResponse
-from .models.website_cad_user_info_form import WebsiteCadUserInfoForm
-from .models.website_sales_form import WebsiteSalesForm
-from .models.website_support_form import WebsiteSupportForm
-from .models.zoo_product_subscriptions import ZooProductSubscriptions
-from .models.zoo_product_subscriptions_org_request import (
-    ZooProductSubscriptionsOrgRequest,
-)
-from .models.zoo_product_subscriptions_user_request import (
-    ZooProductSubscriptionsUserRequest,
-)
-from .pagination import AsyncPageIterator, SyncPageIterator
-from .response_helpers import raise_for_status
-from .types import serialize_request_body
+from .hooks import connect_websocket, connect_websocket_async
+from .pagination import AsyncPageIterator, SyncPageIterator, parse_page_response
+from .response_helpers import parse_json_response, raise_for_status
+from .types import encode_request_body
+
+# Models are only imported for type checking, so ``import kittycad`` doesn't
+# build hundreds of pydantic models up front. Methods that need a model at
+# runtime import it locally, annotations name them through the lazy
+# ``models`` package, and ``from kittycad import SomeModel`` still works
+# through ``__getattr__`` below.
+if TYPE_CHECKING:
+    from .models.account_provider import AccountProvider
+    from .models.add_org_member import AddOrgMember
+    from .models.aggregate_usage_collection_threshold_set import (
+        AggregateUsageCollectionThresholdSet,
+    )
+    from .models.aggregate_usage_collection_threshold_view import (
+        AggregateUsageCollectionThresholdView,
+    )
+    from .models.announcement_list import AnnouncementList
+    from .models.api_call_with_price import ApiCallWithPrice
+    from .models.api_call_with_price_results_page import ApiCallWithPriceResultsPage
+    from .models.api_token import ApiToken
+    from .models.api_token_results_page import ApiTokenResultsPage
+    from .models.api_token_uuid import ApiTokenUuid
+    from .models.api_token_with_full_token import ApiTokenWithFullToken
+    from .models.app_client_info import AppClientInfo
+    from .models.async_api_call_output import AsyncApiCallOutput
+    from .models.auth_api_key_response import AuthApiKeyResponse
+    from .models.auth_callback import AuthCallback
+    from .models.billing_contract_upsert import BillingContractUpsert
+    from .models.billing_contract_view import BillingContractView
+    from .models.billing_info import BillingInfo
+    from .models.client_error_report import ClientErrorReport
+    from .models.client_error_report_accepted import ClientErrorReportAccepted
+    from .models.code_language import CodeLanguage
+    from .models.code_option import CodeOption
+    from .models.code_output import CodeOutput
+    from .models.conversation_results_page import ConversationResultsPage
+    from .models.conversion_params import ConversionParams
+    from .models.conversion_sort_mode import ConversionSortMode
+    from .models.create_custom_model import CreateCustomModel
+    from .models.create_o_auth2_app_request import CreateOAuth2AppRequest
+    from .models.create_org_dataset import CreateOrgDataset
+    from .models.create_project_share_link_request import CreateProjectShareLinkRequest
+    from .models.create_shortlink_request import CreateShortlinkRequest
+    from .models.create_shortlink_response import CreateShortlinkResponse
+    from .models.created_at_sort_mode import CreatedAtSortMode
+    from .models.custom_model import CustomModel
+    from .models.customer import Customer
+    from .models.customer_balance import CustomerBalance
+    from .models.dataset_s3_policies import DatasetS3Policies
+    from .models.device_access_token_request_form import DeviceAccessTokenRequestForm
+    from .models.device_auth_confirm_params import DeviceAuthConfirmParams
+    from .models.device_auth_request_form import DeviceAuthRequestForm
+    from .models.discount_code import DiscountCode
+    from .models.email_authentication_form import EmailAuthenticationForm
+    from .models.email_marketing_confirm_token_body import (
+        EmailMarketingConfirmTokenBody,
+    )
+    from .models.email_marketing_consent_state import EmailMarketingConsentState
+    from .models.extended_user import ExtendedUser
+    from .models.factory_customer_catalog_option import FactoryCustomerCatalogOption
+    from .models.factory_job_response import FactoryJobResponse
+    from .models.file_center_of_mass import FileCenterOfMass
+    from .models.file_conversion import FileConversion
+    from .models.file_density import FileDensity
+    from .models.file_export_format import FileExportFormat
+    from .models.file_import_format import FileImportFormat
+    from .models.file_mass import FileMass
+    from .models.file_surface_area import FileSurfaceArea
+    from .models.file_volume import FileVolume
+    from .models.invoice_results_page import InvoiceResultsPage
+    from .models.ip_addr_info import IpAddrInfo
+    from .models.kcl_code_completion_request import KclCodeCompletionRequest
+    from .models.kcl_code_completion_response import KclCodeCompletionResponse
+    from .models.kcl_model import KclModel
+    from .models.lenient_url import LenientUrl
+    from .models.ml_copilot_client_message import MlCopilotClientMessage
+    from .models.ml_copilot_server_message import MlCopilotServerMessage
+    from .models.ml_feedback import MlFeedback
+    from .models.o_auth2_app_response import OAuth2AppResponse
+    from .models.o_auth2_app_response_results_page import OAuth2AppResponseResultsPage
+    from .models.o_auth2_authorization_decision_response import (
+        OAuth2AuthorizationDecisionResponse,
+    )
+    from .models.o_auth2_authorization_request_response import (
+        OAuth2AuthorizationRequestResponse,
+    )
+    from .models.o_auth2_authorization_response_type import (
+        OAuth2AuthorizationResponseType,
+    )
+    from .models.o_auth2_code_challenge_method import OAuth2CodeChallengeMethod
+    from .models.o_auth2_scopes import OAuth2Scopes
+    from .models.o_auth2_token_request_form import OAuth2TokenRequestForm
+    from .models.oauth2_client_info import OAuth2ClientInfo
+    from .models.org import Org
+    from .models.org_dataset import OrgDataset
+    from .models.org_dataset_conversion_stats_response import (
+        OrgDatasetConversionStatsResponse,
+    )
+    from .models.org_dataset_file_conversion_details import (
+        OrgDatasetFileConversionDetails,
+    )
+    from .models.org_dataset_file_conversion_summary_results_page import (
+        OrgDatasetFileConversionSummaryResultsPage,
+    )
+    from .models.org_dataset_results_page import OrgDatasetResultsPage
+    from .models.org_dataset_semantic_search_match import OrgDatasetSemanticSearchMatch
+    from .models.org_details import OrgDetails
+    from .models.org_member import OrgMember
+    from .models.org_member_results_page import OrgMemberResultsPage
+    from .models.org_skill_response import OrgSkillResponse
+    from .models.payment_intent import PaymentIntent
+    from .models.payment_method import PaymentMethod
+    from .models.pong import Pong
+    from .models.post_effect_type import PostEffectType
+    from .models.price_upsert_request import PriceUpsertRequest
+    from .models.privacy_settings import PrivacySettings
+    from .models.project_archive_format import ProjectArchiveFormat
+    from .models.project_category_response import ProjectCategoryResponse
+    from .models.project_response import ProjectResponse
+    from .models.project_share_link_response import ProjectShareLinkResponse
+    from .models.project_summary_response import ProjectSummaryResponse
+    from .models.public_email_marketing_consent_request import (
+        PublicEmailMarketingConsentRequest,
+    )
+    from .models.public_mailing_list_membership_request import (
+        PublicMailingListMembershipRequest,
+    )
+    from .models.public_project_response import PublicProjectResponse
+    from .models.public_project_vote_response import PublicProjectVoteResponse
+    from .models.saml_identity_provider import SamlIdentityProvider
+    from .models.saml_identity_provider_create import SamlIdentityProviderCreate
+    from .models.service_account import ServiceAccount
+    from .models.service_account_results_page import ServiceAccountResultsPage
+    from .models.service_account_uuid import ServiceAccountUuid
+    from .models.session import Session
+    from .models.session_uuid import SessionUuid
+    from .models.shortlink_results_page import ShortlinkResultsPage
+    from .models.store_coupon_params import StoreCouponParams
+    from .models.subscription_plan_price_record import SubscriptionPlanPriceRecord
+    from .models.text_to_cad_response import TextToCadResponse
+    from .models.text_to_cad_response_results_page import TextToCadResponseResultsPage
+    from .models.token_revoke_request_form import TokenRevokeRequestForm
+    from .models.unit_angle import UnitAngle
+    from .models.unit_angle_conversion import UnitAngleConversion
+    from .models.unit_area import UnitArea
+    from .models.unit_area_conversion import UnitAreaConversion
+    from .models.unit_current import UnitCurrent
+    from .models.unit_current_conversion import UnitCurrentConversion
+    from .models.unit_density import UnitDensity
+    from .models.unit_energy import UnitEnergy
+    from .models.unit_energy_conversion import UnitEnergyConversion
+    from .models.unit_force import UnitForce
+    from .models.unit_force_conversion import UnitForceConversion
+    from .models.unit_frequency import UnitFrequency
+    from .models.unit_frequency_conversion import UnitFrequencyConversion
+    from .models.unit_length import UnitLength
+    from .models.unit_length_conversion import UnitLengthConversion
+    from .models.unit_mass import UnitMass
+    from .models.unit_mass_conversion import UnitMassConversion
+    from .models.unit_power import UnitPower
+    from .models.unit_power_conversion import UnitPowerConversion
+    from .models.unit_pressure import UnitPressure
+    from .models.unit_pressure_conversion import UnitPressureConversion
+    from .models.unit_temperature import UnitTemperature
+    from .models.unit_temperature_conversion import UnitTemperatureConversion
+    from .models.unit_torque import UnitTorque
+    from .models.unit_torque_conversion import UnitTorqueConversion
+    from .models.unit_volume import UnitVolume
+    from .models.unit_volume_conversion import UnitVolumeConversion
+    from .models.update_custom_model import UpdateCustomModel
+    from .models.update_member_to_org_body import UpdateMemberToOrgBody
+    from .models.update_o_auth2_app_request import UpdateOAuth2AppRequest
+    from .models.update_org_dataset import UpdateOrgDataset
+    from .models.update_payment_balance import UpdatePaymentBalance
+    from .models.update_shortlink_request import UpdateShortlinkRequest
+    from .models.update_user import UpdateUser
+    from .models.upload_org_dataset_files_response import UploadOrgDatasetFilesResponse
+    from .models.user_admin_details import UserAdminDetails
+    from .models.user_feature_list import UserFeatureList
+    from .models.user_identifier import UserIdentifier
+    from .models.user_org_info import UserOrgInfo
+    from .models.user_org_role import UserOrgRole
+    from .models.user_response import UserResponse
+    from .models.uuid import Uuid
+    from .models.verification_token_response import VerificationTokenResponse
+    from .models.web_socket_request import WebSocketRequest
+    from .models.web_socket_response import WebSocketResponse
+    from .models.website_cad_user_info_form import WebsiteCadUserInfoForm
+    from .models.website_sales_form import WebsiteSalesForm
+    from .models.website_support_form import WebsiteSupportForm
+    from .models.zoo_product_subscriptions import ZooProductSubscriptions
+    from .models.zoo_product_subscriptions_org_request import (
+        ZooProductSubscriptionsOrgRequest,
+    )
+    from .models.zoo_product_subscriptions_user_request import (
+        ZooProductSubscriptionsUserRequest,
+    )
+
+
+# Adapters for list/dict/union response types, keyed by the annotation.
+_TYPE_ADAPTERS = TypeAdapterRegistry()
 
 
 class MetaAPI:
@@ -242,6 +261,8 @@ class MetaAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={"kittycad_operation": OperationInfo("get_schema", "meta", "/")},
         )
 
         if not response.is_success:
@@ -252,18 +273,22 @@ class MetaAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(Dict).validate_python(json_data, extra="ignore")
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get("Dict", lambda: Dict).validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_ipinfo(
         self,
-    ) -> IpAddrInfo:
+    ) -> "models.IpAddrInfo":
         """Get ip address information."""
 
+        from kittycad.models.ip_addr_info import IpAddrInfo
+
         url = "{}/_meta/ipinfo".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -271,6 +296,12 @@ class MetaAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_ipinfo", "meta", "/_meta/ipinfo"
+                )
+            },
         )
 
         if not response.is_success:
@@ -281,16 +312,19 @@ class MetaAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return IpAddrInfo.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: IpAddrInfo.model_validate_json(content, extra="ignore"),
+        )
 
     def get_announcements(
         self,
-    ) -> AnnouncementList:
+    ) -> "models.AnnouncementList":
         """No authentication is required."""
 
+        from kittycad.models.announcement_list import AnnouncementList
+
         url = "{}/announcements".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -298,6 +332,12 @@ class MetaAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_announcements", "meta", "/announcements"
+                )
+            },
         )
 
         if not response.is_success:
@@ -308,10 +348,13 @@ class MetaAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return AnnouncementList.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: AnnouncementList.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def community_sso(
         self,
@@ -339,6 +382,12 @@ class MetaAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "community_sso", "meta", "/community/sso"
+                )
+            },
         )
 
         if not response.is_success:
@@ -346,16 +395,20 @@ class MetaAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def internal_get_api_token_for_discord_user(
         self,
         discord_id: str,
-    ) -> ApiToken:
+    ) -> "models.ApiToken":
         """This endpoint allows us to run API calls from our discord bot on behalf of a user. The user must have a discord account linked to their Zoo Account via oauth2 for this to work.
 
         You must be a Zoo admin to use this endpoint."""
 
+        from kittycad.models.api_token import ApiToken
+
         url = "{}/internal/discord/api-token/{discord_id}".format(
             self.client.base_url, discord_id=discord_id
         )
@@ -365,6 +418,14 @@ class MetaAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "internal_get_api_token_for_discord_user",
+                    "meta",
+                    "/internal/discord/api-token/{discord_id}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -375,16 +436,19 @@ class MetaAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ApiToken.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ApiToken.model_validate_json(content, extra="ignore"),
+        )
 
     def ping(
         self,
-    ) -> Pong:
+    ) -> "models.Pong":
         """Return pong."""
 
+        from kittycad.models.pong import Pong
+
         url = "{}/ping".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -392,6 +456,8 @@ class MetaAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={"kittycad_operation": OperationInfo("ping", "meta", "/ping")},
         )
 
         if not response.is_success:
@@ -402,10 +468,10 @@ class MetaAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Pong.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response, lambda content: Pong.model_validate_json(content, extra="ignore")
+        )
 
     def get_pricing_subscriptions(
         self,
@@ -419,6 +485,12 @@ class MetaAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_pricing_subscriptions", "meta", "/pricing/subscriptions"
+                )
+            },
         )
 
         if not response.is_success:
@@ -429,12 +501,14 @@ class MetaAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(Dict).validate_python(json_data, extra="ignore")
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get("Dict", lambda: Dict).validate_json(
+                content, extra="ignore"
+            ),
+        )
 
 
 class AsyncMetaAPI:
@@ -455,6 +529,8 @@ class AsyncMetaAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={"kittycad_operation": OperationInfo("get_schema", "meta", "/")},
         )
 
         if not response.is_success:
@@ -465,18 +541,22 @@ class AsyncMetaAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(Dict).validate_python(json_data, extra="ignore")
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get("Dict", lambda: Dict).validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_ipinfo(
         self,
-    ) -> IpAddrInfo:
+    ) -> "models.IpAddrInfo":
         """Get ip address information."""
 
+        from kittycad.models.ip_addr_info import IpAddrInfo
+
         url = "{}/_meta/ipinfo".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -484,6 +564,12 @@ class AsyncMetaAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_ipinfo", "meta", "/_meta/ipinfo"
+                )
+            },
         )
 
         if not response.is_success:
@@ -494,16 +580,19 @@ class AsyncMetaAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return IpAddrInfo.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: IpAddrInfo.model_validate_json(content, extra="ignore"),
+        )
 
     async def get_announcements(
         self,
-    ) -> AnnouncementList:
+    ) -> "models.AnnouncementList":
         """No authentication is required."""
 
+        from kittycad.models.announcement_list import AnnouncementList
+
         url = "{}/announcements".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -511,6 +600,12 @@ class AsyncMetaAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_announcements", "meta", "/announcements"
+                )
+            },
         )
 
         if not response.is_success:
@@ -521,10 +616,13 @@ class AsyncMetaAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return AnnouncementList.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: AnnouncementList.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def community_sso(
         self,
@@ -552,6 +650,12 @@ class AsyncMetaAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "community_sso", "meta", "/community/sso"
+                )
+            },
         )
 
         if not response.is_success:
@@ -559,16 +663,20 @@ class AsyncMetaAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def internal_get_api_token_for_discord_user(
         self,
         discord_id: str,
-    ) -> ApiToken:
+    ) -> "models.ApiToken":
         """This endpoint allows us to run API calls from our discord bot on behalf of a user. The user must have a discord account linked to their Zoo Account via oauth2 for this to work.
 
         You must be a Zoo admin to use this endpoint."""
 
+        from kittycad.models.api_token import ApiToken
+
         url = "{}/internal/discord/api-token/{discord_id}".format(
             self.client.base_url, discord_id=discord_id
         )
@@ -578,6 +686,14 @@ class AsyncMetaAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "internal_get_api_token_for_discord_user",
+                    "meta",
+                    "/internal/discord/api-token/{discord_id}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -588,16 +704,19 @@ class AsyncMetaAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ApiToken.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ApiToken.model_validate_json(content, extra="ignore"),
+        )
 
     async def ping(
         self,
-    ) -> Pong:
+    ) -> "models.Pong":
         """Return pong."""
 
+        from kittycad.models.pong import Pong
+
         url = "{}/ping".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -605,6 +724,8 @@ class AsyncMetaAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={"kittycad_operation": OperationInfo("ping", "meta", "/ping")},
         )
 
         if not response.is_success:
@@ -615,10 +736,10 @@ class AsyncMetaAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Pong.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response, lambda content: Pong.model_validate_json(content, extra="ignore")
+        )
 
     async def get_pricing_subscriptions(
         self,
@@ -632,6 +753,12 @@ class AsyncMetaAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_pricing_subscriptions", "meta", "/pricing/subscriptions"
+                )
+            },
         )
 
         if not response.is_success:
@@ -642,12 +769,14 @@ class AsyncMetaAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(Dict).validate_python(json_data, extra="ignore")
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get("Dict", lambda: Dict).validate_json(
+                content, extra="ignore"
+            ),
+        )
 
 
 class ApiCallsAPI:
@@ -659,13 +788,15 @@ class ApiCallsAPI:
     def get_api_call(
         self,
         id: str,
-    ) -> ApiCallWithPrice:
+    ) -> "models.ApiCallWithPrice":
         """This endpoint requires authentication by any Zoo user. It returns details of the requested API call for the user.
 
         If the user is not authenticated to view the specified API call, then it is not returned.
 
         Only Zoo employees can view API calls for other users."""
 
+        from kittycad.models.api_call_with_price import ApiCallWithPrice
+
         url = "{}/api-calls/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -673,6 +804,12 @@ class ApiCallsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_api_call", "api_calls", "/api-calls/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -683,15 +820,18 @@ class ApiCallsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ApiCallWithPrice.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ApiCallWithPrice.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_async_operation(
         self,
         id: str,
-    ) -> AsyncApiCallOutput:
+    ) -> "models.AsyncApiCallOutput":
         """Get the status and output of an async operation.
 
         This endpoint requires authentication by any Zoo user. It returns details of the requested async operation for the user.
@@ -700,6 +840,8 @@ class ApiCallsAPI:
 
         Only Zoo employees with the proper access can view async operations for other users."""
 
+        from kittycad.models.async_api_call_output import AsyncApiCallOutput
+
         url = "{}/async/operations/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -707,6 +849,12 @@ class ApiCallsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_async_operation", "api_calls", "/async/operations/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -717,17 +865,20 @@ class ApiCallsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return AsyncApiCallOutput.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: AsyncApiCallOutput.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def org_list_api_calls(
         self,
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "SyncPageIterator":
         """This includes all API calls that were made by users in the org.
 
@@ -767,10 +918,21 @@ class ApiCallsAPI:
         return SyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "org_list_api_calls", "api_calls", "/org/api-calls"
+            ),
         )
 
-    def _fetch_page_org_list_api_calls(self, **kwargs) -> ApiCallWithPriceResultsPage:
+    def _fetch_page_org_list_api_calls(
+        self, **kwargs
+    ) -> "models.ApiCallWithPriceResultsPage":
         """Internal method to fetch a single page."""
+
+        from kittycad.models.api_call_with_price_results_page import (
+            ApiCallWithPriceResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/org/api-calls".format(self.client.base_url)
 
@@ -800,6 +962,12 @@ class ApiCallsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "org_list_api_calls", "api_calls", "/org/api-calls"
+                )
+            },
         )
 
         if not response.is_success:
@@ -810,16 +978,24 @@ class ApiCallsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return ApiCallWithPriceResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: ApiCallWithPriceResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_api_call_for_org(
         self,
         id: str,
-    ) -> ApiCallWithPrice:
+    ) -> "models.ApiCallWithPrice":
         """This endpoint requires authentication by an org admin. It returns details of the requested API call for the user's org."""
 
+        from kittycad.models.api_call_with_price import ApiCallWithPrice
+
         url = "{}/org/api-calls/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -827,6 +1003,12 @@ class ApiCallsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_api_call_for_org", "api_calls", "/org/api-calls/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -837,17 +1019,20 @@ class ApiCallsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ApiCallWithPrice.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ApiCallWithPrice.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def user_list_api_calls(
         self,
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "SyncPageIterator":
         """This endpoint requires authentication by any Zoo user. It returns the API calls for the authenticated user.
 
@@ -885,10 +1070,21 @@ class ApiCallsAPI:
         return SyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "user_list_api_calls", "api_calls", "/user/api-calls"
+            ),
         )
 
-    def _fetch_page_user_list_api_calls(self, **kwargs) -> ApiCallWithPriceResultsPage:
+    def _fetch_page_user_list_api_calls(
+        self, **kwargs
+    ) -> "models.ApiCallWithPriceResultsPage":
         """Internal method to fetch a single page."""
+
+        from kittycad.models.api_call_with_price_results_page import (
+            ApiCallWithPriceResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/user/api-calls".format(self.client.base_url)
 
@@ -918,6 +1114,12 @@ class ApiCallsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "user_list_api_calls", "api_calls", "/user/api-calls"
+                )
+            },
         )
 
         if not response.is_success:
@@ -928,16 +1130,24 @@ class ApiCallsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return ApiCallWithPriceResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: ApiCallWithPriceResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_api_call_for_user(
         self,
         id: str,
-    ) -> ApiCallWithPrice:
+    ) -> "models.ApiCallWithPrice":
         """This endpoint requires authentication by any Zoo user. It returns details of the requested API call for the user."""
 
+        from kittycad.models.api_call_with_price import ApiCallWithPrice
+
         url = "{}/user/api-calls/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -945,6 +1155,12 @@ class ApiCallsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_api_call_for_user", "api_calls", "/user/api-calls/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -955,18 +1171,21 @@ class ApiCallsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ApiCallWithPrice.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ApiCallWithPrice.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def list_api_calls_for_user(
         self,
-        id: UserIdentifier,
+        id: "models.UserIdentifier",
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "SyncPageIterator":
         """This endpoint requires authentication by any Zoo user. It returns the API calls for the authenticated user if "me" is passed as the user id.
 
@@ -1010,12 +1229,21 @@ class ApiCallsAPI:
         return SyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_api_calls_for_user", "api_calls", "/users/{id}/api-calls"
+            ),
         )
 
     def _fetch_page_list_api_calls_for_user(
-        self, id: UserIdentifier, **kwargs
-    ) -> ApiCallWithPriceResultsPage:
+        self, id: "models.UserIdentifier", **kwargs
+    ) -> "models.ApiCallWithPriceResultsPage":
         """Internal method to fetch a single page."""
+
+        from kittycad.models.api_call_with_price_results_page import (
+            ApiCallWithPriceResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/users/{id}/api-calls".format(self.client.base_url, id=id)
 
@@ -1045,6 +1273,12 @@ class ApiCallsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_api_calls_for_user", "api_calls", "/users/{id}/api-calls"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1055,9 +1289,15 @@ class ApiCallsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return ApiCallWithPriceResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: ApiCallWithPriceResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
 
 class AsyncApiCallsAPI:
@@ -1069,13 +1309,15 @@ class AsyncApiCallsAPI:
     async def get_api_call(
         self,
         id: str,
-    ) -> ApiCallWithPrice:
+    ) -> "models.ApiCallWithPrice":
         """This endpoint requires authentication by any Zoo user. It returns details of the requested API call for the user.
 
         If the user is not authenticated to view the specified API call, then it is not returned.
 
         Only Zoo employees can view API calls for other users."""
 
+        from kittycad.models.api_call_with_price import ApiCallWithPrice
+
         url = "{}/api-calls/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -1083,6 +1325,12 @@ class AsyncApiCallsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_api_call", "api_calls", "/api-calls/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1093,15 +1341,18 @@ class AsyncApiCallsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ApiCallWithPrice.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ApiCallWithPrice.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_async_operation(
         self,
         id: str,
-    ) -> AsyncApiCallOutput:
+    ) -> "models.AsyncApiCallOutput":
         """Get the status and output of an async operation.
 
         This endpoint requires authentication by any Zoo user. It returns details of the requested async operation for the user.
@@ -1110,6 +1361,8 @@ class AsyncApiCallsAPI:
 
         Only Zoo employees with the proper access can view async operations for other users."""
 
+        from kittycad.models.async_api_call_output import AsyncApiCallOutput
+
         url = "{}/async/operations/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -1117,6 +1370,12 @@ class AsyncApiCallsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_async_operation", "api_calls", "/async/operations/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1127,17 +1386,20 @@ class AsyncApiCallsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return AsyncApiCallOutput.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: AsyncApiCallOutput.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def org_list_api_calls(
         self,
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "AsyncPageIterator":
         """This includes all API calls that were made by users in the org.
 
@@ -1177,12 +1439,21 @@ class AsyncApiCallsAPI:
         return AsyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "org_list_api_calls", "api_calls", "/org/api-calls"
+            ),
         )
 
     async def _fetch_page_org_list_api_calls(
         self, **kwargs
-    ) -> ApiCallWithPriceResultsPage:
+    ) -> "models.ApiCallWithPriceResultsPage":
         """Internal async method to fetch a single page."""
+
+        from kittycad.models.api_call_with_price_results_page import (
+            ApiCallWithPriceResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/org/api-calls".format(self.client.base_url)
 
@@ -1212,6 +1483,12 @@ class AsyncApiCallsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "org_list_api_calls", "api_calls", "/org/api-calls"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1222,16 +1499,24 @@ class AsyncApiCallsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return ApiCallWithPriceResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: ApiCallWithPriceResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_api_call_for_org(
         self,
         id: str,
-    ) -> ApiCallWithPrice:
+    ) -> "models.ApiCallWithPrice":
         """This endpoint requires authentication by an org admin. It returns details of the requested API call for the user's org."""
 
+        from kittycad.models.api_call_with_price import ApiCallWithPrice
+
         url = "{}/org/api-calls/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -1239,6 +1524,12 @@ class AsyncApiCallsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_api_call_for_org", "api_calls", "/org/api-calls/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1249,17 +1540,20 @@ class AsyncApiCallsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ApiCallWithPrice.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ApiCallWithPrice.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def user_list_api_calls(
         self,
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "AsyncPageIterator":
         """This endpoint requires authentication by any Zoo user. It returns the API calls for the authenticated user.
 
@@ -1297,12 +1591,21 @@ class AsyncApiCallsAPI:
         return AsyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "user_list_api_calls", "api_calls", "/user/api-calls"
+            ),
         )
 
     async def _fetch_page_user_list_api_calls(
         self, **kwargs
-    ) -> ApiCallWithPriceResultsPage:
+    ) -> "models.ApiCallWithPriceResultsPage":
         """Internal async method to fetch a single page."""
+
+        from kittycad.models.api_call_with_price_results_page import (
+            ApiCallWithPriceResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/user/api-calls".format(self.client.base_url)
 
@@ -1332,6 +1635,12 @@ class AsyncApiCallsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "user_list_api_calls", "api_calls", "/user/api-calls"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1342,16 +1651,24 @@ class AsyncApiCallsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return ApiCallWithPriceResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: ApiCallWithPriceResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_api_call_for_user(
         self,
         id: str,
-    ) -> ApiCallWithPrice:
+    ) -> "models.ApiCallWithPrice":
         """This endpoint requires authentication by any Zoo user. It returns details of the requested API call for the user."""
 
+        from kittycad.models.api_call_with_price import ApiCallWithPrice
+
         url = "{}/user/api-calls/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -1359,6 +1676,12 @@ class AsyncApiCallsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_api_call_for_user", "api_calls", "/user/api-calls/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1369,18 +1692,21 @@ class AsyncApiCallsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ApiCallWithPrice.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ApiCallWithPrice.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def list_api_calls_for_user(
         self,
-        id: UserIdentifier,
+        id: "models.UserIdentifier",
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "AsyncPageIterator":
         """This endpoint requires authentication by any Zoo user. It returns the API calls for the authenticated user if "me" is passed as the user id.
 
@@ -1424,12 +1750,21 @@ class AsyncApiCallsAPI:
         return AsyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_api_calls_for_user", "api_calls", "/users/{id}/api-calls"
+            ),
         )
 
     async def _fetch_page_list_api_calls_for_user(
-        self, id: UserIdentifier, **kwargs
-    ) -> ApiCallWithPriceResultsPage:
+        self, id: "models.UserIdentifier", **kwargs
+    ) -> "models.ApiCallWithPriceResultsPage":
         """Internal async method to fetch a single page."""
+
+        from kittycad.models.api_call_with_price_results_page import (
+            ApiCallWithPriceResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/users/{id}/api-calls".format(self.client.base_url, id=id)
 
@@ -1459,6 +1794,12 @@ class AsyncApiCallsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_api_calls_for_user", "api_calls", "/users/{id}/api-calls"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1469,9 +1810,15 @@ class AsyncApiCallsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return ApiCallWithPriceResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: ApiCallWithPriceResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
 
 class AppsAPI:
@@ -1494,6 +1841,12 @@ class AppsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "apps_github_callback", "apps", "/apps/github/callback"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1501,15 +1854,19 @@ class AppsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def apps_github_consent(
         self,
-    ) -> AppClientInfo:
+    ) -> "models.AppClientInfo":
         """This is different than OAuth 2.0 authentication for users. This endpoint grants access for Zoo to access user's repos.
 
         The user doesn't need Zoo OAuth authorization for this endpoint, this is purely for the GitHub permissions to access repos."""
 
+        from kittycad.models.app_client_info import AppClientInfo
+
         url = "{}/apps/github/consent".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -1517,6 +1874,12 @@ class AppsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "apps_github_consent", "apps", "/apps/github/consent"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1527,10 +1890,11 @@ class AppsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return AppClientInfo.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: AppClientInfo.model_validate_json(content, extra="ignore"),
+        )
 
     def apps_github_webhook(
         self,
@@ -1545,7 +1909,13 @@ class AppsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
             content=body,
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "apps_github_webhook", "apps", "/apps/github/webhook"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1553,7 +1923,9 @@ class AppsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
 
 class AsyncAppsAPI:
@@ -1576,6 +1948,12 @@ class AsyncAppsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "apps_github_callback", "apps", "/apps/github/callback"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1583,15 +1961,19 @@ class AsyncAppsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def apps_github_consent(
         self,
-    ) -> AppClientInfo:
+    ) -> "models.AppClientInfo":
         """This is different than OAuth 2.0 authentication for users. This endpoint grants access for Zoo to access user's repos.
 
         The user doesn't need Zoo OAuth authorization for this endpoint, this is purely for the GitHub permissions to access repos."""
 
+        from kittycad.models.app_client_info import AppClientInfo
+
         url = "{}/apps/github/consent".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -1599,6 +1981,12 @@ class AsyncAppsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "apps_github_consent", "apps", "/apps/github/consent"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1609,10 +1997,11 @@ class AsyncAppsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return AppClientInfo.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: AppClientInfo.model_validate_json(content, extra="ignore"),
+        )
 
     async def apps_github_webhook(
         self,
@@ -1627,7 +2016,13 @@ class AsyncAppsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
             content=body,
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "apps_github_webhook", "apps", "/apps/github/webhook"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1635,7 +2030,9 @@ class AsyncAppsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
 
 class HiddenAPI:
@@ -1646,9 +2043,11 @@ class HiddenAPI:
 
     def auth_api_key(
         self,
-    ) -> AuthApiKeyResponse:
+    ) -> "models.AuthApiKeyResponse":
         """This returns a session token."""
 
+        from kittycad.models.auth_api_key_response import AuthApiKeyResponse
+
         url = "{}/auth/api-key".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -1656,6 +2055,12 @@ class HiddenAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "auth_api_key", "hidden", "/auth/api-key"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1666,17 +2071,24 @@ class HiddenAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return AuthApiKeyResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: AuthApiKeyResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def auth_email(
         self,
-        body: EmailAuthenticationForm,
-    ) -> VerificationTokenResponse:
+        body: "models.EmailAuthenticationForm",
+    ) -> "models.VerificationTokenResponse":
         """Create an email verification request for a user."""
 
+        from kittycad.models.verification_token_response import (
+            VerificationTokenResponse,
+        )
+
         url = "{}/auth/email".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -1684,7 +2096,13 @@ class HiddenAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "auth_email", "hidden", "/auth/email"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1695,14 +2113,17 @@ class HiddenAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return VerificationTokenResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: VerificationTokenResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def auth_email_marketing_confirm_post(
         self,
-        body: EmailMarketingConfirmTokenBody,
+        body: "models.EmailMarketingConfirmTokenBody",
     ):
         """Consume a confirmation token and finalize double opt-in."""
 
@@ -1713,7 +2134,15 @@ class HiddenAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "auth_email_marketing_confirm_post",
+                    "hidden",
+                    "/auth/email-marketing/confirm",
+                )
+            },
         )
 
         if not response.is_success:
@@ -1721,7 +2150,9 @@ class HiddenAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def auth_email_callback(
         self,
@@ -1757,6 +2188,12 @@ class HiddenAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "auth_email_callback", "hidden", "/auth/email/callback"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1764,13 +2201,15 @@ class HiddenAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def get_auth_saml_by_org(
         self,
-        org_id: Uuid,
+        org_id: "models.Uuid",
         *,
-        callback_url: Optional[LenientUrl] = None,
+        callback_url: "Optional[models.LenientUrl]" = None,
     ):
         """Redirects the browser straight to the org’s SAML IdP."""
 
@@ -1789,6 +2228,12 @@ class HiddenAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_auth_saml_by_org", "hidden", "/auth/saml/org/{org_id}/login"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1796,13 +2241,15 @@ class HiddenAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def get_auth_saml(
         self,
-        provider_id: Uuid,
+        provider_id: "models.Uuid",
         *,
-        callback_url: Optional[LenientUrl] = None,
+        callback_url: "Optional[models.LenientUrl]" = None,
     ):
         """The UI uses this to avoid having to ask the API anything about the IdP. It already knows the SAML IdP ID from the path, so it can just link to this path and rely on the API to redirect to the actual IdP."""
 
@@ -1821,6 +2268,12 @@ class HiddenAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_auth_saml", "hidden", "/auth/saml/provider/{provider_id}/login"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1828,11 +2281,13 @@ class HiddenAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def post_auth_saml(
         self,
-        provider_id: Uuid,
+        provider_id: "models.Uuid",
         body: bytes,
     ):
         """Authenticate a user via SAML"""
@@ -1846,7 +2301,15 @@ class HiddenAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
             content=body,
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "post_auth_saml",
+                    "hidden",
+                    "/auth/saml/provider/{provider_id}/login",
+                )
+            },
         )
 
         if not response.is_success:
@@ -1854,7 +2317,9 @@ class HiddenAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def logout(
         self,
@@ -1868,6 +2333,10 @@ class HiddenAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo("logout", "hidden", "/logout")
+            },
         )
 
         if not response.is_success:
@@ -1875,13 +2344,15 @@ class HiddenAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def download_shared_project(
         self,
         key: str,
         *,
-        format: Optional[ProjectArchiveFormat] = None,
+        format: "Optional[models.ProjectArchiveFormat]" = None,
     ):
         """Download a project using a share link."""
 
@@ -1898,6 +2369,14 @@ class HiddenAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "download_shared_project",
+                    "hidden",
+                    "/projects/shared/{key}/download",
+                )
+            },
         )
 
         if not response.is_success:
@@ -1905,7 +2384,9 @@ class HiddenAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def redirect_user_shortlink(
         self,
@@ -1920,6 +2401,12 @@ class HiddenAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "redirect_user_shortlink", "hidden", "/user/shortlinks/{key}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1927,7 +2414,9 @@ class HiddenAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
 
 class AsyncHiddenAPI:
@@ -1938,9 +2427,11 @@ class AsyncHiddenAPI:
 
     async def auth_api_key(
         self,
-    ) -> AuthApiKeyResponse:
+    ) -> "models.AuthApiKeyResponse":
         """This returns a session token."""
 
+        from kittycad.models.auth_api_key_response import AuthApiKeyResponse
+
         url = "{}/auth/api-key".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -1948,6 +2439,12 @@ class AsyncHiddenAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "auth_api_key", "hidden", "/auth/api-key"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1958,17 +2455,24 @@ class AsyncHiddenAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return AuthApiKeyResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: AuthApiKeyResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def auth_email(
         self,
-        body: EmailAuthenticationForm,
-    ) -> VerificationTokenResponse:
+        body: "models.EmailAuthenticationForm",
+    ) -> "models.VerificationTokenResponse":
         """Create an email verification request for a user."""
 
+        from kittycad.models.verification_token_response import (
+            VerificationTokenResponse,
+        )
+
         url = "{}/auth/email".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -1976,7 +2480,13 @@ class AsyncHiddenAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "auth_email", "hidden", "/auth/email"
+                )
+            },
         )
 
         if not response.is_success:
@@ -1987,14 +2497,17 @@ class AsyncHiddenAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return VerificationTokenResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: VerificationTokenResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def auth_email_marketing_confirm_post(
         self,
-        body: EmailMarketingConfirmTokenBody,
+        body: "models.EmailMarketingConfirmTokenBody",
     ):
         """Consume a confirmation token and finalize double opt-in."""
 
@@ -2005,7 +2518,15 @@ class AsyncHiddenAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "auth_email_marketing_confirm_post",
+                    "hidden",
+                    "/auth/email-marketing/confirm",
+                )
+            },
         )
 
         if not response.is_success:
@@ -2013,7 +2534,9 @@ class AsyncHiddenAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def auth_email_callback(
         self,
@@ -2049,6 +2572,12 @@ class AsyncHiddenAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "auth_email_callback", "hidden", "/auth/email/callback"
+                )
+            },
         )
 
         if not response.is_success:
@@ -2056,13 +2585,15 @@ class AsyncHiddenAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def get_auth_saml_by_org(
         self,
-        org_id: Uuid,
+        org_id: "models.Uuid",
         *,
-        callback_url: Optional[LenientUrl] = None,
+        callback_url: "Optional[models.LenientUrl]" = None,
     ):
         """Redirects the browser straight to the org’s SAML IdP."""
 
@@ -2081,6 +2612,12 @@ class AsyncHiddenAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_auth_saml_by_org", "hidden", "/auth/saml/org/{org_id}/login"
+                )
+            },
         )
 
         if not response.is_success:
@@ -2088,13 +2625,15 @@ class AsyncHiddenAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def get_auth_saml(
         self,
-        provider_id: Uuid,
+        provider_id: "models.Uuid",
         *,
-        callback_url: Optional[LenientUrl] = None,
+        callback_url: "Optional[models.LenientUrl]" = None,
     ):
         """The UI uses this to avoid having to ask the API anything about the IdP. It already knows the SAML IdP ID from the path, so it can just link to this path and rely on the API to redirect to the actual IdP."""
 
@@ -2113,6 +2652,12 @@ class AsyncHiddenAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_auth_saml", "hidden", "/auth/saml/provider/{provider_id}/login"
+                )
+            },
         )
 
         if not response.is_success:
@@ -2120,11 +2665,13 @@ class AsyncHiddenAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def post_auth_saml(
         self,
-        provider_id: Uuid,
+        provider_id: "models.Uuid",
         body: bytes,
     ):
         """Authenticate a user via SAML"""
@@ -2138,7 +2685,15 @@ class AsyncHiddenAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
             content=body,
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "post_auth_saml",
+                    "hidden",
+                    "/auth/saml/provider/{provider_id}/login",
+                )
+            },
         )
 
         if not response.is_success:
@@ -2146,7 +2701,9 @@ class AsyncHiddenAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def logout(
         self,
@@ -2160,6 +2717,10 @@ class AsyncHiddenAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo("logout", "hidden", "/logout")
+            },
         )
 
         if not response.is_success:
@@ -2167,13 +2728,15 @@ class AsyncHiddenAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def download_shared_project(
         self,
         key: str,
         *,
-        format: Optional[ProjectArchiveFormat] = None,
+        format: "Optional[models.ProjectArchiveFormat]" = None,
     ):
         """Download a project using a share link."""
 
@@ -2190,6 +2753,14 @@ class AsyncHiddenAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "download_shared_project",
+                    "hidden",
+                    "/projects/shared/{key}/download",
+                )
+            },
         )
 
         if not response.is_success:
@@ -2197,7 +2768,9 @@ class AsyncHiddenAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def redirect_user_shortlink(
         self,
@@ -2212,6 +2785,12 @@ class AsyncHiddenAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "redirect_user_shortlink", "hidden", "/user/shortlinks/{key}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -2219,7 +2798,9 @@ class AsyncHiddenAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
 
 class FileAPI:
@@ -2230,11 +2811,11 @@ class FileAPI:
 
     def create_file_center_of_mass(
         self,
-        src_format: FileImportFormat,
+        src_format: "models.FileImportFormat",
         body: bytes,
         *,
-        output_unit: Optional[UnitLength] = None,
-    ) -> FileCenterOfMass:
+        output_unit: "Optional[models.UnitLength]" = None,
+    ) -> "models.FileCenterOfMass":
         """We assume any file given to us has one consistent unit throughout. We also assume the file is at the proper scale.
 
         This endpoint returns the cartesian coordinate in world space measure units.
@@ -2245,6 +2826,8 @@ class FileAPI:
 
         If the operation is performed asynchronously, the `id` of the operation will be returned. You can use the `id` returned from the request to get status information about the async operation from the `/async/operations/{id}` endpoint."""
 
+        from kittycad.models.file_center_of_mass import FileCenterOfMass
+
         url = "{}/file/center-of-mass".format(self.client.base_url)
 
         if src_format is not None:
@@ -2264,7 +2847,13 @@ class FileAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
             content=body,
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_file_center_of_mass", "file", "/file/center-of-mass"
+                )
+            },
         )
 
         if not response.is_success:
@@ -2275,16 +2864,19 @@ class FileAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return FileCenterOfMass.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: FileCenterOfMass.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def create_file_conversion_options(
         self,
-        body: ConversionParams,
+        body: "models.ConversionParams",
         file_attachments: Dict[str, SyncUpload],
-    ) -> FileConversion:
+    ) -> "models.FileConversion":
         """This takes a HTTP multipart body with these fields in any order:
 
          - The input and output format options (as JSON), name is 'body'.  - The files to convert, in raw binary. Must supply filenames.
@@ -2335,6 +2927,8 @@ class FileAPI:
             ```
         """
 
+        from kittycad.models.file_conversion import FileConversion
+
         url = "{}/file/conversion".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -2346,6 +2940,12 @@ class FileAPI:
             json_body=body,
             file_attachments=file_attachments,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_file_conversion_options", "file", "/file/conversion"
+                )
+            },
         )
 
         if not response.is_success:
@@ -2356,17 +2956,18 @@ class FileAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return FileConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: FileConversion.model_validate_json(content, extra="ignore"),
+        )
 
     def create_file_conversion(
         self,
-        src_format: FileImportFormat,
-        output_format: FileExportFormat,
+        src_format: "models.FileImportFormat",
+        output_format: "models.FileExportFormat",
         body: bytes,
-    ) -> FileConversion:
+    ) -> "models.FileConversion":
         """If you wish to specify the conversion options, use the `/file/conversion` endpoint instead.
 
         Convert a CAD file from one format to another. If the file being converted is larger than 25MB, it will be performed asynchronously.
@@ -2375,6 +2976,8 @@ class FileAPI:
 
         If the operation is performed asynchronously, the `id` of the operation will be returned. You can use the `id` returned from the request to get status information about the async operation from the `/async/operations/{id}` endpoint."""
 
+        from kittycad.models.file_conversion import FileConversion
+
         url = "{}/file/conversion/{src_format}/{output_format}".format(
             self.client.base_url, src_format=src_format, output_format=output_format
         )
@@ -2384,7 +2987,15 @@ class FileAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
             content=body,
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_file_conversion",
+                    "file",
+                    "/file/conversion/{src_format}/{output_format}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -2395,20 +3006,21 @@ class FileAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return FileConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: FileConversion.model_validate_json(content, extra="ignore"),
+        )
 
     def create_file_density(
         self,
-        src_format: FileImportFormat,
+        src_format: "models.FileImportFormat",
         material_mass: float,
         body: bytes,
         *,
-        material_mass_unit: Optional[UnitMass] = None,
-        output_unit: Optional[UnitDensity] = None,
-    ) -> FileDensity:
+        material_mass_unit: "Optional[models.UnitMass]" = None,
+        output_unit: "Optional[models.UnitDensity]" = None,
+    ) -> "models.FileDensity":
         """We assume any file given to us has one consistent unit throughout. We also assume the file is at the proper scale.
 
         This endpoint assumes if you are giving a material mass in a specific mass units, we return a density in mass unit per cubic measure unit.
@@ -2419,6 +3031,8 @@ class FileAPI:
 
         If the operation is performed asynchronously, the `id` of the operation will be returned. You can use the `id` returned from the request to get status information about the async operation from the `/async/operations/{id}` endpoint."""
 
+        from kittycad.models.file_density import FileDensity
+
         url = "{}/file/density".format(self.client.base_url)
 
         if src_format is not None:
@@ -2450,7 +3064,13 @@ class FileAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
             content=body,
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_file_density", "file", "/file/density"
+                )
+            },
         )
 
         if not response.is_success:
@@ -2461,20 +3081,21 @@ class FileAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return FileDensity.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: FileDensity.model_validate_json(content, extra="ignore"),
+        )
 
     def create_file_mass(
         self,
-        src_format: FileImportFormat,
+        src_format: "models.FileImportFormat",
         material_density: float,
         body: bytes,
         *,
-        material_density_unit: Optional[UnitDensity] = None,
-        output_unit: Optional[UnitMass] = None,
-    ) -> FileMass:
+        material_density_unit: "Optional[models.UnitDensity]" = None,
+        output_unit: "Optional[models.UnitMass]" = None,
+    ) -> "models.FileMass":
         """We assume any file given to us has one consistent unit throughout. We also assume the file is at the proper scale.
 
         This endpoint assumes if you are giving a material density in a specific mass unit per cubic measure unit, we return a mass in mass units. The same mass units as passed in the material density.
@@ -2485,6 +3106,8 @@ class FileAPI:
 
         If the operation is performed asynchronously, the `id` of the operation will be returned. You can use the `id` returned from the request to get status information about the async operation from the `/async/operations/{id}` endpoint."""
 
+        from kittycad.models.file_mass import FileMass
+
         url = "{}/file/mass".format(self.client.base_url)
 
         if src_format is not None:
@@ -2516,7 +3139,13 @@ class FileAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
             content=body,
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_file_mass", "file", "/file/mass"
+                )
+            },
         )
 
         if not response.is_success:
@@ -2527,18 +3156,19 @@ class FileAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return FileMass.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: FileMass.model_validate_json(content, extra="ignore"),
+        )
 
     def create_file_surface_area(
         self,
-        src_format: FileImportFormat,
+        src_format: "models.FileImportFormat",
         body: bytes,
         *,
-        output_unit: Optional[UnitArea] = None,
-    ) -> FileSurfaceArea:
+        output_unit: "Optional[models.UnitArea]" = None,
+    ) -> "models.FileSurfaceArea":
         """We assume any file given to us has one consistent unit throughout. We also assume the file is at the proper scale.
 
         This endpoint returns the square measure units.
@@ -2549,6 +3179,8 @@ class FileAPI:
 
         If the operation is performed asynchronously, the `id` of the operation will be returned. You can use the `id` returned from the request to get status information about the async operation from the `/async/operations/{id}` endpoint."""
 
+        from kittycad.models.file_surface_area import FileSurfaceArea
+
         url = "{}/file/surface-area".format(self.client.base_url)
 
         if src_format is not None:
@@ -2568,7 +3200,13 @@ class FileAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
             content=body,
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_file_surface_area", "file", "/file/surface-area"
+                )
+            },
         )
 
         if not response.is_success:
@@ -2579,18 +3217,21 @@ class FileAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return FileSurfaceArea.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: FileSurfaceArea.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def create_file_volume(
         self,
-        src_format: FileImportFormat,
+        src_format: "models.FileImportFormat",
         body: bytes,
         *,
-        output_unit: Optional[UnitVolume] = None,
-    ) -> FileVolume:
+        output_unit: "Optional[models.UnitVolume]" = None,
+    ) -> "models.FileVolume":
         """We assume any file given to us has one consistent unit throughout. We also assume the file is at the proper scale.
 
         This endpoint returns the cubic measure units.
@@ -2601,6 +3242,8 @@ class FileAPI:
 
         If the operation is performed asynchronously, the `id` of the operation will be returned. You can use the `id` returned from the request to get status information about the async operation from the `/async/operations/{id}` endpoint."""
 
+        from kittycad.models.file_volume import FileVolume
+
         url = "{}/file/volume".format(self.client.base_url)
 
         if src_format is not None:
@@ -2620,7 +3263,13 @@ class FileAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
             content=body,
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_file_volume", "file", "/file/volume"
+                )
+            },
         )
 
         if not response.is_success:
@@ -2631,10 +3280,11 @@ class FileAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return FileVolume.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: FileVolume.model_validate_json(content, extra="ignore"),
+        )
 
 
 class AsyncFileAPI:
@@ -2645,11 +3295,11 @@ class AsyncFileAPI:
 
     async def create_file_center_of_mass(
         self,
-        src_format: FileImportFormat,
+        src_format: "models.FileImportFormat",
         body: bytes,
         *,
-        output_unit: Optional[UnitLength] = None,
-    ) -> FileCenterOfMass:
+        output_unit: "Optional[models.UnitLength]" = None,
+    ) -> "models.FileCenterOfMass":
         """We assume any file given to us has one consistent unit throughout. We also assume the file is at the proper scale.
 
         This endpoint returns the cartesian coordinate in world space measure units.
@@ -2660,6 +3310,8 @@ class AsyncFileAPI:
 
         If the operation is performed asynchronously, the `id` of the operation will be returned. You can use the `id` returned from the request to get status information about the async operation from the `/async/operations/{id}` endpoint."""
 
+        from kittycad.models.file_center_of_mass import FileCenterOfMass
+
         url = "{}/file/center-of-mass".format(self.client.base_url)
 
         if src_format is not None:
@@ -2679,7 +3331,13 @@ class AsyncFileAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
             content=body,
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_file_center_of_mass", "file", "/file/center-of-mass"
+                )
+            },
         )
 
         if not response.is_success:
@@ -2690,16 +3348,19 @@ class AsyncFileAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return FileCenterOfMass.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: FileCenterOfMass.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def create_file_conversion_options(
         self,
-        body: ConversionParams,
+        body: "models.ConversionParams",
         file_attachments: Dict[str, SyncUpload],
-    ) -> FileConversion:
+    ) -> "models.FileConversion":
         """This takes a HTTP multipart body with these fields in any order:
 
          - The input and output format options (as JSON), name is 'body'.  - The files to convert, in raw binary. Must supply filenames.
@@ -2750,6 +3411,8 @@ class AsyncFileAPI:
             ```
         """
 
+        from kittycad.models.file_conversion import FileConversion
+
         url = "{}/file/conversion".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -2761,6 +3424,12 @@ class AsyncFileAPI:
             json_body=body,
             file_attachments=file_attachments,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_file_conversion_options", "file", "/file/conversion"
+                )
+            },
         )
 
         if not response.is_success:
@@ -2771,17 +3440,18 @@ class AsyncFileAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return FileConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: FileConversion.model_validate_json(content, extra="ignore"),
+        )
 
     async def create_file_conversion(
         self,
-        src_format: FileImportFormat,
-        output_format: FileExportFormat,
+        src_format: "models.FileImportFormat",
+        output_format: "models.FileExportFormat",
         body: bytes,
-    ) -> FileConversion:
+    ) -> "models.FileConversion":
         """If you wish to specify the conversion options, use the `/file/conversion` endpoint instead.
 
         Convert a CAD file from one format to another. If the file being converted is larger than 25MB, it will be performed asynchronously.
@@ -2790,6 +3460,8 @@ class AsyncFileAPI:
 
         If the operation is performed asynchronously, the `id` of the operation will be returned. You can use the `id` returned from the request to get status information about the async operation from the `/async/operations/{id}` endpoint."""
 
+        from kittycad.models.file_conversion import FileConversion
+
         url = "{}/file/conversion/{src_format}/{output_format}".format(
             self.client.base_url, src_format=src_format, output_format=output_format
         )
@@ -2799,7 +3471,15 @@ class AsyncFileAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
             content=body,
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_file_conversion",
+                    "file",
+                    "/file/conversion/{src_format}/{output_format}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -2810,20 +3490,21 @@ class AsyncFileAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return FileConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: FileConversion.model_validate_json(content, extra="ignore"),
+        )
 
     async def create_file_density(
         self,
-        src_format: FileImportFormat,
+        src_format: "models.FileImportFormat",
         material_mass: float,
         body: bytes,
         *,
-        material_mass_unit: Optional[UnitMass] = None,
-        output_unit: Optional[UnitDensity] = None,
-    ) -> FileDensity:
+        material_mass_unit: "Optional[models.UnitMass]" = None,
+        output_unit: "Optional[models.UnitDensity]" = None,
+    ) -> "models.FileDensity":
         """We assume any file given to us has one consistent unit throughout. We also assume the file is at the proper scale.
 
         This endpoint assumes if you are giving a material mass in a specific mass units, we return a density in mass unit per cubic measure unit.
@@ -2834,6 +3515,8 @@ class AsyncFileAPI:
 
         If the operation is performed asynchronously, the `id` of the operation will be returned. You can use the `id` returned from the request to get status information about the async operation from the `/async/operations/{id}` endpoint."""
 
+        from kittycad.models.file_density import FileDensity
+
         url = "{}/file/density".format(self.client.base_url)
 
         if src_format is not None:
@@ -2865,7 +3548,13 @@ class AsyncFileAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
             content=body,
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_file_density", "file", "/file/density"
+                )
+            },
         )
 
         if not response.is_success:
@@ -2876,20 +3565,21 @@ class AsyncFileAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return FileDensity.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: FileDensity.model_validate_json(content, extra="ignore"),
+        )
 
     async def create_file_mass(
         self,
-        src_format: FileImportFormat,
+        src_format: "models.FileImportFormat",
         material_density: float,
         body: bytes,
         *,
-        material_density_unit: Optional[UnitDensity] = None,
-        output_unit: Optional[UnitMass] = None,
-    ) -> FileMass:
+        material_density_unit: "Optional[models.UnitDensity]" = None,
+        output_unit: "Optional[models.UnitMass]" = None,
+    ) -> "models.FileMass":
         """We assume any file given to us has one consistent unit throughout. We also assume the file is at the proper scale.
 
         This endpoint assumes if you are giving a material density in a specific mass unit per cubic measure unit, we return a mass in mass units. The same mass units as passed in the material density.
@@ -2900,6 +3590,8 @@ class AsyncFileAPI:
 
         If the operation is performed asynchronously, the `id` of the operation will be returned. You can use the `id` returned from the request to get status information about the async operation from the `/async/operations/{id}` endpoint."""
 
+        from kittycad.models.file_mass import FileMass
+
         url = "{}/file/mass".format(self.client.base_url)
 
         if src_format is not None:
@@ -2931,7 +3623,13 @@ class AsyncFileAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
             content=body,
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_file_mass", "file", "/file/mass"
+                )
+            },
         )
 
         if not response.is_success:
@@ -2942,18 +3640,19 @@ class AsyncFileAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return FileMass.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: FileMass.model_validate_json(content, extra="ignore"),
+        )
 
     async def create_file_surface_area(
         self,
-        src_format: FileImportFormat,
+        src_format: "models.FileImportFormat",
         body: bytes,
         *,
-        output_unit: Optional[UnitArea] = None,
-    ) -> FileSurfaceArea:
+        output_unit: "Optional[models.UnitArea]" = None,
+    ) -> "models.FileSurfaceArea":
         """We assume any file given to us has one consistent unit throughout. We also assume the file is at the proper scale.
 
         This endpoint returns the square measure units.
@@ -2964,6 +3663,8 @@ class AsyncFileAPI:
 
         If the operation is performed asynchronously, the `id` of the operation will be returned. You can use the `id` returned from the request to get status information about the async operation from the `/async/operations/{id}` endpoint."""
 
+        from kittycad.models.file_surface_area import FileSurfaceArea
+
         url = "{}/file/surface-area".format(self.client.base_url)
 
         if src_format is not None:
@@ -2983,7 +3684,13 @@ class AsyncFileAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
             content=body,
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_file_surface_area", "file", "/file/surface-area"
+                )
+            },
         )
 
         if not response.is_success:
@@ -2994,18 +3701,21 @@ class AsyncFileAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return FileSurfaceArea.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: FileSurfaceArea.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def create_file_volume(
         self,
-        src_format: FileImportFormat,
+        src_format: "models.FileImportFormat",
         body: bytes,
         *,
-        output_unit: Optional[UnitVolume] = None,
-    ) -> FileVolume:
+        output_unit: "Optional[models.UnitVolume]" = None,
+    ) -> "models.FileVolume":
         """We assume any file given to us has one consistent unit throughout. We also assume the file is at the proper scale.
 
         This endpoint returns the cubic measure units.
@@ -3016,6 +3726,8 @@ class AsyncFileAPI:
 
         If the operation is performed asynchronously, the `id` of the operation will be returned. You can use the `id` returned from the request to get status information about the async operation from the `/async/operations/{id}` endpoint."""
 
+        from kittycad.models.file_volume import FileVolume
+
         url = "{}/file/volume".format(self.client.base_url)
 
         if src_format is not None:
@@ -3035,7 +3747,13 @@ class AsyncFileAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
             content=body,
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_file_volume", "file", "/file/volume"
+                )
+            },
         )
 
         if not response.is_success:
@@ -3046,10 +3764,11 @@ class AsyncFileAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return FileVolume.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: FileVolume.model_validate_json(content, extra="ignore"),
+        )
 
 
 class ExecutorAPI:
@@ -3060,13 +3779,15 @@ class ExecutorAPI:
 
     def create_file_execution(
         self,
-        lang: CodeLanguage,
+        lang: "models.CodeLanguage",
         body: bytes,
         *,
         output: Optional[str] = None,
-    ) -> CodeOutput:
+    ) -> "models.CodeOutput":
         """Execute a Zoo program in a specific language."""
 
+        from kittycad.models.code_output import CodeOutput
+
         url = "{}/file/execute/{lang}".format(self.client.base_url, lang=lang)
 
         if output is not None:
@@ -3080,7 +3801,13 @@ class ExecutorAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
             content=body,
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_file_execution", "executor", "/file/execute/{lang}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -3091,10 +3818,11 @@ class ExecutorAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CodeOutput.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CodeOutput.model_validate_json(content, extra="ignore"),
+        )
 
     def create_executor_term(
         self,
@@ -3118,13 +3846,15 @@ class AsyncExecutorAPI:
 
     async def create_file_execution(
         self,
-        lang: CodeLanguage,
+        lang: "models.CodeLanguage",
         body: bytes,
         *,
         output: Optional[str] = None,
-    ) -> CodeOutput:
+    ) -> "models.CodeOutput":
         """Execute a Zoo program in a specific language."""
 
+        from kittycad.models.code_output import CodeOutput
+
         url = "{}/file/execute/{lang}".format(self.client.base_url, lang=lang)
 
         if output is not None:
@@ -3138,7 +3868,13 @@ class AsyncExecutorAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
             content=body,
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_file_execution", "executor", "/file/execute/{lang}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -3149,10 +3885,11 @@ class AsyncExecutorAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CodeOutput.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CodeOutput.model_validate_json(content, extra="ignore"),
+        )
 
     async def create_executor_term(self):
         """Create a terminal.
@@ -3169,7 +3906,13 @@ class AsyncExecutorAPI:
 
             url = "/ws/executor/term"
 
-            return await ws_connect_async(
+            if self.client.rate_limiter is not None:
+                await self.client.rate_limiter.acquire_async("/ws/executor/term")
+
+            return await connect_websocket_async(
+                self.client.event_hooks,
+                OperationInfo("create_executor_term", "executor", "/ws/executor/term"),
+                self.client.get_websocket_connect(ws_connect_async),
                 url.replace("http", "ws"),
                 extra_headers=self.client.get_headers(),
                 close_timeout=120,
@@ -3188,7 +3931,7 @@ class MlAPI:
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "SyncPageIterator":
         """This endpoint requires authentication by any Zoo user. It returns the conversations for the authenticated user.
 
@@ -3226,12 +3969,19 @@ class MlAPI:
         return SyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_conversations_for_user", "ml", "/ml/conversations"
+            ),
         )
 
     def _fetch_page_list_conversations_for_user(
         self, **kwargs
-    ) -> ConversationResultsPage:
+    ) -> "models.ConversationResultsPage":
         """Internal method to fetch a single page."""
+
+        from kittycad.models.conversation_results_page import ConversationResultsPage
+
         # Build URL with path parameters
         url = "{}/ml/conversations".format(self.client.base_url)
 
@@ -3261,6 +4011,12 @@ class MlAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_conversations_for_user", "ml", "/ml/conversations"
+                )
+            },
         )
 
         if not response.is_success:
@@ -3271,15 +4027,21 @@ class MlAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return ConversationResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: ConversationResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def create_proprietary_to_kcl(
         self,
         *,
-        code_option: Optional[CodeOption] = None,
-    ) -> KclModel:
+        code_option: "Optional[models.CodeOption]" = None,
+    ) -> "models.KclModel":
         """This endpoint is used to convert a proprietary CAD format to KCL. The file passed MUST have feature tree data.
 
         A STEP file does not have feature tree data, so it will not work. A sldprt file does have feature tree data, so it will work.
@@ -3294,6 +4056,8 @@ class MlAPI:
 
         Input filepaths will be normalized and re-canonicalized to be under the current working directory -- so returned paths may differ from provided paths, and care must be taken when handling user provided paths."""
 
+        from kittycad.models.kcl_model import KclModel
+
         url = "{}/ml/convert/proprietary-to-kcl".format(self.client.base_url)
 
         if code_option is not None:
@@ -3307,6 +4071,12 @@ class MlAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_proprietary_to_kcl", "ml", "/ml/convert/proprietary-to-kcl"
+                )
+            },
         )
 
         if not response.is_success:
@@ -3317,17 +4087,20 @@ class MlAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return KclModel.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: KclModel.model_validate_json(content, extra="ignore"),
+        )
 
     def create_custom_model(
         self,
-        body: CreateCustomModel,
-    ) -> CustomModel:
+        body: "models.CreateCustomModel",
+    ) -> "models.CustomModel":
         """Dataset readiness is enforced via `OrgDatasetFileConversion::status_counts_for_datasets`: - At least one conversion must have status `success`. - No conversions may remain in `queued`. If even a single file is still queued the dataset is treated as “not ready for training.” - A dataset consisting only of `canceled` or `error_*` entries is rejected because there’s nothing usable."""
 
+        from kittycad.models.custom_model import CustomModel
+
         url = "{}/ml/custom/models".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -3335,7 +4108,13 @@ class MlAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_custom_model", "ml", "/ml/custom/models"
+                )
+            },
         )
 
         if not response.is_success:
@@ -3346,17 +4125,20 @@ class MlAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CustomModel.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CustomModel.model_validate_json(content, extra="ignore"),
+        )
 
     def get_custom_model(
         self,
-        id: Uuid,
-    ) -> CustomModel:
+        id: "models.Uuid",
+    ) -> "models.CustomModel":
         """Retrieve the details of a single custom ML model so long as it belongs to the caller’s organization."""
 
+        from kittycad.models.custom_model import CustomModel
+
         url = "{}/ml/custom/models/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -3364,6 +4146,12 @@ class MlAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_custom_model", "ml", "/ml/custom/models/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -3374,18 +4162,21 @@ class MlAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CustomModel.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CustomModel.model_validate_json(content, extra="ignore"),
+        )
 
     def update_custom_model(
         self,
-        id: Uuid,
-        body: UpdateCustomModel,
-    ) -> CustomModel:
+        id: "models.Uuid",
+        body: "models.UpdateCustomModel",
+    ) -> "models.CustomModel":
         """Update mutable metadata (name, system prompt) for a custom ML model owned by the caller's organization."""
 
+        from kittycad.models.custom_model import CustomModel
+
         url = "{}/ml/custom/models/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -3393,7 +4184,13 @@ class MlAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_custom_model", "ml", "/ml/custom/models/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -3404,17 +4201,20 @@ class MlAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CustomModel.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CustomModel.model_validate_json(content, extra="ignore"),
+        )
 
     def list_org_datasets_for_model(
         self,
-        id: Uuid,
-    ) -> List[OrgDataset]:
+        id: "models.Uuid",
+    ) -> "List[models.OrgDataset]":
         """List the org datasets that are currently attached to a custom ML model owned by the caller’s organization."""
 
+        from kittycad.models.org_dataset import OrgDataset
+
         url = "{}/ml/custom/models/{id}/datasets".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -3422,6 +4222,14 @@ class MlAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_org_datasets_for_model",
+                    "ml",
+                    "/ml/custom/models/{id}/datasets",
+                )
+            },
         )
 
         if not response.is_success:
@@ -3432,19 +4240,25 @@ class MlAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[OrgDataset]).validate_python(json_data, extra="ignore")
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[OrgDataset]", lambda: List[OrgDataset]
+            ).validate_json(content, extra="ignore"),
+        )
 
     def create_kcl_code_completions(
         self,
-        body: KclCodeCompletionRequest,
-    ) -> KclCodeCompletionResponse:
+        body: "models.KclCodeCompletionRequest",
+    ) -> "models.KclCodeCompletionResponse":
         """Generate code completions for KCL."""
 
+        from kittycad.models.kcl_code_completion_response import (
+            KclCodeCompletionResponse,
+        )
+
         url = "{}/ml/kcl/completions".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -3452,7 +4266,13 @@ class MlAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_kcl_code_completions", "ml", "/ml/kcl/completions"
+                )
+            },
         )
 
         if not response.is_success:
@@ -3463,20 +4283,23 @@ class MlAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return KclCodeCompletionResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: KclCodeCompletionResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def list_text_to_cad_parts_for_user(
         self,
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
         no_models: Optional[bool] = None,
         no_parts: Optional[bool] = None,
-        conversation_id: Optional[Uuid] = None,
+        conversation_id: "Optional[models.Uuid]" = None,
     ) -> "SyncPageIterator":
         """This will always return the STEP file contents as well as the format the user originally requested.
 
@@ -3525,12 +4348,21 @@ class MlAPI:
         return SyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_text_to_cad_parts_for_user", "ml", "/user/text-to-cad"
+            ),
         )
 
     def _fetch_page_list_text_to_cad_parts_for_user(
         self, **kwargs
-    ) -> TextToCadResponseResultsPage:
+    ) -> "models.TextToCadResponseResultsPage":
         """Internal method to fetch a single page."""
+
+        from kittycad.models.text_to_cad_response_results_page import (
+            TextToCadResponseResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/user/text-to-cad".format(self.client.base_url)
 
@@ -3578,6 +4410,12 @@ class MlAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_text_to_cad_parts_for_user", "ml", "/user/text-to-cad"
+                )
+            },
         )
 
         if not response.is_success:
@@ -3588,16 +4426,24 @@ class MlAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return TextToCadResponseResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: TextToCadResponseResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_text_to_cad_part_for_user(
         self,
         id: str,
-    ) -> TextToCadResponse:
+    ) -> "models.TextToCadResponse":
         """This endpoint requires authentication by any Zoo user. The user must be the owner of the text-to-CAD model."""
 
+        from kittycad.models.text_to_cad_response import TextToCadResponse
+
         url = "{}/user/text-to-cad/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -3605,6 +4451,12 @@ class MlAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_text_to_cad_part_for_user", "ml", "/user/text-to-cad/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -3615,15 +4467,18 @@ class MlAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return TextToCadResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: TextToCadResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def create_text_to_cad_part_feedback(
         self,
         id: str,
-        feedback: MlFeedback,
+        feedback: "models.MlFeedback",
     ):
         """This can be a text-to-CAD creation or iteration.
 
@@ -3642,6 +4497,12 @@ class MlAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_text_to_cad_part_feedback", "ml", "/user/text-to-cad/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -3649,7 +4510,9 @@ class MlAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def ml_copilot_ws(
         self,
@@ -3698,7 +4561,7 @@ class AsyncMlAPI:
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "AsyncPageIterator":
         """This endpoint requires authentication by any Zoo user. It returns the conversations for the authenticated user.
 
@@ -3736,12 +4599,19 @@ class AsyncMlAPI:
         return AsyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_conversations_for_user", "ml", "/ml/conversations"
+            ),
         )
 
     async def _fetch_page_list_conversations_for_user(
         self, **kwargs
-    ) -> ConversationResultsPage:
+    ) -> "models.ConversationResultsPage":
         """Internal async method to fetch a single page."""
+
+        from kittycad.models.conversation_results_page import ConversationResultsPage
+
         # Build URL with path parameters
         url = "{}/ml/conversations".format(self.client.base_url)
 
@@ -3771,6 +4641,12 @@ class AsyncMlAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_conversations_for_user", "ml", "/ml/conversations"
+                )
+            },
         )
 
         if not response.is_success:
@@ -3781,15 +4657,21 @@ class AsyncMlAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return ConversationResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: ConversationResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def create_proprietary_to_kcl(
         self,
         *,
-        code_option: Optional[CodeOption] = None,
-    ) -> KclModel:
+        code_option: "Optional[models.CodeOption]" = None,
+    ) -> "models.KclModel":
         """This endpoint is used to convert a proprietary CAD format to KCL. The file passed MUST have feature tree data.
 
         A STEP file does not have feature tree data, so it will not work. A sldprt file does have feature tree data, so it will work.
@@ -3804,6 +4686,8 @@ class AsyncMlAPI:
 
         Input filepaths will be normalized and re-canonicalized to be under the current working directory -- so returned paths may differ from provided paths, and care must be taken when handling user provided paths."""
 
+        from kittycad.models.kcl_model import KclModel
+
         url = "{}/ml/convert/proprietary-to-kcl".format(self.client.base_url)
 
         if code_option is not None:
@@ -3817,6 +4701,12 @@ class AsyncMlAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_proprietary_to_kcl", "ml", "/ml/convert/proprietary-to-kcl"
+                )
+            },
         )
 
         if not response.is_success:
@@ -3827,17 +4717,20 @@ class AsyncMlAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return KclModel.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: KclModel.model_validate_json(content, extra="ignore"),
+        )
 
     async def create_custom_model(
         self,
-        body: CreateCustomModel,
-    ) -> CustomModel:
+        body: "models.CreateCustomModel",
+    ) -> "models.CustomModel":
         """Dataset readiness is enforced via `OrgDatasetFileConversion::status_counts_for_datasets`: - At least one conversion must have status `success`. - No conversions may remain in `queued`. If even a single file is still queued the dataset is treated as “not ready for training.” - A dataset consisting only of `canceled` or `error_*` entries is rejected because there’s nothing usable."""
 
+        from kittycad.models.custom_model import CustomModel
+
         url = "{}/ml/custom/models".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -3845,7 +4738,13 @@ class AsyncMlAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_custom_model", "ml", "/ml/custom/models"
+                )
+            },
         )
 
         if not response.is_success:
@@ -3856,17 +4755,20 @@ class AsyncMlAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CustomModel.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CustomModel.model_validate_json(content, extra="ignore"),
+        )
 
     async def get_custom_model(
         self,
-        id: Uuid,
-    ) -> CustomModel:
+        id: "models.Uuid",
+    ) -> "models.CustomModel":
         """Retrieve the details of a single custom ML model so long as it belongs to the caller’s organization."""
 
+        from kittycad.models.custom_model import CustomModel
+
         url = "{}/ml/custom/models/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -3874,6 +4776,12 @@ class AsyncMlAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_custom_model", "ml", "/ml/custom/models/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -3884,18 +4792,21 @@ class AsyncMlAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CustomModel.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CustomModel.model_validate_json(content, extra="ignore"),
+        )
 
     async def update_custom_model(
         self,
-        id: Uuid,
-        body: UpdateCustomModel,
-    ) -> CustomModel:
+        id: "models.Uuid",
+        body: "models.UpdateCustomModel",
+    ) -> "models.CustomModel":
         """Update mutable metadata (name, system prompt) for a custom ML model owned by the caller's organization."""
 
+        from kittycad.models.custom_model import CustomModel
+
         url = "{}/ml/custom/models/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -3903,7 +4814,13 @@ class AsyncMlAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_custom_model", "ml", "/ml/custom/models/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -3914,17 +4831,20 @@ class AsyncMlAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CustomModel.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CustomModel.model_validate_json(content, extra="ignore"),
+        )
 
     async def list_org_datasets_for_model(
         self,
-        id: Uuid,
-    ) -> List[OrgDataset]:
+        id: "models.Uuid",
+    ) -> "List[models.OrgDataset]":
         """List the org datasets that are currently attached to a custom ML model owned by the caller’s organization."""
 
+        from kittycad.models.org_dataset import OrgDataset
+
         url = "{}/ml/custom/models/{id}/datasets".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -3932,6 +4852,14 @@ class AsyncMlAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_org_datasets_for_model",
+                    "ml",
+                    "/ml/custom/models/{id}/datasets",
+                )
+            },
         )
 
         if not response.is_success:
@@ -3942,19 +4870,25 @@ class AsyncMlAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[OrgDataset]).validate_python(json_data, extra="ignore")
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[OrgDataset]", lambda: List[OrgDataset]
+            ).validate_json(content, extra="ignore"),
+        )
 
     async def create_kcl_code_completions(
         self,
-        body: KclCodeCompletionRequest,
-    ) -> KclCodeCompletionResponse:
+        body: "models.KclCodeCompletionRequest",
+    ) -> "models.KclCodeCompletionResponse":
         """Generate code completions for KCL."""
 
+        from kittycad.models.kcl_code_completion_response import (
+            KclCodeCompletionResponse,
+        )
+
         url = "{}/ml/kcl/completions".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -3962,7 +4896,13 @@ class AsyncMlAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_kcl_code_completions", "ml", "/ml/kcl/completions"
+                )
+            },
         )
 
         if not response.is_success:
@@ -3973,20 +4913,23 @@ class AsyncMlAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return KclCodeCompletionResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: KclCodeCompletionResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def list_text_to_cad_parts_for_user(
         self,
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
         no_models: Optional[bool] = None,
         no_parts: Optional[bool] = None,
-        conversation_id: Optional[Uuid] = None,
+        conversation_id: "Optional[models.Uuid]" = None,
     ) -> "AsyncPageIterator":
         """This will always return the STEP file contents as well as the format the user originally requested.
 
@@ -4035,12 +4978,21 @@ class AsyncMlAPI:
         return AsyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_text_to_cad_parts_for_user", "ml", "/user/text-to-cad"
+            ),
         )
 
     async def _fetch_page_list_text_to_cad_parts_for_user(
         self, **kwargs
-    ) -> TextToCadResponseResultsPage:
+    ) -> "models.TextToCadResponseResultsPage":
         """Internal async method to fetch a single page."""
+
+        from kittycad.models.text_to_cad_response_results_page import (
+            TextToCadResponseResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/user/text-to-cad".format(self.client.base_url)
 
@@ -4088,6 +5040,12 @@ class AsyncMlAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_text_to_cad_parts_for_user", "ml", "/user/text-to-cad"
+                )
+            },
         )
 
         if not response.is_success:
@@ -4098,16 +5056,24 @@ class AsyncMlAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return TextToCadResponseResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: TextToCadResponseResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_text_to_cad_part_for_user(
         self,
         id: str,
-    ) -> TextToCadResponse:
+    ) -> "models.TextToCadResponse":
         """This endpoint requires authentication by any Zoo user. The user must be the owner of the text-to-CAD model."""
 
+        from kittycad.models.text_to_cad_response import TextToCadResponse
+
         url = "{}/user/text-to-cad/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -4115,6 +5081,12 @@ class AsyncMlAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_text_to_cad_part_for_user", "ml", "/user/text-to-cad/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -4125,15 +5097,18 @@ class AsyncMlAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return TextToCadResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: TextToCadResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def create_text_to_cad_part_feedback(
         self,
         id: str,
-        feedback: MlFeedback,
+        feedback: "models.MlFeedback",
     ):
         """This can be a text-to-CAD creation or iteration.
 
@@ -4152,6 +5127,12 @@ class AsyncMlAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_text_to_cad_part_feedback", "ml", "/user/text-to-cad/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -4159,7 +5140,9 @@ class AsyncMlAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def ml_copilot_ws(
         self,
@@ -4203,7 +5186,13 @@ class AsyncMlAPI:
                 else:
                     url = url + "?pr=" + str(pr)
 
-            return await ws_connect_async(
+            if self.client.rate_limiter is not None:
+                await self.client.rate_limiter.acquire_async("/ws/ml/copilot")
+
+            return await connect_websocket_async(
+                self.client.event_hooks,
+                OperationInfo("ml_copilot_ws", "ml", "/ws/ml/copilot"),
+                self.client.get_websocket_connect(ws_connect_async),
                 url.replace("http", "ws"),
                 extra_headers=self.client.get_headers(),
                 close_timeout=120,
@@ -4226,7 +5215,13 @@ class AsyncMlAPI:
 
             url = "/ws/ml/reasoning/{id}".format(id=id)
 
-            return await ws_connect_async(
+            if self.client.rate_limiter is not None:
+                await self.client.rate_limiter.acquire_async("/ws/ml/reasoning/{id}")
+
+            return await connect_websocket_async(
+                self.client.event_hooks,
+                OperationInfo("ml_reasoning_ws", "ml", "/ws/ml/reasoning/{id}"),
+                self.client.get_websocket_connect(ws_connect_async),
                 url.replace("http", "ws"),
                 extra_headers=self.client.get_headers(),
                 close_timeout=120,
@@ -4242,10 +5237,14 @@ class Oauth2API:
 
     def get_oauth2_authorization_request(
         self,
-        request_id: Uuid,
-    ) -> OAuth2AuthorizationRequestResponse:
+        request_id: "models.Uuid",
+    ) -> "models.OAuth2AuthorizationRequestResponse":
         """Get a pending OAuth 2.0 authorization request for the consent page."""
 
+        from kittycad.models.o_auth2_authorization_request_response import (
+            OAuth2AuthorizationRequestResponse,
+        )
+
         url = "{}/oauth2/authorization-requests/{request_id}".format(
             self.client.base_url, request_id=request_id
         )
@@ -4255,6 +5254,14 @@ class Oauth2API:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_oauth2_authorization_request",
+                    "oauth2",
+                    "/oauth2/authorization-requests/{request_id}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -4265,19 +5272,24 @@ class Oauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OAuth2AuthorizationRequestResponse.model_validate(
-            json_data, extra="ignore"
+        return parse_json_response(
+            response,
+            lambda content: OAuth2AuthorizationRequestResponse.model_validate_json(
+                content, extra="ignore"
+            ),
         )
 
     def approve_oauth2_authorization_request(
         self,
-        request_id: Uuid,
-    ) -> OAuth2AuthorizationDecisionResponse:
+        request_id: "models.Uuid",
+    ) -> "models.OAuth2AuthorizationDecisionResponse":
         """Approve a pending OAuth 2.0 authorization request."""
 
+        from kittycad.models.o_auth2_authorization_decision_response import (
+            OAuth2AuthorizationDecisionResponse,
+        )
+
         url = "{}/oauth2/authorization-requests/{request_id}/approve".format(
             self.client.base_url, request_id=request_id
         )
@@ -4287,6 +5299,14 @@ class Oauth2API:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "approve_oauth2_authorization_request",
+                    "oauth2",
+                    "/oauth2/authorization-requests/{request_id}/approve",
+                )
+            },
         )
 
         if not response.is_success:
@@ -4297,19 +5317,24 @@ class Oauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OAuth2AuthorizationDecisionResponse.model_validate(
-            json_data, extra="ignore"
+        return parse_json_response(
+            response,
+            lambda content: OAuth2AuthorizationDecisionResponse.model_validate_json(
+                content, extra="ignore"
+            ),
         )
 
     def deny_oauth2_authorization_request(
         self,
-        request_id: Uuid,
-    ) -> OAuth2AuthorizationDecisionResponse:
+        request_id: "models.Uuid",
+    ) -> "models.OAuth2AuthorizationDecisionResponse":
         """Deny a pending OAuth 2.0 authorization request."""
 
+        from kittycad.models.o_auth2_authorization_decision_response import (
+            OAuth2AuthorizationDecisionResponse,
+        )
+
         url = "{}/oauth2/authorization-requests/{request_id}/deny".format(
             self.client.base_url, request_id=request_id
         )
@@ -4319,6 +5344,14 @@ class Oauth2API:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "deny_oauth2_authorization_request",
+                    "oauth2",
+                    "/oauth2/authorization-requests/{request_id}/deny",
+                )
+            },
         )
 
         if not response.is_success:
@@ -4329,23 +5362,24 @@ class Oauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OAuth2AuthorizationDecisionResponse.model_validate(
-            json_data, extra="ignore"
+        return parse_json_response(
+            response,
+            lambda content: OAuth2AuthorizationDecisionResponse.model_validate_json(
+                content, extra="ignore"
+            ),
         )
 
     def oauth2_authorize(
         self,
-        response_type: OAuth2AuthorizationResponseType,
+        response_type: "models.OAuth2AuthorizationResponseType",
         client_id: str,
         redirect_uri: str,
         state: str,
         code_challenge: str,
-        code_challenge_method: OAuth2CodeChallengeMethod,
+        code_challenge_method: "models.OAuth2CodeChallengeMethod",
         *,
-        scope: Optional[OAuth2Scopes] = None,
+        scope: "Optional[models.OAuth2Scopes]" = None,
     ):
         """Start an OAuth 2.0 authorization code flow with PKCE."""
 
@@ -4398,6 +5432,12 @@ class Oauth2API:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "oauth2_authorize", "oauth2", "/oauth2/authorize"
+                )
+            },
         )
 
         if not response.is_success:
@@ -4405,11 +5445,13 @@ class Oauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def device_auth_request(
         self,
-        body: DeviceAuthRequestForm,
+        body: "models.DeviceAuthRequestForm",
     ):
         """This endpoint is designed to be accessed from an *unauthenticated* API client. It generates and records a `device_code` and `user_code` which must be verified and confirmed prior to a token being granted."""
 
@@ -4420,7 +5462,13 @@ class Oauth2API:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "device_auth_request", "oauth2", "/oauth2/device/auth"
+                )
+            },
         )
 
         if not response.is_success:
@@ -4428,11 +5476,13 @@ class Oauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def device_auth_confirm(
         self,
-        body: DeviceAuthConfirmParams,
+        body: "models.DeviceAuthConfirmParams",
     ):
         """This endpoint is designed to be accessed by the user agent (browser), not the client requesting the token. So we do not actually return the token here; it will be returned in response to the poll on `/oauth2/device/token`."""
 
@@ -4443,7 +5493,13 @@ class Oauth2API:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "device_auth_confirm", "oauth2", "/oauth2/device/confirm"
+                )
+            },
         )
 
         if not response.is_success:
@@ -4451,11 +5507,13 @@ class Oauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def device_access_token(
         self,
-        body: DeviceAccessTokenRequestForm,
+        body: "models.DeviceAccessTokenRequestForm",
     ):
         """This endpoint should be polled by the client until the user code is verified and the grant is confirmed."""
 
@@ -4466,7 +5524,13 @@ class Oauth2API:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "device_access_token", "oauth2", "/oauth2/device/token"
+                )
+            },
         )
 
         if not response.is_success:
@@ -4474,7 +5538,9 @@ class Oauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def device_auth_verify(
         self,
@@ -4503,6 +5569,12 @@ class Oauth2API:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "device_auth_verify", "oauth2", "/oauth2/device/verify"
+                )
+            },
         )
 
         if not response.is_success:
@@ -4510,11 +5582,13 @@ class Oauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def oauth2_provider_callback(
         self,
-        provider: AccountProvider,
+        provider: "models.AccountProvider",
         *,
         code: Optional[str] = None,
         state: Optional[str] = None,
@@ -4556,6 +5630,14 @@ class Oauth2API:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "oauth2_provider_callback",
+                    "oauth2",
+                    "/oauth2/provider/{provider}/callback",
+                )
+            },
         )
 
         if not response.is_success:
@@ -4563,12 +5645,14 @@ class Oauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def oauth2_provider_callback_post(
         self,
-        provider: AccountProvider,
-        body: AuthCallback,
+        provider: "models.AccountProvider",
+        body: "models.AuthCallback",
     ):
         """This specific endpoint listens for posts of form data."""
 
@@ -4581,7 +5665,15 @@ class Oauth2API:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "oauth2_provider_callback_post",
+                    "oauth2",
+                    "/oauth2/provider/{provider}/callback",
+                )
+            },
         )
 
         if not response.is_success:
@@ -4589,16 +5681,20 @@ class Oauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def oauth2_provider_consent(
         self,
-        provider: AccountProvider,
+        provider: "models.AccountProvider",
         *,
         callback_url: Optional[str] = None,
-    ) -> OAuth2ClientInfo:
+    ) -> "models.OAuth2ClientInfo":
         """Get the consent URL and other information for the OAuth 2.0 provider."""
 
+        from kittycad.models.oauth2_client_info import OAuth2ClientInfo
+
         url = "{}/oauth2/provider/{provider}/consent".format(
             self.client.base_url, provider=provider
         )
@@ -4614,6 +5710,14 @@ class Oauth2API:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "oauth2_provider_consent",
+                    "oauth2",
+                    "/oauth2/provider/{provider}/consent",
+                )
+            },
         )
 
         if not response.is_success:
@@ -4624,14 +5728,17 @@ class Oauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OAuth2ClientInfo.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OAuth2ClientInfo.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def oauth2_token(
         self,
-        body: OAuth2TokenRequestForm,
+        body: "models.OAuth2TokenRequestForm",
     ):
         """Exchange an authorization code or refresh token for an OAuth 2.0 access token."""
 
@@ -4642,7 +5749,13 @@ class Oauth2API:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "oauth2_token", "oauth2", "/oauth2/token"
+                )
+            },
         )
 
         if not response.is_success:
@@ -4650,11 +5763,13 @@ class Oauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def oauth2_token_revoke(
         self,
-        body: TokenRevokeRequestForm,
+        body: "models.TokenRevokeRequestForm",
     ):
         """This endpoint is designed to be accessed from an *unauthenticated* API client."""
 
@@ -4665,7 +5780,13 @@ class Oauth2API:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "oauth2_token_revoke", "oauth2", "/oauth2/token/revoke"
+                )
+            },
         )
 
         if not response.is_success:
@@ -4673,7 +5794,9 @@ class Oauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def verify_oauth_account_linking(
         self,
@@ -4702,6 +5825,14 @@ class Oauth2API:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "verify_oauth_account_linking",
+                    "oauth2",
+                    "/oauth2/verify-account-linking",
+                )
+            },
         )
 
         if not response.is_success:
@@ -4709,14 +5840,16 @@ class Oauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def list_org_oauth2_apps(
         self,
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "SyncPageIterator":
         """This endpoint requires authentication by an org member. It lists the organization's active public OAuth apps.
 
@@ -4752,12 +5885,21 @@ class Oauth2API:
         return SyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_org_oauth2_apps", "oauth2", "/org/oauth2/apps"
+            ),
         )
 
     def _fetch_page_list_org_oauth2_apps(
         self, **kwargs
-    ) -> OAuth2AppResponseResultsPage:
+    ) -> "models.OAuth2AppResponseResultsPage":
         """Internal method to fetch a single page."""
+
+        from kittycad.models.o_auth2_app_response_results_page import (
+            OAuth2AppResponseResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/org/oauth2/apps".format(self.client.base_url)
 
@@ -4787,6 +5929,12 @@ class Oauth2API:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_org_oauth2_apps", "oauth2", "/org/oauth2/apps"
+                )
+            },
         )
 
         if not response.is_success:
@@ -4797,16 +5945,24 @@ class Oauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return OAuth2AppResponseResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: OAuth2AppResponseResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def create_org_oauth2_app(
         self,
-        body: CreateOAuth2AppRequest,
-    ) -> OAuth2AppResponse:
+        body: "models.CreateOAuth2AppRequest",
+    ) -> "models.OAuth2AppResponse":
         """This endpoint requires authentication by an org admin. It creates an active public OAuth app owned by the authenticated organization."""
 
+        from kittycad.models.o_auth2_app_response import OAuth2AppResponse
+
         url = "{}/org/oauth2/apps".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -4814,7 +5970,13 @@ class Oauth2API:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_org_oauth2_app", "oauth2", "/org/oauth2/apps"
+                )
+            },
         )
 
         if not response.is_success:
@@ -4825,17 +5987,22 @@ class Oauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OAuth2AppResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OAuth2AppResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_org_oauth2_app(
         self,
-        client_id: Uuid,
-    ) -> OAuth2AppResponse:
+        client_id: "models.Uuid",
+    ) -> "models.OAuth2AppResponse":
         """This endpoint requires authentication by an org member. It returns the organization's active public OAuth app by client ID."""
 
+        from kittycad.models.o_auth2_app_response import OAuth2AppResponse
+
         url = "{}/org/oauth2/apps/{client_id}".format(
             self.client.base_url, client_id=client_id
         )
@@ -4845,6 +6012,12 @@ class Oauth2API:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_org_oauth2_app", "oauth2", "/org/oauth2/apps/{client_id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -4855,18 +6028,23 @@ class Oauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OAuth2AppResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OAuth2AppResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def update_org_oauth2_app(
         self,
-        client_id: Uuid,
-        body: UpdateOAuth2AppRequest,
-    ) -> OAuth2AppResponse:
+        client_id: "models.Uuid",
+        body: "models.UpdateOAuth2AppRequest",
+    ) -> "models.OAuth2AppResponse":
         """This endpoint requires authentication by an org admin. It updates the configuration of the organization's active public OAuth app."""
 
+        from kittycad.models.o_auth2_app_response import OAuth2AppResponse
+
         url = "{}/org/oauth2/apps/{client_id}".format(
             self.client.base_url, client_id=client_id
         )
@@ -4876,7 +6054,13 @@ class Oauth2API:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_org_oauth2_app", "oauth2", "/org/oauth2/apps/{client_id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -4887,14 +6071,17 @@ class Oauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OAuth2AppResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OAuth2AppResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def delete_org_oauth2_app(
         self,
-        client_id: Uuid,
+        client_id: "models.Uuid",
     ):
         """This endpoint requires authentication by an org admin. It deactivates the organization's active public OAuth app."""
 
@@ -4907,6 +6094,12 @@ class Oauth2API:
         response = _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_org_oauth2_app", "oauth2", "/org/oauth2/apps/{client_id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -4914,15 +6107,17 @@ class Oauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def list_oauth2_apps_for_any_org(
         self,
-        id: Uuid,
+        id: "models.Uuid",
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "SyncPageIterator":
         """This endpoint requires Zoo admin authentication. It returns the target organization's active OAuth apps for admin dashboard inspection.
 
@@ -4960,12 +6155,21 @@ class Oauth2API:
         return SyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_oauth2_apps_for_any_org", "oauth2", "/orgs/{id}/oauth2/apps"
+            ),
         )
 
     def _fetch_page_list_oauth2_apps_for_any_org(
-        self, id: Uuid, **kwargs
-    ) -> OAuth2AppResponseResultsPage:
+        self, id: "models.Uuid", **kwargs
+    ) -> "models.OAuth2AppResponseResultsPage":
         """Internal method to fetch a single page."""
+
+        from kittycad.models.o_auth2_app_response_results_page import (
+            OAuth2AppResponseResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/orgs/{id}/oauth2/apps".format(self.client.base_url, id=id)
 
@@ -4995,6 +6199,12 @@ class Oauth2API:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_oauth2_apps_for_any_org", "oauth2", "/orgs/{id}/oauth2/apps"
+                )
+            },
         )
 
         if not response.is_success:
@@ -5005,16 +6215,22 @@ class Oauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return OAuth2AppResponseResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: OAuth2AppResponseResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def list_user_oauth2_apps(
         self,
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "SyncPageIterator":
         """This endpoint requires authentication by any Zoo user. It lists the authenticated user's active public OAuth apps.
 
@@ -5050,12 +6266,21 @@ class Oauth2API:
         return SyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_user_oauth2_apps", "oauth2", "/user/oauth2/apps"
+            ),
         )
 
     def _fetch_page_list_user_oauth2_apps(
         self, **kwargs
-    ) -> OAuth2AppResponseResultsPage:
+    ) -> "models.OAuth2AppResponseResultsPage":
         """Internal method to fetch a single page."""
+
+        from kittycad.models.o_auth2_app_response_results_page import (
+            OAuth2AppResponseResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/user/oauth2/apps".format(self.client.base_url)
 
@@ -5085,6 +6310,12 @@ class Oauth2API:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_user_oauth2_apps", "oauth2", "/user/oauth2/apps"
+                )
+            },
         )
 
         if not response.is_success:
@@ -5095,16 +6326,24 @@ class Oauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return OAuth2AppResponseResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: OAuth2AppResponseResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def create_user_oauth2_app(
         self,
-        body: CreateOAuth2AppRequest,
-    ) -> OAuth2AppResponse:
+        body: "models.CreateOAuth2AppRequest",
+    ) -> "models.OAuth2AppResponse":
         """This endpoint requires authentication by any Zoo user. It creates an active public OAuth app owned by the authenticated user."""
 
+        from kittycad.models.o_auth2_app_response import OAuth2AppResponse
+
         url = "{}/user/oauth2/apps".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -5112,7 +6351,13 @@ class Oauth2API:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_user_oauth2_app", "oauth2", "/user/oauth2/apps"
+                )
+            },
         )
 
         if not response.is_success:
@@ -5123,17 +6368,22 @@ class Oauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OAuth2AppResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OAuth2AppResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_user_oauth2_app(
         self,
-        client_id: Uuid,
-    ) -> OAuth2AppResponse:
+        client_id: "models.Uuid",
+    ) -> "models.OAuth2AppResponse":
         """This endpoint requires authentication by any Zoo user. It returns the authenticated user's active public OAuth app by client ID."""
 
+        from kittycad.models.o_auth2_app_response import OAuth2AppResponse
+
         url = "{}/user/oauth2/apps/{client_id}".format(
             self.client.base_url, client_id=client_id
         )
@@ -5143,6 +6393,12 @@ class Oauth2API:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_user_oauth2_app", "oauth2", "/user/oauth2/apps/{client_id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -5153,18 +6409,23 @@ class Oauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OAuth2AppResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OAuth2AppResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def update_user_oauth2_app(
         self,
-        client_id: Uuid,
-        body: UpdateOAuth2AppRequest,
-    ) -> OAuth2AppResponse:
+        client_id: "models.Uuid",
+        body: "models.UpdateOAuth2AppRequest",
+    ) -> "models.OAuth2AppResponse":
         """This endpoint requires authentication by any Zoo user. It updates the configuration of the authenticated user's active public OAuth app."""
 
+        from kittycad.models.o_auth2_app_response import OAuth2AppResponse
+
         url = "{}/user/oauth2/apps/{client_id}".format(
             self.client.base_url, client_id=client_id
         )
@@ -5174,7 +6435,13 @@ class Oauth2API:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_user_oauth2_app", "oauth2", "/user/oauth2/apps/{client_id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -5185,14 +6452,17 @@ class Oauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OAuth2AppResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OAuth2AppResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def delete_user_oauth2_app(
         self,
-        client_id: Uuid,
+        client_id: "models.Uuid",
     ):
         """This endpoint requires authentication by any Zoo user. It deactivates the authenticated user's active public OAuth app."""
 
@@ -5205,6 +6475,12 @@ class Oauth2API:
         response = _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_user_oauth2_app", "oauth2", "/user/oauth2/apps/{client_id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -5212,15 +6488,17 @@ class Oauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def list_oauth2_apps_for_any_user(
         self,
-        id: UserIdentifier,
+        id: "models.UserIdentifier",
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "SyncPageIterator":
         """This endpoint requires Zoo admin authentication. It returns the target user's active OAuth apps so the admin dashboard can inspect them without impersonating the user.
 
@@ -5258,12 +6536,21 @@ class Oauth2API:
         return SyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_oauth2_apps_for_any_user", "oauth2", "/users/{id}/oauth2/apps"
+            ),
         )
 
     def _fetch_page_list_oauth2_apps_for_any_user(
-        self, id: UserIdentifier, **kwargs
-    ) -> OAuth2AppResponseResultsPage:
+        self, id: "models.UserIdentifier", **kwargs
+    ) -> "models.OAuth2AppResponseResultsPage":
         """Internal method to fetch a single page."""
+
+        from kittycad.models.o_auth2_app_response_results_page import (
+            OAuth2AppResponseResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/users/{id}/oauth2/apps".format(self.client.base_url, id=id)
 
@@ -5293,6 +6580,12 @@ class Oauth2API:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_oauth2_apps_for_any_user", "oauth2", "/users/{id}/oauth2/apps"
+                )
+            },
         )
 
         if not response.is_success:
@@ -5303,9 +6596,15 @@ class Oauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return OAuth2AppResponseResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: OAuth2AppResponseResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
 
 class AsyncOauth2API:
@@ -5316,10 +6615,14 @@ class AsyncOauth2API:
 
     async def get_oauth2_authorization_request(
         self,
-        request_id: Uuid,
-    ) -> OAuth2AuthorizationRequestResponse:
+        request_id: "models.Uuid",
+    ) -> "models.OAuth2AuthorizationRequestResponse":
         """Get a pending OAuth 2.0 authorization request for the consent page."""
 
+        from kittycad.models.o_auth2_authorization_request_response import (
+            OAuth2AuthorizationRequestResponse,
+        )
+
         url = "{}/oauth2/authorization-requests/{request_id}".format(
             self.client.base_url, request_id=request_id
         )
@@ -5329,6 +6632,14 @@ class AsyncOauth2API:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_oauth2_authorization_request",
+                    "oauth2",
+                    "/oauth2/authorization-requests/{request_id}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -5339,19 +6650,24 @@ class AsyncOauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OAuth2AuthorizationRequestResponse.model_validate(
-            json_data, extra="ignore"
+        return parse_json_response(
+            response,
+            lambda content: OAuth2AuthorizationRequestResponse.model_validate_json(
+                content, extra="ignore"
+            ),
         )
 
     async def approve_oauth2_authorization_request(
         self,
-        request_id: Uuid,
-    ) -> OAuth2AuthorizationDecisionResponse:
+        request_id: "models.Uuid",
+    ) -> "models.OAuth2AuthorizationDecisionResponse":
         """Approve a pending OAuth 2.0 authorization request."""
 
+        from kittycad.models.o_auth2_authorization_decision_response import (
+            OAuth2AuthorizationDecisionResponse,
+        )
+
         url = "{}/oauth2/authorization-requests/{request_id}/approve".format(
             self.client.base_url, request_id=request_id
         )
@@ -5361,6 +6677,14 @@ class AsyncOauth2API:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "approve_oauth2_authorization_request",
+                    "oauth2",
+                    "/oauth2/authorization-requests/{request_id}/approve",
+                )
+            },
         )
 
         if not response.is_success:
@@ -5371,19 +6695,24 @@ class AsyncOauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OAuth2AuthorizationDecisionResponse.model_validate(
-            json_data, extra="ignore"
+        return parse_json_response(
+            response,
+            lambda content: OAuth2AuthorizationDecisionResponse.model_validate_json(
+                content, extra="ignore"
+            ),
         )
 
     async def deny_oauth2_authorization_request(
         self,
-        request_id: Uuid,
-    ) -> OAuth2AuthorizationDecisionResponse:
+        request_id: "models.Uuid",
+    ) -> "models.OAuth2AuthorizationDecisionResponse":
         """Deny a pending OAuth 2.0 authorization request."""
 
+        from kittycad.models.o_auth2_authorization_decision_response import (
+            OAuth2AuthorizationDecisionResponse,
+        )
+
         url = "{}/oauth2/authorization-requests/{request_id}/deny".format(
             self.client.base_url, request_id=request_id
         )
@@ -5393,6 +6722,14 @@ class AsyncOauth2API:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "deny_oauth2_authorization_request",
+                    "oauth2",
+                    "/oauth2/authorization-requests/{request_id}/deny",
+                )
+            },
         )
 
         if not response.is_success:
@@ -5403,23 +6740,24 @@ class AsyncOauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OAuth2AuthorizationDecisionResponse.model_validate(
-            json_data, extra="ignore"
+        return parse_json_response(
+            response,
+            lambda content: OAuth2AuthorizationDecisionResponse.model_validate_json(
+                content, extra="ignore"
+            ),
         )
 
     async def oauth2_authorize(
         self,
-        response_type: OAuth2AuthorizationResponseType,
+        response_type: "models.OAuth2AuthorizationResponseType",
         client_id: str,
         redirect_uri: str,
         state: str,
         code_challenge: str,
-        code_challenge_method: OAuth2CodeChallengeMethod,
+        code_challenge_method: "models.OAuth2CodeChallengeMethod",
         *,
-        scope: Optional[OAuth2Scopes] = None,
+        scope: "Optional[models.OAuth2Scopes]" = None,
     ):
         """Start an OAuth 2.0 authorization code flow with PKCE."""
 
@@ -5472,6 +6810,12 @@ class AsyncOauth2API:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "oauth2_authorize", "oauth2", "/oauth2/authorize"
+                )
+            },
         )
 
         if not response.is_success:
@@ -5479,11 +6823,13 @@ class AsyncOauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def device_auth_request(
         self,
-        body: DeviceAuthRequestForm,
+        body: "models.DeviceAuthRequestForm",
     ):
         """This endpoint is designed to be accessed from an *unauthenticated* API client. It generates and records a `device_code` and `user_code` which must be verified and confirmed prior to a token being granted."""
 
@@ -5494,7 +6840,13 @@ class AsyncOauth2API:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "device_auth_request", "oauth2", "/oauth2/device/auth"
+                )
+            },
         )
 
         if not response.is_success:
@@ -5502,11 +6854,13 @@ class AsyncOauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def device_auth_confirm(
         self,
-        body: DeviceAuthConfirmParams,
+        body: "models.DeviceAuthConfirmParams",
     ):
         """This endpoint is designed to be accessed by the user agent (browser), not the client requesting the token. So we do not actually return the token here; it will be returned in response to the poll on `/oauth2/device/token`."""
 
@@ -5517,7 +6871,13 @@ class AsyncOauth2API:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "device_auth_confirm", "oauth2", "/oauth2/device/confirm"
+                )
+            },
         )
 
         if not response.is_success:
@@ -5525,11 +6885,13 @@ class AsyncOauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def device_access_token(
         self,
-        body: DeviceAccessTokenRequestForm,
+        body: "models.DeviceAccessTokenRequestForm",
     ):
         """This endpoint should be polled by the client until the user code is verified and the grant is confirmed."""
 
@@ -5540,7 +6902,13 @@ class AsyncOauth2API:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "device_access_token", "oauth2", "/oauth2/device/token"
+                )
+            },
         )
 
         if not response.is_success:
@@ -5548,7 +6916,9 @@ class AsyncOauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def device_auth_verify(
         self,
@@ -5577,6 +6947,12 @@ class AsyncOauth2API:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "device_auth_verify", "oauth2", "/oauth2/device/verify"
+                )
+            },
         )
 
         if not response.is_success:
@@ -5584,11 +6960,13 @@ class AsyncOauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def oauth2_provider_callback(
         self,
-        provider: AccountProvider,
+        provider: "models.AccountProvider",
         *,
         code: Optional[str] = None,
         state: Optional[str] = None,
@@ -5630,6 +7008,14 @@ class AsyncOauth2API:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "oauth2_provider_callback",
+                    "oauth2",
+                    "/oauth2/provider/{provider}/callback",
+                )
+            },
         )
 
         if not response.is_success:
@@ -5637,12 +7023,14 @@ class AsyncOauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def oauth2_provider_callback_post(
         self,
-        provider: AccountProvider,
-        body: AuthCallback,
+        provider: "models.AccountProvider",
+        body: "models.AuthCallback",
     ):
         """This specific endpoint listens for posts of form data."""
 
@@ -5655,7 +7043,15 @@ class AsyncOauth2API:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "oauth2_provider_callback_post",
+                    "oauth2",
+                    "/oauth2/provider/{provider}/callback",
+                )
+            },
         )
 
         if not response.is_success:
@@ -5663,16 +7059,20 @@ class AsyncOauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def oauth2_provider_consent(
         self,
-        provider: AccountProvider,
+        provider: "models.AccountProvider",
         *,
         callback_url: Optional[str] = None,
-    ) -> OAuth2ClientInfo:
+    ) -> "models.OAuth2ClientInfo":
         """Get the consent URL and other information for the OAuth 2.0 provider."""
 
+        from kittycad.models.oauth2_client_info import OAuth2ClientInfo
+
         url = "{}/oauth2/provider/{provider}/consent".format(
             self.client.base_url, provider=provider
         )
@@ -5688,6 +7088,14 @@ class AsyncOauth2API:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "oauth2_provider_consent",
+                    "oauth2",
+                    "/oauth2/provider/{provider}/consent",
+                )
+            },
         )
 
         if not response.is_success:
@@ -5698,14 +7106,17 @@ class AsyncOauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OAuth2ClientInfo.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OAuth2ClientInfo.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def oauth2_token(
         self,
-        body: OAuth2TokenRequestForm,
+        body: "models.OAuth2TokenRequestForm",
     ):
         """Exchange an authorization code or refresh token for an OAuth 2.0 access token."""
 
@@ -5716,7 +7127,13 @@ class AsyncOauth2API:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "oauth2_token", "oauth2", "/oauth2/token"
+                )
+            },
         )
 
         if not response.is_success:
@@ -5724,11 +7141,13 @@ class AsyncOauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def oauth2_token_revoke(
         self,
-        body: TokenRevokeRequestForm,
+        body: "models.TokenRevokeRequestForm",
     ):
         """This endpoint is designed to be accessed from an *unauthenticated* API client."""
 
@@ -5739,7 +7158,13 @@ class AsyncOauth2API:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "oauth2_token_revoke", "oauth2", "/oauth2/token/revoke"
+                )
+            },
         )
 
         if not response.is_success:
@@ -5747,7 +7172,9 @@ class AsyncOauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def verify_oauth_account_linking(
         self,
@@ -5776,6 +7203,14 @@ class AsyncOauth2API:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "verify_oauth_account_linking",
+                    "oauth2",
+                    "/oauth2/verify-account-linking",
+                )
+            },
         )
 
         if not response.is_success:
@@ -5783,14 +7218,16 @@ class AsyncOauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def list_org_oauth2_apps(
         self,
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "AsyncPageIterator":
         """This endpoint requires authentication by an org member. It lists the organization's active public OAuth apps.
 
@@ -5826,12 +7263,21 @@ class AsyncOauth2API:
         return AsyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_org_oauth2_apps", "oauth2", "/org/oauth2/apps"
+            ),
         )
 
     async def _fetch_page_list_org_oauth2_apps(
         self, **kwargs
-    ) -> OAuth2AppResponseResultsPage:
+    ) -> "models.OAuth2AppResponseResultsPage":
         """Internal async method to fetch a single page."""
+
+        from kittycad.models.o_auth2_app_response_results_page import (
+            OAuth2AppResponseResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/org/oauth2/apps".format(self.client.base_url)
 
@@ -5861,6 +7307,12 @@ class AsyncOauth2API:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_org_oauth2_apps", "oauth2", "/org/oauth2/apps"
+                )
+            },
         )
 
         if not response.is_success:
@@ -5871,16 +7323,24 @@ class AsyncOauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return OAuth2AppResponseResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: OAuth2AppResponseResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def create_org_oauth2_app(
         self,
-        body: CreateOAuth2AppRequest,
-    ) -> OAuth2AppResponse:
+        body: "models.CreateOAuth2AppRequest",
+    ) -> "models.OAuth2AppResponse":
         """This endpoint requires authentication by an org admin. It creates an active public OAuth app owned by the authenticated organization."""
 
+        from kittycad.models.o_auth2_app_response import OAuth2AppResponse
+
         url = "{}/org/oauth2/apps".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -5888,7 +7348,13 @@ class AsyncOauth2API:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_org_oauth2_app", "oauth2", "/org/oauth2/apps"
+                )
+            },
         )
 
         if not response.is_success:
@@ -5899,17 +7365,22 @@ class AsyncOauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OAuth2AppResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OAuth2AppResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_org_oauth2_app(
         self,
-        client_id: Uuid,
-    ) -> OAuth2AppResponse:
+        client_id: "models.Uuid",
+    ) -> "models.OAuth2AppResponse":
         """This endpoint requires authentication by an org member. It returns the organization's active public OAuth app by client ID."""
 
+        from kittycad.models.o_auth2_app_response import OAuth2AppResponse
+
         url = "{}/org/oauth2/apps/{client_id}".format(
             self.client.base_url, client_id=client_id
         )
@@ -5919,6 +7390,12 @@ class AsyncOauth2API:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_org_oauth2_app", "oauth2", "/org/oauth2/apps/{client_id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -5929,18 +7406,23 @@ class AsyncOauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OAuth2AppResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OAuth2AppResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def update_org_oauth2_app(
         self,
-        client_id: Uuid,
-        body: UpdateOAuth2AppRequest,
-    ) -> OAuth2AppResponse:
+        client_id: "models.Uuid",
+        body: "models.UpdateOAuth2AppRequest",
+    ) -> "models.OAuth2AppResponse":
         """This endpoint requires authentication by an org admin. It updates the configuration of the organization's active public OAuth app."""
 
+        from kittycad.models.o_auth2_app_response import OAuth2AppResponse
+
         url = "{}/org/oauth2/apps/{client_id}".format(
             self.client.base_url, client_id=client_id
         )
@@ -5950,7 +7432,13 @@ class AsyncOauth2API:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_org_oauth2_app", "oauth2", "/org/oauth2/apps/{client_id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -5961,14 +7449,17 @@ class AsyncOauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OAuth2AppResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OAuth2AppResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def delete_org_oauth2_app(
         self,
-        client_id: Uuid,
+        client_id: "models.Uuid",
     ):
         """This endpoint requires authentication by an org admin. It deactivates the organization's active public OAuth app."""
 
@@ -5981,6 +7472,12 @@ class AsyncOauth2API:
         response = await _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_org_oauth2_app", "oauth2", "/org/oauth2/apps/{client_id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -5988,15 +7485,17 @@ class AsyncOauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def list_oauth2_apps_for_any_org(
         self,
-        id: Uuid,
+        id: "models.Uuid",
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "AsyncPageIterator":
         """This endpoint requires Zoo admin authentication. It returns the target organization's active OAuth apps for admin dashboard inspection.
 
@@ -6034,12 +7533,21 @@ class AsyncOauth2API:
         return AsyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_oauth2_apps_for_any_org", "oauth2", "/orgs/{id}/oauth2/apps"
+            ),
         )
 
     async def _fetch_page_list_oauth2_apps_for_any_org(
-        self, id: Uuid, **kwargs
-    ) -> OAuth2AppResponseResultsPage:
+        self, id: "models.Uuid", **kwargs
+    ) -> "models.OAuth2AppResponseResultsPage":
         """Internal async method to fetch a single page."""
+
+        from kittycad.models.o_auth2_app_response_results_page import (
+            OAuth2AppResponseResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/orgs/{id}/oauth2/apps".format(self.client.base_url, id=id)
 
@@ -6069,6 +7577,12 @@ class AsyncOauth2API:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_oauth2_apps_for_any_org", "oauth2", "/orgs/{id}/oauth2/apps"
+                )
+            },
         )
 
         if not response.is_success:
@@ -6079,16 +7593,22 @@ class AsyncOauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return OAuth2AppResponseResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: OAuth2AppResponseResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def list_user_oauth2_apps(
         self,
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "AsyncPageIterator":
         """This endpoint requires authentication by any Zoo user. It lists the authenticated user's active public OAuth apps.
 
@@ -6124,12 +7644,21 @@ class AsyncOauth2API:
         return AsyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_user_oauth2_apps", "oauth2", "/user/oauth2/apps"
+            ),
         )
 
     async def _fetch_page_list_user_oauth2_apps(
         self, **kwargs
-    ) -> OAuth2AppResponseResultsPage:
+    ) -> "models.OAuth2AppResponseResultsPage":
         """Internal async method to fetch a single page."""
+
+        from kittycad.models.o_auth2_app_response_results_page import (
+            OAuth2AppResponseResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/user/oauth2/apps".format(self.client.base_url)
 
@@ -6159,6 +7688,12 @@ class AsyncOauth2API:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_user_oauth2_apps", "oauth2", "/user/oauth2/apps"
+                )
+            },
         )
 
         if not response.is_success:
@@ -6169,16 +7704,24 @@ class AsyncOauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return OAuth2AppResponseResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: OAuth2AppResponseResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def create_user_oauth2_app(
         self,
-        body: CreateOAuth2AppRequest,
-    ) -> OAuth2AppResponse:
+        body: "models.CreateOAuth2AppRequest",
+    ) -> "models.OAuth2AppResponse":
         """This endpoint requires authentication by any Zoo user. It creates an active public OAuth app owned by the authenticated user."""
 
+        from kittycad.models.o_auth2_app_response import OAuth2AppResponse
+
         url = "{}/user/oauth2/apps".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -6186,7 +7729,13 @@ class AsyncOauth2API:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_user_oauth2_app", "oauth2", "/user/oauth2/apps"
+                )
+            },
         )
 
         if not response.is_success:
@@ -6197,17 +7746,22 @@ class AsyncOauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OAuth2AppResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OAuth2AppResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_user_oauth2_app(
         self,
-        client_id: Uuid,
-    ) -> OAuth2AppResponse:
+        client_id: "models.Uuid",
+    ) -> "models.OAuth2AppResponse":
         """This endpoint requires authentication by any Zoo user. It returns the authenticated user's active public OAuth app by client ID."""
 
+        from kittycad.models.o_auth2_app_response import OAuth2AppResponse
+
         url = "{}/user/oauth2/apps/{client_id}".format(
             self.client.base_url, client_id=client_id
         )
@@ -6217,6 +7771,12 @@ class AsyncOauth2API:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_user_oauth2_app", "oauth2", "/user/oauth2/apps/{client_id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -6227,18 +7787,23 @@ class AsyncOauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OAuth2AppResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OAuth2AppResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def update_user_oauth2_app(
         self,
-        client_id: Uuid,
-        body: UpdateOAuth2AppRequest,
-    ) -> OAuth2AppResponse:
+        client_id: "models.Uuid",
+        body: "models.UpdateOAuth2AppRequest",
+    ) -> "models.OAuth2AppResponse":
         """This endpoint requires authentication by any Zoo user. It updates the configuration of the authenticated user's active public OAuth app."""
 
+        from kittycad.models.o_auth2_app_response import OAuth2AppResponse
+
         url = "{}/user/oauth2/apps/{client_id}".format(
             self.client.base_url, client_id=client_id
         )
@@ -6248,7 +7813,13 @@ class AsyncOauth2API:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_user_oauth2_app", "oauth2", "/user/oauth2/apps/{client_id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -6259,14 +7830,17 @@ class AsyncOauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OAuth2AppResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OAuth2AppResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def delete_user_oauth2_app(
         self,
-        client_id: Uuid,
+        client_id: "models.Uuid",
     ):
         """This endpoint requires authentication by any Zoo user. It deactivates the authenticated user's active public OAuth app."""
 
@@ -6279,6 +7853,12 @@ class AsyncOauth2API:
         response = await _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_user_oauth2_app", "oauth2", "/user/oauth2/apps/{client_id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -6286,15 +7866,17 @@ class AsyncOauth2API:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def list_oauth2_apps_for_any_user(
         self,
-        id: UserIdentifier,
+        id: "models.UserIdentifier",
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "AsyncPageIterator":
         """This endpoint requires Zoo admin authentication. It returns the target user's active OAuth apps so the admin dashboard can inspect them without impersonating the user.
 
@@ -6332,12 +7914,21 @@ class AsyncOauth2API:
         return AsyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_oauth2_apps_for_any_user", "oauth2", "/users/{id}/oauth2/apps"
+            ),
         )
 
     async def _fetch_page_list_oauth2_apps_for_any_user(
-        self, id: UserIdentifier, **kwargs
-    ) -> OAuth2AppResponseResultsPage:
+        self, id: "models.UserIdentifier", **kwargs
+    ) -> "models.OAuth2AppResponseResultsPage":
         """Internal async method to fetch a single page."""
+
+        from kittycad.models.o_auth2_app_response_results_page import (
+            OAuth2AppResponseResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/users/{id}/oauth2/apps".format(self.client.base_url, id=id)
 
@@ -6367,6 +7958,12 @@ class AsyncOauth2API:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_oauth2_apps_for_any_user", "oauth2", "/users/{id}/oauth2/apps"
+                )
+            },
         )
 
         if not response.is_success:
@@ -6377,9 +7974,15 @@ class AsyncOauth2API:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return OAuth2AppResponseResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: OAuth2AppResponseResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
 
 class OrgsAPI:
@@ -6390,9 +7993,11 @@ class OrgsAPI:
 
     def get_org(
         self,
-    ) -> Org:
+    ) -> "models.Org":
         """This endpoint requires authentication by an org admin. It gets the authenticated user's org."""
 
+        from kittycad.models.org import Org
+
         url = "{}/org".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -6400,6 +8005,8 @@ class OrgsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={"kittycad_operation": OperationInfo("get_org", "orgs", "/org")},
         )
 
         if not response.is_success:
@@ -6410,17 +8017,19 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Org.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response, lambda content: Org.model_validate_json(content, extra="ignore")
+        )
 
     def update_org(
         self,
-        body: OrgDetails,
-    ) -> Org:
+        body: "models.OrgDetails",
+    ) -> "models.Org":
         """This endpoint requires authentication by an org admin. It updates the authenticated user's org."""
 
+        from kittycad.models.org import Org
+
         url = "{}/org".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -6428,7 +8037,11 @@ class OrgsAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo("update_org", "orgs", "/org")
+            },
         )
 
         if not response.is_success:
@@ -6439,17 +8052,19 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Org.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response, lambda content: Org.model_validate_json(content, extra="ignore")
+        )
 
     def create_org(
         self,
-        body: OrgDetails,
-    ) -> Org:
+        body: "models.OrgDetails",
+    ) -> "models.Org":
         """This endpoint requires authentication by a Zoo user that is not already in an org. It creates a new org for the authenticated user and makes them an admin."""
 
+        from kittycad.models.org import Org
+
         url = "{}/org".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -6457,7 +8072,11 @@ class OrgsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo("create_org", "orgs", "/org")
+            },
         )
 
         if not response.is_success:
@@ -6468,10 +8087,10 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Org.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response, lambda content: Org.model_validate_json(content, extra="ignore")
+        )
 
     def delete_org(
         self,
@@ -6489,6 +8108,10 @@ class OrgsAPI:
         response = _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo("delete_org", "orgs", "/org")
+            },
         )
 
         if not response.is_success:
@@ -6496,15 +8119,19 @@ class OrgsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def org_dataset_s3_policies(
         self,
         uri: str,
         role_arn: str,
-    ) -> DatasetS3Policies:
+    ) -> "models.DatasetS3Policies":
         """Return the IAM policies customers should apply when onboarding an S3 dataset."""
 
+        from kittycad.models.dataset_s3_policies import DatasetS3Policies
+
         url = "{}/org/dataset/s3/policies".format(self.client.base_url)
 
         if uri is not None:
@@ -6524,6 +8151,12 @@ class OrgsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "org_dataset_s3_policies", "orgs", "/org/dataset/s3/policies"
+                )
+            },
         )
 
         if not response.is_success:
@@ -6534,10 +8167,13 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return DatasetS3Policies.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: DatasetS3Policies.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def list_org_datasets(
         self,
@@ -6545,7 +8181,7 @@ class OrgsAPI:
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
         lookup_enabled: Optional[bool] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "SyncPageIterator":
         """List every dataset that belongs to the caller's organization.
 
@@ -6584,10 +8220,15 @@ class OrgsAPI:
         return SyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo("list_org_datasets", "orgs", "/org/datasets"),
         )
 
-    def _fetch_page_list_org_datasets(self, **kwargs) -> OrgDatasetResultsPage:
+    def _fetch_page_list_org_datasets(self, **kwargs) -> "models.OrgDatasetResultsPage":
         """Internal method to fetch a single page."""
+
+        from kittycad.models.org_dataset_results_page import OrgDatasetResultsPage
+
         # Build URL with path parameters
         url = "{}/org/datasets".format(self.client.base_url)
 
@@ -6623,6 +8264,12 @@ class OrgsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_org_datasets", "orgs", "/org/datasets"
+                )
+            },
         )
 
         if not response.is_success:
@@ -6633,16 +8280,24 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return OrgDatasetResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: OrgDatasetResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def create_org_dataset(
         self,
-        body: CreateOrgDataset,
-    ) -> OrgDataset:
+        body: "models.CreateOrgDataset",
+    ) -> "models.OrgDataset":
         """If the dataset lives in S3, call `/org/dataset/s3/policies` first so you can generate the trust, permission, and bucket policies scoped to your dataset before invoking this endpoint."""
 
+        from kittycad.models.org_dataset import OrgDataset
+
         url = "{}/org/datasets".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -6650,7 +8305,13 @@ class OrgsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_org_dataset", "orgs", "/org/datasets"
+                )
+            },
         )
 
         if not response.is_success:
@@ -6661,17 +8322,20 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OrgDataset.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OrgDataset.model_validate_json(content, extra="ignore"),
+        )
 
     def get_org_dataset(
         self,
-        id: Uuid,
-    ) -> OrgDataset:
+        id: "models.Uuid",
+    ) -> "models.OrgDataset":
         """Fetch a single dataset by id so long as it belongs to the authenticated org."""
 
+        from kittycad.models.org_dataset import OrgDataset
+
         url = "{}/org/datasets/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -6679,6 +8343,12 @@ class OrgsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_org_dataset", "orgs", "/org/datasets/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -6689,18 +8359,21 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OrgDataset.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OrgDataset.model_validate_json(content, extra="ignore"),
+        )
 
     def update_org_dataset(
         self,
-        id: Uuid,
-        body: UpdateOrgDataset,
-    ) -> OrgDataset:
+        id: "models.Uuid",
+        body: "models.UpdateOrgDataset",
+    ) -> "models.OrgDataset":
         """IMPORTANT: Use this endpoint to fix connectivity to the same underlying storage location (e.g. rotating credentials or correcting a typo). Do not repoint an existing dataset at a completely different bucket or provider—create a new dataset instead so conversions in flight keep their original source. This warning applies to every storage backend, not just S3."""
 
+        from kittycad.models.org_dataset import OrgDataset
+
         url = "{}/org/datasets/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -6708,7 +8381,13 @@ class OrgsAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_org_dataset", "orgs", "/org/datasets/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -6719,14 +8398,15 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OrgDataset.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OrgDataset.model_validate_json(content, extra="ignore"),
+        )
 
     def delete_org_dataset(
         self,
-        id: Uuid,
+        id: "models.Uuid",
     ):
         """This is a destructive operation that: - requires org admin authentication and the dataset must belong to the caller's org. - fails with a 409 Conflict if the dataset is still attached to any custom model. - deletes Zoo-managed artifacts for this dataset (converted outputs and embeddings). - does **not** delete or modify the customer's source bucket/prefix.
 
@@ -6739,6 +8419,12 @@ class OrgsAPI:
         response = _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_org_dataset", "orgs", "/org/datasets/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -6746,11 +8432,13 @@ class OrgsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def download_org_dataset_successful_kcl_bulk(
         self,
-        id: Uuid,
+        id: "models.Uuid",
     ):
         """Bulk-download KCL outputs for successful dataset conversions."""
 
@@ -6763,6 +8451,14 @@ class OrgsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "download_org_dataset_successful_kcl_bulk",
+                    "orgs",
+                    "/org/datasets/{id}/bulk-download/kcl",
+                )
+            },
         )
 
         if not response.is_success:
@@ -6770,15 +8466,17 @@ class OrgsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def list_org_dataset_conversions(
         self,
-        id: Uuid,
+        id: "models.Uuid",
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[ConversionSortMode] = None,
+        sort_by: "Optional[models.ConversionSortMode]" = None,
         filter: Optional[str] = None,
         q: Optional[str] = None,
         phase: Optional[str] = None,
@@ -6828,12 +8526,21 @@ class OrgsAPI:
         return SyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_org_dataset_conversions", "orgs", "/org/datasets/{id}/conversions"
+            ),
         )
 
     def _fetch_page_list_org_dataset_conversions(
-        self, id: Uuid, **kwargs
-    ) -> OrgDatasetFileConversionSummaryResultsPage:
+        self, id: "models.Uuid", **kwargs
+    ) -> "models.OrgDatasetFileConversionSummaryResultsPage":
         """Internal method to fetch a single page."""
+
+        from kittycad.models.org_dataset_file_conversion_summary_results_page import (
+            OrgDatasetFileConversionSummaryResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/org/datasets/{id}/conversions".format(self.client.base_url, id=id)
 
@@ -6881,6 +8588,14 @@ class OrgsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_org_dataset_conversions",
+                    "orgs",
+                    "/org/datasets/{id}/conversions",
+                )
+            },
         )
 
         if not response.is_success:
@@ -6891,19 +8606,29 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return OrgDatasetFileConversionSummaryResultsPage.model_validate(
-            json_data, extra="ignore"
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: (
+                OrgDatasetFileConversionSummaryResultsPage.model_validate_json(
+                    content, extra="ignore"
+                )
+            ),
         )
 
     def get_org_dataset_conversion(
         self,
-        id: Uuid,
-        conversion_id: Uuid,
-    ) -> OrgDatasetFileConversionDetails:
+        id: "models.Uuid",
+        conversion_id: "models.Uuid",
+    ) -> "models.OrgDatasetFileConversionDetails":
         """Unlike list/search endpoints, this returns the full conversion payload: latest output text plus decoded snapshot image payloads for original, raw-KCL, and salon-KCL stages."""
 
+        from kittycad.models.org_dataset_file_conversion_details import (
+            OrgDatasetFileConversionDetails,
+        )
+
         url = "{}/org/datasets/{id}/conversions/{conversion_id}".format(
             self.client.base_url, id=id, conversion_id=conversion_id
         )
@@ -6913,6 +8638,14 @@ class OrgsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_org_dataset_conversion",
+                    "orgs",
+                    "/org/datasets/{id}/conversions/{conversion_id}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -6923,15 +8656,18 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OrgDatasetFileConversionDetails.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OrgDatasetFileConversionDetails.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def download_org_dataset_conversion_original(
         self,
-        id: Uuid,
-        conversion_id: Uuid,
+        id: "models.Uuid",
+        conversion_id: "models.Uuid",
     ):
         """Download the original source file for a specific dataset conversion."""
 
@@ -6944,6 +8680,14 @@ class OrgsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "download_org_dataset_conversion_original",
+                    "orgs",
+                    "/org/datasets/{id}/conversions/{conversion_id}/original",
+                )
+            },
         )
 
         if not response.is_success:
@@ -6951,12 +8695,14 @@ class OrgsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def retrigger_org_dataset_conversion(
         self,
-        id: Uuid,
-        conversion_id: Uuid,
+        id: "models.Uuid",
+        conversion_id: "models.Uuid",
     ):
         """Retrigger a specific dataset conversion for the caller's org."""
 
@@ -6969,6 +8715,14 @@ class OrgsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "retrigger_org_dataset_conversion",
+                    "orgs",
+                    "/org/datasets/{id}/conversions/{conversion_id}/retrigger",
+                )
+            },
         )
 
         if not response.is_success:
@@ -6976,11 +8730,13 @@ class OrgsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def retrigger_org_dataset(
         self,
-        id: Uuid,
+        id: "models.Uuid",
         *,
         statuses: Optional[str] = None,
     ):
@@ -6999,6 +8755,12 @@ class OrgsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "retrigger_org_dataset", "orgs", "/org/datasets/{id}/retrigger"
+                )
+            },
         )
 
         if not response.is_success:
@@ -7006,16 +8768,18 @@ class OrgsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def search_org_dataset_conversions(
         self,
-        id: Uuid,
+        id: "models.Uuid",
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
         q: Optional[str] = None,
-        sort_by: Optional[ConversionSortMode] = None,
+        sort_by: "Optional[models.ConversionSortMode]" = None,
         filter: Optional[str] = None,
         phase: Optional[str] = None,
     ) -> "SyncPageIterator":
@@ -7064,12 +8828,23 @@ class OrgsAPI:
         return SyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "search_org_dataset_conversions",
+                "orgs",
+                "/org/datasets/{id}/search/conversions",
+            ),
         )
 
     def _fetch_page_search_org_dataset_conversions(
-        self, id: Uuid, **kwargs
-    ) -> OrgDatasetFileConversionSummaryResultsPage:
+        self, id: "models.Uuid", **kwargs
+    ) -> "models.OrgDatasetFileConversionSummaryResultsPage":
         """Internal method to fetch a single page."""
+
+        from kittycad.models.org_dataset_file_conversion_summary_results_page import (
+            OrgDatasetFileConversionSummaryResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/org/datasets/{id}/search/conversions".format(
             self.client.base_url, id=id
@@ -7119,6 +8894,14 @@ class OrgsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "search_org_dataset_conversions",
+                    "orgs",
+                    "/org/datasets/{id}/search/conversions",
+                )
+            },
         )
 
         if not response.is_success:
@@ -7129,21 +8912,31 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return OrgDatasetFileConversionSummaryResultsPage.model_validate(
-            json_data, extra="ignore"
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: (
+                OrgDatasetFileConversionSummaryResultsPage.model_validate_json(
+                    content, extra="ignore"
+                )
+            ),
         )
 
     def search_org_dataset_semantic(
         self,
-        id: Uuid,
+        id: "models.Uuid",
         q: str,
         *,
         limit: Optional[int] = None,
-    ) -> List[OrgDatasetSemanticSearchMatch]:
+    ) -> "List[models.OrgDatasetSemanticSearchMatch]":
         """This embeds the query text with the org-dataset embedding model and returns top chunk matches ranked by cosine similarity."""
 
+        from kittycad.models.org_dataset_semantic_search_match import (
+            OrgDatasetSemanticSearchMatch,
+        )
+
         url = "{}/org/datasets/{id}/search/semantic".format(self.client.base_url, id=id)
 
         if q is not None:
@@ -7163,6 +8956,14 @@ class OrgsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "search_org_dataset_semantic",
+                    "orgs",
+                    "/org/datasets/{id}/search/semantic",
+                )
+            },
         )
 
         if not response.is_success:
@@ -7173,21 +8974,26 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[OrgDatasetSemanticSearchMatch]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[OrgDatasetSemanticSearchMatch]",
+                lambda: List[OrgDatasetSemanticSearchMatch],
+            ).validate_json(content, extra="ignore"),
         )
 
     def get_org_dataset_conversion_stats(
         self,
-        id: Uuid,
-    ) -> OrgDatasetConversionStatsResponse:
+        id: "models.Uuid",
+    ) -> "models.OrgDatasetConversionStatsResponse":
         """Return aggregate conversion stats for a dataset owned by the caller's org."""
 
+        from kittycad.models.org_dataset_conversion_stats_response import (
+            OrgDatasetConversionStatsResponse,
+        )
+
         url = "{}/org/datasets/{id}/stats".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -7195,6 +9001,14 @@ class OrgsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_org_dataset_conversion_stats",
+                    "orgs",
+                    "/org/datasets/{id}/stats",
+                )
+            },
         )
 
         if not response.is_success:
@@ -7205,19 +9019,24 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OrgDatasetConversionStatsResponse.model_validate(
-            json_data, extra="ignore"
+        return parse_json_response(
+            response,
+            lambda content: OrgDatasetConversionStatsResponse.model_validate_json(
+                content, extra="ignore"
+            ),
         )
 
     def upload_org_dataset_files(
         self,
-        id: Uuid,
-    ) -> UploadOrgDatasetFilesResponse:
+        id: "models.Uuid",
+    ) -> "models.UploadOrgDatasetFilesResponse":
         """This endpoint accepts `multipart/form-data` where each file part becomes a source object in the dataset. Exact `<proprietary CAD filename>.json` converter dumps are also accepted and associated with their original CAD file. Paths are normalized and must be relative."""
 
+        from kittycad.models.upload_org_dataset_files_response import (
+            UploadOrgDatasetFilesResponse,
+        )
+
         url = "{}/org/datasets/{id}/uploads".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -7225,6 +9044,12 @@ class OrgsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "upload_org_dataset_files", "orgs", "/org/datasets/{id}/uploads"
+                )
+            },
         )
 
         if not response.is_success:
@@ -7235,18 +9060,21 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UploadOrgDatasetFilesResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UploadOrgDatasetFilesResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def list_org_members(
         self,
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
-        role: Optional[UserOrgRole] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
+        role: "Optional[models.UserOrgRole]" = None,
     ) -> "SyncPageIterator":
         """This endpoint requires authentication by an org admin. It lists the members of the authenticated user's org.
 
@@ -7285,10 +9113,15 @@ class OrgsAPI:
         return SyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo("list_org_members", "orgs", "/org/members"),
         )
 
-    def _fetch_page_list_org_members(self, **kwargs) -> OrgMemberResultsPage:
+    def _fetch_page_list_org_members(self, **kwargs) -> "models.OrgMemberResultsPage":
         """Internal method to fetch a single page."""
+
+        from kittycad.models.org_member_results_page import OrgMemberResultsPage
+
         # Build URL with path parameters
         url = "{}/org/members".format(self.client.base_url)
 
@@ -7324,6 +9157,12 @@ class OrgsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_org_members", "orgs", "/org/members"
+                )
+            },
         )
 
         if not response.is_success:
@@ -7334,14 +9173,20 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return OrgMemberResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: OrgMemberResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def create_org_member(
         self,
-        body: AddOrgMember,
-    ) -> OrgMember:
+        body: "models.AddOrgMember",
+    ) -> "models.OrgMember":
         """If the user exists, this will add them to your org. If they do not exist, this will create a new user and add them to your org.
 
         In both cases the user gets an email that they have been added to the org.
@@ -7352,6 +9197,8 @@ class OrgsAPI:
 
         This endpoint requires authentication by an org admin. It adds the specified member to the authenticated user's org."""
 
+        from kittycad.models.org_member import OrgMember
+
         url = "{}/org/members".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -7359,7 +9206,13 @@ class OrgsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_org_member", "orgs", "/org/members"
+                )
+            },
         )
 
         if not response.is_success:
@@ -7370,17 +9223,20 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OrgMember.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OrgMember.model_validate_json(content, extra="ignore"),
+        )
 
     def get_org_member(
         self,
-        user_id: Uuid,
-    ) -> OrgMember:
+        user_id: "models.Uuid",
+    ) -> "models.OrgMember":
         """This endpoint requires authentication by an org admin. It gets the specified member of the authenticated user's org."""
 
+        from kittycad.models.org_member import OrgMember
+
         url = "{}/org/members/{user_id}".format(self.client.base_url, user_id=user_id)
 
         _client = self.client.get_http_client()
@@ -7388,6 +9244,12 @@ class OrgsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_org_member", "orgs", "/org/members/{user_id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -7398,18 +9260,21 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OrgMember.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OrgMember.model_validate_json(content, extra="ignore"),
+        )
 
     def update_org_member(
         self,
-        user_id: Uuid,
-        body: UpdateMemberToOrgBody,
-    ) -> OrgMember:
+        user_id: "models.Uuid",
+        body: "models.UpdateMemberToOrgBody",
+    ) -> "models.OrgMember":
         """This endpoint requires authentication by an org admin. It updates the specified member of the authenticated user's org."""
 
+        from kittycad.models.org_member import OrgMember
+
         url = "{}/org/members/{user_id}".format(self.client.base_url, user_id=user_id)
 
         _client = self.client.get_http_client()
@@ -7417,7 +9282,13 @@ class OrgsAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_org_member", "orgs", "/org/members/{user_id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -7428,14 +9299,15 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OrgMember.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OrgMember.model_validate_json(content, extra="ignore"),
+        )
 
     def delete_org_member(
         self,
-        user_id: Uuid,
+        user_id: "models.Uuid",
     ):
         """This endpoint requires authentication by an org admin. It removes the specified member from the authenticated user's org."""
 
@@ -7446,6 +9318,12 @@ class OrgsAPI:
         response = _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_org_member", "orgs", "/org/members/{user_id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -7453,13 +9331,17 @@ class OrgsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def get_org_privacy_settings(
         self,
-    ) -> PrivacySettings:
+    ) -> "models.PrivacySettings":
         """This endpoint requires authentication by an org admin. It gets the privacy settings for the authenticated user's org."""
 
+        from kittycad.models.privacy_settings import PrivacySettings
+
         url = "{}/org/privacy".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -7467,6 +9349,12 @@ class OrgsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_org_privacy_settings", "orgs", "/org/privacy"
+                )
+            },
         )
 
         if not response.is_success:
@@ -7477,17 +9365,22 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return PrivacySettings.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: PrivacySettings.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def update_org_privacy_settings(
         self,
-        body: PrivacySettings,
-    ) -> PrivacySettings:
+        body: "models.PrivacySettings",
+    ) -> "models.PrivacySettings":
         """This endpoint requires authentication by an org admin. It updates the privacy settings for the authenticated user's org."""
 
+        from kittycad.models.privacy_settings import PrivacySettings
+
         url = "{}/org/privacy".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -7495,7 +9388,13 @@ class OrgsAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_org_privacy_settings", "orgs", "/org/privacy"
+                )
+            },
         )
 
         if not response.is_success:
@@ -7506,16 +9405,21 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return PrivacySettings.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: PrivacySettings.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_org_saml_idp(
         self,
-    ) -> SamlIdentityProvider:
+    ) -> "models.SamlIdentityProvider":
         """This endpoint requires authentication by an org admin."""
 
+        from kittycad.models.saml_identity_provider import SamlIdentityProvider
+
         url = "{}/org/saml/idp".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -7523,6 +9427,12 @@ class OrgsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_org_saml_idp", "orgs", "/org/saml/idp"
+                )
+            },
         )
 
         if not response.is_success:
@@ -7533,17 +9443,22 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return SamlIdentityProvider.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: SamlIdentityProvider.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def update_org_saml_idp(
         self,
-        body: SamlIdentityProviderCreate,
-    ) -> SamlIdentityProvider:
+        body: "models.SamlIdentityProviderCreate",
+    ) -> "models.SamlIdentityProvider":
         """This endpoint requires authentication by an org admin."""
 
+        from kittycad.models.saml_identity_provider import SamlIdentityProvider
+
         url = "{}/org/saml/idp".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -7551,7 +9466,13 @@ class OrgsAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_org_saml_idp", "orgs", "/org/saml/idp"
+                )
+            },
         )
 
         if not response.is_success:
@@ -7562,17 +9483,22 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return SamlIdentityProvider.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: SamlIdentityProvider.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def create_org_saml_idp(
         self,
-        body: SamlIdentityProviderCreate,
-    ) -> SamlIdentityProvider:
+        body: "models.SamlIdentityProviderCreate",
+    ) -> "models.SamlIdentityProvider":
         """This endpoint requires authentication by an org admin."""
 
+        from kittycad.models.saml_identity_provider import SamlIdentityProvider
+
         url = "{}/org/saml/idp".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -7580,7 +9506,13 @@ class OrgsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_org_saml_idp", "orgs", "/org/saml/idp"
+                )
+            },
         )
 
         if not response.is_success:
@@ -7591,10 +9523,13 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return SamlIdentityProvider.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: SamlIdentityProvider.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def delete_org_saml_idp(
         self,
@@ -7608,6 +9543,12 @@ class OrgsAPI:
         response = _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_org_saml_idp", "orgs", "/org/saml/idp"
+                )
+            },
         )
 
         if not response.is_success:
@@ -7615,14 +9556,16 @@ class OrgsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def get_org_shortlinks(
         self,
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "SyncPageIterator":
         """This endpoint requires authentication by an org admin. It gets the shortlinks for the authenticated user's org.
 
@@ -7658,10 +9601,15 @@ class OrgsAPI:
         return SyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo("get_org_shortlinks", "orgs", "/org/shortlinks"),
         )
 
-    def _fetch_page_get_org_shortlinks(self, **kwargs) -> ShortlinkResultsPage:
+    def _fetch_page_get_org_shortlinks(self, **kwargs) -> "models.ShortlinkResultsPage":
         """Internal method to fetch a single page."""
+
+        from kittycad.models.shortlink_results_page import ShortlinkResultsPage
+
         # Build URL with path parameters
         url = "{}/org/shortlinks".format(self.client.base_url)
 
@@ -7691,6 +9639,12 @@ class OrgsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_org_shortlinks", "orgs", "/org/shortlinks"
+                )
+            },
         )
 
         if not response.is_success:
@@ -7701,15 +9655,23 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return ShortlinkResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: ShortlinkResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def list_org_skills(
         self,
-    ) -> List[OrgSkillResponse]:
+    ) -> "List[models.OrgSkillResponse]":
         """List every skill that belongs to the caller's organization."""
 
+        from kittycad.models.org_skill_response import OrgSkillResponse
+
         url = "{}/org/skills".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -7717,6 +9679,12 @@ class OrgsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_org_skills", "orgs", "/org/skills"
+                )
+            },
         )
 
         if not response.is_success:
@@ -7727,21 +9695,23 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[OrgSkillResponse]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[OrgSkillResponse]", lambda: List[OrgSkillResponse]
+            ).validate_json(content, extra="ignore"),
         )
 
     def get_billing_contract_for_any_org(
         self,
-        id: Uuid,
-    ) -> BillingContractView:
+        id: "models.Uuid",
+    ) -> "models.BillingContractView":
         """This endpoint requires Zoo admin authentication. It returns the active contract for the organization, or the latest draft when no active contract exists."""
 
+        from kittycad.models.billing_contract_view import BillingContractView
+
         url = "{}/orgs/{id}/billing/contract".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -7749,6 +9719,14 @@ class OrgsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_billing_contract_for_any_org",
+                    "orgs",
+                    "/orgs/{id}/billing/contract",
+                )
+            },
         )
 
         if not response.is_success:
@@ -7759,18 +9737,23 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return BillingContractView.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: BillingContractView.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def upsert_billing_contract_for_any_org(
         self,
-        id: Uuid,
-        body: BillingContractUpsert,
-    ) -> BillingContractView:
+        id: "models.Uuid",
+        body: "models.BillingContractUpsert",
+    ) -> "models.BillingContractView":
         """This endpoint requires Zoo admin authentication. It upserts the contract definition used for admin-managed enterprise billing."""
 
+        from kittycad.models.billing_contract_view import BillingContractView
+
         url = "{}/orgs/{id}/billing/contract".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -7778,7 +9761,15 @@ class OrgsAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "upsert_billing_contract_for_any_org",
+                    "orgs",
+                    "/orgs/{id}/billing/contract",
+                )
+            },
         )
 
         if not response.is_success:
@@ -7789,18 +9780,23 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return BillingContractView.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: BillingContractView.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_user_org(
         self,
-    ) -> UserOrgInfo:
+    ) -> "models.UserOrgInfo":
         """This endpoint requires authentication by any Zoo user. It gets the authenticated user's org.
 
         If the user is not a member of an org, this endpoint will return a 404."""
 
+        from kittycad.models.user_org_info import UserOrgInfo
+
         url = "{}/user/org".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -7808,6 +9804,10 @@ class OrgsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo("get_user_org", "orgs", "/user/org")
+            },
         )
 
         if not response.is_success:
@@ -7818,10 +9818,11 @@ class OrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UserOrgInfo.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UserOrgInfo.model_validate_json(content, extra="ignore"),
+        )
 
 
 class AsyncOrgsAPI:
@@ -7832,9 +9833,11 @@ class AsyncOrgsAPI:
 
     async def get_org(
         self,
-    ) -> Org:
+    ) -> "models.Org":
         """This endpoint requires authentication by an org admin. It gets the authenticated user's org."""
 
+        from kittycad.models.org import Org
+
         url = "{}/org".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -7842,6 +9845,8 @@ class AsyncOrgsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={"kittycad_operation": OperationInfo("get_org", "orgs", "/org")},
         )
 
         if not response.is_success:
@@ -7852,17 +9857,19 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Org.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response, lambda content: Org.model_validate_json(content, extra="ignore")
+        )
 
     async def update_org(
         self,
-        body: OrgDetails,
-    ) -> Org:
+        body: "models.OrgDetails",
+    ) -> "models.Org":
         """This endpoint requires authentication by an org admin. It updates the authenticated user's org."""
 
+        from kittycad.models.org import Org
+
         url = "{}/org".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -7870,7 +9877,11 @@ class AsyncOrgsAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo("update_org", "orgs", "/org")
+            },
         )
 
         if not response.is_success:
@@ -7881,17 +9892,19 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Org.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response, lambda content: Org.model_validate_json(content, extra="ignore")
+        )
 
     async def create_org(
         self,
-        body: OrgDetails,
-    ) -> Org:
+        body: "models.OrgDetails",
+    ) -> "models.Org":
         """This endpoint requires authentication by a Zoo user that is not already in an org. It creates a new org for the authenticated user and makes them an admin."""
 
+        from kittycad.models.org import Org
+
         url = "{}/org".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -7899,7 +9912,11 @@ class AsyncOrgsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo("create_org", "orgs", "/org")
+            },
         )
 
         if not response.is_success:
@@ -7910,10 +9927,10 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Org.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response, lambda content: Org.model_validate_json(content, extra="ignore")
+        )
 
     async def delete_org(
         self,
@@ -7931,6 +9948,10 @@ class AsyncOrgsAPI:
         response = await _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo("delete_org", "orgs", "/org")
+            },
         )
 
         if not response.is_success:
@@ -7938,15 +9959,19 @@ class AsyncOrgsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def org_dataset_s3_policies(
         self,
         uri: str,
         role_arn: str,
-    ) -> DatasetS3Policies:
+    ) -> "models.DatasetS3Policies":
         """Return the IAM policies customers should apply when onboarding an S3 dataset."""
 
+        from kittycad.models.dataset_s3_policies import DatasetS3Policies
+
         url = "{}/org/dataset/s3/policies".format(self.client.base_url)
 
         if uri is not None:
@@ -7966,6 +9991,12 @@ class AsyncOrgsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "org_dataset_s3_policies", "orgs", "/org/dataset/s3/policies"
+                )
+            },
         )
 
         if not response.is_success:
@@ -7976,10 +10007,13 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return DatasetS3Policies.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: DatasetS3Policies.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def list_org_datasets(
         self,
@@ -7987,7 +10021,7 @@ class AsyncOrgsAPI:
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
         lookup_enabled: Optional[bool] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "AsyncPageIterator":
         """List every dataset that belongs to the caller's organization.
 
@@ -8026,10 +10060,17 @@ class AsyncOrgsAPI:
         return AsyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo("list_org_datasets", "orgs", "/org/datasets"),
         )
 
-    async def _fetch_page_list_org_datasets(self, **kwargs) -> OrgDatasetResultsPage:
+    async def _fetch_page_list_org_datasets(
+        self, **kwargs
+    ) -> "models.OrgDatasetResultsPage":
         """Internal async method to fetch a single page."""
+
+        from kittycad.models.org_dataset_results_page import OrgDatasetResultsPage
+
         # Build URL with path parameters
         url = "{}/org/datasets".format(self.client.base_url)
 
@@ -8065,6 +10106,12 @@ class AsyncOrgsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_org_datasets", "orgs", "/org/datasets"
+                )
+            },
         )
 
         if not response.is_success:
@@ -8075,16 +10122,24 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return OrgDatasetResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: OrgDatasetResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def create_org_dataset(
         self,
-        body: CreateOrgDataset,
-    ) -> OrgDataset:
+        body: "models.CreateOrgDataset",
+    ) -> "models.OrgDataset":
         """If the dataset lives in S3, call `/org/dataset/s3/policies` first so you can generate the trust, permission, and bucket policies scoped to your dataset before invoking this endpoint."""
 
+        from kittycad.models.org_dataset import OrgDataset
+
         url = "{}/org/datasets".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -8092,7 +10147,13 @@ class AsyncOrgsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_org_dataset", "orgs", "/org/datasets"
+                )
+            },
         )
 
         if not response.is_success:
@@ -8103,17 +10164,20 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OrgDataset.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OrgDataset.model_validate_json(content, extra="ignore"),
+        )
 
     async def get_org_dataset(
         self,
-        id: Uuid,
-    ) -> OrgDataset:
+        id: "models.Uuid",
+    ) -> "models.OrgDataset":
         """Fetch a single dataset by id so long as it belongs to the authenticated org."""
 
+        from kittycad.models.org_dataset import OrgDataset
+
         url = "{}/org/datasets/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -8121,6 +10185,12 @@ class AsyncOrgsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_org_dataset", "orgs", "/org/datasets/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -8131,18 +10201,21 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OrgDataset.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OrgDataset.model_validate_json(content, extra="ignore"),
+        )
 
     async def update_org_dataset(
         self,
-        id: Uuid,
-        body: UpdateOrgDataset,
-    ) -> OrgDataset:
+        id: "models.Uuid",
+        body: "models.UpdateOrgDataset",
+    ) -> "models.OrgDataset":
         """IMPORTANT: Use this endpoint to fix connectivity to the same underlying storage location (e.g. rotating credentials or correcting a typo). Do not repoint an existing dataset at a completely different bucket or provider—create a new dataset instead so conversions in flight keep their original source. This warning applies to every storage backend, not just S3."""
 
+        from kittycad.models.org_dataset import OrgDataset
+
         url = "{}/org/datasets/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -8150,7 +10223,13 @@ class AsyncOrgsAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_org_dataset", "orgs", "/org/datasets/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -8161,14 +10240,15 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OrgDataset.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OrgDataset.model_validate_json(content, extra="ignore"),
+        )
 
     async def delete_org_dataset(
         self,
-        id: Uuid,
+        id: "models.Uuid",
     ):
         """This is a destructive operation that: - requires org admin authentication and the dataset must belong to the caller's org. - fails with a 409 Conflict if the dataset is still attached to any custom model. - deletes Zoo-managed artifacts for this dataset (converted outputs and embeddings). - does **not** delete or modify the customer's source bucket/prefix.
 
@@ -8181,6 +10261,12 @@ class AsyncOrgsAPI:
         response = await _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_org_dataset", "orgs", "/org/datasets/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -8188,11 +10274,13 @@ class AsyncOrgsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def download_org_dataset_successful_kcl_bulk(
         self,
-        id: Uuid,
+        id: "models.Uuid",
     ):
         """Bulk-download KCL outputs for successful dataset conversions."""
 
@@ -8205,6 +10293,14 @@ class AsyncOrgsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "download_org_dataset_successful_kcl_bulk",
+                    "orgs",
+                    "/org/datasets/{id}/bulk-download/kcl",
+                )
+            },
         )
 
         if not response.is_success:
@@ -8212,15 +10308,17 @@ class AsyncOrgsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def list_org_dataset_conversions(
         self,
-        id: Uuid,
+        id: "models.Uuid",
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[ConversionSortMode] = None,
+        sort_by: "Optional[models.ConversionSortMode]" = None,
         filter: Optional[str] = None,
         q: Optional[str] = None,
         phase: Optional[str] = None,
@@ -8270,12 +10368,21 @@ class AsyncOrgsAPI:
         return AsyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_org_dataset_conversions", "orgs", "/org/datasets/{id}/conversions"
+            ),
         )
 
     async def _fetch_page_list_org_dataset_conversions(
-        self, id: Uuid, **kwargs
-    ) -> OrgDatasetFileConversionSummaryResultsPage:
+        self, id: "models.Uuid", **kwargs
+    ) -> "models.OrgDatasetFileConversionSummaryResultsPage":
         """Internal async method to fetch a single page."""
+
+        from kittycad.models.org_dataset_file_conversion_summary_results_page import (
+            OrgDatasetFileConversionSummaryResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/org/datasets/{id}/conversions".format(self.client.base_url, id=id)
 
@@ -8323,6 +10430,14 @@ class AsyncOrgsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_org_dataset_conversions",
+                    "orgs",
+                    "/org/datasets/{id}/conversions",
+                )
+            },
         )
 
         if not response.is_success:
@@ -8333,19 +10448,29 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return OrgDatasetFileConversionSummaryResultsPage.model_validate(
-            json_data, extra="ignore"
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: (
+                OrgDatasetFileConversionSummaryResultsPage.model_validate_json(
+                    content, extra="ignore"
+                )
+            ),
         )
 
     async def get_org_dataset_conversion(
         self,
-        id: Uuid,
-        conversion_id: Uuid,
-    ) -> OrgDatasetFileConversionDetails:
+        id: "models.Uuid",
+        conversion_id: "models.Uuid",
+    ) -> "models.OrgDatasetFileConversionDetails":
         """Unlike list/search endpoints, this returns the full conversion payload: latest output text plus decoded snapshot image payloads for original, raw-KCL, and salon-KCL stages."""
 
+        from kittycad.models.org_dataset_file_conversion_details import (
+            OrgDatasetFileConversionDetails,
+        )
+
         url = "{}/org/datasets/{id}/conversions/{conversion_id}".format(
             self.client.base_url, id=id, conversion_id=conversion_id
         )
@@ -8355,6 +10480,14 @@ class AsyncOrgsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_org_dataset_conversion",
+                    "orgs",
+                    "/org/datasets/{id}/conversions/{conversion_id}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -8365,15 +10498,18 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OrgDatasetFileConversionDetails.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OrgDatasetFileConversionDetails.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def download_org_dataset_conversion_original(
         self,
-        id: Uuid,
-        conversion_id: Uuid,
+        id: "models.Uuid",
+        conversion_id: "models.Uuid",
     ):
         """Download the original source file for a specific dataset conversion."""
 
@@ -8386,6 +10522,14 @@ class AsyncOrgsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "download_org_dataset_conversion_original",
+                    "orgs",
+                    "/org/datasets/{id}/conversions/{conversion_id}/original",
+                )
+            },
         )
 
         if not response.is_success:
@@ -8393,12 +10537,14 @@ class AsyncOrgsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def retrigger_org_dataset_conversion(
         self,
-        id: Uuid,
-        conversion_id: Uuid,
+        id: "models.Uuid",
+        conversion_id: "models.Uuid",
     ):
         """Retrigger a specific dataset conversion for the caller's org."""
 
@@ -8411,6 +10557,14 @@ class AsyncOrgsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "retrigger_org_dataset_conversion",
+                    "orgs",
+                    "/org/datasets/{id}/conversions/{conversion_id}/retrigger",
+                )
+            },
         )
 
         if not response.is_success:
@@ -8418,11 +10572,13 @@ class AsyncOrgsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def retrigger_org_dataset(
         self,
-        id: Uuid,
+        id: "models.Uuid",
         *,
         statuses: Optional[str] = None,
     ):
@@ -8441,6 +10597,12 @@ class AsyncOrgsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "retrigger_org_dataset", "orgs", "/org/datasets/{id}/retrigger"
+                )
+            },
         )
 
         if not response.is_success:
@@ -8448,16 +10610,18 @@ class AsyncOrgsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def search_org_dataset_conversions(
         self,
-        id: Uuid,
+        id: "models.Uuid",
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
         q: Optional[str] = None,
-        sort_by: Optional[ConversionSortMode] = None,
+        sort_by: "Optional[models.ConversionSortMode]" = None,
         filter: Optional[str] = None,
         phase: Optional[str] = None,
     ) -> "AsyncPageIterator":
@@ -8506,12 +10670,23 @@ class AsyncOrgsAPI:
         return AsyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "search_org_dataset_conversions",
+                "orgs",
+                "/org/datasets/{id}/search/conversions",
+            ),
         )
 
     async def _fetch_page_search_org_dataset_conversions(
-        self, id: Uuid, **kwargs
-    ) -> OrgDatasetFileConversionSummaryResultsPage:
+        self, id: "models.Uuid", **kwargs
+    ) -> "models.OrgDatasetFileConversionSummaryResultsPage":
         """Internal async method to fetch a single page."""
+
+        from kittycad.models.org_dataset_file_conversion_summary_results_page import (
+            OrgDatasetFileConversionSummaryResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/org/datasets/{id}/search/conversions".format(
             self.client.base_url, id=id
@@ -8561,6 +10736,14 @@ class AsyncOrgsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "search_org_dataset_conversions",
+                    "orgs",
+                    "/org/datasets/{id}/search/conversions",
+                )
+            },
         )
 
         if not response.is_success:
@@ -8571,21 +10754,31 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return OrgDatasetFileConversionSummaryResultsPage.model_validate(
-            json_data, extra="ignore"
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: (
+                OrgDatasetFileConversionSummaryResultsPage.model_validate_json(
+                    content, extra="ignore"
+                )
+            ),
         )
 
     async def search_org_dataset_semantic(
         self,
-        id: Uuid,
+        id: "models.Uuid",
         q: str,
         *,
         limit: Optional[int] = None,
-    ) -> List[OrgDatasetSemanticSearchMatch]:
+    ) -> "List[models.OrgDatasetSemanticSearchMatch]":
         """This embeds the query text with the org-dataset embedding model and returns top chunk matches ranked by cosine similarity."""
 
+        from kittycad.models.org_dataset_semantic_search_match import (
+            OrgDatasetSemanticSearchMatch,
+        )
+
         url = "{}/org/datasets/{id}/search/semantic".format(self.client.base_url, id=id)
 
         if q is not None:
@@ -8605,6 +10798,14 @@ class AsyncOrgsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "search_org_dataset_semantic",
+                    "orgs",
+                    "/org/datasets/{id}/search/semantic",
+                )
+            },
         )
 
         if not response.is_success:
@@ -8615,21 +10816,26 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[OrgDatasetSemanticSearchMatch]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[OrgDatasetSemanticSearchMatch]",
+                lambda: List[OrgDatasetSemanticSearchMatch],
+            ).validate_json(content, extra="ignore"),
         )
 
     async def get_org_dataset_conversion_stats(
         self,
-        id: Uuid,
-    ) -> OrgDatasetConversionStatsResponse:
+        id: "models.Uuid",
+    ) -> "models.OrgDatasetConversionStatsResponse":
         """Return aggregate conversion stats for a dataset owned by the caller's org."""
 
+        from kittycad.models.org_dataset_conversion_stats_response import (
+            OrgDatasetConversionStatsResponse,
+        )
+
         url = "{}/org/datasets/{id}/stats".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -8637,6 +10843,14 @@ class AsyncOrgsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_org_dataset_conversion_stats",
+                    "orgs",
+                    "/org/datasets/{id}/stats",
+                )
+            },
         )
 
         if not response.is_success:
@@ -8647,19 +10861,24 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OrgDatasetConversionStatsResponse.model_validate(
-            json_data, extra="ignore"
+        return parse_json_response(
+            response,
+            lambda content: OrgDatasetConversionStatsResponse.model_validate_json(
+                content, extra="ignore"
+            ),
         )
 
     async def upload_org_dataset_files(
         self,
-        id: Uuid,
-    ) -> UploadOrgDatasetFilesResponse:
+        id: "models.Uuid",
+    ) -> "models.UploadOrgDatasetFilesResponse":
         """This endpoint accepts `multipart/form-data` where each file part becomes a source object in the dataset. Exact `<proprietary CAD filename>.json` converter dumps are also accepted and associated with their original CAD file. Paths are normalized and must be relative."""
 
+        from kittycad.models.upload_org_dataset_files_response import (
+            UploadOrgDatasetFilesResponse,
+        )
+
         url = "{}/org/datasets/{id}/uploads".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -8667,6 +10886,12 @@ class AsyncOrgsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "upload_org_dataset_files", "orgs", "/org/datasets/{id}/uploads"
+                )
+            },
         )
 
         if not response.is_success:
@@ -8677,18 +10902,21 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UploadOrgDatasetFilesResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UploadOrgDatasetFilesResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def list_org_members(
         self,
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
-        role: Optional[UserOrgRole] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
+        role: "Optional[models.UserOrgRole]" = None,
     ) -> "AsyncPageIterator":
         """This endpoint requires authentication by an org admin. It lists the members of the authenticated user's org.
 
@@ -8727,10 +10955,17 @@ class AsyncOrgsAPI:
         return AsyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo("list_org_members", "orgs", "/org/members"),
         )
 
-    async def _fetch_page_list_org_members(self, **kwargs) -> OrgMemberResultsPage:
+    async def _fetch_page_list_org_members(
+        self, **kwargs
+    ) -> "models.OrgMemberResultsPage":
         """Internal async method to fetch a single page."""
+
+        from kittycad.models.org_member_results_page import OrgMemberResultsPage
+
         # Build URL with path parameters
         url = "{}/org/members".format(self.client.base_url)
 
@@ -8766,6 +11001,12 @@ class AsyncOrgsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_org_members", "orgs", "/org/members"
+                )
+            },
         )
 
         if not response.is_success:
@@ -8776,14 +11017,20 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return OrgMemberResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: OrgMemberResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def create_org_member(
         self,
-        body: AddOrgMember,
-    ) -> OrgMember:
+        body: "models.AddOrgMember",
+    ) -> "models.OrgMember":
         """If the user exists, this will add them to your org. If they do not exist, this will create a new user and add them to your org.
 
         In both cases the user gets an email that they have been added to the org.
@@ -8794,6 +11041,8 @@ class AsyncOrgsAPI:
 
         This endpoint requires authentication by an org admin. It adds the specified member to the authenticated user's org."""
 
+        from kittycad.models.org_member import OrgMember
+
         url = "{}/org/members".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -8801,7 +11050,13 @@ class AsyncOrgsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_org_member", "orgs", "/org/members"
+                )
+            },
         )
 
         if not response.is_success:
@@ -8812,17 +11067,20 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OrgMember.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OrgMember.model_validate_json(content, extra="ignore"),
+        )
 
     async def get_org_member(
         self,
-        user_id: Uuid,
-    ) -> OrgMember:
+        user_id: "models.Uuid",
+    ) -> "models.OrgMember":
         """This endpoint requires authentication by an org admin. It gets the specified member of the authenticated user's org."""
 
+        from kittycad.models.org_member import OrgMember
+
         url = "{}/org/members/{user_id}".format(self.client.base_url, user_id=user_id)
 
         _client = self.client.get_http_client()
@@ -8830,6 +11088,12 @@ class AsyncOrgsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_org_member", "orgs", "/org/members/{user_id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -8840,18 +11104,21 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OrgMember.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OrgMember.model_validate_json(content, extra="ignore"),
+        )
 
     async def update_org_member(
         self,
-        user_id: Uuid,
-        body: UpdateMemberToOrgBody,
-    ) -> OrgMember:
+        user_id: "models.Uuid",
+        body: "models.UpdateMemberToOrgBody",
+    ) -> "models.OrgMember":
         """This endpoint requires authentication by an org admin. It updates the specified member of the authenticated user's org."""
 
+        from kittycad.models.org_member import OrgMember
+
         url = "{}/org/members/{user_id}".format(self.client.base_url, user_id=user_id)
 
         _client = self.client.get_http_client()
@@ -8859,7 +11126,13 @@ class AsyncOrgsAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_org_member", "orgs", "/org/members/{user_id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -8870,14 +11143,15 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return OrgMember.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: OrgMember.model_validate_json(content, extra="ignore"),
+        )
 
     async def delete_org_member(
         self,
-        user_id: Uuid,
+        user_id: "models.Uuid",
     ):
         """This endpoint requires authentication by an org admin. It removes the specified member from the authenticated user's org."""
 
@@ -8888,6 +11162,12 @@ class AsyncOrgsAPI:
         response = await _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_org_member", "orgs", "/org/members/{user_id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -8895,13 +11175,17 @@ class AsyncOrgsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def get_org_privacy_settings(
         self,
-    ) -> PrivacySettings:
+    ) -> "models.PrivacySettings":
         """This endpoint requires authentication by an org admin. It gets the privacy settings for the authenticated user's org."""
 
+        from kittycad.models.privacy_settings import PrivacySettings
+
         url = "{}/org/privacy".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -8909,6 +11193,12 @@ class AsyncOrgsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_org_privacy_settings", "orgs", "/org/privacy"
+                )
+            },
         )
 
         if not response.is_success:
@@ -8919,17 +11209,22 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return PrivacySettings.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: PrivacySettings.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def update_org_privacy_settings(
         self,
-        body: PrivacySettings,
-    ) -> PrivacySettings:
+        body: "models.PrivacySettings",
+    ) -> "models.PrivacySettings":
         """This endpoint requires authentication by an org admin. It updates the privacy settings for the authenticated user's org."""
 
+        from kittycad.models.privacy_settings import PrivacySettings
+
         url = "{}/org/privacy".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -8937,7 +11232,13 @@ class AsyncOrgsAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_org_privacy_settings", "orgs", "/org/privacy"
+                )
+            },
         )
 
         if not response.is_success:
@@ -8948,16 +11249,21 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return PrivacySettings.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: PrivacySettings.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_org_saml_idp(
         self,
-    ) -> SamlIdentityProvider:
+    ) -> "models.SamlIdentityProvider":
         """This endpoint requires authentication by an org admin."""
 
+        from kittycad.models.saml_identity_provider import SamlIdentityProvider
+
         url = "{}/org/saml/idp".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -8965,6 +11271,12 @@ class AsyncOrgsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_org_saml_idp", "orgs", "/org/saml/idp"
+                )
+            },
         )
 
         if not response.is_success:
@@ -8975,17 +11287,22 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return SamlIdentityProvider.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: SamlIdentityProvider.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def update_org_saml_idp(
         self,
-        body: SamlIdentityProviderCreate,
-    ) -> SamlIdentityProvider:
+        body: "models.SamlIdentityProviderCreate",
+    ) -> "models.SamlIdentityProvider":
         """This endpoint requires authentication by an org admin."""
 
+        from kittycad.models.saml_identity_provider import SamlIdentityProvider
+
         url = "{}/org/saml/idp".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -8993,7 +11310,13 @@ class AsyncOrgsAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_org_saml_idp", "orgs", "/org/saml/idp"
+                )
+            },
         )
 
         if not response.is_success:
@@ -9004,17 +11327,22 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return SamlIdentityProvider.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: SamlIdentityProvider.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def create_org_saml_idp(
         self,
-        body: SamlIdentityProviderCreate,
-    ) -> SamlIdentityProvider:
+        body: "models.SamlIdentityProviderCreate",
+    ) -> "models.SamlIdentityProvider":
         """This endpoint requires authentication by an org admin."""
 
+        from kittycad.models.saml_identity_provider import SamlIdentityProvider
+
         url = "{}/org/saml/idp".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -9022,7 +11350,13 @@ class AsyncOrgsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_org_saml_idp", "orgs", "/org/saml/idp"
+                )
+            },
         )
 
         if not response.is_success:
@@ -9033,10 +11367,13 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return SamlIdentityProvider.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: SamlIdentityProvider.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def delete_org_saml_idp(
         self,
@@ -9050,6 +11387,12 @@ class AsyncOrgsAPI:
         response = await _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_org_saml_idp", "orgs", "/org/saml/idp"
+                )
+            },
         )
 
         if not response.is_success:
@@ -9057,14 +11400,16 @@ class AsyncOrgsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def get_org_shortlinks(
         self,
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "AsyncPageIterator":
         """This endpoint requires authentication by an org admin. It gets the shortlinks for the authenticated user's org.
 
@@ -9100,10 +11445,17 @@ class AsyncOrgsAPI:
         return AsyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo("get_org_shortlinks", "orgs", "/org/shortlinks"),
         )
 
-    async def _fetch_page_get_org_shortlinks(self, **kwargs) -> ShortlinkResultsPage:
+    async def _fetch_page_get_org_shortlinks(
+        self, **kwargs
+    ) -> "models.ShortlinkResultsPage":
         """Internal async method to fetch a single page."""
+
+        from kittycad.models.shortlink_results_page import ShortlinkResultsPage
+
         # Build URL with path parameters
         url = "{}/org/shortlinks".format(self.client.base_url)
 
@@ -9133,6 +11485,12 @@ class AsyncOrgsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_org_shortlinks", "orgs", "/org/shortlinks"
+                )
+            },
         )
 
         if not response.is_success:
@@ -9143,15 +11501,23 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return ShortlinkResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: ShortlinkResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def list_org_skills(
         self,
-    ) -> List[OrgSkillResponse]:
+    ) -> "List[models.OrgSkillResponse]":
         """List every skill that belongs to the caller's organization."""
 
+        from kittycad.models.org_skill_response import OrgSkillResponse
+
         url = "{}/org/skills".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -9159,6 +11525,12 @@ class AsyncOrgsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_org_skills", "orgs", "/org/skills"
+                )
+            },
         )
 
         if not response.is_success:
@@ -9169,21 +11541,23 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[OrgSkillResponse]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[OrgSkillResponse]", lambda: List[OrgSkillResponse]
+            ).validate_json(content, extra="ignore"),
         )
 
     async def get_billing_contract_for_any_org(
         self,
-        id: Uuid,
-    ) -> BillingContractView:
+        id: "models.Uuid",
+    ) -> "models.BillingContractView":
         """This endpoint requires Zoo admin authentication. It returns the active contract for the organization, or the latest draft when no active contract exists."""
 
+        from kittycad.models.billing_contract_view import BillingContractView
+
         url = "{}/orgs/{id}/billing/contract".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -9191,6 +11565,14 @@ class AsyncOrgsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_billing_contract_for_any_org",
+                    "orgs",
+                    "/orgs/{id}/billing/contract",
+                )
+            },
         )
 
         if not response.is_success:
@@ -9201,18 +11583,23 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return BillingContractView.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: BillingContractView.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def upsert_billing_contract_for_any_org(
         self,
-        id: Uuid,
-        body: BillingContractUpsert,
-    ) -> BillingContractView:
+        id: "models.Uuid",
+        body: "models.BillingContractUpsert",
+    ) -> "models.BillingContractView":
         """This endpoint requires Zoo admin authentication. It upserts the contract definition used for admin-managed enterprise billing."""
 
+        from kittycad.models.billing_contract_view import BillingContractView
+
         url = "{}/orgs/{id}/billing/contract".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -9220,7 +11607,15 @@ class AsyncOrgsAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "upsert_billing_contract_for_any_org",
+                    "orgs",
+                    "/orgs/{id}/billing/contract",
+                )
+            },
         )
 
         if not response.is_success:
@@ -9231,18 +11626,23 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return BillingContractView.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: BillingContractView.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_user_org(
         self,
-    ) -> UserOrgInfo:
+    ) -> "models.UserOrgInfo":
         """This endpoint requires authentication by any Zoo user. It gets the authenticated user's org.
 
         If the user is not a member of an org, this endpoint will return a 404."""
 
+        from kittycad.models.user_org_info import UserOrgInfo
+
         url = "{}/user/org".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -9250,6 +11650,10 @@ class AsyncOrgsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo("get_user_org", "orgs", "/user/org")
+            },
         )
 
         if not response.is_success:
@@ -9260,10 +11664,11 @@ class AsyncOrgsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UserOrgInfo.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UserOrgInfo.model_validate_json(content, extra="ignore"),
+        )
 
 
 class PaymentsAPI:
@@ -9274,9 +11679,13 @@ class PaymentsAPI:
 
     def get_org_usage_collection_threshold(
         self,
-    ) -> AggregateUsageCollectionThresholdView:
+    ) -> "models.AggregateUsageCollectionThresholdView":
         """Get the authenticated organization's aggregate-usage collection threshold."""
 
+        from kittycad.models.aggregate_usage_collection_threshold_view import (
+            AggregateUsageCollectionThresholdView,
+        )
+
         url = "{}/org/billing/usage-collection-threshold".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -9284,6 +11693,14 @@ class PaymentsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_org_usage_collection_threshold",
+                    "payments",
+                    "/org/billing/usage-collection-threshold",
+                )
+            },
         )
 
         if not response.is_success:
@@ -9294,19 +11711,24 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return AggregateUsageCollectionThresholdView.model_validate(
-            json_data, extra="ignore"
+        return parse_json_response(
+            response,
+            lambda content: AggregateUsageCollectionThresholdView.model_validate_json(
+                content, extra="ignore"
+            ),
         )
 
     def set_org_usage_collection_threshold(
         self,
-        body: AggregateUsageCollectionThresholdSet,
-    ) -> AggregateUsageCollectionThresholdView:
+        body: "models.AggregateUsageCollectionThresholdSet",
+    ) -> "models.AggregateUsageCollectionThresholdView":
         """Set the authenticated organization's aggregate-usage collection threshold."""
 
+        from kittycad.models.aggregate_usage_collection_threshold_view import (
+            AggregateUsageCollectionThresholdView,
+        )
+
         url = "{}/org/billing/usage-collection-threshold".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -9314,7 +11736,15 @@ class PaymentsAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "set_org_usage_collection_threshold",
+                    "payments",
+                    "/org/billing/usage-collection-threshold",
+                )
+            },
         )
 
         if not response.is_success:
@@ -9325,19 +11755,24 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return AggregateUsageCollectionThresholdView.model_validate(
-            json_data, extra="ignore"
+        return parse_json_response(
+            response,
+            lambda content: AggregateUsageCollectionThresholdView.model_validate_json(
+                content, extra="ignore"
+            ),
         )
 
     def reset_org_usage_collection_threshold(
         self,
         expected_version: int,
-    ) -> AggregateUsageCollectionThresholdView:
+    ) -> "models.AggregateUsageCollectionThresholdView":
         """Restore the default for the authenticated organization's aggregate-usage collection threshold."""
 
+        from kittycad.models.aggregate_usage_collection_threshold_view import (
+            AggregateUsageCollectionThresholdView,
+        )
+
         url = "{}/org/billing/usage-collection-threshold".format(self.client.base_url)
 
         if expected_version is not None:
@@ -9351,6 +11786,14 @@ class PaymentsAPI:
         response = _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "reset_org_usage_collection_threshold",
+                    "payments",
+                    "/org/billing/usage-collection-threshold",
+                )
+            },
         )
 
         if not response.is_success:
@@ -9361,20 +11804,23 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return AggregateUsageCollectionThresholdView.model_validate(
-            json_data, extra="ignore"
+        return parse_json_response(
+            response,
+            lambda content: AggregateUsageCollectionThresholdView.model_validate_json(
+                content, extra="ignore"
+            ),
         )
 
     def get_payment_information_for_org(
         self,
-    ) -> Customer:
+    ) -> "models.Customer":
         """This includes billing address, phone, and name.
 
         This endpoint requires authentication by an org admin. It gets the payment information for the authenticated user's org."""
 
+        from kittycad.models.customer import Customer
+
         url = "{}/org/payment".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -9382,6 +11828,12 @@ class PaymentsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_payment_information_for_org", "payments", "/org/payment"
+                )
+            },
         )
 
         if not response.is_success:
@@ -9392,19 +11844,22 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Customer.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: Customer.model_validate_json(content, extra="ignore"),
+        )
 
     def update_payment_information_for_org(
         self,
-        body: BillingInfo,
-    ) -> Customer:
+        body: "models.BillingInfo",
+    ) -> "models.Customer":
         """This includes billing address, phone, and name.
 
         This endpoint requires authentication by an org admin. It updates the payment information for the authenticated user's org."""
 
+        from kittycad.models.customer import Customer
+
         url = "{}/org/payment".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -9412,7 +11867,13 @@ class PaymentsAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_payment_information_for_org", "payments", "/org/payment"
+                )
+            },
         )
 
         if not response.is_success:
@@ -9423,19 +11884,22 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Customer.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: Customer.model_validate_json(content, extra="ignore"),
+        )
 
     def create_payment_information_for_org(
         self,
-        body: BillingInfo,
-    ) -> Customer:
+        body: "models.BillingInfo",
+    ) -> "models.Customer":
         """This includes billing address, phone, and name.
 
         This endpoint requires authentication by the org admin. It creates the payment information for the authenticated user's org."""
 
+        from kittycad.models.customer import Customer
+
         url = "{}/org/payment".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -9443,7 +11907,13 @@ class PaymentsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_payment_information_for_org", "payments", "/org/payment"
+                )
+            },
         )
 
         if not response.is_success:
@@ -9454,10 +11924,11 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Customer.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: Customer.model_validate_json(content, extra="ignore"),
+        )
 
     def delete_payment_information_for_org(
         self,
@@ -9473,6 +11944,12 @@ class PaymentsAPI:
         response = _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_payment_information_for_org", "payments", "/org/payment"
+                )
+            },
         )
 
         if not response.is_success:
@@ -9480,15 +11957,19 @@ class PaymentsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def get_payment_balance_for_org(
         self,
         *,
         include_total_due: Optional[bool] = None,
-    ) -> CustomerBalance:
+    ) -> "models.CustomerBalance":
         """This endpoint requires authentication by any member of an org. It gets the balance information for the authenticated user's org."""
 
+        from kittycad.models.customer_balance import CustomerBalance
+
         url = "{}/org/payment/balance".format(self.client.base_url)
 
         if include_total_due is not None:
@@ -9502,6 +11983,12 @@ class PaymentsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_payment_balance_for_org", "payments", "/org/payment/balance"
+                )
+            },
         )
 
         if not response.is_success:
@@ -9512,16 +11999,21 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CustomerBalance.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CustomerBalance.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def create_payment_intent_for_org(
         self,
-    ) -> PaymentIntent:
+    ) -> "models.PaymentIntent":
         """This endpoint requires authentication by the org admin. It creates a new payment intent for the authenticated user's org's org."""
 
+        from kittycad.models.payment_intent import PaymentIntent
+
         url = "{}/org/payment/intent".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -9529,6 +12021,12 @@ class PaymentsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_payment_intent_for_org", "payments", "/org/payment/intent"
+                )
+            },
         )
 
         if not response.is_success:
@@ -9539,10 +12037,11 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return PaymentIntent.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: PaymentIntent.model_validate_json(content, extra="ignore"),
+        )
 
     def list_invoices_for_org(
         self,
@@ -9581,10 +12080,19 @@ class PaymentsAPI:
         return SyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_invoices_for_org", "payments", "/org/payment/invoices"
+            ),
         )
 
-    def _fetch_page_list_invoices_for_org(self, **kwargs) -> InvoiceResultsPage:
+    def _fetch_page_list_invoices_for_org(
+        self, **kwargs
+    ) -> "models.InvoiceResultsPage":
         """Internal method to fetch a single page."""
+
+        from kittycad.models.invoice_results_page import InvoiceResultsPage
+
         # Build URL with path parameters
         url = "{}/org/payment/invoices".format(self.client.base_url)
 
@@ -9608,6 +12116,12 @@ class PaymentsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_invoices_for_org", "payments", "/org/payment/invoices"
+                )
+            },
         )
 
         if not response.is_success:
@@ -9618,9 +12132,15 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return InvoiceResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: InvoiceResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def redirect_payment_method_portal_link_for_org(
         self,
@@ -9642,6 +12162,14 @@ class PaymentsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "redirect_payment_method_portal_link_for_org",
+                    "payments",
+                    "/org/payment/method-portal-link",
+                )
+            },
         )
 
         if not response.is_success:
@@ -9649,13 +12177,17 @@ class PaymentsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def list_payment_methods_for_org(
         self,
-    ) -> List[PaymentMethod]:
+    ) -> "List[models.PaymentMethod]":
         """This endpoint requires authentication by an org admin. It lists payment methods for the authenticated user's org."""
 
+        from kittycad.models.payment_method import PaymentMethod
+
         url = "{}/org/payment/methods".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -9663,6 +12195,12 @@ class PaymentsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_payment_methods_for_org", "payments", "/org/payment/methods"
+                )
+            },
         )
 
         if not response.is_success:
@@ -9673,13 +12211,13 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[PaymentMethod]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[PaymentMethod]", lambda: List[PaymentMethod]
+            ).validate_json(content, extra="ignore"),
         )
 
     def delete_payment_method_for_org(
@@ -9695,6 +12233,14 @@ class PaymentsAPI:
         response = _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_payment_method_for_org",
+                    "payments",
+                    "/org/payment/methods/{id}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -9702,13 +12248,17 @@ class PaymentsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def get_org_subscription(
         self,
-    ) -> ZooProductSubscriptions:
+    ) -> "models.ZooProductSubscriptions":
         """This endpoint requires authentication by any member of an org. It gets the subscription for the authenticated user's org."""
 
+        from kittycad.models.zoo_product_subscriptions import ZooProductSubscriptions
+
         url = "{}/org/payment/subscriptions".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -9716,6 +12266,12 @@ class PaymentsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_org_subscription", "payments", "/org/payment/subscriptions"
+                )
+            },
         )
 
         if not response.is_success:
@@ -9726,17 +12282,22 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ZooProductSubscriptions.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ZooProductSubscriptions.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def update_org_subscription(
         self,
-        body: ZooProductSubscriptionsOrgRequest,
-    ) -> ZooProductSubscriptions:
+        body: "models.ZooProductSubscriptionsOrgRequest",
+    ) -> "models.ZooProductSubscriptions":
         """This endpoint requires authentication by an org admin. It updates the subscription for the authenticated user's org."""
 
+        from kittycad.models.zoo_product_subscriptions import ZooProductSubscriptions
+
         url = "{}/org/payment/subscriptions".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -9744,7 +12305,13 @@ class PaymentsAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_org_subscription", "payments", "/org/payment/subscriptions"
+                )
+            },
         )
 
         if not response.is_success:
@@ -9755,17 +12322,22 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ZooProductSubscriptions.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ZooProductSubscriptions.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def create_org_subscription(
         self,
-        body: ZooProductSubscriptionsOrgRequest,
-    ) -> ZooProductSubscriptions:
+        body: "models.ZooProductSubscriptionsOrgRequest",
+    ) -> "models.ZooProductSubscriptions":
         """This endpoint requires authentication by an org admin. It creates the subscription for the authenticated user's org."""
 
+        from kittycad.models.zoo_product_subscriptions import ZooProductSubscriptions
+
         url = "{}/org/payment/subscriptions".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -9773,7 +12345,13 @@ class PaymentsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_org_subscription", "payments", "/org/payment/subscriptions"
+                )
+            },
         )
 
         if not response.is_success:
@@ -9784,10 +12362,13 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ZooProductSubscriptions.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ZooProductSubscriptions.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def validate_customer_tax_information_for_org(
         self,
@@ -9801,6 +12382,14 @@ class PaymentsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "validate_customer_tax_information_for_org",
+                    "payments",
+                    "/org/payment/tax",
+                )
+            },
         )
 
         if not response.is_success:
@@ -9808,16 +12397,20 @@ class PaymentsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def get_payment_balance_for_any_org(
         self,
-        id: Uuid,
+        id: "models.Uuid",
         *,
         include_total_due: Optional[bool] = None,
-    ) -> CustomerBalance:
+    ) -> "models.CustomerBalance":
         """This endpoint requires authentication by a Zoo employee. It gets the balance information for the specified org."""
 
+        from kittycad.models.customer_balance import CustomerBalance
+
         url = "{}/orgs/{id}/payment/balance".format(self.client.base_url, id=id)
 
         if include_total_due is not None:
@@ -9831,6 +12424,14 @@ class PaymentsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_payment_balance_for_any_org",
+                    "payments",
+                    "/orgs/{id}/payment/balance",
+                )
+            },
         )
 
         if not response.is_success:
@@ -9841,20 +12442,25 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CustomerBalance.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CustomerBalance.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def update_payment_balance_for_any_org(
         self,
-        id: Uuid,
-        body: UpdatePaymentBalance,
+        id: "models.Uuid",
+        body: "models.UpdatePaymentBalance",
         *,
         include_total_due: Optional[bool] = None,
-    ) -> CustomerBalance:
+    ) -> "models.CustomerBalance":
         """This endpoint requires authentication by a Zoo employee. It updates the balance information for the specified org."""
 
+        from kittycad.models.customer_balance import CustomerBalance
+
         url = "{}/orgs/{id}/payment/balance".format(self.client.base_url, id=id)
 
         if include_total_due is not None:
@@ -9868,7 +12474,15 @@ class PaymentsAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_payment_balance_for_any_org",
+                    "payments",
+                    "/orgs/{id}/payment/balance",
+                )
+            },
         )
 
         if not response.is_success:
@@ -9879,18 +12493,23 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CustomerBalance.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CustomerBalance.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def update_org_subscription_for_any_org(
         self,
-        id: Uuid,
-        body: ZooProductSubscriptionsOrgRequest,
-    ) -> ZooProductSubscriptions:
+        id: "models.Uuid",
+        body: "models.ZooProductSubscriptionsOrgRequest",
+    ) -> "models.ZooProductSubscriptions":
         """This endpoint requires authentication by a Zoo admin. It updates the subscription for the specified org."""
 
+        from kittycad.models.zoo_product_subscriptions import ZooProductSubscriptions
+
         url = "{}/orgs/{id}/payment/subscriptions".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -9898,7 +12517,15 @@ class PaymentsAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_org_subscription_for_any_org",
+                    "payments",
+                    "/orgs/{id}/payment/subscriptions",
+                )
+            },
         )
 
         if not response.is_success:
@@ -9909,18 +12536,25 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ZooProductSubscriptions.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ZooProductSubscriptions.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def upsert_subscription_plan_price(
         self,
         slug: str,
-        body: PriceUpsertRequest,
-    ) -> SubscriptionPlanPriceRecord:
+        body: "models.PriceUpsertRequest",
+    ) -> "models.SubscriptionPlanPriceRecord":
         """You must be a Zoo admin to perform this request."""
 
+        from kittycad.models.subscription_plan_price_record import (
+            SubscriptionPlanPriceRecord,
+        )
+
         url = "{}/subscription-plans/{slug}/prices".format(
             self.client.base_url, slug=slug
         )
@@ -9930,7 +12564,15 @@ class PaymentsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "upsert_subscription_plan_price",
+                    "payments",
+                    "/subscription-plans/{slug}/prices",
+                )
+            },
         )
 
         if not response.is_success:
@@ -9941,16 +12583,23 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return SubscriptionPlanPriceRecord.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: SubscriptionPlanPriceRecord.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_user_usage_collection_threshold(
         self,
-    ) -> AggregateUsageCollectionThresholdView:
+    ) -> "models.AggregateUsageCollectionThresholdView":
         """The effective threshold is the amount of accrued, unfunded usage that causes an early invoice before the normal billing-period close."""
 
+        from kittycad.models.aggregate_usage_collection_threshold_view import (
+            AggregateUsageCollectionThresholdView,
+        )
+
         url = "{}/user/billing/usage-collection-threshold".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -9958,6 +12607,14 @@ class PaymentsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_user_usage_collection_threshold",
+                    "payments",
+                    "/user/billing/usage-collection-threshold",
+                )
+            },
         )
 
         if not response.is_success:
@@ -9968,19 +12625,24 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return AggregateUsageCollectionThresholdView.model_validate(
-            json_data, extra="ignore"
+        return parse_json_response(
+            response,
+            lambda content: AggregateUsageCollectionThresholdView.model_validate_json(
+                content, extra="ignore"
+            ),
         )
 
     def set_user_usage_collection_threshold(
         self,
-        body: AggregateUsageCollectionThresholdSet,
-    ) -> AggregateUsageCollectionThresholdView:
+        body: "models.AggregateUsageCollectionThresholdSet",
+    ) -> "models.AggregateUsageCollectionThresholdView":
         """Set your personal aggregate-usage collection threshold."""
 
+        from kittycad.models.aggregate_usage_collection_threshold_view import (
+            AggregateUsageCollectionThresholdView,
+        )
+
         url = "{}/user/billing/usage-collection-threshold".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -9988,7 +12650,15 @@ class PaymentsAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "set_user_usage_collection_threshold",
+                    "payments",
+                    "/user/billing/usage-collection-threshold",
+                )
+            },
         )
 
         if not response.is_success:
@@ -9999,19 +12669,24 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return AggregateUsageCollectionThresholdView.model_validate(
-            json_data, extra="ignore"
+        return parse_json_response(
+            response,
+            lambda content: AggregateUsageCollectionThresholdView.model_validate_json(
+                content, extra="ignore"
+            ),
         )
 
     def reset_user_usage_collection_threshold(
         self,
         expected_version: int,
-    ) -> AggregateUsageCollectionThresholdView:
+    ) -> "models.AggregateUsageCollectionThresholdView":
         """Restore the default for your personal aggregate-usage collection threshold."""
 
+        from kittycad.models.aggregate_usage_collection_threshold_view import (
+            AggregateUsageCollectionThresholdView,
+        )
+
         url = "{}/user/billing/usage-collection-threshold".format(self.client.base_url)
 
         if expected_version is not None:
@@ -10025,6 +12700,14 @@ class PaymentsAPI:
         response = _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "reset_user_usage_collection_threshold",
+                    "payments",
+                    "/user/billing/usage-collection-threshold",
+                )
+            },
         )
 
         if not response.is_success:
@@ -10035,20 +12718,23 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return AggregateUsageCollectionThresholdView.model_validate(
-            json_data, extra="ignore"
+        return parse_json_response(
+            response,
+            lambda content: AggregateUsageCollectionThresholdView.model_validate_json(
+                content, extra="ignore"
+            ),
         )
 
     def get_payment_information_for_user(
         self,
-    ) -> Customer:
+    ) -> "models.Customer":
         """This includes billing address, phone, and name.
 
         This endpoint requires authentication by any Zoo user. It gets the payment information for the authenticated user."""
 
+        from kittycad.models.customer import Customer
+
         url = "{}/user/payment".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -10056,6 +12742,12 @@ class PaymentsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_payment_information_for_user", "payments", "/user/payment"
+                )
+            },
         )
 
         if not response.is_success:
@@ -10066,19 +12758,22 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Customer.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: Customer.model_validate_json(content, extra="ignore"),
+        )
 
     def update_payment_information_for_user(
         self,
-        body: BillingInfo,
-    ) -> Customer:
+        body: "models.BillingInfo",
+    ) -> "models.Customer":
         """This includes billing address, phone, and name.
 
         This endpoint requires authentication by any Zoo user. It updates the payment information for the authenticated user."""
 
+        from kittycad.models.customer import Customer
+
         url = "{}/user/payment".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -10086,7 +12781,13 @@ class PaymentsAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_payment_information_for_user", "payments", "/user/payment"
+                )
+            },
         )
 
         if not response.is_success:
@@ -10097,19 +12798,22 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Customer.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: Customer.model_validate_json(content, extra="ignore"),
+        )
 
     def create_payment_information_for_user(
         self,
-        body: BillingInfo,
-    ) -> Customer:
+        body: "models.BillingInfo",
+    ) -> "models.Customer":
         """This includes billing address, phone, and name.
 
         This endpoint requires authentication by any Zoo user. It creates the payment information for the authenticated user."""
 
+        from kittycad.models.customer import Customer
+
         url = "{}/user/payment".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -10117,7 +12821,13 @@ class PaymentsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_payment_information_for_user", "payments", "/user/payment"
+                )
+            },
         )
 
         if not response.is_success:
@@ -10128,10 +12838,11 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Customer.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: Customer.model_validate_json(content, extra="ignore"),
+        )
 
     def delete_payment_information_for_user(
         self,
@@ -10147,6 +12858,12 @@ class PaymentsAPI:
         response = _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_payment_information_for_user", "payments", "/user/payment"
+                )
+            },
         )
 
         if not response.is_success:
@@ -10154,15 +12871,19 @@ class PaymentsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def get_payment_balance_for_user(
         self,
         *,
         include_total_due: Optional[bool] = None,
-    ) -> CustomerBalance:
+    ) -> "models.CustomerBalance":
         """This endpoint requires authentication by any Zoo user. It gets the balance information for the authenticated user."""
 
+        from kittycad.models.customer_balance import CustomerBalance
+
         url = "{}/user/payment/balance".format(self.client.base_url)
 
         if include_total_due is not None:
@@ -10176,6 +12897,12 @@ class PaymentsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_payment_balance_for_user", "payments", "/user/payment/balance"
+                )
+            },
         )
 
         if not response.is_success:
@@ -10186,16 +12913,21 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CustomerBalance.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CustomerBalance.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def create_payment_intent_for_user(
         self,
-    ) -> PaymentIntent:
+    ) -> "models.PaymentIntent":
         """This endpoint requires authentication by any Zoo user. It creates a new payment intent for the authenticated user."""
 
+        from kittycad.models.payment_intent import PaymentIntent
+
         url = "{}/user/payment/intent".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -10203,6 +12935,12 @@ class PaymentsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_payment_intent_for_user", "payments", "/user/payment/intent"
+                )
+            },
         )
 
         if not response.is_success:
@@ -10213,10 +12951,11 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return PaymentIntent.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: PaymentIntent.model_validate_json(content, extra="ignore"),
+        )
 
     def list_invoices_for_user(
         self,
@@ -10255,10 +12994,19 @@ class PaymentsAPI:
         return SyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_invoices_for_user", "payments", "/user/payment/invoices"
+            ),
         )
 
-    def _fetch_page_list_invoices_for_user(self, **kwargs) -> InvoiceResultsPage:
+    def _fetch_page_list_invoices_for_user(
+        self, **kwargs
+    ) -> "models.InvoiceResultsPage":
         """Internal method to fetch a single page."""
+
+        from kittycad.models.invoice_results_page import InvoiceResultsPage
+
         # Build URL with path parameters
         url = "{}/user/payment/invoices".format(self.client.base_url)
 
@@ -10282,6 +13030,12 @@ class PaymentsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_invoices_for_user", "payments", "/user/payment/invoices"
+                )
+            },
         )
 
         if not response.is_success:
@@ -10292,9 +13046,15 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return InvoiceResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: InvoiceResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def redirect_payment_method_portal_link_for_user(
         self,
@@ -10316,6 +13076,14 @@ class PaymentsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "redirect_payment_method_portal_link_for_user",
+                    "payments",
+                    "/user/payment/method-portal-link",
+                )
+            },
         )
 
         if not response.is_success:
@@ -10323,13 +13091,17 @@ class PaymentsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def list_payment_methods_for_user(
         self,
-    ) -> List[PaymentMethod]:
+    ) -> "List[models.PaymentMethod]":
         """This endpoint requires authentication by any Zoo user. It lists payment methods for the authenticated user."""
 
+        from kittycad.models.payment_method import PaymentMethod
+
         url = "{}/user/payment/methods".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -10337,6 +13109,12 @@ class PaymentsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_payment_methods_for_user", "payments", "/user/payment/methods"
+                )
+            },
         )
 
         if not response.is_success:
@@ -10347,13 +13125,13 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[PaymentMethod]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[PaymentMethod]", lambda: List[PaymentMethod]
+            ).validate_json(content, extra="ignore"),
         )
 
     def delete_payment_method_for_user(
@@ -10369,6 +13147,14 @@ class PaymentsAPI:
         response = _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_payment_method_for_user",
+                    "payments",
+                    "/user/payment/methods/{id}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -10376,7 +13162,9 @@ class PaymentsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def set_default_payment_method_for_user(
         self,
@@ -10391,6 +13179,14 @@ class PaymentsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "set_default_payment_method_for_user",
+                    "payments",
+                    "/user/payment/methods/{id}/default",
+                )
+            },
         )
 
         if not response.is_success:
@@ -10398,13 +13194,17 @@ class PaymentsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def get_user_subscription(
         self,
-    ) -> ZooProductSubscriptions:
+    ) -> "models.ZooProductSubscriptions":
         """This endpoint requires authentication by any Zoo user. It gets the subscription for the user."""
 
+        from kittycad.models.zoo_product_subscriptions import ZooProductSubscriptions
+
         url = "{}/user/payment/subscriptions".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -10412,6 +13212,12 @@ class PaymentsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_user_subscription", "payments", "/user/payment/subscriptions"
+                )
+            },
         )
 
         if not response.is_success:
@@ -10422,17 +13228,22 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ZooProductSubscriptions.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ZooProductSubscriptions.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def update_user_subscription(
         self,
-        body: ZooProductSubscriptionsUserRequest,
-    ) -> ZooProductSubscriptions:
+        body: "models.ZooProductSubscriptionsUserRequest",
+    ) -> "models.ZooProductSubscriptions":
         """This endpoint requires authentication by any Zoo user. It updates the subscription for the user."""
 
+        from kittycad.models.zoo_product_subscriptions import ZooProductSubscriptions
+
         url = "{}/user/payment/subscriptions".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -10440,7 +13251,15 @@ class PaymentsAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_user_subscription",
+                    "payments",
+                    "/user/payment/subscriptions",
+                )
+            },
         )
 
         if not response.is_success:
@@ -10451,17 +13270,22 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ZooProductSubscriptions.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ZooProductSubscriptions.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def create_user_subscription(
         self,
-        body: ZooProductSubscriptionsUserRequest,
-    ) -> ZooProductSubscriptions:
+        body: "models.ZooProductSubscriptionsUserRequest",
+    ) -> "models.ZooProductSubscriptions":
         """This endpoint requires authentication by any Zoo user. It creates the subscription for the user."""
 
+        from kittycad.models.zoo_product_subscriptions import ZooProductSubscriptions
+
         url = "{}/user/payment/subscriptions".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -10469,7 +13293,15 @@ class PaymentsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_user_subscription",
+                    "payments",
+                    "/user/payment/subscriptions",
+                )
+            },
         )
 
         if not response.is_success:
@@ -10480,10 +13312,13 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ZooProductSubscriptions.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ZooProductSubscriptions.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def validate_customer_tax_information_for_user(
         self,
@@ -10497,6 +13332,14 @@ class PaymentsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "validate_customer_tax_information_for_user",
+                    "payments",
+                    "/user/payment/tax",
+                )
+            },
         )
 
         if not response.is_success:
@@ -10504,16 +13347,20 @@ class PaymentsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def get_payment_balance_for_any_user(
         self,
-        id: UserIdentifier,
+        id: "models.UserIdentifier",
         *,
         include_total_due: Optional[bool] = None,
-    ) -> CustomerBalance:
+    ) -> "models.CustomerBalance":
         """This endpoint requires authentication by a Zoo employee. It gets the balance information for the specified user."""
 
+        from kittycad.models.customer_balance import CustomerBalance
+
         url = "{}/users/{id}/payment/balance".format(self.client.base_url, id=id)
 
         if include_total_due is not None:
@@ -10527,6 +13374,14 @@ class PaymentsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_payment_balance_for_any_user",
+                    "payments",
+                    "/users/{id}/payment/balance",
+                )
+            },
         )
 
         if not response.is_success:
@@ -10537,20 +13392,25 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CustomerBalance.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CustomerBalance.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def update_payment_balance_for_any_user(
         self,
-        id: UserIdentifier,
-        body: UpdatePaymentBalance,
+        id: "models.UserIdentifier",
+        body: "models.UpdatePaymentBalance",
         *,
         include_total_due: Optional[bool] = None,
-    ) -> CustomerBalance:
+    ) -> "models.CustomerBalance":
         """This endpoint requires authentication by a Zoo employee. It updates the balance information for the specified user."""
 
+        from kittycad.models.customer_balance import CustomerBalance
+
         url = "{}/users/{id}/payment/balance".format(self.client.base_url, id=id)
 
         if include_total_due is not None:
@@ -10564,7 +13424,15 @@ class PaymentsAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_payment_balance_for_any_user",
+                    "payments",
+                    "/users/{id}/payment/balance",
+                )
+            },
         )
 
         if not response.is_success:
@@ -10575,10 +13443,13 @@ class PaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CustomerBalance.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CustomerBalance.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
 
 class AsyncPaymentsAPI:
@@ -10589,9 +13460,13 @@ class AsyncPaymentsAPI:
 
     async def get_org_usage_collection_threshold(
         self,
-    ) -> AggregateUsageCollectionThresholdView:
+    ) -> "models.AggregateUsageCollectionThresholdView":
         """Get the authenticated organization's aggregate-usage collection threshold."""
 
+        from kittycad.models.aggregate_usage_collection_threshold_view import (
+            AggregateUsageCollectionThresholdView,
+        )
+
         url = "{}/org/billing/usage-collection-threshold".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -10599,6 +13474,14 @@ class AsyncPaymentsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_org_usage_collection_threshold",
+                    "payments",
+                    "/org/billing/usage-collection-threshold",
+                )
+            },
         )
 
         if not response.is_success:
@@ -10609,19 +13492,24 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return AggregateUsageCollectionThresholdView.model_validate(
-            json_data, extra="ignore"
+        return parse_json_response(
+            response,
+            lambda content: AggregateUsageCollectionThresholdView.model_validate_json(
+                content, extra="ignore"
+            ),
         )
 
     async def set_org_usage_collection_threshold(
         self,
-        body: AggregateUsageCollectionThresholdSet,
-    ) -> AggregateUsageCollectionThresholdView:
+        body: "models.AggregateUsageCollectionThresholdSet",
+    ) -> "models.AggregateUsageCollectionThresholdView":
         """Set the authenticated organization's aggregate-usage collection threshold."""
 
+        from kittycad.models.aggregate_usage_collection_threshold_view import (
+            AggregateUsageCollectionThresholdView,
+        )
+
         url = "{}/org/billing/usage-collection-threshold".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -10629,7 +13517,15 @@ class AsyncPaymentsAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "set_org_usage_collection_threshold",
+                    "payments",
+                    "/org/billing/usage-collection-threshold",
+                )
+            },
         )
 
         if not response.is_success:
@@ -10640,19 +13536,24 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return AggregateUsageCollectionThresholdView.model_validate(
-            json_data, extra="ignore"
+        return parse_json_response(
+            response,
+            lambda content: AggregateUsageCollectionThresholdView.model_validate_json(
+                content, extra="ignore"
+            ),
         )
 
     async def reset_org_usage_collection_threshold(
         self,
         expected_version: int,
-    ) -> AggregateUsageCollectionThresholdView:
+    ) -> "models.AggregateUsageCollectionThresholdView":
         """Restore the default for the authenticated organization's aggregate-usage collection threshold."""
 
+        from kittycad.models.aggregate_usage_collection_threshold_view import (
+            AggregateUsageCollectionThresholdView,
+        )
+
         url = "{}/org/billing/usage-collection-threshold".format(self.client.base_url)
 
         if expected_version is not None:
@@ -10666,6 +13567,14 @@ class AsyncPaymentsAPI:
         response = await _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "reset_org_usage_collection_threshold",
+                    "payments",
+                    "/org/billing/usage-collection-threshold",
+                )
+            },
         )
 
         if not response.is_success:
@@ -10676,20 +13585,23 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return AggregateUsageCollectionThresholdView.model_validate(
-            json_data, extra="ignore"
+        return parse_json_response(
+            response,
+            lambda content: AggregateUsageCollectionThresholdView.model_validate_json(
+                content, extra="ignore"
+            ),
         )
 
     async def get_payment_information_for_org(
         self,
-    ) -> Customer:
+    ) -> "models.Customer":
         """This includes billing address, phone, and name.
 
         This endpoint requires authentication by an org admin. It gets the payment information for the authenticated user's org."""
 
+        from kittycad.models.customer import Customer
+
         url = "{}/org/payment".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -10697,6 +13609,12 @@ class AsyncPaymentsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_payment_information_for_org", "payments", "/org/payment"
+                )
+            },
         )
 
         if not response.is_success:
@@ -10707,19 +13625,22 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Customer.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: Customer.model_validate_json(content, extra="ignore"),
+        )
 
     async def update_payment_information_for_org(
         self,
-        body: BillingInfo,
-    ) -> Customer:
+        body: "models.BillingInfo",
+    ) -> "models.Customer":
         """This includes billing address, phone, and name.
 
         This endpoint requires authentication by an org admin. It updates the payment information for the authenticated user's org."""
 
+        from kittycad.models.customer import Customer
+
         url = "{}/org/payment".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -10727,7 +13648,13 @@ class AsyncPaymentsAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_payment_information_for_org", "payments", "/org/payment"
+                )
+            },
         )
 
         if not response.is_success:
@@ -10738,19 +13665,22 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Customer.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: Customer.model_validate_json(content, extra="ignore"),
+        )
 
     async def create_payment_information_for_org(
         self,
-        body: BillingInfo,
-    ) -> Customer:
+        body: "models.BillingInfo",
+    ) -> "models.Customer":
         """This includes billing address, phone, and name.
 
         This endpoint requires authentication by the org admin. It creates the payment information for the authenticated user's org."""
 
+        from kittycad.models.customer import Customer
+
         url = "{}/org/payment".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -10758,7 +13688,13 @@ class AsyncPaymentsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_payment_information_for_org", "payments", "/org/payment"
+                )
+            },
         )
 
         if not response.is_success:
@@ -10769,10 +13705,11 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Customer.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: Customer.model_validate_json(content, extra="ignore"),
+        )
 
     async def delete_payment_information_for_org(
         self,
@@ -10788,6 +13725,12 @@ class AsyncPaymentsAPI:
         response = await _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_payment_information_for_org", "payments", "/org/payment"
+                )
+            },
         )
 
         if not response.is_success:
@@ -10795,15 +13738,19 @@ class AsyncPaymentsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def get_payment_balance_for_org(
         self,
         *,
         include_total_due: Optional[bool] = None,
-    ) -> CustomerBalance:
+    ) -> "models.CustomerBalance":
         """This endpoint requires authentication by any member of an org. It gets the balance information for the authenticated user's org."""
 
+        from kittycad.models.customer_balance import CustomerBalance
+
         url = "{}/org/payment/balance".format(self.client.base_url)
 
         if include_total_due is not None:
@@ -10817,6 +13764,12 @@ class AsyncPaymentsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_payment_balance_for_org", "payments", "/org/payment/balance"
+                )
+            },
         )
 
         if not response.is_success:
@@ -10827,16 +13780,21 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CustomerBalance.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CustomerBalance.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def create_payment_intent_for_org(
         self,
-    ) -> PaymentIntent:
+    ) -> "models.PaymentIntent":
         """This endpoint requires authentication by the org admin. It creates a new payment intent for the authenticated user's org's org."""
 
+        from kittycad.models.payment_intent import PaymentIntent
+
         url = "{}/org/payment/intent".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -10844,6 +13802,12 @@ class AsyncPaymentsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_payment_intent_for_org", "payments", "/org/payment/intent"
+                )
+            },
         )
 
         if not response.is_success:
@@ -10854,10 +13818,11 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return PaymentIntent.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: PaymentIntent.model_validate_json(content, extra="ignore"),
+        )
 
     def list_invoices_for_org(
         self,
@@ -10896,10 +13861,19 @@ class AsyncPaymentsAPI:
         return AsyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_invoices_for_org", "payments", "/org/payment/invoices"
+            ),
         )
 
-    async def _fetch_page_list_invoices_for_org(self, **kwargs) -> InvoiceResultsPage:
+    async def _fetch_page_list_invoices_for_org(
+        self, **kwargs
+    ) -> "models.InvoiceResultsPage":
         """Internal async method to fetch a single page."""
+
+        from kittycad.models.invoice_results_page import InvoiceResultsPage
+
         # Build URL with path parameters
         url = "{}/org/payment/invoices".format(self.client.base_url)
 
@@ -10923,6 +13897,12 @@ class AsyncPaymentsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_invoices_for_org", "payments", "/org/payment/invoices"
+                )
+            },
         )
 
         if not response.is_success:
@@ -10933,9 +13913,15 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return InvoiceResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: InvoiceResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def redirect_payment_method_portal_link_for_org(
         self,
@@ -10957,6 +13943,14 @@ class AsyncPaymentsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "redirect_payment_method_portal_link_for_org",
+                    "payments",
+                    "/org/payment/method-portal-link",
+                )
+            },
         )
 
         if not response.is_success:
@@ -10964,13 +13958,17 @@ class AsyncPaymentsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def list_payment_methods_for_org(
         self,
-    ) -> List[PaymentMethod]:
+    ) -> "List[models.PaymentMethod]":
         """This endpoint requires authentication by an org admin. It lists payment methods for the authenticated user's org."""
 
+        from kittycad.models.payment_method import PaymentMethod
+
         url = "{}/org/payment/methods".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -10978,6 +13976,12 @@ class AsyncPaymentsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_payment_methods_for_org", "payments", "/org/payment/methods"
+                )
+            },
         )
 
         if not response.is_success:
@@ -10988,13 +13992,13 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[PaymentMethod]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[PaymentMethod]", lambda: List[PaymentMethod]
+            ).validate_json(content, extra="ignore"),
         )
 
     async def delete_payment_method_for_org(
@@ -11010,6 +14014,14 @@ class AsyncPaymentsAPI:
         response = await _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_payment_method_for_org",
+                    "payments",
+                    "/org/payment/methods/{id}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -11017,13 +14029,17 @@ class AsyncPaymentsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def get_org_subscription(
         self,
-    ) -> ZooProductSubscriptions:
+    ) -> "models.ZooProductSubscriptions":
         """This endpoint requires authentication by any member of an org. It gets the subscription for the authenticated user's org."""
 
+        from kittycad.models.zoo_product_subscriptions import ZooProductSubscriptions
+
         url = "{}/org/payment/subscriptions".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -11031,6 +14047,12 @@ class AsyncPaymentsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_org_subscription", "payments", "/org/payment/subscriptions"
+                )
+            },
         )
 
         if not response.is_success:
@@ -11041,17 +14063,22 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ZooProductSubscriptions.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ZooProductSubscriptions.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def update_org_subscription(
         self,
-        body: ZooProductSubscriptionsOrgRequest,
-    ) -> ZooProductSubscriptions:
+        body: "models.ZooProductSubscriptionsOrgRequest",
+    ) -> "models.ZooProductSubscriptions":
         """This endpoint requires authentication by an org admin. It updates the subscription for the authenticated user's org."""
 
+        from kittycad.models.zoo_product_subscriptions import ZooProductSubscriptions
+
         url = "{}/org/payment/subscriptions".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -11059,7 +14086,13 @@ class AsyncPaymentsAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_org_subscription", "payments", "/org/payment/subscriptions"
+                )
+            },
         )
 
         if not response.is_success:
@@ -11070,17 +14103,22 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ZooProductSubscriptions.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ZooProductSubscriptions.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def create_org_subscription(
         self,
-        body: ZooProductSubscriptionsOrgRequest,
-    ) -> ZooProductSubscriptions:
+        body: "models.ZooProductSubscriptionsOrgRequest",
+    ) -> "models.ZooProductSubscriptions":
         """This endpoint requires authentication by an org admin. It creates the subscription for the authenticated user's org."""
 
+        from kittycad.models.zoo_product_subscriptions import ZooProductSubscriptions
+
         url = "{}/org/payment/subscriptions".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -11088,7 +14126,13 @@ class AsyncPaymentsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_org_subscription", "payments", "/org/payment/subscriptions"
+                )
+            },
         )
 
         if not response.is_success:
@@ -11099,10 +14143,13 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ZooProductSubscriptions.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ZooProductSubscriptions.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def validate_customer_tax_information_for_org(
         self,
@@ -11116,6 +14163,14 @@ class AsyncPaymentsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "validate_customer_tax_information_for_org",
+                    "payments",
+                    "/org/payment/tax",
+                )
+            },
         )
 
         if not response.is_success:
@@ -11123,16 +14178,20 @@ class AsyncPaymentsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def get_payment_balance_for_any_org(
         self,
-        id: Uuid,
+        id: "models.Uuid",
         *,
         include_total_due: Optional[bool] = None,
-    ) -> CustomerBalance:
+    ) -> "models.CustomerBalance":
         """This endpoint requires authentication by a Zoo employee. It gets the balance information for the specified org."""
 
+        from kittycad.models.customer_balance import CustomerBalance
+
         url = "{}/orgs/{id}/payment/balance".format(self.client.base_url, id=id)
 
         if include_total_due is not None:
@@ -11146,6 +14205,14 @@ class AsyncPaymentsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_payment_balance_for_any_org",
+                    "payments",
+                    "/orgs/{id}/payment/balance",
+                )
+            },
         )
 
         if not response.is_success:
@@ -11156,20 +14223,25 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CustomerBalance.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CustomerBalance.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def update_payment_balance_for_any_org(
         self,
-        id: Uuid,
-        body: UpdatePaymentBalance,
+        id: "models.Uuid",
+        body: "models.UpdatePaymentBalance",
         *,
         include_total_due: Optional[bool] = None,
-    ) -> CustomerBalance:
+    ) -> "models.CustomerBalance":
         """This endpoint requires authentication by a Zoo employee. It updates the balance information for the specified org."""
 
+        from kittycad.models.customer_balance import CustomerBalance
+
         url = "{}/orgs/{id}/payment/balance".format(self.client.base_url, id=id)
 
         if include_total_due is not None:
@@ -11183,7 +14255,15 @@ class AsyncPaymentsAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_payment_balance_for_any_org",
+                    "payments",
+                    "/orgs/{id}/payment/balance",
+                )
+            },
         )
 
         if not response.is_success:
@@ -11194,18 +14274,23 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CustomerBalance.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CustomerBalance.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def update_org_subscription_for_any_org(
         self,
-        id: Uuid,
-        body: ZooProductSubscriptionsOrgRequest,
-    ) -> ZooProductSubscriptions:
+        id: "models.Uuid",
+        body: "models.ZooProductSubscriptionsOrgRequest",
+    ) -> "models.ZooProductSubscriptions":
         """This endpoint requires authentication by a Zoo admin. It updates the subscription for the specified org."""
 
+        from kittycad.models.zoo_product_subscriptions import ZooProductSubscriptions
+
         url = "{}/orgs/{id}/payment/subscriptions".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -11213,7 +14298,15 @@ class AsyncPaymentsAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_org_subscription_for_any_org",
+                    "payments",
+                    "/orgs/{id}/payment/subscriptions",
+                )
+            },
         )
 
         if not response.is_success:
@@ -11224,18 +14317,25 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ZooProductSubscriptions.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ZooProductSubscriptions.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def upsert_subscription_plan_price(
         self,
         slug: str,
-        body: PriceUpsertRequest,
-    ) -> SubscriptionPlanPriceRecord:
+        body: "models.PriceUpsertRequest",
+    ) -> "models.SubscriptionPlanPriceRecord":
         """You must be a Zoo admin to perform this request."""
 
+        from kittycad.models.subscription_plan_price_record import (
+            SubscriptionPlanPriceRecord,
+        )
+
         url = "{}/subscription-plans/{slug}/prices".format(
             self.client.base_url, slug=slug
         )
@@ -11245,7 +14345,15 @@ class AsyncPaymentsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "upsert_subscription_plan_price",
+                    "payments",
+                    "/subscription-plans/{slug}/prices",
+                )
+            },
         )
 
         if not response.is_success:
@@ -11256,16 +14364,23 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return SubscriptionPlanPriceRecord.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: SubscriptionPlanPriceRecord.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_user_usage_collection_threshold(
         self,
-    ) -> AggregateUsageCollectionThresholdView:
+    ) -> "models.AggregateUsageCollectionThresholdView":
         """The effective threshold is the amount of accrued, unfunded usage that causes an early invoice before the normal billing-period close."""
 
+        from kittycad.models.aggregate_usage_collection_threshold_view import (
+            AggregateUsageCollectionThresholdView,
+        )
+
         url = "{}/user/billing/usage-collection-threshold".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -11273,6 +14388,14 @@ class AsyncPaymentsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_user_usage_collection_threshold",
+                    "payments",
+                    "/user/billing/usage-collection-threshold",
+                )
+            },
         )
 
         if not response.is_success:
@@ -11283,19 +14406,24 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return AggregateUsageCollectionThresholdView.model_validate(
-            json_data, extra="ignore"
+        return parse_json_response(
+            response,
+            lambda content: AggregateUsageCollectionThresholdView.model_validate_json(
+                content, extra="ignore"
+            ),
         )
 
     async def set_user_usage_collection_threshold(
         self,
-        body: AggregateUsageCollectionThresholdSet,
-    ) -> AggregateUsageCollectionThresholdView:
+        body: "models.AggregateUsageCollectionThresholdSet",
+    ) -> "models.AggregateUsageCollectionThresholdView":
         """Set your personal aggregate-usage collection threshold."""
 
+        from kittycad.models.aggregate_usage_collection_threshold_view import (
+            AggregateUsageCollectionThresholdView,
+        )
+
         url = "{}/user/billing/usage-collection-threshold".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -11303,7 +14431,15 @@ class AsyncPaymentsAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "set_user_usage_collection_threshold",
+                    "payments",
+                    "/user/billing/usage-collection-threshold",
+                )
+            },
         )
 
         if not response.is_success:
@@ -11314,19 +14450,24 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return AggregateUsageCollectionThresholdView.model_validate(
-            json_data, extra="ignore"
+        return parse_json_response(
+            response,
+            lambda content: AggregateUsageCollectionThresholdView.model_validate_json(
+                content, extra="ignore"
+            ),
         )
 
     async def reset_user_usage_collection_threshold(
         self,
         expected_version: int,
-    ) -> AggregateUsageCollectionThresholdView:
+    ) -> "models.AggregateUsageCollectionThresholdView":
         """Restore the default for your personal aggregate-usage collection threshold."""
 
+        from kittycad.models.aggregate_usage_collection_threshold_view import (
+            AggregateUsageCollectionThresholdView,
+        )
+
         url = "{}/user/billing/usage-collection-threshold".format(self.client.base_url)
 
         if expected_version is not None:
@@ -11340,6 +14481,14 @@ class AsyncPaymentsAPI:
         response = await _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "reset_user_usage_collection_threshold",
+                    "payments",
+                    "/user/billing/usage-collection-threshold",
+                )
+            },
         )
 
         if not response.is_success:
@@ -11350,20 +14499,23 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return AggregateUsageCollectionThresholdView.model_validate(
-            json_data, extra="ignore"
+        return parse_json_response(
+            response,
+            lambda content: AggregateUsageCollectionThresholdView.model_validate_json(
+                content, extra="ignore"
+            ),
         )
 
     async def get_payment_information_for_user(
         self,
-    ) -> Customer:
+    ) -> "models.Customer":
         """This includes billing address, phone, and name.
 
         This endpoint requires authentication by any Zoo user. It gets the payment information for the authenticated user."""
 
+        from kittycad.models.customer import Customer
+
         url = "{}/user/payment".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -11371,6 +14523,12 @@ class AsyncPaymentsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_payment_information_for_user", "payments", "/user/payment"
+                )
+            },
         )
 
         if not response.is_success:
@@ -11381,19 +14539,22 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Customer.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: Customer.model_validate_json(content, extra="ignore"),
+        )
 
     async def update_payment_information_for_user(
         self,
-        body: BillingInfo,
-    ) -> Customer:
+        body: "models.BillingInfo",
+    ) -> "models.Customer":
         """This includes billing address, phone, and name.
 
         This endpoint requires authentication by any Zoo user. It updates the payment information for the authenticated user."""
 
+        from kittycad.models.customer import Customer
+
         url = "{}/user/payment".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -11401,7 +14562,13 @@ class AsyncPaymentsAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_payment_information_for_user", "payments", "/user/payment"
+                )
+            },
         )
 
         if not response.is_success:
@@ -11412,19 +14579,22 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Customer.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: Customer.model_validate_json(content, extra="ignore"),
+        )
 
     async def create_payment_information_for_user(
         self,
-        body: BillingInfo,
-    ) -> Customer:
+        body: "models.BillingInfo",
+    ) -> "models.Customer":
         """This includes billing address, phone, and name.
 
         This endpoint requires authentication by any Zoo user. It creates the payment information for the authenticated user."""
 
+        from kittycad.models.customer import Customer
+
         url = "{}/user/payment".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -11432,7 +14602,13 @@ class AsyncPaymentsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_payment_information_for_user", "payments", "/user/payment"
+                )
+            },
         )
 
         if not response.is_success:
@@ -11443,10 +14619,11 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Customer.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: Customer.model_validate_json(content, extra="ignore"),
+        )
 
     async def delete_payment_information_for_user(
         self,
@@ -11462,6 +14639,12 @@ class AsyncPaymentsAPI:
         response = await _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_payment_information_for_user", "payments", "/user/payment"
+                )
+            },
         )
 
         if not response.is_success:
@@ -11469,15 +14652,19 @@ class AsyncPaymentsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def get_payment_balance_for_user(
         self,
         *,
         include_total_due: Optional[bool] = None,
-    ) -> CustomerBalance:
+    ) -> "models.CustomerBalance":
         """This endpoint requires authentication by any Zoo user. It gets the balance information for the authenticated user."""
 
+        from kittycad.models.customer_balance import CustomerBalance
+
         url = "{}/user/payment/balance".format(self.client.base_url)
 
         if include_total_due is not None:
@@ -11491,6 +14678,12 @@ class AsyncPaymentsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_payment_balance_for_user", "payments", "/user/payment/balance"
+                )
+            },
         )
 
         if not response.is_success:
@@ -11501,16 +14694,21 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CustomerBalance.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CustomerBalance.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def create_payment_intent_for_user(
         self,
-    ) -> PaymentIntent:
+    ) -> "models.PaymentIntent":
         """This endpoint requires authentication by any Zoo user. It creates a new payment intent for the authenticated user."""
 
+        from kittycad.models.payment_intent import PaymentIntent
+
         url = "{}/user/payment/intent".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -11518,6 +14716,12 @@ class AsyncPaymentsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_payment_intent_for_user", "payments", "/user/payment/intent"
+                )
+            },
         )
 
         if not response.is_success:
@@ -11528,10 +14732,11 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return PaymentIntent.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: PaymentIntent.model_validate_json(content, extra="ignore"),
+        )
 
     def list_invoices_for_user(
         self,
@@ -11570,10 +14775,19 @@ class AsyncPaymentsAPI:
         return AsyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_invoices_for_user", "payments", "/user/payment/invoices"
+            ),
         )
 
-    async def _fetch_page_list_invoices_for_user(self, **kwargs) -> InvoiceResultsPage:
+    async def _fetch_page_list_invoices_for_user(
+        self, **kwargs
+    ) -> "models.InvoiceResultsPage":
         """Internal async method to fetch a single page."""
+
+        from kittycad.models.invoice_results_page import InvoiceResultsPage
+
         # Build URL with path parameters
         url = "{}/user/payment/invoices".format(self.client.base_url)
 
@@ -11597,6 +14811,12 @@ class AsyncPaymentsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_invoices_for_user", "payments", "/user/payment/invoices"
+                )
+            },
         )
 
         if not response.is_success:
@@ -11607,9 +14827,15 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return InvoiceResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: InvoiceResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def redirect_payment_method_portal_link_for_user(
         self,
@@ -11631,6 +14857,14 @@ class AsyncPaymentsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "redirect_payment_method_portal_link_for_user",
+                    "payments",
+                    "/user/payment/method-portal-link",
+                )
+            },
         )
 
         if not response.is_success:
@@ -11638,13 +14872,17 @@ class AsyncPaymentsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def list_payment_methods_for_user(
         self,
-    ) -> List[PaymentMethod]:
+    ) -> "List[models.PaymentMethod]":
         """This endpoint requires authentication by any Zoo user. It lists payment methods for the authenticated user."""
 
+        from kittycad.models.payment_method import PaymentMethod
+
         url = "{}/user/payment/methods".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -11652,6 +14890,12 @@ class AsyncPaymentsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_payment_methods_for_user", "payments", "/user/payment/methods"
+                )
+            },
         )
 
         if not response.is_success:
@@ -11662,13 +14906,13 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[PaymentMethod]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[PaymentMethod]", lambda: List[PaymentMethod]
+            ).validate_json(content, extra="ignore"),
         )
 
     async def delete_payment_method_for_user(
@@ -11684,6 +14928,14 @@ class AsyncPaymentsAPI:
         response = await _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_payment_method_for_user",
+                    "payments",
+                    "/user/payment/methods/{id}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -11691,7 +14943,9 @@ class AsyncPaymentsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def set_default_payment_method_for_user(
         self,
@@ -11706,6 +14960,14 @@ class AsyncPaymentsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "set_default_payment_method_for_user",
+                    "payments",
+                    "/user/payment/methods/{id}/default",
+                )
+            },
         )
 
         if not response.is_success:
@@ -11713,13 +14975,17 @@ class AsyncPaymentsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def get_user_subscription(
         self,
-    ) -> ZooProductSubscriptions:
+    ) -> "models.ZooProductSubscriptions":
         """This endpoint requires authentication by any Zoo user. It gets the subscription for the user."""
 
+        from kittycad.models.zoo_product_subscriptions import ZooProductSubscriptions
+
         url = "{}/user/payment/subscriptions".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -11727,6 +14993,12 @@ class AsyncPaymentsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_user_subscription", "payments", "/user/payment/subscriptions"
+                )
+            },
         )
 
         if not response.is_success:
@@ -11737,17 +15009,22 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ZooProductSubscriptions.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ZooProductSubscriptions.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def update_user_subscription(
         self,
-        body: ZooProductSubscriptionsUserRequest,
-    ) -> ZooProductSubscriptions:
+        body: "models.ZooProductSubscriptionsUserRequest",
+    ) -> "models.ZooProductSubscriptions":
         """This endpoint requires authentication by any Zoo user. It updates the subscription for the user."""
 
+        from kittycad.models.zoo_product_subscriptions import ZooProductSubscriptions
+
         url = "{}/user/payment/subscriptions".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -11755,7 +15032,15 @@ class AsyncPaymentsAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_user_subscription",
+                    "payments",
+                    "/user/payment/subscriptions",
+                )
+            },
         )
 
         if not response.is_success:
@@ -11766,17 +15051,22 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ZooProductSubscriptions.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ZooProductSubscriptions.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def create_user_subscription(
         self,
-        body: ZooProductSubscriptionsUserRequest,
-    ) -> ZooProductSubscriptions:
+        body: "models.ZooProductSubscriptionsUserRequest",
+    ) -> "models.ZooProductSubscriptions":
         """This endpoint requires authentication by any Zoo user. It creates the subscription for the user."""
 
+        from kittycad.models.zoo_product_subscriptions import ZooProductSubscriptions
+
         url = "{}/user/payment/subscriptions".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -11784,7 +15074,15 @@ class AsyncPaymentsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_user_subscription",
+                    "payments",
+                    "/user/payment/subscriptions",
+                )
+            },
         )
 
         if not response.is_success:
@@ -11795,10 +15093,13 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ZooProductSubscriptions.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ZooProductSubscriptions.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def validate_customer_tax_information_for_user(
         self,
@@ -11812,6 +15113,14 @@ class AsyncPaymentsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "validate_customer_tax_information_for_user",
+                    "payments",
+                    "/user/payment/tax",
+                )
+            },
         )
 
         if not response.is_success:
@@ -11819,16 +15128,20 @@ class AsyncPaymentsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def get_payment_balance_for_any_user(
         self,
-        id: UserIdentifier,
+        id: "models.UserIdentifier",
         *,
         include_total_due: Optional[bool] = None,
-    ) -> CustomerBalance:
+    ) -> "models.CustomerBalance":
         """This endpoint requires authentication by a Zoo employee. It gets the balance information for the specified user."""
 
+        from kittycad.models.customer_balance import CustomerBalance
+
         url = "{}/users/{id}/payment/balance".format(self.client.base_url, id=id)
 
         if include_total_due is not None:
@@ -11842,6 +15155,14 @@ class AsyncPaymentsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_payment_balance_for_any_user",
+                    "payments",
+                    "/users/{id}/payment/balance",
+                )
+            },
         )
 
         if not response.is_success:
@@ -11852,20 +15173,25 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CustomerBalance.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CustomerBalance.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def update_payment_balance_for_any_user(
         self,
-        id: UserIdentifier,
-        body: UpdatePaymentBalance,
+        id: "models.UserIdentifier",
+        body: "models.UpdatePaymentBalance",
         *,
         include_total_due: Optional[bool] = None,
-    ) -> CustomerBalance:
+    ) -> "models.CustomerBalance":
         """This endpoint requires authentication by a Zoo employee. It updates the balance information for the specified user."""
 
+        from kittycad.models.customer_balance import CustomerBalance
+
         url = "{}/users/{id}/payment/balance".format(self.client.base_url, id=id)
 
         if include_total_due is not None:
@@ -11879,7 +15205,15 @@ class AsyncPaymentsAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_payment_balance_for_any_user",
+                    "payments",
+                    "/users/{id}/payment/balance",
+                )
+            },
         )
 
         if not response.is_success:
@@ -11890,10 +15224,13 @@ class AsyncPaymentsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CustomerBalance.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CustomerBalance.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
 
 class ServiceAccountsAPI:
@@ -11907,7 +15244,7 @@ class ServiceAccountsAPI:
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "SyncPageIterator":
         """This endpoint requires authentication by an org member. It returns the service accounts for the organization.
 
@@ -11945,12 +15282,23 @@ class ServiceAccountsAPI:
         return SyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_service_accounts_for_org",
+                "service_accounts",
+                "/org/service-accounts",
+            ),
         )
 
     def _fetch_page_list_service_accounts_for_org(
         self, **kwargs
-    ) -> ServiceAccountResultsPage:
+    ) -> "models.ServiceAccountResultsPage":
         """Internal method to fetch a single page."""
+
+        from kittycad.models.service_account_results_page import (
+            ServiceAccountResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/org/service-accounts".format(self.client.base_url)
 
@@ -11980,6 +15328,14 @@ class ServiceAccountsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_service_accounts_for_org",
+                    "service_accounts",
+                    "/org/service-accounts",
+                )
+            },
         )
 
         if not response.is_success:
@@ -11990,17 +15346,25 @@ class ServiceAccountsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return ServiceAccountResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: ServiceAccountResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def create_service_account_for_org(
         self,
         *,
         label: Optional[str] = None,
-    ) -> ServiceAccount:
+    ) -> "models.ServiceAccount":
         """This endpoint requires authentication by an org member. It creates a new service account for the organization."""
 
+        from kittycad.models.service_account import ServiceAccount
+
         url = "{}/org/service-accounts".format(self.client.base_url)
 
         if label is not None:
@@ -12014,6 +15378,14 @@ class ServiceAccountsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_service_account_for_org",
+                    "service_accounts",
+                    "/org/service-accounts",
+                )
+            },
         )
 
         if not response.is_success:
@@ -12024,17 +15396,20 @@ class ServiceAccountsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ServiceAccount.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ServiceAccount.model_validate_json(content, extra="ignore"),
+        )
 
     def get_service_account_for_org(
         self,
-        token: ServiceAccountUuid,
-    ) -> ServiceAccount:
+        token: "models.ServiceAccountUuid",
+    ) -> "models.ServiceAccount":
         """This endpoint requires authentication by an org member. It returns details of the requested service account for the organization."""
 
+        from kittycad.models.service_account import ServiceAccount
+
         url = "{}/org/service-accounts/{token}".format(
             self.client.base_url, token=token
         )
@@ -12044,6 +15419,14 @@ class ServiceAccountsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_service_account_for_org",
+                    "service_accounts",
+                    "/org/service-accounts/{token}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -12054,10 +15437,11 @@ class ServiceAccountsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ServiceAccount.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ServiceAccount.model_validate_json(content, extra="ignore"),
+        )
 
     def delete_service_account_for_org(
         self,
@@ -12078,6 +15462,14 @@ class ServiceAccountsAPI:
         response = _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_service_account_for_org",
+                    "service_accounts",
+                    "/org/service-accounts/{token}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -12085,7 +15477,9 @@ class ServiceAccountsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
 
 class AsyncServiceAccountsAPI:
@@ -12099,7 +15493,7 @@ class AsyncServiceAccountsAPI:
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "AsyncPageIterator":
         """This endpoint requires authentication by an org member. It returns the service accounts for the organization.
 
@@ -12137,12 +15531,23 @@ class AsyncServiceAccountsAPI:
         return AsyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_service_accounts_for_org",
+                "service_accounts",
+                "/org/service-accounts",
+            ),
         )
 
     async def _fetch_page_list_service_accounts_for_org(
         self, **kwargs
-    ) -> ServiceAccountResultsPage:
+    ) -> "models.ServiceAccountResultsPage":
         """Internal async method to fetch a single page."""
+
+        from kittycad.models.service_account_results_page import (
+            ServiceAccountResultsPage,
+        )
+
         # Build URL with path parameters
         url = "{}/org/service-accounts".format(self.client.base_url)
 
@@ -12172,6 +15577,14 @@ class AsyncServiceAccountsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_service_accounts_for_org",
+                    "service_accounts",
+                    "/org/service-accounts",
+                )
+            },
         )
 
         if not response.is_success:
@@ -12182,17 +15595,25 @@ class AsyncServiceAccountsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return ServiceAccountResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: ServiceAccountResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def create_service_account_for_org(
         self,
         *,
         label: Optional[str] = None,
-    ) -> ServiceAccount:
+    ) -> "models.ServiceAccount":
         """This endpoint requires authentication by an org member. It creates a new service account for the organization."""
 
+        from kittycad.models.service_account import ServiceAccount
+
         url = "{}/org/service-accounts".format(self.client.base_url)
 
         if label is not None:
@@ -12206,6 +15627,14 @@ class AsyncServiceAccountsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_service_account_for_org",
+                    "service_accounts",
+                    "/org/service-accounts",
+                )
+            },
         )
 
         if not response.is_success:
@@ -12216,17 +15645,20 @@ class AsyncServiceAccountsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ServiceAccount.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ServiceAccount.model_validate_json(content, extra="ignore"),
+        )
 
     async def get_service_account_for_org(
         self,
-        token: ServiceAccountUuid,
-    ) -> ServiceAccount:
+        token: "models.ServiceAccountUuid",
+    ) -> "models.ServiceAccount":
         """This endpoint requires authentication by an org member. It returns details of the requested service account for the organization."""
 
+        from kittycad.models.service_account import ServiceAccount
+
         url = "{}/org/service-accounts/{token}".format(
             self.client.base_url, token=token
         )
@@ -12236,6 +15668,14 @@ class AsyncServiceAccountsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_service_account_for_org",
+                    "service_accounts",
+                    "/org/service-accounts/{token}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -12246,10 +15686,11 @@ class AsyncServiceAccountsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ServiceAccount.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ServiceAccount.model_validate_json(content, extra="ignore"),
+        )
 
     async def delete_service_account_for_org(
         self,
@@ -12270,6 +15711,14 @@ class AsyncServiceAccountsAPI:
         response = await _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_service_account_for_org",
+                    "service_accounts",
+                    "/org/service-accounts/{token}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -12277,7 +15726,9 @@ class AsyncServiceAccountsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
 
 class ProjectsAPI:
@@ -12288,9 +15739,11 @@ class ProjectsAPI:
 
     def list_project_categories(
         self,
-    ) -> List[ProjectCategoryResponse]:
+    ) -> "List[models.ProjectCategoryResponse]":
         """List the active categories available for project submissions."""
 
+        from kittycad.models.project_category_response import ProjectCategoryResponse
+
         url = "{}/projects/categories".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -12298,6 +15751,12 @@ class ProjectsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_project_categories", "projects", "/projects/categories"
+                )
+            },
         )
 
         if not response.is_success:
@@ -12308,20 +15767,22 @@ class ProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[ProjectCategoryResponse]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[ProjectCategoryResponse]", lambda: List[ProjectCategoryResponse]
+            ).validate_json(content, extra="ignore"),
         )
 
     def list_public_projects(
         self,
-    ) -> List[PublicProjectResponse]:
+    ) -> "List[models.PublicProjectResponse]":
         """List publicly visible community projects for the website/gallery."""
 
+        from kittycad.models.public_project_response import PublicProjectResponse
+
         url = "{}/projects/public".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -12329,6 +15790,12 @@ class ProjectsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_public_projects", "projects", "/projects/public"
+                )
+            },
         )
 
         if not response.is_success:
@@ -12339,21 +15806,23 @@ class ProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[PublicProjectResponse]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[PublicProjectResponse]", lambda: List[PublicProjectResponse]
+            ).validate_json(content, extra="ignore"),
         )
 
     def get_public_project(
         self,
-        id: Uuid,
-    ) -> PublicProjectResponse:
+        id: "models.Uuid",
+    ) -> "models.PublicProjectResponse":
         """Get one publicly visible community project."""
 
+        from kittycad.models.public_project_response import PublicProjectResponse
+
         url = "{}/projects/public/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -12361,6 +15830,12 @@ class ProjectsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_public_project", "projects", "/projects/public/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -12371,16 +15846,19 @@ class ProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return PublicProjectResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: PublicProjectResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def download_public_project(
         self,
-        id: Uuid,
+        id: "models.Uuid",
         *,
-        format: Optional[ProjectArchiveFormat] = None,
+        format: "Optional[models.ProjectArchiveFormat]" = None,
     ):
         """Download a published public project as a tar archive."""
 
@@ -12397,6 +15875,14 @@ class ProjectsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "download_public_project",
+                    "projects",
+                    "/projects/public/{id}/download",
+                )
+            },
         )
 
         if not response.is_success:
@@ -12404,11 +15890,13 @@ class ProjectsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def get_public_project_thumbnail(
         self,
-        id: Uuid,
+        id: "models.Uuid",
     ):
         """Fetch the public thumbnail for a published project."""
 
@@ -12419,6 +15907,14 @@ class ProjectsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_public_project_thumbnail",
+                    "projects",
+                    "/projects/public/{id}/thumbnail",
+                )
+            },
         )
 
         if not response.is_success:
@@ -12426,14 +15922,20 @@ class ProjectsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def create_public_project_vote(
         self,
-        id: Uuid,
-    ) -> PublicProjectVoteResponse:
+        id: "models.Uuid",
+    ) -> "models.PublicProjectVoteResponse":
         """Add the authenticated user's upvote to a published community project."""
 
+        from kittycad.models.public_project_vote_response import (
+            PublicProjectVoteResponse,
+        )
+
         url = "{}/projects/public/{id}/vote".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -12441,6 +15943,14 @@ class ProjectsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_public_project_vote",
+                    "projects",
+                    "/projects/public/{id}/vote",
+                )
+            },
         )
 
         if not response.is_success:
@@ -12451,17 +15961,24 @@ class ProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return PublicProjectVoteResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: PublicProjectVoteResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def delete_public_project_vote(
         self,
-        id: Uuid,
-    ) -> PublicProjectVoteResponse:
+        id: "models.Uuid",
+    ) -> "models.PublicProjectVoteResponse":
         """Remove the authenticated user's upvote from a published community project."""
 
+        from kittycad.models.public_project_vote_response import (
+            PublicProjectVoteResponse,
+        )
+
         url = "{}/projects/public/{id}/vote".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -12469,6 +15986,14 @@ class ProjectsAPI:
         response = _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_public_project_vote",
+                    "projects",
+                    "/projects/public/{id}/vote",
+                )
+            },
         )
 
         if not response.is_success:
@@ -12479,16 +16004,21 @@ class ProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return PublicProjectVoteResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: PublicProjectVoteResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def list_projects(
         self,
-    ) -> List[ProjectSummaryResponse]:
+    ) -> "List[models.ProjectSummaryResponse]":
         """List the authenticated user's projects."""
 
+        from kittycad.models.project_summary_response import ProjectSummaryResponse
+
         url = "{}/user/projects".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -12496,6 +16026,12 @@ class ProjectsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_projects", "projects", "/user/projects"
+                )
+            },
         )
 
         if not response.is_success:
@@ -12506,20 +16042,22 @@ class ProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[ProjectSummaryResponse]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[ProjectSummaryResponse]", lambda: List[ProjectSummaryResponse]
+            ).validate_json(content, extra="ignore"),
         )
 
     def create_project(
         self,
-    ) -> ProjectResponse:
+    ) -> "models.ProjectResponse":
         """Create a draft project for the authenticated user."""
 
+        from kittycad.models.project_response import ProjectResponse
+
         url = "{}/user/projects".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -12527,6 +16065,12 @@ class ProjectsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_project", "projects", "/user/projects"
+                )
+            },
         )
 
         if not response.is_success:
@@ -12537,17 +16081,22 @@ class ProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ProjectResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ProjectResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_project(
         self,
-        id: Uuid,
-    ) -> ProjectResponse:
+        id: "models.Uuid",
+    ) -> "models.ProjectResponse":
         """Get one of the authenticated user's projects."""
 
+        from kittycad.models.project_response import ProjectResponse
+
         url = "{}/user/projects/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -12555,6 +16104,12 @@ class ProjectsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_project", "projects", "/user/projects/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -12565,17 +16120,22 @@ class ProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ProjectResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ProjectResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def update_project(
         self,
-        id: Uuid,
-    ) -> ProjectResponse:
+        id: "models.Uuid",
+    ) -> "models.ProjectResponse":
         """Replace one of the authenticated user's projects."""
 
+        from kittycad.models.project_response import ProjectResponse
+
         url = "{}/user/projects/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -12583,6 +16143,12 @@ class ProjectsAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_project", "projects", "/user/projects/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -12593,14 +16159,17 @@ class ProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ProjectResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ProjectResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def delete_project(
         self,
-        id: Uuid,
+        id: "models.Uuid",
     ):
         """Delete one of the authenticated user's projects."""
 
@@ -12611,6 +16180,12 @@ class ProjectsAPI:
         response = _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_project", "projects", "/user/projects/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -12618,13 +16193,15 @@ class ProjectsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def download_project(
         self,
-        id: Uuid,
+        id: "models.Uuid",
         *,
-        format: Optional[ProjectArchiveFormat] = None,
+        format: "Optional[models.ProjectArchiveFormat]" = None,
     ):
         """Download one of the authenticated user's projects as a tar archive."""
 
@@ -12641,6 +16218,12 @@ class ProjectsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "download_project", "projects", "/user/projects/{id}/download"
+                )
+            },
         )
 
         if not response.is_success:
@@ -12648,14 +16231,18 @@ class ProjectsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def update_project_organization(
         self,
-        id: Uuid,
-    ) -> ProjectResponse:
+        id: "models.Uuid",
+    ) -> "models.ProjectResponse":
         """This changes only the project's ownership scope. The project ID, current revision, files, and version history remain unchanged so cloud bindings stay valid across the move."""
 
+        from kittycad.models.project_response import ProjectResponse
+
         url = "{}/user/projects/{id}/organization".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -12663,6 +16250,14 @@ class ProjectsAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_project_organization",
+                    "projects",
+                    "/user/projects/{id}/organization",
+                )
+            },
         )
 
         if not response.is_success:
@@ -12673,14 +16268,17 @@ class ProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ProjectResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ProjectResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def delete_project_organization(
         self,
-        id: Uuid,
+        id: "models.Uuid",
     ):
         """Organization administrators may perform this move to revoke organization access. The project ID, current revision, files, and version history remain unchanged."""
 
@@ -12691,6 +16289,14 @@ class ProjectsAPI:
         response = _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_project_organization",
+                    "projects",
+                    "/user/projects/{id}/organization",
+                )
+            },
         )
 
         if not response.is_success:
@@ -12698,14 +16304,18 @@ class ProjectsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def publish_project(
         self,
-        id: Uuid,
-    ) -> ProjectResponse:
+        id: "models.Uuid",
+    ) -> "models.ProjectResponse":
         """Submit one of the authenticated user's projects for public review."""
 
+        from kittycad.models.project_response import ProjectResponse
+
         url = "{}/user/projects/{id}/publish".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -12713,6 +16323,12 @@ class ProjectsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "publish_project", "projects", "/user/projects/{id}/publish"
+                )
+            },
         )
 
         if not response.is_success:
@@ -12723,17 +16339,22 @@ class ProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ProjectResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ProjectResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def list_project_share_links(
         self,
-        id: Uuid,
-    ) -> List[ProjectShareLinkResponse]:
+        id: "models.Uuid",
+    ) -> "List[models.ProjectShareLinkResponse]":
         """List share links for one of the authenticated user's projects."""
 
+        from kittycad.models.project_share_link_response import ProjectShareLinkResponse
+
         url = "{}/user/projects/{id}/share-links".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -12741,6 +16362,14 @@ class ProjectsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_project_share_links",
+                    "projects",
+                    "/user/projects/{id}/share-links",
+                )
+            },
         )
 
         if not response.is_success:
@@ -12751,22 +16380,24 @@ class ProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[ProjectShareLinkResponse]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[ProjectShareLinkResponse]", lambda: List[ProjectShareLinkResponse]
+            ).validate_json(content, extra="ignore"),
         )
 
     def create_project_share_link(
         self,
-        id: Uuid,
-        body: CreateProjectShareLinkRequest,
-    ) -> ProjectShareLinkResponse:
+        id: "models.Uuid",
+        body: "models.CreateProjectShareLinkRequest",
+    ) -> "models.ProjectShareLinkResponse":
         """Create a share link for one of the authenticated user's projects."""
 
+        from kittycad.models.project_share_link_response import ProjectShareLinkResponse
+
         url = "{}/user/projects/{id}/share-links".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -12774,7 +16405,15 @@ class ProjectsAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_project_share_link",
+                    "projects",
+                    "/user/projects/{id}/share-links",
+                )
+            },
         )
 
         if not response.is_success:
@@ -12785,14 +16424,17 @@ class ProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ProjectShareLinkResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ProjectShareLinkResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def delete_project_share_link(
         self,
-        id: Uuid,
+        id: "models.Uuid",
         key: str,
     ):
         """Delete one share link for one of the authenticated user's projects."""
@@ -12806,6 +16448,14 @@ class ProjectsAPI:
         response = _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_project_share_link",
+                    "projects",
+                    "/user/projects/{id}/share-links/{key}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -12813,11 +16463,13 @@ class ProjectsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def get_project_thumbnail(
         self,
-        id: Uuid,
+        id: "models.Uuid",
     ):
         """Fetch the authenticated owner's current project thumbnail."""
 
@@ -12828,6 +16480,12 @@ class ProjectsAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_project_thumbnail", "projects", "/user/projects/{id}/thumbnail"
+                )
+            },
         )
 
         if not response.is_success:
@@ -12835,7 +16493,9 @@ class ProjectsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
 
 class AsyncProjectsAPI:
@@ -12846,9 +16506,11 @@ class AsyncProjectsAPI:
 
     async def list_project_categories(
         self,
-    ) -> List[ProjectCategoryResponse]:
+    ) -> "List[models.ProjectCategoryResponse]":
         """List the active categories available for project submissions."""
 
+        from kittycad.models.project_category_response import ProjectCategoryResponse
+
         url = "{}/projects/categories".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -12856,6 +16518,12 @@ class AsyncProjectsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_project_categories", "projects", "/projects/categories"
+                )
+            },
         )
 
         if not response.is_success:
@@ -12866,20 +16534,22 @@ class AsyncProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[ProjectCategoryResponse]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[ProjectCategoryResponse]", lambda: List[ProjectCategoryResponse]
+            ).validate_json(content, extra="ignore"),
         )
 
     async def list_public_projects(
         self,
-    ) -> List[PublicProjectResponse]:
+    ) -> "List[models.PublicProjectResponse]":
         """List publicly visible community projects for the website/gallery."""
 
+        from kittycad.models.public_project_response import PublicProjectResponse
+
         url = "{}/projects/public".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -12887,6 +16557,12 @@ class AsyncProjectsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_public_projects", "projects", "/projects/public"
+                )
+            },
         )
 
         if not response.is_success:
@@ -12897,21 +16573,23 @@ class AsyncProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[PublicProjectResponse]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[PublicProjectResponse]", lambda: List[PublicProjectResponse]
+            ).validate_json(content, extra="ignore"),
         )
 
     async def get_public_project(
         self,
-        id: Uuid,
-    ) -> PublicProjectResponse:
+        id: "models.Uuid",
+    ) -> "models.PublicProjectResponse":
         """Get one publicly visible community project."""
 
+        from kittycad.models.public_project_response import PublicProjectResponse
+
         url = "{}/projects/public/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -12919,6 +16597,12 @@ class AsyncProjectsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_public_project", "projects", "/projects/public/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -12929,16 +16613,19 @@ class AsyncProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return PublicProjectResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: PublicProjectResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def download_public_project(
         self,
-        id: Uuid,
+        id: "models.Uuid",
         *,
-        format: Optional[ProjectArchiveFormat] = None,
+        format: "Optional[models.ProjectArchiveFormat]" = None,
     ):
         """Download a published public project as a tar archive."""
 
@@ -12955,6 +16642,14 @@ class AsyncProjectsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "download_public_project",
+                    "projects",
+                    "/projects/public/{id}/download",
+                )
+            },
         )
 
         if not response.is_success:
@@ -12962,11 +16657,13 @@ class AsyncProjectsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def get_public_project_thumbnail(
         self,
-        id: Uuid,
+        id: "models.Uuid",
     ):
         """Fetch the public thumbnail for a published project."""
 
@@ -12977,6 +16674,14 @@ class AsyncProjectsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_public_project_thumbnail",
+                    "projects",
+                    "/projects/public/{id}/thumbnail",
+                )
+            },
         )
 
         if not response.is_success:
@@ -12984,14 +16689,20 @@ class AsyncProjectsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def create_public_project_vote(
         self,
-        id: Uuid,
-    ) -> PublicProjectVoteResponse:
+        id: "models.Uuid",
+    ) -> "models.PublicProjectVoteResponse":
         """Add the authenticated user's upvote to a published community project."""
 
+        from kittycad.models.public_project_vote_response import (
+            PublicProjectVoteResponse,
+        )
+
         url = "{}/projects/public/{id}/vote".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -12999,6 +16710,14 @@ class AsyncProjectsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_public_project_vote",
+                    "projects",
+                    "/projects/public/{id}/vote",
+                )
+            },
         )
 
         if not response.is_success:
@@ -13009,17 +16728,24 @@ class AsyncProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return PublicProjectVoteResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: PublicProjectVoteResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def delete_public_project_vote(
         self,
-        id: Uuid,
-    ) -> PublicProjectVoteResponse:
+        id: "models.Uuid",
+    ) -> "models.PublicProjectVoteResponse":
         """Remove the authenticated user's upvote from a published community project."""
 
+        from kittycad.models.public_project_vote_response import (
+            PublicProjectVoteResponse,
+        )
+
         url = "{}/projects/public/{id}/vote".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -13027,6 +16753,14 @@ class AsyncProjectsAPI:
         response = await _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_public_project_vote",
+                    "projects",
+                    "/projects/public/{id}/vote",
+                )
+            },
         )
 
         if not response.is_success:
@@ -13037,16 +16771,21 @@ class AsyncProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return PublicProjectVoteResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: PublicProjectVoteResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def list_projects(
         self,
-    ) -> List[ProjectSummaryResponse]:
+    ) -> "List[models.ProjectSummaryResponse]":
         """List the authenticated user's projects."""
 
+        from kittycad.models.project_summary_response import ProjectSummaryResponse
+
         url = "{}/user/projects".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -13054,6 +16793,12 @@ class AsyncProjectsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_projects", "projects", "/user/projects"
+                )
+            },
         )
 
         if not response.is_success:
@@ -13064,20 +16809,22 @@ class AsyncProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[ProjectSummaryResponse]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[ProjectSummaryResponse]", lambda: List[ProjectSummaryResponse]
+            ).validate_json(content, extra="ignore"),
         )
 
     async def create_project(
         self,
-    ) -> ProjectResponse:
+    ) -> "models.ProjectResponse":
         """Create a draft project for the authenticated user."""
 
+        from kittycad.models.project_response import ProjectResponse
+
         url = "{}/user/projects".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -13085,6 +16832,12 @@ class AsyncProjectsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_project", "projects", "/user/projects"
+                )
+            },
         )
 
         if not response.is_success:
@@ -13095,17 +16848,22 @@ class AsyncProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ProjectResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ProjectResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_project(
         self,
-        id: Uuid,
-    ) -> ProjectResponse:
+        id: "models.Uuid",
+    ) -> "models.ProjectResponse":
         """Get one of the authenticated user's projects."""
 
+        from kittycad.models.project_response import ProjectResponse
+
         url = "{}/user/projects/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -13113,6 +16871,12 @@ class AsyncProjectsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_project", "projects", "/user/projects/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -13123,17 +16887,22 @@ class AsyncProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ProjectResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ProjectResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def update_project(
         self,
-        id: Uuid,
-    ) -> ProjectResponse:
+        id: "models.Uuid",
+    ) -> "models.ProjectResponse":
         """Replace one of the authenticated user's projects."""
 
+        from kittycad.models.project_response import ProjectResponse
+
         url = "{}/user/projects/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -13141,6 +16910,12 @@ class AsyncProjectsAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_project", "projects", "/user/projects/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -13151,14 +16926,17 @@ class AsyncProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ProjectResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ProjectResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def delete_project(
         self,
-        id: Uuid,
+        id: "models.Uuid",
     ):
         """Delete one of the authenticated user's projects."""
 
@@ -13169,6 +16947,12 @@ class AsyncProjectsAPI:
         response = await _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_project", "projects", "/user/projects/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -13176,13 +16960,15 @@ class AsyncProjectsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def download_project(
         self,
-        id: Uuid,
+        id: "models.Uuid",
         *,
-        format: Optional[ProjectArchiveFormat] = None,
+        format: "Optional[models.ProjectArchiveFormat]" = None,
     ):
         """Download one of the authenticated user's projects as a tar archive."""
 
@@ -13199,6 +16985,12 @@ class AsyncProjectsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "download_project", "projects", "/user/projects/{id}/download"
+                )
+            },
         )
 
         if not response.is_success:
@@ -13206,14 +16998,18 @@ class AsyncProjectsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def update_project_organization(
         self,
-        id: Uuid,
-    ) -> ProjectResponse:
+        id: "models.Uuid",
+    ) -> "models.ProjectResponse":
         """This changes only the project's ownership scope. The project ID, current revision, files, and version history remain unchanged so cloud bindings stay valid across the move."""
 
+        from kittycad.models.project_response import ProjectResponse
+
         url = "{}/user/projects/{id}/organization".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -13221,6 +17017,14 @@ class AsyncProjectsAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_project_organization",
+                    "projects",
+                    "/user/projects/{id}/organization",
+                )
+            },
         )
 
         if not response.is_success:
@@ -13231,14 +17035,17 @@ class AsyncProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ProjectResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ProjectResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def delete_project_organization(
         self,
-        id: Uuid,
+        id: "models.Uuid",
     ):
         """Organization administrators may perform this move to revoke organization access. The project ID, current revision, files, and version history remain unchanged."""
 
@@ -13249,6 +17056,14 @@ class AsyncProjectsAPI:
         response = await _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_project_organization",
+                    "projects",
+                    "/user/projects/{id}/organization",
+                )
+            },
         )
 
         if not response.is_success:
@@ -13256,14 +17071,18 @@ class AsyncProjectsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def publish_project(
         self,
-        id: Uuid,
-    ) -> ProjectResponse:
+        id: "models.Uuid",
+    ) -> "models.ProjectResponse":
         """Submit one of the authenticated user's projects for public review."""
 
+        from kittycad.models.project_response import ProjectResponse
+
         url = "{}/user/projects/{id}/publish".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -13271,6 +17090,12 @@ class AsyncProjectsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "publish_project", "projects", "/user/projects/{id}/publish"
+                )
+            },
         )
 
         if not response.is_success:
@@ -13281,17 +17106,22 @@ class AsyncProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ProjectResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ProjectResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def list_project_share_links(
         self,
-        id: Uuid,
-    ) -> List[ProjectShareLinkResponse]:
+        id: "models.Uuid",
+    ) -> "List[models.ProjectShareLinkResponse]":
         """List share links for one of the authenticated user's projects."""
 
+        from kittycad.models.project_share_link_response import ProjectShareLinkResponse
+
         url = "{}/user/projects/{id}/share-links".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -13299,6 +17129,14 @@ class AsyncProjectsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_project_share_links",
+                    "projects",
+                    "/user/projects/{id}/share-links",
+                )
+            },
         )
 
         if not response.is_success:
@@ -13309,22 +17147,24 @@ class AsyncProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[ProjectShareLinkResponse]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[ProjectShareLinkResponse]", lambda: List[ProjectShareLinkResponse]
+            ).validate_json(content, extra="ignore"),
         )
 
     async def create_project_share_link(
         self,
-        id: Uuid,
-        body: CreateProjectShareLinkRequest,
-    ) -> ProjectShareLinkResponse:
+        id: "models.Uuid",
+        body: "models.CreateProjectShareLinkRequest",
+    ) -> "models.ProjectShareLinkResponse":
         """Create a share link for one of the authenticated user's projects."""
 
+        from kittycad.models.project_share_link_response import ProjectShareLinkResponse
+
         url = "{}/user/projects/{id}/share-links".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -13332,7 +17172,15 @@ class AsyncProjectsAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_project_share_link",
+                    "projects",
+                    "/user/projects/{id}/share-links",
+                )
+            },
         )
 
         if not response.is_success:
@@ -13343,14 +17191,17 @@ class AsyncProjectsAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ProjectShareLinkResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ProjectShareLinkResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def delete_project_share_link(
         self,
-        id: Uuid,
+        id: "models.Uuid",
         key: str,
     ):
         """Delete one share link for one of the authenticated user's projects."""
@@ -13364,6 +17215,14 @@ class AsyncProjectsAPI:
         response = await _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_project_share_link",
+                    "projects",
+                    "/user/projects/{id}/share-links/{key}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -13371,11 +17230,13 @@ class AsyncProjectsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def get_project_thumbnail(
         self,
-        id: Uuid,
+        id: "models.Uuid",
     ):
         """Fetch the authenticated owner's current project thumbnail."""
 
@@ -13386,6 +17247,12 @@ class AsyncProjectsAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_project_thumbnail", "projects", "/user/projects/{id}/thumbnail"
+                )
+            },
         )
 
         if not response.is_success:
@@ -13393,7 +17260,9 @@ class AsyncProjectsAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
 
 class StoreAPI:
@@ -13404,10 +17273,12 @@ class StoreAPI:
 
     def create_store_coupon(
         self,
-        body: StoreCouponParams,
-    ) -> DiscountCode:
+        body: "models.StoreCouponParams",
+    ) -> "models.DiscountCode":
         """This endpoint requires authentication by a Zoo employee. It creates a new store coupon."""
 
+        from kittycad.models.discount_code import DiscountCode
+
         url = "{}/store/coupon".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -13415,7 +17286,13 @@ class StoreAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_store_coupon", "store", "/store/coupon"
+                )
+            },
         )
 
         if not response.is_success:
@@ -13426,10 +17303,11 @@ class StoreAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return DiscountCode.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: DiscountCode.model_validate_json(content, extra="ignore"),
+        )
 
 
 class AsyncStoreAPI:
@@ -13440,10 +17318,12 @@ class AsyncStoreAPI:
 
     async def create_store_coupon(
         self,
-        body: StoreCouponParams,
-    ) -> DiscountCode:
+        body: "models.StoreCouponParams",
+    ) -> "models.DiscountCode":
         """This endpoint requires authentication by a Zoo employee. It creates a new store coupon."""
 
+        from kittycad.models.discount_code import DiscountCode
+
         url = "{}/store/coupon".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -13451,7 +17331,13 @@ class AsyncStoreAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_store_coupon", "store", "/store/coupon"
+                )
+            },
         )
 
         if not response.is_success:
@@ -13462,10 +17348,11 @@ class AsyncStoreAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return DiscountCode.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: DiscountCode.model_validate_json(content, extra="ignore"),
+        )
 
 
 class UnitAPI:
@@ -13476,11 +17363,22 @@ class UnitAPI:
 
     def get_angle_unit_conversion(
         self,
-        input_unit: UnitAngle,
-        output_unit: UnitAngle,
+        input_unit: "models.UnitAngle",
+        output_unit: "models.UnitAngle",
         value: float,
-    ) -> UnitAngleConversion:
-        """Convert an angle unit value to another angle unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitAngleConversion":
+        """Convert an angle unit value to another angle unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_angle_conversion import UnitAngleConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(UnitAngleConversion, input_unit, output_unit, value)
 
         url = "{}/unit/conversion/angle/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -13497,6 +17395,14 @@ class UnitAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_angle_unit_conversion",
+                    "unit",
+                    "/unit/conversion/angle/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -13507,18 +17413,32 @@ class UnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitAngleConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitAngleConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_area_unit_conversion(
         self,
-        input_unit: UnitArea,
-        output_unit: UnitArea,
+        input_unit: "models.UnitArea",
+        output_unit: "models.UnitArea",
         value: float,
-    ) -> UnitAreaConversion:
-        """Convert an area unit value to another area unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitAreaConversion":
+        """Convert an area unit value to another area unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_area_conversion import UnitAreaConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(UnitAreaConversion, input_unit, output_unit, value)
 
         url = "{}/unit/conversion/area/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -13535,6 +17455,14 @@ class UnitAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_area_unit_conversion",
+                    "unit",
+                    "/unit/conversion/area/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -13545,18 +17473,34 @@ class UnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitAreaConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitAreaConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_current_unit_conversion(
         self,
-        input_unit: UnitCurrent,
-        output_unit: UnitCurrent,
+        input_unit: "models.UnitCurrent",
+        output_unit: "models.UnitCurrent",
         value: float,
-    ) -> UnitCurrentConversion:
-        """Convert a current unit value to another current unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitCurrentConversion":
+        """Convert a current unit value to another current unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_current_conversion import UnitCurrentConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(
+                UnitCurrentConversion, input_unit, output_unit, value
+            )
 
         url = "{}/unit/conversion/current/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -13573,6 +17517,14 @@ class UnitAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_current_unit_conversion",
+                    "unit",
+                    "/unit/conversion/current/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -13583,18 +17535,34 @@ class UnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitCurrentConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitCurrentConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_energy_unit_conversion(
         self,
-        input_unit: UnitEnergy,
-        output_unit: UnitEnergy,
+        input_unit: "models.UnitEnergy",
+        output_unit: "models.UnitEnergy",
         value: float,
-    ) -> UnitEnergyConversion:
-        """Convert a energy unit value to another energy unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitEnergyConversion":
+        """Convert a energy unit value to another energy unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_energy_conversion import UnitEnergyConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(
+                UnitEnergyConversion, input_unit, output_unit, value
+            )
 
         url = "{}/unit/conversion/energy/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -13611,6 +17579,14 @@ class UnitAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_energy_unit_conversion",
+                    "unit",
+                    "/unit/conversion/energy/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -13621,18 +17597,32 @@ class UnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitEnergyConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitEnergyConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_force_unit_conversion(
         self,
-        input_unit: UnitForce,
-        output_unit: UnitForce,
+        input_unit: "models.UnitForce",
+        output_unit: "models.UnitForce",
         value: float,
-    ) -> UnitForceConversion:
-        """Convert a force unit value to another force unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitForceConversion":
+        """Convert a force unit value to another force unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_force_conversion import UnitForceConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(UnitForceConversion, input_unit, output_unit, value)
 
         url = "{}/unit/conversion/force/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -13649,6 +17639,14 @@ class UnitAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_force_unit_conversion",
+                    "unit",
+                    "/unit/conversion/force/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -13659,18 +17657,34 @@ class UnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitForceConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitForceConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_frequency_unit_conversion(
         self,
-        input_unit: UnitFrequency,
-        output_unit: UnitFrequency,
+        input_unit: "models.UnitFrequency",
+        output_unit: "models.UnitFrequency",
         value: float,
-    ) -> UnitFrequencyConversion:
-        """Convert a frequency unit value to another frequency unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitFrequencyConversion":
+        """Convert a frequency unit value to another frequency unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_frequency_conversion import UnitFrequencyConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(
+                UnitFrequencyConversion, input_unit, output_unit, value
+            )
 
         url = "{}/unit/conversion/frequency/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -13687,6 +17701,14 @@ class UnitAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_frequency_unit_conversion",
+                    "unit",
+                    "/unit/conversion/frequency/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -13697,18 +17719,34 @@ class UnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitFrequencyConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitFrequencyConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_length_unit_conversion(
         self,
-        input_unit: UnitLength,
-        output_unit: UnitLength,
+        input_unit: "models.UnitLength",
+        output_unit: "models.UnitLength",
         value: float,
-    ) -> UnitLengthConversion:
-        """Convert a length unit value to another length unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitLengthConversion":
+        """Convert a length unit value to another length unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_length_conversion import UnitLengthConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(
+                UnitLengthConversion, input_unit, output_unit, value
+            )
 
         url = "{}/unit/conversion/length/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -13725,6 +17763,14 @@ class UnitAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_length_unit_conversion",
+                    "unit",
+                    "/unit/conversion/length/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -13735,18 +17781,32 @@ class UnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitLengthConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitLengthConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_mass_unit_conversion(
         self,
-        input_unit: UnitMass,
-        output_unit: UnitMass,
+        input_unit: "models.UnitMass",
+        output_unit: "models.UnitMass",
         value: float,
-    ) -> UnitMassConversion:
-        """Convert a mass unit value to another mass unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitMassConversion":
+        """Convert a mass unit value to another mass unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_mass_conversion import UnitMassConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(UnitMassConversion, input_unit, output_unit, value)
 
         url = "{}/unit/conversion/mass/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -13763,6 +17823,14 @@ class UnitAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_mass_unit_conversion",
+                    "unit",
+                    "/unit/conversion/mass/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -13773,18 +17841,32 @@ class UnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitMassConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitMassConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_power_unit_conversion(
         self,
-        input_unit: UnitPower,
-        output_unit: UnitPower,
+        input_unit: "models.UnitPower",
+        output_unit: "models.UnitPower",
         value: float,
-    ) -> UnitPowerConversion:
-        """Convert a power unit value to another power unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitPowerConversion":
+        """Convert a power unit value to another power unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_power_conversion import UnitPowerConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(UnitPowerConversion, input_unit, output_unit, value)
 
         url = "{}/unit/conversion/power/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -13801,6 +17883,14 @@ class UnitAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_power_unit_conversion",
+                    "unit",
+                    "/unit/conversion/power/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -13811,18 +17901,34 @@ class UnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitPowerConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitPowerConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_pressure_unit_conversion(
         self,
-        input_unit: UnitPressure,
-        output_unit: UnitPressure,
+        input_unit: "models.UnitPressure",
+        output_unit: "models.UnitPressure",
         value: float,
-    ) -> UnitPressureConversion:
-        """Convert a pressure unit value to another pressure unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitPressureConversion":
+        """Convert a pressure unit value to another pressure unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_pressure_conversion import UnitPressureConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(
+                UnitPressureConversion, input_unit, output_unit, value
+            )
 
         url = "{}/unit/conversion/pressure/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -13839,6 +17945,14 @@ class UnitAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_pressure_unit_conversion",
+                    "unit",
+                    "/unit/conversion/pressure/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -13849,18 +17963,36 @@ class UnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitPressureConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitPressureConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_temperature_unit_conversion(
         self,
-        input_unit: UnitTemperature,
-        output_unit: UnitTemperature,
+        input_unit: "models.UnitTemperature",
+        output_unit: "models.UnitTemperature",
         value: float,
-    ) -> UnitTemperatureConversion:
-        """Convert a temperature unit value to another temperature unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitTemperatureConversion":
+        """Convert a temperature unit value to another temperature unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_temperature_conversion import (
+            UnitTemperatureConversion,
+        )
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(
+                UnitTemperatureConversion, input_unit, output_unit, value
+            )
 
         url = "{}/unit/conversion/temperature/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -13877,6 +18009,14 @@ class UnitAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_temperature_unit_conversion",
+                    "unit",
+                    "/unit/conversion/temperature/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -13887,18 +18027,34 @@ class UnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitTemperatureConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitTemperatureConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_torque_unit_conversion(
         self,
-        input_unit: UnitTorque,
-        output_unit: UnitTorque,
+        input_unit: "models.UnitTorque",
+        output_unit: "models.UnitTorque",
         value: float,
-    ) -> UnitTorqueConversion:
-        """Convert a torque unit value to another torque unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitTorqueConversion":
+        """Convert a torque unit value to another torque unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_torque_conversion import UnitTorqueConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(
+                UnitTorqueConversion, input_unit, output_unit, value
+            )
 
         url = "{}/unit/conversion/torque/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -13915,6 +18071,14 @@ class UnitAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_torque_unit_conversion",
+                    "unit",
+                    "/unit/conversion/torque/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -13925,18 +18089,34 @@ class UnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitTorqueConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitTorqueConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_volume_unit_conversion(
         self,
-        input_unit: UnitVolume,
-        output_unit: UnitVolume,
+        input_unit: "models.UnitVolume",
+        output_unit: "models.UnitVolume",
         value: float,
-    ) -> UnitVolumeConversion:
-        """Convert a volume unit value to another volume unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitVolumeConversion":
+        """Convert a volume unit value to another volume unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_volume_conversion import UnitVolumeConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(
+                UnitVolumeConversion, input_unit, output_unit, value
+            )
 
         url = "{}/unit/conversion/volume/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -13953,6 +18133,14 @@ class UnitAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_volume_unit_conversion",
+                    "unit",
+                    "/unit/conversion/volume/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -13963,10 +18151,13 @@ class UnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitVolumeConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitVolumeConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
 
 class AsyncUnitAPI:
@@ -13977,11 +18168,22 @@ class AsyncUnitAPI:
 
     async def get_angle_unit_conversion(
         self,
-        input_unit: UnitAngle,
-        output_unit: UnitAngle,
+        input_unit: "models.UnitAngle",
+        output_unit: "models.UnitAngle",
         value: float,
-    ) -> UnitAngleConversion:
-        """Convert an angle unit value to another angle unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitAngleConversion":
+        """Convert an angle unit value to another angle unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_angle_conversion import UnitAngleConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(UnitAngleConversion, input_unit, output_unit, value)
 
         url = "{}/unit/conversion/angle/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -13998,6 +18200,14 @@ class AsyncUnitAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_angle_unit_conversion",
+                    "unit",
+                    "/unit/conversion/angle/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -14008,18 +18218,32 @@ class AsyncUnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitAngleConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitAngleConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_area_unit_conversion(
         self,
-        input_unit: UnitArea,
-        output_unit: UnitArea,
+        input_unit: "models.UnitArea",
+        output_unit: "models.UnitArea",
         value: float,
-    ) -> UnitAreaConversion:
-        """Convert an area unit value to another area unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitAreaConversion":
+        """Convert an area unit value to another area unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_area_conversion import UnitAreaConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(UnitAreaConversion, input_unit, output_unit, value)
 
         url = "{}/unit/conversion/area/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -14036,6 +18260,14 @@ class AsyncUnitAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_area_unit_conversion",
+                    "unit",
+                    "/unit/conversion/area/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -14046,18 +18278,34 @@ class AsyncUnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitAreaConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitAreaConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_current_unit_conversion(
         self,
-        input_unit: UnitCurrent,
-        output_unit: UnitCurrent,
+        input_unit: "models.UnitCurrent",
+        output_unit: "models.UnitCurrent",
         value: float,
-    ) -> UnitCurrentConversion:
-        """Convert a current unit value to another current unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitCurrentConversion":
+        """Convert a current unit value to another current unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_current_conversion import UnitCurrentConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(
+                UnitCurrentConversion, input_unit, output_unit, value
+            )
 
         url = "{}/unit/conversion/current/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -14074,6 +18322,14 @@ class AsyncUnitAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_current_unit_conversion",
+                    "unit",
+                    "/unit/conversion/current/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -14084,18 +18340,34 @@ class AsyncUnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitCurrentConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitCurrentConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_energy_unit_conversion(
         self,
-        input_unit: UnitEnergy,
-        output_unit: UnitEnergy,
+        input_unit: "models.UnitEnergy",
+        output_unit: "models.UnitEnergy",
         value: float,
-    ) -> UnitEnergyConversion:
-        """Convert a energy unit value to another energy unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitEnergyConversion":
+        """Convert a energy unit value to another energy unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_energy_conversion import UnitEnergyConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(
+                UnitEnergyConversion, input_unit, output_unit, value
+            )
 
         url = "{}/unit/conversion/energy/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -14112,6 +18384,14 @@ class AsyncUnitAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_energy_unit_conversion",
+                    "unit",
+                    "/unit/conversion/energy/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -14122,18 +18402,32 @@ class AsyncUnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitEnergyConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitEnergyConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_force_unit_conversion(
         self,
-        input_unit: UnitForce,
-        output_unit: UnitForce,
+        input_unit: "models.UnitForce",
+        output_unit: "models.UnitForce",
         value: float,
-    ) -> UnitForceConversion:
-        """Convert a force unit value to another force unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitForceConversion":
+        """Convert a force unit value to another force unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_force_conversion import UnitForceConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(UnitForceConversion, input_unit, output_unit, value)
 
         url = "{}/unit/conversion/force/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -14150,6 +18444,14 @@ class AsyncUnitAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_force_unit_conversion",
+                    "unit",
+                    "/unit/conversion/force/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -14160,18 +18462,34 @@ class AsyncUnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitForceConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitForceConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_frequency_unit_conversion(
         self,
-        input_unit: UnitFrequency,
-        output_unit: UnitFrequency,
+        input_unit: "models.UnitFrequency",
+        output_unit: "models.UnitFrequency",
         value: float,
-    ) -> UnitFrequencyConversion:
-        """Convert a frequency unit value to another frequency unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitFrequencyConversion":
+        """Convert a frequency unit value to another frequency unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_frequency_conversion import UnitFrequencyConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(
+                UnitFrequencyConversion, input_unit, output_unit, value
+            )
 
         url = "{}/unit/conversion/frequency/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -14188,6 +18506,14 @@ class AsyncUnitAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_frequency_unit_conversion",
+                    "unit",
+                    "/unit/conversion/frequency/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -14198,18 +18524,34 @@ class AsyncUnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitFrequencyConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitFrequencyConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_length_unit_conversion(
         self,
-        input_unit: UnitLength,
-        output_unit: UnitLength,
+        input_unit: "models.UnitLength",
+        output_unit: "models.UnitLength",
         value: float,
-    ) -> UnitLengthConversion:
-        """Convert a length unit value to another length unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitLengthConversion":
+        """Convert a length unit value to another length unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_length_conversion import UnitLengthConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(
+                UnitLengthConversion, input_unit, output_unit, value
+            )
 
         url = "{}/unit/conversion/length/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -14226,6 +18568,14 @@ class AsyncUnitAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_length_unit_conversion",
+                    "unit",
+                    "/unit/conversion/length/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -14236,18 +18586,32 @@ class AsyncUnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitLengthConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitLengthConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_mass_unit_conversion(
         self,
-        input_unit: UnitMass,
-        output_unit: UnitMass,
+        input_unit: "models.UnitMass",
+        output_unit: "models.UnitMass",
         value: float,
-    ) -> UnitMassConversion:
-        """Convert a mass unit value to another mass unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitMassConversion":
+        """Convert a mass unit value to another mass unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_mass_conversion import UnitMassConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(UnitMassConversion, input_unit, output_unit, value)
 
         url = "{}/unit/conversion/mass/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -14264,6 +18628,14 @@ class AsyncUnitAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_mass_unit_conversion",
+                    "unit",
+                    "/unit/conversion/mass/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -14274,18 +18646,32 @@ class AsyncUnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitMassConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitMassConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_power_unit_conversion(
         self,
-        input_unit: UnitPower,
-        output_unit: UnitPower,
+        input_unit: "models.UnitPower",
+        output_unit: "models.UnitPower",
         value: float,
-    ) -> UnitPowerConversion:
-        """Convert a power unit value to another power unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitPowerConversion":
+        """Convert a power unit value to another power unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_power_conversion import UnitPowerConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(UnitPowerConversion, input_unit, output_unit, value)
 
         url = "{}/unit/conversion/power/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -14302,6 +18688,14 @@ class AsyncUnitAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_power_unit_conversion",
+                    "unit",
+                    "/unit/conversion/power/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -14312,18 +18706,34 @@ class AsyncUnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitPowerConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitPowerConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_pressure_unit_conversion(
         self,
-        input_unit: UnitPressure,
-        output_unit: UnitPressure,
+        input_unit: "models.UnitPressure",
+        output_unit: "models.UnitPressure",
         value: float,
-    ) -> UnitPressureConversion:
-        """Convert a pressure unit value to another pressure unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitPressureConversion":
+        """Convert a pressure unit value to another pressure unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_pressure_conversion import UnitPressureConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(
+                UnitPressureConversion, input_unit, output_unit, value
+            )
 
         url = "{}/unit/conversion/pressure/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -14340,6 +18750,14 @@ class AsyncUnitAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_pressure_unit_conversion",
+                    "unit",
+                    "/unit/conversion/pressure/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -14350,18 +18768,36 @@ class AsyncUnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitPressureConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitPressureConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_temperature_unit_conversion(
         self,
-        input_unit: UnitTemperature,
-        output_unit: UnitTemperature,
+        input_unit: "models.UnitTemperature",
+        output_unit: "models.UnitTemperature",
         value: float,
-    ) -> UnitTemperatureConversion:
-        """Convert a temperature unit value to another temperature unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitTemperatureConversion":
+        """Convert a temperature unit value to another temperature unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_temperature_conversion import (
+            UnitTemperatureConversion,
+        )
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(
+                UnitTemperatureConversion, input_unit, output_unit, value
+            )
 
         url = "{}/unit/conversion/temperature/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -14378,6 +18814,14 @@ class AsyncUnitAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_temperature_unit_conversion",
+                    "unit",
+                    "/unit/conversion/temperature/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -14388,18 +18832,34 @@ class AsyncUnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitTemperatureConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitTemperatureConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_torque_unit_conversion(
         self,
-        input_unit: UnitTorque,
-        output_unit: UnitTorque,
+        input_unit: "models.UnitTorque",
+        output_unit: "models.UnitTorque",
         value: float,
-    ) -> UnitTorqueConversion:
-        """Convert a torque unit value to another torque unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitTorqueConversion":
+        """Convert a torque unit value to another torque unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_torque_conversion import UnitTorqueConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(
+                UnitTorqueConversion, input_unit, output_unit, value
+            )
 
         url = "{}/unit/conversion/torque/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -14416,6 +18876,14 @@ class AsyncUnitAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_torque_unit_conversion",
+                    "unit",
+                    "/unit/conversion/torque/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -14426,18 +18894,34 @@ class AsyncUnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitTorqueConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitTorqueConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_volume_unit_conversion(
         self,
-        input_unit: UnitVolume,
-        output_unit: UnitVolume,
+        input_unit: "models.UnitVolume",
+        output_unit: "models.UnitVolume",
         value: float,
-    ) -> UnitVolumeConversion:
-        """Convert a volume unit value to another volume unit value. This is a nice endpoint to use for helper functions."""
+        *,
+        local: bool = False,
+    ) -> "models.UnitVolumeConversion":
+        """Convert a volume unit value to another volume unit value. This is a nice endpoint to use for helper functions.
+
+        Pass ``local=True`` to convert offline with :mod:`kittycad.units` instead of calling the API."""
+
+        from kittycad.models.unit_volume_conversion import UnitVolumeConversion
+
+        if local:
+            from kittycad.units import local_conversion
+
+            return local_conversion(
+                UnitVolumeConversion, input_unit, output_unit, value
+            )
 
         url = "{}/unit/conversion/volume/{input_unit}/{output_unit}".format(
             self.client.base_url, input_unit=input_unit, output_unit=output_unit
@@ -14454,6 +18938,14 @@ class AsyncUnitAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_volume_unit_conversion",
+                    "unit",
+                    "/unit/conversion/volume/{input_unit}/{output_unit}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -14464,10 +18956,13 @@ class AsyncUnitAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UnitVolumeConversion.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UnitVolumeConversion.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
 
 class UsersAPI:
@@ -14478,11 +18973,13 @@ class UsersAPI:
 
     def get_user_self(
         self,
-    ) -> UserResponse:
+    ) -> "models.UserResponse":
         """Get the user information for the authenticated user.
 
         Alternatively, you can also use the `/users/me` endpoint."""
 
+        from kittycad.models.user_response import UserResponse
+
         url = "{}/user".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -14490,6 +18987,10 @@ class UsersAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo("get_user_self", "users", "/user")
+            },
         )
 
         if not response.is_success:
@@ -14500,17 +19001,20 @@ class UsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UserResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UserResponse.model_validate_json(content, extra="ignore"),
+        )
 
     def update_user_self(
         self,
-        body: UpdateUser,
-    ) -> UserResponse:
+        body: "models.UpdateUser",
+    ) -> "models.UserResponse":
         """This endpoint requires authentication by any Zoo user. It updates information about the authenticated user."""
 
+        from kittycad.models.user_response import UserResponse
+
         url = "{}/user".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -14518,7 +19022,13 @@ class UsersAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_user_self", "users", "/user"
+                )
+            },
         )
 
         if not response.is_success:
@@ -14529,10 +19039,11 @@ class UsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UserResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UserResponse.model_validate_json(content, extra="ignore"),
+        )
 
     def delete_user_self(
         self,
@@ -14548,6 +19059,12 @@ class UsersAPI:
         response = _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_user_self", "users", "/user"
+                )
+            },
         )
 
         if not response.is_success:
@@ -14555,13 +19072,17 @@ class UsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def get_user_cad_user_info_form(
         self,
-    ) -> WebsiteCadUserInfoForm:
+    ) -> "models.WebsiteCadUserInfoForm":
         """Gets authenticated CAD user info form data for the current user."""
 
+        from kittycad.models.website_cad_user_info_form import WebsiteCadUserInfoForm
+
         url = "{}/user/cad-user-info".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -14569,6 +19090,12 @@ class UsersAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_user_cad_user_info_form", "users", "/user/cad-user-info"
+                )
+            },
         )
 
         if not response.is_success:
@@ -14579,17 +19106,24 @@ class UsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return WebsiteCadUserInfoForm.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: WebsiteCadUserInfoForm.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def report_user_client_error(
         self,
-        body: ClientErrorReport,
-    ) -> ClientErrorReportAccepted:
+        body: "models.ClientErrorReport",
+    ) -> "models.ClientErrorReportAccepted":
         """This endpoint requires authentication by any Zoo user. It accepts a structured client error payload and writes it to the server logs for triage."""
 
+        from kittycad.models.client_error_report_accepted import (
+            ClientErrorReportAccepted,
+        )
+
         url = "{}/user/client-errors".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -14597,7 +19131,13 @@ class UsersAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "report_user_client_error", "users", "/user/client-errors"
+                )
+            },
         )
 
         if not response.is_success:
@@ -14608,16 +19148,23 @@ class UsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ClientErrorReportAccepted.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ClientErrorReportAccepted.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def user_email_marketing_consent_get(
         self,
-    ) -> EmailMarketingConsentState:
+    ) -> "models.EmailMarketingConsentState":
         """Get email marketing consent state for the authenticated user."""
 
+        from kittycad.models.email_marketing_consent_state import (
+            EmailMarketingConsentState,
+        )
+
         url = "{}/user/email-marketing-consent".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -14625,6 +19172,14 @@ class UsersAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "user_email_marketing_consent_get",
+                    "users",
+                    "/user/email-marketing-consent",
+                )
+            },
         )
 
         if not response.is_success:
@@ -14635,10 +19190,13 @@ class UsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return EmailMarketingConsentState.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: EmailMarketingConsentState.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def user_email_marketing_consent_decline_post(
         self,
@@ -14652,6 +19210,14 @@ class UsersAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "user_email_marketing_consent_decline_post",
+                    "users",
+                    "/user/email-marketing-consent/decline",
+                )
+            },
         )
 
         if not response.is_success:
@@ -14659,7 +19225,9 @@ class UsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def user_email_marketing_consent_request_post(
         self,
@@ -14673,6 +19241,14 @@ class UsersAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "user_email_marketing_consent_request_post",
+                    "users",
+                    "/user/email-marketing-consent/request",
+                )
+            },
         )
 
         if not response.is_success:
@@ -14680,7 +19256,9 @@ class UsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def user_email_marketing_consent_seen_post(
         self,
@@ -14694,6 +19272,14 @@ class UsersAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "user_email_marketing_consent_seen_post",
+                    "users",
+                    "/user/email-marketing-consent/seen",
+                )
+            },
         )
 
         if not response.is_success:
@@ -14701,15 +19287,19 @@ class UsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def get_user_self_extended(
         self,
-    ) -> ExtendedUser:
+    ) -> "models.ExtendedUser":
         """Get the user information for the authenticated user.
 
         Alternatively, you can also use the `/users-extended/me` endpoint."""
 
+        from kittycad.models.extended_user import ExtendedUser
+
         url = "{}/user/extended".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -14717,6 +19307,12 @@ class UsersAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_user_self_extended", "users", "/user/extended"
+                )
+            },
         )
 
         if not response.is_success:
@@ -14727,16 +19323,19 @@ class UsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ExtendedUser.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ExtendedUser.model_validate_json(content, extra="ignore"),
+        )
 
     def user_features_get(
         self,
-    ) -> UserFeatureList:
+    ) -> "models.UserFeatureList":
         """Returns only features that are marked as safe for exposure to clients and currently resolved to `true` for the requesting user (including org overrides)."""
 
+        from kittycad.models.user_feature_list import UserFeatureList
+
         url = "{}/user/features".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -14744,6 +19343,12 @@ class UsersAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "user_features_get", "users", "/user/features"
+                )
+            },
         )
 
         if not response.is_success:
@@ -14754,18 +19359,23 @@ class UsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UserFeatureList.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UserFeatureList.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_oauth2_providers_for_user(
         self,
-    ) -> List[AccountProvider]:
+    ) -> "List[models.AccountProvider]":
         """If this returns an empty array, then the user has not connected any OAuth2 providers and uses raw email authentication.
 
         This endpoint requires authentication by any Zoo user. It gets the providers for the authenticated user."""
 
+        from kittycad.models.account_provider import AccountProvider
+
         url = "{}/user/oauth2/providers".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -14773,6 +19383,12 @@ class UsersAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_oauth2_providers_for_user", "users", "/user/oauth2/providers"
+                )
+            },
         )
 
         if not response.is_success:
@@ -14783,20 +19399,22 @@ class UsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[AccountProvider]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[AccountProvider]", lambda: List[AccountProvider]
+            ).validate_json(content, extra="ignore"),
         )
 
     def get_user_privacy_settings(
         self,
-    ) -> PrivacySettings:
+    ) -> "models.PrivacySettings":
         """This endpoint requires authentication by any Zoo user. It gets the privacy settings for the user."""
 
+        from kittycad.models.privacy_settings import PrivacySettings
+
         url = "{}/user/privacy".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -14804,6 +19422,12 @@ class UsersAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_user_privacy_settings", "users", "/user/privacy"
+                )
+            },
         )
 
         if not response.is_success:
@@ -14814,17 +19438,22 @@ class UsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return PrivacySettings.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: PrivacySettings.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def update_user_privacy_settings(
         self,
-        body: PrivacySettings,
-    ) -> PrivacySettings:
+        body: "models.PrivacySettings",
+    ) -> "models.PrivacySettings":
         """This endpoint requires authentication by any Zoo user. It updates the privacy settings for the user."""
 
+        from kittycad.models.privacy_settings import PrivacySettings
+
         url = "{}/user/privacy".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -14832,7 +19461,13 @@ class UsersAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_user_privacy_settings", "users", "/user/privacy"
+                )
+            },
         )
 
         if not response.is_success:
@@ -14843,17 +19478,22 @@ class UsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return PrivacySettings.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: PrivacySettings.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_session_for_user(
         self,
-        token: SessionUuid,
-    ) -> Session:
+        token: "models.SessionUuid",
+    ) -> "models.Session":
         """This endpoint requires authentication by any Zoo user. It returns details of the requested API token for the user."""
 
+        from kittycad.models.session import Session
+
         url = "{}/user/session/{token}".format(self.client.base_url, token=token)
 
         _client = self.client.get_http_client()
@@ -14861,6 +19501,12 @@ class UsersAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_session_for_user", "users", "/user/session/{token}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -14871,17 +19517,18 @@ class UsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Session.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: Session.model_validate_json(content, extra="ignore"),
+        )
 
     def get_user_shortlinks(
         self,
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "SyncPageIterator":
         """This endpoint requires authentication by any Zoo user. It gets the shortlinks for the user.
 
@@ -14917,10 +19564,17 @@ class UsersAPI:
         return SyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo("get_user_shortlinks", "users", "/user/shortlinks"),
         )
 
-    def _fetch_page_get_user_shortlinks(self, **kwargs) -> ShortlinkResultsPage:
+    def _fetch_page_get_user_shortlinks(
+        self, **kwargs
+    ) -> "models.ShortlinkResultsPage":
         """Internal method to fetch a single page."""
+
+        from kittycad.models.shortlink_results_page import ShortlinkResultsPage
+
         # Build URL with path parameters
         url = "{}/user/shortlinks".format(self.client.base_url)
 
@@ -14950,6 +19604,12 @@ class UsersAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_user_shortlinks", "users", "/user/shortlinks"
+                )
+            },
         )
 
         if not response.is_success:
@@ -14960,16 +19620,24 @@ class UsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return ShortlinkResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: ShortlinkResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def create_user_shortlink(
         self,
-        body: CreateShortlinkRequest,
-    ) -> CreateShortlinkResponse:
+        body: "models.CreateShortlinkRequest",
+    ) -> "models.CreateShortlinkResponse":
         """This endpoint requires authentication by any Zoo user. It creates a shortlink for the user."""
 
+        from kittycad.models.create_shortlink_response import CreateShortlinkResponse
+
         url = "{}/user/shortlinks".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -14977,7 +19645,13 @@ class UsersAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_user_shortlink", "users", "/user/shortlinks"
+                )
+            },
         )
 
         if not response.is_success:
@@ -14988,15 +19662,18 @@ class UsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CreateShortlinkResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CreateShortlinkResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def update_user_shortlink(
         self,
         key: str,
-        body: UpdateShortlinkRequest,
+        body: "models.UpdateShortlinkRequest",
     ):
         """This endpoint requires authentication by any Zoo user. It updates a shortlink for the user.
 
@@ -15009,7 +19686,13 @@ class UsersAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_user_shortlink", "users", "/user/shortlinks/{key}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15017,7 +19700,9 @@ class UsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def delete_user_shortlink(
         self,
@@ -15032,6 +19717,12 @@ class UsersAPI:
         response = _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_user_shortlink", "users", "/user/shortlinks/{key}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15039,16 +19730,20 @@ class UsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def get_user_extended(
         self,
-        id: UserIdentifier,
-    ) -> ExtendedUser:
+        id: "models.UserIdentifier",
+    ) -> "models.ExtendedUser":
         """To get information about yourself, use `/users-extended/me` as the endpoint. By doing so you will get the user information for the authenticated user.
 
         Alternatively, to get information about the authenticated user, use `/user/extended` endpoint."""
 
+        from kittycad.models.extended_user import ExtendedUser
+
         url = "{}/users-extended/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -15056,6 +19751,12 @@ class UsersAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_user_extended", "users", "/users-extended/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15066,19 +19767,22 @@ class UsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ExtendedUser.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ExtendedUser.model_validate_json(content, extra="ignore"),
+        )
 
     def get_user(
         self,
-        id: UserIdentifier,
-    ) -> UserResponse:
+        id: "models.UserIdentifier",
+    ) -> "models.UserResponse":
         """To get information about yourself, use `/users/me` as the endpoint. By doing so you will get the user information for the authenticated user.
 
         Alternatively, to get information about the authenticated user, use `/user` endpoint."""
 
+        from kittycad.models.user_response import UserResponse
+
         url = "{}/users/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -15086,6 +19790,10 @@ class UsersAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo("get_user", "users", "/users/{id}")
+            },
         )
 
         if not response.is_success:
@@ -15096,17 +19804,20 @@ class UsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UserResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UserResponse.model_validate_json(content, extra="ignore"),
+        )
 
     def user_admin_details_get(
         self,
-        id: UserIdentifier,
-    ) -> UserAdminDetails:
+        id: "models.UserIdentifier",
+    ) -> "models.UserAdminDetails":
         """Zoo admins can retrieve extended information about any user, while non-admins receive a 404 to avoid leaking the existence of the resource."""
 
+        from kittycad.models.user_admin_details import UserAdminDetails
+
         url = "{}/users/{id}/admin/details".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -15114,6 +19825,12 @@ class UsersAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "user_admin_details_get", "users", "/users/{id}/admin/details"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15124,18 +19841,23 @@ class UsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UserAdminDetails.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UserAdminDetails.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def update_subscription_for_user(
         self,
-        id: UserIdentifier,
-        body: ZooProductSubscriptionsUserRequest,
-    ) -> ZooProductSubscriptions:
+        id: "models.UserIdentifier",
+        body: "models.ZooProductSubscriptionsUserRequest",
+    ) -> "models.ZooProductSubscriptions":
         """You must be a Zoo admin to perform this request."""
 
+        from kittycad.models.zoo_product_subscriptions import ZooProductSubscriptions
+
         url = "{}/users/{id}/payment/subscriptions".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -15143,7 +19865,15 @@ class UsersAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_subscription_for_user",
+                    "users",
+                    "/users/{id}/payment/subscriptions",
+                )
+            },
         )
 
         if not response.is_success:
@@ -15154,14 +19884,17 @@ class UsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ZooProductSubscriptions.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ZooProductSubscriptions.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def put_public_email_marketing_consent_request(
         self,
-        body: PublicEmailMarketingConsentRequest,
+        body: "models.PublicEmailMarketingConsentRequest",
     ):
         """Requests public email marketing consent for an email address."""
 
@@ -15172,7 +19905,15 @@ class UsersAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "put_public_email_marketing_consent_request",
+                    "users",
+                    "/website/email-marketing-consent/request",
+                )
+            },
         )
 
         if not response.is_success:
@@ -15180,12 +19921,14 @@ class UsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def put_public_mailing_list_subscribe(
         self,
         slug: str,
-        body: PublicMailingListMembershipRequest,
+        body: "models.PublicMailingListMembershipRequest",
     ):
         """Publicly subscribe an email address to a mailing list by slug."""
 
@@ -15198,7 +19941,15 @@ class UsersAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "put_public_mailing_list_subscribe",
+                    "users",
+                    "/website/email-marketing-lists/{slug}/subscribe",
+                )
+            },
         )
 
         if not response.is_success:
@@ -15206,12 +19957,14 @@ class UsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def put_public_mailing_list_unsubscribe(
         self,
         slug: str,
-        body: PublicMailingListMembershipRequest,
+        body: "models.PublicMailingListMembershipRequest",
     ):
         """Publicly remove an email address from a mailing list by slug."""
 
@@ -15224,7 +19977,15 @@ class UsersAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "put_public_mailing_list_unsubscribe",
+                    "users",
+                    "/website/email-marketing-lists/{slug}/unsubscribe",
+                )
+            },
         )
 
         if not response.is_success:
@@ -15232,11 +19993,13 @@ class UsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def put_user_cad_user_info_form(
         self,
-        body: WebsiteCadUserInfoForm,
+        body: "models.WebsiteCadUserInfoForm",
     ):
         """Stores authenticated CAD user info form data for the current user."""
 
@@ -15247,7 +20010,15 @@ class UsersAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "put_user_cad_user_info_form",
+                    "users",
+                    "/website/forms/cad-user-info",
+                )
+            },
         )
 
         if not response.is_success:
@@ -15255,11 +20026,13 @@ class UsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def put_public_sales_form(
         self,
-        body: WebsiteSalesForm,
+        body: "models.WebsiteSalesForm",
     ):
         """This endpoint accepts optional authentication."""
 
@@ -15270,7 +20043,13 @@ class UsersAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "put_public_sales_form", "users", "/website/forms/sales"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15278,11 +20057,13 @@ class UsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     def put_public_support_form(
         self,
-        body: WebsiteSupportForm,
+        body: "models.WebsiteSupportForm",
     ):
         """This endpoint accepts optional authentication."""
 
@@ -15293,7 +20074,13 @@ class UsersAPI:
         response = _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "put_public_support_form", "users", "/website/forms/support"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15301,7 +20088,9 @@ class UsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
 
 class AsyncUsersAPI:
@@ -15312,11 +20101,13 @@ class AsyncUsersAPI:
 
     async def get_user_self(
         self,
-    ) -> UserResponse:
+    ) -> "models.UserResponse":
         """Get the user information for the authenticated user.
 
         Alternatively, you can also use the `/users/me` endpoint."""
 
+        from kittycad.models.user_response import UserResponse
+
         url = "{}/user".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -15324,6 +20115,10 @@ class AsyncUsersAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo("get_user_self", "users", "/user")
+            },
         )
 
         if not response.is_success:
@@ -15334,17 +20129,20 @@ class AsyncUsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UserResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UserResponse.model_validate_json(content, extra="ignore"),
+        )
 
     async def update_user_self(
         self,
-        body: UpdateUser,
-    ) -> UserResponse:
+        body: "models.UpdateUser",
+    ) -> "models.UserResponse":
         """This endpoint requires authentication by any Zoo user. It updates information about the authenticated user."""
 
+        from kittycad.models.user_response import UserResponse
+
         url = "{}/user".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -15352,7 +20150,13 @@ class AsyncUsersAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_user_self", "users", "/user"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15363,10 +20167,11 @@ class AsyncUsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UserResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UserResponse.model_validate_json(content, extra="ignore"),
+        )
 
     async def delete_user_self(
         self,
@@ -15382,6 +20187,12 @@ class AsyncUsersAPI:
         response = await _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_user_self", "users", "/user"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15389,13 +20200,17 @@ class AsyncUsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def get_user_cad_user_info_form(
         self,
-    ) -> WebsiteCadUserInfoForm:
+    ) -> "models.WebsiteCadUserInfoForm":
         """Gets authenticated CAD user info form data for the current user."""
 
+        from kittycad.models.website_cad_user_info_form import WebsiteCadUserInfoForm
+
         url = "{}/user/cad-user-info".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -15403,6 +20218,12 @@ class AsyncUsersAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_user_cad_user_info_form", "users", "/user/cad-user-info"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15413,17 +20234,24 @@ class AsyncUsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return WebsiteCadUserInfoForm.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: WebsiteCadUserInfoForm.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def report_user_client_error(
         self,
-        body: ClientErrorReport,
-    ) -> ClientErrorReportAccepted:
+        body: "models.ClientErrorReport",
+    ) -> "models.ClientErrorReportAccepted":
         """This endpoint requires authentication by any Zoo user. It accepts a structured client error payload and writes it to the server logs for triage."""
 
+        from kittycad.models.client_error_report_accepted import (
+            ClientErrorReportAccepted,
+        )
+
         url = "{}/user/client-errors".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -15431,7 +20259,13 @@ class AsyncUsersAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "report_user_client_error", "users", "/user/client-errors"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15442,16 +20276,23 @@ class AsyncUsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ClientErrorReportAccepted.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ClientErrorReportAccepted.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def user_email_marketing_consent_get(
         self,
-    ) -> EmailMarketingConsentState:
+    ) -> "models.EmailMarketingConsentState":
         """Get email marketing consent state for the authenticated user."""
 
+        from kittycad.models.email_marketing_consent_state import (
+            EmailMarketingConsentState,
+        )
+
         url = "{}/user/email-marketing-consent".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -15459,6 +20300,14 @@ class AsyncUsersAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "user_email_marketing_consent_get",
+                    "users",
+                    "/user/email-marketing-consent",
+                )
+            },
         )
 
         if not response.is_success:
@@ -15469,10 +20318,13 @@ class AsyncUsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return EmailMarketingConsentState.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: EmailMarketingConsentState.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def user_email_marketing_consent_decline_post(
         self,
@@ -15486,6 +20338,14 @@ class AsyncUsersAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "user_email_marketing_consent_decline_post",
+                    "users",
+                    "/user/email-marketing-consent/decline",
+                )
+            },
         )
 
         if not response.is_success:
@@ -15493,7 +20353,9 @@ class AsyncUsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def user_email_marketing_consent_request_post(
         self,
@@ -15507,6 +20369,14 @@ class AsyncUsersAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "user_email_marketing_consent_request_post",
+                    "users",
+                    "/user/email-marketing-consent/request",
+                )
+            },
         )
 
         if not response.is_success:
@@ -15514,7 +20384,9 @@ class AsyncUsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def user_email_marketing_consent_seen_post(
         self,
@@ -15528,6 +20400,14 @@ class AsyncUsersAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "user_email_marketing_consent_seen_post",
+                    "users",
+                    "/user/email-marketing-consent/seen",
+                )
+            },
         )
 
         if not response.is_success:
@@ -15535,15 +20415,19 @@ class AsyncUsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def get_user_self_extended(
         self,
-    ) -> ExtendedUser:
+    ) -> "models.ExtendedUser":
         """Get the user information for the authenticated user.
 
         Alternatively, you can also use the `/users-extended/me` endpoint."""
 
+        from kittycad.models.extended_user import ExtendedUser
+
         url = "{}/user/extended".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -15551,6 +20435,12 @@ class AsyncUsersAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_user_self_extended", "users", "/user/extended"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15561,16 +20451,19 @@ class AsyncUsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ExtendedUser.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ExtendedUser.model_validate_json(content, extra="ignore"),
+        )
 
     async def user_features_get(
         self,
-    ) -> UserFeatureList:
+    ) -> "models.UserFeatureList":
         """Returns only features that are marked as safe for exposure to clients and currently resolved to `true` for the requesting user (including org overrides)."""
 
+        from kittycad.models.user_feature_list import UserFeatureList
+
         url = "{}/user/features".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -15578,6 +20471,12 @@ class AsyncUsersAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "user_features_get", "users", "/user/features"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15588,18 +20487,23 @@ class AsyncUsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UserFeatureList.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UserFeatureList.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_oauth2_providers_for_user(
         self,
-    ) -> List[AccountProvider]:
+    ) -> "List[models.AccountProvider]":
         """If this returns an empty array, then the user has not connected any OAuth2 providers and uses raw email authentication.
 
         This endpoint requires authentication by any Zoo user. It gets the providers for the authenticated user."""
 
+        from kittycad.models.account_provider import AccountProvider
+
         url = "{}/user/oauth2/providers".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -15607,6 +20511,12 @@ class AsyncUsersAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_oauth2_providers_for_user", "users", "/user/oauth2/providers"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15617,20 +20527,22 @@ class AsyncUsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[AccountProvider]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[AccountProvider]", lambda: List[AccountProvider]
+            ).validate_json(content, extra="ignore"),
         )
 
     async def get_user_privacy_settings(
         self,
-    ) -> PrivacySettings:
+    ) -> "models.PrivacySettings":
         """This endpoint requires authentication by any Zoo user. It gets the privacy settings for the user."""
 
+        from kittycad.models.privacy_settings import PrivacySettings
+
         url = "{}/user/privacy".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -15638,6 +20550,12 @@ class AsyncUsersAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_user_privacy_settings", "users", "/user/privacy"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15648,17 +20566,22 @@ class AsyncUsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return PrivacySettings.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: PrivacySettings.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def update_user_privacy_settings(
         self,
-        body: PrivacySettings,
-    ) -> PrivacySettings:
+        body: "models.PrivacySettings",
+    ) -> "models.PrivacySettings":
         """This endpoint requires authentication by any Zoo user. It updates the privacy settings for the user."""
 
+        from kittycad.models.privacy_settings import PrivacySettings
+
         url = "{}/user/privacy".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -15666,7 +20589,13 @@ class AsyncUsersAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_user_privacy_settings", "users", "/user/privacy"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15677,17 +20606,22 @@ class AsyncUsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return PrivacySettings.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: PrivacySettings.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_session_for_user(
         self,
-        token: SessionUuid,
-    ) -> Session:
+        token: "models.SessionUuid",
+    ) -> "models.Session":
         """This endpoint requires authentication by any Zoo user. It returns details of the requested API token for the user."""
 
+        from kittycad.models.session import Session
+
         url = "{}/user/session/{token}".format(self.client.base_url, token=token)
 
         _client = self.client.get_http_client()
@@ -15695,6 +20629,12 @@ class AsyncUsersAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_session_for_user", "users", "/user/session/{token}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15705,17 +20645,18 @@ class AsyncUsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return Session.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: Session.model_validate_json(content, extra="ignore"),
+        )
 
     def get_user_shortlinks(
         self,
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "AsyncPageIterator":
         """This endpoint requires authentication by any Zoo user. It gets the shortlinks for the user.
 
@@ -15751,10 +20692,17 @@ class AsyncUsersAPI:
         return AsyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo("get_user_shortlinks", "users", "/user/shortlinks"),
         )
 
-    async def _fetch_page_get_user_shortlinks(self, **kwargs) -> ShortlinkResultsPage:
+    async def _fetch_page_get_user_shortlinks(
+        self, **kwargs
+    ) -> "models.ShortlinkResultsPage":
         """Internal async method to fetch a single page."""
+
+        from kittycad.models.shortlink_results_page import ShortlinkResultsPage
+
         # Build URL with path parameters
         url = "{}/user/shortlinks".format(self.client.base_url)
 
@@ -15784,6 +20732,12 @@ class AsyncUsersAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_user_shortlinks", "users", "/user/shortlinks"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15794,16 +20748,24 @@ class AsyncUsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return ShortlinkResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: ShortlinkResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def create_user_shortlink(
         self,
-        body: CreateShortlinkRequest,
-    ) -> CreateShortlinkResponse:
+        body: "models.CreateShortlinkRequest",
+    ) -> "models.CreateShortlinkResponse":
         """This endpoint requires authentication by any Zoo user. It creates a shortlink for the user."""
 
+        from kittycad.models.create_shortlink_response import CreateShortlinkResponse
+
         url = "{}/user/shortlinks".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -15811,7 +20773,13 @@ class AsyncUsersAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_user_shortlink", "users", "/user/shortlinks"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15822,15 +20790,18 @@ class AsyncUsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return CreateShortlinkResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: CreateShortlinkResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def update_user_shortlink(
         self,
         key: str,
-        body: UpdateShortlinkRequest,
+        body: "models.UpdateShortlinkRequest",
     ):
         """This endpoint requires authentication by any Zoo user. It updates a shortlink for the user.
 
@@ -15843,7 +20814,13 @@ class AsyncUsersAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_user_shortlink", "users", "/user/shortlinks/{key}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15851,7 +20828,9 @@ class AsyncUsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def delete_user_shortlink(
         self,
@@ -15866,6 +20845,12 @@ class AsyncUsersAPI:
         response = await _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_user_shortlink", "users", "/user/shortlinks/{key}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15873,16 +20858,20 @@ class AsyncUsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def get_user_extended(
         self,
-        id: UserIdentifier,
-    ) -> ExtendedUser:
+        id: "models.UserIdentifier",
+    ) -> "models.ExtendedUser":
         """To get information about yourself, use `/users-extended/me` as the endpoint. By doing so you will get the user information for the authenticated user.
 
         Alternatively, to get information about the authenticated user, use `/user/extended` endpoint."""
 
+        from kittycad.models.extended_user import ExtendedUser
+
         url = "{}/users-extended/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -15890,6 +20879,12 @@ class AsyncUsersAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_user_extended", "users", "/users-extended/{id}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15900,19 +20895,22 @@ class AsyncUsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ExtendedUser.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ExtendedUser.model_validate_json(content, extra="ignore"),
+        )
 
     async def get_user(
         self,
-        id: UserIdentifier,
-    ) -> UserResponse:
+        id: "models.UserIdentifier",
+    ) -> "models.UserResponse":
         """To get information about yourself, use `/users/me` as the endpoint. By doing so you will get the user information for the authenticated user.
 
         Alternatively, to get information about the authenticated user, use `/user` endpoint."""
 
+        from kittycad.models.user_response import UserResponse
+
         url = "{}/users/{id}".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -15920,6 +20918,10 @@ class AsyncUsersAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo("get_user", "users", "/users/{id}")
+            },
         )
 
         if not response.is_success:
@@ -15930,17 +20932,20 @@ class AsyncUsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UserResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UserResponse.model_validate_json(content, extra="ignore"),
+        )
 
     async def user_admin_details_get(
         self,
-        id: UserIdentifier,
-    ) -> UserAdminDetails:
+        id: "models.UserIdentifier",
+    ) -> "models.UserAdminDetails":
         """Zoo admins can retrieve extended information about any user, while non-admins receive a 404 to avoid leaking the existence of the resource."""
 
+        from kittycad.models.user_admin_details import UserAdminDetails
+
         url = "{}/users/{id}/admin/details".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -15948,6 +20953,12 @@ class AsyncUsersAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "user_admin_details_get", "users", "/users/{id}/admin/details"
+                )
+            },
         )
 
         if not response.is_success:
@@ -15958,18 +20969,23 @@ class AsyncUsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return UserAdminDetails.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: UserAdminDetails.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def update_subscription_for_user(
         self,
-        id: UserIdentifier,
-        body: ZooProductSubscriptionsUserRequest,
-    ) -> ZooProductSubscriptions:
+        id: "models.UserIdentifier",
+        body: "models.ZooProductSubscriptionsUserRequest",
+    ) -> "models.ZooProductSubscriptions":
         """You must be a Zoo admin to perform this request."""
 
+        from kittycad.models.zoo_product_subscriptions import ZooProductSubscriptions
+
         url = "{}/users/{id}/payment/subscriptions".format(self.client.base_url, id=id)
 
         _client = self.client.get_http_client()
@@ -15977,7 +20993,15 @@ class AsyncUsersAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "update_subscription_for_user",
+                    "users",
+                    "/users/{id}/payment/subscriptions",
+                )
+            },
         )
 
         if not response.is_success:
@@ -15988,14 +21012,17 @@ class AsyncUsersAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ZooProductSubscriptions.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ZooProductSubscriptions.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def put_public_email_marketing_consent_request(
         self,
-        body: PublicEmailMarketingConsentRequest,
+        body: "models.PublicEmailMarketingConsentRequest",
     ):
         """Requests public email marketing consent for an email address."""
 
@@ -16006,7 +21033,15 @@ class AsyncUsersAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "put_public_email_marketing_consent_request",
+                    "users",
+                    "/website/email-marketing-consent/request",
+                )
+            },
         )
 
         if not response.is_success:
@@ -16014,12 +21049,14 @@ class AsyncUsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def put_public_mailing_list_subscribe(
         self,
         slug: str,
-        body: PublicMailingListMembershipRequest,
+        body: "models.PublicMailingListMembershipRequest",
     ):
         """Publicly subscribe an email address to a mailing list by slug."""
 
@@ -16032,7 +21069,15 @@ class AsyncUsersAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "put_public_mailing_list_subscribe",
+                    "users",
+                    "/website/email-marketing-lists/{slug}/subscribe",
+                )
+            },
         )
 
         if not response.is_success:
@@ -16040,12 +21085,14 @@ class AsyncUsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def put_public_mailing_list_unsubscribe(
         self,
         slug: str,
-        body: PublicMailingListMembershipRequest,
+        body: "models.PublicMailingListMembershipRequest",
     ):
         """Publicly remove an email address from a mailing list by slug."""
 
@@ -16058,7 +21105,15 @@ class AsyncUsersAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "put_public_mailing_list_unsubscribe",
+                    "users",
+                    "/website/email-marketing-lists/{slug}/unsubscribe",
+                )
+            },
         )
 
         if not response.is_success:
@@ -16066,11 +21121,13 @@ class AsyncUsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def put_user_cad_user_info_form(
         self,
-        body: WebsiteCadUserInfoForm,
+        body: "models.WebsiteCadUserInfoForm",
     ):
         """Stores authenticated CAD user info form data for the current user."""
 
@@ -16081,7 +21138,15 @@ class AsyncUsersAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "put_user_cad_user_info_form",
+                    "users",
+                    "/website/forms/cad-user-info",
+                )
+            },
         )
 
         if not response.is_success:
@@ -16089,11 +21154,13 @@ class AsyncUsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def put_public_sales_form(
         self,
-        body: WebsiteSalesForm,
+        body: "models.WebsiteSalesForm",
     ):
         """This endpoint accepts optional authentication."""
 
@@ -16104,7 +21171,13 @@ class AsyncUsersAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "put_public_sales_form", "users", "/website/forms/sales"
+                )
+            },
         )
 
         if not response.is_success:
@@ -16112,11 +21185,13 @@ class AsyncUsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
     async def put_public_support_form(
         self,
-        body: WebsiteSupportForm,
+        body: "models.WebsiteSupportForm",
     ):
         """This endpoint accepts optional authentication."""
 
@@ -16127,7 +21202,13 @@ class AsyncUsersAPI:
         response = await _client.put(
             url=url,
             headers=self.client.get_headers(),
-            content=serialize_request_body(body),
+            timeout=self.client.get_timeout(),
+            content=encode_request_body(body, self.client.json_codec),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "put_public_support_form", "users", "/website/forms/support"
+                )
+            },
         )
 
         if not response.is_success:
@@ -16135,7 +21216,9 @@ class AsyncUsersAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
 
 class ApiTokensAPI:
@@ -16149,7 +21232,7 @@ class ApiTokensAPI:
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "SyncPageIterator":
         """This endpoint requires authentication by any Zoo user. It returns the API tokens for the authenticated user.
 
@@ -16187,10 +21270,19 @@ class ApiTokensAPI:
         return SyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_api_tokens_for_user", "api_tokens", "/user/api-tokens"
+            ),
         )
 
-    def _fetch_page_list_api_tokens_for_user(self, **kwargs) -> ApiTokenResultsPage:
+    def _fetch_page_list_api_tokens_for_user(
+        self, **kwargs
+    ) -> "models.ApiTokenResultsPage":
         """Internal method to fetch a single page."""
+
+        from kittycad.models.api_token_results_page import ApiTokenResultsPage
+
         # Build URL with path parameters
         url = "{}/user/api-tokens".format(self.client.base_url)
 
@@ -16220,6 +21312,12 @@ class ApiTokensAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_api_tokens_for_user", "api_tokens", "/user/api-tokens"
+                )
+            },
         )
 
         if not response.is_success:
@@ -16230,17 +21328,25 @@ class ApiTokensAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return ApiTokenResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: ApiTokenResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def create_api_token_for_user(
         self,
         *,
         label: Optional[str] = None,
-    ) -> ApiTokenWithFullToken:
+    ) -> "models.ApiTokenWithFullToken":
         """This endpoint requires authentication by any Zoo user. It creates a new API token for the authenticated user."""
 
+        from kittycad.models.api_token_with_full_token import ApiTokenWithFullToken
+
         url = "{}/user/api-tokens".format(self.client.base_url)
 
         if label is not None:
@@ -16254,6 +21360,12 @@ class ApiTokensAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_api_token_for_user", "api_tokens", "/user/api-tokens"
+                )
+            },
         )
 
         if not response.is_success:
@@ -16264,17 +21376,22 @@ class ApiTokensAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ApiTokenWithFullToken.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ApiTokenWithFullToken.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_api_token_for_user(
         self,
-        token: ApiTokenUuid,
-    ) -> ApiToken:
+        token: "models.ApiTokenUuid",
+    ) -> "models.ApiToken":
         """This endpoint requires authentication by any Zoo user. It returns details of the requested API token for the user."""
 
+        from kittycad.models.api_token import ApiToken
+
         url = "{}/user/api-tokens/{token}".format(self.client.base_url, token=token)
 
         _client = self.client.get_http_client()
@@ -16282,6 +21399,12 @@ class ApiTokensAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_api_token_for_user", "api_tokens", "/user/api-tokens/{token}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -16292,10 +21415,11 @@ class ApiTokensAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ApiToken.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ApiToken.model_validate_json(content, extra="ignore"),
+        )
 
     def delete_api_token_for_user(
         self,
@@ -16314,6 +21438,14 @@ class ApiTokensAPI:
         response = _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_api_token_for_user",
+                    "api_tokens",
+                    "/user/api-tokens/{token}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -16321,7 +21453,9 @@ class ApiTokensAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
 
 class AsyncApiTokensAPI:
@@ -16335,7 +21469,7 @@ class AsyncApiTokensAPI:
         *,
         limit: Optional[int] = None,
         page_token: Optional[str] = None,
-        sort_by: Optional[CreatedAtSortMode] = None,
+        sort_by: "Optional[models.CreatedAtSortMode]" = None,
     ) -> "AsyncPageIterator":
         """This endpoint requires authentication by any Zoo user. It returns the API tokens for the authenticated user.
 
@@ -16373,12 +21507,19 @@ class AsyncApiTokensAPI:
         return AsyncPageIterator(
             page_fetcher=fetch_page,
             initial_kwargs=kwargs,
+            event_hooks=self.client.event_hooks,
+            operation=OperationInfo(
+                "list_api_tokens_for_user", "api_tokens", "/user/api-tokens"
+            ),
         )
 
     async def _fetch_page_list_api_tokens_for_user(
         self, **kwargs
-    ) -> ApiTokenResultsPage:
+    ) -> "models.ApiTokenResultsPage":
         """Internal async method to fetch a single page."""
+
+        from kittycad.models.api_token_results_page import ApiTokenResultsPage
+
         # Build URL with path parameters
         url = "{}/user/api-tokens".format(self.client.base_url)
 
@@ -16408,6 +21549,12 @@ class AsyncApiTokensAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "list_api_tokens_for_user", "api_tokens", "/user/api-tokens"
+                )
+            },
         )
 
         if not response.is_success:
@@ -16418,17 +21565,25 @@ class AsyncApiTokensAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-        # Validate into a Pydantic model (supports BaseModel/RootModel)
-        return ApiTokenResultsPage.model_validate(json_data, extra="ignore")
+        # Validate into a Pydantic model (supports BaseModel/RootModel), or
+        # leave the items as JSON for a columnar export
+        return parse_page_response(
+            response,
+            self.client.json_codec,
+            lambda content: ApiTokenResultsPage.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def create_api_token_for_user(
         self,
         *,
         label: Optional[str] = None,
-    ) -> ApiTokenWithFullToken:
+    ) -> "models.ApiTokenWithFullToken":
         """This endpoint requires authentication by any Zoo user. It creates a new API token for the authenticated user."""
 
+        from kittycad.models.api_token_with_full_token import ApiTokenWithFullToken
+
         url = "{}/user/api-tokens".format(self.client.base_url)
 
         if label is not None:
@@ -16442,6 +21597,12 @@ class AsyncApiTokensAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_api_token_for_user", "api_tokens", "/user/api-tokens"
+                )
+            },
         )
 
         if not response.is_success:
@@ -16452,17 +21613,22 @@ class AsyncApiTokensAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ApiTokenWithFullToken.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ApiTokenWithFullToken.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_api_token_for_user(
         self,
-        token: ApiTokenUuid,
-    ) -> ApiToken:
+        token: "models.ApiTokenUuid",
+    ) -> "models.ApiToken":
         """This endpoint requires authentication by any Zoo user. It returns details of the requested API token for the user."""
 
+        from kittycad.models.api_token import ApiToken
+
         url = "{}/user/api-tokens/{token}".format(self.client.base_url, token=token)
 
         _client = self.client.get_http_client()
@@ -16470,6 +21636,12 @@ class AsyncApiTokensAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_api_token_for_user", "api_tokens", "/user/api-tokens/{token}"
+                )
+            },
         )
 
         if not response.is_success:
@@ -16480,10 +21652,11 @@ class AsyncApiTokensAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return ApiToken.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: ApiToken.model_validate_json(content, extra="ignore"),
+        )
 
     async def delete_api_token_for_user(
         self,
@@ -16502,6 +21675,14 @@ class AsyncApiTokensAPI:
         response = await _client.delete(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "delete_api_token_for_user",
+                    "api_tokens",
+                    "/user/api-tokens/{token}",
+                )
+            },
         )
 
         if not response.is_success:
@@ -16509,7 +21690,9 @@ class AsyncApiTokensAPI:
 
             raise_for_status(response)
 
-        return response.json() if response.content else None
+        return (
+            self.client.json_codec.loads(response.content) if response.content else None
+        )
 
 
 class FactoryAPI:
@@ -16520,9 +21703,13 @@ class FactoryAPI:
 
     def get_user_factory_finishes(
         self,
-    ) -> List[FactoryCustomerCatalogOption]:
+    ) -> "List[models.FactoryCustomerCatalogOption]":
         """Internal-only entries are omitted. Clients should refetch this endpoint after a catalog validation error before asking the customer to choose again."""
 
+        from kittycad.models.factory_customer_catalog_option import (
+            FactoryCustomerCatalogOption,
+        )
+
         url = "{}/user/factory/finishes".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -16530,6 +21717,12 @@ class FactoryAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_user_factory_finishes", "factory", "/user/factory/finishes"
+                )
+            },
         )
 
         if not response.is_success:
@@ -16540,18 +21733,19 @@ class FactoryAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[FactoryCustomerCatalogOption]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[FactoryCustomerCatalogOption]",
+                lambda: List[FactoryCustomerCatalogOption],
+            ).validate_json(content, extra="ignore"),
         )
 
     def create_user_factory_job(
         self,
-    ) -> FactoryJobResponse:
+    ) -> "models.FactoryJobResponse":
         """The request is `multipart/form-data`: - one JSON part named `body` (`FactoryIntakeForm`) whose `fields` object holds   intake data (material, finish, quantity, notes, …). Material and finish   are required customer-visible catalog names; all other fields are stored   verbatim so they can be added or renamed without an API change. - one or more file parts (any part name). At least one file is required.
 
         The submitter's identity (email, name, user id) comes from the authenticated account, not the form.
@@ -16564,6 +21758,8 @@ class FactoryAPI:
 
         Returns `201` with the created job (`FactoryJobResponse`)."""
 
+        from kittycad.models.factory_job_response import FactoryJobResponse
+
         url = "{}/user/factory/jobs".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -16571,6 +21767,12 @@ class FactoryAPI:
         response = _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_user_factory_job", "factory", "/user/factory/jobs"
+                )
+            },
         )
 
         if not response.is_success:
@@ -16581,16 +21783,23 @@ class FactoryAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return FactoryJobResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: FactoryJobResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     def get_user_factory_materials(
         self,
-    ) -> List[FactoryCustomerCatalogOption]:
+    ) -> "List[models.FactoryCustomerCatalogOption]":
         """Internal-only entries are omitted. Clients should refetch this endpoint after a catalog validation error before asking the customer to choose again."""
 
+        from kittycad.models.factory_customer_catalog_option import (
+            FactoryCustomerCatalogOption,
+        )
+
         url = "{}/user/factory/materials".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -16598,6 +21807,12 @@ class FactoryAPI:
         response = _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_user_factory_materials", "factory", "/user/factory/materials"
+                )
+            },
         )
 
         if not response.is_success:
@@ -16608,13 +21823,14 @@ class FactoryAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[FactoryCustomerCatalogOption]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[FactoryCustomerCatalogOption]",
+                lambda: List[FactoryCustomerCatalogOption],
+            ).validate_json(content, extra="ignore"),
         )
 
 
@@ -16626,9 +21842,13 @@ class AsyncFactoryAPI:
 
     async def get_user_factory_finishes(
         self,
-    ) -> List[FactoryCustomerCatalogOption]:
+    ) -> "List[models.FactoryCustomerCatalogOption]":
         """Internal-only entries are omitted. Clients should refetch this endpoint after a catalog validation error before asking the customer to choose again."""
 
+        from kittycad.models.factory_customer_catalog_option import (
+            FactoryCustomerCatalogOption,
+        )
+
         url = "{}/user/factory/finishes".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -16636,6 +21856,12 @@ class AsyncFactoryAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_user_factory_finishes", "factory", "/user/factory/finishes"
+                )
+            },
         )
 
         if not response.is_success:
@@ -16646,18 +21872,19 @@ class AsyncFactoryAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[FactoryCustomerCatalogOption]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[FactoryCustomerCatalogOption]",
+                lambda: List[FactoryCustomerCatalogOption],
+            ).validate_json(content, extra="ignore"),
         )
 
     async def create_user_factory_job(
         self,
-    ) -> FactoryJobResponse:
+    ) -> "models.FactoryJobResponse":
         """The request is `multipart/form-data`: - one JSON part named `body` (`FactoryIntakeForm`) whose `fields` object holds   intake data (material, finish, quantity, notes, …). Material and finish   are required customer-visible catalog names; all other fields are stored   verbatim so they can be added or renamed without an API change. - one or more file parts (any part name). At least one file is required.
 
         The submitter's identity (email, name, user id) comes from the authenticated account, not the form.
@@ -16670,6 +21897,8 @@ class AsyncFactoryAPI:
 
         Returns `201` with the created job (`FactoryJobResponse`)."""
 
+        from kittycad.models.factory_job_response import FactoryJobResponse
+
         url = "{}/user/factory/jobs".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -16677,6 +21906,12 @@ class AsyncFactoryAPI:
         response = await _client.post(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "create_user_factory_job", "factory", "/user/factory/jobs"
+                )
+            },
         )
 
         if not response.is_success:
@@ -16687,16 +21922,23 @@ class AsyncFactoryAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
         # Validate into a Pydantic model (works for BaseModel and RootModel)
-        return FactoryJobResponse.model_validate(json_data, extra="ignore")
+        return parse_json_response(
+            response,
+            lambda content: FactoryJobResponse.model_validate_json(
+                content, extra="ignore"
+            ),
+        )
 
     async def get_user_factory_materials(
         self,
-    ) -> List[FactoryCustomerCatalogOption]:
+    ) -> "List[models.FactoryCustomerCatalogOption]":
         """Internal-only entries are omitted. Clients should refetch this endpoint after a catalog validation error before asking the customer to choose again."""
 
+        from kittycad.models.factory_customer_catalog_option import (
+            FactoryCustomerCatalogOption,
+        )
+
         url = "{}/user/factory/materials".format(self.client.base_url)
 
         _client = self.client.get_http_client()
@@ -16704,6 +21946,12 @@ class AsyncFactoryAPI:
         response = await _client.get(
             url=url,
             headers=self.client.get_headers(),
+            timeout=self.client.get_timeout(),
+            extensions={
+                "kittycad_operation": OperationInfo(
+                    "get_user_factory_materials", "factory", "/user/factory/materials"
+                )
+            },
         )
 
         if not response.is_success:
@@ -16714,13 +21962,14 @@ class AsyncFactoryAPI:
         if not response.content:
             return None  # type: ignore
 
-        json_data = response.json()
-
-        # Validate into annotated/collection/union types using TypeAdapter
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(List[FactoryCustomerCatalogOption]).validate_python(
-            json_data, extra="ignore"
+        # Validate into annotated/collection/union types using a TypeAdapter
+        # that is built once and cached in _TYPE_ADAPTERS.
+        return parse_json_response(
+            response,
+            lambda content: _TYPE_ADAPTERS.get(
+                "List[FactoryCustomerCatalogOption]",
+                lambda: List[FactoryCustomerCatalogOption],
+            ).validate_json(content, extra="ignore"),
         )
 
 
@@ -16736,7 +21985,7 @@ class ModelingAPI:
         video_res_height: Optional[int] = None,
         fps: Optional[int] = None,
         unlocked_framerate: Optional[bool] = None,
-        post_effect: Optional[PostEffectType] = None,
+        post_effect: "Optional[models.PostEffectType]" = None,
         webrtc: Optional[bool] = None,
         pool: Optional[str] = None,
         show_grid: Optional[bool] = None,
@@ -16782,7 +22031,7 @@ class AsyncModelingAPI:
         video_res_height: Optional[int] = None,
         fps: Optional[int] = None,
         unlocked_framerate: Optional[bool] = None,
-        post_effect: Optional[PostEffectType] = None,
+        post_effect: "Optional[models.PostEffectType]" = None,
         webrtc: Optional[bool] = None,
         pool: Optional[str] = None,
         show_grid: Optional[bool] = None,
@@ -16805,7 +22054,7 @@ class AsyncModelingAPI:
             video_res_height: Optional[int] = None,
             fps: Optional[int] = None,
             unlocked_framerate: Optional[bool] = None,
-            post_effect: Optional[PostEffectType] = None,
+            post_effect: "Optional[models.PostEffectType]" = None,
             webrtc: Optional[bool] = None,
             pool: Optional[str] = None,
             show_grid: Optional[bool] = None,
@@ -16898,7 +22147,15 @@ class AsyncModelingAPI:
                 else:
                     url = url + "?pr=" + str(pr)
 
-            return await ws_connect_async(
+            if self.client.rate_limiter is not None:
+                await self.client.rate_limiter.acquire_async("/ws/modeling/commands")
+
+            return await connect_websocket_async(
+                self.client.event_hooks,
+                OperationInfo(
+                    "modeling_commands_ws", "modeling", "/ws/modeling/commands"
+                ),
+                self.client.get_websocket_connect(ws_connect_async),
                 url.replace("http", "ws"),
                 extra_headers=self.client.get_headers(),
                 close_timeout=120,
@@ -16923,8 +22180,13 @@ class WebSocketCreateExecutorTerm:
         url = ("{}" + "/ws/executor/term").format(client.base_url)
 
         headers = client.get_headers()
-        factory = ws_factory or ws_connect
-        self.ws = factory(
+        if client.rate_limiter is not None:
+            client.rate_limiter.acquire("/ws/executor/term")
+        factory = ws_factory or client.get_websocket_connect(ws_connect)
+        self.ws = connect_websocket(
+            client.event_hooks,
+            OperationInfo("create_executor_term", "executor", "/ws/executor/term"),
+            factory,
             url.replace("http", "ws"),
             additional_headers=headers,
             close_timeout=120,
@@ -16935,6 +22197,7 @@ class WebSocketCreateExecutorTerm:
             if recv_timeout is None
             else recv_timeout
         )
+        self._json_codec = client.json_codec
 
     def __enter__(self):
         return self
@@ -16951,13 +22214,14 @@ class WebSocketCreateExecutorTerm:
         It exits when the connection is closed normally. It raises a
         ConnectionClosedError exception after a protocol error or a network failure.
         """
+
         for message in self.ws:
-            yield json.loads(message)
+            yield self._json_codec.loads(message)
 
     def send(self, data: Dict[str, Any]):
         """Send data to the websocket."""
 
-        self.ws.send(json.dumps(data))
+        self.ws.send(self._json_codec.dumps(data).decode())
 
     def send_binary(self, data: Dict[str, Any]):
         """Send data as bson to the websocket."""
@@ -16968,7 +22232,7 @@ class WebSocketCreateExecutorTerm:
         """Receive data from the websocket."""
         message = self.ws.recv(timeout=self._recv_timeout)
 
-        return json.loads(message)
+        return self._json_codec.loads(message)
 
     def close(self):
         """Close the websocket."""
@@ -17013,8 +22277,13 @@ class WebSocketMlCopilotWs:
                 url = url + "?pr=" + str(pr)
 
         headers = client.get_headers()
-        factory = ws_factory or ws_connect
-        self.ws = factory(
+        if client.rate_limiter is not None:
+            client.rate_limiter.acquire("/ws/ml/copilot")
+        factory = ws_factory or client.get_websocket_connect(ws_connect)
+        self.ws = connect_websocket(
+            client.event_hooks,
+            OperationInfo("ml_copilot_ws", "ml", "/ws/ml/copilot"),
+            factory,
             url.replace("http", "ws"),
             additional_headers=headers,
             close_timeout=120,
@@ -17025,6 +22294,7 @@ class WebSocketMlCopilotWs:
             if recv_timeout is None
             else recv_timeout
         )
+        self._json_codec = client.json_codec
 
     def __enter__(self):
         return self
@@ -17041,23 +22311,28 @@ class WebSocketMlCopilotWs:
         It exits when the connection is closed normally. It raises a
         ConnectionClosedError exception after a protocol error or a network failure.
         """
+
+        from kittycad.models.ml_copilot_server_message import MlCopilotServerMessage
+
         for message in self.ws:
             yield MlCopilotServerMessage.model_validate_json(message)
 
-    def send(self, data: MlCopilotClientMessage):
+    def send(self, data: "models.MlCopilotClientMessage"):
         """Send data to the websocket."""
 
-        self.ws.send(json.dumps(data.model_dump(exclude_none=True)))
+        self.ws.send(data.model_dump_json(exclude_none=True))
 
-    def send_binary(self, data: MlCopilotClientMessage):
+    def send_binary(self, data: "models.MlCopilotClientMessage"):
         """Send data as bson to the websocket."""
 
         self.ws.send(bson.encode(data.model_dump(exclude_none=True)))
 
-    def recv(self) -> MlCopilotServerMessage:
+    def recv(self) -> "models.MlCopilotServerMessage":
         """Receive data from the websocket."""
         message = self.ws.recv(timeout=self._recv_timeout)
 
+        from kittycad.models.ml_copilot_server_message import MlCopilotServerMessage
+
         return MlCopilotServerMessage.model_validate_json(message)
 
     def close(self):
@@ -17083,8 +22358,13 @@ class WebSocketMlReasoningWs:
         url = ("{}" + "/ws/ml/reasoning/{id}").format(client.base_url, id=id)
 
         headers = client.get_headers()
-        factory = ws_factory or ws_connect
-        self.ws = factory(
+        if client.rate_limiter is not None:
+            client.rate_limiter.acquire("/ws/ml/reasoning/{id}")
+        factory = ws_factory or client.get_websocket_connect(ws_connect)
+        self.ws = connect_websocket(
+            client.event_hooks,
+            OperationInfo("ml_reasoning_ws", "ml", "/ws/ml/reasoning/{id}"),
+            factory,
             url.replace("http", "ws"),
             additional_headers=headers,
             close_timeout=120,
@@ -17095,6 +22375,7 @@ class WebSocketMlReasoningWs:
             if recv_timeout is None
             else recv_timeout
         )
+        self._json_codec = client.json_codec
 
     def __enter__(self):
         return self
@@ -17111,23 +22392,28 @@ class WebSocketMlReasoningWs:
         It exits when the connection is closed normally. It raises a
         ConnectionClosedError exception after a protocol error or a network failure.
         """
+
+        from kittycad.models.ml_copilot_server_message import MlCopilotServerMessage
+
         for message in self.ws:
             yield MlCopilotServerMessage.model_validate_json(message)
 
-    def send(self, data: MlCopilotClientMessage):
+    def send(self, data: "models.MlCopilotClientMessage"):
         """Send data to the websocket."""
 
-        self.ws.send(json.dumps(data.model_dump(exclude_none=True)))
+        self.ws.send(data.model_dump_json(exclude_none=True))
 
-    def send_binary(self, data: MlCopilotClientMessage):
+    def send_binary(self, data: "models.MlCopilotClientMessage"):
         """Send data as bson to the websocket."""
 
         self.ws.send(bson.encode(data.model_dump(exclude_none=True)))
 
-    def recv(self) -> MlCopilotServerMessage:
+    def recv(self) -> "models.MlCopilotServerMessage":
         """Receive data from the websocket."""
         message = self.ws.recv(timeout=self._recv_timeout)
 
+        from kittycad.models.ml_copilot_server_message import MlCopilotServerMessage
+
         return MlCopilotServerMessage.model_validate_json(message)
 
     def close(self):
@@ -17146,7 +22432,7 @@ class WebSocketModelingCommandsWs:
         video_res_height: Optional[int] = None,
         fps: Optional[int] = None,
         unlocked_framerate: Optional[bool] = None,
-        post_effect: Optional[PostEffectType] = None,
+        post_effect: "Optional[models.PostEffectType]" = None,
         webrtc: Optional[bool] = None,
         pool: Optional[str] = None,
         show_grid: Optional[bool] = None,
@@ -17244,8 +22530,13 @@ class WebSocketModelingCommandsWs:
                 url = url + "?pr=" + str(pr)
 
         headers = client.get_headers()
-        factory = ws_factory or ws_connect
-        self.ws = factory(
+        if client.rate_limiter is not None:
+            client.rate_limiter.acquire("/ws/modeling/commands")
+        factory = ws_factory or client.get_websocket_connect(ws_connect)
+        self.ws = connect_websocket(
+            client.event_hooks,
+            OperationInfo("modeling_commands_ws", "modeling", "/ws/modeling/commands"),
+            factory,
             url.replace("http", "ws"),
             additional_headers=headers,
             close_timeout=120,
@@ -17256,6 +22547,7 @@ class WebSocketModelingCommandsWs:
             if recv_timeout is None
             else recv_timeout
         )
+        self._json_codec = client.json_codec
 
     def __enter__(self):
         return self
@@ -17272,23 +22564,28 @@ class WebSocketModelingCommandsWs:
         It exits when the connection is closed normally. It raises a
         ConnectionClosedError exception after a protocol error or a network failure.
         """
+
+        from kittycad.models.web_socket_response import WebSocketResponse
+
         for message in self.ws:
             yield WebSocketResponse.model_validate_json(message)
 
-    def send(self, data: WebSocketRequest):
+    def send(self, data: "models.WebSocketRequest"):
         """Send data to the websocket."""
 
-        self.ws.send(json.dumps(data.model_dump(exclude_none=True)))
+        self.ws.send(data.model_dump_json(exclude_none=True))
 
-    def send_binary(self, data: WebSocketRequest):
+    def send_binary(self, data: "models.WebSocketRequest"):
         """Send data as bson to the websocket."""
 
         self.ws.send(bson.encode(data.model_dump(exclude_none=True)))
 
-    def recv(self) -> WebSocketResponse:
+    def recv(self) -> "models.WebSocketResponse":
         """Receive data from the websocket."""
         message = self.ws.recv(timeout=self._recv_timeout)
 
+        from kittycad.models.web_socket_response import WebSocketResponse
+
         return WebSocketResponse.model_validate_json(message)
 
     def close(self):
@@ -17364,44 +22661,6 @@ class KittyCAD(Client):
 
     """
 
-    # API attribute type annotations for documentation
-
-    meta: "MetaAPI"
-
-    api_calls: "ApiCallsAPI"
-
-    apps: "AppsAPI"
-
-    hidden: "HiddenAPI"
-
-    file: "FileAPI"
-
-    executor: "ExecutorAPI"
-
-    ml: "MlAPI"
-
-    oauth2: "Oauth2API"
-
-    orgs: "OrgsAPI"
-
-    payments: "PaymentsAPI"
-
-    service_accounts: "ServiceAccountsAPI"
-
-    projects: "ProjectsAPI"
-
-    store: "StoreAPI"
-
-    unit: "UnitAPI"
-
-    users: "UsersAPI"
-
-    api_tokens: "ApiTokensAPI"
-
-    factory: "FactoryAPI"
-
-    modeling: "ModelingAPI"
-
     def __init__(self, token: Optional[str] = None, **kwargs) -> None:
         if token is None:
             token = os.getenv("KITTYCAD_API_TOKEN") or os.getenv("ZOO_API_TOKEN")
@@ -17419,43 +22678,80 @@ class KittyCAD(Client):
 
         super().__init__(token=token, **kwargs)
 
-        # Import and initialize API classes
+    # API groups are built on first access, so creating (or evolving) a
+    # client doesn't construct every group up front.
 
-        self.meta: MetaAPI = MetaAPI(self)
+    @functools.cached_property
+    def meta(self) -> MetaAPI:
+        return MetaAPI(self)
 
-        self.api_calls: ApiCallsAPI = ApiCallsAPI(self)
+    @functools.cached_property
+    def api_calls(self) -> ApiCallsAPI:
+        return ApiCallsAPI(self)
 
-        self.apps: AppsAPI = AppsAPI(self)
+    @functools.cached_property
+    def apps(self) -> AppsAPI:
+        return AppsAPI(self)
 
-        self.hidden: HiddenAPI = HiddenAPI(self)
+    @functools.cached_property
+    def hidden(self) -> HiddenAPI:
+        return HiddenAPI(self)
 
-        self.file: FileAPI = FileAPI(self)
+    @functools.cached_property
+    def file(self) -> FileAPI:
+        return FileAPI(self)
 
-        self.executor: ExecutorAPI = ExecutorAPI(self)
+    @functools.cached_property
+    def executor(self) -> ExecutorAPI:
+        return ExecutorAPI(self)
 
-        self.ml: MlAPI = MlAPI(self)
+    @functools.cached_property
+    def ml(self) -> MlAPI:
+        return MlAPI(self)
 
-        self.oauth2: Oauth2API = Oauth2API(self)
+    @functools.cached_property
+    def oauth2(self) -> Oauth2API:
+        return Oauth2API(self)
 
-        self.orgs: OrgsAPI = OrgsAPI(self)
+    @functools.cached_property
+    def orgs(self) -> OrgsAPI:
+        return OrgsAPI(self)
 
-        self.payments: PaymentsAPI = PaymentsAPI(self)
+    @functools.cached_property
+    def payments(self) -> PaymentsAPI:
+        return PaymentsAPI(self)
 
-        self.service_accounts: ServiceAccountsAPI = ServiceAccountsAPI(self)
+    @functools.cached_property
+    def service_accounts(self) -> ServiceAccountsAPI:
+        return ServiceAccountsAPI(self)
 
-        self.projects: ProjectsAPI = ProjectsAPI(self)
+    @functools.cached_property
+    def projects(self) -> ProjectsAPI:
+        return ProjectsAPI(self)
 
-        self.store: StoreAPI = StoreAPI(self)
+    @functools.cached_property
+    def store(self) -> StoreAPI:
+        return StoreAPI(self)
 
-        self.unit: UnitAPI = UnitAPI(self)
+    @functools.cached_property
+    def unit(self) -> UnitAPI:
+        return UnitAPI(self)
 
-        self.users: UsersAPI = UsersAPI(self)
+    @functools.cached_property
+    def users(self) -> UsersAPI:
+        return UsersAPI(self)
 
-        self.api_tokens: ApiTokensAPI = ApiTokensAPI(self)
+    @functools.cached_property
+    def api_tokens(self) -> ApiTokensAPI:
+        return ApiTokensAPI(self)
 
-        self.factory: FactoryAPI = FactoryAPI(self)
+    @functools.cached_property
+    def factory(self) -> FactoryAPI:
+        return FactoryAPI(self)
 
-        self.modeling: ModelingAPI = ModelingAPI(self)
+    @functools.cached_property
+    def modeling(self) -> ModelingAPI:
+        return ModelingAPI(self)
 
 
 class AsyncKittyCAD(AsyncClient):
@@ -17532,44 +22828,6 @@ class AsyncKittyCAD(AsyncClient):
 
     """
 
-    # API attribute type annotations for documentation
-
-    meta: "AsyncMetaAPI"
-
-    api_calls: "AsyncApiCallsAPI"
-
-    apps: "AsyncAppsAPI"
-
-    hidden: "AsyncHiddenAPI"
-
-    file: "AsyncFileAPI"
-
-    executor: "AsyncExecutorAPI"
-
-    ml: "AsyncMlAPI"
-
-    oauth2: "AsyncOauth2API"
-
-    orgs: "AsyncOrgsAPI"
-
-    payments: "AsyncPaymentsAPI"
-
-    service_accounts: "AsyncServiceAccountsAPI"
-
-    projects: "AsyncProjectsAPI"
-
-    store: "AsyncStoreAPI"
-
-    unit: "AsyncUnitAPI"
-
-    users: "AsyncUsersAPI"
-
-    api_tokens: "AsyncApiTokensAPI"
-
-    factory: "AsyncFactoryAPI"
-
-    modeling: "AsyncModelingAPI"
-
     def __init__(self, token: Optional[str] = None, **kwargs) -> None:
         if token is None:
             token = os.getenv("KITTYCAD_API_TOKEN") or os.getenv("ZOO_API_TOKEN")
@@ -17587,43 +22845,91 @@ class AsyncKittyCAD(AsyncClient):
 
         super().__init__(token=token, **kwargs)
 
-        # Import and initialize async API classes
+    # API groups are built on first access, so creating (or evolving) a
+    # client doesn't construct every group up front.
+
+    @functools.cached_property
+    def meta(self) -> AsyncMetaAPI:
+        return AsyncMetaAPI(self)
+
+    @functools.cached_property
+    def api_calls(self) -> AsyncApiCallsAPI:
+        return AsyncApiCallsAPI(self)
 
-        self.meta: AsyncMetaAPI = AsyncMetaAPI(self)
+    @functools.cached_property
+    def apps(self) -> AsyncAppsAPI:
+        return AsyncAppsAPI(self)
 
-        self.api_calls: AsyncApiCallsAPI = AsyncApiCallsAPI(self)
+    @functools.cached_property
+    def hidden(self) -> AsyncHiddenAPI:
+        return AsyncHiddenAPI(self)
 
-        self.apps: AsyncAppsAPI = AsyncAppsAPI(self)
+    @functools.cached_property
+    def file(self) -> AsyncFileAPI:
+        return AsyncFileAPI(self)
 
-        self.hidden: AsyncHiddenAPI = AsyncHiddenAPI(self)
+    @functools.cached_property
+    def executor(self) -> AsyncExecutorAPI:
+        return AsyncExecutorAPI(self)
 
-        self.file: AsyncFileAPI = AsyncFileAPI(self)
+    @functools.cached_property
+    def ml(self) -> AsyncMlAPI:
+        return AsyncMlAPI(self)
 
-        self.executor: AsyncExecutorAPI = AsyncExecutorAPI(self)
+    @functools.cached_property
+    def oauth2(self) -> AsyncOauth2API:
+        return AsyncOauth2API(self)
 
-        self.ml: AsyncMlAPI = AsyncMlAPI(self)
+    @functools.cached_property
+    def orgs(self) -> AsyncOrgsAPI:
+        return AsyncOrgsAPI(self)
 
-        self.oauth2: AsyncOauth2API = AsyncOauth2API(self)
+    @functools.cached_property
+    def payments(self) -> AsyncPaymentsAPI:
+        return AsyncPaymentsAPI(self)
 
-        self.orgs: AsyncOrgsAPI = AsyncOrgsAPI(self)
+    @functools.cached_property
+    def service_accounts(self) -> AsyncServiceAccountsAPI:
+        return AsyncServiceAccountsAPI(self)
 
-        self.payments: AsyncPaymentsAPI = AsyncPaymentsAPI(self)
+    @functools.cached_property
+    def projects(self) -> AsyncProjectsAPI:
+        return AsyncProjectsAPI(self)
 
-        self.service_accounts: AsyncServiceAccountsAPI = AsyncServiceAccountsAPI(self)
+    @functools.cached_property
+    def store(self) -> AsyncStoreAPI:
+        return AsyncStoreAPI(self)
 
-        self.projects: AsyncProjectsAPI = AsyncProjectsAPI(self)
+    @functools.cached_property
+    def unit(self) -> AsyncUnitAPI:
+        return AsyncUnitAPI(self)
 
-        self.store: AsyncStoreAPI = AsyncStoreAPI(self)
+    @functools.cached_property
+    def users(self) -> AsyncUsersAPI:
+        return AsyncUsersAPI(self)
 
-        self.unit: AsyncUnitAPI = AsyncUnitAPI(self)
+    @functools.cached_property
+    def api_tokens(self) -> AsyncApiTokensAPI:
+        return AsyncApiTokensAPI(self)
 
-        self.users: AsyncUsersAPI = AsyncUsersAPI(self)
+    @functools.cached_property
+    def factory(self) -> AsyncFactoryAPI:
+        return AsyncFactoryAPI(self)
 
-        self.api_tokens: AsyncApiTokensAPI = AsyncApiTokensAPI(self)
+    @functools.cached_property
+    def modeling(self) -> AsyncModelingAPI:
+        return AsyncModelingAPI(self)
 
-        self.factory: AsyncFactoryAPI = AsyncFactoryAPI(self)
 
-        self.modeling: AsyncModelingAPI = AsyncModelingAPI(self)
+def __getattr__(name: str) -> Any:
+    # Models used to be imported eagerly into this module; keep
+    # ``from kittycad import SomeModel`` working without that cost.
+    if name in models._MODULES:
+        value = getattr(models, name)
+        # Later lookups (and string annotations) then find it directly.
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
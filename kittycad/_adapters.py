@@ -0,0 +1,43 @@
+"""A cache of pydantic ``TypeAdapter`` instances for the generated client.
+
+Building a ``TypeAdapter`` compiles a core schema, which costs far more than
+validating a typical response with it. Endpoint methods that return lists,
+dicts or unions therefore look their adapter up here, and each one is built
+once, on first use.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict
+
+from pydantic import TypeAdapter
+
+
+class TypeAdapterRegistry:
+    """Thread-safe, lazily-filled map of type names to ``TypeAdapter`` instances."""
+
+    def __init__(self) -> None:
+        self._adapters: Dict[str, TypeAdapter[Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, type_factory: Callable[[], Any]) -> TypeAdapter[Any]:
+        """Get the adapter for ``key``, building it from ``type_factory()`` if needed.
+
+        ``key`` must identify the type, e.g. its annotation as written in the
+        generated code; ``type_factory`` is only called on a miss, so the
+        types it refers to can be imported lazily.
+        """
+        adapter = self._adapters.get(key)
+        if adapter is None:
+            with self._lock:
+                adapter = self._adapters.get(key)
+                if adapter is None:
+                    adapter = self._adapters[key] = TypeAdapter(type_factory())
+        return adapter
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._adapters
+
+    def __len__(self) -> int:
+        return len(self._adapters)
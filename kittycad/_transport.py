@@ -0,0 +1,428 @@
+"""Transport construction and connection-pool helpers for the KittyCAD SDK.
+
+This module builds the httpx transports used by :class:`kittycad.client.Client`
+and :class:`kittycad.client.AsyncClient`, applies the configured pool limits,
+and exposes a read-only view of pool occupancy.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import attr
+import httpx
+from httpx._utils import get_environment_proxies
+
+OPERATION_EXTENSION = "kittycad_operation"
+SHARED_RESULT_EXTENSION = "kittycad_shared_result"
+
+
+@attr.s(auto_attribs=True, frozen=True, slots=True)
+class OperationInfo:
+    """Identifies the API operation a request belongs to.
+
+    Generated endpoint methods attach this to every request via the httpx
+    ``extensions`` mapping, so transports can make per-operation decisions.
+    """
+
+    operation_id: str
+    tag: str
+    url_template: str
+    """The spec path, e.g. ``/file/conversion/{src_format}/{output_format}``."""
+
+
+def get_operation(request: httpx.Request) -> Optional[OperationInfo]:
+    """Get the operation a request was issued for, if known."""
+    return request.extensions.get(OPERATION_EXTENSION)
+
+
+VOLATILE_HEADERS: FrozenSet[str] = frozenset(
+    {
+        "accept-encoding",
+        "cache-control",
+        "connection",
+        "content-length",
+        "if-modified-since",
+        "if-none-match",
+        "traceparent",
+        "tracestate",
+        "user-agent",
+        "x-request-id",
+    }
+)
+"""Headers that don't change what a GET returns, ignored by :func:`request_identity`."""
+
+RequestIdentity = Tuple[Tuple[str, str], ...]
+
+
+def request_identity(
+    request: httpx.Request, volatile: FrozenSet[str] = VOLATILE_HEADERS
+) -> RequestIdentity:
+    """Get the headers that decide who a request is made for.
+
+    This is every header except the ``volatile`` ones, so besides
+    ``Authorization`` it covers cookies and any tenant or org headers set on
+    the client.
+    """
+    return tuple(
+        sorted(
+            (name, value)
+            for name, value in request.headers.multi_items()
+            if name not in volatile
+        )
+    )
+
+
+_MISSING: Any = object()
+
+
+class SharedResult:
+    """Holds the parsed result of a response body shared by several callers.
+
+    Transports that hand the same body to more than one caller attach an
+    instance under :data:`SHARED_RESULT_EXTENSION`, so it is parsed once.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._value: Any = _MISSING
+
+    def get_or_parse(self, parse: Callable[[], Any]) -> Any:
+        with self._lock:
+            if self._value is _MISSING:
+                self._value = parse()
+            return self._value
+
+
+H = TypeVar("H", httpx.Client, httpx.AsyncClient)
+
+
+class SharedHTTPClient(Generic[H]):
+    """An httpx client (and so a connection pool) shared by several SDK clients.
+
+    A client and the clients derived from it with ``with_headers``,
+    ``with_cookies``, ``with_timeout`` and ``with_base_url`` all refer to
+    the same instance. Each of them takes a reference the first time it
+    sends a request and drops it when closed or garbage collected. Closing
+    the last client that holds a reference closes the httpx client; using a
+    client after that creates a new one.
+    """
+
+    def __init__(self, http_client: Optional[H] = None):
+        self._lock = threading.Lock()
+        self._http_client: Optional[H] = http_client
+        self._refs = 0
+        self.created = 0
+        """How many httpx clients this has created."""
+
+    @property
+    def http_client(self) -> Optional[H]:
+        return self._http_client
+
+    @property
+    def refs(self) -> int:
+        return self._refs
+
+    def acquire(self, create: Callable[[], H]) -> H:
+        """Take a reference, creating the httpx client if there is none."""
+        with self._lock:
+            if self._http_client is None:
+                self._http_client = create()
+                self.created += 1
+            self._refs += 1
+            return self._http_client
+
+    def release(self, detach: bool = True) -> Optional[H]:
+        """Drop a reference; return the httpx client for closing if it was the last.
+
+        With ``detach=False`` the httpx client stays for the next client to
+        take a reference to, and nothing is returned.
+        """
+        with self._lock:
+            self._refs = max(self._refs - 1, 0)
+            return self._detach_if_unused() if detach else None
+
+    def detach_if_unused(self) -> Optional[H]:
+        """Return the httpx client for closing if nothing references it."""
+        with self._lock:
+            return self._detach_if_unused()
+
+    def forget(self) -> None:
+        """Drop the httpx client without closing it, after a fork.
+
+        Its connections are shared with the parent process, so closing (or
+        using) them in the child would break the parent's requests.
+        """
+        self._lock = threading.Lock()
+        self._http_client = None
+        self._refs = 0
+
+    def _detach_if_unused(self) -> Optional[H]:
+        if self._refs:
+            return None
+        http_client, self._http_client = self._http_client, None
+        return http_client
+
+
+def release_collected(shared: SharedHTTPClient) -> None:
+    """Drop the reference of a client that was garbage collected unclosed.
+
+    The httpx client is neither closed nor detached: short-lived derived
+    clients (``client.with_headers(...).meta.ping()``) keep reusing the
+    pool, and whoever still holds it may keep using it. It is closed by the
+    next ``close()``, or when collected, as it would be without the SDK.
+    """
+    shared.release(detach=False)
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class PoolStats:
+    """A snapshot of connection-pool occupancy."""
+
+    connections: int
+    """Connections currently held by the pool (idle or in use)."""
+    active_connections: int
+    """Connections currently serving a request."""
+    idle_connections: int
+    """Keep-alive connections parked in the pool."""
+    queued_requests: int
+    """Requests waiting for a connection to become available."""
+    max_connections: Optional[int]
+    max_keepalive_connections: Optional[int]
+    in_flight_by_host: Dict[str, int] = attr.ib(factory=dict)
+    """Requests in flight per host, when a per-host limit is configured."""
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """Response stream that runs a callback exactly once when closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close: Optional[Callable[[], None]] = on_close
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if self._on_close is not None:
+                on_close, self._on_close = self._on_close, None
+                on_close()
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    """Async response stream that runs a callback exactly once when closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close: Optional[Callable[[], None]] = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._on_close is not None:
+                on_close, self._on_close = self._on_close, None
+                on_close()
+
+
+class PerHostLimitTransport(httpx.BaseTransport):
+    """Caps the number of in-flight requests to any single host.
+
+    A slot is held from the moment the request is sent until the response
+    body has been closed, so streamed downloads count against the limit.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, max_per_host: int):
+        self.transport = transport
+        self.max_per_host = max_per_host
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._in_flight: Dict[str, int] = {}
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_per_host)
+                self._semaphores[host] = semaphore
+            return semaphore
+
+    def _track(self, host: str, delta: int) -> None:
+        with self._lock:
+            self._in_flight[host] = self._in_flight.get(host, 0) + delta
+
+    def in_flight_by_host(self) -> Dict[str, int]:
+        with self._lock:
+            return {host: n for host, n in self._in_flight.items() if n}
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.netloc.decode("ascii")
+        semaphore = self._semaphore(host)
+        semaphore.acquire()
+        self._track(host, 1)
+
+        def release() -> None:
+            self._track(host, -1)
+            semaphore.release()
+
+        try:
+            response = self.transport.handle_request(request)
+        except BaseException:
+            release()
+            raise
+        if response.is_closed:
+            # Fully buffered already, so nothing is left in flight.
+            release()
+            return response
+        assert isinstance(response.stream, httpx.SyncByteStream)
+        response.stream = _ReleasingStream(response.stream, release)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncPerHostLimitTransport(httpx.AsyncBaseTransport):
+    """Async variant of :class:`PerHostLimitTransport`."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_per_host: int):
+        self.transport = transport
+        self.max_per_host = max_per_host
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._in_flight: Dict[str, int] = {}
+
+    def in_flight_by_host(self) -> Dict[str, int]:
+        return {host: n for host, n in self._in_flight.items() if n}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.netloc.decode("ascii")
+        semaphore = self._semaphores.setdefault(
+            host, asyncio.Semaphore(self.max_per_host)
+        )
+        await semaphore.acquire()
+        self._in_flight[host] = self._in_flight.get(host, 0) + 1
+
+        def release() -> None:
+            self._in_flight[host] -= 1
+            semaphore.release()
+
+        try:
+            response = await self.transport.handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+        if response.is_closed:
+            # Fully buffered already, so nothing is left in flight.
+            release()
+            return response
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        response.stream = _AsyncReleasingStream(response.stream, release)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def build_limits(
+    max_connections: Optional[int],
+    max_keepalive_connections: Optional[int],
+    keepalive_expiry: Optional[float],
+) -> httpx.Limits:
+    """Build the ``httpx.Limits`` for a pool. ``None`` means unlimited."""
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def proxy_map(
+    proxy: Optional[Union[str, httpx.Proxy]], *, use_env: bool
+) -> Dict[str, Optional[httpx.Proxy]]:
+    """Map URL patterns to the proxy each should go through.
+
+    An explicit ``proxy`` applies to every request. Otherwise, with ``use_env``,
+    ``HTTP_PROXY``/``HTTPS_PROXY``/``ALL_PROXY`` are honoured and ``NO_PROXY``
+    entries map to ``None`` (connect directly), just as httpx would do itself
+    if the SDK didn't pass it a ``transport=``.
+    """
+    if proxy is not None:
+        return {
+            "all://": proxy if isinstance(proxy, httpx.Proxy) else httpx.Proxy(proxy)
+        }
+    if not use_env:
+        return {}
+    return {
+        pattern: None if url is None else httpx.Proxy(url)
+        for pattern, url in get_environment_proxies().items()
+    }
+
+
+def iter_transports(transport: Any) -> Iterator[Any]:
+    """Yield a transport and every transport it wraps, outermost first."""
+    seen = set()
+    while transport is not None and id(transport) not in seen:
+        seen.add(id(transport))
+        yield transport
+        transport = getattr(transport, "transport", None)
+
+
+def pool_stats(http_client: Optional[Any]) -> PoolStats:
+    """Read pool occupancy from an httpx client built by the SDK.
+
+    Clients injected via ``http_client=`` are inspected on a best-effort
+    basis; anything that is not an httpcore pool reports zeros.
+    """
+    pool = None
+    in_flight_by_host: Dict[str, int] = {}
+    root = getattr(http_client, "_transport", None)
+    for transport in iter_transports(root):
+        if isinstance(transport, (PerHostLimitTransport, AsyncPerHostLimitTransport)):
+            in_flight_by_host = transport.in_flight_by_host()
+        if hasattr(transport, "_pool"):
+            pool = transport._pool
+
+    if pool is None:
+        return PoolStats(
+            connections=0,
+            active_connections=0,
+            idle_connections=0,
+            queued_requests=0,
+            max_connections=None,
+            max_keepalive_connections=None,
+            in_flight_by_host=in_flight_by_host,
+        )
+
+    connections = list(getattr(pool, "connections", []))
+    idle = sum(1 for conn in connections if conn.is_idle())
+    queued = sum(1 for req in list(getattr(pool, "_requests", [])) if req.is_queued())
+    return PoolStats(
+        connections=len(connections),
+        active_connections=len(connections) - idle,
+        idle_connections=idle,
+        queued_requests=queued,
+        max_connections=getattr(pool, "_max_connections", None),
+        max_keepalive_connections=getattr(pool, "_max_keepalive_connections", None),
+        in_flight_by_host=in_flight_by_host,
+    )
@@ -0,0 +1,568 @@
+"""HTTP response caching for the KittyCAD SDK.
+
+A :class:`ResponseCache` attached to :class:`kittycad.client.Client` or
+:class:`kittycad.client.AsyncClient` stores successful GET responses and
+serves them again while they are fresh. Freshness follows the response's
+``Cache-Control``/``Expires`` headers unless a per-endpoint TTL override is
+given (``no-store`` is always honoured); stale entries with an ``ETag`` or ``Last-Modified`` are revalidated
+with a conditional request, and a ``304 Not Modified`` reuses the stored body.
+
+Cached responses also carry the object the endpoint method parsed from them,
+so repeat hits skip JSON decoding and pydantic validation. Hits return the
+same model instance every time; treat cached results as read-only.
+
+Example:
+    >>> from kittycad import KittyCAD
+    >>> from kittycad.cache import DiskCacheBackend, ResponseCache
+    >>> cache = ResponseCache(ttl={"get_schema": 3600, "/user": 60})
+    >>> client = KittyCAD(token="my-token", response_cache=cache)
+    >>> on_disk = ResponseCache(backend=DiskCacheBackend("~/.cache/kittycad"))  # doctest: +SKIP
+"""
+
+from __future__ import annotations
+
+import abc
+import base64
+import collections
+import contextlib
+import email.utils
+import fnmatch
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Mapping, Optional, OrderedDict, Tuple
+
+import attr
+import httpx
+
+from ._transport import (
+    SHARED_RESULT_EXTENSION,
+    VOLATILE_HEADERS,
+    SharedResult,
+    get_operation,
+    request_identity,
+)
+
+CACHE_EXTENSION = "kittycad_cache"
+"""Response extension set to ``"hit"``, ``"revalidated"`` or ``"miss"``."""
+
+_CACHEABLE_STATUSES = frozenset({200, 203})
+# Headers that describe the stored body and must survive a 304.
+_ENTITY_HEADERS = frozenset({"content-encoding", "content-length", "content-type"})
+
+
+@attr.s(auto_attribs=True)
+class CacheEntry:
+    """A stored response."""
+
+    status_code: int
+    headers: List[Tuple[str, str]]
+    content: bytes
+    stored_at: float
+    """Wall-clock time (``time.time()``) the response was stored or revalidated."""
+    expires_at: float
+    """Wall-clock time after which the entry must be revalidated."""
+    shared: SharedResult = attr.ib(factory=SharedResult, eq=False)
+    """The object parsed from ``content``, filled in on first use."""
+
+    @property
+    def etag(self) -> Optional[str]:
+        return httpx.Headers(self.headers).get("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return httpx.Headers(self.headers).get("last-modified")
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def to_response(self, outcome: str) -> httpx.Response:
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            stream=httpx.ByteStream(self.content),
+            extensions={SHARED_RESULT_EXTENSION: self.shared, CACHE_EXTENSION: outcome},
+        )
+
+
+class CacheBackend(abc.ABC):
+    """Storage for :class:`CacheEntry` objects. Implementations must be thread-safe."""
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]: ...
+
+    @abc.abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None: ...
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None: ...
+
+    @abc.abstractmethod
+    def clear(self) -> None: ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    """An in-process LRU bounded by entry count and total body size."""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, CacheEntry] = collections.OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if entry.size > self.max_bytes:
+            self.delete(key)
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+_FileSignature = Tuple[int, int, int]
+
+
+def _signature(st: os.stat_result) -> _FileSignature:
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+class DiskCacheBackend(CacheBackend):
+    """Stores entries as JSON files in a directory, one file per cache key.
+
+    Recently used entries are also kept in memory so their parsed objects can
+    be reused; files are the source of truth across processes and restarts.
+    A file is only re-read when its mtime, size or inode no longer match the
+    in-memory copy, i.e. when another process has replaced it.
+    """
+
+    def __init__(self, directory: str, memory_entries: int = 128):
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self._memory = MemoryCacheBackend(max_entries=memory_entries)
+        self._signatures: Dict[str, _FileSignature] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".json")
+
+    def _remember(self, key: str, entry: CacheEntry, sig: _FileSignature) -> None:
+        self._memory.set(key, entry)
+        with self._lock:
+            self._signatures[key] = sig
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        path = self._path(key)
+        try:
+            sig = _signature(os.stat(path))
+        except OSError:
+            self._forget(key)
+            return None
+        entry = self._memory.get(key)
+        with self._lock:
+            if entry is None:
+                self._signatures.pop(key, None)
+            elif self._signatures.get(key) == sig:
+                return entry
+        try:
+            with open(path, encoding="utf-8") as f:
+                sig = _signature(os.fstat(f.fileno()))
+                data = json.load(f)
+            if entry is None or entry.stored_at != data["stored_at"]:
+                entry = CacheEntry(
+                    status_code=data["status_code"],
+                    headers=[tuple(header) for header in data["headers"]],  # type: ignore[misc]
+                    content=base64.b64decode(data["content"]),
+                    stored_at=data["stored_at"],
+                    expires_at=data["expires_at"],
+                )
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing, truncated or malformed: a miss, overwritten on the next store.
+            self._forget(key)
+            return None
+        self._remember(key, entry, sig)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        data = {
+            "status_code": entry.status_code,
+            "headers": entry.headers,
+            "content": base64.b64encode(entry.content).decode("ascii"),
+            "stored_at": entry.stored_at,
+            "expires_at": entry.expires_at,
+        }
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+                f.flush()
+                sig = _signature(os.fstat(f.fileno()))
+            os.replace(tmp, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp)
+            raise
+        self._remember(key, entry, sig)
+
+    def _forget(self, key: str) -> None:
+        self._memory.delete(key)
+        with self._lock:
+            self._signatures.pop(key, None)
+
+    def delete(self, key: str) -> None:
+        self._forget(key)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        self._memory.clear()
+        with self._lock:
+            self._signatures.clear()
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                os.remove(os.path.join(self.directory, name))
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class CacheStats:
+    """Counters for a :class:`ResponseCache`."""
+
+    hits: int
+    """Responses served from the cache without contacting the API."""
+    revalidated: int
+    """Stale entries the API confirmed unchanged (``304``)."""
+    misses: int
+    stores: int
+
+
+def _cache_control(headers: httpx.Headers) -> Dict[str, Optional[str]]:
+    directives: Dict[str, Optional[str]] = {}
+    for value in headers.get_list("cache-control", split_commas=True):
+        name, _, arg = value.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
+
+
+def _parse_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class ResponseCache:
+    """Caches GET responses by URL and request identity.
+
+    Two requests share an entry only if every header other than
+    ``volatile_headers`` matches, so different tokens, cookies or tenant
+    headers never see each other's responses.
+
+    Args:
+        backend: Where entries live; defaults to a :class:`MemoryCacheBackend`
+        ttl: Per-endpoint freshness overrides in seconds, keyed by operation
+            id (e.g. ``get_schema``) or path pattern (``fnmatch`` syntax, e.g.
+            ``/projects/*``). They win over response headers other than
+            ``no-store``; ``0`` means "always revalidate".
+        default_ttl: Freshness for responses that say nothing about it
+            (``None`` stores them only if they can be revalidated)
+        volatile_headers: Headers (lower case) left out of the cache key
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl: Optional[Mapping[str, float]] = None,
+        default_ttl: Optional[float] = None,
+        volatile_headers: Iterable[str] = VOLATILE_HEADERS,
+    ):
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.volatile_headers = frozenset(volatile_headers)
+        self.ttl = dict(ttl or {})
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._revalidated = 0
+        self._misses = 0
+        self._stores = 0
+
+    def key_for(self, request: httpx.Request) -> Optional[str]:
+        """Get the cache key of a request, or ``None`` if it isn't cacheable."""
+        if request.method != "GET":
+            return None
+        if "no-store" in _cache_control(request.headers):
+            return None
+        identity = request_identity(request, self.volatile_headers)
+        lines = [str(request.url), *(f"{name}: {value}" for name, value in identity)]
+        return hashlib.sha256("\n".join(lines).encode()).hexdigest()
+
+    def ttl_for(self, request: httpx.Request) -> Optional[float]:
+        """Get the TTL override that applies to a request, if any."""
+        if not self.ttl:
+            return None
+        operation = get_operation(request)
+        if operation is not None and operation.operation_id in self.ttl:
+            return self.ttl[operation.operation_id]
+        for pattern, seconds in self.ttl.items():
+            if fnmatch.fnmatchcase(request.url.path, pattern):
+                return seconds
+        return None
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                revalidated=self._revalidated,
+                misses=self._misses,
+                stores=self._stores,
+            )
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            if outcome == "hit":
+                self._hits += 1
+            elif outcome == "revalidated":
+                self._revalidated += 1
+            elif outcome == "miss":
+                self._misses += 1
+            else:
+                self._stores += 1
+
+    def lookup(
+        self, key: str, request: httpx.Request
+    ) -> Tuple[Optional[CacheEntry], Optional[httpx.Response]]:
+        """Find the entry for a request.
+
+        Returns the entry, plus a response when it can be served as-is.
+        Otherwise conditional headers are added to ``request`` when the entry
+        can be revalidated.
+        """
+        entry = self.backend.get(key)
+        if entry is None:
+            return None, None
+        if entry.is_fresh(time.time()) and "no-cache" not in _cache_control(
+            request.headers
+        ):
+            self._count("hit")
+            return entry, entry.to_response("hit")
+        if entry.etag is not None:
+            request.headers["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            request.headers["If-Modified-Since"] = entry.last_modified
+        return entry, None
+
+    def revalidated(
+        self,
+        key: str,
+        request: httpx.Request,
+        entry: CacheEntry,
+        response: httpx.Response,
+    ) -> httpx.Response:
+        """Refresh a stale entry from a ``304`` and serve its stored body."""
+        headers = httpx.Headers(entry.headers)
+        for name, value in response.headers.multi_items():
+            if name.lower() not in _ENTITY_HEADERS:
+                headers[name] = value
+        entry.headers = headers.multi_items()
+        entry.stored_at = time.time()
+        entry.expires_at = self._expires_at(request, headers, entry.stored_at)
+        self.backend.set(key, entry)
+        self._count("revalidated")
+        return entry.to_response("revalidated")
+
+    def storable(self, request: httpx.Request, response: httpx.Response) -> bool:
+        """Whether a response may be stored, judged from its status and headers.
+
+        Decided before the body is read, so responses that won't be stored
+        can stream straight through.
+        """
+        if response.status_code not in _CACHEABLE_STATUSES:
+            return False
+        directives = _cache_control(response.headers)
+        if "no-store" in directives or response.headers.get("vary", "") == "*":
+            return False
+        if self.ttl_for(request) is not None:
+            return True
+        now = time.time()
+        return (
+            self._expires_at(request, response.headers, now) > now
+            or "etag" in response.headers
+            or "last-modified" in response.headers
+        )
+
+    def store(
+        self, key: str, request: httpx.Request, response: httpx.Response, content: bytes
+    ) -> httpx.Response:
+        """Store a fully-read, :meth:`storable` response and return a response for it."""
+        self._count("miss")
+        now = time.time()
+        entry = CacheEntry(
+            status_code=response.status_code,
+            headers=response.headers.multi_items(),
+            content=content,
+            stored_at=now,
+            expires_at=self._expires_at(request, response.headers, now),
+        )
+        self.backend.set(key, entry)
+        self._count("store")
+        served = entry.to_response("miss")
+        served.extensions = {**response.extensions, **served.extensions}
+        return served
+
+    def bypass(self, key: str, response: httpx.Response) -> httpx.Response:
+        """Pass a response that won't be stored through unread, dropping any old entry."""
+        self._count("miss")
+        self.backend.delete(key)
+        response.extensions[CACHE_EXTENSION] = "miss"
+        return response
+
+    def _expires_at(
+        self, request: httpx.Request, headers: httpx.Headers, now: float
+    ) -> float:
+        override = self.ttl_for(request)
+        if override is not None:
+            return now + override
+        directives = _cache_control(headers)
+        if "no-cache" in directives:
+            return now
+        max_age = directives.get("max-age")
+        if max_age is not None:
+            try:
+                age = float(headers.get("age", 0))
+                return now + float(max_age) - age
+            except ValueError:
+                return now
+        expires = _parse_date(headers.get("expires"))
+        if expires is not None:
+            date = _parse_date(headers.get("date")) or now
+            return now + (expires - date)
+        return now + (self.default_ttl or 0.0)
+
+
+class CacheTransport(httpx.BaseTransport):
+    """Transport wrapper that serves and stores responses via a :class:`ResponseCache`."""
+
+    def __init__(self, transport: httpx.BaseTransport, cache: ResponseCache):
+        self.transport = transport
+        self.cache = cache
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key = self.cache.key_for(request)
+        if key is None:
+            return self.transport.handle_request(request)
+        entry, cached = self.cache.lookup(key, request)
+        if cached is not None:
+            return cached
+        response = self.transport.handle_request(request)
+        if response.status_code == 304:
+            if entry is None:
+                return response
+            response.close()
+            return self.cache.revalidated(key, request, entry, response)
+        if response.status_code not in _CACHEABLE_STATUSES:
+            return response
+        if not self.cache.storable(request, response):
+            return self.cache.bypass(key, response)
+        assert isinstance(response.stream, httpx.SyncByteStream)
+        try:
+            content = b"".join(response.stream)
+        finally:
+            response.close()
+        return self.cache.store(key, request, response, content)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncCacheTransport(httpx.AsyncBaseTransport):
+    """Async variant of :class:`CacheTransport`."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: ResponseCache):
+        self.transport = transport
+        self.cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = self.cache.key_for(request)
+        if key is None:
+            return await self.transport.handle_async_request(request)
+        entry, cached = self.cache.lookup(key, request)
+        if cached is not None:
+            return cached
+        response = await self.transport.handle_async_request(request)
+        if response.status_code == 304:
+            if entry is None:
+                return response
+            await response.aclose()
+            return self.cache.revalidated(key, request, entry, response)
+        if response.status_code not in _CACHEABLE_STATUSES:
+            return response
+        if not self.cache.storable(request, response):
+            return self.cache.bypass(key, response)
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        try:
+            content = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        return self.cache.store(key, request, response, content)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+__all__ = [
+    "AsyncCacheTransport",
+    "CacheBackend",
+    "CacheEntry",
+    "CacheStats",
+    "CacheTransport",
+    "DiskCacheBackend",
+    "MemoryCacheBackend",
+    "ResponseCache",
+]
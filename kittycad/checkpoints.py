@@ -0,0 +1,151 @@
+"""Durable checkpoints for resuming paginated listings.
+
+A :class:`PageCheckpoint` records where a page iterator is: the token of the
+page being consumed and how many of its items are finished. Give a page
+iterator a :class:`CheckpointStore` and it resumes from the stored
+checkpoint, then saves a new one each time the consumer moves past a page.
+A page is delivered again after a restart only if the process stopped
+before moving past it, so work done per page happens once.
+
+Example:
+    >>> from kittycad import KittyCAD
+    >>> from kittycad.checkpoints import SQLiteCheckpointStore
+    >>> client = KittyCAD(token="my-token")
+    >>> store = SQLiteCheckpointStore("crawl.db", key="dataset-42")  # doctest: +SKIP
+    >>> conversions = client.orgs.list_org_dataset_conversions(id="42")
+    >>> for page in conversions.checkpoint_to(store).pages():  # doctest: +SKIP
+    ...     save(page.items)
+"""
+
+import abc
+import contextlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterator, Optional
+
+import attr
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class PageCheckpoint:
+    """A position in a paginated listing."""
+
+    page_token: Optional[str] = None
+    """Token of the page to resume at; ``None`` for the first page."""
+    offset: int = 0
+    """Items of that page already finished, skipped on resume."""
+    items: int = 0
+    """Items finished across the whole listing so far."""
+    done: bool = False
+    """Every page has been consumed; resuming yields nothing."""
+
+    def to_json(self) -> str:
+        return json.dumps(attr.asdict(self))
+
+    @classmethod
+    def from_json(cls, data: str) -> "PageCheckpoint":
+        return cls(**json.loads(data))
+
+
+class CheckpointStore(abc.ABC):
+    """Somewhere to keep the checkpoint of one listing."""
+
+    @abc.abstractmethod
+    def load(self) -> Optional[PageCheckpoint]:
+        """Get the saved checkpoint, or ``None`` to start from the beginning."""
+
+    @abc.abstractmethod
+    def save(self, checkpoint: PageCheckpoint) -> None:
+        """Durably replace the saved checkpoint."""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Forget the checkpoint, so the listing starts over."""
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Keeps the checkpoint as JSON in a file, replaced atomically on save."""
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+
+    def load(self) -> Optional[PageCheckpoint]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return PageCheckpoint.from_json(f.read())
+        except FileNotFoundError:
+            return None
+
+    def save(self, checkpoint: PageCheckpoint) -> None:
+        tmp = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(checkpoint.to_json())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Keeps checkpoints in a SQLite table, one row per ``key``.
+
+    One database can track many listings, and may be shared with the data
+    being crawled.
+    """
+
+    def __init__(self, path: str, key: str = "default"):
+        self.path = os.path.expanduser(path)
+        self.key = key
+        with self._transaction() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS kittycad_checkpoints ("
+                " key TEXT PRIMARY KEY,"
+                " checkpoint TEXT NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # A connection per call: iterators may run on other threads.
+        db = sqlite3.connect(self.path, timeout=30.0)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def load(self) -> Optional[PageCheckpoint]:
+        with self._transaction() as db:
+            row = db.execute(
+                "SELECT checkpoint FROM kittycad_checkpoints WHERE key = ?",
+                (self.key,),
+            ).fetchone()
+        return None if row is None else PageCheckpoint.from_json(row[0])
+
+    def save(self, checkpoint: PageCheckpoint) -> None:
+        with self._transaction() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO kittycad_checkpoints"
+                " (key, checkpoint, updated_at) VALUES (?, ?, ?)",
+                (self.key, checkpoint.to_json(), time.time()),
+            )
+
+    def clear(self) -> None:
+        with self._transaction() as db:
+            db.execute("DELETE FROM kittycad_checkpoints WHERE key = ?", (self.key,))
+
+
+__all__ = [
+    "CheckpointStore",
+    "FileCheckpointStore",
+    "PageCheckpoint",
+    "SQLiteCheckpointStore",
+]
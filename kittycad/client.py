@@ -1,16 +1,91 @@
+import functools
+import os
 import ssl
-from typing import Dict, Optional, Self, Union
+import threading
+import weakref
+from typing import Any, Callable, Dict, Optional, Self, Union
 
 import attr
 import httpx
 import truststore
 
+from ._transport import (
+    AsyncPerHostLimitTransport,
+    PerHostLimitTransport,
+    PoolStats,
+    SharedHTTPClient,
+    build_limits,
+    pool_stats,
+    proxy_map,
+    release_collected,
+)
+from .cache import AsyncCacheTransport, CacheTransport, ResponseCache
+from .codec import JSONCodec
+from .concurrency import AdaptiveConcurrencyLimiter, AsyncConcurrencyLimitTransport
+from .failover import AsyncFailoverTransport, EndpointRouter, FailoverTransport
+from .hedging import AsyncHedgeTransport, Hedger, HedgeTransport
+from .hooks import (
+    AsyncEventHookTransport,
+    EventHooks,
+    EventHookTransport,
+    rate_limit_hook,
+    retry_hook,
+)
+from .rate_limit import AsyncRateLimitTransport, RateLimiter, RateLimitTransport
+from .retry import AsyncRetryTransport, RetryPolicy, RetryTransport
+from .singleflight import (
+    AsyncSingleFlightTransport,
+    SingleFlight,
+    SingleFlightTransport,
+)
+from .timing import AsyncTimingTransport, TimingTransport
+from .warmup import WarmupReport, _AsyncWarmer, _Warmer
+
 DEFAULT_BASE_URL = "https://api.zoo.dev"
 
+# Every live client by id (clients aren't hashable), so a forked child can
+# drop the pools it inherited.
+_clients: "weakref.WeakValueDictionary[int, Union[Client, AsyncClient]]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _after_fork_in_child() -> None:
+    for client in list(_clients.values()):
+        client._forget_inherited_pool()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def _routed_websocket(
+    connect: Callable[..., Any], router: EndpointRouter, url: str, **kwargs: Any
+) -> Any:
+    return connect(router.route_websocket(url), **kwargs)
+
 
 @attr.s(auto_attribs=True)
 class Client:
-    """A Client which has been authenticated for use on secured endpoints of the KittyCAD API."""  # noqa: E501
+    """A Client which has been authenticated for use on secured endpoints of the KittyCAD API.
+
+    One client may be shared by any number of threads: the connection pool
+    is created once, on first use, and each thread may hold the client open
+    with ``with client:``; the client is closed when the last of them exits.
+
+    Clients derived with ``with_headers``, ``with_cookies``, ``with_timeout``
+    and ``with_base_url`` share this client's pool (see
+    :class:`kittycad._transport.SharedHTTPClient`): closing one of them only
+    closes the pool once no other client uses it. Derivatives that change how
+    requests are sent, like ``with_limits`` or ``with_retry_policy``, get a
+    pool of their own.
+
+    Clients are fork-safe: a child process forked after the pool was opened
+    (e.g. a gunicorn worker or a ``multiprocessing`` pool) drops the pool it
+    inherited, without closing the parent's connections, and opens its own
+    on first use. See :mod:`kittycad.workers` for one client per process in
+    ``ProcessPoolExecutor`` pools.
+    """  # noqa: E501
 
     token: str = attr.ib(kw_only=True)
     base_url: str = attr.ib(default=DEFAULT_BASE_URL)
@@ -21,13 +96,70 @@ class Client:
     verify_ssl: Union[str, bool, ssl.SSLContext, truststore.SSLContext] = attr.ib(
         True, kw_only=True
     )
+    max_connections: Optional[int] = attr.ib(100, kw_only=True)
+    max_keepalive_connections: Optional[int] = attr.ib(20, kw_only=True)
+    keepalive_expiry: Optional[float] = attr.ib(5.0, kw_only=True)
+    max_connections_per_host: Optional[int] = attr.ib(None, kw_only=True)
+    # HTTP/2 needs the optional ``h2`` package (``pip install httpx[http2]``).
+    http2: bool = attr.ib(False, kw_only=True)
+    retry_policy: Optional[RetryPolicy] = attr.ib(default=None, kw_only=True)
+    # May be shared between sync and async clients and across threads.
+    rate_limiter: Optional[RateLimiter] = attr.ib(default=None, kw_only=True)
+    # Coalesces identical concurrent GETs; may be shared like ``rate_limiter``.
+    single_flight: Optional[SingleFlight] = attr.ib(default=None, kw_only=True)
+    response_cache: Optional[ResponseCache] = attr.ib(default=None, kw_only=True)
+    # Spreads requests over several base URLs with health-checked failover;
+    # may be shared like ``rate_limiter``. See kittycad.failover.
+    router: Optional[EndpointRouter] = attr.ib(default=None, kw_only=True)
+    # Re-sends slow idempotent requests; may be shared like ``rate_limiter``.
+    # See kittycad.hedging.
+    hedger: Optional[Hedger] = attr.ib(default=None, kw_only=True)
+    # Encodes request bodies and decodes untyped responses. See kittycad.codec
+    # to opt into orjson.
+    json_codec: JSONCodec = attr.ib(factory=JSONCodec, kw_only=True)
+    # Lifecycle callbacks for every request and websocket; see kittycad.hooks.
+    event_hooks: Optional[EventHooks] = attr.ib(default=None, kw_only=True)
+    # Fraction of requests that record a DNS/connect/TLS/TTFB breakdown; see
+    # kittycad.timing.
+    timing_sample_rate: float = attr.ib(0.0, kw_only=True)
+    # Proxy for every request; by default HTTP(S)_PROXY/ALL_PROXY/NO_PROXY
+    # from the environment apply, unless ``transport`` is given.
+    proxy: Optional[Union[str, httpx.Proxy]] = attr.ib(default=None, kw_only=True)
+    # Innermost transport the SDK builds on (e.g. ``httpx.MockTransport`` in
+    # tests). Defaults to a pooled transport using the settings above.
+    transport: Optional[httpx.BaseTransport] = attr.ib(default=None, kw_only=True)
     http_client: Optional[httpx.Client] = attr.ib(default=None, kw_only=True)
+    # The pool this client and the clients derived from it use.
+    shared_http_client: SharedHTTPClient[httpx.Client] = attr.ib(
+        factory=SharedHTTPClient, kw_only=True, repr=False, eq=False
+    )
+    # Guards taking and dropping this client's reference to the shared pool;
+    # ``_users`` counts the open ``with`` blocks. Derived clients
+    # (``attr.evolve``) get their own.
+    _lock: threading.Lock = attr.ib(
+        factory=threading.Lock, init=False, repr=False, eq=False
+    )
+    _users: int = attr.ib(default=0, init=False, repr=False, eq=False)
+    _finalizer: Optional[weakref.finalize] = attr.ib(
+        default=None, init=False, repr=False, eq=False
+    )
+    # What ``warmup`` left behind: its refresher and a parked websocket socket.
+    _warmer: Optional[_Warmer] = attr.ib(default=None, init=False, repr=False, eq=False)
+
+    def __attrs_post_init__(self) -> None:
+        if self.http_client is not None and self.shared_http_client.http_client is None:
+            # An injected client is shared (and closed) like one the SDK built.
+            self.shared_http_client = SharedHTTPClient(self.http_client)
+        _clients[id(self)] = self
 
     def get_headers(self) -> Dict[str, str]:
         """Get headers to be used in all endpoints"""
         headers = {**self.headers}
         if getattr(self, "token", None):
             headers["Authorization"] = f"Bearer {self.token}"
+        if self.cookies:
+            # Sent per request, so clients sharing a pool can differ in cookies.
+            headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in self.cookies.items())
         return headers
 
     def with_headers(self, headers: Dict[str, str]) -> "Client":
@@ -55,38 +187,289 @@ class Client:
         """Get a new client matching this one with a new websocket recv timeout"""
         return attr.evolve(self, websocket_recv_timeout=timeout)
 
+    def with_json_codec(self, codec: JSONCodec) -> "Client":
+        """Get a new client matching this one with a different JSON codec"""
+        return attr.evolve(self, json_codec=codec)
+
     def with_base_url(self, url: str) -> "Client":
         """Get a new client matching this one with a new base url"""
         return attr.evolve(self, base_url=url)
 
-    def get_http_client(self) -> httpx.Client:
-        """Get the underlying httpx.Client, creating it if necessary"""
-        if self.http_client is None:
-            self.http_client = httpx.Client(
-                timeout=self.timeout,
+    def get_limits(self) -> httpx.Limits:
+        return build_limits(
+            self.max_connections,
+            self.max_keepalive_connections,
+            self.keepalive_expiry,
+        )
+
+    def with_limits(
+        self,
+        *,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        max_connections_per_host: Optional[int] = None,
+        http2: Optional[bool] = None,
+    ) -> "Client":
+        """Get a new client matching this one with different connection-pool settings
+
+        Arguments left as ``None`` keep their current value. The new client gets
+        its own pool, since pool limits can't be changed on a live pool.
+        """
+        changes: Dict[str, Any] = {
+            "max_connections": max_connections,
+            "max_keepalive_connections": max_keepalive_connections,
+            "keepalive_expiry": keepalive_expiry,
+            "max_connections_per_host": max_connections_per_host,
+            "http2": http2,
+        }
+        return attr.evolve(
+            self,
+            http_client=None,
+            shared_http_client=SharedHTTPClient(),
+            **{key: value for key, value in changes.items() if value is not None},
+        )
+
+    def with_retry_policy(self, policy: Optional[RetryPolicy]) -> "Client":
+        """Get a new client matching this one with a different retry policy (or none)"""
+        return attr.evolve(
+            self,
+            retry_policy=policy,
+            http_client=None,
+            shared_http_client=SharedHTTPClient(),
+        )
+
+    def with_rate_limiter(self, limiter: Optional[RateLimiter]) -> "Client":
+        """Get a new client matching this one with a different rate limiter (or none)"""
+        return attr.evolve(
+            self,
+            rate_limiter=limiter,
+            http_client=None,
+            shared_http_client=SharedHTTPClient(),
+        )
+
+    def with_single_flight(self, single_flight: Optional[SingleFlight]) -> "Client":
+        """Get a new client matching this one with a different single-flight group (or none)"""
+        return attr.evolve(
+            self,
+            single_flight=single_flight,
+            http_client=None,
+            shared_http_client=SharedHTTPClient(),
+        )
+
+    def with_router(self, router: Optional[EndpointRouter]) -> "Client":
+        """Get a new client matching this one with a different endpoint router (or none)"""
+        return attr.evolve(
+            self,
+            router=router,
+            http_client=None,
+            shared_http_client=SharedHTTPClient(),
+        )
+
+    def with_hedger(self, hedger: Optional[Hedger]) -> "Client":
+        """Get a new client matching this one with a different hedger (or none)"""
+        return attr.evolve(
+            self,
+            hedger=hedger,
+            http_client=None,
+            shared_http_client=SharedHTTPClient(),
+        )
+
+    def with_response_cache(self, cache: Optional[ResponseCache]) -> "Client":
+        """Get a new client matching this one with a different response cache (or none)"""
+        return attr.evolve(
+            self,
+            response_cache=cache,
+            http_client=None,
+            shared_http_client=SharedHTTPClient(),
+        )
+
+    def with_event_hooks(self, hooks: Optional[EventHooks]) -> "Client":
+        """Get a new client matching this one with different event hooks (or none)"""
+        return attr.evolve(
+            self,
+            event_hooks=hooks,
+            http_client=None,
+            shared_http_client=SharedHTTPClient(),
+        )
+
+    def with_timing_sample_rate(self, rate: float) -> "Client":
+        """Get a new client matching this one with a different timing sample rate"""
+        return attr.evolve(
+            self,
+            timing_sample_rate=rate,
+            http_client=None,
+            shared_http_client=SharedHTTPClient(),
+        )
+
+    def _build_transport(
+        self, proxy: Optional[httpx.Proxy] = None
+    ) -> httpx.BaseTransport:
+        transport: httpx.BaseTransport
+        if self.transport is not None and proxy is None:
+            transport = self.transport
+        else:
+            transport = httpx.HTTPTransport(
                 verify=self.verify_ssl,
-                cookies=self.cookies,
+                limits=self.get_limits(),
+                http2=self.http2,
+                proxy=proxy,
+            )
+        if self.timing_sample_rate > 0:
+            transport = TimingTransport(transport, self.timing_sample_rate)
+        if self.max_connections_per_host is not None:
+            transport = PerHostLimitTransport(transport, self.max_connections_per_host)
+        if self.router is not None:
+            transport = FailoverTransport(transport, self.router)
+        if self.hedger is not None:
+            transport = HedgeTransport(transport, self.hedger)
+        if self.rate_limiter is not None:
+            transport = RateLimitTransport(
+                transport,
+                self.rate_limiter,
+                on_wait=None
+                if self.event_hooks is None
+                else rate_limit_hook(self.event_hooks),
             )
-        return self.http_client
+        if self.retry_policy is not None:
+            transport = RetryTransport(
+                transport,
+                self.retry_policy,
+                on_retry=None
+                if self.event_hooks is None
+                else retry_hook(self.event_hooks),
+            )
+        if self.single_flight is not None:
+            transport = SingleFlightTransport(transport, self.single_flight)
+        if self.response_cache is not None:
+            transport = CacheTransport(transport, self.response_cache)
+        if self.event_hooks is not None:
+            transport = EventHookTransport(transport, self.event_hooks)
+        return transport
 
-    def close(self) -> None:
-        """Close the underlying HTTP client"""
-        if self.http_client is not None:
-            self.http_client.close()
+    def get_http_client(self) -> httpx.Client:
+        """Get the underlying httpx.Client, creating it if necessary"""
+        http_client = self.http_client
+        if http_client is not None and self._finalizer is not None:
+            return http_client
+        with self._lock:
+            if self._finalizer is None:
+                shared = self.shared_http_client
+                self.http_client = shared.acquire(self._new_http_client)
+                self._finalizer = weakref.finalize(self, release_collected, shared)
+            assert self.http_client is not None
+            return self.http_client
+
+    def _forget_inherited_pool(self) -> None:
+        """Forget the pool after a fork; the child opens its own on first use."""
+        if self._finalizer is not None:
+            self._finalizer.detach()
+        self._lock = threading.Lock()
+        self._users = 0
+        self._finalizer = None
+        self.http_client = None
+        self.shared_http_client.forget()
+        if self._warmer is not None:
+            self._warmer.forget()
+
+    def _release(self) -> Optional[httpx.Client]:
+        """Drop this client's reference; return the pool if it's now unused."""
+        with self._lock:
+            finalizer, self._finalizer = self._finalizer, None
             self.http_client = None
+        if finalizer is not None and finalizer.detach() is not None:
+            return self.shared_http_client.release()
+        return self.shared_http_client.detach_if_unused()
+
+    def _new_http_client(self) -> httpx.Client:
+        # Passing ``transport=`` stops httpx reading proxies from the
+        # environment, so mount them here, each with the full SDK stack.
+        proxies = proxy_map(self.proxy, use_env=self.transport is None)
+        return httpx.Client(
+            timeout=self.timeout,
+            verify=self.verify_ssl,
+            cookies=self.cookies,
+            limits=self.get_limits(),
+            http2=self.http2,
+            transport=self._build_transport(),
+            mounts={
+                pattern: None if proxy is None else self._build_transport(proxy)
+                for pattern, proxy in proxies.items()
+            },
+        )
+
+    def warmup(
+        self,
+        n_connections: int = 1,
+        *,
+        refresh_interval: Optional[float] = None,
+        websocket: bool = False,
+    ) -> WarmupReport:
+        """Open and park ``n_connections`` keep-alive connections to ``base_url``
+
+        See :mod:`kittycad.warmup` for ``refresh_interval`` and ``websocket``.
+        """
+        with self._lock:
+            warmer = self._warmer
+            if warmer is None:
+                warmer = self._warmer = _Warmer()
+        return warmer.warm(
+            self,
+            n_connections,
+            refresh_interval=refresh_interval,
+            websocket=websocket,
+        )
+
+    def get_websocket_connect(self, connect: Callable[..., Any]) -> Callable[..., Any]:
+        """Get ``connect`` routed by ``router`` and bound to the socket ``warmup`` parked, if any"""
+        router = self.router
+        base = None if router is None else router.match(self.base_url)
+        if (
+            router is not None
+            and base is not None
+            and router.choose_websocket() != base
+        ):
+            # Routed elsewhere, so the socket warmed up for ``base_url`` won't do.
+            return functools.partial(_routed_websocket, connect, router)
+        sock = None if self._warmer is None else self._warmer.take_socket()
+        return connect if sock is None else functools.partial(connect, sock=sock)
+
+    def pool_stats(self) -> PoolStats:
+        """Get a snapshot of the connection pool's current occupancy"""
+        return pool_stats(self.http_client)
+
+    def close(self) -> None:
+        """Close the underlying HTTP client, unless other clients still share it"""
+        if self._warmer is not None:
+            self._warmer.close()
+        http_client = self._release()
+        if http_client is not None:
+            http_client.close()
 
     def __enter__(self) -> Self:
         """Context manager entry"""
+        with self._lock:
+            self._users += 1
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Context manager exit"""
+        """Context manager exit; closes the client once no ``with`` block holds it"""
+        with self._lock:
+            self._users = max(self._users - 1, 0)
+            if self._users:
+                return
         self.close()
 
 
 @attr.s(auto_attribs=True)
 class AsyncClient:
-    """An Async Client which has been authenticated for use on secured endpoints of the KittyCAD API."""  # noqa: E501
+    """An Async Client which has been authenticated for use on secured endpoints of the KittyCAD API.
+
+    Like :class:`Client`, one client may be shared by concurrent tasks (and
+    threads): the connection pool is created once, and ``async with client:``
+    blocks hold it open until the last of them exits. Derived clients share
+    the pool, and forked children drop it, in the same way.
+    """  # noqa: E501
 
     token: str = attr.ib(kw_only=True)
     base_url: str = attr.ib(default=DEFAULT_BASE_URL)
@@ -97,13 +480,75 @@ class AsyncClient:
     verify_ssl: Union[str, bool, ssl.SSLContext, truststore.SSLContext] = attr.ib(
         True, kw_only=True
     )
+    max_connections: Optional[int] = attr.ib(100, kw_only=True)
+    max_keepalive_connections: Optional[int] = attr.ib(20, kw_only=True)
+    keepalive_expiry: Optional[float] = attr.ib(5.0, kw_only=True)
+    max_connections_per_host: Optional[int] = attr.ib(None, kw_only=True)
+    # HTTP/2 needs the optional ``h2`` package (``pip install httpx[http2]``).
+    http2: bool = attr.ib(False, kw_only=True)
+    retry_policy: Optional[RetryPolicy] = attr.ib(default=None, kw_only=True)
+    # May be shared between sync and async clients and across threads.
+    rate_limiter: Optional[RateLimiter] = attr.ib(default=None, kw_only=True)
+    # Coalesces identical concurrent GETs; may be shared like ``rate_limiter``.
+    single_flight: Optional[SingleFlight] = attr.ib(default=None, kw_only=True)
+    response_cache: Optional[ResponseCache] = attr.ib(default=None, kw_only=True)
+    # Spreads requests over several base URLs with health-checked failover;
+    # may be shared like ``rate_limiter``. See kittycad.failover.
+    router: Optional[EndpointRouter] = attr.ib(default=None, kw_only=True)
+    # Re-sends slow idempotent requests; may be shared like ``rate_limiter``.
+    # See kittycad.hedging.
+    hedger: Optional[Hedger] = attr.ib(default=None, kw_only=True)
+    # Encodes request bodies and decodes untyped responses. See kittycad.codec
+    # to opt into orjson.
+    json_codec: JSONCodec = attr.ib(factory=JSONCodec, kw_only=True)
+    concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = attr.ib(
+        default=None, kw_only=True
+    )
+    # Lifecycle callbacks for every request and websocket; see kittycad.hooks.
+    event_hooks: Optional[EventHooks] = attr.ib(default=None, kw_only=True)
+    # Fraction of requests that record a DNS/connect/TLS/TTFB breakdown; see
+    # kittycad.timing.
+    timing_sample_rate: float = attr.ib(0.0, kw_only=True)
+    # Proxy for every request; by default HTTP(S)_PROXY/ALL_PROXY/NO_PROXY
+    # from the environment apply, unless ``transport`` is given.
+    proxy: Optional[Union[str, httpx.Proxy]] = attr.ib(default=None, kw_only=True)
+    # Innermost transport the SDK builds on (e.g. ``httpx.MockTransport`` in
+    # tests). Defaults to a pooled transport using the settings above.
+    transport: Optional[httpx.AsyncBaseTransport] = attr.ib(default=None, kw_only=True)
     http_client: Optional[httpx.AsyncClient] = attr.ib(default=None, kw_only=True)
+    # The pool this client and the clients derived from it use.
+    shared_http_client: SharedHTTPClient[httpx.AsyncClient] = attr.ib(
+        factory=SharedHTTPClient, kw_only=True, repr=False, eq=False
+    )
+    # Guards taking and dropping this client's reference to the shared pool;
+    # ``_users`` counts the open ``with`` blocks. Derived clients
+    # (``attr.evolve``) get their own.
+    _lock: threading.Lock = attr.ib(
+        factory=threading.Lock, init=False, repr=False, eq=False
+    )
+    _users: int = attr.ib(default=0, init=False, repr=False, eq=False)
+    _finalizer: Optional[weakref.finalize] = attr.ib(
+        default=None, init=False, repr=False, eq=False
+    )
+    # What ``warmup`` left behind: its refresher and a parked websocket socket.
+    _warmer: Optional[_AsyncWarmer] = attr.ib(
+        default=None, init=False, repr=False, eq=False
+    )
+
+    def __attrs_post_init__(self) -> None:
+        if self.http_client is not None and self.shared_http_client.http_client is None:
+            # An injected client is shared (and closed) like one the SDK built.
+            self.shared_http_client = SharedHTTPClient(self.http_client)
+        _clients[id(self)] = self
 
     def get_headers(self) -> Dict[str, str]:
         """Get headers to be used in all endpoints"""
         headers = {**self.headers}
         if getattr(self, "token", None):
             headers["Authorization"] = f"Bearer {self.token}"
+        if self.cookies:
+            # Sent per request, so clients sharing a pool can differ in cookies.
+            headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in self.cookies.items())
         return headers
 
     def with_headers(self, headers: Dict[str, str]) -> "AsyncClient":
@@ -131,30 +576,294 @@ class AsyncClient:
         """Get a new client matching this one with a new websocket recv timeout"""
         return attr.evolve(self, websocket_recv_timeout=timeout)
 
+    def with_json_codec(self, codec: JSONCodec) -> "AsyncClient":
+        """Get a new client matching this one with a different JSON codec"""
+        return attr.evolve(self, json_codec=codec)
+
     def with_base_url(self, url: str) -> "AsyncClient":
         """Get a new client matching this one with a new base url"""
         return attr.evolve(self, base_url=url)
 
-    def get_http_client(self) -> httpx.AsyncClient:
-        """Get the underlying httpx.AsyncClient, creating it if necessary"""
-        if self.http_client is None:
-            self.http_client = httpx.AsyncClient(
-                timeout=self.timeout,
+    def get_limits(self) -> httpx.Limits:
+        return build_limits(
+            self.max_connections,
+            self.max_keepalive_connections,
+            self.keepalive_expiry,
+        )
+
+    def with_limits(
+        self,
+        *,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        max_connections_per_host: Optional[int] = None,
+        http2: Optional[bool] = None,
+    ) -> "AsyncClient":
+        """Get a new client matching this one with different connection-pool settings
+
+        Arguments left as ``None`` keep their current value. The new client gets
+        its own pool, since pool limits can't be changed on a live pool.
+        """
+        changes: Dict[str, Any] = {
+            "max_connections": max_connections,
+            "max_keepalive_connections": max_keepalive_connections,
+            "keepalive_expiry": keepalive_expiry,
+            "max_connections_per_host": max_connections_per_host,
+            "http2": http2,
+        }
+        return attr.evolve(
+            self,
+            http_client=None,
+            shared_http_client=SharedHTTPClient(),
+            **{key: value for key, value in changes.items() if value is not None},
+        )
+
+    def with_retry_policy(self, policy: Optional[RetryPolicy]) -> "AsyncClient":
+        """Get a new client matching this one with a different retry policy (or none)"""
+        return attr.evolve(
+            self,
+            retry_policy=policy,
+            http_client=None,
+            shared_http_client=SharedHTTPClient(),
+        )
+
+    def with_rate_limiter(self, limiter: Optional[RateLimiter]) -> "AsyncClient":
+        """Get a new client matching this one with a different rate limiter (or none)"""
+        return attr.evolve(
+            self,
+            rate_limiter=limiter,
+            http_client=None,
+            shared_http_client=SharedHTTPClient(),
+        )
+
+    def with_concurrency_limiter(
+        self, limiter: Optional[AdaptiveConcurrencyLimiter]
+    ) -> "AsyncClient":
+        """Get a new client matching this one with a different concurrency limiter (or none)"""
+        return attr.evolve(
+            self,
+            concurrency_limiter=limiter,
+            http_client=None,
+            shared_http_client=SharedHTTPClient(),
+        )
+
+    def with_single_flight(
+        self, single_flight: Optional[SingleFlight]
+    ) -> "AsyncClient":
+        """Get a new client matching this one with a different single-flight group (or none)"""
+        return attr.evolve(
+            self,
+            single_flight=single_flight,
+            http_client=None,
+            shared_http_client=SharedHTTPClient(),
+        )
+
+    def with_router(self, router: Optional[EndpointRouter]) -> "AsyncClient":
+        """Get a new client matching this one with a different endpoint router (or none)"""
+        return attr.evolve(
+            self,
+            router=router,
+            http_client=None,
+            shared_http_client=SharedHTTPClient(),
+        )
+
+    def with_hedger(self, hedger: Optional[Hedger]) -> "AsyncClient":
+        """Get a new client matching this one with a different hedger (or none)"""
+        return attr.evolve(
+            self,
+            hedger=hedger,
+            http_client=None,
+            shared_http_client=SharedHTTPClient(),
+        )
+
+    def with_response_cache(self, cache: Optional[ResponseCache]) -> "AsyncClient":
+        """Get a new client matching this one with a different response cache (or none)"""
+        return attr.evolve(
+            self,
+            response_cache=cache,
+            http_client=None,
+            shared_http_client=SharedHTTPClient(),
+        )
+
+    def with_event_hooks(self, hooks: Optional[EventHooks]) -> "AsyncClient":
+        """Get a new client matching this one with different event hooks (or none)"""
+        return attr.evolve(
+            self,
+            event_hooks=hooks,
+            http_client=None,
+            shared_http_client=SharedHTTPClient(),
+        )
+
+    def with_timing_sample_rate(self, rate: float) -> "AsyncClient":
+        """Get a new client matching this one with a different timing sample rate"""
+        return attr.evolve(
+            self,
+            timing_sample_rate=rate,
+            http_client=None,
+            shared_http_client=SharedHTTPClient(),
+        )
+
+    def _build_transport(
+        self, proxy: Optional[httpx.Proxy] = None
+    ) -> httpx.AsyncBaseTransport:
+        transport: httpx.AsyncBaseTransport
+        if self.transport is not None and proxy is None:
+            transport = self.transport
+        else:
+            transport = httpx.AsyncHTTPTransport(
                 verify=self.verify_ssl,
-                cookies=self.cookies,
+                limits=self.get_limits(),
+                http2=self.http2,
+                proxy=proxy,
+            )
+        if self.timing_sample_rate > 0:
+            transport = AsyncTimingTransport(transport, self.timing_sample_rate)
+        if self.max_connections_per_host is not None:
+            transport = AsyncPerHostLimitTransport(
+                transport, self.max_connections_per_host
+            )
+        if self.router is not None:
+            transport = AsyncFailoverTransport(transport, self.router)
+        if self.hedger is not None:
+            transport = AsyncHedgeTransport(transport, self.hedger)
+        if self.concurrency_limiter is not None:
+            transport = AsyncConcurrencyLimitTransport(
+                transport, self.concurrency_limiter
+            )
+        if self.rate_limiter is not None:
+            transport = AsyncRateLimitTransport(
+                transport,
+                self.rate_limiter,
+                on_wait=None
+                if self.event_hooks is None
+                else rate_limit_hook(self.event_hooks),
+            )
+        if self.retry_policy is not None:
+            transport = AsyncRetryTransport(
+                transport,
+                self.retry_policy,
+                on_retry=None
+                if self.event_hooks is None
+                else retry_hook(self.event_hooks),
             )
-        return self.http_client
+        if self.single_flight is not None:
+            transport = AsyncSingleFlightTransport(transport, self.single_flight)
+        if self.response_cache is not None:
+            transport = AsyncCacheTransport(transport, self.response_cache)
+        if self.event_hooks is not None:
+            transport = AsyncEventHookTransport(transport, self.event_hooks)
+        return transport
 
-    async def aclose(self) -> None:
-        """Close the underlying HTTP client"""
-        if self.http_client is not None:
-            await self.http_client.aclose()
+    def get_http_client(self) -> httpx.AsyncClient:
+        """Get the underlying httpx.AsyncClient, creating it if necessary"""
+        http_client = self.http_client
+        if http_client is not None and self._finalizer is not None:
+            return http_client
+        with self._lock:
+            if self._finalizer is None:
+                shared = self.shared_http_client
+                self.http_client = shared.acquire(self._new_http_client)
+                self._finalizer = weakref.finalize(self, release_collected, shared)
+            assert self.http_client is not None
+            return self.http_client
+
+    def _forget_inherited_pool(self) -> None:
+        """Forget the pool after a fork; the child opens its own on first use."""
+        if self._finalizer is not None:
+            self._finalizer.detach()
+        self._lock = threading.Lock()
+        self._users = 0
+        self._finalizer = None
+        self.http_client = None
+        self.shared_http_client.forget()
+        if self._warmer is not None:
+            self._warmer.forget()
+
+    def _release(self) -> Optional[httpx.AsyncClient]:
+        """Drop this client's reference; return the pool if it's now unused."""
+        with self._lock:
+            finalizer, self._finalizer = self._finalizer, None
             self.http_client = None
+        if finalizer is not None and finalizer.detach() is not None:
+            return self.shared_http_client.release()
+        return self.shared_http_client.detach_if_unused()
+
+    def _new_http_client(self) -> httpx.AsyncClient:
+        # Passing ``transport=`` stops httpx reading proxies from the
+        # environment, so mount them here, each with the full SDK stack.
+        proxies = proxy_map(self.proxy, use_env=self.transport is None)
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            verify=self.verify_ssl,
+            cookies=self.cookies,
+            limits=self.get_limits(),
+            http2=self.http2,
+            transport=self._build_transport(),
+            mounts={
+                pattern: None if proxy is None else self._build_transport(proxy)
+                for pattern, proxy in proxies.items()
+            },
+        )
+
+    async def warmup(
+        self,
+        n_connections: int = 1,
+        *,
+        refresh_interval: Optional[float] = None,
+        websocket: bool = False,
+    ) -> WarmupReport:
+        """Open and park ``n_connections`` keep-alive connections to ``base_url``
+
+        See :mod:`kittycad.warmup` for ``refresh_interval`` and ``websocket``.
+        """
+        with self._lock:
+            warmer = self._warmer
+            if warmer is None:
+                warmer = self._warmer = _AsyncWarmer()
+        return await warmer.warm(
+            self,
+            n_connections,
+            refresh_interval=refresh_interval,
+            websocket=websocket,
+        )
+
+    def get_websocket_connect(self, connect: Callable[..., Any]) -> Callable[..., Any]:
+        """Get ``connect`` routed by ``router`` and bound to the socket ``warmup`` parked, if any"""
+        router = self.router
+        base = None if router is None else router.match(self.base_url)
+        if (
+            router is not None
+            and base is not None
+            and router.choose_websocket() != base
+        ):
+            # Routed elsewhere, so the socket warmed up for ``base_url`` won't do.
+            return functools.partial(_routed_websocket, connect, router)
+        sock = None if self._warmer is None else self._warmer.take_socket()
+        return connect if sock is None else functools.partial(connect, sock=sock)
+
+    def pool_stats(self) -> PoolStats:
+        """Get a snapshot of the connection pool's current occupancy"""
+        return pool_stats(self.http_client)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client, unless other clients still share it"""
+        if self._warmer is not None:
+            self._warmer.close()
+        http_client = self._release()
+        if http_client is not None:
+            await http_client.aclose()
 
     async def __aenter__(self) -> Self:
         """Async context manager entry"""
+        with self._lock:
+            self._users += 1
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Async context manager exit"""
+        """Async context manager exit; closes the client once no block holds it"""
+        with self._lock:
+            self._users = max(self._users - 1, 0)
+            if self._users:
+                return
         await self.aclose()
@@ -0,0 +1,70 @@
+"""Pluggable JSON codecs for the KittyCAD SDK.
+
+A client's ``json_codec`` encodes request bodies and websocket messages, and
+decodes responses that aren't validated into a model. Responses that are
+validated into models skip the codec: pydantic parses the raw body bytes
+itself (``model_validate_json``), without first building a ``dict``.
+
+Clients use the standard library (:class:`JSONCodec`) unless told
+otherwise. To use ``orjson`` (``pip install kittycad[orjson]``), pass
+``json_codec=OrjsonCodec()``, or ``json_codec=fastest_codec()`` to use it
+only when it is installed.
+
+Example:
+    >>> from kittycad.codec import JSONCodec
+    >>> JSONCodec().dumps({"a": [1, 2]})
+    b'{"a":[1,2]}'
+    >>> from kittycad import KittyCAD
+    >>> from kittycad.codec import fastest_codec
+    >>> client = KittyCAD(token="my-token", json_codec=fastest_codec())
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+
+class JSONCodec:
+    """JSON encoding with the standard library; the base for other codecs."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode ``obj`` as compact UTF-8 JSON."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def loads(self, data: Union[bytes, bytearray, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON encoding with ``orjson``.
+
+    Output is compact and not ASCII-escaped, and integers must fit in 64
+    bits; everything the SDK itself sends satisfies that.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, bytearray, str]) -> Any:
+        return self._orjson.loads(data)
+
+
+def fastest_codec() -> JSONCodec:
+    """Get the fastest codec available in this environment."""
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return JSONCodec()
+
+
+__all__ = ["JSONCodec", "OrjsonCodec", "fastest_codec"]
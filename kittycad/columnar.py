@@ -0,0 +1,189 @@
+"""Columnar export of paginated listings, for analytics.
+
+``iterator.columns(fields)`` turns a listing into chunks of NumPy arrays, one
+array per field, without building a model for each item: values are read
+from each page's JSON straight into per-column buffers, and a chunk is
+handed over once it has ``chunk_size`` rows. Memory stays bounded by one
+chunk however long the listing is, and each chunk converts to Arrow (with
+``pyarrow`` installed) or a NumPy record array.
+
+``fields`` lists the fields to keep, with dots reaching into nested objects
+(``"user.email"``). A mapping from field to NumPy dtype fixes each column's
+type; otherwise it's inferred from the chunk's values. Besides NumPy's own
+dtypes, ``"str"`` keeps text in an object array and ``"datetime"`` is
+``datetime64[us]`` in UTC.
+
+Missing values and nulls are marked in :attr:`ColumnChunk.valid`, and hold
+``NaN``, ``NaT``, ``None`` or zero in the column itself, depending on its
+dtype.
+
+Example:
+    >>> from kittycad import KittyCAD
+    >>> client = KittyCAD(token="my-token")
+    >>> calls = client.api_calls.user_list_api_calls()
+    >>> fields = {"created_at": "datetime", "endpoint": "str", "price": "float64"}
+    >>> for chunk in calls.columns(fields):  # doctest: +SKIP
+    ...     table = chunk.to_arrow()
+
+Needs the ``numpy`` extra: ``pip install kittycad[numpy]``.
+"""
+
+import datetime
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import attr
+
+Fields = Union[Sequence[str], Mapping[str, Optional[str]]]
+"""Field paths to export, or a mapping of field path to dtype."""
+
+_ALIASES = {"str": "object", "datetime": "datetime64[us]"}
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class ColumnChunk:
+    """A run of rows from a listing, as one array per field."""
+
+    columns: Dict[str, Any]
+    """Field path to NumPy array, in the order the fields were given."""
+    valid: Dict[str, Any]
+    """Field path to boolean array; ``False`` where the item had no value."""
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values())))
+
+    def __getitem__(self, field: str) -> Any:
+        return self.columns[field]
+
+    def to_records(self) -> Any:
+        """Get the chunk as a NumPy record array, one record per row."""
+        import numpy
+
+        dtype = [(name, column.dtype) for name, column in self.columns.items()]
+        return numpy.rec.fromarrays(list(self.columns.values()), dtype=dtype)
+
+    def to_arrow(self) -> Any:
+        """Get the chunk as a ``pyarrow.RecordBatch``, with nulls where invalid."""
+        import pyarrow
+
+        arrays = [
+            pyarrow.array(column, mask=~self.valid[name])
+            for name, column in self.columns.items()
+        ]
+        return pyarrow.RecordBatch.from_arrays(arrays, names=list(self.columns))
+
+
+def _dtype(spec: Optional[str]) -> Any:
+    import numpy
+
+    if spec is None:
+        return None
+    return numpy.dtype(_ALIASES.get(spec, spec))
+
+
+def _naive_utc(value: Union[str, datetime.datetime]) -> str:
+    # NumPy rejects timezone suffixes; the API's timestamps are UTC.
+    if isinstance(value, str):
+        if value.endswith("Z"):
+            return value[:-1]
+        if value.endswith("+00:00"):
+            return value[:-6]
+        value = datetime.datetime.fromisoformat(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value.isoformat()
+
+
+def _infer(values: List[Any]) -> Any:
+    import numpy
+
+    present = [v for v in values if v is not None]
+    if present and all(isinstance(v, bool) for v in present):
+        return numpy.dtype(bool)
+    if present and all(isinstance(v, int) and not isinstance(v, bool) for v in present):
+        return numpy.dtype("int64")
+    if present and all(
+        isinstance(v, (int, float)) and not isinstance(v, bool) for v in present
+    ):
+        return numpy.dtype("float64")
+    return numpy.dtype(object)
+
+
+def _column(values: List[Any], dtype: Any) -> Tuple[Any, Any]:
+    """Build one column and its validity mask from ``values``."""
+    import numpy
+
+    valid = numpy.fromiter(
+        (v is not None for v in values), dtype=bool, count=len(values)
+    )
+    if dtype is None:
+        dtype = _infer(values)
+    if dtype.kind == "O":
+        # Filled in place, so nested lists stay single values.
+        column = numpy.empty(len(values), dtype=object)
+        column[:] = values
+    elif dtype.kind == "M":
+        column = numpy.array(
+            ["NaT" if v is None else _naive_utc(v) for v in values], dtype=dtype
+        )
+    elif dtype.kind in "fc":
+        column = numpy.array(
+            [numpy.nan if v is None else v for v in values], dtype=dtype
+        )
+    else:
+        column = numpy.array([0 if v is None else v for v in values], dtype=dtype)
+    return column, valid
+
+
+class ColumnBuilder:
+    """Collects JSON items into per-column buffers, ``chunk_size`` rows at a time."""
+
+    def __init__(self, fields: Fields, chunk_size: int):
+        import numpy  # noqa: F401 - fail before fetching when NumPy is missing
+
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        if isinstance(fields, Mapping):
+            specs = dict(fields)
+        else:
+            specs = dict.fromkeys(fields)
+        if not specs:
+            raise ValueError("columns needs at least one field")
+        self.chunk_size = chunk_size
+        self._dtypes = {name: _dtype(spec) for name, spec in specs.items()}
+        self._paths = [(name, name.split(".")) for name in specs]
+        self._buffers: Dict[str, List[Any]] = {name: [] for name in specs}
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def append(self, item: Any) -> bool:
+        """Add ``item``'s fields as a row; return whether the chunk is full."""
+        for name, path in self._paths:
+            value = item
+            for key in path:
+                if isinstance(value, dict):
+                    value = value.get(key)
+                else:
+                    # Pages from a custom fetcher may still hold models.
+                    value = getattr(value, key, None)
+            self._buffers[name].append(value)
+        self._rows += 1
+        return self._rows >= self.chunk_size
+
+    def chunk(self) -> ColumnChunk:
+        """Turn the buffered rows into a chunk and start a new one."""
+        columns: Dict[str, Any] = {}
+        valid: Dict[str, Any] = {}
+        for name, values in self._buffers.items():
+            columns[name], valid[name] = _column(values, self._dtypes[name])
+            self._buffers[name] = []
+        self._rows = 0
+        return ColumnChunk(columns=columns, valid=valid)
+
+
+__all__ = [
+    "ColumnBuilder",
+    "ColumnChunk",
+    "Fields",
+]
@@ -0,0 +1,237 @@
+"""Adaptive concurrency limiting for :class:`kittycad.client.AsyncClient`.
+
+:class:`AdaptiveConcurrencyLimiter` caps the number of requests in flight and
+tunes that cap with AIMD (additive increase, multiplicative decrease): it
+grows by roughly one slot per window of healthy responses and is cut by
+``decrease_factor`` on 429/5xx responses and timeouts.
+
+Example:
+    >>> import asyncio
+    >>> from kittycad import AsyncKittyCAD
+    >>> from kittycad.concurrency import AdaptiveConcurrencyLimiter
+    >>> limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=128)
+    >>> client = AsyncKittyCAD(token="my-token", concurrency_limiter=limiter)
+    >>> # asyncio.gather(...) over thousands of calls now self-tunes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import time
+from typing import AsyncIterator, Deque, FrozenSet, Optional
+
+import attr
+import httpx
+
+from ._transport import _AsyncReleasingStream
+
+DEFAULT_OVERLOAD_STATUSES: FrozenSet[int] = frozenset({429, *range(500, 600)})
+"""429 and every 5xx status."""
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class ConcurrencyStats:
+    """A snapshot of an :class:`AdaptiveConcurrencyLimiter`."""
+
+    limit: int
+    in_flight: int
+    queue_depth: int
+    """Requests waiting for a slot."""
+    increases: int
+    decreases: int
+
+
+class AdaptiveConcurrencyLimiter:
+    """An AIMD-controlled async semaphore.
+
+    Slots are granted in FIFO order. Use it directly with
+    ``async with limiter.slot():`` or attach it to an ``AsyncClient`` so every
+    endpoint method acquires a slot automatically.
+
+    Instances belong to a single event loop.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_target: Optional[float] = None,
+        overload_statuses: FrozenSet[int] = DEFAULT_OVERLOAD_STATUSES,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            initial_limit: Starting in-flight cap
+            min_limit: Floor for the cap
+            max_limit: Ceiling for the cap
+            increase: Slots added per window of healthy responses
+            decrease_factor: Multiplier applied to the cap on overload
+            latency_target: Responses slower than this (seconds to headers)
+                stop the cap from growing; ``None`` ignores latency
+            overload_statuses: Status codes treated as overload (429 and
+                any 5xx by default)
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("expected 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+        self.overload_statuses = overload_statuses
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future[None]] = collections.deque()
+        self._last_decrease = float("-inf")
+        self._increases = 0
+        self._decreases = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    def stats(self) -> ConcurrencyStats:
+        return ConcurrencyStats(
+            limit=self.limit,
+            in_flight=self._in_flight,
+            queue_depth=self.queue_depth,
+            increases=self._increases,
+            decreases=self._decreases,
+        )
+
+    async def acquire(self) -> float:
+        """Wait for a slot; return the time it was granted (``time.monotonic()``)."""
+        if not self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            return time.monotonic()
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we were cancelled.
+                self._release_slot()
+            else:
+                self._waiters.remove(waiter)
+            raise
+        return time.monotonic()
+
+    def release(
+        self,
+        started: float,
+        *,
+        latency: Optional[float] = None,
+        overloaded: bool = False,
+    ) -> None:
+        """Return a slot and feed the outcome of its request into the controller.
+
+        Args:
+            started: Value returned by :meth:`acquire`
+            latency: Seconds until the response arrived (``None`` if unknown)
+            overloaded: Whether the request hit a 429/5xx/timeout
+        """
+        if overloaded:
+            # Only cut once per congestion event: requests that started
+            # before the last cut don't trigger another one.
+            if started > self._last_decrease:
+                self._limit = max(
+                    float(self.min_limit), self._limit * self.decrease_factor
+                )
+                self._last_decrease = time.monotonic()
+                self._decreases += 1
+        elif latency is not None and (
+            self.latency_target is None or latency <= self.latency_target
+        ):
+            before = self.limit
+            self._limit = min(
+                float(self.max_limit), self._limit + self.increase / self._limit
+            )
+            if self.limit > before:
+                self._increases += 1
+        self._release_slot()
+
+    def _release_slot(self) -> None:
+        self._in_flight -= 1
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the ``async with`` block."""
+        started = await self.acquire()
+        try:
+            yield
+        except (httpx.TimeoutException, asyncio.TimeoutError):
+            self.release(started, overloaded=True)
+            raise
+        except BaseException:
+            self.release(started)
+            raise
+        self.release(started, latency=time.monotonic() - started)
+
+
+class AsyncConcurrencyLimitTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that holds a limiter slot for each request.
+
+    The slot is released once the response body is closed; the controller is
+    fed the time to response headers and whether the status signals overload.
+    """
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, limiter: AdaptiveConcurrencyLimiter
+    ):
+        self.transport = transport
+        self.limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        limiter = self.limiter
+        started = await limiter.acquire()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except httpx.TimeoutException:
+            limiter.release(started, overloaded=True)
+            raise
+        except BaseException:
+            limiter.release(started)
+            raise
+        latency = time.monotonic() - started
+        overloaded = response.status_code in limiter.overload_statuses
+
+        def release() -> None:
+            limiter.release(started, latency=latency, overloaded=overloaded)
+
+        if response.is_closed:
+            release()
+            return response
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        response.stream = _AsyncReleasingStream(response.stream, release)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+__all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "AsyncConcurrencyLimitTransport",
+    "ConcurrencyStats",
+]
@@ -1,6 +1,10 @@
 """KittyCAD API exceptions."""
 
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from .retry import AttemptRecord
+    from .timing import TimingBreakdown
 
 
 class KittyCADError(Exception):
@@ -9,12 +13,20 @@ class KittyCADError(Exception):
     Attributes:
         message: Human-readable error message
         request_id: Optional request ID for debugging (when available)
+        timing: Connection timing breakdown of the last attempt, when the
+            request was sampled (see ``kittycad.timing``)
     """
 
-    def __init__(self, message: str, request_id: Optional[str] = None):
+    def __init__(
+        self,
+        message: str,
+        request_id: Optional[str] = None,
+        timing: Optional["TimingBreakdown"] = None,
+    ):
         super().__init__(message)
         self.message = message
         self.request_id = request_id
+        self.timing = timing
 
     def __str__(self) -> str:
         if self.request_id:
@@ -33,6 +45,9 @@ class KittyCADAPIError(KittyCADError):
         headers: Response headers dictionary
         request_method: HTTP method used for the request (when available)
         request_url: URL that was requested (when available)
+        attempts: Per-attempt timing when the request was retried by a
+            ``RetryPolicy`` (empty otherwise)
+        timing: Connection timing breakdown of the last attempt (when sampled)
     """
 
     def __init__(
@@ -44,13 +59,16 @@ class KittyCADAPIError(KittyCADError):
         headers: Optional[Dict[str, str]] = None,
         request_method: Optional[str] = None,
         request_url: Optional[str] = None,
+        attempts: Optional[List["AttemptRecord"]] = None,
+        timing: Optional["TimingBreakdown"] = None,
     ):
-        super().__init__(message, request_id)
+        super().__init__(message, request_id, timing)
         self.status_code = status_code
         self.error_code = error_code
         self.headers = headers or {}
         self.request_method = request_method
         self.request_url = request_url
+        self.attempts = attempts or []
 
     def __str__(self) -> str:
         base_msg = f"HTTP {self.status_code}: {self.message}"
@@ -58,6 +76,8 @@ class KittyCADAPIError(KittyCADError):
             base_msg = f"{base_msg} (error_code: {self.error_code})"
         if self.request_id:
             base_msg = f"{base_msg} (request_id: {self.request_id})"
+        if self.timing is not None:
+            base_msg = f"{base_msg} (timing: {self.timing})"
         return base_msg
 
 
@@ -93,6 +113,7 @@ class KittyCADConnectionError(KittyCADError):
         original_error: The original underlying exception that caused this error
         request_method: HTTP method attempted (when available)
         request_url: URL that was being requested (when available)
+        timing: Connection timing breakdown up to the failure (when sampled)
     """
 
     def __init__(
@@ -102,8 +123,9 @@ class KittyCADConnectionError(KittyCADError):
         original_error: Optional[Exception] = None,
         request_method: Optional[str] = None,
         request_url: Optional[str] = None,
+        timing: Optional["TimingBreakdown"] = None,
     ):
-        super().__init__(message, request_id)
+        super().__init__(message, request_id, timing)
         self.original_error = original_error
         self.request_method = request_method
         self.request_url = request_url
@@ -118,6 +140,8 @@ class KittyCADConnectionError(KittyCADError):
             base_msg = f"{base_msg} (request_id: {self.request_id})"
         if self.original_error:
             base_msg = f"{base_msg} [caused by: {self.original_error}]"
+        if self.timing is not None:
+            base_msg = f"{base_msg} (timing: {self.timing})"
         return base_msg
 
 
@@ -132,6 +156,8 @@ class KittyCADTimeoutError(KittyCADError):
         timeout_seconds: The timeout value that was exceeded (when available)
         request_method: HTTP method attempted (when available)
         request_url: URL that was being requested (when available)
+        timing: Connection timing breakdown up to the timeout (when sampled);
+            ``timing.failed_phase`` says which phase ran out of time
     """
 
     def __init__(
@@ -141,8 +167,9 @@ class KittyCADTimeoutError(KittyCADError):
         timeout_seconds: Optional[float] = None,
         request_method: Optional[str] = None,
         request_url: Optional[str] = None,
+        timing: Optional["TimingBreakdown"] = None,
     ):
-        super().__init__(message, request_id)
+        super().__init__(message, request_id, timing)
         self.timeout_seconds = timeout_seconds
         self.request_method = request_method
         self.request_url = request_url
@@ -157,4 +184,6 @@ class KittyCADTimeoutError(KittyCADError):
             )
         if self.request_id:
             base_msg = f"{base_msg} (request_id: {self.request_id})"
+        if self.timing is not None:
+            base_msg = f"{base_msg} (timing: {self.timing})"
         return base_msg
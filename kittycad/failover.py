@@ -0,0 +1,461 @@
+"""Multi-endpoint routing and failover for the KittyCAD SDK.
+
+An :class:`EndpointRouter` attached to a client spreads its requests over
+several deployments of the API, e.g. the public one and a regional or
+self-hosted one. Requests to any of the router's base URLs (the client's
+``base_url`` should be one of them) go to the healthiest, fastest endpoint:
+
+- Passive health: the time each endpoint takes to send response headers is
+  tracked as an exponentially weighted moving average, and an endpoint that
+  fails ``failure_threshold`` times in a row (connection errors, or
+  502/503/504) is ejected for ``eject_for`` seconds.
+- Active health: with ``probe_interval``, every endpoint is sent a
+  ``GET /ping`` (``meta.ping``) that often from a background thread (or a
+  task, for async clients). A probe that succeeds brings an ejected endpoint
+  back early; one that fails counts like any other failure.
+- Failover: a request that fails on one endpoint is sent on to the next one
+  straight away when that's safe, i.e. the method is idempotent (or the
+  request never left) and its body can be replayed.
+- Websockets are sticky: every websocket opened through the router goes to
+  the same endpoint for as long as that stays healthy, so sessions don't
+  straddle deployments.
+
+Among healthy endpoints the lowest average latency wins; endpoints that
+haven't been measured yet are tried first, in the order given. The endpoint
+that served a response is in its ``kittycad_endpoint`` extension. A router
+may be shared by sync and async clients.
+
+Example:
+    >>> from kittycad import KittyCAD
+    >>> from kittycad.failover import EndpointRouter
+    >>> router = EndpointRouter(
+    ...     ["https://api.zoo.dev", "https://zoo.internal.example"],
+    ...     probe_interval=10.0,
+    ... )
+    >>> client = KittyCAD(token="my-token", router=router)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+import weakref
+from typing import Callable, Collection, FrozenSet, List, Optional, Sequence
+
+import attr
+import httpx
+
+from ._transport import OPERATION_EXTENSION, OperationInfo
+from .retry import _UNSENT_ERRORS, DEFAULT_RETRY_METHODS, _body_rewinder
+
+ENDPOINT_EXTENSION = "kittycad_endpoint"
+"""Response extension holding the base URL of the endpoint that served it."""
+
+DEFAULT_FAILOVER_STATUSES: FrozenSet[int] = frozenset({502, 503, 504})
+
+_PING = OperationInfo("ping", "meta", "/ping")
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class EndpointStats:
+    """A snapshot of one endpoint's health."""
+
+    url: str
+    healthy: bool
+    """Whether the endpoint is taking requests, i.e. isn't ejected."""
+    latency: Optional[float]
+    """Average seconds to response headers, or ``None`` before the first."""
+    consecutive_failures: int
+    requests: int
+    """Requests and probes sent to the endpoint."""
+    failures: int
+
+
+class _Endpoint:
+    def __init__(self, url: str):
+        self.url = url
+        self.latency: Optional[float] = None
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.requests = 0
+        self.failures = 0
+
+
+def _normalize(url: str) -> str:
+    return url.rstrip("/")
+
+
+class EndpointRouter:
+    """Chooses among several base URLs by health and latency.
+
+    Args:
+        base_urls: the endpoints, primary first; ties go to the earlier one.
+        failure_threshold: consecutive failures that eject an endpoint.
+        eject_for: seconds an ejected endpoint gets no requests (unless
+            every endpoint is ejected, or a probe brings it back).
+        ewma_alpha: weight of the newest latency in the moving average.
+        probe_interval: seconds between active health probes of every
+            endpoint, or ``None`` for passive health only.
+        failover_statuses: statuses that count as the endpoint failing.
+    """
+
+    def __init__(
+        self,
+        base_urls: Sequence[str],
+        *,
+        failure_threshold: int = 3,
+        eject_for: float = 30.0,
+        ewma_alpha: float = 0.3,
+        probe_interval: Optional[float] = None,
+        failover_statuses: FrozenSet[int] = DEFAULT_FAILOVER_STATUSES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not base_urls:
+            raise ValueError("EndpointRouter needs at least one base URL")
+        if not 0.0 < ewma_alpha <= 1.0:
+            raise ValueError(f"ewma_alpha must be in (0, 1], got {ewma_alpha}")
+        self._endpoints = [_Endpoint(_normalize(url)) for url in base_urls]
+        self.failure_threshold = failure_threshold
+        self.eject_for = eject_for
+        self.ewma_alpha = ewma_alpha
+        self.probe_interval = probe_interval
+        self.failover_statuses = failover_statuses
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._websocket: Optional[_Endpoint] = None
+        # Token of the transport running the probes, if any, and its process:
+        # a forked child's transports probe for themselves.
+        self._prober: Optional[object] = None
+        self._prober_pid = 0
+
+    @property
+    def base_urls(self) -> List[str]:
+        return [endpoint.url for endpoint in self._endpoints]
+
+    def match(self, url: str) -> Optional[str]:
+        """Get the base URL ``url`` is under, if it's one of the router's."""
+        for endpoint in self._endpoints:
+            rest = url[len(endpoint.url) :]
+            if url.startswith(endpoint.url) and rest[:1] in ("", "/", "?"):
+                return endpoint.url
+        return None
+
+    def _find(self, url: str) -> _Endpoint:
+        return next(e for e in self._endpoints if e.url == url)
+
+    def _best(self, candidates: List[_Endpoint], now: float) -> _Endpoint:
+        healthy = [e for e in candidates if e.ejected_until <= now]
+        if not healthy:
+            # Everything is down: try whichever comes back soonest.
+            return min(candidates, key=lambda e: e.ejected_until)
+        return min(
+            healthy,
+            key=lambda e: (e.latency is not None, e.latency or 0.0),
+        )
+
+    def choose(self, exclude: Collection[str] = ()) -> Optional[str]:
+        """Get the base URL to send the next request to, skipping ``exclude``."""
+        with self._lock:
+            candidates = [e for e in self._endpoints if e.url not in exclude]
+            if not candidates:
+                return None
+            return self._best(candidates, self._clock()).url
+
+    def choose_websocket(self) -> str:
+        """Get the base URL websockets are pinned to, re-pinning if it's down."""
+        with self._lock:
+            now = self._clock()
+            pinned = self._websocket
+            if pinned is None or pinned.ejected_until > now:
+                pinned = self._websocket = self._best(self._endpoints, now)
+            return pinned.url
+
+    def record_success(self, url: str, latency: float) -> None:
+        """Record a response that arrived from ``url`` after ``latency`` seconds."""
+        with self._lock:
+            endpoint = self._find(url)
+            endpoint.requests += 1
+            endpoint.consecutive_failures = 0
+            endpoint.ejected_until = 0.0
+            if endpoint.latency is None:
+                endpoint.latency = latency
+            else:
+                endpoint.latency += self.ewma_alpha * (latency - endpoint.latency)
+
+    def record_failure(self, url: str) -> None:
+        """Record a failed request to ``url``, ejecting it after too many."""
+        with self._lock:
+            endpoint = self._find(url)
+            endpoint.requests += 1
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+            if endpoint.consecutive_failures >= self.failure_threshold:
+                endpoint.ejected_until = self._clock() + self.eject_for
+
+    def stats(self) -> List[EndpointStats]:
+        with self._lock:
+            now = self._clock()
+            return [
+                EndpointStats(
+                    url=e.url,
+                    healthy=e.ejected_until <= now,
+                    latency=e.latency,
+                    consecutive_failures=e.consecutive_failures,
+                    requests=e.requests,
+                    failures=e.failures,
+                )
+                for e in self._endpoints
+            ]
+
+    def route_websocket(self, url: str) -> str:
+        """Rewrite a websocket URL built from a router base URL to the pinned one."""
+        http_url = url.replace("ws", "http", 1)
+        base = self.match(http_url)
+        if base is None:
+            return url
+        routed = self.choose_websocket() + http_url[len(base) :]
+        return routed.replace("http", "ws", 1)
+
+    def _claim_probing(self, prober: object) -> bool:
+        """Let one transport sharing the router run the probes."""
+        with self._lock:
+            if self._prober is not None and self._prober_pid == os.getpid():
+                return False
+            self._prober = prober
+            self._prober_pid = os.getpid()
+            return True
+
+    def _release_probing(self, prober: object) -> None:
+        with self._lock:
+            if self._prober is prober:
+                self._prober = None
+
+
+def _routed(request: httpx.Request, base: str, endpoint: str) -> httpx.Request:
+    """Copy ``request`` with its URL moved from ``base`` to ``endpoint``."""
+    if endpoint == base:
+        return request
+    url = httpx.URL(endpoint + str(request.url)[len(base) :])
+    headers = request.headers.copy()
+    headers["Host"] = url.netloc.decode("ascii")
+    return httpx.Request(
+        request.method,
+        url,
+        headers=headers,
+        stream=request.stream,
+        extensions=request.extensions,
+    )
+
+
+class _Failover:
+    """Per-request bookkeeping shared by the sync and async transports."""
+
+    def __init__(self, router: EndpointRouter, request: httpx.Request, base: str):
+        self.router = router
+        self.request = request
+        self.base = base
+        self.idempotent = request.method.upper() in DEFAULT_RETRY_METHODS
+        self.rewind = _body_rewinder(request)
+        self.tried: List[str] = []
+        self.endpoint = base
+        self.start = 0.0
+
+    def next(self) -> Optional[httpx.Request]:
+        """Get the request for the next endpoint, or ``None`` if none is left."""
+        endpoint = self.router.choose(exclude=self.tried)
+        if endpoint is None:
+            return None
+        if self.tried:
+            assert self.rewind is not None
+            self.rewind()
+        self.tried.append(endpoint)
+        self.endpoint = endpoint
+        self.start = time.perf_counter()
+        return _routed(self.request, self.base, endpoint)
+
+    def _more(self) -> bool:
+        endpoints = len(self.router.base_urls)
+        return len(self.tried) < endpoints and self.rewind is not None
+
+    def on_error(self, error: Exception) -> bool:
+        """Record a transport error; return whether to fail over."""
+        self.router.record_failure(self.endpoint)
+        unsent = isinstance(error, _UNSENT_ERRORS)
+        return (unsent or self.idempotent) and self._more()
+
+    def on_response(self, response: httpx.Response) -> bool:
+        """Record a response; return whether to fail over."""
+        if response.status_code in self.router.failover_statuses:
+            self.router.record_failure(self.endpoint)
+            if self.idempotent and self._more():
+                return True
+        else:
+            latency = time.perf_counter() - self.start
+            self.router.record_success(self.endpoint, latency)
+        response.extensions[ENDPOINT_EXTENSION] = self.endpoint
+        return False
+
+
+def _probe_request(endpoint: str) -> httpx.Request:
+    return httpx.Request(
+        "GET", f"{endpoint}/ping", extensions={OPERATION_EXTENSION: _PING}
+    )
+
+
+class FailoverTransport(httpx.BaseTransport):
+    """Transport wrapper routing requests with an :class:`EndpointRouter`."""
+
+    def __init__(self, transport: httpx.BaseTransport, router: EndpointRouter):
+        self.transport = transport
+        self.router = router
+        self._stop: Optional[threading.Event] = None
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        base = self.router.match(str(request.url))
+        if base is None:
+            return self.transport.handle_request(request)
+        if self.router.probe_interval is not None and self._stop is None:
+            self._start_probing(self.router.probe_interval)
+        failover = _Failover(self.router, request, base)
+        while True:
+            routed = failover.next()
+            assert routed is not None
+            try:
+                response = self.transport.handle_request(routed)
+            except httpx.TransportError as e:
+                if not failover.on_error(e):
+                    raise
+                continue
+            if not failover.on_response(response):
+                return response
+            response.close()
+
+    def probe(self) -> None:
+        """Ping every endpoint once and record how it went."""
+        for endpoint in self.router.base_urls:
+            start = time.perf_counter()
+            try:
+                response = self.transport.handle_request(_probe_request(endpoint))
+                response.read()
+                response.close()
+            except httpx.TransportError:
+                self.router.record_failure(endpoint)
+                continue
+            if response.is_success:
+                self.router.record_success(endpoint, time.perf_counter() - start)
+            else:
+                self.router.record_failure(endpoint)
+
+    def _start_probing(self, interval: float) -> None:
+        stop = self._stop = threading.Event()
+        router = self.router
+        if not router._claim_probing(stop):
+            # Another transport sharing the router probes.
+            return
+        ref = weakref.ref(self)
+
+        def run() -> None:
+            while not stop.wait(interval):
+                transport = ref()
+                if transport is None:
+                    break
+                transport.probe()
+                del transport
+            router._release_probing(stop)
+
+        threading.Thread(target=run, name="kittycad-probe", daemon=True).start()
+
+    def close(self) -> None:
+        if self._stop is not None:
+            self._stop.set()
+            self.router._release_probing(self._stop)
+        self.transport.close()
+
+
+class AsyncFailoverTransport(httpx.AsyncBaseTransport):
+    """Async variant of :class:`FailoverTransport`."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, router: EndpointRouter):
+        self.transport = transport
+        self.router = router
+        self._task: Optional[asyncio.Task[None]] = None
+        self._token: Optional[object] = None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        base = self.router.match(str(request.url))
+        if base is None:
+            return await self.transport.handle_async_request(request)
+        if self.router.probe_interval is not None and self._token is None:
+            self._start_probing(self.router.probe_interval)
+        failover = _Failover(self.router, request, base)
+        while True:
+            routed = failover.next()
+            assert routed is not None
+            try:
+                response = await self.transport.handle_async_request(routed)
+            except httpx.TransportError as e:
+                if not failover.on_error(e):
+                    raise
+                continue
+            if not failover.on_response(response):
+                return response
+            await response.aclose()
+
+    async def probe(self) -> None:
+        """Ping every endpoint once and record how it went."""
+        for endpoint in self.router.base_urls:
+            start = time.perf_counter()
+            try:
+                request = _probe_request(endpoint)
+                response = await self.transport.handle_async_request(request)
+                await response.aread()
+                await response.aclose()
+            except httpx.TransportError:
+                self.router.record_failure(endpoint)
+                continue
+            if response.is_success:
+                self.router.record_success(endpoint, time.perf_counter() - start)
+            else:
+                self.router.record_failure(endpoint)
+
+    def _start_probing(self, interval: float) -> None:
+        token = self._token = object()
+        router = self.router
+        if not router._claim_probing(token):
+            # Another transport sharing the router probes.
+            return
+        ref = weakref.ref(self)
+
+        async def run() -> None:
+            try:
+                while True:
+                    await asyncio.sleep(interval)
+                    transport = ref()
+                    if transport is None:
+                        break
+                    await transport.probe()
+                    del transport
+            finally:
+                router._release_probing(token)
+
+        self._task = asyncio.get_running_loop().create_task(run())
+
+    async def aclose(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._token is not None:
+            self.router._release_probing(self._token)
+        await self.transport.aclose()
+
+
+__all__ = [
+    "DEFAULT_FAILOVER_STATUSES",
+    "ENDPOINT_EXTENSION",
+    "AsyncFailoverTransport",
+    "EndpointRouter",
+    "EndpointStats",
+    "FailoverTransport",
+]
@@ -0,0 +1,345 @@
+"""Hedged requests for the KittyCAD SDK.
+
+A :class:`Hedger` attached to a client cuts the tail latency of idempotent
+requests (``GET`` by default): when an attempt hasn't got its response
+headers after the ``percentile``-th latency recently seen for the same
+operation, a second, identical attempt is sent, the first response to
+arrive is used and the other attempt is cancelled. Async clients cancel the
+losing task outright; sync clients can't interrupt a blocked thread, so the
+loser's response is closed as soon as it arrives.
+
+Hedges add load, so they are capped by a :class:`HedgeBudget` (a fraction of
+hedgeable requests), and an operation isn't hedged until ``min_samples`` of
+its latencies are known. :meth:`Hedger.stats` counts how many requests were
+hedged and how often the hedge won; each response says which attempt it came
+from in its ``kittycad_hedge`` extension (``"primary"`` or ``"hedge"``).
+
+Example:
+    >>> from kittycad import KittyCAD
+    >>> from kittycad.hedging import Hedger
+    >>> hedger = Hedger(
+    ...     percentile=95,
+    ...     operations={"get_async_operation", "get_text_to_cad_part_for_user"},
+    ... )
+    >>> client = KittyCAD(token="my-token", hedger=hedger)
+    >>> # ... traffic ...
+    >>> hedger.stats().hedge_wins  # doctest: +SKIP
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextvars
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Deque, Dict, Iterable, Optional, Tuple
+
+import attr
+import httpx
+
+from ._transport import get_operation
+from .retry import RetryBudget
+
+HEDGE_EXTENSION = "kittycad_hedge"
+"""Response extension saying which attempt won: ``"primary"`` or ``"hedge"``."""
+
+DEFAULT_HEDGE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class HedgeBudget(RetryBudget):
+    """Caps hedges to a fraction of hedgeable requests.
+
+    Works like :class:`kittycad.retry.RetryBudget`: every hedgeable request
+    deposits ``ratio`` tokens and every hedge withdraws one, on top of a
+    floor of ``min_hedges``.
+    """
+
+    def __init__(self, ratio: float = 0.05, min_hedges: int = 10):
+        super().__init__(ratio=ratio, min_retries=min_hedges)
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class HedgeStats:
+    """Counters for a :class:`Hedger`."""
+
+    requests: int
+    """Hedgeable requests sent."""
+    hedged: int
+    """Requests that got a second attempt."""
+    hedge_wins: int
+    """Hedged requests answered by the second attempt."""
+    over_budget: int
+    """Requests that would have been hedged but for the budget."""
+
+    @property
+    def hedge_rate(self) -> float:
+        return self.hedged / self.requests if self.requests else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of hedges that beat the first attempt."""
+        return self.hedge_wins / self.hedged if self.hedged else 0.0
+
+
+class Hedger:
+    """Decides when to hedge, and keeps the latencies and counters it needs.
+
+    May be shared by several sync and async clients.
+
+    Args:
+        percentile: hedge once an attempt is slower than this percentile of
+            the operation's recent latencies (to response headers).
+        min_samples: latencies needed before an operation is hedged.
+        window: recent latencies kept per operation.
+        min_delay: never hedge sooner than this many seconds.
+        max_delay: never wait longer than this many seconds to hedge.
+        methods: methods that may be hedged; they must be idempotent.
+        operations: operation ids to hedge, or ``None`` for every request
+            with one of ``methods``.
+        budget: caps the extra load, or ``None`` for no cap.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        *,
+        min_samples: int = 20,
+        window: int = 200,
+        min_delay: float = 0.0,
+        max_delay: Optional[float] = None,
+        methods: Iterable[str] = DEFAULT_HEDGE_METHODS,
+        operations: Optional[Iterable[str]] = None,
+        budget: Optional[HedgeBudget] = None,
+    ):
+        if not 0.0 < percentile < 100.0:
+            raise ValueError(f"percentile must be in (0, 100), got {percentile}")
+        if min_samples < 1:
+            raise ValueError(f"min_samples must be at least 1, got {min_samples}")
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window = window
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.methods = frozenset(method.upper() for method in methods)
+        self.operations = None if operations is None else frozenset(operations)
+        self.budget = HedgeBudget() if budget is None else budget
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._requests = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._over_budget = 0
+
+    def key_for(self, request: httpx.Request) -> Optional[str]:
+        """Get the key latencies are tracked under, or ``None`` if not hedgeable."""
+        if request.method.upper() not in self.methods:
+            return None
+        operation = get_operation(request)
+        if self.operations is not None:
+            if operation is None or operation.operation_id not in self.operations:
+                return None
+        if operation is not None:
+            return operation.operation_id
+        return f"{request.method} {request.url.path}"
+
+    def delay_for(self, key: str) -> Optional[float]:
+        """Seconds to wait before hedging, or ``None`` while samples are short."""
+        with self._lock:
+            self._requests += 1
+            samples = self._latencies.get(key)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        delay = max(self.min_delay, ordered[index])
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+        self.budget.deposit()
+        return delay
+
+    def record(self, key: str, latency: float) -> None:
+        """Record how long an attempt took to get its response headers."""
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None:
+                samples = self._latencies[key] = collections.deque(maxlen=self.window)
+            samples.append(latency)
+
+    def try_hedge(self) -> bool:
+        """Take a hedge from the budget; ``False`` if it's spent."""
+        allowed = self.budget.try_withdraw()
+        with self._lock:
+            if allowed:
+                self._hedged += 1
+            else:
+                self._over_budget += 1
+        return allowed
+
+    def _won(self, hedge: bool) -> None:
+        if hedge:
+            with self._lock:
+                self._hedge_wins += 1
+
+    def stats(self) -> HedgeStats:
+        with self._lock:
+            return HedgeStats(
+                requests=self._requests,
+                hedged=self._hedged,
+                hedge_wins=self._hedge_wins,
+                over_budget=self._over_budget,
+            )
+
+
+def _copy(request: httpx.Request) -> httpx.Request:
+    """A second request like ``request``, with extensions of its own."""
+    return httpx.Request(
+        request.method,
+        request.url,
+        headers=request.headers,
+        stream=request.stream,
+        extensions=dict(request.extensions),
+    )
+
+
+def _mark(response: httpx.Response, hedge: bool) -> httpx.Response:
+    response.extensions[HEDGE_EXTENSION] = "hedge" if hedge else "primary"
+    return response
+
+
+class HedgeTransport(httpx.BaseTransport):
+    """Transport wrapper that hedges requests with a :class:`Hedger`.
+
+    Hedgeable requests are sent from a thread pool, so the caller can stop
+    waiting for the first attempt and send a second one.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, hedger: Hedger):
+        self.transport = transport
+        self.hedger = hedger
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _submit(self, key: str, request: httpx.Request) -> "Future[httpx.Response]":
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(thread_name_prefix="kittycad-hedge")
+            executor = self._executor
+        context = contextvars.copy_context()
+        return executor.submit(context.run, self._send, key, request)
+
+    def _send(self, key: str, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        response = self.transport.handle_request(request)
+        self.hedger.record(key, time.perf_counter() - start)
+        return response
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key = self.hedger.key_for(request)
+        delay = None if key is None else self.hedger.delay_for(key)
+        if key is None or delay is None:
+            if key is None:
+                return self.transport.handle_request(request)
+            return _mark(self._send(key, request), hedge=False)
+
+        primary = self._submit(key, request)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self.hedger.try_hedge():
+            return _mark(primary.result(), hedge=False)
+        hedge = self._submit(key, _copy(request))
+        attempts = {primary: False, hedge: True}
+        done, _ = wait(attempts, return_when=FIRST_COMPLETED)
+        winner = primary if primary in done else hedge
+        if winner.exception() is not None:
+            # The first to finish failed; the other one may still succeed.
+            winner = hedge if winner is primary else primary
+            if winner.exception() is not None:
+                primary.result()
+        loser = hedge if winner is primary else primary
+        loser.add_done_callback(_close_loser)
+        self.hedger._won(attempts[winner])
+        return _mark(winner.result(), attempts[winner])
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        self.transport.close()
+
+
+def _close_loser(future: "Future[httpx.Response]") -> None:
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+class AsyncHedgeTransport(httpx.AsyncBaseTransport):
+    """Async variant of :class:`HedgeTransport`, which cancels the loser."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, hedger: Hedger):
+        self.transport = transport
+        self.hedger = hedger
+
+    async def _send(self, key: str, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        self.hedger.record(key, time.perf_counter() - start)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = self.hedger.key_for(request)
+        delay = None if key is None else self.hedger.delay_for(key)
+        if key is None or delay is None:
+            if key is None:
+                return await self.transport.handle_async_request(request)
+            return _mark(await self._send(key, request), hedge=False)
+
+        primary = asyncio.ensure_future(self._send(key, request))
+        tasks: Dict["asyncio.Future[httpx.Response]", bool] = {primary: False}
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if not done and self.hedger.try_hedge():
+                hedge = asyncio.ensure_future(self._send(key, _copy(request)))
+                tasks[hedge] = True
+            winner, is_hedge = await _first_success(tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        # Let the loser unwind, and release its response if it had one.
+        await asyncio.wait(tasks)
+        for task in tasks:
+            if not task.cancelled() and task.exception() is None:
+                if task.result() is not winner:
+                    await task.result().aclose()
+        if len(tasks) > 1:
+            self.hedger._won(is_hedge)
+        return _mark(winner, is_hedge)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+async def _first_success(
+    tasks: Dict["asyncio.Future[httpx.Response]", bool],
+) -> Tuple[httpx.Response, bool]:
+    """Wait for the first attempt to succeed; raise the primary's error if none."""
+    pending = set(tasks)
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() is None:
+                return task.result(), tasks[task]
+    primary = next(iter(tasks))
+    return primary.result(), False
+
+
+__all__ = [
+    "DEFAULT_HEDGE_METHODS",
+    "HEDGE_EXTENSION",
+    "AsyncHedgeTransport",
+    "HedgeBudget",
+    "HedgeStats",
+    "HedgeTransport",
+    "Hedger",
+]
@@ -0,0 +1,393 @@
+"""A local SQLite copy of API call history, kept up to date incrementally.
+
+:class:`ApiCallHistory` pulls ``api_calls.user_list_api_calls`` (or
+``org_list_api_calls``) newest first and stops as soon as it reaches the
+high-water mark of the previous sync, so a nightly sync fetches only the
+new calls. Rows are upserted a page at a time, and the high-water mark only
+moves once a sync has finished: a sync that dies part way leaves the mark
+where it was and the next one fills the gap.
+
+Queries then run locally, without touching the API:
+
+    >>> from kittycad import KittyCAD
+    >>> from kittycad.history import ApiCallHistory
+    >>> history = ApiCallHistory("api-calls.db")  # doctest: +SKIP
+    >>> history.sync(KittyCAD(token="my-token"))  # doctest: +SKIP
+    >>> history.cost_per_endpoint_day()  # doctest: +SKIP
+    >>> history.latency_percentiles(endpoint="/file/conversion")  # doctest: +SKIP
+
+The database is plain SQLite (table ``api_calls``), so it can also be
+queried directly.
+"""
+
+import contextlib
+import datetime
+import math
+import os
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import attr
+
+from .models.api_call_with_price import ApiCallWithPrice
+from .models.created_at_sort_mode import CreatedAtSortMode
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS api_calls (
+    id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    started_at TEXT,
+    completed_at TEXT,
+    latency REAL,
+    duration INTEGER,
+    endpoint TEXT,
+    method TEXT NOT NULL,
+    status_code INTEGER,
+    price REAL,
+    minutes INTEGER,
+    seconds INTEGER,
+    user_id TEXT NOT NULL,
+    org_id TEXT,
+    email TEXT,
+    origin TEXT,
+    ip_address TEXT,
+    user_agent TEXT NOT NULL,
+    token TEXT NOT NULL,
+    stripe_invoice_item_id TEXT,
+    request_query_params TEXT
+);
+CREATE INDEX IF NOT EXISTS api_calls_created_at ON api_calls (created_at);
+CREATE INDEX IF NOT EXISTS api_calls_endpoint ON api_calls (endpoint, created_at);
+CREATE INDEX IF NOT EXISTS api_calls_user_id ON api_calls (user_id, created_at);
+CREATE TABLE IF NOT EXISTS kittycad_sync_state (
+    scope TEXT PRIMARY KEY,
+    high_water_mark TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+"""
+
+_COLUMNS = (
+    "id",
+    "created_at",
+    "updated_at",
+    "started_at",
+    "completed_at",
+    "latency",
+    "duration",
+    "endpoint",
+    "method",
+    "status_code",
+    "price",
+    "minutes",
+    "seconds",
+    "user_id",
+    "org_id",
+    "email",
+    "origin",
+    "ip_address",
+    "user_agent",
+    "token",
+    "stripe_invoice_item_id",
+    "request_query_params",
+)
+
+_UPSERT = "INSERT OR REPLACE INTO api_calls ({}) VALUES ({})".format(
+    ", ".join(_COLUMNS), ", ".join("?" * len(_COLUMNS))
+)
+
+
+def _timestamp(value: Optional[datetime.datetime]) -> Optional[str]:
+    """Format ``value`` in UTC so that timestamps sort as text."""
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _parse(value: str) -> datetime.datetime:
+    return datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%fZ").replace(
+        tzinfo=datetime.timezone.utc
+    )
+
+
+def _row(call: ApiCallWithPrice) -> Tuple[Any, ...]:
+    latency = None
+    if call.started_at is not None and call.completed_at is not None:
+        latency = (call.completed_at - call.started_at).total_seconds()
+    return (
+        str(call.id),
+        _timestamp(call.created_at),
+        _timestamp(call.updated_at),
+        _timestamp(call.started_at),
+        _timestamp(call.completed_at),
+        latency,
+        call.duration,
+        call.endpoint,
+        str(call.method),
+        call.status_code,
+        call.price,
+        call.minutes,
+        call.seconds,
+        str(call.user_id),
+        None if call.org_id is None else str(call.org_id),
+        call.email,
+        call.origin,
+        call.ip_address,
+        call.user_agent,
+        str(call.token),
+        call.stripe_invoice_item_id,
+        call.request_query_params,
+    )
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class SyncReport:
+    """What one :meth:`ApiCallHistory.sync` did."""
+
+    pages: int
+    calls: int
+    """Calls fetched and upserted, including any re-read by the overlap."""
+    high_water_mark: Optional[datetime.datetime]
+    """``created_at`` of the newest call stored, after the sync."""
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class EndpointDayCost:
+    """One row of :meth:`ApiCallHistory.cost_per_endpoint_day`."""
+
+    day: datetime.date
+    endpoint: Optional[str]
+    calls: int
+    cost: float
+
+
+class _Sync:
+    """Bookkeeping for one sync: where to stop, and what was seen."""
+
+    def __init__(self, history: "ApiCallHistory", scope: str):
+        self.history = history
+        self.scope = scope
+        self.mark = history.high_water_mark(org=scope == "org")
+        self.stop_before = None
+        if self.mark is not None:
+            self.stop_before = _timestamp(self.mark - history.overlap)
+        self.newest: Optional[str] = None
+        self.pages = 0
+        self.calls = 0
+
+    def add(self, items: Optional[Sequence[ApiCallWithPrice]]) -> bool:
+        """Store a page; return whether older pages are still needed."""
+        self.pages += 1
+        rows = []
+        reached = False
+        for call in items or []:
+            row = _row(call)
+            if self.stop_before is not None and row[1] < self.stop_before:
+                reached = True
+                break
+            rows.append(row)
+        if rows:
+            newest = max(row[1] for row in rows)
+            if self.newest is None or newest > self.newest:
+                self.newest = newest
+            self.history._upsert_rows(rows)
+            self.calls += len(rows)
+        return not reached
+
+    def finish(self) -> SyncReport:
+        mark = self.history._advance(self.scope, self.newest)
+        return SyncReport(pages=self.pages, calls=self.calls, high_water_mark=mark)
+
+
+class ApiCallHistory:
+    """API call history stored in a SQLite database at ``path``.
+
+    Args:
+        path: The database file; created if missing.
+        overlap: How far before the high-water mark each sync re-reads, to
+            pick up calls that were still running (or not yet priced) when
+            the previous sync saw them.
+        page_size: ``limit`` for each page fetched.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        overlap: datetime.timedelta = datetime.timedelta(hours=1),
+        page_size: int = 100,
+    ):
+        self.path = os.path.expanduser(path)
+        self.overlap = overlap
+        self.page_size = page_size
+        with self._transaction() as db:
+            db.executescript(_SCHEMA)
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        db = sqlite3.connect(self.path, timeout=30.0)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def upsert(self, calls: Iterable[ApiCallWithPrice]) -> int:
+        """Insert or replace ``calls``; return how many there were."""
+        return self._upsert_rows([_row(call) for call in calls])
+
+    def _upsert_rows(self, rows: List[Tuple[Any, ...]]) -> int:
+        with self._transaction() as db:
+            db.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def high_water_mark(self, *, org: bool = False) -> Optional[datetime.datetime]:
+        """``created_at`` of the newest call the last finished sync stored."""
+        with self._transaction() as db:
+            row = db.execute(
+                "SELECT high_water_mark FROM kittycad_sync_state WHERE scope = ?",
+                ("org" if org else "user",),
+            ).fetchone()
+        return None if row is None else _parse(row[0])
+
+    def _advance(
+        self, scope: str, newest: Optional[str]
+    ) -> Optional[datetime.datetime]:
+        with self._transaction() as db:
+            row = db.execute(
+                "SELECT high_water_mark FROM kittycad_sync_state WHERE scope = ?",
+                (scope,),
+            ).fetchone()
+            mark = None if row is None else row[0]
+            if newest is not None and (mark is None or newest > mark):
+                mark = newest
+            if mark is not None:
+                db.execute(
+                    "INSERT OR REPLACE INTO kittycad_sync_state"
+                    " (scope, high_water_mark, synced_at) VALUES (?, ?, ?)",
+                    (scope, mark, time.time()),
+                )
+        return None if mark is None else _parse(mark)
+
+    def sync(self, client: Any, *, org: bool = False) -> SyncReport:
+        """Fetch the calls made since the last sync from a ``KittyCAD`` client.
+
+        With ``org=True``, syncs every call made in the user's org (this
+        needs an org admin) rather than the user's own.
+        """
+        run = _Sync(self, "org" if org else "user")
+        api = client.api_calls
+        listing = api.org_list_api_calls if org else api.user_list_api_calls
+        pages = listing(
+            limit=self.page_size, sort_by=CreatedAtSortMode.CREATED_AT_DESCENDING
+        ).pages()
+        try:
+            for page in pages:
+                if not run.add(page.items):
+                    break
+        finally:
+            pages.close()
+        return run.finish()
+
+    async def async_sync(self, client: Any, *, org: bool = False) -> SyncReport:
+        """Like :meth:`sync`, for an ``AsyncKittyCAD`` client.
+
+        The database is written on the event loop; each write is one page.
+        """
+        run = _Sync(self, "org" if org else "user")
+        api = client.api_calls
+        listing = api.org_list_api_calls if org else api.user_list_api_calls
+        pages = listing(
+            limit=self.page_size, sort_by=CreatedAtSortMode.CREATED_AT_DESCENDING
+        ).pages()
+        try:
+            async for page in pages:
+                if not run.add(page.items):
+                    break
+        finally:
+            await pages.aclose()
+        return run.finish()
+
+    def count(self) -> int:
+        with self._transaction() as db:
+            return db.execute("SELECT COUNT(*) FROM api_calls").fetchone()[0]
+
+    def cost_per_endpoint_day(
+        self,
+        start: Optional[datetime.datetime] = None,
+        end: Optional[datetime.datetime] = None,
+    ) -> List[EndpointDayCost]:
+        """Calls and total price per endpoint per (UTC) day, oldest day first."""
+        where, params = _window(start, end)
+        with self._transaction() as db:
+            rows = db.execute(
+                "SELECT substr(created_at, 1, 10) AS day, endpoint, COUNT(*),"
+                " COALESCE(SUM(price), 0.0) FROM api_calls"
+                f" {where} GROUP BY day, endpoint ORDER BY day, endpoint",
+                params,
+            ).fetchall()
+        return [
+            EndpointDayCost(
+                day=datetime.date.fromisoformat(day),
+                endpoint=endpoint,
+                calls=calls,
+                cost=cost,
+            )
+            for day, endpoint, calls, cost in rows
+        ]
+
+    def latency_percentiles(
+        self,
+        percentiles: Sequence[float] = (50.0, 90.0, 99.0),
+        *,
+        endpoint: Optional[str] = None,
+        start: Optional[datetime.datetime] = None,
+        end: Optional[datetime.datetime] = None,
+    ) -> Dict[float, Optional[float]]:
+        """Nearest-rank percentiles of call latency, in seconds.
+
+        Latency is ``completed_at - started_at``; calls missing either are
+        left out. A percentile is ``None`` if no calls match.
+        """
+        where, params = _window(start, end)
+        where += " AND " if where else "WHERE "
+        where += "latency IS NOT NULL"
+        if endpoint is not None:
+            where += " AND endpoint = ?"
+            params.append(endpoint)
+        result: Dict[float, Optional[float]] = {}
+        with self._transaction() as db:
+            total = db.execute(
+                f"SELECT COUNT(*) FROM api_calls {where}", params
+            ).fetchone()[0]
+            for p in percentiles:
+                if total == 0:
+                    result[p] = None
+                    continue
+                rank = max(1, math.ceil(p / 100 * total))
+                result[p] = db.execute(
+                    f"SELECT latency FROM api_calls {where}"
+                    " ORDER BY latency LIMIT 1 OFFSET ?",
+                    [*params, rank - 1],
+                ).fetchone()[0]
+        return result
+
+
+def _window(
+    start: Optional[datetime.datetime], end: Optional[datetime.datetime]
+) -> Tuple[str, List[Any]]:
+    clauses = []
+    params: List[Any] = []
+    if start is not None:
+        clauses.append("created_at >= ?")
+        params.append(_timestamp(start))
+    if end is not None:
+        clauses.append("created_at < ?")
+        params.append(_timestamp(end))
+    return ("WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+__all__ = ["ApiCallHistory", "EndpointDayCost", "SyncReport"]
@@ -0,0 +1,633 @@
+"""Request lifecycle event hooks for the KittyCAD SDK.
+
+Attach an :class:`EventHooks` to a client to observe every endpoint call:
+
+- ``on_request_start``: the request is about to be sent
+- ``on_response_headers``: the status line and headers arrived
+- ``on_response_end``: the response body was fully read (or closed)
+- ``on_error``: the request failed without a response
+- ``on_retry``: an attempt failed and will be retried (see
+  :mod:`kittycad.retry`)
+- ``on_rate_limit``: the request waited for the client-side rate limiter
+  (see :mod:`kittycad.rate_limit`)
+
+Every hook receives a :class:`RequestEvent` naming the operation by its id,
+tag and URL template (never the expanded URL, which may contain ids), along
+with whatever is known at that point: status, byte counts, time to first
+byte and total duration. Events of the same request share an
+``exchange_id``.
+
+Websocket connections opened by the generated clients emit the same events,
+with ``protocol="websocket"``: connecting is a ``GET``, every ``send`` and
+``recv`` is reported as a ``SEND`` or ``RECV`` "request" whose
+``parent_id`` is the connection's exchange, and ``close`` ends the
+connection's exchange with a ``CLOSE``. Page iterators likewise report
+iterating every page as one ``PAGINATE`` exchange with
+``protocol="pagination"``, the parent of each page request.
+
+Clients without hooks don't wrap anything, so they pay nothing.
+
+Example:
+    >>> from kittycad import KittyCAD
+    >>> from kittycad.hooks import EventHooks
+    >>> hooks = EventHooks()
+    >>> @hooks.on_response_end
+    ... def log(event):
+    ...     print(event.operation_id, event.status_code, event.duration)
+    >>> client = KittyCAD(token="my-token", event_hooks=hooks)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import itertools
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+)
+
+import attr
+import httpx
+
+from ._transport import (
+    OperationInfo,
+    _AsyncReleasingStream,
+    _ReleasingStream,
+    get_operation,
+)
+from .retry import AttemptRecord, RetryCallback
+from .timing import TIMING_EXTENSION, TimingBreakdown
+
+EVENTS = (
+    "on_request_start",
+    "on_response_headers",
+    "on_response_end",
+    "on_error",
+    "on_retry",
+    "on_rate_limit",
+)
+
+EXCHANGE_EXTENSION = "kittycad_exchange"
+"""Request extension holding the request's ``exchange_id``."""
+
+_exchange_ids = itertools.count(1)
+# The exchange that requests started here belong to, e.g. a pagination run.
+_parent: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar(
+    "kittycad_parent_exchange", default=None
+)
+
+
+@attr.s(auto_attribs=True, frozen=True, slots=True)
+class RequestEvent:
+    """One lifecycle event of a request or websocket operation."""
+
+    event: str
+    """Which hook this is for, e.g. ``"on_response_end"``."""
+    method: str
+    url_template: str
+    """The spec path, e.g. ``/users/{id}``; the URL path if the operation is unknown."""
+    operation_id: Optional[str] = None
+    tag: Optional[str] = None
+    protocol: str = "http"
+    status_code: Optional[int] = None
+    request_bytes: Optional[int] = None
+    """Request body size, when known up front."""
+    response_bytes: Optional[int] = None
+    ttfb: Optional[float] = None
+    """Seconds from sending the request to receiving the response headers."""
+    duration: Optional[float] = None
+    """Seconds from sending the request to this event."""
+    attempt: Optional[int] = None
+    """For ``on_retry``: the 1-based attempt that failed."""
+    error: Optional[BaseException] = None
+    exchange_id: int = 0
+    """Identifies the request (or websocket connection, or pagination run)."""
+    parent_id: Optional[int] = None
+    """The exchange this one is part of, e.g. the connection of a ``SEND``."""
+    count: Optional[int] = None
+    """Pages fetched (``PAGINATE``) or messages exchanged (``CLOSE``)."""
+    timing: Optional[TimingBreakdown] = None
+    """Connection timing of the last attempt, when sampled (see :mod:`kittycad.timing`)."""
+
+
+Hook = Callable[[RequestEvent], None]
+
+
+class EventHooks:
+    """Callbacks for request lifecycle events.
+
+    Hooks run synchronously on the thread (or event loop) making the
+    request, so they should be quick. Register them through the constructor
+    or with the decorator-style methods named after each event.
+    """
+
+    def __init__(
+        self,
+        on_request_start: Optional[List[Hook]] = None,
+        on_response_headers: Optional[List[Hook]] = None,
+        on_response_end: Optional[List[Hook]] = None,
+        on_error: Optional[List[Hook]] = None,
+        on_retry: Optional[List[Hook]] = None,
+        on_rate_limit: Optional[List[Hook]] = None,
+    ):
+        self._hooks: Dict[str, List[Hook]] = {
+            "on_request_start": list(on_request_start or ()),
+            "on_response_headers": list(on_response_headers or ()),
+            "on_response_end": list(on_response_end or ()),
+            "on_error": list(on_error or ()),
+            "on_retry": list(on_retry or ()),
+            "on_rate_limit": list(on_rate_limit or ()),
+        }
+
+    def register(self, event: str, hook: Hook) -> Hook:
+        """Add ``hook`` for ``event`` (one of :data:`EVENTS`); return it."""
+        if event not in self._hooks:
+            raise ValueError(f"unknown event {event!r}, expected one of {EVENTS}")
+        self._hooks[event].append(hook)
+        return hook
+
+    def on_request_start(self, hook: Hook) -> Hook:
+        return self.register("on_request_start", hook)
+
+    def on_response_headers(self, hook: Hook) -> Hook:
+        return self.register("on_response_headers", hook)
+
+    def on_response_end(self, hook: Hook) -> Hook:
+        return self.register("on_response_end", hook)
+
+    def on_error(self, hook: Hook) -> Hook:
+        return self.register("on_error", hook)
+
+    def on_retry(self, hook: Hook) -> Hook:
+        return self.register("on_retry", hook)
+
+    def on_rate_limit(self, hook: Hook) -> Hook:
+        return self.register("on_rate_limit", hook)
+
+    def emit(self, event: RequestEvent) -> None:
+        for hook in self._hooks[event.event]:
+            hook(event)
+
+
+def _request_fields(request: httpx.Request) -> Dict[str, Any]:
+    operation = get_operation(request)
+    return {
+        "method": request.method,
+        "url_template": operation.url_template if operation else request.url.path,
+        "operation_id": operation.operation_id if operation else None,
+        "tag": operation.tag if operation else None,
+        "exchange_id": request.extensions.get(EXCHANGE_EXTENSION, 0),
+    }
+
+
+def _request_bytes(request: httpx.Request) -> Optional[int]:
+    length = request.headers.get("content-length")
+    if length is not None:
+        return int(length)
+    return None if "transfer-encoding" in request.headers else 0
+
+
+class _Exchange:
+    """Emits the events of one HTTP request."""
+
+    def __init__(self, hooks: EventHooks, request: httpx.Request):
+        self.hooks = hooks
+        self.id = next(_exchange_ids)
+        request.extensions[EXCHANGE_EXTENSION] = self.id
+        self.base: Dict[str, Any] = {
+            **_request_fields(request),
+            "request_bytes": _request_bytes(request),
+            "parent_id": _parent.get(),
+        }
+        self.extensions = request.extensions
+        self.start = time.perf_counter()
+        self.ttfb: Optional[float] = None
+        self.status_code: Optional[int] = None
+        self.received = 0
+        self.emit("on_request_start")
+
+    def emit(self, event: str, **fields: Any) -> None:
+        self.hooks.emit(RequestEvent(event=event, **self.base, **fields))
+
+    def error(self, error: BaseException) -> None:
+        self.emit(
+            "on_error",
+            status_code=self.status_code,
+            ttfb=self.ttfb,
+            duration=time.perf_counter() - self.start,
+            error=error,
+            timing=self.extensions.get(TIMING_EXTENSION),
+        )
+
+    def headers(self, response: httpx.Response) -> None:
+        self.ttfb = time.perf_counter() - self.start
+        self.status_code = response.status_code
+        self.emit("on_response_headers", status_code=self.status_code, ttfb=self.ttfb)
+
+    def count(self, chunk: bytes) -> bytes:
+        self.received += len(chunk)
+        return chunk
+
+    def end(self) -> None:
+        self.emit(
+            "on_response_end",
+            status_code=self.status_code,
+            response_bytes=self.received,
+            ttfb=self.ttfb,
+            duration=time.perf_counter() - self.start,
+            timing=self.extensions.get(TIMING_EXTENSION),
+        )
+
+
+class _CountingStream(_ReleasingStream):
+    def __init__(self, stream: httpx.SyncByteStream, exchange: _Exchange):
+        super().__init__(stream, exchange.end)
+        self._exchange = exchange
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            yield self._exchange.count(chunk)
+
+
+class _AsyncCountingStream(_AsyncReleasingStream):
+    def __init__(self, stream: httpx.AsyncByteStream, exchange: _Exchange):
+        super().__init__(stream, exchange.end)
+        self._exchange = exchange
+
+    async def __aiter__(self):  # type: ignore[override]
+        async for chunk in self._stream:
+            yield self._exchange.count(chunk)
+
+
+class EventHookTransport(httpx.BaseTransport):
+    """Transport wrapper that reports each request to an :class:`EventHooks`."""
+
+    def __init__(self, transport: httpx.BaseTransport, hooks: EventHooks):
+        self.transport = transport
+        self.hooks = hooks
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        exchange = _Exchange(self.hooks, request)
+        try:
+            response = self.transport.handle_request(request)
+        except Exception as e:
+            exchange.error(e)
+            raise
+        exchange.headers(response)
+        if response.is_closed:
+            exchange.received = len(response.content)
+            exchange.end()
+            return response
+        assert isinstance(response.stream, httpx.SyncByteStream)
+        response.stream = _CountingStream(response.stream, exchange)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncEventHookTransport(httpx.AsyncBaseTransport):
+    """Async variant of :class:`EventHookTransport`."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, hooks: EventHooks):
+        self.transport = transport
+        self.hooks = hooks
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        exchange = _Exchange(self.hooks, request)
+        try:
+            response = await self.transport.handle_async_request(request)
+        except Exception as e:
+            exchange.error(e)
+            raise
+        exchange.headers(response)
+        if response.is_closed:
+            exchange.received = len(response.content)
+            exchange.end()
+            return response
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        response.stream = _AsyncCountingStream(response.stream, exchange)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def retry_hook(hooks: EventHooks) -> RetryCallback:
+    """Adapt ``hooks`` to the ``on_retry`` callback of the retry transports."""
+
+    def on_retry(request: httpx.Request, record: AttemptRecord) -> None:
+        hooks.emit(
+            RequestEvent(
+                event="on_retry",
+                **_request_fields(request),
+                status_code=record.status_code,
+                request_bytes=_request_bytes(request),
+                duration=record.duration,
+                attempt=record.attempt,
+            )
+        )
+
+    return on_retry
+
+
+def rate_limit_hook(hooks: EventHooks) -> Callable[[httpx.Request, float], None]:
+    """Adapt ``hooks`` to the ``on_wait`` callback of the rate-limit transports."""
+
+    def on_wait(request: httpx.Request, wait: float) -> None:
+        hooks.emit(
+            RequestEvent(
+                event="on_rate_limit", **_request_fields(request), duration=wait
+            )
+        )
+
+    return on_wait
+
+
+class OperationScope:
+    """Reports an operation spanning several requests as one exchange.
+
+    Requests made inside :meth:`child` carry this exchange as their
+    ``parent_id``.
+    """
+
+    def __init__(
+        self, hooks: EventHooks, operation: OperationInfo, protocol: str, method: str
+    ):
+        self.hooks = hooks
+        self.id = next(_exchange_ids)
+        self.base: Dict[str, Any] = {
+            "method": method,
+            "url_template": operation.url_template,
+            "operation_id": operation.operation_id,
+            "tag": operation.tag,
+            "protocol": protocol,
+            "exchange_id": self.id,
+            "parent_id": _parent.get(),
+        }
+        self.start = time.perf_counter()
+        self.emit("on_request_start")
+
+    def emit(self, event: str, **fields: Any) -> None:
+        self.hooks.emit(RequestEvent(event=event, **self.base, **fields))
+
+    @contextlib.contextmanager
+    def child(self) -> Iterator[None]:
+        token = _parent.set(self.id)
+        try:
+            yield
+        finally:
+            _parent.reset(token)
+
+    def end(self, count: Optional[int] = None) -> None:
+        duration = time.perf_counter() - self.start
+        self.emit("on_response_end", duration=duration, count=count)
+
+    def error(self, error: BaseException, count: Optional[int] = None) -> None:
+        duration = time.perf_counter() - self.start
+        self.emit("on_error", duration=duration, error=error, count=count)
+
+
+def _message_size(message: Any) -> int:
+    if isinstance(message, str):
+        return len(message.encode())
+    return len(message)
+
+
+class _WebSocketEvents:
+    """Emits the events of one websocket connection."""
+
+    def __init__(self, hooks: EventHooks, operation: OperationInfo):
+        self.scope = OperationScope(hooks, operation, "websocket", "GET")
+        self.messages = 0
+
+    def emit(self, event: str, method: str, exchange_id: int, **fields: Any) -> None:
+        base = {**self.scope.base, "method": method, "exchange_id": exchange_id}
+        if exchange_id != self.scope.id:
+            base["parent_id"] = self.scope.id
+        self.scope.hooks.emit(RequestEvent(event=event, **base, **fields))
+
+    def message(self, method: str, **fields: Any) -> int:
+        """Start a ``SEND`` or ``RECV``; return its exchange id."""
+        exchange_id = next(_exchange_ids)
+        self.emit("on_request_start", method, exchange_id, **fields)
+        return exchange_id
+
+    def sent(self, exchange_id: int, size: int, start: float) -> None:
+        self.messages += 1
+        duration = time.perf_counter() - start
+        self.emit(
+            "on_response_end",
+            "SEND",
+            exchange_id,
+            request_bytes=size,
+            duration=duration,
+        )
+
+    def received(self, exchange_id: int, message: Any, start: float) -> None:
+        self.messages += 1
+        duration = time.perf_counter() - start
+        self.emit(
+            "on_response_end",
+            "RECV",
+            exchange_id,
+            response_bytes=_message_size(message),
+            ttfb=duration,
+            duration=duration,
+        )
+
+    def failed(
+        self, method: str, exchange_id: int, error: BaseException, start: float
+    ) -> None:
+        duration = time.perf_counter() - start
+        self.emit("on_error", method, exchange_id, duration=duration, error=error)
+
+    def connected(self) -> None:
+        duration = time.perf_counter() - self.scope.start
+        self.emit(
+            "on_response_headers",
+            "GET",
+            self.scope.id,
+            status_code=101,
+            ttfb=duration,
+            duration=duration,
+        )
+
+    def closed(self) -> None:
+        duration = time.perf_counter() - self.scope.start
+        self.emit(
+            "on_response_end",
+            "CLOSE",
+            self.scope.id,
+            status_code=101,
+            duration=duration,
+            count=self.messages,
+        )
+
+
+class InstrumentedWebSocket:
+    """Wraps a sync websocket connection and reports each send and recv.
+
+    Anything other than ``send``, ``recv``, iteration and ``close`` is passed
+    through to the wrapped connection.
+    """
+
+    def __init__(self, ws: Any, events: _WebSocketEvents):
+        self._ws = ws
+        self._events = events
+
+    def send(self, message: Any, *args: Any, **kwargs: Any) -> None:
+        size = _message_size(message)
+        exchange_id = self._events.message("SEND", request_bytes=size)
+        start = time.perf_counter()
+        try:
+            self._ws.send(message, *args, **kwargs)
+        except Exception as e:
+            self._events.failed("SEND", exchange_id, e, start)
+            raise
+        self._events.sent(exchange_id, size, start)
+
+    def recv(self, *args: Any, **kwargs: Any) -> Any:
+        exchange_id = self._events.message("RECV")
+        start = time.perf_counter()
+        try:
+            message = self._ws.recv(*args, **kwargs)
+        except Exception as e:
+            self._events.failed("RECV", exchange_id, e, start)
+            raise
+        self._events.received(exchange_id, message, start)
+        return message
+
+    def __iter__(self) -> Iterator[Any]:
+        start = time.perf_counter()
+        for message in self._ws:
+            self._events.received(next(_exchange_ids), message, start)
+            yield message
+            start = time.perf_counter()
+
+    def close(self, *args: Any, **kwargs: Any) -> None:
+        try:
+            self._ws.close(*args, **kwargs)
+        finally:
+            self._events.closed()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._ws, name)
+
+
+class AsyncInstrumentedWebSocket:
+    """Async variant of :class:`InstrumentedWebSocket`."""
+
+    def __init__(self, ws: Any, events: _WebSocketEvents):
+        self._ws = ws
+        self._events = events
+
+    async def send(self, message: Any, *args: Any, **kwargs: Any) -> None:
+        size = _message_size(message)
+        exchange_id = self._events.message("SEND", request_bytes=size)
+        start = time.perf_counter()
+        try:
+            await self._ws.send(message, *args, **kwargs)
+        except Exception as e:
+            self._events.failed("SEND", exchange_id, e, start)
+            raise
+        self._events.sent(exchange_id, size, start)
+
+    async def recv(self, *args: Any, **kwargs: Any) -> Any:
+        exchange_id = self._events.message("RECV")
+        start = time.perf_counter()
+        try:
+            message = await self._ws.recv(*args, **kwargs)
+        except Exception as e:
+            self._events.failed("RECV", exchange_id, e, start)
+            raise
+        self._events.received(exchange_id, message, start)
+        return message
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        start = time.perf_counter()
+        async for message in self._ws:
+            self._events.received(next(_exchange_ids), message, start)
+            yield message
+            start = time.perf_counter()
+
+    async def close(self, *args: Any, **kwargs: Any) -> None:
+        try:
+            await self._ws.close(*args, **kwargs)
+        finally:
+            self._events.closed()
+
+    async def __aenter__(self) -> "AsyncInstrumentedWebSocket":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._ws, name)
+
+
+def connect_websocket(
+    hooks: Optional[EventHooks],
+    operation: OperationInfo,
+    factory: Callable[..., Any],
+    url: str,
+    **kwargs: Any,
+) -> Any:
+    """Open a websocket with ``factory``, instrumented when ``hooks`` is set."""
+    if hooks is None:
+        return factory(url, **kwargs)
+    events = _WebSocketEvents(hooks, operation)
+    try:
+        ws = factory(url, **kwargs)
+    except Exception as e:
+        events.scope.error(e)
+        raise
+    events.connected()
+    return InstrumentedWebSocket(ws, events)
+
+
+async def connect_websocket_async(
+    hooks: Optional[EventHooks],
+    operation: OperationInfo,
+    factory: Callable[..., Awaitable[Any]],
+    url: str,
+    **kwargs: Any,
+) -> Any:
+    """Async variant of :func:`connect_websocket`."""
+    if hooks is None:
+        return await factory(url, **kwargs)
+    events = _WebSocketEvents(hooks, operation)
+    try:
+        ws = await factory(url, **kwargs)
+    except Exception as e:
+        events.scope.error(e)
+        raise
+    events.connected()
+    return AsyncInstrumentedWebSocket(ws, events)
+
+
+__all__ = [
+    "EVENTS",
+    "EXCHANGE_EXTENSION",
+    "AsyncEventHookTransport",
+    "AsyncInstrumentedWebSocket",
+    "EventHookTransport",
+    "EventHooks",
+    "Hook",
+    "InstrumentedWebSocket",
+    "OperationScope",
+    "RequestEvent",
+    "connect_websocket",
+    "connect_websocket_async",
+    "rate_limit_hook",
+    "retry_hook",
+]
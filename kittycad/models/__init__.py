@@ -1,576 +1,1175 @@
 """Contains all the data models used in inputs/outputs"""
 
-from .account_provider import AccountProvider
-from .add_hole_from_offset import AddHoleFromOffset
-from .add_org_member import AddOrgMember
-from .address import Address
-from .address_details import AddressDetails
-from .adjacency_info import AdjacencyInfo
-from .aggregate_usage_collection_threshold_bounds import (
-    AggregateUsageCollectionThresholdBounds,
-)
-from .aggregate_usage_collection_threshold_set import (
-    AggregateUsageCollectionThresholdSet,
-)
-from .aggregate_usage_collection_threshold_source import (
-    AggregateUsageCollectionThresholdSource,
-)
-from .aggregate_usage_collection_threshold_view import (
-    AggregateUsageCollectionThresholdView,
-)
-from .angle import Angle
-from .annotation_basic_dimension import AnnotationBasicDimension
-from .annotation_feature_control import AnnotationFeatureControl
-from .annotation_feature_tag import AnnotationFeatureTag
-from .annotation_line_end import AnnotationLineEnd
-from .annotation_line_end_options import AnnotationLineEndOptions
-from .annotation_mbd_basic_dimension import AnnotationMbdBasicDimension
-from .annotation_mbd_control_frame import AnnotationMbdControlFrame
-from .annotation_options import AnnotationOptions
-from .annotation_text_alignment_x import AnnotationTextAlignmentX
-from .annotation_text_alignment_y import AnnotationTextAlignmentY
-from .annotation_text_options import AnnotationTextOptions
-from .annotation_type import AnnotationType
-from .announcement import Announcement
-from .announcement_list import AnnouncementList
-from .api_call_status import ApiCallStatus
-from .api_call_with_price import ApiCallWithPrice
-from .api_call_with_price_results_page import ApiCallWithPriceResultsPage
-from .api_endpoint import ApiEndpoint
-from .api_error import ApiError
-from .api_token import ApiToken
-from .api_token_results_page import ApiTokenResultsPage
-from .api_token_uuid import ApiTokenUuid
-from .api_token_with_full_token import ApiTokenWithFullToken
-from .app_client_info import AppClientInfo
-from .async_api_call_output import AsyncApiCallOutput
-from .auth_api_key_response import AuthApiKeyResponse
-from .auth_callback import AuthCallback
-from .axis import Axis
-from .axis_direction_pair import AxisDirectionPair
-from .base import KittyCadBaseModel
-from .batch_response import BatchResponse
-from .begin_execution import BeginExecution
-from .billing_cadence import BillingCadence
-from .billing_commitment_scope import BillingCommitmentScope
-from .billing_contract_item_input import BillingContractItemInput
-from .billing_contract_item_view import BillingContractItemView
-from .billing_contract_status import BillingContractStatus
-from .billing_contract_upsert import BillingContractUpsert
-from .billing_contract_view import BillingContractView
-from .billing_external_customer_id import BillingExternalCustomerId
-from .billing_info import BillingInfo
-from .billing_item_code import BillingItemCode
-from .billing_item_kind import BillingItemKind
-from .billing_period_index import BillingPeriodIndex
-from .billing_period_input import BillingPeriodInput
-from .billing_period_status import BillingPeriodStatus
-from .billing_period_view import BillingPeriodView
-from .billing_provider import BillingProvider
-from .billing_quantity import BillingQuantity
-from .billing_rate_tier_input import BillingRateTierInput
-from .billing_rate_tier_view import BillingRateTierView
-from .billing_rollover_policy import BillingRolloverPolicy
-from .billing_unit import BillingUnit
-from .billing_unit_granularity import BillingUnitGranularity
-from .blend_type import BlendType
-from .block_reason import BlockReason
-from .bodies_created import BodiesCreated
-from .bodies_updated import BodiesUpdated
-from .body_created import BodyCreated
-from .body_type import BodyType
-from .body_updated import BodyUpdated
-from .boolean_imprint import BooleanImprint
-from .boolean_intersection import BooleanIntersection
-from .boolean_subtract import BooleanSubtract
-from .boolean_union import BooleanUnion
-from .bounding_box import BoundingBox
-from .cad_design_workflow import CadDesignWorkflow
-from .cad_discovery_source import CadDiscoverySource
-from .cad_experience_level import CadExperienceLevel
-from .cad_industry import CadIndustry
-from .cad_user_type import CadUserType
-from .camera_drag_end import CameraDragEnd
-from .camera_drag_interaction_type import CameraDragInteractionType
-from .camera_drag_move import CameraDragMove
-from .camera_drag_start import CameraDragStart
-from .camera_movement import CameraMovement
-from .camera_settings import CameraSettings
-from .camera_view_state import CameraViewState
-from .card_details import CardDetails
-from .center_of_mass import CenterOfMass
-from .client_error_report import ClientErrorReport
-from .client_error_report_accepted import ClientErrorReportAccepted
-from .client_metrics import ClientMetrics
-from .close_path import ClosePath
-from .closest_edge import ClosestEdge
-from .code_language import CodeLanguage
-from .code_option import CodeOption
-from .code_output import CodeOutput
-from .color import Color
-from .company_size import CompanySize
-from .complementary_edges import ComplementaryEdges
-from .component_transform import ComponentTransform
-from .conversation import Conversation
-from .conversation_results_page import ConversationResultsPage
-from .conversion_params import ConversionParams
-from .conversion_sort_mode import ConversionSortMode
-from .country_code import CountryCode
-from .coupon import Coupon
-from .create_custom_model import CreateCustomModel
-from .create_o_auth2_app_request import CreateOAuth2AppRequest
-from .create_org_dataset import CreateOrgDataset
-from .create_planar_surface import CreatePlanarSurface
-from .create_project_share_link_request import CreateProjectShareLinkRequest
-from .create_region import CreateRegion
-from .create_region_from_query_point import CreateRegionFromQueryPoint
-from .create_shortlink_request import CreateShortlinkRequest
-from .create_shortlink_response import CreateShortlinkResponse
-from .created_at_sort_mode import CreatedAtSortMode
-from .currency import Currency
-from .curve_debug import CurveDebug
-from .curve_get_control_points import CurveGetControlPoints
-from .curve_get_end_points import CurveGetEndPoints
-from .curve_get_type import CurveGetType
-from .curve_set_constraint import CurveSetConstraint
-from .curve_type import CurveType
-from .curve_type_debug import CurveTypeDebug
-from .custom_model import CustomModel
-from .customer import Customer
-from .customer_balance import CustomerBalance
-from .cut_strategy import CutStrategy
-from .cut_type import CutType
-from .cut_type_v2 import CutTypeV2
-from .dataset_s3_policies import DatasetS3Policies
-from .default_camera_center_to_scene import DefaultCameraCenterToScene
-from .default_camera_center_to_selection import DefaultCameraCenterToSelection
-from .default_camera_focus_on import DefaultCameraFocusOn
-from .default_camera_get_settings import DefaultCameraGetSettings
-from .default_camera_get_view import DefaultCameraGetView
-from .default_camera_look_at import DefaultCameraLookAt
-from .default_camera_perspective_settings import DefaultCameraPerspectiveSettings
-from .default_camera_set_orthographic import DefaultCameraSetOrthographic
-from .default_camera_set_perspective import DefaultCameraSetPerspective
-from .default_camera_set_view import DefaultCameraSetView
-from .default_camera_zoom import DefaultCameraZoom
-from .density import Density
-from .der_encoded_key_pair import DerEncodedKeyPair
-from .device_access_token_request_form import DeviceAccessTokenRequestForm
-from .device_auth_confirm_params import DeviceAuthConfirmParams
-from .device_auth_request_form import DeviceAuthRequestForm
-from .direction import Direction
-from .direction_type import DirectionType
-from .discount import Discount
-from .discount_code import DiscountCode
-from .distance_type import DistanceType
-from .dxf_storage import DxfStorage
-from .edge_cut_version import EdgeCutVersion
-from .edge_get_length import EdgeGetLength
-from .edge_info import EdgeInfo
-from .edge_lines_visible import EdgeLinesVisible
-from .edge_specifier import EdgeSpecifier
-from .email_authentication_form import EmailAuthenticationForm
-from .email_marketing_confirm_token_body import EmailMarketingConfirmTokenBody
-from .email_marketing_consent_state import EmailMarketingConsentState
-from .email_marketing_consent_status import EmailMarketingConsentStatus
-from .empty import Empty
-from .enable_sketch_mode import EnableSketchMode
-from .end_execution import EndExecution
-from .engine_util_evaluate_path import EngineUtilEvaluatePath
-from .entity_circular_pattern import EntityCircularPattern
-from .entity_clone import EntityClone
-from .entity_delete_children import EntityDeleteChildren
-from .entity_fade import EntityFade
-from .entity_get_all_child_uuids import EntityGetAllChildUuids
-from .entity_get_child_uuid import EntityGetChildUuid
-from .entity_get_distance import EntityGetDistance
-from .entity_get_index import EntityGetIndex
-from .entity_get_num_children import EntityGetNumChildren
-from .entity_get_parent_id import EntityGetParentId
-from .entity_get_primitive_index import EntityGetPrimitiveIndex
-from .entity_get_sketch_paths import EntityGetSketchPaths
-from .entity_linear_pattern import EntityLinearPattern
-from .entity_linear_pattern_transform import EntityLinearPatternTransform
-from .entity_make_helix import EntityMakeHelix
-from .entity_make_helix_from_edge import EntityMakeHelixFromEdge
-from .entity_make_helix_from_params import EntityMakeHelixFromParams
-from .entity_mirror import EntityMirror
-from .entity_mirror_across import EntityMirrorAcross
-from .entity_mirror_across_edge import EntityMirrorAcrossEdge
-from .entity_reference import EntityReference
-from .entity_set_opacity import EntitySetOpacity
-from .entity_type import EntityType
-from .error import Error
-from .error_code import ErrorCode
-from .export import Export
-from .export2d import Export2d
-from .export3d import Export3d
-from .export_file import ExportFile
-from .extend_path import ExtendPath
-from .extended_user import ExtendedUser
-from .extrude import Extrude
-from .extrude_method import ExtrudeMethod
-from .extrude_reference import ExtrudeReference
-from .extrude_to_reference import ExtrudeToReference
-from .extruded_face_info import ExtrudedFaceInfo
-from .extrusion_face_cap_type import ExtrusionFaceCapType
-from .extrusion_face_info import ExtrusionFaceInfo
-from .face_edge_info import FaceEdgeInfo
-from .face_get_center import FaceGetCenter
-from .face_get_gradient import FaceGetGradient
-from .face_get_position import FaceGetPosition
-from .face_is_planar import FaceIsPlanar
-from .factory_customer_catalog_option import FactoryCustomerCatalogOption
-from .factory_job_response import FactoryJobResponse
-from .failure_web_socket_response import FailureWebSocketResponse
-from .fbx_storage import FbxStorage
-from .feature import Feature
-from .file_center_of_mass import FileCenterOfMass
-from .file_conversion import FileConversion
-from .file_density import FileDensity
-from .file_export_format import FileExportFormat
-from .file_import_format import FileImportFormat
-from .file_mass import FileMass
-from .file_surface_area import FileSurfaceArea
-from .file_volume import FileVolume
-from .fraction_of_edge import FractionOfEdge
-from .get_entity_type import GetEntityType
-from .get_num_objects import GetNumObjects
-from .get_sketch_mode_plane import GetSketchModePlane
-from .global_axis import GlobalAxis
-from .gltf_presentation import GltfPresentation
-from .gltf_storage import GltfStorage
-from .handle_mouse_drag_end import HandleMouseDragEnd
-from .handle_mouse_drag_move import HandleMouseDragMove
-from .handle_mouse_drag_start import HandleMouseDragStart
-from .highlight_set_entities import HighlightSetEntities
-from .highlight_set_entity import HighlightSetEntity
-from .ice_server import IceServer
-from .idp_metadata_source import IdpMetadataSource
-from .image_format import ImageFormat
-from .import_file import ImportFile
-from .import_files import ImportFiles
-from .imported_geometry import ImportedGeometry
-from .input_format3d import InputFormat3d
-from .invoice import Invoice
-from .invoice_line_item import InvoiceLineItem
-from .invoice_refund_status import InvoiceRefundStatus
-from .invoice_results_page import InvoiceResultsPage
-from .invoice_status import InvoiceStatus
-from .ip_addr_info import IpAddrInfo
-from .kcl_code_completion_params import KclCodeCompletionParams
-from .kcl_code_completion_request import KclCodeCompletionRequest
-from .kcl_code_completion_response import KclCodeCompletionResponse
-from .kcl_model import KclModel
-from .kcl_project_file_role import KclProjectFileRole
-from .kcl_project_preview_status import KclProjectPreviewStatus
-from .kcl_project_publication_status import KclProjectPublicationStatus
-from .kcl_project_share_link_access_mode import KclProjectShareLinkAccessMode
-from .length_unit import LengthUnit
-from .lenient_url import LenientUrl
-from .loft import Loft
-from .make_axes_gizmo import MakeAxesGizmo
-from .make_offset_path import MakeOffsetPath
-from .make_plane import MakePlane
-from .mass import Mass
-from .mbd_symbol import MbdSymbol
-from .method import Method
-from .mirror_across import MirrorAcross
-from .ml_copilot_client_message import MlCopilotClientMessage
-from .ml_copilot_file import MlCopilotFile
-from .ml_copilot_mode import MlCopilotMode
-from .ml_copilot_mode_option import MlCopilotModeOption
-from .ml_copilot_server_message import MlCopilotServerMessage
-from .ml_copilot_supported_models import MlCopilotSupportedModels
-from .ml_copilot_system_command import MlCopilotSystemCommand
-from .ml_copilot_tool import MlCopilotTool
-from .ml_feedback import MlFeedback
-from .ml_reasoning_effort import MlReasoningEffort
-from .ml_tool_result import MlToolResult
-from .modeling_app_share_links import ModelingAppShareLinks
-from .modeling_app_subscription_tier import ModelingAppSubscriptionTier
-from .modeling_cmd import ModelingCmd
-from .modeling_cmd_id import ModelingCmdId
-from .modeling_cmd_req import ModelingCmdReq
-from .modeling_session_data import ModelingSessionData
-from .mouse_click import MouseClick
-from .mouse_move import MouseMove
-from .move_path_pen import MovePathPen
-from .new_annotation import NewAnnotation
-from .o_auth2_app_client_type import OAuth2AppClientType
-from .o_auth2_app_grant_type import OAuth2AppGrantType
-from .o_auth2_app_mode import OAuth2AppMode
-from .o_auth2_app_response import OAuth2AppResponse
-from .o_auth2_app_response_results_page import OAuth2AppResponseResultsPage
-from .o_auth2_authorization_code_uuid import OAuth2AuthorizationCodeUuid
-from .o_auth2_authorization_decision_response import OAuth2AuthorizationDecisionResponse
-from .o_auth2_authorization_request_response import OAuth2AuthorizationRequestResponse
-from .o_auth2_authorization_response_type import OAuth2AuthorizationResponseType
-from .o_auth2_code_challenge_method import OAuth2CodeChallengeMethod
-from .o_auth2_refresh_token_uuid import OAuth2RefreshTokenUuid
-from .o_auth2_scope import OAuth2Scope
-from .o_auth2_scopes import OAuth2Scopes
-from .o_auth2_token_grant_type import OAuth2TokenGrantType
-from .o_auth2_token_request_form import OAuth2TokenRequestForm
-from .oauth2_client_info import OAuth2ClientInfo
-from .oauth2_grant_type import OAuth2GrantType
-from .object_bring_to_front import ObjectBringToFront
-from .object_set_material_params_pbr import ObjectSetMaterialParamsPbr
-from .object_set_name import ObjectSetName
-from .object_visible import ObjectVisible
-from .offset_surface import OffsetSurface
-from .ok_modeling_cmd_response import OkModelingCmdResponse
-from .ok_web_socket_response_data import OkWebSocketResponseData
-from .opposite_for_angle import OppositeForAngle
-from .opposite_for_length_unit import OppositeForLengthUnit
-from .org import Org
-from .org_dataset import OrgDataset
-from .org_dataset_conversion_stats_response import OrgDatasetConversionStatsResponse
-from .org_dataset_file_conversion_details import OrgDatasetFileConversionDetails
-from .org_dataset_file_conversion_phase import OrgDatasetFileConversionPhase
-from .org_dataset_file_conversion_status import OrgDatasetFileConversionStatus
-from .org_dataset_file_conversion_summary import OrgDatasetFileConversionSummary
-from .org_dataset_file_conversion_summary_results_page import (
-    OrgDatasetFileConversionSummaryResultsPage,
-)
-from .org_dataset_results_page import OrgDatasetResultsPage
-from .org_dataset_semantic_search_match import OrgDatasetSemanticSearchMatch
-from .org_dataset_snapshot_image import OrgDatasetSnapshotImage
-from .org_dataset_source import OrgDatasetSource
-from .org_dataset_status import OrgDatasetStatus
-from .org_details import OrgDetails
-from .org_member import OrgMember
-from .org_member_results_page import OrgMemberResultsPage
-from .org_role import OrgRole
-from .org_skill_response import OrgSkillResponse
-from .orient_to_face import OrientToFace
-from .origin_type import OriginType
-from .output_file import OutputFile
-from .output_format2d import OutputFormat2d
-from .output_format3d import OutputFormat3d
-from .path_command import PathCommand
-from .path_component_constraint_bound import PathComponentConstraintBound
-from .path_component_constraint_type import PathComponentConstraintType
-from .path_get_curve_uuid import PathGetCurveUuid
-from .path_get_curve_uuids_for_vertices import PathGetCurveUuidsForVertices
-from .path_get_info import PathGetInfo
-from .path_get_sketch_target_uuid import PathGetSketchTargetUuid
-from .path_get_vertex_uuids import PathGetVertexUuids
-from .path_segment import PathSegment
-from .path_segment_info import PathSegmentInfo
-from .payment_intent import PaymentIntent
-from .payment_method import PaymentMethod
-from .payment_method_card_checks import PaymentMethodCardChecks
-from .payment_method_type import PaymentMethodType
-from .perspective_camera_parameters import PerspectiveCameraParameters
-from .plan_interval import PlanInterval
-from .plan_step import PlanStep
-from .plane_intersect_and_project import PlaneIntersectAndProject
-from .plane_set_color import PlaneSetColor
-from .ply_storage import PlyStorage
-from .point2d import Point2d
-from .point3d import Point3d
-from .point4d import Point4d
-from .pong import Pong
-from .post_effect_type import PostEffectType
-from .price_upsert_request import PriceUpsertRequest
-from .primitive_topology_fallback import PrimitiveTopologyFallback
-from .privacy_settings import PrivacySettings
-from .project_access_response import ProjectAccessResponse
-from .project_access_scope import ProjectAccessScope
-from .project_archive_format import ProjectArchiveFormat
-from .project_category_response import ProjectCategoryResponse
-from .project_entity_to_plane import ProjectEntityToPlane
-from .project_file_response import ProjectFileResponse
-from .project_points_to_plane import ProjectPointsToPlane
-from .project_publication_info_response import ProjectPublicationInfoResponse
-from .project_response import ProjectResponse
-from .project_share_link_response import ProjectShareLinkResponse
-from .project_summary_response import ProjectSummaryResponse
-from .public_email_marketing_consent_request import PublicEmailMarketingConsentRequest
-from .public_mailing_list_membership_request import PublicMailingListMembershipRequest
-from .public_project_owner_response import PublicProjectOwnerResponse
-from .public_project_response import PublicProjectResponse
-from .public_project_vote_response import PublicProjectVoteResponse
-from .query_entity_type import QueryEntityType
-from .query_entity_type_with_point import QueryEntityTypeWithPoint
-from .raw_file import RawFile
-from .reasoning_message import ReasoningMessage
-from .reconfigure_stream import ReconfigureStream
-from .region_get_query_point import RegionGetQueryPoint
-from .region_get_resolvable_intersection_info import RegionGetResolvableIntersectionInfo
-from .region_version import RegionVersion
-from .relative_to import RelativeTo
-from .remove_scene_objects import RemoveSceneObjects
-from .revolve import Revolve
-from .revolve_about_edge import RevolveAboutEdge
-from .rotation import Rotation
-from .rtc_ice_candidate_init import RtcIceCandidateInit
-from .rtc_sdp_type import RtcSdpType
-from .rtc_session_description import RtcSessionDescription
-from .sales_inquiry_type import SalesInquiryType
-from .saml_identity_provider import SamlIdentityProvider
-from .saml_identity_provider_create import SamlIdentityProviderCreate
-from .scene_clear_all import SceneClearAll
-from .scene_get_entity_ids import SceneGetEntityIds
-from .scene_selection_type import SceneSelectionType
-from .scene_tool_type import SceneToolType
-from .select_add import SelectAdd
-from .select_clear import SelectClear
-from .select_entity import SelectEntity
-from .select_get import SelectGet
-from .select_region_from_point import SelectRegionFromPoint
-from .select_remove import SelectRemove
-from .select_replace import SelectReplace
-from .select_with_point import SelectWithPoint
-from .selected_region import SelectedRegion
-from .selection import Selection
-from .send_object import SendObject
-from .service_account import ServiceAccount
-from .service_account_results_page import ServiceAccountResultsPage
-from .service_account_uuid import ServiceAccountUuid
-from .session import Session
-from .session_uuid import SessionUuid
-from .set_background_color import SetBackgroundColor
-from .set_current_tool_properties import SetCurrentToolProperties
-from .set_default_system_properties import SetDefaultSystemProperties
-from .set_grid_auto_scale import SetGridAutoScale
-from .set_grid_reference_plane import SetGridReferencePlane
-from .set_grid_scale import SetGridScale
-from .set_object_transform import SetObjectTransform
-from .set_order_independent_transparency import SetOrderIndependentTransparency
-from .set_scene_units import SetSceneUnits
-from .set_selection_filter import SetSelectionFilter
-from .set_selection_type import SetSelectionType
-from .set_tool import SetTool
-from .shortlink import Shortlink
-from .shortlink_results_page import ShortlinkResultsPage
-from .side_face import SideFace
-from .sketch_get_info import SketchGetInfo
-from .sketch_mode_disable import SketchModeDisable
-from .solid2d_add_hole import Solid2dAddHole
-from .solid3d_cut_edge_references import Solid3dCutEdgeReferences
-from .solid3d_cut_edges import Solid3dCutEdges
-from .solid3d_fillet_edge import Solid3dFilletEdge
-from .solid3d_flip import Solid3dFlip
-from .solid3d_flip_face import Solid3dFlipFace
-from .solid3d_get_adjacency_info import Solid3dGetAdjacencyInfo
-from .solid3d_get_all_edge_faces import Solid3dGetAllEdgeFaces
-from .solid3d_get_all_opposite_edges import Solid3dGetAllOppositeEdges
-from .solid3d_get_body_type import Solid3dGetBodyType
-from .solid3d_get_common_edge import Solid3dGetCommonEdge
-from .solid3d_get_edge_uuid import Solid3dGetEdgeUuid
-from .solid3d_get_extrusion_face_info import Solid3dGetExtrusionFaceInfo
-from .solid3d_get_face_uuid import Solid3dGetFaceUuid
-from .solid3d_get_next_adjacent_edge import Solid3dGetNextAdjacentEdge
-from .solid3d_get_opposite_edge import Solid3dGetOppositeEdge
-from .solid3d_get_prev_adjacent_edge import Solid3dGetPrevAdjacentEdge
-from .solid3d_join import Solid3dJoin
-from .solid3d_multi_join import Solid3dMultiJoin
-from .solid3d_shell_face import Solid3dShellFace
-from .source_position import SourcePosition
-from .source_range import SourceRange
-from .source_range_prompt import SourceRangePrompt
-from .start_path import StartPath
-from .step_import_target_representation import StepImportTargetRepresentation
-from .step_presentation import StepPresentation
-from .stl_storage import StlStorage
-from .storage_provider import StorageProvider
-from .store_coupon_params import StoreCouponParams
-from .subscription_action_type import SubscriptionActionType
-from .subscription_billing_mode import SubscriptionBillingMode
-from .subscription_plan_billing_model import SubscriptionPlanBillingModel
-from .subscription_plan_price_record import SubscriptionPlanPriceRecord
-from .subscription_tier_feature import SubscriptionTierFeature
-from .subscription_tier_price import SubscriptionTierPrice
-from .subscription_tier_type import SubscriptionTierType
-from .subscription_training_data_behavior import SubscriptionTrainingDataBehavior
-from .success_web_socket_response import SuccessWebSocketResponse
-from .support_inquiry_type import SupportInquiryType
-from .support_tier import SupportTier
-from .surface_area import SurfaceArea
-from .surface_blend import SurfaceBlend
-from .surface_created import SurfaceCreated
-from .surface_edge_reference import SurfaceEdgeReference
-from .sweep import Sweep
-from .system import System
-from .take_snapshot import TakeSnapshot
-from .text_to_cad_model import TextToCadModel
-from .text_to_cad_multi_file_iteration_body import TextToCadMultiFileIterationBody
-from .text_to_cad_response import TextToCadResponse
-from .text_to_cad_response_results_page import TextToCadResponseResultsPage
-from .token_revoke_request_form import TokenRevokeRequestForm
-from .transform import Transform
-from .transform_by_for_point3d import TransformByForPoint3d
-from .transform_by_for_point4d import TransformByForPoint4d
-from .twist_extrude import TwistExtrude
-from .unit_angle import UnitAngle
-from .unit_angle_conversion import UnitAngleConversion
-from .unit_area import UnitArea
-from .unit_area_conversion import UnitAreaConversion
-from .unit_current import UnitCurrent
-from .unit_current_conversion import UnitCurrentConversion
-from .unit_density import UnitDensity
-from .unit_energy import UnitEnergy
-from .unit_energy_conversion import UnitEnergyConversion
-from .unit_force import UnitForce
-from .unit_force_conversion import UnitForceConversion
-from .unit_frequency import UnitFrequency
-from .unit_frequency_conversion import UnitFrequencyConversion
-from .unit_length import UnitLength
-from .unit_length_conversion import UnitLengthConversion
-from .unit_mass import UnitMass
-from .unit_mass_conversion import UnitMassConversion
-from .unit_power import UnitPower
-from .unit_power_conversion import UnitPowerConversion
-from .unit_pressure import UnitPressure
-from .unit_pressure_conversion import UnitPressureConversion
-from .unit_temperature import UnitTemperature
-from .unit_temperature_conversion import UnitTemperatureConversion
-from .unit_torque import UnitTorque
-from .unit_torque_conversion import UnitTorqueConversion
-from .unit_volume import UnitVolume
-from .unit_volume_conversion import UnitVolumeConversion
-from .update_annotation import UpdateAnnotation
-from .update_custom_model import UpdateCustomModel
-from .update_member_to_org_body import UpdateMemberToOrgBody
-from .update_o_auth2_app_request import UpdateOAuth2AppRequest
-from .update_org_dataset import UpdateOrgDataset
-from .update_org_dataset_source import UpdateOrgDatasetSource
-from .update_payment_balance import UpdatePaymentBalance
-from .update_shortlink_request import UpdateShortlinkRequest
-from .update_user import UpdateUser
-from .upload_org_dataset_files_response import UploadOrgDatasetFilesResponse
-from .user_admin_details import UserAdminDetails
-from .user_cad_info_admin_details import UserCadInfoAdminDetails
-from .user_feature_entry import UserFeatureEntry
-from .user_feature_list import UserFeatureList
-from .user_identifier import UserIdentifier
-from .user_org_info import UserOrgInfo
-from .user_org_role import UserOrgRole
-from .user_response import UserResponse
-from .uuid import Uuid
-from .verification_token_response import VerificationTokenResponse
-from .view_isometric import ViewIsometric
-from .volume import Volume
-from .web_socket_request import WebSocketRequest
-from .web_socket_response import WebSocketResponse
-from .website_cad_user_info_form import WebsiteCadUserInfoForm
-from .website_sales_form import WebsiteSalesForm
-from .website_support_form import WebsiteSupportForm
-from .world_coordinate_system import WorldCoordinateSystem
-from .zoo_product_subscription import ZooProductSubscription
-from .zoo_product_subscription_downgrade_reason import (
-    ZooProductSubscriptionDowngradeReason,
-)
-from .zoo_product_subscriptions import ZooProductSubscriptions
-from .zoo_product_subscriptions_org_request import ZooProductSubscriptionsOrgRequest
-from .zoo_product_subscriptions_user_request import ZooProductSubscriptionsUserRequest
-from .zoo_tool import ZooTool
-from .zookeeper_auto_router_metadata import ZookeeperAutoRouterMetadata
-from .zookeeper_edit_patch import ZookeeperEditPatch
-from .zookeeper_edit_patch_file import ZookeeperEditPatchFile
-from .zookeeper_turn_usage import ZookeeperTurnUsage
-from .zookeeper_turn_usage_model import ZookeeperTurnUsageModel
-from .zookeeper_turn_usage_stage import ZookeeperTurnUsageStage
-from .zoom_to_fit import ZoomToFit
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .account_provider import AccountProvider
+    from .add_hole_from_offset import AddHoleFromOffset
+    from .add_org_member import AddOrgMember
+    from .address import Address
+    from .address_details import AddressDetails
+    from .adjacency_info import AdjacencyInfo
+    from .aggregate_usage_collection_threshold_bounds import (
+        AggregateUsageCollectionThresholdBounds,
+    )
+    from .aggregate_usage_collection_threshold_set import (
+        AggregateUsageCollectionThresholdSet,
+    )
+    from .aggregate_usage_collection_threshold_source import (
+        AggregateUsageCollectionThresholdSource,
+    )
+    from .aggregate_usage_collection_threshold_view import (
+        AggregateUsageCollectionThresholdView,
+    )
+    from .angle import Angle
+    from .annotation_basic_dimension import AnnotationBasicDimension
+    from .annotation_feature_control import AnnotationFeatureControl
+    from .annotation_feature_tag import AnnotationFeatureTag
+    from .annotation_line_end import AnnotationLineEnd
+    from .annotation_line_end_options import AnnotationLineEndOptions
+    from .annotation_mbd_basic_dimension import AnnotationMbdBasicDimension
+    from .annotation_mbd_control_frame import AnnotationMbdControlFrame
+    from .annotation_options import AnnotationOptions
+    from .annotation_text_alignment_x import AnnotationTextAlignmentX
+    from .annotation_text_alignment_y import AnnotationTextAlignmentY
+    from .annotation_text_options import AnnotationTextOptions
+    from .annotation_type import AnnotationType
+    from .announcement import Announcement
+    from .announcement_list import AnnouncementList
+    from .api_call_status import ApiCallStatus
+    from .api_call_with_price import ApiCallWithPrice
+    from .api_call_with_price_results_page import ApiCallWithPriceResultsPage
+    from .api_endpoint import ApiEndpoint
+    from .api_error import ApiError
+    from .api_token import ApiToken
+    from .api_token_results_page import ApiTokenResultsPage
+    from .api_token_uuid import ApiTokenUuid
+    from .api_token_with_full_token import ApiTokenWithFullToken
+    from .app_client_info import AppClientInfo
+    from .async_api_call_output import AsyncApiCallOutput
+    from .auth_api_key_response import AuthApiKeyResponse
+    from .auth_callback import AuthCallback
+    from .axis import Axis
+    from .axis_direction_pair import AxisDirectionPair
+    from .base import KittyCadBaseModel, KittyCadRootModel
+    from .batch_response import BatchResponse
+    from .begin_execution import BeginExecution
+    from .billing_cadence import BillingCadence
+    from .billing_commitment_scope import BillingCommitmentScope
+    from .billing_contract_item_input import BillingContractItemInput
+    from .billing_contract_item_view import BillingContractItemView
+    from .billing_contract_status import BillingContractStatus
+    from .billing_contract_upsert import BillingContractUpsert
+    from .billing_contract_view import BillingContractView
+    from .billing_external_customer_id import BillingExternalCustomerId
+    from .billing_info import BillingInfo
+    from .billing_item_code import BillingItemCode
+    from .billing_item_kind import BillingItemKind
+    from .billing_period_index import BillingPeriodIndex
+    from .billing_period_input import BillingPeriodInput
+    from .billing_period_status import BillingPeriodStatus
+    from .billing_period_view import BillingPeriodView
+    from .billing_provider import BillingProvider
+    from .billing_quantity import BillingQuantity
+    from .billing_rate_tier_input import BillingRateTierInput
+    from .billing_rate_tier_view import BillingRateTierView
+    from .billing_rollover_policy import BillingRolloverPolicy
+    from .billing_unit import BillingUnit
+    from .billing_unit_granularity import BillingUnitGranularity
+    from .blend_type import BlendType
+    from .block_reason import BlockReason
+    from .bodies_created import BodiesCreated
+    from .bodies_updated import BodiesUpdated
+    from .body_created import BodyCreated
+    from .body_type import BodyType
+    from .body_updated import BodyUpdated
+    from .boolean_imprint import BooleanImprint
+    from .boolean_intersection import BooleanIntersection
+    from .boolean_subtract import BooleanSubtract
+    from .boolean_union import BooleanUnion
+    from .bounding_box import BoundingBox
+    from .cad_design_workflow import CadDesignWorkflow
+    from .cad_discovery_source import CadDiscoverySource
+    from .cad_experience_level import CadExperienceLevel
+    from .cad_industry import CadIndustry
+    from .cad_user_type import CadUserType
+    from .camera_drag_end import CameraDragEnd
+    from .camera_drag_interaction_type import CameraDragInteractionType
+    from .camera_drag_move import CameraDragMove
+    from .camera_drag_start import CameraDragStart
+    from .camera_movement import CameraMovement
+    from .camera_settings import CameraSettings
+    from .camera_view_state import CameraViewState
+    from .card_details import CardDetails
+    from .center_of_mass import CenterOfMass
+    from .client_error_report import ClientErrorReport
+    from .client_error_report_accepted import ClientErrorReportAccepted
+    from .client_metrics import ClientMetrics
+    from .close_path import ClosePath
+    from .closest_edge import ClosestEdge
+    from .code_language import CodeLanguage
+    from .code_option import CodeOption
+    from .code_output import CodeOutput
+    from .color import Color
+    from .company_size import CompanySize
+    from .complementary_edges import ComplementaryEdges
+    from .component_transform import ComponentTransform
+    from .conversation import Conversation
+    from .conversation_results_page import ConversationResultsPage
+    from .conversion_params import ConversionParams
+    from .conversion_sort_mode import ConversionSortMode
+    from .country_code import CountryCode
+    from .coupon import Coupon
+    from .create_custom_model import CreateCustomModel
+    from .create_o_auth2_app_request import CreateOAuth2AppRequest
+    from .create_org_dataset import CreateOrgDataset
+    from .create_planar_surface import CreatePlanarSurface
+    from .create_project_share_link_request import CreateProjectShareLinkRequest
+    from .create_region import CreateRegion
+    from .create_region_from_query_point import CreateRegionFromQueryPoint
+    from .create_shortlink_request import CreateShortlinkRequest
+    from .create_shortlink_response import CreateShortlinkResponse
+    from .created_at_sort_mode import CreatedAtSortMode
+    from .currency import Currency
+    from .curve_debug import CurveDebug
+    from .curve_get_control_points import CurveGetControlPoints
+    from .curve_get_end_points import CurveGetEndPoints
+    from .curve_get_type import CurveGetType
+    from .curve_set_constraint import CurveSetConstraint
+    from .curve_type import CurveType
+    from .curve_type_debug import CurveTypeDebug
+    from .custom_model import CustomModel
+    from .customer import Customer
+    from .customer_balance import CustomerBalance
+    from .cut_strategy import CutStrategy
+    from .cut_type import CutType
+    from .cut_type_v2 import CutTypeV2
+    from .dataset_s3_policies import DatasetS3Policies
+    from .default_camera_center_to_scene import DefaultCameraCenterToScene
+    from .default_camera_center_to_selection import DefaultCameraCenterToSelection
+    from .default_camera_focus_on import DefaultCameraFocusOn
+    from .default_camera_get_settings import DefaultCameraGetSettings
+    from .default_camera_get_view import DefaultCameraGetView
+    from .default_camera_look_at import DefaultCameraLookAt
+    from .default_camera_perspective_settings import DefaultCameraPerspectiveSettings
+    from .default_camera_set_orthographic import DefaultCameraSetOrthographic
+    from .default_camera_set_perspective import DefaultCameraSetPerspective
+    from .default_camera_set_view import DefaultCameraSetView
+    from .default_camera_zoom import DefaultCameraZoom
+    from .density import Density
+    from .der_encoded_key_pair import DerEncodedKeyPair
+    from .device_access_token_request_form import DeviceAccessTokenRequestForm
+    from .device_auth_confirm_params import DeviceAuthConfirmParams
+    from .device_auth_request_form import DeviceAuthRequestForm
+    from .direction import Direction
+    from .direction_type import DirectionType
+    from .discount import Discount
+    from .discount_code import DiscountCode
+    from .distance_type import DistanceType
+    from .dxf_storage import DxfStorage
+    from .edge_cut_version import EdgeCutVersion
+    from .edge_get_length import EdgeGetLength
+    from .edge_info import EdgeInfo
+    from .edge_lines_visible import EdgeLinesVisible
+    from .edge_specifier import EdgeSpecifier
+    from .email_authentication_form import EmailAuthenticationForm
+    from .email_marketing_confirm_token_body import EmailMarketingConfirmTokenBody
+    from .email_marketing_consent_state import EmailMarketingConsentState
+    from .email_marketing_consent_status import EmailMarketingConsentStatus
+    from .empty import Empty
+    from .enable_sketch_mode import EnableSketchMode
+    from .end_execution import EndExecution
+    from .engine_util_evaluate_path import EngineUtilEvaluatePath
+    from .entity_circular_pattern import EntityCircularPattern
+    from .entity_clone import EntityClone
+    from .entity_delete_children import EntityDeleteChildren
+    from .entity_fade import EntityFade
+    from .entity_get_all_child_uuids import EntityGetAllChildUuids
+    from .entity_get_child_uuid import EntityGetChildUuid
+    from .entity_get_distance import EntityGetDistance
+    from .entity_get_index import EntityGetIndex
+    from .entity_get_num_children import EntityGetNumChildren
+    from .entity_get_parent_id import EntityGetParentId
+    from .entity_get_primitive_index import EntityGetPrimitiveIndex
+    from .entity_get_sketch_paths import EntityGetSketchPaths
+    from .entity_linear_pattern import EntityLinearPattern
+    from .entity_linear_pattern_transform import EntityLinearPatternTransform
+    from .entity_make_helix import EntityMakeHelix
+    from .entity_make_helix_from_edge import EntityMakeHelixFromEdge
+    from .entity_make_helix_from_params import EntityMakeHelixFromParams
+    from .entity_mirror import EntityMirror
+    from .entity_mirror_across import EntityMirrorAcross
+    from .entity_mirror_across_edge import EntityMirrorAcrossEdge
+    from .entity_reference import EntityReference
+    from .entity_set_opacity import EntitySetOpacity
+    from .entity_type import EntityType
+    from .error import Error
+    from .error_code import ErrorCode
+    from .export import Export
+    from .export2d import Export2d
+    from .export3d import Export3d
+    from .export_file import ExportFile
+    from .extend_path import ExtendPath
+    from .extended_user import ExtendedUser
+    from .extrude import Extrude
+    from .extrude_method import ExtrudeMethod
+    from .extrude_reference import ExtrudeReference
+    from .extrude_to_reference import ExtrudeToReference
+    from .extruded_face_info import ExtrudedFaceInfo
+    from .extrusion_face_cap_type import ExtrusionFaceCapType
+    from .extrusion_face_info import ExtrusionFaceInfo
+    from .face_edge_info import FaceEdgeInfo
+    from .face_get_center import FaceGetCenter
+    from .face_get_gradient import FaceGetGradient
+    from .face_get_position import FaceGetPosition
+    from .face_is_planar import FaceIsPlanar
+    from .factory_customer_catalog_option import FactoryCustomerCatalogOption
+    from .factory_job_response import FactoryJobResponse
+    from .failure_web_socket_response import FailureWebSocketResponse
+    from .fbx_storage import FbxStorage
+    from .feature import Feature
+    from .file_center_of_mass import FileCenterOfMass
+    from .file_conversion import FileConversion
+    from .file_density import FileDensity
+    from .file_export_format import FileExportFormat
+    from .file_import_format import FileImportFormat
+    from .file_mass import FileMass
+    from .file_surface_area import FileSurfaceArea
+    from .file_volume import FileVolume
+    from .fraction_of_edge import FractionOfEdge
+    from .get_entity_type import GetEntityType
+    from .get_num_objects import GetNumObjects
+    from .get_sketch_mode_plane import GetSketchModePlane
+    from .global_axis import GlobalAxis
+    from .gltf_presentation import GltfPresentation
+    from .gltf_storage import GltfStorage
+    from .handle_mouse_drag_end import HandleMouseDragEnd
+    from .handle_mouse_drag_move import HandleMouseDragMove
+    from .handle_mouse_drag_start import HandleMouseDragStart
+    from .highlight_set_entities import HighlightSetEntities
+    from .highlight_set_entity import HighlightSetEntity
+    from .ice_server import IceServer
+    from .idp_metadata_source import IdpMetadataSource
+    from .image_format import ImageFormat
+    from .import_file import ImportFile
+    from .import_files import ImportFiles
+    from .imported_geometry import ImportedGeometry
+    from .input_format3d import InputFormat3d
+    from .invoice import Invoice
+    from .invoice_line_item import InvoiceLineItem
+    from .invoice_refund_status import InvoiceRefundStatus
+    from .invoice_results_page import InvoiceResultsPage
+    from .invoice_status import InvoiceStatus
+    from .ip_addr_info import IpAddrInfo
+    from .kcl_code_completion_params import KclCodeCompletionParams
+    from .kcl_code_completion_request import KclCodeCompletionRequest
+    from .kcl_code_completion_response import KclCodeCompletionResponse
+    from .kcl_model import KclModel
+    from .kcl_project_file_role import KclProjectFileRole
+    from .kcl_project_preview_status import KclProjectPreviewStatus
+    from .kcl_project_publication_status import KclProjectPublicationStatus
+    from .kcl_project_share_link_access_mode import KclProjectShareLinkAccessMode
+    from .length_unit import LengthUnit
+    from .lenient_url import LenientUrl
+    from .loft import Loft
+    from .make_axes_gizmo import MakeAxesGizmo
+    from .make_offset_path import MakeOffsetPath
+    from .make_plane import MakePlane
+    from .mass import Mass
+    from .mbd_symbol import MbdSymbol
+    from .method import Method
+    from .mirror_across import MirrorAcross
+    from .ml_copilot_client_message import MlCopilotClientMessage
+    from .ml_copilot_file import MlCopilotFile
+    from .ml_copilot_mode import MlCopilotMode
+    from .ml_copilot_mode_option import MlCopilotModeOption
+    from .ml_copilot_server_message import MlCopilotServerMessage
+    from .ml_copilot_supported_models import MlCopilotSupportedModels
+    from .ml_copilot_system_command import MlCopilotSystemCommand
+    from .ml_copilot_tool import MlCopilotTool
+    from .ml_feedback import MlFeedback
+    from .ml_reasoning_effort import MlReasoningEffort
+    from .ml_tool_result import MlToolResult
+    from .modeling_app_share_links import ModelingAppShareLinks
+    from .modeling_app_subscription_tier import ModelingAppSubscriptionTier
+    from .modeling_cmd import ModelingCmd
+    from .modeling_cmd_id import ModelingCmdId
+    from .modeling_cmd_req import ModelingCmdReq
+    from .modeling_session_data import ModelingSessionData
+    from .mouse_click import MouseClick
+    from .mouse_move import MouseMove
+    from .move_path_pen import MovePathPen
+    from .new_annotation import NewAnnotation
+    from .o_auth2_app_client_type import OAuth2AppClientType
+    from .o_auth2_app_grant_type import OAuth2AppGrantType
+    from .o_auth2_app_mode import OAuth2AppMode
+    from .o_auth2_app_response import OAuth2AppResponse
+    from .o_auth2_app_response_results_page import OAuth2AppResponseResultsPage
+    from .o_auth2_authorization_code_uuid import OAuth2AuthorizationCodeUuid
+    from .o_auth2_authorization_decision_response import (
+        OAuth2AuthorizationDecisionResponse,
+    )
+    from .o_auth2_authorization_request_response import (
+        OAuth2AuthorizationRequestResponse,
+    )
+    from .o_auth2_authorization_response_type import OAuth2AuthorizationResponseType
+    from .o_auth2_code_challenge_method import OAuth2CodeChallengeMethod
+    from .o_auth2_refresh_token_uuid import OAuth2RefreshTokenUuid
+    from .o_auth2_scope import OAuth2Scope
+    from .o_auth2_scopes import OAuth2Scopes
+    from .o_auth2_token_grant_type import OAuth2TokenGrantType
+    from .o_auth2_token_request_form import OAuth2TokenRequestForm
+    from .oauth2_client_info import OAuth2ClientInfo
+    from .oauth2_grant_type import OAuth2GrantType
+    from .object_bring_to_front import ObjectBringToFront
+    from .object_set_material_params_pbr import ObjectSetMaterialParamsPbr
+    from .object_set_name import ObjectSetName
+    from .object_visible import ObjectVisible
+    from .offset_surface import OffsetSurface
+    from .ok_modeling_cmd_response import OkModelingCmdResponse
+    from .ok_web_socket_response_data import OkWebSocketResponseData
+    from .opposite_for_angle import OppositeForAngle
+    from .opposite_for_length_unit import OppositeForLengthUnit
+    from .org import Org
+    from .org_dataset import OrgDataset
+    from .org_dataset_conversion_stats_response import OrgDatasetConversionStatsResponse
+    from .org_dataset_file_conversion_details import OrgDatasetFileConversionDetails
+    from .org_dataset_file_conversion_phase import OrgDatasetFileConversionPhase
+    from .org_dataset_file_conversion_status import OrgDatasetFileConversionStatus
+    from .org_dataset_file_conversion_summary import OrgDatasetFileConversionSummary
+    from .org_dataset_file_conversion_summary_results_page import (
+        OrgDatasetFileConversionSummaryResultsPage,
+    )
+    from .org_dataset_results_page import OrgDatasetResultsPage
+    from .org_dataset_semantic_search_match import OrgDatasetSemanticSearchMatch
+    from .org_dataset_snapshot_image import OrgDatasetSnapshotImage
+    from .org_dataset_source import OrgDatasetSource
+    from .org_dataset_status import OrgDatasetStatus
+    from .org_details import OrgDetails
+    from .org_member import OrgMember
+    from .org_member_results_page import OrgMemberResultsPage
+    from .org_role import OrgRole
+    from .org_skill_response import OrgSkillResponse
+    from .orient_to_face import OrientToFace
+    from .origin_type import OriginType
+    from .output_file import OutputFile
+    from .output_format2d import OutputFormat2d
+    from .output_format3d import OutputFormat3d
+    from .path_command import PathCommand
+    from .path_component_constraint_bound import PathComponentConstraintBound
+    from .path_component_constraint_type import PathComponentConstraintType
+    from .path_get_curve_uuid import PathGetCurveUuid
+    from .path_get_curve_uuids_for_vertices import PathGetCurveUuidsForVertices
+    from .path_get_info import PathGetInfo
+    from .path_get_sketch_target_uuid import PathGetSketchTargetUuid
+    from .path_get_vertex_uuids import PathGetVertexUuids
+    from .path_segment import PathSegment
+    from .path_segment_info import PathSegmentInfo
+    from .payment_intent import PaymentIntent
+    from .payment_method import PaymentMethod
+    from .payment_method_card_checks import PaymentMethodCardChecks
+    from .payment_method_type import PaymentMethodType
+    from .perspective_camera_parameters import PerspectiveCameraParameters
+    from .plan_interval import PlanInterval
+    from .plan_step import PlanStep
+    from .plane_intersect_and_project import PlaneIntersectAndProject
+    from .plane_set_color import PlaneSetColor
+    from .ply_storage import PlyStorage
+    from .point2d import Point2d
+    from .point3d import Point3d
+    from .point4d import Point4d
+    from .pong import Pong
+    from .post_effect_type import PostEffectType
+    from .price_upsert_request import PriceUpsertRequest
+    from .primitive_topology_fallback import PrimitiveTopologyFallback
+    from .privacy_settings import PrivacySettings
+    from .project_access_response import ProjectAccessResponse
+    from .project_access_scope import ProjectAccessScope
+    from .project_archive_format import ProjectArchiveFormat
+    from .project_category_response import ProjectCategoryResponse
+    from .project_entity_to_plane import ProjectEntityToPlane
+    from .project_file_response import ProjectFileResponse
+    from .project_points_to_plane import ProjectPointsToPlane
+    from .project_publication_info_response import ProjectPublicationInfoResponse
+    from .project_response import ProjectResponse
+    from .project_share_link_response import ProjectShareLinkResponse
+    from .project_summary_response import ProjectSummaryResponse
+    from .public_email_marketing_consent_request import (
+        PublicEmailMarketingConsentRequest,
+    )
+    from .public_mailing_list_membership_request import (
+        PublicMailingListMembershipRequest,
+    )
+    from .public_project_owner_response import PublicProjectOwnerResponse
+    from .public_project_response import PublicProjectResponse
+    from .public_project_vote_response import PublicProjectVoteResponse
+    from .query_entity_type import QueryEntityType
+    from .query_entity_type_with_point import QueryEntityTypeWithPoint
+    from .raw_file import RawFile
+    from .reasoning_message import ReasoningMessage
+    from .reconfigure_stream import ReconfigureStream
+    from .region_get_query_point import RegionGetQueryPoint
+    from .region_get_resolvable_intersection_info import (
+        RegionGetResolvableIntersectionInfo,
+    )
+    from .region_version import RegionVersion
+    from .relative_to import RelativeTo
+    from .remove_scene_objects import RemoveSceneObjects
+    from .revolve import Revolve
+    from .revolve_about_edge import RevolveAboutEdge
+    from .rotation import Rotation
+    from .rtc_ice_candidate_init import RtcIceCandidateInit
+    from .rtc_sdp_type import RtcSdpType
+    from .rtc_session_description import RtcSessionDescription
+    from .sales_inquiry_type import SalesInquiryType
+    from .saml_identity_provider import SamlIdentityProvider
+    from .saml_identity_provider_create import SamlIdentityProviderCreate
+    from .scene_clear_all import SceneClearAll
+    from .scene_get_entity_ids import SceneGetEntityIds
+    from .scene_selection_type import SceneSelectionType
+    from .scene_tool_type import SceneToolType
+    from .select_add import SelectAdd
+    from .select_clear import SelectClear
+    from .select_entity import SelectEntity
+    from .select_get import SelectGet
+    from .select_region_from_point import SelectRegionFromPoint
+    from .select_remove import SelectRemove
+    from .select_replace import SelectReplace
+    from .select_with_point import SelectWithPoint
+    from .selected_region import SelectedRegion
+    from .selection import Selection
+    from .send_object import SendObject
+    from .service_account import ServiceAccount
+    from .service_account_results_page import ServiceAccountResultsPage
+    from .service_account_uuid import ServiceAccountUuid
+    from .session import Session
+    from .session_uuid import SessionUuid
+    from .set_background_color import SetBackgroundColor
+    from .set_current_tool_properties import SetCurrentToolProperties
+    from .set_default_system_properties import SetDefaultSystemProperties
+    from .set_grid_auto_scale import SetGridAutoScale
+    from .set_grid_reference_plane import SetGridReferencePlane
+    from .set_grid_scale import SetGridScale
+    from .set_object_transform import SetObjectTransform
+    from .set_order_independent_transparency import SetOrderIndependentTransparency
+    from .set_scene_units import SetSceneUnits
+    from .set_selection_filter import SetSelectionFilter
+    from .set_selection_type import SetSelectionType
+    from .set_tool import SetTool
+    from .shortlink import Shortlink
+    from .shortlink_results_page import ShortlinkResultsPage
+    from .side_face import SideFace
+    from .sketch_get_info import SketchGetInfo
+    from .sketch_mode_disable import SketchModeDisable
+    from .solid2d_add_hole import Solid2dAddHole
+    from .solid3d_cut_edge_references import Solid3dCutEdgeReferences
+    from .solid3d_cut_edges import Solid3dCutEdges
+    from .solid3d_fillet_edge import Solid3dFilletEdge
+    from .solid3d_flip import Solid3dFlip
+    from .solid3d_flip_face import Solid3dFlipFace
+    from .solid3d_get_adjacency_info import Solid3dGetAdjacencyInfo
+    from .solid3d_get_all_edge_faces import Solid3dGetAllEdgeFaces
+    from .solid3d_get_all_opposite_edges import Solid3dGetAllOppositeEdges
+    from .solid3d_get_body_type import Solid3dGetBodyType
+    from .solid3d_get_common_edge import Solid3dGetCommonEdge
+    from .solid3d_get_edge_uuid import Solid3dGetEdgeUuid
+    from .solid3d_get_extrusion_face_info import Solid3dGetExtrusionFaceInfo
+    from .solid3d_get_face_uuid import Solid3dGetFaceUuid
+    from .solid3d_get_next_adjacent_edge import Solid3dGetNextAdjacentEdge
+    from .solid3d_get_opposite_edge import Solid3dGetOppositeEdge
+    from .solid3d_get_prev_adjacent_edge import Solid3dGetPrevAdjacentEdge
+    from .solid3d_join import Solid3dJoin
+    from .solid3d_multi_join import Solid3dMultiJoin
+    from .solid3d_shell_face import Solid3dShellFace
+    from .source_position import SourcePosition
+    from .source_range import SourceRange
+    from .source_range_prompt import SourceRangePrompt
+    from .start_path import StartPath
+    from .step_import_target_representation import StepImportTargetRepresentation
+    from .step_presentation import StepPresentation
+    from .stl_storage import StlStorage
+    from .storage_provider import StorageProvider
+    from .store_coupon_params import StoreCouponParams
+    from .subscription_action_type import SubscriptionActionType
+    from .subscription_billing_mode import SubscriptionBillingMode
+    from .subscription_plan_billing_model import SubscriptionPlanBillingModel
+    from .subscription_plan_price_record import SubscriptionPlanPriceRecord
+    from .subscription_tier_feature import SubscriptionTierFeature
+    from .subscription_tier_price import SubscriptionTierPrice
+    from .subscription_tier_type import SubscriptionTierType
+    from .subscription_training_data_behavior import SubscriptionTrainingDataBehavior
+    from .success_web_socket_response import SuccessWebSocketResponse
+    from .support_inquiry_type import SupportInquiryType
+    from .support_tier import SupportTier
+    from .surface_area import SurfaceArea
+    from .surface_blend import SurfaceBlend
+    from .surface_created import SurfaceCreated
+    from .surface_edge_reference import SurfaceEdgeReference
+    from .sweep import Sweep
+    from .system import System
+    from .take_snapshot import TakeSnapshot
+    from .text_to_cad_model import TextToCadModel
+    from .text_to_cad_multi_file_iteration_body import TextToCadMultiFileIterationBody
+    from .text_to_cad_response import TextToCadResponse
+    from .text_to_cad_response_results_page import TextToCadResponseResultsPage
+    from .token_revoke_request_form import TokenRevokeRequestForm
+    from .transform import Transform
+    from .transform_by_for_point3d import TransformByForPoint3d
+    from .transform_by_for_point4d import TransformByForPoint4d
+    from .twist_extrude import TwistExtrude
+    from .unit_angle import UnitAngle
+    from .unit_angle_conversion import UnitAngleConversion
+    from .unit_area import UnitArea
+    from .unit_area_conversion import UnitAreaConversion
+    from .unit_current import UnitCurrent
+    from .unit_current_conversion import UnitCurrentConversion
+    from .unit_density import UnitDensity
+    from .unit_energy import UnitEnergy
+    from .unit_energy_conversion import UnitEnergyConversion
+    from .unit_force import UnitForce
+    from .unit_force_conversion import UnitForceConversion
+    from .unit_frequency import UnitFrequency
+    from .unit_frequency_conversion import UnitFrequencyConversion
+    from .unit_length import UnitLength
+    from .unit_length_conversion import UnitLengthConversion
+    from .unit_mass import UnitMass
+    from .unit_mass_conversion import UnitMassConversion
+    from .unit_power import UnitPower
+    from .unit_power_conversion import UnitPowerConversion
+    from .unit_pressure import UnitPressure
+    from .unit_pressure_conversion import UnitPressureConversion
+    from .unit_temperature import UnitTemperature
+    from .unit_temperature_conversion import UnitTemperatureConversion
+    from .unit_torque import UnitTorque
+    from .unit_torque_conversion import UnitTorqueConversion
+    from .unit_volume import UnitVolume
+    from .unit_volume_conversion import UnitVolumeConversion
+    from .update_annotation import UpdateAnnotation
+    from .update_custom_model import UpdateCustomModel
+    from .update_member_to_org_body import UpdateMemberToOrgBody
+    from .update_o_auth2_app_request import UpdateOAuth2AppRequest
+    from .update_org_dataset import UpdateOrgDataset
+    from .update_org_dataset_source import UpdateOrgDatasetSource
+    from .update_payment_balance import UpdatePaymentBalance
+    from .update_shortlink_request import UpdateShortlinkRequest
+    from .update_user import UpdateUser
+    from .upload_org_dataset_files_response import UploadOrgDatasetFilesResponse
+    from .user_admin_details import UserAdminDetails
+    from .user_cad_info_admin_details import UserCadInfoAdminDetails
+    from .user_feature_entry import UserFeatureEntry
+    from .user_feature_list import UserFeatureList
+    from .user_identifier import UserIdentifier
+    from .user_org_info import UserOrgInfo
+    from .user_org_role import UserOrgRole
+    from .user_response import UserResponse
+    from .uuid import Uuid
+    from .verification_token_response import VerificationTokenResponse
+    from .view_isometric import ViewIsometric
+    from .volume import Volume
+    from .web_socket_request import WebSocketRequest
+    from .web_socket_response import WebSocketResponse
+    from .website_cad_user_info_form import WebsiteCadUserInfoForm
+    from .website_sales_form import WebsiteSalesForm
+    from .website_support_form import WebsiteSupportForm
+    from .world_coordinate_system import WorldCoordinateSystem
+    from .zoo_product_subscription import ZooProductSubscription
+    from .zoo_product_subscription_downgrade_reason import (
+        ZooProductSubscriptionDowngradeReason,
+    )
+    from .zoo_product_subscriptions import ZooProductSubscriptions
+    from .zoo_product_subscriptions_org_request import ZooProductSubscriptionsOrgRequest
+    from .zoo_product_subscriptions_user_request import (
+        ZooProductSubscriptionsUserRequest,
+    )
+    from .zoo_tool import ZooTool
+    from .zookeeper_auto_router_metadata import ZookeeperAutoRouterMetadata
+    from .zookeeper_edit_patch import ZookeeperEditPatch
+    from .zookeeper_edit_patch_file import ZookeeperEditPatchFile
+    from .zookeeper_turn_usage import ZookeeperTurnUsage
+    from .zookeeper_turn_usage_model import ZookeeperTurnUsageModel
+    from .zookeeper_turn_usage_stage import ZookeeperTurnUsageStage
+    from .zoom_to_fit import ZoomToFit
+
+# Public name -> module that defines it.
+_MODULES = {
+    "AccountProvider": "account_provider",
+    "AddHoleFromOffset": "add_hole_from_offset",
+    "AddOrgMember": "add_org_member",
+    "Address": "address",
+    "AddressDetails": "address_details",
+    "AdjacencyInfo": "adjacency_info",
+    "AggregateUsageCollectionThresholdBounds": "aggregate_usage_collection_threshold_bounds",
+    "AggregateUsageCollectionThresholdSet": "aggregate_usage_collection_threshold_set",
+    "AggregateUsageCollectionThresholdSource": "aggregate_usage_collection_threshold_source",
+    "AggregateUsageCollectionThresholdView": "aggregate_usage_collection_threshold_view",
+    "Angle": "angle",
+    "AnnotationBasicDimension": "annotation_basic_dimension",
+    "AnnotationFeatureControl": "annotation_feature_control",
+    "AnnotationFeatureTag": "annotation_feature_tag",
+    "AnnotationLineEnd": "annotation_line_end",
+    "AnnotationLineEndOptions": "annotation_line_end_options",
+    "AnnotationMbdBasicDimension": "annotation_mbd_basic_dimension",
+    "AnnotationMbdControlFrame": "annotation_mbd_control_frame",
+    "AnnotationOptions": "annotation_options",
+    "AnnotationTextAlignmentX": "annotation_text_alignment_x",
+    "AnnotationTextAlignmentY": "annotation_text_alignment_y",
+    "AnnotationTextOptions": "annotation_text_options",
+    "AnnotationType": "annotation_type",
+    "Announcement": "announcement",
+    "AnnouncementList": "announcement_list",
+    "ApiCallStatus": "api_call_status",
+    "ApiCallWithPrice": "api_call_with_price",
+    "ApiCallWithPriceResultsPage": "api_call_with_price_results_page",
+    "ApiEndpoint": "api_endpoint",
+    "ApiError": "api_error",
+    "ApiToken": "api_token",
+    "ApiTokenResultsPage": "api_token_results_page",
+    "ApiTokenUuid": "api_token_uuid",
+    "ApiTokenWithFullToken": "api_token_with_full_token",
+    "AppClientInfo": "app_client_info",
+    "AsyncApiCallOutput": "async_api_call_output",
+    "AuthApiKeyResponse": "auth_api_key_response",
+    "AuthCallback": "auth_callback",
+    "Axis": "axis",
+    "AxisDirectionPair": "axis_direction_pair",
+    "BatchResponse": "batch_response",
+    "BeginExecution": "begin_execution",
+    "BillingCadence": "billing_cadence",
+    "BillingCommitmentScope": "billing_commitment_scope",
+    "BillingContractItemInput": "billing_contract_item_input",
+    "BillingContractItemView": "billing_contract_item_view",
+    "BillingContractStatus": "billing_contract_status",
+    "BillingContractUpsert": "billing_contract_upsert",
+    "BillingContractView": "billing_contract_view",
+    "BillingExternalCustomerId": "billing_external_customer_id",
+    "BillingInfo": "billing_info",
+    "BillingItemCode": "billing_item_code",
+    "BillingItemKind": "billing_item_kind",
+    "BillingPeriodIndex": "billing_period_index",
+    "BillingPeriodInput": "billing_period_input",
+    "BillingPeriodStatus": "billing_period_status",
+    "BillingPeriodView": "billing_period_view",
+    "BillingProvider": "billing_provider",
+    "BillingQuantity": "billing_quantity",
+    "BillingRateTierInput": "billing_rate_tier_input",
+    "BillingRateTierView": "billing_rate_tier_view",
+    "BillingRolloverPolicy": "billing_rollover_policy",
+    "BillingUnit": "billing_unit",
+    "BillingUnitGranularity": "billing_unit_granularity",
+    "BlendType": "blend_type",
+    "BlockReason": "block_reason",
+    "BodiesCreated": "bodies_created",
+    "BodiesUpdated": "bodies_updated",
+    "BodyCreated": "body_created",
+    "BodyType": "body_type",
+    "BodyUpdated": "body_updated",
+    "BooleanImprint": "boolean_imprint",
+    "BooleanIntersection": "boolean_intersection",
+    "BooleanSubtract": "boolean_subtract",
+    "BooleanUnion": "boolean_union",
+    "BoundingBox": "bounding_box",
+    "CadDesignWorkflow": "cad_design_workflow",
+    "CadDiscoverySource": "cad_discovery_source",
+    "CadExperienceLevel": "cad_experience_level",
+    "CadIndustry": "cad_industry",
+    "CadUserType": "cad_user_type",
+    "CameraDragEnd": "camera_drag_end",
+    "CameraDragInteractionType": "camera_drag_interaction_type",
+    "CameraDragMove": "camera_drag_move",
+    "CameraDragStart": "camera_drag_start",
+    "CameraMovement": "camera_movement",
+    "CameraSettings": "camera_settings",
+    "CameraViewState": "camera_view_state",
+    "CardDetails": "card_details",
+    "CenterOfMass": "center_of_mass",
+    "ClientErrorReport": "client_error_report",
+    "ClientErrorReportAccepted": "client_error_report_accepted",
+    "ClientMetrics": "client_metrics",
+    "ClosePath": "close_path",
+    "ClosestEdge": "closest_edge",
+    "CodeLanguage": "code_language",
+    "CodeOption": "code_option",
+    "CodeOutput": "code_output",
+    "Color": "color",
+    "CompanySize": "company_size",
+    "ComplementaryEdges": "complementary_edges",
+    "ComponentTransform": "component_transform",
+    "Conversation": "conversation",
+    "ConversationResultsPage": "conversation_results_page",
+    "ConversionParams": "conversion_params",
+    "ConversionSortMode": "conversion_sort_mode",
+    "CountryCode": "country_code",
+    "Coupon": "coupon",
+    "CreateCustomModel": "create_custom_model",
+    "CreateOAuth2AppRequest": "create_o_auth2_app_request",
+    "CreateOrgDataset": "create_org_dataset",
+    "CreatePlanarSurface": "create_planar_surface",
+    "CreateProjectShareLinkRequest": "create_project_share_link_request",
+    "CreateRegion": "create_region",
+    "CreateRegionFromQueryPoint": "create_region_from_query_point",
+    "CreateShortlinkRequest": "create_shortlink_request",
+    "CreateShortlinkResponse": "create_shortlink_response",
+    "CreatedAtSortMode": "created_at_sort_mode",
+    "Currency": "currency",
+    "CurveDebug": "curve_debug",
+    "CurveGetControlPoints": "curve_get_control_points",
+    "CurveGetEndPoints": "curve_get_end_points",
+    "CurveGetType": "curve_get_type",
+    "CurveSetConstraint": "curve_set_constraint",
+    "CurveType": "curve_type",
+    "CurveTypeDebug": "curve_type_debug",
+    "CustomModel": "custom_model",
+    "Customer": "customer",
+    "CustomerBalance": "customer_balance",
+    "CutStrategy": "cut_strategy",
+    "CutType": "cut_type",
+    "CutTypeV2": "cut_type_v2",
+    "DatasetS3Policies": "dataset_s3_policies",
+    "DefaultCameraCenterToScene": "default_camera_center_to_scene",
+    "DefaultCameraCenterToSelection": "default_camera_center_to_selection",
+    "DefaultCameraFocusOn": "default_camera_focus_on",
+    "DefaultCameraGetSettings": "default_camera_get_settings",
+    "DefaultCameraGetView": "default_camera_get_view",
+    "DefaultCameraLookAt": "default_camera_look_at",
+    "DefaultCameraPerspectiveSettings": "default_camera_perspective_settings",
+    "DefaultCameraSetOrthographic": "default_camera_set_orthographic",
+    "DefaultCameraSetPerspective": "default_camera_set_perspective",
+    "DefaultCameraSetView": "default_camera_set_view",
+    "DefaultCameraZoom": "default_camera_zoom",
+    "Density": "density",
+    "DerEncodedKeyPair": "der_encoded_key_pair",
+    "DeviceAccessTokenRequestForm": "device_access_token_request_form",
+    "DeviceAuthConfirmParams": "device_auth_confirm_params",
+    "DeviceAuthRequestForm": "device_auth_request_form",
+    "Direction": "direction",
+    "DirectionType": "direction_type",
+    "Discount": "discount",
+    "DiscountCode": "discount_code",
+    "DistanceType": "distance_type",
+    "DxfStorage": "dxf_storage",
+    "EdgeCutVersion": "edge_cut_version",
+    "EdgeGetLength": "edge_get_length",
+    "EdgeInfo": "edge_info",
+    "EdgeLinesVisible": "edge_lines_visible",
+    "EdgeSpecifier": "edge_specifier",
+    "EmailAuthenticationForm": "email_authentication_form",
+    "EmailMarketingConfirmTokenBody": "email_marketing_confirm_token_body",
+    "EmailMarketingConsentState": "email_marketing_consent_state",
+    "EmailMarketingConsentStatus": "email_marketing_consent_status",
+    "Empty": "empty",
+    "EnableSketchMode": "enable_sketch_mode",
+    "EndExecution": "end_execution",
+    "EngineUtilEvaluatePath": "engine_util_evaluate_path",
+    "EntityCircularPattern": "entity_circular_pattern",
+    "EntityClone": "entity_clone",
+    "EntityDeleteChildren": "entity_delete_children",
+    "EntityFade": "entity_fade",
+    "EntityGetAllChildUuids": "entity_get_all_child_uuids",
+    "EntityGetChildUuid": "entity_get_child_uuid",
+    "EntityGetDistance": "entity_get_distance",
+    "EntityGetIndex": "entity_get_index",
+    "EntityGetNumChildren": "entity_get_num_children",
+    "EntityGetParentId": "entity_get_parent_id",
+    "EntityGetPrimitiveIndex": "entity_get_primitive_index",
+    "EntityGetSketchPaths": "entity_get_sketch_paths",
+    "EntityLinearPattern": "entity_linear_pattern",
+    "EntityLinearPatternTransform": "entity_linear_pattern_transform",
+    "EntityMakeHelix": "entity_make_helix",
+    "EntityMakeHelixFromEdge": "entity_make_helix_from_edge",
+    "EntityMakeHelixFromParams": "entity_make_helix_from_params",
+    "EntityMirror": "entity_mirror",
+    "EntityMirrorAcross": "entity_mirror_across",
+    "EntityMirrorAcrossEdge": "entity_mirror_across_edge",
+    "EntityReference": "entity_reference",
+    "EntitySetOpacity": "entity_set_opacity",
+    "EntityType": "entity_type",
+    "Error": "error",
+    "ErrorCode": "error_code",
+    "Export": "export",
+    "Export2d": "export2d",
+    "Export3d": "export3d",
+    "ExportFile": "export_file",
+    "ExtendPath": "extend_path",
+    "ExtendedUser": "extended_user",
+    "Extrude": "extrude",
+    "ExtrudeMethod": "extrude_method",
+    "ExtrudeReference": "extrude_reference",
+    "ExtrudeToReference": "extrude_to_reference",
+    "ExtrudedFaceInfo": "extruded_face_info",
+    "ExtrusionFaceCapType": "extrusion_face_cap_type",
+    "ExtrusionFaceInfo": "extrusion_face_info",
+    "FaceEdgeInfo": "face_edge_info",
+    "FaceGetCenter": "face_get_center",
+    "FaceGetGradient": "face_get_gradient",
+    "FaceGetPosition": "face_get_position",
+    "FaceIsPlanar": "face_is_planar",
+    "FactoryCustomerCatalogOption": "factory_customer_catalog_option",
+    "FactoryJobResponse": "factory_job_response",
+    "FailureWebSocketResponse": "failure_web_socket_response",
+    "FbxStorage": "fbx_storage",
+    "Feature": "feature",
+    "FileCenterOfMass": "file_center_of_mass",
+    "FileConversion": "file_conversion",
+    "FileDensity": "file_density",
+    "FileExportFormat": "file_export_format",
+    "FileImportFormat": "file_import_format",
+    "FileMass": "file_mass",
+    "FileSurfaceArea": "file_surface_area",
+    "FileVolume": "file_volume",
+    "FractionOfEdge": "fraction_of_edge",
+    "GetEntityType": "get_entity_type",
+    "GetNumObjects": "get_num_objects",
+    "GetSketchModePlane": "get_sketch_mode_plane",
+    "GlobalAxis": "global_axis",
+    "GltfPresentation": "gltf_presentation",
+    "GltfStorage": "gltf_storage",
+    "HandleMouseDragEnd": "handle_mouse_drag_end",
+    "HandleMouseDragMove": "handle_mouse_drag_move",
+    "HandleMouseDragStart": "handle_mouse_drag_start",
+    "HighlightSetEntities": "highlight_set_entities",
+    "HighlightSetEntity": "highlight_set_entity",
+    "IceServer": "ice_server",
+    "IdpMetadataSource": "idp_metadata_source",
+    "ImageFormat": "image_format",
+    "ImportFile": "import_file",
+    "ImportFiles": "import_files",
+    "ImportedGeometry": "imported_geometry",
+    "InputFormat3d": "input_format3d",
+    "Invoice": "invoice",
+    "InvoiceLineItem": "invoice_line_item",
+    "InvoiceRefundStatus": "invoice_refund_status",
+    "InvoiceResultsPage": "invoice_results_page",
+    "InvoiceStatus": "invoice_status",
+    "IpAddrInfo": "ip_addr_info",
+    "KclCodeCompletionParams": "kcl_code_completion_params",
+    "KclCodeCompletionRequest": "kcl_code_completion_request",
+    "KclCodeCompletionResponse": "kcl_code_completion_response",
+    "KclModel": "kcl_model",
+    "KclProjectFileRole": "kcl_project_file_role",
+    "KclProjectPreviewStatus": "kcl_project_preview_status",
+    "KclProjectPublicationStatus": "kcl_project_publication_status",
+    "KclProjectShareLinkAccessMode": "kcl_project_share_link_access_mode",
+    "KittyCadBaseModel": "base",
+    "KittyCadRootModel": "base",
+    "LengthUnit": "length_unit",
+    "LenientUrl": "lenient_url",
+    "Loft": "loft",
+    "MakeAxesGizmo": "make_axes_gizmo",
+    "MakeOffsetPath": "make_offset_path",
+    "MakePlane": "make_plane",
+    "Mass": "mass",
+    "MbdSymbol": "mbd_symbol",
+    "Method": "method",
+    "MirrorAcross": "mirror_across",
+    "MlCopilotClientMessage": "ml_copilot_client_message",
+    "MlCopilotFile": "ml_copilot_file",
+    "MlCopilotMode": "ml_copilot_mode",
+    "MlCopilotModeOption": "ml_copilot_mode_option",
+    "MlCopilotServerMessage": "ml_copilot_server_message",
+    "MlCopilotSupportedModels": "ml_copilot_supported_models",
+    "MlCopilotSystemCommand": "ml_copilot_system_command",
+    "MlCopilotTool": "ml_copilot_tool",
+    "MlFeedback": "ml_feedback",
+    "MlReasoningEffort": "ml_reasoning_effort",
+    "MlToolResult": "ml_tool_result",
+    "ModelingAppShareLinks": "modeling_app_share_links",
+    "ModelingAppSubscriptionTier": "modeling_app_subscription_tier",
+    "ModelingCmd": "modeling_cmd",
+    "ModelingCmdId": "modeling_cmd_id",
+    "ModelingCmdReq": "modeling_cmd_req",
+    "ModelingSessionData": "modeling_session_data",
+    "MouseClick": "mouse_click",
+    "MouseMove": "mouse_move",
+    "MovePathPen": "move_path_pen",
+    "NewAnnotation": "new_annotation",
+    "OAuth2AppClientType": "o_auth2_app_client_type",
+    "OAuth2AppGrantType": "o_auth2_app_grant_type",
+    "OAuth2AppMode": "o_auth2_app_mode",
+    "OAuth2AppResponse": "o_auth2_app_response",
+    "OAuth2AppResponseResultsPage": "o_auth2_app_response_results_page",
+    "OAuth2AuthorizationCodeUuid": "o_auth2_authorization_code_uuid",
+    "OAuth2AuthorizationDecisionResponse": "o_auth2_authorization_decision_response",
+    "OAuth2AuthorizationRequestResponse": "o_auth2_authorization_request_response",
+    "OAuth2AuthorizationResponseType": "o_auth2_authorization_response_type",
+    "OAuth2ClientInfo": "oauth2_client_info",
+    "OAuth2CodeChallengeMethod": "o_auth2_code_challenge_method",
+    "OAuth2GrantType": "oauth2_grant_type",
+    "OAuth2RefreshTokenUuid": "o_auth2_refresh_token_uuid",
+    "OAuth2Scope": "o_auth2_scope",
+    "OAuth2Scopes": "o_auth2_scopes",
+    "OAuth2TokenGrantType": "o_auth2_token_grant_type",
+    "OAuth2TokenRequestForm": "o_auth2_token_request_form",
+    "ObjectBringToFront": "object_bring_to_front",
+    "ObjectSetMaterialParamsPbr": "object_set_material_params_pbr",
+    "ObjectSetName": "object_set_name",
+    "ObjectVisible": "object_visible",
+    "OffsetSurface": "offset_surface",
+    "OkModelingCmdResponse": "ok_modeling_cmd_response",
+    "OkWebSocketResponseData": "ok_web_socket_response_data",
+    "OppositeForAngle": "opposite_for_angle",
+    "OppositeForLengthUnit": "opposite_for_length_unit",
+    "Org": "org",
+    "OrgDataset": "org_dataset",
+    "OrgDatasetConversionStatsResponse": "org_dataset_conversion_stats_response",
+    "OrgDatasetFileConversionDetails": "org_dataset_file_conversion_details",
+    "OrgDatasetFileConversionPhase": "org_dataset_file_conversion_phase",
+    "OrgDatasetFileConversionStatus": "org_dataset_file_conversion_status",
+    "OrgDatasetFileConversionSummary": "org_dataset_file_conversion_summary",
+    "OrgDatasetFileConversionSummaryResultsPage": "org_dataset_file_conversion_summary_results_page",
+    "OrgDatasetResultsPage": "org_dataset_results_page",
+    "OrgDatasetSemanticSearchMatch": "org_dataset_semantic_search_match",
+    "OrgDatasetSnapshotImage": "org_dataset_snapshot_image",
+    "OrgDatasetSource": "org_dataset_source",
+    "OrgDatasetStatus": "org_dataset_status",
+    "OrgDetails": "org_details",
+    "OrgMember": "org_member",
+    "OrgMemberResultsPage": "org_member_results_page",
+    "OrgRole": "org_role",
+    "OrgSkillResponse": "org_skill_response",
+    "OrientToFace": "orient_to_face",
+    "OriginType": "origin_type",
+    "OutputFile": "output_file",
+    "OutputFormat2d": "output_format2d",
+    "OutputFormat3d": "output_format3d",
+    "PathCommand": "path_command",
+    "PathComponentConstraintBound": "path_component_constraint_bound",
+    "PathComponentConstraintType": "path_component_constraint_type",
+    "PathGetCurveUuid": "path_get_curve_uuid",
+    "PathGetCurveUuidsForVertices": "path_get_curve_uuids_for_vertices",
+    "PathGetInfo": "path_get_info",
+    "PathGetSketchTargetUuid": "path_get_sketch_target_uuid",
+    "PathGetVertexUuids": "path_get_vertex_uuids",
+    "PathSegment": "path_segment",
+    "PathSegmentInfo": "path_segment_info",
+    "PaymentIntent": "payment_intent",
+    "PaymentMethod": "payment_method",
+    "PaymentMethodCardChecks": "payment_method_card_checks",
+    "PaymentMethodType": "payment_method_type",
+    "PerspectiveCameraParameters": "perspective_camera_parameters",
+    "PlanInterval": "plan_interval",
+    "PlanStep": "plan_step",
+    "PlaneIntersectAndProject": "plane_intersect_and_project",
+    "PlaneSetColor": "plane_set_color",
+    "PlyStorage": "ply_storage",
+    "Point2d": "point2d",
+    "Point3d": "point3d",
+    "Point4d": "point4d",
+    "Pong": "pong",
+    "PostEffectType": "post_effect_type",
+    "PriceUpsertRequest": "price_upsert_request",
+    "PrimitiveTopologyFallback": "primitive_topology_fallback",
+    "PrivacySettings": "privacy_settings",
+    "ProjectAccessResponse": "project_access_response",
+    "ProjectAccessScope": "project_access_scope",
+    "ProjectArchiveFormat": "project_archive_format",
+    "ProjectCategoryResponse": "project_category_response",
+    "ProjectEntityToPlane": "project_entity_to_plane",
+    "ProjectFileResponse": "project_file_response",
+    "ProjectPointsToPlane": "project_points_to_plane",
+    "ProjectPublicationInfoResponse": "project_publication_info_response",
+    "ProjectResponse": "project_response",
+    "ProjectShareLinkResponse": "project_share_link_response",
+    "ProjectSummaryResponse": "project_summary_response",
+    "PublicEmailMarketingConsentRequest": "public_email_marketing_consent_request",
+    "PublicMailingListMembershipRequest": "public_mailing_list_membership_request",
+    "PublicProjectOwnerResponse": "public_project_owner_response",
+    "PublicProjectResponse": "public_project_response",
+    "PublicProjectVoteResponse": "public_project_vote_response",
+    "QueryEntityType": "query_entity_type",
+    "QueryEntityTypeWithPoint": "query_entity_type_with_point",
+    "RawFile": "raw_file",
+    "ReasoningMessage": "reasoning_message",
+    "ReconfigureStream": "reconfigure_stream",
+    "RegionGetQueryPoint": "region_get_query_point",
+    "RegionGetResolvableIntersectionInfo": "region_get_resolvable_intersection_info",
+    "RegionVersion": "region_version",
+    "RelativeTo": "relative_to",
+    "RemoveSceneObjects": "remove_scene_objects",
+    "Revolve": "revolve",
+    "RevolveAboutEdge": "revolve_about_edge",
+    "Rotation": "rotation",
+    "RtcIceCandidateInit": "rtc_ice_candidate_init",
+    "RtcSdpType": "rtc_sdp_type",
+    "RtcSessionDescription": "rtc_session_description",
+    "SalesInquiryType": "sales_inquiry_type",
+    "SamlIdentityProvider": "saml_identity_provider",
+    "SamlIdentityProviderCreate": "saml_identity_provider_create",
+    "SceneClearAll": "scene_clear_all",
+    "SceneGetEntityIds": "scene_get_entity_ids",
+    "SceneSelectionType": "scene_selection_type",
+    "SceneToolType": "scene_tool_type",
+    "SelectAdd": "select_add",
+    "SelectClear": "select_clear",
+    "SelectEntity": "select_entity",
+    "SelectGet": "select_get",
+    "SelectRegionFromPoint": "select_region_from_point",
+    "SelectRemove": "select_remove",
+    "SelectReplace": "select_replace",
+    "SelectWithPoint": "select_with_point",
+    "SelectedRegion": "selected_region",
+    "Selection": "selection",
+    "SendObject": "send_object",
+    "ServiceAccount": "service_account",
+    "ServiceAccountResultsPage": "service_account_results_page",
+    "ServiceAccountUuid": "service_account_uuid",
+    "Session": "session",
+    "SessionUuid": "session_uuid",
+    "SetBackgroundColor": "set_background_color",
+    "SetCurrentToolProperties": "set_current_tool_properties",
+    "SetDefaultSystemProperties": "set_default_system_properties",
+    "SetGridAutoScale": "set_grid_auto_scale",
+    "SetGridReferencePlane": "set_grid_reference_plane",
+    "SetGridScale": "set_grid_scale",
+    "SetObjectTransform": "set_object_transform",
+    "SetOrderIndependentTransparency": "set_order_independent_transparency",
+    "SetSceneUnits": "set_scene_units",
+    "SetSelectionFilter": "set_selection_filter",
+    "SetSelectionType": "set_selection_type",
+    "SetTool": "set_tool",
+    "Shortlink": "shortlink",
+    "ShortlinkResultsPage": "shortlink_results_page",
+    "SideFace": "side_face",
+    "SketchGetInfo": "sketch_get_info",
+    "SketchModeDisable": "sketch_mode_disable",
+    "Solid2dAddHole": "solid2d_add_hole",
+    "Solid3dCutEdgeReferences": "solid3d_cut_edge_references",
+    "Solid3dCutEdges": "solid3d_cut_edges",
+    "Solid3dFilletEdge": "solid3d_fillet_edge",
+    "Solid3dFlip": "solid3d_flip",
+    "Solid3dFlipFace": "solid3d_flip_face",
+    "Solid3dGetAdjacencyInfo": "solid3d_get_adjacency_info",
+    "Solid3dGetAllEdgeFaces": "solid3d_get_all_edge_faces",
+    "Solid3dGetAllOppositeEdges": "solid3d_get_all_opposite_edges",
+    "Solid3dGetBodyType": "solid3d_get_body_type",
+    "Solid3dGetCommonEdge": "solid3d_get_common_edge",
+    "Solid3dGetEdgeUuid": "solid3d_get_edge_uuid",
+    "Solid3dGetExtrusionFaceInfo": "solid3d_get_extrusion_face_info",
+    "Solid3dGetFaceUuid": "solid3d_get_face_uuid",
+    "Solid3dGetNextAdjacentEdge": "solid3d_get_next_adjacent_edge",
+    "Solid3dGetOppositeEdge": "solid3d_get_opposite_edge",
+    "Solid3dGetPrevAdjacentEdge": "solid3d_get_prev_adjacent_edge",
+    "Solid3dJoin": "solid3d_join",
+    "Solid3dMultiJoin": "solid3d_multi_join",
+    "Solid3dShellFace": "solid3d_shell_face",
+    "SourcePosition": "source_position",
+    "SourceRange": "source_range",
+    "SourceRangePrompt": "source_range_prompt",
+    "StartPath": "start_path",
+    "StepImportTargetRepresentation": "step_import_target_representation",
+    "StepPresentation": "step_presentation",
+    "StlStorage": "stl_storage",
+    "StorageProvider": "storage_provider",
+    "StoreCouponParams": "store_coupon_params",
+    "SubscriptionActionType": "subscription_action_type",
+    "SubscriptionBillingMode": "subscription_billing_mode",
+    "SubscriptionPlanBillingModel": "subscription_plan_billing_model",
+    "SubscriptionPlanPriceRecord": "subscription_plan_price_record",
+    "SubscriptionTierFeature": "subscription_tier_feature",
+    "SubscriptionTierPrice": "subscription_tier_price",
+    "SubscriptionTierType": "subscription_tier_type",
+    "SubscriptionTrainingDataBehavior": "subscription_training_data_behavior",
+    "SuccessWebSocketResponse": "success_web_socket_response",
+    "SupportInquiryType": "support_inquiry_type",
+    "SupportTier": "support_tier",
+    "SurfaceArea": "surface_area",
+    "SurfaceBlend": "surface_blend",
+    "SurfaceCreated": "surface_created",
+    "SurfaceEdgeReference": "surface_edge_reference",
+    "Sweep": "sweep",
+    "System": "system",
+    "TakeSnapshot": "take_snapshot",
+    "TextToCadModel": "text_to_cad_model",
+    "TextToCadMultiFileIterationBody": "text_to_cad_multi_file_iteration_body",
+    "TextToCadResponse": "text_to_cad_response",
+    "TextToCadResponseResultsPage": "text_to_cad_response_results_page",
+    "TokenRevokeRequestForm": "token_revoke_request_form",
+    "Transform": "transform",
+    "TransformByForPoint3d": "transform_by_for_point3d",
+    "TransformByForPoint4d": "transform_by_for_point4d",
+    "TwistExtrude": "twist_extrude",
+    "UnitAngle": "unit_angle",
+    "UnitAngleConversion": "unit_angle_conversion",
+    "UnitArea": "unit_area",
+    "UnitAreaConversion": "unit_area_conversion",
+    "UnitCurrent": "unit_current",
+    "UnitCurrentConversion": "unit_current_conversion",
+    "UnitDensity": "unit_density",
+    "UnitEnergy": "unit_energy",
+    "UnitEnergyConversion": "unit_energy_conversion",
+    "UnitForce": "unit_force",
+    "UnitForceConversion": "unit_force_conversion",
+    "UnitFrequency": "unit_frequency",
+    "UnitFrequencyConversion": "unit_frequency_conversion",
+    "UnitLength": "unit_length",
+    "UnitLengthConversion": "unit_length_conversion",
+    "UnitMass": "unit_mass",
+    "UnitMassConversion": "unit_mass_conversion",
+    "UnitPower": "unit_power",
+    "UnitPowerConversion": "unit_power_conversion",
+    "UnitPressure": "unit_pressure",
+    "UnitPressureConversion": "unit_pressure_conversion",
+    "UnitTemperature": "unit_temperature",
+    "UnitTemperatureConversion": "unit_temperature_conversion",
+    "UnitTorque": "unit_torque",
+    "UnitTorqueConversion": "unit_torque_conversion",
+    "UnitVolume": "unit_volume",
+    "UnitVolumeConversion": "unit_volume_conversion",
+    "UpdateAnnotation": "update_annotation",
+    "UpdateCustomModel": "update_custom_model",
+    "UpdateMemberToOrgBody": "update_member_to_org_body",
+    "UpdateOAuth2AppRequest": "update_o_auth2_app_request",
+    "UpdateOrgDataset": "update_org_dataset",
+    "UpdateOrgDatasetSource": "update_org_dataset_source",
+    "UpdatePaymentBalance": "update_payment_balance",
+    "UpdateShortlinkRequest": "update_shortlink_request",
+    "UpdateUser": "update_user",
+    "UploadOrgDatasetFilesResponse": "upload_org_dataset_files_response",
+    "UserAdminDetails": "user_admin_details",
+    "UserCadInfoAdminDetails": "user_cad_info_admin_details",
+    "UserFeatureEntry": "user_feature_entry",
+    "UserFeatureList": "user_feature_list",
+    "UserIdentifier": "user_identifier",
+    "UserOrgInfo": "user_org_info",
+    "UserOrgRole": "user_org_role",
+    "UserResponse": "user_response",
+    "Uuid": "uuid",
+    "VerificationTokenResponse": "verification_token_response",
+    "ViewIsometric": "view_isometric",
+    "Volume": "volume",
+    "WebSocketRequest": "web_socket_request",
+    "WebSocketResponse": "web_socket_response",
+    "WebsiteCadUserInfoForm": "website_cad_user_info_form",
+    "WebsiteSalesForm": "website_sales_form",
+    "WebsiteSupportForm": "website_support_form",
+    "WorldCoordinateSystem": "world_coordinate_system",
+    "ZooProductSubscription": "zoo_product_subscription",
+    "ZooProductSubscriptionDowngradeReason": "zoo_product_subscription_downgrade_reason",
+    "ZooProductSubscriptions": "zoo_product_subscriptions",
+    "ZooProductSubscriptionsOrgRequest": "zoo_product_subscriptions_org_request",
+    "ZooProductSubscriptionsUserRequest": "zoo_product_subscriptions_user_request",
+    "ZooTool": "zoo_tool",
+    "ZookeeperAutoRouterMetadata": "zookeeper_auto_router_metadata",
+    "ZookeeperEditPatch": "zookeeper_edit_patch",
+    "ZookeeperEditPatchFile": "zookeeper_edit_patch_file",
+    "ZookeeperTurnUsage": "zookeeper_turn_usage",
+    "ZookeeperTurnUsageModel": "zookeeper_turn_usage_model",
+    "ZookeeperTurnUsageStage": "zookeeper_turn_usage_stage",
+    "ZoomToFit": "zoom_to_fit",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_MODULES))
+
+
+__all__ = list(_MODULES)
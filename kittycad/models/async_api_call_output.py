@@ -1,7 +1,7 @@
 import datetime
 from typing import Dict, List, Literal, Optional, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
 from ..models.api_call_status import ApiCallStatus
@@ -19,7 +19,7 @@ from ..models.unit_length import UnitLength
 from ..models.unit_mass import UnitMass
 from ..models.unit_volume import UnitVolume
 from ..models.uuid import Uuid
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 from .base64data import Base64Data
 
 
@@ -323,7 +323,7 @@ class OptionTextToCadMultiFileIteration(KittyCadBaseModel):
     user_id: Uuid
 
 
-AsyncApiCallOutput = RootModel[
+AsyncApiCallOutput = KittyCadRootModel[
     Annotated[
         Union[
             OptionFileConversion,
@@ -1,8 +1,23 @@
 """Base model classes for KittyCAD SDK."""
 
-from typing import Any, Dict
+import os
+from typing import Any, Dict, Generic, TypeVar
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, RootModel
+
+RootT = TypeVar("RootT")
+
+DEFER_BUILD = os.environ.get("KITTYCAD_DEFER_BUILD", "").lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
+"""Whether models build their validators on first use instead of at import.
+
+Set the ``KITTYCAD_DEFER_BUILD`` environment variable before importing
+``kittycad`` to turn it on; see :mod:`kittycad.precompile`.
+"""
 
 
 class KittyCadBaseModel(BaseModel):
@@ -19,6 +34,7 @@ class KittyCadBaseModel(BaseModel):
         extra="forbid",
         # Use enum values in serialization
         use_enum_values=True,
+        defer_build=DEFER_BUILD,
     )
 
     def __repr__(self) -> str:
@@ -90,3 +106,9 @@ class KittyCadBaseModel(BaseModel):
             user = User.from_json(user_json)
         """
         return cls.model_validate_json(json_str)
+
+
+class KittyCadRootModel(RootModel[RootT], Generic[RootT]):
+    """Base for the generated union (``oneOf``) models."""
+
+    model_config = ConfigDict(defer_build=DEFER_BUILD)
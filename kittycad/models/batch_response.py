@@ -1,8 +1,6 @@
 from typing import Union
 
-from pydantic import RootModel
-
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class Response(KittyCadBaseModel):
@@ -13,7 +11,7 @@ class Errors(KittyCadBaseModel):
     """Errors that occurred during the modeling command."""
 
 
-BatchResponse = RootModel[
+BatchResponse = KittyCadRootModel[
     Union[
         Response,
         Errors,
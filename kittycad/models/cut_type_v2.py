@@ -1,10 +1,10 @@
 from typing import Optional, Union
 
-from pydantic import RootModel, model_serializer, model_validator
+from pydantic import model_serializer, model_validator
 
 from ..models.angle import Angle
 from ..models.length_unit import LengthUnit
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class Fillet(KittyCadBaseModel):
@@ -87,7 +87,7 @@ class Custom(KittyCadBaseModel):
         return {"custom": payload}
 
 
-CutTypeV2 = RootModel[
+CutTypeV2 = KittyCadRootModel[
     Union[
         Fillet,
         Chamfer,
@@ -1,9 +1,9 @@
 from typing import Union
 
-from pydantic import RootModel, model_serializer, model_validator
+from pydantic import model_serializer, model_validator
 
 from ..models.point3d import Point3d
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class Edge(KittyCadBaseModel):
@@ -46,7 +46,7 @@ class Axis(KittyCadBaseModel):
         return {"axis": payload}
 
 
-DirectionType = RootModel[
+DirectionType = KittyCadRootModel[
     Union[
         Edge,
         Axis,
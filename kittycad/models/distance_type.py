@@ -1,10 +1,10 @@
 from typing import Literal, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
 from ..models.global_axis import GlobalAxis
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class OptionEuclidean(KittyCadBaseModel):
@@ -21,7 +21,7 @@ class OptionOnAxis(KittyCadBaseModel):
     type: Literal["on_axis"] = "on_axis"
 
 
-DistanceType = RootModel[
+DistanceType = KittyCadRootModel[
     Annotated[
         Union[
             OptionEuclidean,
@@ -1,10 +1,10 @@
 from typing import List, Literal, Optional, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
 from ..models.primitive_topology_fallback import PrimitiveTopologyFallback
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class OptionPlane(KittyCadBaseModel):
@@ -105,7 +105,7 @@ class OptionRegion(KittyCadBaseModel):
     type: Literal["region"] = "region"
 
 
-EntityReference = RootModel[
+EntityReference = KittyCadRootModel[
     Annotated[
         Union[
             OptionPlane,
@@ -1,10 +1,10 @@
 from typing import Optional, Union
 
-from pydantic import RootModel, model_serializer, model_validator
+from pydantic import model_serializer, model_validator
 
 from ..models.entity_reference import EntityReference as EntityReferenceModel
 from ..models.point3d import Point3d
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class EntityReference(KittyCadBaseModel):
@@ -79,7 +79,7 @@ class Point(KittyCadBaseModel):
         return {"point": payload}
 
 
-ExtrudeReference = RootModel[
+ExtrudeReference = KittyCadRootModel[
     Union[
         EntityReference,
         Axis,
@@ -1,9 +1,9 @@
 from typing import Literal, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 from .base64data import Base64Data
 
 
@@ -23,7 +23,7 @@ class OptionBase64EncodedXml(KittyCadBaseModel):
     type: Literal["base64_encoded_xml"] = "base64_encoded_xml"
 
 
-IdpMetadataSource = RootModel[
+IdpMetadataSource = KittyCadRootModel[
     Annotated[
         Union[
             OptionUrl,
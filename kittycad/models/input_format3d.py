@@ -1,12 +1,12 @@
 from typing import Literal, Optional, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
 from ..models.step_import_target_representation import StepImportTargetRepresentation
 from ..models.system import System
 from ..models.unit_length import UnitLength
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class OptionAcis(KittyCadBaseModel):
@@ -157,7 +157,7 @@ class OptionStl(KittyCadBaseModel):
     units: UnitLength
 
 
-InputFormat3d = RootModel[
+InputFormat3d = KittyCadRootModel[
     Annotated[
         Union[
             OptionAcis,
@@ -1,10 +1,10 @@
 from typing import Union
 
-from pydantic import RootModel, model_serializer, model_validator
+from pydantic import model_serializer, model_validator
 
 from ..models.edge_specifier import EdgeSpecifier
 from ..models.point3d import Point3d
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class Edge(KittyCadBaseModel):
@@ -97,7 +97,7 @@ class Plane(KittyCadBaseModel):
         return {"plane": payload}
 
 
-MirrorAcross = RootModel[
+MirrorAcross = KittyCadRootModel[
     Union[
         Edge,
         EdgeReference,
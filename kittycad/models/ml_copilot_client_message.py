@@ -1,6 +1,6 @@
 from typing import Dict, List, Literal, Optional, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
 from ..models.ml_copilot_file import MlCopilotFile
@@ -11,7 +11,7 @@ from ..models.ml_copilot_tool import MlCopilotTool
 from ..models.ml_reasoning_effort import MlReasoningEffort
 from ..models.source_range_prompt import SourceRangePrompt
 from ..models.uuid import Uuid
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class OptionPing(KittyCadBaseModel):
@@ -96,7 +96,7 @@ class OptionAttachmentResponse(KittyCadBaseModel):
     type: Literal["attachment_response"] = "attachment_response"
 
 
-MlCopilotClientMessage = RootModel[
+MlCopilotClientMessage = KittyCadRootModel[
     Annotated[
         Union[
             OptionPing,
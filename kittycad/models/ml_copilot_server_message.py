@@ -1,7 +1,7 @@
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import RootModel, model_serializer, model_validator
+from pydantic import model_serializer, model_validator
 
 from ..models.ml_copilot_file import MlCopilotFile
 from ..models.ml_copilot_mode_option import MlCopilotModeOption
@@ -12,7 +12,7 @@ from ..models.zookeeper_auto_router_metadata import (
     ZookeeperAutoRouterMetadata as ZookeeperAutoRouterMetadataModel,
 )
 from ..models.zookeeper_turn_usage import ZookeeperTurnUsage as ZookeeperTurnUsageModel
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class Pong(KittyCadBaseModel):
@@ -461,7 +461,7 @@ class Files(KittyCadBaseModel):
         return {"files": payload}
 
 
-MlCopilotServerMessage = RootModel[
+MlCopilotServerMessage = KittyCadRootModel[
     Union[
         Pong,
         SessionData,
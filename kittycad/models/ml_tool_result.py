@@ -1,10 +1,10 @@
 from typing import Dict, Literal, Optional, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
 from ..models.zookeeper_edit_patch import ZookeeperEditPatch
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class OptionTextToCad(KittyCadBaseModel):
@@ -45,7 +45,7 @@ class OptionMechanicalKnowledgeBase(KittyCadBaseModel):
     type: Literal["mechanical_knowledge_base"] = "mechanical_knowledge_base"
 
 
-MlToolResult = RootModel[
+MlToolResult = KittyCadRootModel[
     Annotated[
         Union[
             OptionTextToCad,
@@ -1,6 +1,6 @@
 from typing import List, Literal, Optional, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
 from ..models.angle import Angle
@@ -52,7 +52,7 @@ from ..models.unit_density import UnitDensity
 from ..models.unit_length import UnitLength
 from ..models.unit_mass import UnitMass
 from ..models.unit_volume import UnitVolume
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class OptionEngineUtilEvaluatePath(KittyCadBaseModel):
@@ -1028,7 +1028,7 @@ class OptionFaceGetPosition(KittyCadBaseModel):
 
 
 class OptionFaceGetCenter(KittyCadBaseModel):
-    """Obtains the surface \"center of mass\" """
+    """Obtains the surface \"center of mass\""""
 
     object_id: str
 
@@ -1845,7 +1845,7 @@ class OptionSketchGetInfo(KittyCadBaseModel):
     type: Literal["sketch_get_info"] = "sketch_get_info"
 
 
-ModelingCmd = RootModel[
+ModelingCmd = KittyCadRootModel[
     Annotated[
         Union[
             OptionEngineUtilEvaluatePath,
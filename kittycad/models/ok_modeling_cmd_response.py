@@ -1,6 +1,6 @@
 from typing import Literal, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
 from ..models.add_hole_from_offset import AddHoleFromOffset
@@ -178,7 +178,7 @@ from ..models.update_annotation import UpdateAnnotation
 from ..models.view_isometric import ViewIsometric
 from ..models.volume import Volume
 from ..models.zoom_to_fit import ZoomToFit
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class OptionEmpty(KittyCadBaseModel):
@@ -1565,7 +1565,7 @@ class OptionSketchGetInfo(KittyCadBaseModel):
     type: Literal["sketch_get_info"] = "sketch_get_info"
 
 
-OkModelingCmdResponse = RootModel[
+OkModelingCmdResponse = KittyCadRootModel[
     Annotated[
         Union[
             OptionEmpty,
@@ -1,6 +1,6 @@
 from typing import Dict, List, Literal, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
 from ..models.batch_response import BatchResponse
@@ -10,7 +10,7 @@ from ..models.ok_modeling_cmd_response import OkModelingCmdResponse
 from ..models.raw_file import RawFile
 from ..models.rtc_ice_candidate_init import RtcIceCandidateInit
 from ..models.rtc_session_description import RtcSessionDescription
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class IceServerInfoData(KittyCadBaseModel):
@@ -149,7 +149,7 @@ class OptionDebug(KittyCadBaseModel):
     type: Literal["debug"] = "debug"
 
 
-OkWebSocketResponseData = RootModel[
+OkWebSocketResponseData = KittyCadRootModel[
     Annotated[
         Union[
             OptionIceServerInfo,
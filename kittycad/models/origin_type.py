@@ -1,10 +1,10 @@
 from typing import Literal, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
 from ..models.point3d import Point3d
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class OptionLocal(KittyCadBaseModel):
@@ -27,7 +27,7 @@ class OptionCustom(KittyCadBaseModel):
     type: Literal["custom"] = "custom"
 
 
-OriginType = RootModel[
+OriginType = KittyCadRootModel[
     Annotated[
         Union[
             OptionLocal,
@@ -1,9 +1,9 @@
 from typing import Literal, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class DxfData(KittyCadBaseModel):
@@ -18,4 +18,6 @@ class OptionDxf(KittyCadBaseModel):
     type: Literal["dxf"] = "dxf"
 
 
-OutputFormat2d = RootModel[Annotated[Union[OptionDxf,], Field(discriminator="type")]]
+OutputFormat2d = KittyCadRootModel[
+    Annotated[Union[OptionDxf,], Field(discriminator="type")]
+]
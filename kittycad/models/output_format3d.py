@@ -1,7 +1,7 @@
 import datetime
 from typing import Literal, Optional, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
 from ..models.fbx_storage import FbxStorage
@@ -13,7 +13,7 @@ from ..models.step_presentation import StepPresentation
 from ..models.stl_storage import StlStorage
 from ..models.system import System
 from ..models.unit_length import UnitLength
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class OptionFbx(KittyCadBaseModel):
@@ -91,7 +91,7 @@ class OptionStl(KittyCadBaseModel):
     units: UnitLength
 
 
-OutputFormat3d = RootModel[
+OutputFormat3d = KittyCadRootModel[
     Annotated[
         Union[
             OptionFbx,
@@ -1,13 +1,13 @@
 from typing import Literal, Optional, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
 from ..models.angle import Angle
 from ..models.length_unit import LengthUnit
 from ..models.point2d import Point2d
 from ..models.point3d import Point3d
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class OptionLine(KittyCadBaseModel):
@@ -128,7 +128,7 @@ class OptionConicTo(KittyCadBaseModel):
     type: Literal["conic_to"] = "conic_to"
 
 
-PathSegment = RootModel[
+PathSegment = KittyCadRootModel[
     Annotated[
         Union[
             OptionLine,
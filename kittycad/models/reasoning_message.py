@@ -1,10 +1,10 @@
 from typing import List, Literal, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
 from ..models.plan_step import PlanStep
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class OptionText(KittyCadBaseModel):
@@ -127,7 +127,7 @@ class OptionDeletedProjectFile(KittyCadBaseModel):
     type: Literal["deleted_project_file"] = "deleted_project_file"
 
 
-ReasoningMessage = RootModel[
+ReasoningMessage = KittyCadRootModel[
     Annotated[
         Union[
             OptionText,
@@ -1,9 +1,9 @@
 from typing import Literal, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class OptionDefaultScene(KittyCadBaseModel):
@@ -44,7 +44,7 @@ class OptionMeshByName(KittyCadBaseModel):
     type: Literal["mesh_by_name"] = "mesh_by_name"
 
 
-Selection = RootModel[
+Selection = KittyCadRootModel[
     Annotated[
         Union[
             OptionDefaultScene,
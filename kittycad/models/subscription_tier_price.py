@@ -1,10 +1,10 @@
 from typing import Literal, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
 from ..models.plan_interval import PlanInterval
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class OptionFlat(KittyCadBaseModel):
@@ -33,7 +33,7 @@ class OptionContract(KittyCadBaseModel):
     type: Literal["contract"] = "contract"
 
 
-SubscriptionTierPrice = RootModel[
+SubscriptionTierPrice = KittyCadRootModel[
     Annotated[
         Union[
             OptionFlat,
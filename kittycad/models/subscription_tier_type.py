@@ -1,9 +1,9 @@
 from typing import Literal, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class OptionIndividual(KittyCadBaseModel):
@@ -20,7 +20,7 @@ class OptionOrganization(KittyCadBaseModel):
     type: Literal["organization"] = "organization"
 
 
-SubscriptionTierType = RootModel[
+SubscriptionTierType = KittyCadRootModel[
     Annotated[
         Union[
             OptionIndividual,
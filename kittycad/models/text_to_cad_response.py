@@ -1,7 +1,7 @@
 import datetime
 from typing import Dict, List, Literal, Optional, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
 from ..models.api_call_status import ApiCallStatus
@@ -10,7 +10,7 @@ from ..models.ml_feedback import MlFeedback
 from ..models.source_range_prompt import SourceRangePrompt
 from ..models.text_to_cad_model import TextToCadModel
 from ..models.uuid import Uuid
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 from .base64data import Base64Data
 
 
@@ -134,7 +134,7 @@ class OptionTextToCadMultiFileIteration(KittyCadBaseModel):
     user_id: Uuid
 
 
-TextToCadResponse = RootModel[
+TextToCadResponse = KittyCadRootModel[
     Annotated[
         Union[
             OptionTextToCad,
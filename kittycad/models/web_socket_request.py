@@ -1,6 +1,6 @@
 from typing import Dict, List, Literal, Optional, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
 from ..models.client_metrics import ClientMetrics
@@ -9,7 +9,7 @@ from ..models.modeling_cmd_id import ModelingCmdId
 from ..models.modeling_cmd_req import ModelingCmdReq
 from ..models.rtc_ice_candidate_init import RtcIceCandidateInit
 from ..models.rtc_session_description import RtcSessionDescription
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class OptionTrickleIce(KittyCadBaseModel):
@@ -78,7 +78,7 @@ class OptionHeaders(KittyCadBaseModel):
     type: Literal["headers"] = "headers"
 
 
-WebSocketRequest = RootModel[
+WebSocketRequest = KittyCadRootModel[
     Annotated[
         Union[
             OptionTrickleIce,
@@ -1,11 +1,10 @@
 from typing import Union
 
-from pydantic import RootModel
-
+from .base import KittyCadRootModel
 from .failure_web_socket_response import FailureWebSocketResponse
 from .success_web_socket_response import SuccessWebSocketResponse
 
-WebSocketResponse = RootModel[
+WebSocketResponse = KittyCadRootModel[
     Union[
         SuccessWebSocketResponse,
         FailureWebSocketResponse,
@@ -1,9 +1,9 @@
 from typing import Literal, Union
 
-from pydantic import Field, RootModel
+from pydantic import Field
 from typing_extensions import Annotated
 
-from .base import KittyCadBaseModel
+from .base import KittyCadBaseModel, KittyCadRootModel
 
 
 class OptionCreated(KittyCadBaseModel):
@@ -36,7 +36,7 @@ class OptionDeleted(KittyCadBaseModel):
     status: Literal["deleted"] = "deleted"
 
 
-ZookeeperEditPatchFile = RootModel[
+ZookeeperEditPatchFile = KittyCadRootModel[
     Annotated[
         Union[
             OptionCreated,
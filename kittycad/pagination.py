@@ -1,12 +1,291 @@
 """Pagination support for KittyCAD API with OpenAI-style auto-iteration."""
 
-from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional, Type, TypeVar
-
+import asyncio
+import contextlib
+import contextvars
+import queue
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
+import attr
+import httpx
 from pydantic import BaseModel
 
+from ._transport import OperationInfo
+from .checkpoints import CheckpointStore, PageCheckpoint
+from .codec import JSONCodec
+from .hooks import EventHooks, OperationScope
+from .response_helpers import parse_json_response
+
+if TYPE_CHECKING:
+    from .columnar import ColumnChunk, Fields
+
 T = TypeVar("T", bound=BaseModel)
 
 
+def _scope(
+    hooks: Optional[EventHooks], operation: Optional[OperationInfo]
+) -> Optional[OperationScope]:
+    if hooks is None or operation is None:
+        return None
+    return OperationScope(hooks, operation, "pagination", "PAGINATE")
+
+
+class RawPage(BaseModel):
+    """A page whose ``items`` were left as decoded JSON objects, not models."""
+
+    items: List[Dict[str, Any]] = []
+    next_page: Optional[str] = None
+
+
+# Set while an iterator fetches pages for a columnar export.
+_raw_pages: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "kittycad_raw_pages", default=False
+)
+
+
+def parse_page_response(
+    response: httpx.Response, codec: JSONCodec, parse: Callable[[bytes], T]
+) -> T:
+    """Parse a page with ``parse``, or as a :class:`RawPage` for a columnar export.
+
+    A raw page skips validating every item into a model; the page fetchers
+    the generator writes call this.
+    """
+    if not _raw_pages.get():
+        return parse_json_response(response, parse)
+    data = codec.loads(response.content)
+    page = RawPage.model_construct(
+        items=data.get("items") or [], next_page=data.get("next_page")
+    )
+    return cast(T, page)
+
+
+_DONE = object()
+
+
+def _prefetched(
+    pages: Generator[Any, None, None], depth: int
+) -> Generator[Any, None, None]:
+    """Iterate ``pages`` from a background thread, up to ``depth`` pages ahead.
+
+    A page counts against ``depth`` from when its fetch starts until it's
+    handed to the consumer. An error is raised where it happened in the
+    stream, after the pages fetched before it.
+    """
+    results: "queue.SimpleQueue[Tuple[bool, Any]]" = queue.SimpleQueue()
+    slots = threading.Semaphore(depth)
+    stop = threading.Event()
+
+    def produce() -> None:
+        try:
+            while True:
+                slots.acquire()
+                if stop.is_set():
+                    return
+                page = next(pages, _DONE)
+                results.put((True, page))
+                if page is _DONE:
+                    return
+        except BaseException as e:
+            results.put((False, e))
+        finally:
+            pages.close()
+
+    # A copied context keeps hooks' parent exchange and other context vars.
+    context = contextvars.copy_context()
+    threading.Thread(
+        target=context.run, args=(produce,), name="kittycad-prefetch", daemon=True
+    ).start()
+    try:
+        while True:
+            ok, page = results.get()
+            if not ok:
+                raise page
+            if page is _DONE:
+                return
+            slots.release()
+            yield page
+    finally:
+        # Wakes the producer if it's waiting for a slot; a fetch already
+        # under way finishes in the background and is dropped.
+        stop.set()
+        slots.release()
+
+
+async def _async_prefetched(
+    pages: AsyncGenerator[Any, None], depth: int
+) -> AsyncGenerator[Any, None]:
+    """Async variant of :func:`_prefetched`, fetching from a task."""
+    results: "asyncio.Queue[Tuple[bool, Any]]" = asyncio.Queue()
+    slots = asyncio.Semaphore(depth)
+
+    async def produce() -> None:
+        try:
+            while True:
+                await slots.acquire()
+                try:
+                    page = await pages.__anext__()
+                except StopAsyncIteration:
+                    results.put_nowait((True, _DONE))
+                    return
+                results.put_nowait((True, page))
+        except Exception as e:
+            results.put_nowait((False, e))
+        finally:
+            await pages.aclose()
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            ok, page = await results.get()
+            if not ok:
+                raise page
+            if page is _DONE:
+                return
+            slots.release()
+            yield page
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+def _check_prefetch(pages: int) -> int:
+    if pages < 0:
+        raise ValueError(f"prefetch must be at least 0, got {pages}")
+    return pages
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class AdaptivePageSize:
+    """Picks ``limit`` for each page from how long the previous one took.
+
+    Pages that come back faster than ``target_latency`` grow the next
+    ``limit`` by up to ``growth`` times, toward ``max_limit``; slower ones
+    shrink it in proportion. Fewer, larger pages cut round trips on big
+    listings without letting any one request run long.
+    """
+
+    target_latency: float = 1.0
+    """Seconds a page fetch should take."""
+    initial_limit: int = 20
+    """The first page's ``limit``, unless the call passed one."""
+    min_limit: int = 1
+    max_limit: int = 100
+    """The largest ``limit`` the server accepts."""
+    growth: float = 2.0
+
+    def __attrs_post_init__(self) -> None:
+        if not 1 <= self.min_limit <= self.initial_limit <= self.max_limit:
+            raise ValueError("expected 1 <= min_limit <= initial_limit <= max_limit")
+        if self.target_latency <= 0 or self.growth < 1:
+            raise ValueError("expected target_latency > 0 and growth >= 1")
+
+    def next_limit(self, limit: int, latency: float) -> int:
+        """Get the ``limit`` to follow a page of ``limit`` that took ``latency``."""
+        factor = self.growth
+        if latency > 0:
+            factor = min(factor, self.target_latency / latency)
+        return max(self.min_limit, min(self.max_limit, int(limit * factor)))
+
+
+class _Pager:
+    """How the pages of one iteration are requested; shared by both iterators."""
+
+    def __init__(
+        self,
+        kwargs: Dict[str, Any],
+        page_size: Optional[AdaptivePageSize],
+        max_items: Optional[int],
+        start: PageCheckpoint,
+    ):
+        self.kwargs = kwargs.copy()
+        if start.page_token is not None:
+            self.kwargs["page_token"] = start.page_token
+        self.page_size = page_size
+        self.remaining = max_items
+        self.skip = start.offset
+        self.done = start.done
+        self.limit: Optional[int] = kwargs.get("limit")
+        if page_size is not None and self.limit is None:
+            self.limit = page_size.initial_limit
+        self.start = 0.0
+
+    def wants_more(self) -> bool:
+        return not self.done and (self.remaining is None or self.remaining > 0)
+
+    def next_kwargs(self) -> Dict[str, Any]:
+        if self.limit is not None:
+            # Don't ask for more items than ``take`` still needs.
+            limit = self.limit
+            if self.remaining is not None:
+                limit = min(limit, self.remaining + self.skip)
+            self.kwargs["limit"] = limit
+        self.start = time.perf_counter()
+        return self.kwargs
+
+    def trim(self, page: BaseModel) -> BaseModel:
+        """Drop the items a resumed checkpoint had already finished."""
+        skip, self.skip = self.skip, 0
+        if not skip:
+            return page
+        items = getattr(page, "items", None) or []
+        return page.model_copy(update={"items": items[skip:]})
+
+    def fetched(self, page: Any) -> bool:
+        """Account for ``page``; return whether there's a page after it."""
+        latency = time.perf_counter() - self.start
+        if self.remaining is not None:
+            self.remaining -= len(getattr(page, "items", None) or [])
+        if self.page_size is not None and self.limit is not None:
+            self.limit = self.page_size.next_limit(self.limit, latency)
+        next_page_token = getattr(page, "next_page", None)
+        if not next_page_token:
+            return False
+        self.kwargs["page_token"] = next_page_token
+        return self.wants_more()
+
+
+def _take(items: Optional[List[Any]], remaining: Optional[int]) -> List[Any]:
+    if items is None:
+        return []
+    return items if remaining is None else items[:remaining]
+
+
+def _next_checkpoint(checkpoint: PageCheckpoint, page: Any) -> PageCheckpoint:
+    """The checkpoint for when every item of ``page`` is finished."""
+    next_page_token = getattr(page, "next_page", None)
+    return PageCheckpoint(
+        page_token=next_page_token or None,
+        items=checkpoint.items + len(getattr(page, "items", None) or []),
+        done=not next_page_token,
+    )
+
+
+def _advanced(checkpoint: PageCheckpoint, n: int) -> PageCheckpoint:
+    """``checkpoint`` with ``n`` more items of its page finished."""
+    return attr.evolve(
+        checkpoint, offset=checkpoint.offset + n, items=checkpoint.items + n
+    )
+
+
 class SyncPageIterator:
     """Synchronous iterator for paginated API responses.
 
@@ -18,6 +297,14 @@ class SyncPageIterator:
         page_fetcher: Callable[..., BaseModel],
         initial_kwargs: Dict[str, Any],
         item_type: Optional[Type[T]] = None,
+        *,
+        event_hooks: Optional[EventHooks] = None,
+        operation: Optional[OperationInfo] = None,
+        prefetch: int = 0,
+        page_size: Optional[AdaptivePageSize] = None,
+        max_items: Optional[int] = None,
+        checkpoint: Optional[PageCheckpoint] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
     ):
         """Initialize the sync page iterator.
 
@@ -25,45 +312,224 @@ class SyncPageIterator:
             page_fetcher: Function to fetch a page (e.g., client.api_calls.list_api_calls)
             initial_kwargs: Initial arguments for the first request
             item_type: Type of items being paginated
+            event_hooks: Hooks to report each full iteration to, as one
+                ``PAGINATE`` exchange (see :mod:`kittycad.hooks`)
+            operation: The paginated operation, for ``event_hooks``
+            prefetch: Pages to fetch ahead of the consumer (see :meth:`prefetch`)
+            page_size: Picks ``limit`` for each page (see :meth:`adaptive`)
+            max_items: Stop after this many items (see :meth:`take`)
+            checkpoint: Where to start (see :meth:`resume_from`)
+            checkpoint_store: Where to resume from and save checkpoints
+                (see :meth:`checkpoint_to`)
         """
         self._page_fetcher = page_fetcher
         self._initial_kwargs = initial_kwargs
         self._item_type = item_type
+        self._event_hooks = event_hooks
+        self._operation = operation
+        self._prefetch = _check_prefetch(prefetch)
+        self._page_size = page_size
+        self._max_items = max_items
+        self._resume_from = checkpoint
+        self._checkpoint_store = checkpoint_store
+        self._checkpoint = PageCheckpoint()
         self._current_page_token: Optional[str] = None
         self._exhausted = False
 
-    def __iter__(self) -> Iterator[T]:
-        """Return iterator that yields individual items across all pages."""
-        # Reset state for new iteration
-        self._current_page_token = None
-        self._exhausted = False
+    def prefetch(self, pages: int) -> "SyncPageIterator":
+        """Fetch up to ``pages`` pages ahead of the consumer, from a background thread.
 
-        kwargs = self._initial_kwargs.copy()
+        Overlaps fetching the next pages with processing the current one.
+        Stopping early cancels the prefetching, and a failed fetch is raised
+        once the items before it have been consumed. ``0`` turns it off.
 
-        while not self._exhausted:
-            # Add page token if we have one
-            if self._current_page_token:
-                kwargs["page_token"] = self._current_page_token
+            for item in client.api_calls.user_list_api_calls().prefetch(2):
+                process(item)
+        """
+        self._prefetch = _check_prefetch(pages)
+        return self
+
+    def take(self, n: int) -> "SyncPageIterator":
+        """Stop after ``n`` items.
+
+        No page is fetched once ``n`` items have arrived, and ``limit`` is
+        lowered so the last page doesn't bring more than are needed.
+        """
+        if n < 0:
+            raise ValueError(f"take needs at least 0 items, got {n}")
+        self._max_items = n
+        return self
+
+    def adaptive(
+        self, page_size: Optional[AdaptivePageSize] = None
+    ) -> "SyncPageIterator":
+        """Let the SDK pick ``limit`` for each page; see :class:`AdaptivePageSize`."""
+        self._page_size = AdaptivePageSize() if page_size is None else page_size
+        return self
+
+    @property
+    def checkpoint(self) -> PageCheckpoint:
+        """Where iteration is, to resume from later with :meth:`resume_from`.
+
+        That's the current page's token and how many of its items are
+        finished; an item is finished once the consumer asks for the next.
+        """
+        return self._checkpoint
+
+    def resume_from(self, checkpoint: Optional[PageCheckpoint]) -> "SyncPageIterator":
+        """Start iterating at ``checkpoint`` instead of the first page."""
+        self._resume_from = checkpoint
+        return self
+
+    def checkpoint_to(self, store: Optional[CheckpointStore]) -> "SyncPageIterator":
+        """Resume from the checkpoint in ``store`` and save one there after each page.
+
+        See :mod:`kittycad.checkpoints`.
+        """
+        self._checkpoint_store = store
+        return self
+
+    def _start(self) -> PageCheckpoint:
+        start = None
+        if self._checkpoint_store is not None:
+            start = self._checkpoint_store.load()
+        if start is None:
+            start = self._resume_from
+        if start is None:
+            start = PageCheckpoint(page_token=self._initial_kwargs.get("page_token"))
+        return start
+
+    def _save(self, checkpoint: PageCheckpoint) -> None:
+        self._checkpoint = checkpoint
+        if self._checkpoint_store is not None:
+            self._checkpoint_store.save(checkpoint)
+
+    def _pages(
+        self, scope: Optional[OperationScope], start: PageCheckpoint, raw: bool
+    ) -> Generator[BaseModel, None, None]:
+        pager = _Pager(self._initial_kwargs, self._page_size, self._max_items, start)
+        more = pager.wants_more()
+        while more:
             # Note: Don't remove page_token from kwargs if it exists in initial_kwargs
             # This allows users to explicitly start pagination from a specific token
+            kwargs = pager.next_kwargs()
+            token = _raw_pages.set(raw)
+            try:
+                if scope is None:
+                    page = self._page_fetcher(**kwargs)
+                else:
+                    with scope.child():
+                        page = self._page_fetcher(**kwargs)
+            finally:
+                _raw_pages.reset(token)
+            page = pager.trim(page)
+            more = pager.fetched(page)
+            yield page
+
+    def pages(self) -> Iterator[BaseModel]:
+        """Iterate over whole pages, each with its ``items`` and ``next_page``."""
+        return self._walk(raw=False, save=True)
+
+    def _walk(self, raw: bool, save: bool) -> Generator[BaseModel, None, None]:
+        """Iterate over pages, saving a checkpoint after each one if ``save``."""
+        # Reset state for new iteration
+        self._current_page_token = None
+        self._exhausted = False
 
-            # Fetch the page
-            page = self._page_fetcher(**kwargs)
+        scope = _scope(self._event_hooks, self._operation)
+        count = 0
+        checkpoint = self._checkpoint = self._start()
+        source = self._pages(scope, checkpoint, raw)
+        if self._prefetch:
+            source = _prefetched(source, self._prefetch)
+
+        try:
+            for page in source:
+                count += 1
+                self._checkpoint = checkpoint
+                yield page
+
+                # Check for next page
+                next_page_token = getattr(page, "next_page", None)
+                if next_page_token:
+                    self._current_page_token = next_page_token
+                else:
+                    self._exhausted = True
+                checkpoint = _next_checkpoint(checkpoint, page)
+                if save:
+                    self._save(checkpoint)
+                else:
+                    self._checkpoint = checkpoint
+        except GeneratorExit:
+            # Abandoned early (``break``, ``close()``): still one finished exchange.
+            if scope is not None:
+                scope.end(count)
+            raise
+        except BaseException as e:
+            if scope is not None:
+                scope.error(e, count)
+            raise
+        finally:
+            source.close()
+        if scope is not None:
+            scope.end(count)
 
-            # Extract items and yield them
-            items = getattr(page, "items", [])
-            # Handle case where items might be None
-            if items is not None:
+    def __iter__(self) -> Iterator[T]:
+        """Return iterator that yields individual items across all pages."""
+        remaining = self._max_items
+        pages = self._walk(raw=False, save=True)
+        try:
+            for page in pages:
+                items = _take(getattr(page, "items", []), remaining)
+                if remaining is not None:
+                    remaining -= len(items)
                 for item in items:
                     yield item
-
-            # Check for next page
-            next_page_token = getattr(page, "next_page", None)
-            if next_page_token:
-                self._current_page_token = next_page_token
-            else:
-                self._exhausted = True
-                break
+                    self._checkpoint = _advanced(self._checkpoint, 1)
+                if remaining == 0:
+                    self._save(self._checkpoint)
+                    return
+        finally:
+            pages.close()
+
+    def columns(
+        self, fields: "Fields", *, chunk_size: int = 65536
+    ) -> Iterator["ColumnChunk"]:
+        """Export ``fields`` of every item as NumPy columns, ``chunk_size`` rows at a time.
+
+        Items are read from each page's JSON straight into the columns,
+        without building a model per item, and at most one chunk is held in
+        memory. A checkpoint is saved after each chunk rather than each page.
+        See :mod:`kittycad.columnar`.
+
+            for chunk in client.api_calls.user_list_api_calls().columns(
+                {"created_at": "datetime64[us]", "price": "float64"}
+            ):
+                store(chunk.to_arrow())
+        """
+        from .columnar import ColumnBuilder
+
+        builder = ColumnBuilder(fields, chunk_size)
+        remaining = self._max_items
+        pages = self._walk(raw=True, save=False)
+        try:
+            for page in pages:
+                start = self._checkpoint
+                items = _take(getattr(page, "items", []), remaining)
+                if remaining is not None:
+                    remaining -= len(items)
+                for n, item in enumerate(items, 1):
+                    if builder.append(item):
+                        yield builder.chunk()
+                        self._save(_advanced(start, n))
+                if remaining == 0:
+                    self._checkpoint = _advanced(start, len(items))
+                    break
+        finally:
+            pages.close()
+        if builder:
+            yield builder.chunk()
+        self._save(self._checkpoint)
 
 
 class AsyncPageIterator:
@@ -77,6 +543,14 @@ class AsyncPageIterator:
         page_fetcher: Callable[..., Any],  # Returns Awaitable[BaseModel]
         initial_kwargs: Dict[str, Any],
         item_type: Optional[Type[T]] = None,
+        *,
+        event_hooks: Optional[EventHooks] = None,
+        operation: Optional[OperationInfo] = None,
+        prefetch: int = 0,
+        page_size: Optional[AdaptivePageSize] = None,
+        max_items: Optional[int] = None,
+        checkpoint: Optional[PageCheckpoint] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
     ):
         """Initialize the async page iterator.
 
@@ -84,13 +558,162 @@ class AsyncPageIterator:
             page_fetcher: Async function to fetch a page (e.g., client.api_calls.list_api_calls)
             initial_kwargs: Initial arguments for the first request
             item_type: Type of items being paginated
+            event_hooks: Hooks to report each full iteration to, as one
+                ``PAGINATE`` exchange (see :mod:`kittycad.hooks`)
+            operation: The paginated operation, for ``event_hooks``
+            prefetch: Pages to fetch ahead of the consumer (see :meth:`prefetch`)
+            page_size: Picks ``limit`` for each page (see :meth:`adaptive`)
+            max_items: Stop after this many items (see :meth:`take`)
+            checkpoint: Where to start (see :meth:`resume_from`)
+            checkpoint_store: Where to resume from and save checkpoints
+                (see :meth:`checkpoint_to`)
         """
         self._page_fetcher = page_fetcher
         self._initial_kwargs = initial_kwargs
         self._item_type = item_type
+        self._event_hooks = event_hooks
+        self._operation = operation
+        self._prefetch = _check_prefetch(prefetch)
+        self._page_size = page_size
+        self._max_items = max_items
+        self._resume_from = checkpoint
+        self._checkpoint_store = checkpoint_store
+        self._checkpoint = PageCheckpoint()
         self._current_page_token: Optional[str] = None
         self._exhausted = False
 
+    def prefetch(self, pages: int) -> "AsyncPageIterator":
+        """Fetch up to ``pages`` pages ahead of the consumer, from a background task.
+
+        Works like :meth:`SyncPageIterator.prefetch`; stopping early cancels
+        the task.
+        """
+        self._prefetch = _check_prefetch(pages)
+        return self
+
+    def take(self, n: int) -> "AsyncPageIterator":
+        """Stop after ``n`` items; see :meth:`SyncPageIterator.take`."""
+        if n < 0:
+            raise ValueError(f"take needs at least 0 items, got {n}")
+        self._max_items = n
+        return self
+
+    def adaptive(
+        self, page_size: Optional[AdaptivePageSize] = None
+    ) -> "AsyncPageIterator":
+        """Let the SDK pick ``limit`` for each page; see :class:`AdaptivePageSize`."""
+        self._page_size = AdaptivePageSize() if page_size is None else page_size
+        return self
+
+    @property
+    def checkpoint(self) -> PageCheckpoint:
+        """Where iteration is, to resume from later with :meth:`resume_from`.
+
+        That's the current page's token and how many of its items are
+        finished; an item is finished once the consumer asks for the next.
+        """
+        return self._checkpoint
+
+    def resume_from(self, checkpoint: Optional[PageCheckpoint]) -> "AsyncPageIterator":
+        """Start iterating at ``checkpoint`` instead of the first page."""
+        self._resume_from = checkpoint
+        return self
+
+    def checkpoint_to(self, store: Optional[CheckpointStore]) -> "AsyncPageIterator":
+        """Resume from the checkpoint in ``store`` and save one there after each page.
+
+        See :mod:`kittycad.checkpoints`. The store is
+        read and written on the event loop, so it should be quick (both
+        provided stores are).
+        """
+        self._checkpoint_store = store
+        return self
+
+    def _start(self) -> PageCheckpoint:
+        start = None
+        if self._checkpoint_store is not None:
+            start = self._checkpoint_store.load()
+        if start is None:
+            start = self._resume_from
+        if start is None:
+            start = PageCheckpoint(page_token=self._initial_kwargs.get("page_token"))
+        return start
+
+    def _save(self, checkpoint: PageCheckpoint) -> None:
+        self._checkpoint = checkpoint
+        if self._checkpoint_store is not None:
+            self._checkpoint_store.save(checkpoint)
+
+    async def _pages(
+        self, scope: Optional[OperationScope], start: PageCheckpoint, raw: bool
+    ) -> AsyncGenerator[BaseModel, None]:
+        pager = _Pager(self._initial_kwargs, self._page_size, self._max_items, start)
+        more = pager.wants_more()
+        while more:
+            # Note: Don't remove page_token from kwargs if it exists in initial_kwargs
+            # This allows users to explicitly start pagination from a specific token
+            kwargs = pager.next_kwargs()
+            token = _raw_pages.set(raw)
+            try:
+                if scope is None:
+                    page = await self._page_fetcher(**kwargs)
+                else:
+                    with scope.child():
+                        page = await self._page_fetcher(**kwargs)
+            finally:
+                _raw_pages.reset(token)
+            page = pager.trim(page)
+            more = pager.fetched(page)
+            yield page
+
+    def pages(self) -> AsyncIterator[BaseModel]:
+        """Iterate over whole pages, each with its ``items`` and ``next_page``."""
+        return self._walk(raw=False, save=True)
+
+    async def _walk(self, raw: bool, save: bool) -> AsyncGenerator[BaseModel, None]:
+        """Iterate over pages, saving a checkpoint after each one if ``save``."""
+        # Reset state for new iteration
+        self._current_page_token = None
+        self._exhausted = False
+
+        scope = _scope(self._event_hooks, self._operation)
+        count = 0
+        checkpoint = self._checkpoint = self._start()
+        source = self._pages(scope, checkpoint, raw)
+        if self._prefetch:
+            source = _async_prefetched(source, self._prefetch)
+
+        try:
+            async for page in source:
+                count += 1
+                self._checkpoint = checkpoint
+                yield page
+
+                # Check for next page
+                next_page_token = getattr(page, "next_page", None)
+                if next_page_token:
+                    self._current_page_token = next_page_token
+                else:
+                    self._exhausted = True
+                checkpoint = _next_checkpoint(checkpoint, page)
+                if save:
+                    self._save(checkpoint)
+                else:
+                    self._checkpoint = checkpoint
+        except GeneratorExit:
+            # Abandoned early (``break``, ``aclose()``): still one finished exchange.
+            if scope is not None:
+                scope.end(count)
+            raise
+        except BaseException as e:
+            if scope is not None:
+                scope.error(e, count)
+            raise
+        finally:
+            await source.aclose()
+        if scope is not None:
+            scope.end(count)
+
     def __aiter__(self) -> AsyncIterator[T]:
         """Return async iterator that yields individual items across all pages."""
         # Reset state for new iteration
@@ -100,32 +723,49 @@ class AsyncPageIterator:
 
     async def _async_iter(self) -> AsyncIterator[T]:
         """Internal async iterator implementation."""
-        kwargs = self._initial_kwargs.copy()
-
-        while not self._exhausted:
-            # Add page token if we have one
-            if self._current_page_token:
-                kwargs["page_token"] = self._current_page_token
-            # Note: Don't remove page_token from kwargs if it exists in initial_kwargs
-            # This allows users to explicitly start pagination from a specific token
-
-            # Fetch the page
-            page = await self._page_fetcher(**kwargs)
-
-            # Extract items and yield them
-            items = getattr(page, "items", [])
-            # Handle case where items might be None
-            if items is not None:
+        remaining = self._max_items
+        pages = self._walk(raw=False, save=True)
+        try:
+            async for page in pages:
+                items = _take(getattr(page, "items", []), remaining)
+                if remaining is not None:
+                    remaining -= len(items)
                 for item in items:
                     yield item
-
-            # Check for next page
-            next_page_token = getattr(page, "next_page", None)
-            if next_page_token:
-                self._current_page_token = next_page_token
-            else:
-                self._exhausted = True
-                break
+                    self._checkpoint = _advanced(self._checkpoint, 1)
+                if remaining == 0:
+                    self._save(self._checkpoint)
+                    return
+        finally:
+            await pages.aclose()
+
+    async def columns(
+        self, fields: "Fields", *, chunk_size: int = 65536
+    ) -> AsyncIterator["ColumnChunk"]:
+        """Export ``fields`` as NumPy columns; see :meth:`SyncPageIterator.columns`."""
+        from .columnar import ColumnBuilder
+
+        builder = ColumnBuilder(fields, chunk_size)
+        remaining = self._max_items
+        pages = self._walk(raw=True, save=False)
+        try:
+            async for page in pages:
+                start = self._checkpoint
+                items = _take(getattr(page, "items", []), remaining)
+                if remaining is not None:
+                    remaining -= len(items)
+                for n, item in enumerate(items, 1):
+                    if builder.append(item):
+                        yield builder.chunk()
+                        self._save(_advanced(start, n))
+                if remaining == 0:
+                    self._checkpoint = _advanced(start, len(items))
+                    break
+        finally:
+            await pages.aclose()
+        if builder:
+            yield builder.chunk()
+        self._save(self._checkpoint)
 
 
 def create_sync_page_iterator(
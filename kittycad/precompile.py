@@ -0,0 +1,80 @@
+"""Deferred model building and background precompilation.
+
+Set ``KITTYCAD_DEFER_BUILD=1`` in the environment before importing
+``kittycad`` and the generated models skip building their pydantic-core
+validators and serializers at import time; each one is built the first time
+it is used instead. Processes that only touch a handful of endpoints then
+never pay for the rest, including the large ``oneOf`` unions such as
+``ModelingCmd``.
+
+To keep first-request latency low for the models you know you'll need,
+build them ahead of time in a background thread with :func:`precompile`.
+
+Example:
+    >>> from kittycad.precompile import precompile
+    >>> thread = precompile(["ModelingCmd", "WebSocketResponse"])  # doctest: +SKIP
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Iterable, List, Optional, Type, Union
+
+from pydantic import BaseModel
+
+from .models.base import DEFER_BUILD
+
+ModelRef = Union[str, Type[BaseModel]]
+
+
+def _resolve(model: ModelRef) -> Type[BaseModel]:
+    if isinstance(model, str):
+        from . import models
+
+        return getattr(models, model)
+    return model
+
+
+def is_built(model: ModelRef) -> bool:
+    """Whether a model's validator and serializer have been built."""
+    return bool(_resolve(model).__pydantic_complete__)
+
+
+def build(models: Iterable[ModelRef]) -> List[str]:
+    """Build the validators of ``models`` now; return the names that needed it.
+
+    Models may be given as classes or as names exported by
+    :mod:`kittycad.models`. Models that are already built are skipped.
+    """
+    built = []
+    for ref in models:
+        model = _resolve(ref)
+        if not model.__pydantic_complete__:
+            model.model_rebuild()
+            built.append(ref if isinstance(ref, str) else model.__name__)
+    return built
+
+
+def precompile(
+    models: Iterable[ModelRef], *, background: bool = True
+) -> Optional[threading.Thread]:
+    """Build a "hot set" of models, by default in a daemon thread.
+
+    Using a model while its thread is still building it is safe: pydantic
+    builds it on demand in the calling thread as well.
+
+    Returns:
+        The started thread, or ``None`` when ``background`` is false
+    """
+    models = list(models)
+    if not background:
+        build(models)
+        return None
+    thread = threading.Thread(
+        target=build, args=(models,), name="kittycad-precompile", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+__all__ = ["DEFER_BUILD", "build", "is_built", "precompile"]
@@ -0,0 +1,234 @@
+"""Client-side rate limiting for the KittyCAD SDK.
+
+A :class:`RateLimiter` holds one token bucket per endpoint group (matched by
+path pattern against the spec path, e.g. ``/users/{id}``, when the request
+came from a generated method, else the URL path) and can be shared by any number of sync and async clients,
+threads and event loops in the same process.
+
+Example:
+    >>> from kittycad import KittyCAD
+    >>> from kittycad.rate_limit import RateLimiter
+    >>> limiter = RateLimiter(
+    ...     default=(20.0, 40),
+    ...     groups={"/file/*": (5.0, 10), "/unit/*": (50.0, 50), "/ws/*": (1.0, 2)},
+    ... )
+    >>> client = KittyCAD(token="my-token", rate_limiter=limiter)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import threading
+import time
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+import attr
+import httpx
+
+from ._transport import get_operation
+
+DEFAULT_GROUP = "default"
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class RateLimitStats:
+    """Wait-time metrics for one endpoint group."""
+
+    acquired: int
+    """Requests that passed through the bucket."""
+    delayed: int
+    """Requests that had to wait for a token."""
+    total_wait: float
+    """Seconds spent waiting, summed over all requests."""
+    max_wait: float
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.acquired if self.acquired else 0.0
+
+
+class TokenBucket:
+    """A thread-safe token bucket.
+
+    Callers reserve a token and are told how long to wait for it, so the wait
+    itself happens outside the lock and works with both ``time.sleep`` and
+    ``asyncio.sleep``.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._acquired = 0
+        self._delayed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take ``tokens`` from the bucket; return the seconds to wait first."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self._acquired += 1
+            if wait > 0:
+                self._delayed += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            return wait
+
+    def refund(self, wait: float, tokens: float = 1.0) -> None:
+        """Give back a reservation whose request never went out."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + tokens)
+            self._acquired -= 1
+            if wait > 0:
+                self._delayed -= 1
+                self._total_wait -= wait
+
+    def stats(self) -> RateLimitStats:
+        with self._lock:
+            return RateLimitStats(
+                acquired=self._acquired,
+                delayed=self._delayed,
+                total_wait=self._total_wait,
+                max_wait=self._max_wait,
+            )
+
+
+class RateLimiter:
+    """Per-endpoint-group token buckets.
+
+    ``groups`` maps a path pattern (``fnmatch`` syntax, e.g. ``/file/*``) to a
+    ``(requests_per_second, burst)`` pair; the first matching pattern wins.
+    Paths matching no group use ``default``, or are not limited when
+    ``default`` is ``None``.
+    """
+
+    def __init__(
+        self,
+        default: Optional[Tuple[float, float]] = None,
+        groups: Optional[Mapping[str, Tuple[float, float]]] = None,
+    ):
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._patterns = list((groups or {}).keys())
+        for pattern, (rate, burst) in (groups or {}).items():
+            self._buckets[pattern] = TokenBucket(rate, burst)
+        if default is not None:
+            self._buckets[DEFAULT_GROUP] = TokenBucket(*default)
+
+    def group_for(self, path: str) -> Optional[str]:
+        """Get the name of the group a path belongs to, if it is limited."""
+        for pattern in self._patterns:
+            if fnmatch.fnmatchcase(path, pattern):
+                return pattern
+        return DEFAULT_GROUP if DEFAULT_GROUP in self._buckets else None
+
+    def reserve(self, path: str) -> float:
+        group = self.group_for(path)
+        if group is None:
+            return 0.0
+        return self._buckets[group].reserve()
+
+    def acquire(self, path: str) -> float:
+        """Block the calling thread until a request to ``path`` may go out."""
+        wait = self.reserve(path)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, path: str) -> float:
+        """Wait (without blocking the loop) until a request to ``path`` may go out.
+
+        If the wait is cancelled the token is refunded, so abandoned requests
+        don't hold back the ones that follow.
+        """
+        group = self.group_for(path)
+        if group is None:
+            return 0.0
+        bucket = self._buckets[group]
+        wait = bucket.reserve()
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                bucket.refund(wait)
+                raise
+        return wait
+
+    def stats(self) -> Dict[str, RateLimitStats]:
+        """Get wait-time metrics keyed by group."""
+        return {group: bucket.stats() for group, bucket in self._buckets.items()}
+
+
+WaitCallback = Callable[[httpx.Request, float], None]
+"""Called with a request and the seconds it waited for a token."""
+
+
+def _limit_path(request: httpx.Request) -> str:
+    operation = get_operation(request)
+    return operation.url_template if operation is not None else request.url.path
+
+
+class RateLimitTransport(httpx.BaseTransport):
+    """Transport wrapper that passes every request through a :class:`RateLimiter`."""
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        limiter: RateLimiter,
+        on_wait: Optional[WaitCallback] = None,
+    ):
+        self.transport = transport
+        self.limiter = limiter
+        self.on_wait = on_wait
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        wait = self.limiter.acquire(_limit_path(request))
+        if wait > 0 and self.on_wait is not None:
+            self.on_wait(request, wait)
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRateLimitTransport(httpx.AsyncBaseTransport):
+    """Async variant of :class:`RateLimitTransport`."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        limiter: RateLimiter,
+        on_wait: Optional[WaitCallback] = None,
+    ):
+        self.transport = transport
+        self.limiter = limiter
+        self.on_wait = on_wait
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        wait = await self.limiter.acquire_async(_limit_path(request))
+        if wait > 0 and self.on_wait is not None:
+            self.on_wait(request, wait)
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+__all__ = [
+    "AsyncRateLimitTransport",
+    "RateLimitStats",
+    "RateLimitTransport",
+    "RateLimiter",
+    "TokenBucket",
+]
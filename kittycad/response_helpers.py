@@ -5,6 +5,7 @@ from typing import Callable, Optional, TypeVar
 
 import httpx
 
+from ._transport import SHARED_RESULT_EXTENSION
 from .exceptions import (
     KittyCADAPIError,
     KittyCADClientError,
@@ -12,6 +13,7 @@ from .exceptions import (
     KittyCADServerError,
     KittyCADTimeoutError,
 )
+from .timing import get_timing
 
 T = TypeVar("T")
 
@@ -79,6 +81,12 @@ def raise_for_status(response: httpx.Response) -> None:
     request_method = response.request.method if response.request else None
     request_url = str(response.url) if response.url else None
 
+    # Attempt history recorded by kittycad.retry, if the request was retried
+    attempts = getattr(response, "extensions", {}).get("kittycad_attempts")
+    if not isinstance(attempts, list):
+        attempts = None
+    timing = get_timing(response)
+
     # Raise appropriate exception based on status code
     if 400 <= response.status_code < 500:
         raise KittyCADClientError(
@@ -89,6 +97,8 @@ def raise_for_status(response: httpx.Response) -> None:
             headers=dict(response.headers),
             request_method=request_method,
             request_url=request_url,
+            attempts=attempts,
+            timing=timing,
         )
     elif 500 <= response.status_code < 600:
         raise KittyCADServerError(
@@ -99,6 +109,8 @@ def raise_for_status(response: httpx.Response) -> None:
             headers=dict(response.headers),
             request_method=request_method,
             request_url=request_url,
+            attempts=attempts,
+            timing=timing,
         )
     else:
         raise KittyCADAPIError(
@@ -109,6 +121,8 @@ def raise_for_status(response: httpx.Response) -> None:
             headers=dict(response.headers),
             request_method=request_method,
             request_url=request_url,
+            attempts=attempts,
+            timing=timing,
         )
 
 
@@ -137,6 +151,18 @@ def parse_response_or_raise(
     return None
 
 
+def parse_json_response(response: httpx.Response, parse: Callable[[bytes], T]) -> T:
+    """Parse a JSON response body with ``parse``, given the raw body bytes.
+
+    When the body is shared with other callers (e.g. by request coalescing),
+    it is parsed only once and every caller gets the same object.
+    """
+    shared = response.extensions.get(SHARED_RESULT_EXTENSION)
+    if shared is None:
+        return parse(response.content)
+    return shared.get_or_parse(lambda: parse(response.content))
+
+
 def wrap_httpx_exceptions(
     request_method: Optional[str] = None,
     request_url: Optional[str] = None,
@@ -167,6 +193,7 @@ def wrap_httpx_exceptions(
                     timeout_seconds=timeout_seconds,
                     request_method=request_method,
                     request_url=request_url,
+                    timing=get_timing(e),
                 ) from e
 
             except httpx.ConnectError as e:
@@ -175,6 +202,7 @@ def wrap_httpx_exceptions(
                     original_error=e,
                     request_method=request_method,
                     request_url=request_url,
+                    timing=get_timing(e),
                 ) from e
 
             except httpx.NetworkError as e:
@@ -187,6 +215,7 @@ def wrap_httpx_exceptions(
                         original_error=e,
                         request_method=request_method,
                         request_url=request_url,
+                        timing=get_timing(e),
                     ) from e
                 else:
                     raise KittyCADConnectionError(
@@ -194,6 +223,7 @@ def wrap_httpx_exceptions(
                         original_error=e,
                         request_method=request_method,
                         request_url=request_url,
+                        timing=get_timing(e),
                     ) from e
 
             except httpx.RequestError as e:
@@ -204,6 +234,7 @@ def wrap_httpx_exceptions(
                     original_error=e,
                     request_method=request_method,
                     request_url=request_url,
+                    timing=get_timing(e),
                 ) from e
 
         return wrapper
@@ -241,6 +272,7 @@ def wrap_httpx_exceptions_async(
                     timeout_seconds=timeout_seconds,
                     request_method=request_method,
                     request_url=request_url,
+                    timing=get_timing(e),
                 ) from e
 
             except httpx.ConnectError as e:
@@ -249,6 +281,7 @@ def wrap_httpx_exceptions_async(
                     original_error=e,
                     request_method=request_method,
                     request_url=request_url,
+                    timing=get_timing(e),
                 ) from e
 
             except httpx.NetworkError as e:
@@ -261,6 +294,7 @@ def wrap_httpx_exceptions_async(
                         original_error=e,
                         request_method=request_method,
                         request_url=request_url,
+                        timing=get_timing(e),
                     ) from e
                 else:
                     raise KittyCADConnectionError(
@@ -268,6 +302,7 @@ def wrap_httpx_exceptions_async(
                         original_error=e,
                         request_method=request_method,
                         request_url=request_url,
+                        timing=get_timing(e),
                     ) from e
 
             except httpx.RequestError as e:
@@ -278,6 +313,7 @@ def wrap_httpx_exceptions_async(
                     original_error=e,
                     request_method=request_method,
                     request_url=request_url,
+                    timing=get_timing(e),
                 ) from e
 
         return wrapper
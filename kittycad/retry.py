@@ -0,0 +1,336 @@
+"""Retry support for the KittyCAD SDK.
+
+A :class:`RetryPolicy` attached to :class:`kittycad.client.Client` or
+:class:`kittycad.client.AsyncClient` makes every endpoint method retry
+transient failures (429/502/503/504 and connection errors) with exponential
+backoff, jitter and ``Retry-After`` support.
+
+Example:
+    >>> from kittycad import KittyCAD
+    >>> from kittycad.retry import RetryPolicy
+    >>> client = KittyCAD(
+    ...     token="my-token",
+    ...     retry_policy=RetryPolicy(max_attempts=5).mark_safe("create_file_conversion"),
+    ... )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import random
+import threading
+import time
+from typing import Awaitable, Callable, FrozenSet, List, Optional
+
+import attr
+import httpx
+
+from ._transport import get_operation
+
+DEFAULT_RETRY_STATUSES: FrozenSet[int] = frozenset({429, 502, 503, 504})
+DEFAULT_RETRY_METHODS: FrozenSet[str] = frozenset(
+    {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+)
+ATTEMPTS_EXTENSION = "kittycad_attempts"
+
+# Errors raised before any byte of the request reached the server, so the
+# request can be replayed regardless of method.
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class AttemptRecord:
+    """Timing and outcome of a single attempt of a request."""
+
+    attempt: int
+    """1-based attempt number."""
+    started_at: float
+    """Wall-clock start time (``time.time()``)."""
+    duration: float
+    """Seconds until response headers arrived or the attempt failed."""
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+    backoff: float = 0.0
+    """Seconds slept before the next attempt (0 for the last attempt)."""
+
+
+class RetryBudget:
+    """Caps retries to a fraction of overall traffic.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, on
+    top of a floor of ``min_retries`` tokens. This keeps an outage from
+    multiplying load on the API by ``max_attempts``.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self._balance = float(min_retries)
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._balance = min(
+                self._balance + self.ratio, self.min_retries + 1000 * self.ratio
+            )
+
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            if self._balance >= 1.0:
+                self._balance -= 1.0
+                return True
+            return False
+
+    @property
+    def balance(self) -> float:
+        return self._balance
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class RetryPolicy:
+    """When and how to retry failed requests."""
+
+    max_attempts: int = 3
+    """Total attempts including the first one."""
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    jitter: float = 1.0
+    """Fraction of each backoff that is randomized (1.0 is "full jitter")."""
+    retry_statuses: FrozenSet[int] = DEFAULT_RETRY_STATUSES
+    retry_methods: FrozenSet[str] = DEFAULT_RETRY_METHODS
+    safe_operations: FrozenSet[str] = frozenset()
+    """Operation ids of non-idempotent endpoints that may still be retried."""
+    respect_retry_after: bool = True
+    max_retry_after: float = 120.0
+    """A ``Retry-After`` longer than this is returned to the caller instead."""
+    budget: Optional[RetryBudget] = attr.ib(factory=RetryBudget, eq=False)
+
+    def mark_safe(self, *operation_ids: str) -> "RetryPolicy":
+        """Get a new policy that also retries the given (e.g. POST) operations"""
+        return attr.evolve(
+            self, safe_operations=self.safe_operations | frozenset(operation_ids)
+        )
+
+    def is_idempotent(self, request: httpx.Request) -> bool:
+        if request.method.upper() in self.retry_methods:
+            return True
+        operation = get_operation(request)
+        return operation is not None and operation.operation_id in self.safe_operations
+
+    def backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Seconds to wait after the given failed attempt (1-based)."""
+        if response is not None and self.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get("retry-after"))
+            if retry_after is not None:
+                return retry_after
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return delay * (1.0 - self.jitter) + random.uniform(0, delay * self.jitter)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def _body_rewinder(request: httpx.Request) -> Optional[Callable[[], None]]:
+    """Get a callable that resets the request body for a replay.
+
+    Returns ``None`` when the body is a one-shot stream (e.g. a generator)
+    that can't be replayed.
+    """
+    stream = request.stream
+    if isinstance(stream, httpx.ByteStream) or type(stream).__name__ == (
+        "MultipartStream"
+    ):
+        # In-memory bodies replay as-is; httpx seeks multipart files itself.
+        return lambda: None
+    source = getattr(stream, "_stream", None)
+    if source is None:
+        return None
+    if hasattr(source, "seek") and hasattr(source, "tell"):
+        try:
+            position = source.tell()
+        except OSError:
+            return None
+        return lambda: source.seek(position)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return lambda: None
+    return None
+
+
+class _RetryState:
+    """Per-request bookkeeping shared by the sync and async transports."""
+
+    def __init__(self, policy: RetryPolicy, request: httpx.Request):
+        self.policy = policy
+        self.request = request
+        self.idempotent = policy.is_idempotent(request)
+        self.rewind = _body_rewinder(request)
+        self.attempts: List[AttemptRecord] = []
+        self.attempt = 0
+        self.started_at = 0.0
+        self.start = 0.0
+        if policy.budget is not None:
+            policy.budget.deposit()
+
+    def begin(self) -> None:
+        self.attempt += 1
+        self.started_at = time.time()
+        self.start = time.monotonic()
+
+    def _attempts_left(self) -> bool:
+        return self.attempt < self.policy.max_attempts and self.rewind is not None
+
+    def _withdraw(self) -> bool:
+        budget = self.policy.budget
+        return budget is None or budget.try_withdraw()
+
+    def on_response(self, response: httpx.Response) -> Optional[float]:
+        """Record a response; return the backoff if it should be retried."""
+        delay = None
+        if (
+            response.status_code in self.policy.retry_statuses
+            and self.idempotent
+            and self._attempts_left()
+        ):
+            delay = self.policy.backoff(self.attempt, response)
+            if delay > self.policy.max_retry_after or not self._withdraw():
+                delay = None
+        self._record(status_code=response.status_code, backoff=delay or 0.0)
+        if delay is None:
+            response.extensions[ATTEMPTS_EXTENSION] = list(self.attempts)
+        return delay
+
+    def on_error(self, error: Exception) -> Optional[float]:
+        """Record a transport error; return the backoff if it should be retried."""
+        delay = None
+        retryable = isinstance(error, _UNSENT_ERRORS) or (
+            self.idempotent and isinstance(error, httpx.TransportError)
+        )
+        if retryable and self._attempts_left() and self._withdraw():
+            delay = self.policy.backoff(self.attempt)
+        self._record(error=f"{type(error).__name__}: {error}", backoff=delay or 0.0)
+        if delay is None:
+            # The caller gets the transport error itself, so keep the attempt
+            # history on it, like responses keep it in their extensions.
+            setattr(error, "attempts", list(self.attempts))
+            error.add_note(f"kittycad: gave up after {self.attempt} attempt(s)")
+        return delay
+
+    def _record(self, **kwargs) -> None:
+        self.attempts.append(
+            AttemptRecord(
+                attempt=self.attempt,
+                started_at=self.started_at,
+                duration=time.monotonic() - self.start,
+                **kwargs,
+            )
+        )
+
+    def prepare_replay(self) -> None:
+        assert self.rewind is not None
+        self.rewind()
+
+
+RetryCallback = Callable[[httpx.Request, AttemptRecord], None]
+"""Called with the request and the record of an attempt that will be retried."""
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Transport wrapper that applies a :class:`RetryPolicy`."""
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        policy: RetryPolicy,
+        sleep: Callable[[float], None] = time.sleep,
+        on_retry: Optional[RetryCallback] = None,
+    ):
+        self.transport = transport
+        self.policy = policy
+        self._sleep = sleep
+        self.on_retry = on_retry
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        state = _RetryState(self.policy, request)
+        while True:
+            state.begin()
+            try:
+                response = self.transport.handle_request(request)
+            except httpx.TransportError as e:
+                delay = state.on_error(e)
+                if delay is None:
+                    raise
+            else:
+                delay = state.on_response(response)
+                if delay is None:
+                    return response
+                response.close()
+            if self.on_retry is not None:
+                self.on_retry(request, state.attempts[-1])
+            state.prepare_replay()
+            self._sleep(delay)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Async variant of :class:`RetryTransport`."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        policy: RetryPolicy,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        on_retry: Optional[RetryCallback] = None,
+    ):
+        self.transport = transport
+        self.policy = policy
+        self._sleep = sleep
+        self.on_retry = on_retry
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        state = _RetryState(self.policy, request)
+        while True:
+            state.begin()
+            try:
+                response = await self.transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                delay = state.on_error(e)
+                if delay is None:
+                    raise
+            else:
+                delay = state.on_response(response)
+                if delay is None:
+                    return response
+                await response.aclose()
+            if self.on_retry is not None:
+                self.on_retry(request, state.attempts[-1])
+            state.prepare_replay()
+            await self._sleep(delay)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+__all__ = [
+    "AttemptRecord",
+    "AsyncRetryTransport",
+    "RetryBudget",
+    "RetryPolicy",
+    "RetryTransport",
+    "parse_retry_after",
+]
@@ -0,0 +1,233 @@
+"""Request coalescing ("single-flight") for the KittyCAD SDK.
+
+When many threads or tasks issue the same GET at the same moment, a
+:class:`SingleFlight` attached to the client lets only the first one hit the
+network. The others wait for it and receive the same response body, and the
+generated endpoint methods parse that body once and share the result.
+
+Requests are considered identical when they have the same URL and the same
+headers, apart from volatile ones such as ``User-Agent`` or trace context, so
+callers using different tokens, cookies or tenant headers never share data.
+
+Example:
+    >>> from kittycad import KittyCAD
+    >>> from kittycad.singleflight import SingleFlight
+    >>> single_flight = SingleFlight()
+    >>> client = KittyCAD(token="my-token", single_flight=single_flight)
+    >>> # ... concurrent client.meta.get_schema() calls ...
+    >>> single_flight.stats().coalesced  # doctest: +SKIP
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import attr
+import httpx
+
+from ._transport import (
+    SHARED_RESULT_EXTENSION,
+    VOLATILE_HEADERS,
+    RequestIdentity,
+    SharedResult,
+    request_identity,
+)
+
+_Key = Tuple[str, RequestIdentity]
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class SingleFlightStats:
+    """Counters for a :class:`SingleFlight`."""
+
+    requests: int
+    """GETs that went out to the network."""
+    coalesced: int
+    """GETs that were answered by another in-flight request."""
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class _Result:
+    """A fully-read response, ready to be handed to every waiter."""
+
+    status_code: int
+    headers: httpx.Headers
+    content: bytes
+    extensions: Dict[str, Any]
+    shared: SharedResult = attr.ib(factory=SharedResult)
+
+    @classmethod
+    def from_raw(cls, response: httpx.Response, content: bytes) -> "_Result":
+        return cls(
+            status_code=response.status_code,
+            headers=response.headers,
+            content=content,
+            extensions=dict(response.extensions),
+        )
+
+    def to_response(self) -> httpx.Response:
+        extensions = dict(self.extensions)
+        extensions[SHARED_RESULT_EXTENSION] = self.shared
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            stream=httpx.ByteStream(self.content),
+            extensions=extensions,
+        )
+
+
+class _Call:
+    """A sync in-flight request and its outcome."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[_Result] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Collapses concurrent identical GETs into one request.
+
+    One instance can be shared by any number of sync and async clients; sync
+    callers are coalesced across threads and async callers within each event
+    loop.
+
+    Args:
+        volatile_headers: Headers (lower case) ignored when deciding whether
+            two requests are identical; every other header must match
+    """
+
+    def __init__(self, volatile_headers: Iterable[str] = VOLATILE_HEADERS) -> None:
+        self.volatile_headers = frozenset(volatile_headers)
+        self._lock = threading.Lock()
+        self._calls: Dict[_Key, _Call] = {}
+        self._tasks: Dict[Tuple[int, _Key], "asyncio.Task[_Result]"] = {}
+        self._requests = 0
+        self._coalesced = 0
+
+    def key_for(self, request: httpx.Request) -> Optional[_Key]:
+        """Get the coalescing key of a request, or ``None`` if it can't be shared."""
+        if request.method != "GET":
+            return None
+        return str(request.url), request_identity(request, self.volatile_headers)
+
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(requests=self._requests, coalesced=self._coalesced)
+
+    def do(
+        self, key: _Key, transport: httpx.BaseTransport, request: httpx.Request
+    ) -> httpx.Response:
+        """Send ``request`` unless an identical one is in flight; wait for it."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._requests += 1
+            else:
+                self._coalesced += 1
+
+        if leader:
+            try:
+                response = transport.handle_request(request)
+                assert isinstance(response.stream, httpx.SyncByteStream)
+                try:
+                    content = b"".join(response.stream)
+                finally:
+                    response.close()
+                call.result = _Result.from_raw(response, content)
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        else:
+            call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+        assert call.result is not None
+        return call.result.to_response()
+
+    async def do_async(
+        self, key: _Key, transport: httpx.AsyncBaseTransport, request: httpx.Request
+    ) -> httpx.Response:
+        """Async variant of :meth:`do`."""
+        task_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            if task is None:
+                task = asyncio.ensure_future(self._fetch(transport, request))
+                self._tasks[task_key] = task
+                task.add_done_callback(lambda _: self._forget(task_key))
+                self._requests += 1
+            else:
+                self._coalesced += 1
+        # Shield the shared request, so a cancelled caller (even the one that
+        # started it) doesn't cancel it for everyone else.
+        result = await asyncio.shield(task)
+        return result.to_response()
+
+    def _forget(self, task_key: Tuple[int, _Key]) -> None:
+        with self._lock:
+            self._tasks.pop(task_key, None)
+
+    @staticmethod
+    async def _fetch(
+        transport: httpx.AsyncBaseTransport, request: httpx.Request
+    ) -> _Result:
+        response = await transport.handle_async_request(request)
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        try:
+            content = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        return _Result.from_raw(response, content)
+
+
+class SingleFlightTransport(httpx.BaseTransport):
+    """Transport wrapper that coalesces identical concurrent GETs."""
+
+    def __init__(self, transport: httpx.BaseTransport, single_flight: SingleFlight):
+        self.transport = transport
+        self.single_flight = single_flight
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key = self.single_flight.key_for(request)
+        if key is None:
+            return self.transport.handle_request(request)
+        return self.single_flight.do(key, self.transport, request)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncSingleFlightTransport(httpx.AsyncBaseTransport):
+    """Async variant of :class:`SingleFlightTransport`."""
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, single_flight: SingleFlight
+    ):
+        self.transport = transport
+        self.single_flight = single_flight
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = self.single_flight.key_for(request)
+        if key is None:
+            return await self.transport.handle_async_request(request)
+        return await self.single_flight.do_async(key, self.transport, request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+__all__ = [
+    "AsyncSingleFlightTransport",
+    "SingleFlight",
+    "SingleFlightStats",
+    "SingleFlightTransport",
+]
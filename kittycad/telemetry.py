@@ -0,0 +1,530 @@
+"""OpenTelemetry-compatible tracing and metrics for the KittyCAD SDK.
+
+:class:`Telemetry` turns the events of :mod:`kittycad.hooks` into spans and
+metrics shaped like OpenTelemetry's (HTTP client semantic conventions for
+attribute and metric names) and hands them to a :class:`TelemetryExporter`:
+
+- :class:`InMemoryCollector` (the default) keeps them in process, for tests,
+  benchmarks and ad-hoc inspection
+- :class:`OpenTelemetryExporter` forwards them to the ``opentelemetry-api``
+  tracer and meter providers (``pip install kittycad[opentelemetry]``)
+
+Every endpoint call, including uploads and downloads, becomes a ``CLIENT``
+span named ``"{method} {url_template}"``. A websocket connection is one span
+for its whole lifetime, with a ``message`` span event per ``send`` and
+``recv``. Iterating a paginated endpoint is an ``INTERNAL`` ``PAGINATE``
+span, the parent of the span of each page it fetched.
+
+Metrics:
+
+- ``http.client.request.duration``: histogram of HTTP call durations, in
+  seconds, by operation and status
+- ``kittycad.client.session.duration``: histogram of websocket connection
+  and pagination run durations, in seconds, by operation
+- ``kittycad.client.requests.in_flight``: up-down counter of the calls,
+  connections and pagination runs in progress
+- ``kittycad.client.bytes_sent`` and ``kittycad.client.bytes_received``:
+  counters of body and websocket message bytes
+- ``kittycad.client.websocket.messages``: counter of websocket messages,
+  by direction
+- ``kittycad.client.retries``: counter of retried attempts
+- ``kittycad.client.rate_limit.wait``: counter of the seconds spent waiting
+  for the client-side rate limiter
+- ``kittycad.client.connection.phase.duration``: histogram of the
+  connection timing phases (``kittycad.phase``: ``queue``, ``connect``,
+  ``tls``, ``send``, ``server``, ``download``) of the requests sampled by
+  ``timing_sample_rate`` (see :mod:`kittycad.timing`), which also become
+  ``kittycad.timing.*`` span attributes
+
+Example:
+    >>> from kittycad import KittyCAD
+    >>> from kittycad.telemetry import InMemoryCollector, Telemetry
+    >>> collector = InMemoryCollector()
+    >>> telemetry = Telemetry(collector)
+    >>> client = KittyCAD(token="my-token", event_hooks=telemetry.instrument())
+"""
+
+from __future__ import annotations
+
+import abc
+import os
+import threading
+import time
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+import attr
+
+from .hooks import EventHooks, RequestEvent
+from .timing import TimingBreakdown
+
+SPAN_KIND_CLIENT = "CLIENT"
+SPAN_KIND_INTERNAL = "INTERNAL"
+
+STATUS_UNSET = "UNSET"
+STATUS_OK = "OK"
+STATUS_ERROR = "ERROR"
+
+COUNTER = "counter"
+HISTOGRAM = "histogram"
+UP_DOWN_COUNTER = "up_down_counter"
+
+REQUEST_DURATION = "http.client.request.duration"
+SESSION_DURATION = "kittycad.client.session.duration"
+IN_FLIGHT = "kittycad.client.requests.in_flight"
+BYTES_SENT = "kittycad.client.bytes_sent"
+BYTES_RECEIVED = "kittycad.client.bytes_received"
+WEBSOCKET_MESSAGES = "kittycad.client.websocket.messages"
+RETRIES = "kittycad.client.retries"
+RATE_LIMIT_WAIT = "kittycad.client.rate_limit.wait"
+PHASE_DURATION = "kittycad.client.connection.phase.duration"
+
+_MESSAGES = ("SEND", "RECV")
+
+
+@attr.s(auto_attribs=True, frozen=True, slots=True)
+class SpanEvent:
+    """A timestamped annotation on a :class:`Span`."""
+
+    name: str
+    time_ns: int
+    attributes: Dict[str, Any] = attr.Factory(dict)
+
+
+@attr.s(auto_attribs=True, slots=True)
+class Span:
+    """One traced operation, in OpenTelemetry's data model.
+
+    Ids are lowercase hex, as in W3C trace context: 32 digits for
+    ``trace_id`` and 16 for ``span_id``.
+    """
+
+    name: str
+    kind: str
+    trace_id: str
+    span_id: str
+    parent_span_id: Optional[str]
+    start_time_ns: int
+    end_time_ns: Optional[int] = None
+    attributes: Dict[str, Any] = attr.Factory(dict)
+    events: List[SpanEvent] = attr.Factory(list)
+    status: str = STATUS_UNSET
+    status_description: Optional[str] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Seconds from start to end, once ended."""
+        if self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns) / 1e9
+
+
+class TelemetryExporter(abc.ABC):
+    """Receives the spans and metric measurements of a :class:`Telemetry`.
+
+    Methods are called on the thread (or event loop) making the request,
+    so they should be quick.
+    """
+
+    @abc.abstractmethod
+    def on_start(self, span: Span) -> None:
+        """``span`` started; its end time, status and events aren't set yet."""
+
+    @abc.abstractmethod
+    def on_end(self, span: Span) -> None:
+        """``span`` ended."""
+
+    @abc.abstractmethod
+    def record(
+        self, name: str, kind: str, value: float, attributes: Dict[str, Any]
+    ) -> None:
+        """Record a measurement of the metric ``name``.
+
+        ``kind`` is :data:`COUNTER` or :data:`UP_DOWN_COUNTER` (``value`` is
+        added) or :data:`HISTOGRAM` (``value`` is one observation).
+        """
+
+
+_SeriesKey = Tuple[str, FrozenSet[Tuple[str, Any]]]
+
+
+class InMemoryCollector(TelemetryExporter):
+    """Keeps finished spans and aggregated metrics in memory.
+
+    Counters are summed and histograms keep every observation, per metric
+    name and attribute set. Safe to share between threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.spans: List[Span] = []
+        """Finished spans, in the order they ended."""
+        self._sums: Dict[_SeriesKey, float] = {}
+        self._observations: Dict[_SeriesKey, List[float]] = {}
+
+    def on_start(self, span: Span) -> None:
+        pass
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def record(
+        self, name: str, kind: str, value: float, attributes: Dict[str, Any]
+    ) -> None:
+        key = (name, frozenset(attributes.items()))
+        with self._lock:
+            if kind == HISTOGRAM:
+                self._observations.setdefault(key, []).append(value)
+            else:
+                self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def _matching(self, series: Dict[_SeriesKey, Any], name: str, attributes):
+        wanted = set((attributes or {}).items())
+        return [
+            value
+            for (metric, labels), value in series.items()
+            if metric == name and wanted <= labels
+        ]
+
+    def value(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> float:
+        """The sum of a counter over the series whose attributes include ``attributes``."""
+        with self._lock:
+            return sum(self._matching(self._sums, name, attributes))
+
+    def observations(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> List[float]:
+        """The observations of a histogram, like :meth:`value`."""
+        with self._lock:
+            matching = self._matching(self._observations, name, attributes)
+        return [value for values in matching for value in values]
+
+    def find(self, name: str) -> List[Span]:
+        """Finished spans called ``name``."""
+        with self._lock:
+            return [span for span in self.spans if span.name == name]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+            self._sums.clear()
+            self._observations.clear()
+
+
+class OpenTelemetryExporter(TelemetryExporter):
+    """Forwards spans and metrics to OpenTelemetry.
+
+    Uses the global tracer and meter providers unless given others. Requires
+    ``opentelemetry-api`` (``pip install kittycad[opentelemetry]``); spans
+    and metrics go wherever the application's OpenTelemetry SDK sends them.
+    """
+
+    def __init__(self, tracer_provider: Any = None, meter_provider: Any = None):
+        from opentelemetry import metrics, trace
+
+        self._trace = trace
+        self._tracer = trace.get_tracer("kittycad", tracer_provider=tracer_provider)
+        self._meter = metrics.get_meter("kittycad", meter_provider=meter_provider)
+        self._lock = threading.Lock()
+        self._live: Dict[str, Any] = {}
+        self._instruments: Dict[str, Any] = {}
+
+    def on_start(self, span: Span) -> None:
+        context = None
+        if span.parent_span_id is not None:
+            with self._lock:
+                parent = self._live.get(span.parent_span_id)
+            if parent is not None:
+                context = self._trace.set_span_in_context(parent)
+        live = self._tracer.start_span(
+            span.name,
+            context=context,
+            kind=getattr(self._trace.SpanKind, span.kind),
+            attributes=span.attributes,
+            start_time=span.start_time_ns,
+        )
+        with self._lock:
+            self._live[span.span_id] = live
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            live = self._live.pop(span.span_id, None)
+        if live is None:
+            return
+        live.set_attributes(span.attributes)
+        for event in span.events:
+            live.add_event(event.name, event.attributes, timestamp=event.time_ns)
+        if span.status != STATUS_UNSET:
+            status = getattr(self._trace.StatusCode, span.status)
+            live.set_status(self._trace.Status(status, span.status_description))
+        live.end(end_time=span.end_time_ns)
+
+    def _instrument(self, name: str, kind: str) -> Any:
+        instrument = self._instruments.get(name)
+        if instrument is None:
+            unit = "s" if name.endswith(("duration", "wait")) else "1"
+            if name.startswith("kittycad.client.bytes"):
+                unit = "By"
+            create = {
+                COUNTER: self._meter.create_counter,
+                HISTOGRAM: self._meter.create_histogram,
+                UP_DOWN_COUNTER: self._meter.create_up_down_counter,
+            }[kind]
+            instrument = self._instruments.setdefault(name, create(name, unit=unit))
+        return instrument
+
+    def record(
+        self, name: str, kind: str, value: float, attributes: Dict[str, Any]
+    ) -> None:
+        instrument = self._instrument(name, kind)
+        if kind == HISTOGRAM:
+            instrument.record(value, attributes)
+        else:
+            instrument.add(value, attributes)
+
+
+def _new_id(digits: int) -> str:
+    return os.urandom(digits // 2).hex()
+
+
+def _operation_attributes(event: RequestEvent) -> Dict[str, Any]:
+    attributes: Dict[str, Any] = {
+        "url.template": event.url_template,
+        "network.protocol.name": event.protocol,
+    }
+    if event.operation_id is not None:
+        attributes["kittycad.operation_id"] = event.operation_id
+    if event.tag is not None:
+        attributes["kittycad.tag"] = event.tag
+    return attributes
+
+
+class Telemetry:
+    """Builds spans and metrics from request lifecycle events.
+
+    Attach it to a client with ``event_hooks=telemetry.instrument()``; one
+    :class:`Telemetry` may instrument several clients.
+    """
+
+    def __init__(self, exporter: Optional[TelemetryExporter] = None):
+        self.exporter = InMemoryCollector() if exporter is None else exporter
+        self._lock = threading.Lock()
+        # Open spans and their metric attributes, by exchange id.
+        self._open: Dict[int, Tuple[Span, Dict[str, Any]]] = {}
+
+    def instrument(self, hooks: Optional[EventHooks] = None) -> EventHooks:
+        """Register on ``hooks`` (a new :class:`EventHooks` by default)."""
+        hooks = EventHooks() if hooks is None else hooks
+        hooks.on_request_start(self._on_request_start)
+        hooks.on_response_headers(self._on_response_headers)
+        hooks.on_response_end(self._on_response_end)
+        hooks.on_error(self._on_error)
+        hooks.on_retry(self._on_retry)
+        hooks.on_rate_limit(self._on_rate_limit)
+        return hooks
+
+    def _get(self, exchange_id: Optional[int]) -> Optional[Tuple[Span, Dict]]:
+        with self._lock:
+            return self._open.get(exchange_id) if exchange_id is not None else None
+
+    def _record(self, name: str, kind: str, value: float, attributes: Dict) -> None:
+        self.exporter.record(name, kind, value, attributes)
+
+    def _on_request_start(self, event: RequestEvent) -> None:
+        if event.method in _MESSAGES:
+            return
+        parent = self._get(event.parent_id)
+        metric_attributes = _operation_attributes(event)
+        attributes = dict(metric_attributes)
+        if event.protocol == "pagination":
+            name, kind = f"PAGINATE {event.url_template}", SPAN_KIND_INTERNAL
+        else:
+            name, kind = f"{event.method} {event.url_template}", SPAN_KIND_CLIENT
+            attributes["http.request.method"] = event.method
+            metric_attributes["http.request.method"] = event.method
+        if event.request_bytes:
+            attributes["http.request.body.size"] = event.request_bytes
+        span = Span(
+            name=name,
+            kind=kind,
+            trace_id=_new_id(32) if parent is None else parent[0].trace_id,
+            span_id=_new_id(16),
+            parent_span_id=None if parent is None else parent[0].span_id,
+            start_time_ns=time.time_ns(),
+            attributes=attributes,
+        )
+        with self._lock:
+            self._open[event.exchange_id] = (span, metric_attributes)
+        self.exporter.on_start(span)
+        self._record(IN_FLIGHT, UP_DOWN_COUNTER, 1, metric_attributes)
+        if event.request_bytes:
+            self._record(BYTES_SENT, COUNTER, event.request_bytes, metric_attributes)
+
+    def _on_response_headers(self, event: RequestEvent) -> None:
+        open_span = self._get(event.exchange_id)
+        if open_span is None:
+            return
+        span = open_span[0]
+        if event.status_code is not None:
+            span.attributes["http.response.status_code"] = event.status_code
+        if event.ttfb is not None:
+            span.attributes["kittycad.ttfb"] = event.ttfb
+
+    def _message(self, event: RequestEvent, error: bool = False) -> None:
+        open_span = self._get(event.parent_id)
+        if open_span is None:
+            return
+        span, metric_attributes = open_span
+        now = time.time_ns()
+        if error:
+            span.events.append(_exception_event(event, now))
+            return
+        sent = event.method == "SEND"
+        size = event.request_bytes if sent else event.response_bytes
+        span.events.append(
+            SpanEvent(
+                "message",
+                now,
+                {
+                    "message.type": "SENT" if sent else "RECEIVED",
+                    "message.uncompressed_size": size or 0,
+                },
+            )
+        )
+        direction = {**metric_attributes, "direction": "sent" if sent else "received"}
+        self._record(WEBSOCKET_MESSAGES, COUNTER, 1, direction)
+        if size:
+            self._record(
+                BYTES_SENT if sent else BYTES_RECEIVED,
+                COUNTER,
+                size,
+                metric_attributes,
+            )
+
+    def _finish(self, event: RequestEvent) -> Optional[Tuple[Span, Dict]]:
+        with self._lock:
+            open_span = self._open.pop(event.exchange_id, None)
+        if open_span is None:
+            return None
+        span, metric_attributes = open_span
+        span.end_time_ns = time.time_ns()
+        self._record(IN_FLIGHT, UP_DOWN_COUNTER, -1, metric_attributes)
+        if event.status_code is not None:
+            span.attributes["http.response.status_code"] = event.status_code
+        if event.count is not None:
+            key = "messages" if event.protocol == "websocket" else "pages"
+            span.attributes[f"kittycad.{key}"] = event.count
+        if event.duration is not None:
+            attributes = dict(metric_attributes)
+            if event.protocol == "http":
+                if event.status_code is not None:
+                    attributes["http.response.status_code"] = event.status_code
+                self._record(REQUEST_DURATION, HISTOGRAM, event.duration, attributes)
+            else:
+                self._record(SESSION_DURATION, HISTOGRAM, event.duration, attributes)
+        if event.timing is not None:
+            self._timing(span, event.timing, metric_attributes)
+        return span, metric_attributes
+
+    def _timing(
+        self, span: Span, timing: TimingBreakdown, metric_attributes: Dict
+    ) -> None:
+        for phase, value in timing.phases().items():
+            span.attributes[f"kittycad.timing.{phase}"] = value
+            if phase != "total":
+                attributes = {**metric_attributes, "kittycad.phase": phase}
+                self._record(PHASE_DURATION, HISTOGRAM, value, attributes)
+        if timing.reused_connection is not None:
+            span.attributes["kittycad.timing.reused_connection"] = (
+                timing.reused_connection
+            )
+        if timing.failed_phase is not None:
+            span.attributes["kittycad.timing.failed_phase"] = timing.failed_phase
+
+    def _on_response_end(self, event: RequestEvent) -> None:
+        if event.method in _MESSAGES:
+            self._message(event)
+            return
+        finished = self._finish(event)
+        if finished is None:
+            return
+        span, metric_attributes = finished
+        if event.protocol == "http":
+            if event.ttfb is not None and event.duration is not None:
+                # Time spent reading the body after the headers arrived.
+                span.attributes["kittycad.download_time"] = event.duration - event.ttfb
+            if event.response_bytes is not None:
+                span.attributes["http.response.body.size"] = event.response_bytes
+            if event.response_bytes:
+                self._record(
+                    BYTES_RECEIVED, COUNTER, event.response_bytes, metric_attributes
+                )
+            if event.status_code is not None and event.status_code >= 400:
+                span.status = STATUS_ERROR
+                span.attributes["error.type"] = str(event.status_code)
+        self.exporter.on_end(span)
+
+    def _on_error(self, event: RequestEvent) -> None:
+        if event.method in _MESSAGES:
+            self._message(event, error=True)
+            return
+        finished = self._finish(event)
+        if finished is None:
+            return
+        span = finished[0]
+        span.status = STATUS_ERROR
+        if event.error is not None:
+            span.status_description = str(event.error)
+            span.attributes["error.type"] = type(event.error).__qualname__
+            span.events.append(_exception_event(event, span.end_time_ns or 0))
+        self.exporter.on_end(span)
+
+    def _on_retry(self, event: RequestEvent) -> None:
+        open_span = self._get(event.exchange_id)
+        attributes = _operation_attributes(event)
+        self._record(RETRIES, COUNTER, 1, attributes)
+        if open_span is not None:
+            retry: Dict[str, Any] = {"kittycad.attempt": event.attempt}
+            if event.status_code is not None:
+                retry["http.response.status_code"] = event.status_code
+            open_span[0].events.append(SpanEvent("retry", time.time_ns(), retry))
+
+    def _on_rate_limit(self, event: RequestEvent) -> None:
+        wait = event.duration or 0.0
+        self._record(RATE_LIMIT_WAIT, COUNTER, wait, _operation_attributes(event))
+        open_span = self._get(event.exchange_id)
+        if open_span is not None:
+            open_span[0].events.append(
+                SpanEvent("rate_limit", time.time_ns(), {"kittycad.wait": wait})
+            )
+
+
+def _exception_event(event: RequestEvent, time_ns: int) -> SpanEvent:
+    error = event.error
+    return SpanEvent(
+        "exception",
+        time_ns,
+        {
+            "exception.type": type(error).__qualname__ if error else "",
+            "exception.message": str(error) if error else "",
+        },
+    )
+
+
+__all__ = [
+    "BYTES_RECEIVED",
+    "BYTES_SENT",
+    "IN_FLIGHT",
+    "PHASE_DURATION",
+    "RATE_LIMIT_WAIT",
+    "REQUEST_DURATION",
+    "RETRIES",
+    "SESSION_DURATION",
+    "WEBSOCKET_MESSAGES",
+    "InMemoryCollector",
+    "OpenTelemetryExporter",
+    "Span",
+    "SpanEvent",
+    "Telemetry",
+    "TelemetryExporter",
+]
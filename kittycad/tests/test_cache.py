@@ -0,0 +1,294 @@
+"""Tests for the HTTP response cache."""
+
+import json
+import os
+
+import httpx
+import pytest
+
+from kittycad import AsyncKittyCAD, KittyCAD
+from kittycad.cache import (
+    CACHE_EXTENSION,
+    CacheBackend,
+    CacheEntry,
+    CacheTransport,
+    DiskCacheBackend,
+    MemoryCacheBackend,
+    ResponseCache,
+)
+
+
+def _server(headers, calls, etag=None):
+    """A handler that honours If-None-Match for a fixed ETag."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if etag is not None and request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"ETag": etag, **headers})
+        extra = {"ETag": etag} if etag else {}
+        return httpx.Response(
+            200, headers={**headers, **extra}, json={"message": "pong"}
+        )
+
+    return handler
+
+
+def _client(handler, cache):
+    return KittyCAD(
+        token="t", transport=httpx.MockTransport(handler), response_cache=cache
+    )
+
+
+def test_fresh_hits_skip_network_and_validation():
+    cache = ResponseCache()
+    calls: list = []
+    client = _client(_server({"Cache-Control": "max-age=60"}, calls), cache)
+
+    first = client.meta.ping()
+    second = client.meta.ping()
+
+    assert len(calls) == 1
+    assert second is first
+    assert cache.stats().hits == 1
+    assert cache.stats().stores == 1
+
+
+def test_stale_entry_is_revalidated_with_etag():
+    cache = ResponseCache()
+    calls: list = []
+    client = _client(_server({"Cache-Control": "no-cache"}, calls, etag='"v1"'), cache)
+
+    first = client.meta.ping()
+    second = client.meta.ping()
+
+    assert len(calls) == 2
+    assert "if-none-match" not in calls[0].headers
+    assert calls[1].headers["if-none-match"] == '"v1"'
+    assert second is first
+    assert cache.stats().revalidated == 1
+
+
+def test_no_store_and_unvalidated_responses_are_not_cached():
+    for headers in ({"Cache-Control": "no-store, max-age=60"}, {}):
+        cache = ResponseCache()
+        calls: list = []
+        client = _client(_server(headers, calls), cache)
+
+        client.meta.ping()
+        client.meta.ping()
+
+        assert len(calls) == 2
+        assert cache.stats().stores == 0
+
+
+def test_ttl_override_by_operation_and_path():
+    cache = ResponseCache(ttl={"ping": 60, "/user/*": 0})
+    calls: list = []
+    # Without the override this response wouldn't be stored at all.
+    client = _client(_server({}, calls), cache)
+
+    client.meta.ping()
+    client.meta.ping()
+
+    assert len(calls) == 1
+    assert cache.ttl_for(httpx.Request("GET", "https://api.zoo.dev/user/x")) == 0
+
+
+def test_no_store_wins_over_ttl_override():
+    cache = ResponseCache(ttl={"ping": 60})
+    calls: list = []
+    client = _client(_server({"Cache-Control": "no-store"}, calls), cache)
+
+    client.meta.ping()
+    client.meta.ping()
+
+    assert len(calls) == 2
+    assert cache.stats().stores == 0
+
+
+def test_unstored_responses_stream_through_unread():
+    class Chunks(httpx.SyncByteStream):
+        def __init__(self) -> None:
+            self.read = 0
+
+        def __iter__(self):
+            for chunk in (b"one", b"two"):
+                self.read += 1
+                yield chunk
+
+    stream = Chunks()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"Cache-Control": "no-store"}, stream=stream)
+
+    cache = ResponseCache()
+    transport = CacheTransport(httpx.MockTransport(handler), cache)
+    response = transport.handle_request(
+        httpx.Request("GET", "https://api.zoo.dev/file/download")
+    )
+
+    assert response.stream is stream
+    assert stream.read == 0
+    assert response.extensions[CACHE_EXTENSION] == "miss"
+    assert list(response.iter_raw()) == [b"one", b"two"]
+    assert cache.stats().misses == 1
+
+
+def test_tokens_do_not_share_entries():
+    cache = ResponseCache(default_ttl=60)
+    calls: list = []
+    handler = _server({}, calls)
+
+    KittyCAD(
+        token="a", transport=httpx.MockTransport(handler), response_cache=cache
+    ).meta.ping()
+    KittyCAD(
+        token="b", transport=httpx.MockTransport(handler), response_cache=cache
+    ).meta.ping()
+
+    assert len(calls) == 2
+
+
+def test_tenants_sharing_a_token_do_not_share_entries():
+    cache = ResponseCache(default_ttl=60)
+    calls: list = []
+    base = _client(_server({}, calls), cache)
+
+    base.with_headers({"X-Org": "a"}).meta.ping()
+    base.with_headers({"X-Org": "b"}).meta.ping()
+    base.with_cookies({"session": "2"}).meta.ping()
+    base.with_headers({"X-Org": "a", "User-Agent": "other"}).meta.ping()
+
+    assert len(calls) == 3
+    assert cache.stats().hits == 1
+
+
+def test_errors_are_not_cached():
+    cache = ResponseCache(default_ttl=60)
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(503, json={"message": "down"})
+
+    client = _client(handler, cache)
+    for _ in range(2):
+        with pytest.raises(Exception):
+            client.meta.ping()
+
+    assert len(calls) == 2
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryCacheBackend(max_entries=10, max_bytes=10)
+
+    def entry(size):
+        return CacheEntry(200, [], b"x" * size, stored_at=0, expires_at=1)
+
+    backend.set("a", entry(4))
+    backend.set("b", entry(4))
+    backend.get("a")
+    backend.set("c", entry(4))
+
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+    assert backend.size_bytes == 8
+    assert backend.evictions == 1
+
+
+def test_disk_backend_persists_entries(tmp_path):
+    calls: list = []
+    handler = _server({"Cache-Control": "max-age=60"}, calls)
+
+    _client(handler, ResponseCache(backend=DiskCacheBackend(str(tmp_path)))).meta.ping()
+    cache = ResponseCache(backend=DiskCacheBackend(str(tmp_path)))
+    result = _client(handler, cache).meta.ping()
+
+    assert result.message == "pong"
+    assert len(calls) == 1
+    assert cache.stats().hits == 1
+
+    cache.clear()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_disk_backend_rereads_only_changed_files(tmp_path, monkeypatch):
+    reads = []
+    real_load = json.load
+
+    def counting_load(f):
+        reads.append(f.name)
+        return real_load(f)
+
+    monkeypatch.setattr(json, "load", counting_load)
+    backend = DiskCacheBackend(str(tmp_path))
+    entry = CacheEntry(200, [], b"one", stored_at=1, expires_at=2)
+    backend.set("k", entry)
+
+    assert backend.get("k") is entry
+    assert backend.get("k") is entry
+    assert reads == []
+
+    # Another process replaces the file.
+    other = DiskCacheBackend(str(tmp_path))
+    other.set("k", CacheEntry(200, [], b"two!", stored_at=3, expires_at=4))
+
+    for _ in range(2):
+        current = backend.get("k")
+        assert current is not None and current.content == b"two!"
+    assert len(reads) == 1
+
+    os.remove(tmp_path / "k.json")
+    assert backend.get("k") is None
+
+
+@pytest.mark.parametrize(
+    "content", ["", '{"status_code": 200', '{"status_code": 200}', "[1, 2]"]
+)
+def test_disk_backend_treats_bad_files_as_misses(tmp_path, content):
+    backend = DiskCacheBackend(str(tmp_path))
+    (tmp_path / "k.json").write_text(content)
+
+    assert backend.get("k") is None
+
+
+def test_disk_backend_removes_temp_file_when_a_write_fails(tmp_path, monkeypatch):
+    def broken_dump(data, f):
+        f.write("{")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(json, "dump", broken_dump)
+    backend = DiskCacheBackend(str(tmp_path))
+
+    with pytest.raises(OSError):
+        backend.set("k", CacheEntry(200, [], b"one", stored_at=1, expires_at=2))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cache_backend_is_abstract():
+    with pytest.raises(TypeError):
+        CacheBackend()  # type: ignore[abstract]
+
+    class Partial(CacheBackend):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Partial()  # type: ignore[abstract]
+
+
+@pytest.mark.asyncio
+async def test_async_client_uses_cache():
+    cache = ResponseCache()
+    calls: list = []
+    client = AsyncKittyCAD(
+        token="t",
+        transport=httpx.MockTransport(_server({"Cache-Control": "max-age=60"}, calls)),
+        response_cache=cache,
+    )
+
+    first = await client.meta.ping()
+    second = await client.meta.ping()
+
+    assert second is first
+    assert len(calls) == 1
@@ -0,0 +1,174 @@
+"""Tests for resumable pagination checkpoints."""
+
+import sqlite3
+from typing import Any, List, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from kittycad.checkpoints import (
+    FileCheckpointStore,
+    PageCheckpoint,
+    SQLiteCheckpointStore,
+)
+from kittycad.pagination import AsyncPageIterator, SyncPageIterator
+
+
+class Item(BaseModel):
+    id: int
+
+
+class Page(BaseModel):
+    items: List[Item]
+    next_page: Optional[str] = None
+
+
+class Listing:
+    """A fake listing of ``total`` items, ten per page, failing at item ``fail``."""
+
+    def __init__(self, total: int, fail: int = -1) -> None:
+        self.total = total
+        self.fail = fail
+        self.tokens: List[Optional[str]] = []
+
+    def page(self, page_token: Optional[str] = None, limit: int = 10) -> Page:
+        self.tokens.append(page_token)
+        start = int(page_token or 0)
+        if start <= self.fail < start + limit:
+            raise RuntimeError("boom")
+        end = min(self.total, start + limit)
+        return Page(
+            items=[Item(id=i) for i in range(start, end)],
+            next_page=str(end) if end < self.total else None,
+        )
+
+    def __call__(self, **kwargs) -> Page:
+        return self.page(**kwargs)
+
+    async def fetch(self, **kwargs) -> Page:
+        return self.page(**kwargs)
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "file":
+        return FileCheckpointStore(str(tmp_path / "checkpoint.json"))
+    return SQLiteCheckpointStore(str(tmp_path / "checkpoints.db"), key="crawl")
+
+
+def _ids(iterator) -> List[int]:
+    return [item.id for item in iterator]
+
+
+def test_checkpoint_tracks_token_and_offset():
+    paginator = SyncPageIterator(Listing(30), {})
+    iterator: Any = iter(paginator)
+    for _ in range(13):
+        next(iterator)
+
+    # The 13th item isn't finished until the next one is asked for.
+    assert paginator.checkpoint == PageCheckpoint(page_token="10", offset=2, items=12)
+
+
+def test_resume_from_an_in_memory_checkpoint():
+    first = SyncPageIterator(Listing(30), {})
+    ids: List[int] = []
+    item: Item
+    for item in first:
+        ids.append(item.id)
+        if item.id == 12:
+            break
+
+    listing = Listing(30)
+    rest = _ids(SyncPageIterator(listing, {}).resume_from(first.checkpoint))
+
+    # Item 12 was yielded but never finished, so it comes again.
+    assert rest == list(range(12, 30))
+    assert listing.tokens == ["10", "20"]
+
+
+def test_crash_resumes_at_the_failed_page(store):
+    seen: List[int] = []
+    item: Item
+    with pytest.raises(RuntimeError):
+        for item in SyncPageIterator(Listing(50, fail=25), {}).checkpoint_to(store):
+            seen.append(item.id)
+    assert seen == list(range(20))
+    assert store.load() == PageCheckpoint(page_token="20", items=20)
+
+    listing = Listing(50)
+    rest = _ids(SyncPageIterator(listing, {}).checkpoint_to(store))
+
+    assert rest == list(range(20, 50))
+    assert listing.tokens == ["20", "30", "40"]
+    assert store.load() == PageCheckpoint(items=50, done=True)
+    # Finished: nothing left to fetch.
+    assert _ids(SyncPageIterator(listing, {}).checkpoint_to(store)) == []
+    assert len(listing.tokens) == 3
+    store.clear()
+    assert store.load() is None
+
+
+def test_pages_are_delivered_exactly_once(store):
+    delivered: List[int] = []
+
+    def crawl(stop_after: int) -> None:
+        iterator = SyncPageIterator(Listing(60), {}).checkpoint_to(store)
+        page: Any
+        for n, page in enumerate(iterator.pages()):
+            if n == stop_after:
+                # Dies before finishing the page, so the next crawl redoes it.
+                return
+            delivered.extend(item.id for item in page.items)
+
+    crawl(stop_after=2)
+    crawl(stop_after=1)
+    crawl(stop_after=99)
+
+    assert delivered == list(range(60))
+
+
+def test_take_saves_the_item_offset(store):
+    first: List[Item] = list(
+        SyncPageIterator(Listing(30), {}).checkpoint_to(store).take(15)
+    )
+    assert len(first) == 15
+    assert store.load() == PageCheckpoint(page_token="10", offset=5, items=15)
+
+    listing = Listing(30)
+    assert _ids(SyncPageIterator(listing, {}).checkpoint_to(store)) == list(
+        range(15, 30)
+    )
+
+
+def test_sqlite_store_keeps_one_row_per_key(tmp_path):
+    path = str(tmp_path / "checkpoints.db")
+    a = SQLiteCheckpointStore(path, key="a")
+    b = SQLiteCheckpointStore(path, key="b")
+    a.save(PageCheckpoint(page_token="x", items=1))
+    b.save(PageCheckpoint(page_token="y", items=2))
+    a.save(PageCheckpoint(page_token="z", items=3))
+
+    assert a.load() == PageCheckpoint(page_token="z", items=3)
+    assert b.load() == PageCheckpoint(page_token="y", items=2)
+    with sqlite3.connect(path) as db:
+        assert db.execute("SELECT COUNT(*) FROM kittycad_checkpoints").fetchone() == (
+            2,
+        )
+
+
+@pytest.mark.asyncio
+async def test_async_checkpoints(store):
+    seen: List[int] = []
+    item: Item
+    with pytest.raises(RuntimeError):
+        async for item in AsyncPageIterator(
+            Listing(40, fail=31).fetch, {}, checkpoint_store=store
+        ):
+            seen.append(item.id)
+    assert store.load() == PageCheckpoint(page_token="30", items=30)
+
+    rest: List[int] = []
+    async for item in AsyncPageIterator(Listing(40).fetch, {}).checkpoint_to(store):
+        rest.append(item.id)
+    assert rest == list(range(30, 40))
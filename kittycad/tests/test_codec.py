@@ -0,0 +1,235 @@
+"""Tests for the pluggable JSON codec and bytes-level (de)serialization."""
+
+import base64
+import json
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Tuple
+
+import httpx
+import pytest
+
+from kittycad import KittyCAD
+from kittycad.codec import JSONCodec, OrjsonCodec, fastest_codec
+from kittycad.models import (
+    ApiCallWithPriceResultsPage,
+    FileConversion,
+    FileExportFormat,
+    FileImportFormat,
+    UpdateUser,
+)
+from kittycad.types import encode_request_body, serialize_request_body
+
+NOW = "2024-01-01T00:00:00Z"
+
+
+def _api_call(i: int) -> Dict[str, Any]:
+    return {
+        "completed_at": NOW,
+        "created_at": NOW,
+        "duration": 12,
+        "endpoint": f"/users/{i}",
+        "id": str(uuid.UUID(int=i)),
+        "ip_address": "127.0.0.1",
+        "method": "GET",
+        "origin": "https://zoo.dev",
+        "price": 0.01,
+        "status_code": 200,
+        "token": str(uuid.UUID(int=i + 1)),
+        "updated_at": NOW,
+        "user_agent": "python-httpx/0.28",
+        "user_id": str(uuid.UUID(int=i + 2)),
+    }
+
+
+def _api_calls_page(n: int) -> bytes:
+    items = [_api_call(i) for i in range(n)]
+    return json.dumps({"items": items, "next_page": None}).encode()
+
+
+def _codec(name: str) -> JSONCodec:
+    if name == "orjson":
+        pytest.importorskip("orjson")
+        return OrjsonCodec()
+    return JSONCodec()
+
+
+def _file_conversion(n_outputs: int, size: int) -> bytes:
+    outputs = {
+        f"part{i}.obj": base64.b64encode(bytes([i]) * size).decode()
+        for i in range(n_outputs)
+    }
+    return json.dumps(
+        {
+            "created_at": NOW,
+            "id": str(uuid.UUID(int=1)),
+            "output_format": "obj",
+            "outputs": outputs,
+            "src_format": "stl",
+            "status": "completed",
+            "updated_at": NOW,
+            "user_id": str(uuid.UUID(int=2)),
+        }
+    ).encode()
+
+
+@pytest.mark.parametrize("name", ["json", "orjson"])
+def test_codecs_round_trip(name):
+    codec = _codec(name)
+    value = {"a": [1, 2.5, None, True], "b": "ünïcode"}
+    encoded = codec.dumps(value)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == value
+    assert json.loads(encoded) == value
+
+
+def test_stdlib_is_default_and_orjson_is_opt_in():
+    assert KittyCAD(token="t").json_codec.name == "json"
+    assert fastest_codec().name in ("json", "orjson")
+
+    pytest.importorskip("orjson")
+    assert fastest_codec().name == "orjson"
+    client = KittyCAD(token="t", json_codec=OrjsonCodec())
+    assert client.json_codec.name == "orjson"
+    assert client.with_json_codec(JSONCodec()).json_codec.name == "json"
+
+
+@pytest.mark.parametrize("name", ["json", "orjson"])
+def test_encode_request_body_matches_string_serializer(name):
+    body = UpdateUser(company="Zoo", discord=None, image="https://zoo.dev/a.png")
+    for codec in (None, _codec(name)):
+        encoded = encode_request_body(body, codec)
+        assert json.loads(encoded) == json.loads(serialize_request_body(body))
+    assert json.loads(encode_request_body(body)) == {
+        "company": "Zoo",
+        "discord": None,
+        "image": "https://zoo.dev/a.png",
+        "phone": "",
+    }
+
+
+def _client(handler: Callable[[httpx.Request], httpx.Response], codec=None):
+    kwargs = {} if codec is None else {"json_codec": codec}
+    return KittyCAD(token="t", transport=httpx.MockTransport(handler), **kwargs)
+
+
+def test_request_body_is_sent_as_codec_bytes():
+    seen: List[bytes] = []
+
+    class RecordingCodec(JSONCodec):
+        def dumps(self, obj):
+            seen.append(super().dumps(obj))
+            return seen[-1]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.content == seen[-1]
+        return httpx.Response(404, json={"message": "nope"})
+
+    client = _client(handler, RecordingCodec())
+    with pytest.raises(Exception):
+        client.users.update_user_self(body=UpdateUser(company="Zoo", image="i"))
+    assert json.loads(seen[-1]) == {"company": "Zoo", "image": "i", "phone": ""}
+
+
+def test_untyped_responses_are_decoded_with_codec():
+    decoded = []
+
+    class RecordingCodec(JSONCodec):
+        def loads(self, data):
+            decoded.append(data)
+            return super().loads(data)
+
+    client = _client(
+        lambda request: httpx.Response(200, json={"ok": True}), RecordingCodec()
+    )
+    assert client.hidden.logout() == {"ok": True}
+    assert decoded == [b'{"ok":true}']
+
+
+def test_models_are_validated_from_raw_bytes():
+    body = _file_conversion(n_outputs=2, size=64)
+    client = _client(lambda request: httpx.Response(200, content=body))
+    conversion = client.file.create_file_conversion(
+        src_format=FileImportFormat.STL,
+        output_format=FileExportFormat.OBJ,
+        body=b"solid",
+    )
+    expected = FileConversion.model_validate(json.loads(body), extra="ignore")
+    assert conversion == expected
+    assert conversion.outputs is not None
+    assert conversion.outputs["part1.obj"] == b"\x01" * 64
+
+
+def test_paginated_responses_are_validated_from_raw_bytes():
+    client = _client(lambda request: httpx.Response(200, content=_api_calls_page(3)))
+    calls = list(client.api_calls.user_list_api_calls())
+    assert [str(call.id) for call in calls] == [str(uuid.UUID(int=i)) for i in range(3)]
+
+
+def test_websocket_send_and_recv_use_codec():
+    sent: List[Any] = []
+
+    class FakeWS:
+        def recv(self, timeout=None):
+            return '{"ok":true}'
+
+        def send(self, data):
+            sent.append(data)
+
+        def close(self):
+            return None
+
+    client = KittyCAD(token="t", base_url="https://example.com")
+    connection = client.executor.create_executor_term(
+        ws_factory=lambda *args, **kwargs: FakeWS()  # type: ignore[arg-type,return-value]
+    )
+    connection.send({"a": 1})
+    assert connection.recv() == {"ok": True}
+    # Text frames, as before, not binary ones.
+    assert sent == ['{"a":1}']
+
+
+def _best_of(fn: Callable[[], Any], runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _payloads() -> List[Tuple[str, Any, bytes]]:
+    return [
+        (
+            "ApiCallWithPriceResultsPage",
+            ApiCallWithPriceResultsPage,
+            _api_calls_page(2000),
+        ),
+        ("FileConversion", FileConversion, _file_conversion(n_outputs=4, size=1 << 18)),
+    ]
+
+
+def test_validate_from_bytes_matches_dict():
+    for _, model, body in _payloads():
+        via_dict = model.model_validate(json.loads(body), extra="ignore")
+        assert model.model_validate_json(body, extra="ignore") == via_dict
+
+
+@pytest.mark.benchmark
+def test_benchmark_validate_from_bytes():
+    """Bytes-level validation vs. the old ``json.loads`` + ``model_validate``.
+
+    Prints the timings (``pytest -s --benchmarks``); only a clear regression fails.
+    """
+    for name, model, body in _payloads():
+
+        def via_dict(model: Any = model, body: bytes = body) -> Any:
+            return model.model_validate(json.loads(body), extra="ignore")
+
+        def via_bytes(model: Any = model, body: bytes = body) -> Any:
+            return model.model_validate_json(body, extra="ignore")
+
+        old = _best_of(via_dict, runs=7)
+        new = _best_of(via_bytes, runs=7)
+        print(f"{name}: dict {old * 1000:.1f}ms, bytes {new * 1000:.1f}ms")
+        assert new < old * 2
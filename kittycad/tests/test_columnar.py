@@ -0,0 +1,177 @@
+"""Tests for columnar export of paginated listings."""
+
+import datetime
+from typing import Any, Dict, List, Optional
+
+import httpx
+import numpy
+import pytest
+
+from kittycad import AsyncKittyCAD, KittyCAD
+from kittycad.checkpoints import FileCheckpointStore, PageCheckpoint
+from kittycad.columnar import ColumnBuilder, ColumnChunk
+from kittycad.models import ApiCallWithPriceResultsPage
+from kittycad.pagination import RawPage, SyncPageIterator
+
+EPOCH = datetime.datetime(2026, 3, 1, tzinfo=datetime.timezone.utc)
+
+
+def _call(n: int) -> Dict[str, Any]:
+    created = (EPOCH + datetime.timedelta(minutes=n)).isoformat()
+    return {
+        "id": f"00000000-0000-0000-0000-{n:012d}",
+        "created_at": created.replace("+00:00", "Z"),
+        "updated_at": created,
+        "endpoint": f"/e{n % 3}",
+        "method": "GET",
+        "price": None if n % 5 == 0 else n / 2,
+        "status_code": 200,
+        "token": "00000000-0000-0000-0000-000000000001",
+        "user_agent": "test",
+        "user_id": "00000000-0000-0000-0000-000000000002",
+    }
+
+
+class Api:
+    """Serves ``total`` API calls, ``limit`` per page."""
+
+    def __init__(self, total: int) -> None:
+        self.calls = [_call(n) for n in range(total)]
+        self.requests: List[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        start = int(request.url.params.get("page_token", 0))
+        end = start + int(request.url.params.get("limit", 10))
+        next_page: Optional[str] = str(end) if end < len(self.calls) else None
+        return httpx.Response(
+            200, json={"items": self.calls[start:end], "next_page": next_page}
+        )
+
+
+FIELDS = {"created_at": "datetime", "endpoint": "str", "price": "float64"}
+
+
+@pytest.fixture
+def no_models(monkeypatch):
+    def refuse(*args, **kwargs):
+        raise AssertionError("a page was validated into models")
+
+    monkeypatch.setattr(ApiCallWithPriceResultsPage, "model_validate_json", refuse)
+
+
+def test_columns_come_in_chunks_without_models(no_models):
+    api = Api(25)
+    client = KittyCAD(token="t", transport=httpx.MockTransport(api))
+
+    chunks: List[ColumnChunk] = list(
+        client.api_calls.user_list_api_calls(limit=10).columns(FIELDS, chunk_size=8)
+    )
+
+    assert [len(chunk) for chunk in chunks] == [8, 8, 8, 1]
+    assert len(api.requests) == 3
+    first = chunks[0]
+    assert first["created_at"].dtype == numpy.dtype("datetime64[us]")
+    assert first["created_at"][1] == numpy.datetime64("2026-03-01T00:01:00")
+    assert list(first["endpoint"][:3]) == ["/e0", "/e1", "/e2"]
+    assert list(first.valid["price"][:2]) == [False, True]
+    assert numpy.isnan(first["price"][0])
+    assert first["price"][1] == 0.5
+
+
+def test_items_still_become_models_outside_columns():
+    client = KittyCAD(token="t", transport=httpx.MockTransport(Api(3)))
+    items: List[Any] = list(client.api_calls.user_list_api_calls())
+
+    assert [type(item).__name__ for item in items] == ["ApiCallWithPrice"] * 3
+
+
+def test_builder_infers_types_and_reads_nested_fields():
+    builder = ColumnBuilder(["n", "ok", "user.email", "missing"], chunk_size=3)
+    builder.append({"n": 1, "ok": True, "user": {"email": "a@b.c"}})
+    builder.append({"n": None, "ok": False, "user": None})
+    chunk = builder.chunk()
+
+    assert chunk["n"].dtype == numpy.dtype("int64")
+    assert list(chunk.valid["n"]) == [True, False]
+    assert chunk["ok"].dtype == numpy.dtype(bool)
+    assert list(chunk["user.email"]) == ["a@b.c", None]
+    assert not chunk.valid["missing"].any()
+    assert len(builder) == 0
+
+    records = chunk.to_records()
+    assert records["n"][0] == 1
+    with pytest.raises(ValueError):
+        ColumnBuilder(["n"], chunk_size=0)
+
+
+def test_to_arrow():
+    pyarrow = pytest.importorskip("pyarrow")
+    builder = ColumnBuilder({"price": "float64"}, chunk_size=2)
+    builder.append({"price": 1.5})
+    builder.append({})
+
+    batch = builder.chunk().to_arrow()
+
+    assert batch.column(0).to_pylist() == [1.5, None]
+    assert batch.schema.field("price").type == pyarrow.float64()
+
+
+def test_take_and_checkpoints_follow_chunks(tmp_path):
+    store = FileCheckpointStore(str(tmp_path / "checkpoint.json"))
+    client = KittyCAD(token="t", transport=httpx.MockTransport(Api(50)))
+
+    def crawl(stop_after: int) -> List[str]:
+        ids: List[str] = []
+        listing = client.api_calls.user_list_api_calls(limit=10)
+        for n, chunk in enumerate(
+            listing.checkpoint_to(store).columns(["id"], chunk_size=7)
+        ):
+            if n == stop_after:
+                # Dies before finishing the chunk, so the next crawl redoes it.
+                break
+            ids.extend(chunk["id"])
+        return ids
+
+    ids = crawl(stop_after=2)
+    assert store.load() == PageCheckpoint(page_token="10", offset=4, items=14)
+    ids += crawl(stop_after=99)
+
+    assert ids == [call["id"] for call in Api(50).calls]
+    assert store.load() == PageCheckpoint(items=50, done=True)
+
+    iterator = client.api_calls.user_list_api_calls(limit=10).take(12)
+    taken: List[ColumnChunk] = list(iterator.columns(["id"], chunk_size=5))
+    assert [len(chunk) for chunk in taken] == [5, 5, 2]
+    assert iterator.checkpoint == PageCheckpoint(page_token="10", offset=2, items=12)
+
+
+def test_custom_fetchers_may_return_models():
+    page = ApiCallWithPriceResultsPage.model_validate({"items": [_call(1), _call(2)]})
+    iterator = SyncPageIterator(lambda **kwargs: page, {})
+
+    [chunk] = list(iterator.columns(FIELDS))
+
+    assert chunk["created_at"][0] == numpy.datetime64("2026-03-01T00:01:00")
+    assert list(chunk["price"]) == [0.5, 1.0]
+
+
+def test_raw_pages_keep_paging():
+    page = RawPage(items=[{"id": 1}], next_page="x")
+    assert page.model_copy(update={"items": []}).next_page == "x"
+
+
+@pytest.mark.asyncio
+async def test_async_columns(no_models):
+    api = Api(12)
+    client = AsyncKittyCAD(token="t", transport=httpx.MockTransport(api))
+
+    lengths: List[int] = []
+    async for chunk in client.api_calls.user_list_api_calls(limit=5).columns(
+        {"price": None}, chunk_size=4
+    ):
+        assert chunk["price"].dtype == numpy.dtype("float64")
+        lengths.append(len(chunk))
+
+    assert lengths == [4, 4, 4]
+    assert len(api.requests) == 3
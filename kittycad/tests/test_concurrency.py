@@ -0,0 +1,140 @@
+"""Tests for the adaptive (AIMD) concurrency limiter."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from kittycad import AsyncKittyCAD
+from kittycad.concurrency import DEFAULT_OVERLOAD_STATUSES, AdaptiveConcurrencyLimiter
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_on_healthy_responses():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+
+    for _ in range(20):
+        started = await limiter.acquire()
+        limiter.release(started, latency=0.01)
+
+    assert limiter.limit == 4
+    assert limiter.stats().increases == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_responses_do_not_grow_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, latency_target=0.1)
+
+    for _ in range(10):
+        started = await limiter.acquire()
+        limiter.release(started, latency=0.5)
+
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_overload_cuts_limit_once_per_event():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16)
+
+    slots = [await limiter.acquire() for _ in range(4)]
+    for started in slots:
+        limiter.release(started, overloaded=True)
+
+    assert limiter.limit == 8
+    assert limiter.stats().decreases == 1
+
+    started = await limiter.acquire()
+    limiter.release(started, overloaded=True)
+    assert limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_limit_never_drops_below_floor():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=2)
+
+    started = await limiter.acquire()
+    limiter.release(started, overloaded=True)
+
+    assert limiter.limit == 2
+
+
+def test_invalid_settings_are_rejected():
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(initial_limit=0)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(decrease_factor=1.0)
+
+
+def test_every_5xx_counts_as_overload():
+    assert {429, 500, 501, 502, 503, 504, 599} <= DEFAULT_OVERLOAD_STATUSES
+    assert not {200, 400, 404, 600} & DEFAULT_OVERLOAD_STATUSES
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    started = await limiter.acquire()
+
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.queue_depth == 0
+
+    limiter.release(started)
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_slot_context_manager():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+
+    async with limiter.slot():
+        assert limiter.in_flight == 1
+    assert limiter.in_flight == 0
+
+    with pytest.raises(httpx.ReadTimeout):
+        async with limiter.slot():
+            raise httpx.ReadTimeout("slow")
+    assert limiter.stats().decreases == 1
+    assert limiter.limit == 1
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_fan_out_is_capped_and_backs_off_on_429():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=8)
+    peak = 0
+    peak_queue = 0
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal peak, peak_queue, calls
+        calls += 1
+        call = calls
+        peak = max(peak, limiter.in_flight)
+        peak_queue = max(peak_queue, limiter.queue_depth)
+        await asyncio.sleep(0.001)
+        if call == 10:
+            return httpx.Response(429, json={"message": "slow down"})
+        return httpx.Response(200, json={"message": "pong"})
+
+    client = AsyncKittyCAD(
+        token="t",
+        transport=httpx.MockTransport(handler),
+        concurrency_limiter=limiter,
+    )
+
+    results = await asyncio.gather(
+        *(client.meta.ping() for _ in range(50)), return_exceptions=True
+    )
+
+    assert sum(isinstance(r, Exception) for r in results) == 1
+    assert peak <= 8
+    assert peak_queue > 0
+    assert limiter.stats().decreases == 1
+    assert limiter.in_flight == 0
+    assert limiter.queue_depth == 0
@@ -0,0 +1,250 @@
+"""Tests for connection-pool configuration on Client/AsyncClient."""
+
+import asyncio
+import threading
+import time
+
+import httpcore
+import httpx
+import pytest
+
+from kittycad import AsyncKittyCAD, KittyCAD
+from kittycad._transport import (
+    AsyncPerHostLimitTransport,
+    PerHostLimitTransport,
+    iter_transports,
+)
+from kittycad.client import AsyncClient, Client
+from kittycad.retry import AsyncRetryTransport, RetryPolicy, RetryTransport
+
+
+def _pool(http_client):
+    transport = http_client._transport
+    while not hasattr(transport, "_pool"):
+        transport = transport.transport
+    return transport._pool
+
+
+def test_default_pool_limits():
+    client = Client(token="test_token")
+    pool = _pool(client.get_http_client())
+
+    assert pool._max_connections == 100
+    assert pool._max_keepalive_connections == 20
+    assert pool._keepalive_expiry == 5.0
+
+    client.close()
+
+
+def test_pool_limits_passed_through_kittycad():
+    client = KittyCAD(
+        token="test_token",
+        max_connections=256,
+        max_keepalive_connections=64,
+        keepalive_expiry=30.0,
+    )
+    pool = _pool(client.get_http_client())
+
+    assert pool._max_connections == 256
+    assert pool._max_keepalive_connections == 64
+    assert pool._keepalive_expiry == 30.0
+
+    client.close()
+
+
+def test_with_limits_creates_fresh_pool_and_keeps_other_settings():
+    client = Client(token="test_token", headers={"X-Tenant": "a"}, timeout=30.0)
+    original = client.get_http_client()
+
+    tuned = client.with_limits(max_connections=8, max_connections_per_host=2)
+
+    assert tuned.max_connections == 8
+    assert tuned.max_connections_per_host == 2
+    assert tuned.max_keepalive_connections == client.max_keepalive_connections
+    assert tuned.headers == {"X-Tenant": "a"}
+    assert tuned.timeout == 30.0
+    assert tuned.get_http_client() is not original
+    assert isinstance(tuned.get_http_client()._transport, PerHostLimitTransport)
+
+    client.close()
+    tuned.close()
+
+
+def test_evolvers_carry_pool_settings():
+    client = Client(token="test_token", max_connections=64, http2=False)
+
+    derived = client.with_headers({"X-Other": "b"}).with_timeout(10.0)
+
+    assert derived.max_connections == 64
+    assert derived.get_limits().max_connections == 64
+
+
+def test_pool_stats_on_fresh_client():
+    client = Client(token="test_token", max_connections=12)
+    client.get_http_client()
+
+    stats = client.pool_stats()
+
+    assert stats.connections == 0
+    assert stats.queued_requests == 0
+    assert stats.max_connections == 12
+
+    client.close()
+
+
+def test_pool_stats_without_http_client():
+    stats = Client(token="test_token").pool_stats()
+
+    assert stats.connections == 0
+    assert stats.max_connections is None
+
+
+def test_per_host_limit_caps_concurrency():
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return httpx.Response(200, json={})
+
+    transport = PerHostLimitTransport(httpx.MockTransport(handler), max_per_host=3)
+    http_client = httpx.Client(transport=transport)
+
+    threads = [
+        threading.Thread(target=http_client.get, args=("https://api.zoo.dev/ping",))
+        for _ in range(12)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 3
+    assert transport.in_flight_by_host() == {}
+
+
+class _ChunkStream(httpx.SyncByteStream):
+    def __iter__(self):
+        yield b"abc"
+
+
+def test_per_host_limit_holds_slot_until_stream_closed():
+    transport = PerHostLimitTransport(
+        httpx.MockTransport(lambda request: httpx.Response(200, stream=_ChunkStream())),
+        max_per_host=1,
+    )
+    http_client = httpx.Client(transport=transport)
+
+    with http_client.stream("GET", "https://api.zoo.dev/file") as response:
+        assert transport.in_flight_by_host() == {"api.zoo.dev": 1}
+        response.read()
+
+    assert transport.in_flight_by_host() == {}
+
+
+@pytest.mark.asyncio
+async def test_async_pool_limits_passed_through():
+    client = AsyncKittyCAD(
+        token="test_token", max_connections=32, max_connections_per_host=4
+    )
+    http_client = client.get_http_client()
+
+    assert isinstance(http_client._transport, AsyncPerHostLimitTransport)
+    assert _pool(http_client)._max_connections == 32
+    assert client.pool_stats().max_connections == 32
+
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_per_host_limit_caps_concurrency():
+    active = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return httpx.Response(200, json={})
+
+    transport = AsyncPerHostLimitTransport(httpx.MockTransport(handler), max_per_host=2)
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        await asyncio.gather(
+            *(http_client.get("https://api.zoo.dev/ping") for _ in range(10))
+        )
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_async_with_limits():
+    client = AsyncClient(token="test_token")
+
+    tuned = client.with_limits(keepalive_expiry=60.0)
+
+    assert tuned.keepalive_expiry == 60.0
+    assert tuned.http_client is None
+
+
+def _mount(http_client, url):
+    for pattern, transport in http_client._mounts.items():
+        if pattern.matches(httpx.URL(url)):
+            return True, transport
+    return False, None
+
+
+def _proxy_pool(transport):
+    return getattr(list(iter_transports(transport))[-1], "_pool")
+
+
+def test_environment_proxies_are_honoured(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+    monkeypatch.setenv("NO_PROXY", "localhost")
+    client = Client(token="test_token", retry_policy=RetryPolicy())
+    http_client = client.get_http_client()
+
+    matched, transport = _mount(http_client, "https://api.zoo.dev/user")
+    assert matched
+    # The proxy transport carries the same SDK stack as the direct one.
+    assert isinstance(transport, RetryTransport)
+    pool = _proxy_pool(transport)
+    assert isinstance(pool, httpcore.HTTPProxy)
+    assert pool._proxy_url.host == b"proxy.internal"
+
+    matched, transport = _mount(http_client, "https://localhost/user")
+    assert matched and transport is None
+    client.close()
+
+
+def test_custom_transport_skips_environment_proxies(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+    client = Client(
+        token="test_token",
+        transport=httpx.MockTransport(lambda request: httpx.Response(200)),
+    )
+    assert client.get_http_client()._mounts == {}
+
+
+@pytest.mark.asyncio
+async def test_async_explicit_proxy(monkeypatch):
+    monkeypatch.delenv("HTTPS_PROXY", raising=False)
+    client = AsyncClient(
+        token="test_token",
+        proxy="http://proxy.internal:3128",
+        retry_policy=RetryPolicy(),
+    )
+    http_client = client.get_http_client()
+    matched, transport = _mount(http_client, "http://api.zoo.dev/user")
+    assert matched
+    assert isinstance(transport, AsyncRetryTransport)
+    assert isinstance(_proxy_pool(transport), httpcore.AsyncHTTPProxy)
+    await client.aclose()
@@ -0,0 +1,215 @@
+"""Tests for multi-endpoint routing and failover."""
+
+import time
+from typing import Dict, List, Set
+
+import httpx
+import pytest
+
+from kittycad import AsyncKittyCAD, KittyCAD
+from kittycad._transport import iter_transports
+from kittycad.failover import ENDPOINT_EXTENSION, EndpointRouter, FailoverTransport
+
+A = "https://a.example"
+B = "https://b.example"
+
+
+class Hosts:
+    """A mock API served from several hosts, some of which can be made to fail."""
+
+    def __init__(self) -> None:
+        self.seen: List[str] = []
+        self.down: Set[str] = set()
+        self.status: Dict[str, int] = {}
+        self.hosts: List[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        self.seen.append(host)
+        self.hosts.append(request.headers["host"])
+        if host in self.down:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(self.status.get(host, 200), json={"message": "pong"})
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _client(hosts, router, cls=KittyCAD):
+    return cls(
+        token="t", base_url=A, router=router, transport=httpx.MockTransport(hosts)
+    )
+
+
+def test_routes_to_the_lowest_latency_endpoint():
+    hosts = Hosts()
+    router = EndpointRouter([A, B])
+    client = _client(hosts, router)
+    router.record_success(A, 0.5)
+    router.record_success(B, 0.01)
+
+    response = client.get_http_client().get(f"{A}/ping")
+
+    assert hosts.seen == ["b.example"]
+    assert hosts.hosts == ["b.example"]
+    assert response.extensions[ENDPOINT_EXTENSION] == B
+    assert client.meta.ping().message == "pong"
+
+
+def test_unmeasured_endpoints_are_tried_in_order():
+    hosts = Hosts()
+    client = _client(hosts, EndpointRouter([A, B]))
+
+    client.meta.ping()
+    client.meta.ping()
+
+    assert hosts.seen == ["a.example", "b.example"]
+
+
+def test_idempotent_requests_fail_over():
+    hosts = Hosts()
+    hosts.down.add("a.example")
+    router = EndpointRouter([A, B])
+    client = _client(hosts, router)
+
+    assert client.meta.ping().message == "pong"
+
+    assert hosts.seen == ["a.example", "b.example"]
+    stats = {s.url: s for s in router.stats()}
+    assert stats[A].failures == 1 and stats[A].healthy
+    assert stats[B].failures == 0 and stats[B].latency is not None
+
+
+def test_unavailable_status_fails_over_gets_only():
+    hosts = Hosts()
+    hosts.status["a.example"] = 503
+    client = _client(hosts, EndpointRouter([A, B]))
+
+    assert client.get_http_client().get(f"{A}/ping").status_code == 200
+    response = client.get_http_client().post(f"{A}/things", json={})
+
+    assert response.status_code == 503
+    assert hosts.seen == ["a.example", "b.example", "a.example"]
+
+
+def test_unsent_post_fails_over_but_sent_one_does_not():
+    sent: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.url.host)
+        if request.url.host == "a.example":
+            if request.url.path == "/unsent":
+                raise httpx.ConnectError("refused", request=request)
+            raise httpx.ReadError("reset", request=request)
+        return httpx.Response(200, json={})
+
+    client = KittyCAD(
+        token="t",
+        base_url=A,
+        router=EndpointRouter([A, B]),
+        transport=httpx.MockTransport(handler),
+    )
+
+    assert client.get_http_client().post(f"{A}/unsent", json={}).status_code == 200
+    with pytest.raises(httpx.ReadError):
+        client.get_http_client().post(f"{A}/sent", json={})
+    assert sent == ["a.example", "b.example", "a.example"]
+
+
+def test_failing_endpoint_is_ejected_until_it_recovers():
+    hosts = Hosts()
+    hosts.down.add("a.example")
+    clock = Clock()
+    router = EndpointRouter([A, B], failure_threshold=2, eject_for=10.0, clock=clock)
+    client = _client(hosts, router)
+
+    for _ in range(4):
+        client.meta.ping()
+
+    assert hosts.seen == ["a.example", "b.example"] * 2 + ["b.example"] * 2
+    assert [s.healthy for s in router.stats()] == [False, True]
+
+    # A successful probe brings it back before the ejection ends.
+    hosts.down.clear()
+    [transport] = [
+        t
+        for t in iter_transports(client.get_http_client()._transport)
+        if isinstance(t, FailoverTransport)
+    ]
+    transport.probe()
+    assert [s.healthy for s in router.stats()] == [True, True]
+
+    # So does waiting it out.
+    router.record_failure(A)
+    router.record_failure(A)
+    assert not router.stats()[0].healthy
+    clock.now += 10.0
+    assert router.stats()[0].healthy
+
+
+def test_background_probes():
+    hosts = Hosts()
+    router = EndpointRouter([A, B], probe_interval=0.02)
+    client = _client(hosts, router)
+
+    client.meta.ping()
+    time.sleep(0.2)
+    client.close()
+    probes = len(hosts.seen)
+    time.sleep(0.1)
+
+    assert probes > 5
+    assert len(hosts.seen) == probes
+    assert all(s.latency is not None for s in router.stats())
+
+
+def test_other_base_urls_are_not_routed():
+    hosts = Hosts()
+    client = _client(hosts, EndpointRouter([A, B])).with_base_url("https://c.example")
+
+    client.meta.ping()
+
+    assert hosts.seen == ["c.example"]
+
+
+def test_websockets_are_sticky():
+    hosts = Hosts()
+    clock = Clock()
+    router = EndpointRouter([A, B], failure_threshold=1, clock=clock)
+    client = _client(hosts, router)
+    router.record_success(A, 0.5)
+    router.record_success(B, 0.01)
+
+    def connect(url, **kwargs):
+        return url
+
+    ws_url = "wss://a.example/ws/modeling/commands?fps=30"
+    assert client.get_websocket_connect(connect)(ws_url) == (
+        "wss://b.example/ws/modeling/commands?fps=30"
+    )
+    # A faster A doesn't move websockets off B...
+    router.record_success(A, 0.0)
+    router.record_success(A, 0.0)
+    assert client.get_websocket_connect(connect)(ws_url).startswith("wss://b.")
+    # ...but B going down does.
+    router.record_failure(B)
+    assert client.get_websocket_connect(connect) is connect
+
+
+@pytest.mark.asyncio
+async def test_async_failover():
+    hosts = Hosts()
+    hosts.down.add("a.example")
+    router = EndpointRouter([A, B], failure_threshold=1, probe_interval=0.02)
+    client = _client(hosts, router, AsyncKittyCAD)
+
+    assert (await client.meta.ping()).message == "pong"
+    assert (await client.meta.ping()).message == "pong"
+    await client.aclose()
+
+    assert hosts.seen[:3] == ["a.example", "b.example", "b.example"]
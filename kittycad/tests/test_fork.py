@@ -0,0 +1,144 @@
+"""Tests for using clients across forks and in process pools."""
+
+import functools
+import http.server
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
+
+import httpx
+import pytest
+
+from kittycad import KittyCAD, workers
+from kittycad.timing import get_timing
+from kittycad.workers import init_worker_client, worker_client
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+
+
+def _pong(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"message": "pong"})
+
+
+def _in_child(check) -> str:
+    """Run ``check`` in a forked child; return what it returned or raised."""
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read)
+        try:
+            result = str(check())
+        except BaseException as e:
+            result = f"{type(e).__name__}: {e}"
+        os.write(write, result.encode())
+        os._exit(0)
+    os.close(write)
+    with os.fdopen(read, "rb") as f:
+        result = f.read().decode()
+    os.waitpid(pid, 0)
+    return result
+
+
+def _client():
+    return KittyCAD(token="t", transport=httpx.MockTransport(_pong))
+
+
+def test_child_drops_the_inherited_pool():
+    client = _client()
+    derived = client.with_headers({"X-Org": "a"})
+    inherited = client.get_http_client()
+    derived.meta.ping()
+
+    def check():
+        assert client.http_client is None
+        assert not inherited.is_closed
+        assert derived.meta.ping().message == "pong"
+        assert client.get_http_client() is derived.get_http_client()
+        assert client.get_http_client() is not inherited
+        assert client.shared_http_client.refs == 2
+        return "ok"
+
+    assert _in_child(check) == "ok"
+    assert not inherited.is_closed
+    assert client.get_http_client() is inherited
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"message":"pong"}'
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[str]:
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_child_does_not_reuse_parent_connections(server):
+    client = KittyCAD(token="t", base_url=server, timing_sample_rate=1.0)
+    client.get_http_client().get(f"{server}/ping")
+
+    def check():
+        response = client.get_http_client().get(f"{server}/ping")
+        timing = get_timing(response)
+        assert timing is not None
+        return timing.reused_connection
+
+    assert _in_child(check) == "False"
+    # The parent's keep-alive connection survived the child.
+    response = client.get_http_client().get(f"{server}/ping")
+    timing = get_timing(response)
+    assert response.json() == {"message": "pong"}
+    assert timing is not None and timing.reused_connection is True
+    client.close()
+
+
+def _ping_from_worker(_):
+    client = worker_client(KittyCAD)
+    return os.getpid(), id(client), client.meta.ping().message
+
+
+def test_process_pool_workers_reuse_one_client_each():
+    factory = functools.partial(
+        KittyCAD, token="t", transport=httpx.MockTransport(_pong)
+    )
+    with ProcessPoolExecutor(
+        2,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=init_worker_client,
+        initargs=(factory,),
+    ) as pool:
+        results = list(pool.map(_ping_from_worker, range(20)))
+
+    clients_per_process: dict = {}
+    for pid, client_id, message in results:
+        assert message == "pong"
+        clients_per_process.setdefault(pid, set()).add(client_id)
+    assert all(len(ids) == 1 for ids in clients_per_process.values())
+
+
+def test_worker_client_errors(monkeypatch):
+    monkeypatch.setattr(workers, "_client", None)
+    with pytest.raises(RuntimeError, match="initializer"):
+        worker_client(KittyCAD)
+
+    init_worker_client(functools.partial(KittyCAD, token="t"))
+    assert isinstance(worker_client(KittyCAD), KittyCAD)
+    with pytest.raises(TypeError, match="not a"):
+        worker_client(httpx.Client)  # type: ignore[type-var]
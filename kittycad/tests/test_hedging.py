@@ -0,0 +1,220 @@
+"""Tests for hedged requests."""
+
+import asyncio
+import threading
+import time
+from typing import List, Optional
+
+import httpx
+import pytest
+
+from kittycad import AsyncKittyCAD, KittyCAD
+from kittycad.hedging import HEDGE_EXTENSION, HedgeBudget, Hedger
+
+
+class Slow:
+    """A mock API whose Nth request (from 1) stalls for ``stall`` seconds."""
+
+    def __init__(self, stall: float = 0.0, slow: int = 0) -> None:
+        self.stall = stall
+        self.slow = slow
+        self.calls = 0
+        self.finished: List[int] = []
+        self.lock = threading.Lock()
+
+    def _next(self) -> int:
+        with self.lock:
+            self.calls += 1
+            return self.calls
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        call = self._next()
+        if call == self.slow:
+            time.sleep(self.stall)
+        self.finished.append(call)
+        return httpx.Response(200, json={"message": f"pong {call}"})
+
+
+class GatedHedger(Hedger):
+    """A hedger whose ``decided`` event is set once each hedge is decided.
+
+    Handlers that wait for it keep the primary attempt outstanding until the
+    caller has given up on it, however slowly the threads get scheduled.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.decided = threading.Event()
+
+    def delay_for(self, key: str) -> Optional[float]:
+        self.decided.clear()
+        return super().delay_for(key)
+
+    def try_hedge(self) -> bool:
+        try:
+            return super().try_hedge()
+        finally:
+            self.decided.set()
+
+
+def _warm(hedger, key="ping", latency=0.01, count=20):
+    for _ in range(count):
+        hedger.record(key, latency)
+
+
+def _client(handler, hedger, cls=KittyCAD):
+    return cls(token="t", hedger=hedger, transport=httpx.MockTransport(handler))
+
+
+def test_not_hedged_until_latencies_are_known():
+    api = Slow()
+    hedger = Hedger(min_samples=5)
+    client = _client(api, hedger)
+
+    for _ in range(5):
+        client.meta.ping()
+
+    assert api.calls == 5
+    stats = hedger.stats()
+    assert stats.requests == 5 and stats.hedged == 0
+    assert hedger.delay_for("ping") is not None
+
+
+def test_slow_request_is_hedged_and_the_hedge_wins():
+    release = threading.Event()
+    calls: List[int] = []
+
+    def handler(request):
+        calls.append(len(calls) + 1)
+        if len(calls) == 1:
+            # The primary stalls until the test is done with the response.
+            assert release.wait(5)
+        return httpx.Response(200, json={"message": f"pong {len(calls)}"})
+
+    hedger = Hedger(percentile=50)
+    # Requests without an operation are keyed by method and path.
+    _warm(hedger, key="GET /ping")
+    client = _client(handler, hedger)
+
+    response = client.get_http_client().get("https://api.zoo.dev/ping")
+    release.set()
+
+    assert response.json() == {"message": "pong 2"}
+    assert response.extensions[HEDGE_EXTENSION] == "hedge"
+    stats = hedger.stats()
+    assert (stats.hedged, stats.hedge_wins, stats.win_rate) == (1, 1, 1.0)
+
+
+def test_fast_request_is_not_hedged():
+    api = Slow()
+    hedger = Hedger()
+    _warm(hedger, latency=0.2)
+    client = _client(api, hedger)
+
+    assert client.meta.ping().message == "pong 1"
+    assert api.calls == 1
+    assert hedger.stats().hedged == 0
+
+
+def test_only_idempotent_methods_and_chosen_operations():
+    api = Slow(stall=0.1, slow=1)
+    hedger = Hedger(operations={"get_user_self"})
+    _warm(hedger, key="ping", latency=0.0)
+    _warm(hedger, key="POST /things", latency=0.0)
+    client = _client(api, hedger)
+
+    client.meta.ping()
+    client.get_http_client().post("https://api.zoo.dev/things", json={})
+
+    assert api.calls == 2
+    assert hedger.stats().requests == 0
+
+
+def test_budget_caps_hedges():
+    calls: List[int] = []
+
+    def handler(request):
+        calls.append(1)
+        assert hedger.decided.wait(5)
+        return httpx.Response(200, json={"message": "pong"})
+
+    hedger = GatedHedger(max_delay=0.001, budget=HedgeBudget(ratio=0.0, min_hedges=2))
+    _warm(hedger)
+    client = _client(handler, hedger)
+
+    for _ in range(5):
+        client.meta.ping()
+
+    stats = hedger.stats()
+    assert (stats.hedged, stats.over_budget) == (2, 3)
+    assert len(calls) == 7
+
+
+def test_failed_attempt_falls_back_to_the_other():
+    calls: List[int] = []
+    failed = threading.Event()
+
+    def handler(request):
+        calls.append(len(calls) + 1)
+        if len(calls) == 1:
+            # The primary fails first, but only once the hedge is on its way.
+            assert hedger.decided.wait(5)
+            failed.set()
+            raise httpx.ReadError("reset", request=request)
+        assert failed.wait(5)
+        return httpx.Response(200, json={"message": "pong"})
+
+    hedger = GatedHedger(max_delay=0.01)
+    _warm(hedger)
+    client = _client(handler, hedger)
+
+    assert client.meta.ping().message == "pong"
+    assert hedger.stats().hedge_wins == 1
+
+
+@pytest.mark.asyncio
+async def test_async_hedge_cancels_the_loser():
+    cancelled = asyncio.Event()
+    calls: List[int] = []
+
+    class Transport(httpx.AsyncBaseTransport):
+        async def handle_async_request(self, request):
+            calls.append(len(calls) + 1)
+            if len(calls) == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return httpx.Response(200, json={"message": f"pong {len(calls)}"})
+
+    hedger = Hedger()
+    _warm(hedger, key="GET /ping")
+    client = AsyncKittyCAD(token="t", hedger=hedger, transport=Transport())
+
+    response = await client.get_http_client().get("https://api.zoo.dev/ping")
+
+    assert response.extensions[HEDGE_EXTENSION] == "hedge"
+    assert cancelled.is_set()
+    assert hedger.stats().hedge_wins == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_fast_primary_wins():
+    api = Slow()
+    hedger = Hedger()
+    _warm(hedger, latency=0.5)
+    client = _client(api, hedger, AsyncKittyCAD)
+
+    assert (await client.meta.ping()).message == "pong 1"
+    assert api.calls == 1
+    await client.aclose()
+
+
+def test_with_hedger():
+    hedger = Hedger()
+    client = KittyCAD(token="t").with_hedger(hedger)
+    assert client.hedger is hedger
+    with pytest.raises(ValueError):
+        Hedger(percentile=100)
@@ -0,0 +1,161 @@
+"""Tests for the incremental API call history sync."""
+
+import datetime
+import uuid
+from typing import Any, Dict, List, Optional
+
+import httpx
+import pytest
+
+from kittycad import AsyncKittyCAD, KittyCAD
+from kittycad.exceptions import KittyCADServerError
+from kittycad.history import ApiCallHistory, EndpointDayCost
+
+EPOCH = datetime.datetime(2026, 3, 1, tzinfo=datetime.timezone.utc)
+
+
+def _call(minute: int, endpoint: str = "/ping", **fields: Any) -> Dict[str, Any]:
+    created = EPOCH + datetime.timedelta(minutes=minute)
+    call = {
+        "id": str(uuid.UUID(int=minute)),
+        "created_at": created.isoformat(),
+        "updated_at": created.isoformat(),
+        "started_at": created.isoformat(),
+        "completed_at": (created + datetime.timedelta(seconds=minute % 10)).isoformat(),
+        "endpoint": endpoint,
+        "method": "GET",
+        "price": 0.5,
+        "token": str(uuid.UUID(int=1)),
+        "user_agent": "test",
+        "user_id": str(uuid.UUID(int=2)),
+    }
+    call.update(fields)
+    return call
+
+
+class Api:
+    """Serves ``calls`` newest first, ``limit`` per page, like /user/api-calls."""
+
+    def __init__(self, calls: List[Dict[str, Any]]) -> None:
+        self.calls = calls
+        self.requests: List[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        assert request.url.params["sort_by"] == "created_at_descending"
+        newest_first = sorted(self.calls, key=lambda c: c["created_at"], reverse=True)
+        start = int(request.url.params.get("page_token", 0))
+        end = start + int(request.url.params["limit"])
+        next_page: Optional[str] = str(end) if end < len(newest_first) else None
+        return httpx.Response(
+            200, json={"items": newest_first[start:end], "next_page": next_page}
+        )
+
+
+def _client(api, cls=KittyCAD):
+    return cls(token="t", transport=httpx.MockTransport(api))
+
+
+@pytest.fixture
+def history(tmp_path):
+    return ApiCallHistory(
+        str(tmp_path / "calls.db"), overlap=datetime.timedelta(0), page_size=10
+    )
+
+
+def test_first_sync_fetches_everything(history):
+    api = Api([_call(m) for m in range(25)])
+
+    report = history.sync(_client(api))
+
+    assert (report.pages, report.calls) == (3, 25)
+    assert report.high_water_mark == EPOCH + datetime.timedelta(minutes=24)
+    assert history.count() == 25
+
+
+def test_next_sync_stops_at_the_high_water_mark(history):
+    api = Api([_call(m) for m in range(25)])
+    client = _client(api)
+    history.sync(client)
+
+    api.calls += [_call(m) for m in range(25, 30)]
+    api.requests.clear()
+    report = history.sync(client)
+
+    # The newest page has the 5 new calls and reaches back past the mark.
+    assert len(api.requests) == 1
+    assert report.calls == 6  # the new calls plus the one at the mark
+    assert history.count() == 30
+    assert history.high_water_mark() == EPOCH + datetime.timedelta(minutes=29)
+
+
+def test_overlap_picks_up_late_updates(tmp_path):
+    history = ApiCallHistory(
+        str(tmp_path / "calls.db"), overlap=datetime.timedelta(minutes=5)
+    )
+    api = Api([_call(m, price=None) for m in range(10)])
+    client = _client(api)
+    history.sync(client)
+
+    api.calls = [_call(m, price=2.0) for m in range(10)]
+    report = history.sync(client)
+
+    assert report.calls == 6
+    [day] = history.cost_per_endpoint_day()
+    assert day.cost == 12.0
+
+
+def test_interrupted_sync_keeps_the_old_mark(history):
+    api = Api([_call(m) for m in range(10)])
+    client = _client(api)
+    history.sync(client)
+    api.calls += [_call(m) for m in range(10, 40)]
+
+    def flaky(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("page_token"):
+            return httpx.Response(500, json={"message": "boom"})
+        return api(request)
+
+    with pytest.raises(KittyCADServerError):
+        history.sync(_client(flaky))
+    assert history.high_water_mark() == EPOCH + datetime.timedelta(minutes=9)
+
+    history.sync(client)
+    assert history.count() == 40
+    assert history.high_water_mark() == EPOCH + datetime.timedelta(minutes=39)
+
+
+def test_local_aggregations(history):
+    calls = [_call(m, "/a") for m in range(3)]
+    calls += [_call(24 * 60 + m, "/b", price=1.0) for m in range(4)]
+    history.sync(_client(Api(calls)))
+
+    assert history.cost_per_endpoint_day() == [
+        EndpointDayCost(
+            day=datetime.date(2026, 3, 1), endpoint="/a", calls=3, cost=1.5
+        ),
+        EndpointDayCost(
+            day=datetime.date(2026, 3, 2), endpoint="/b", calls=4, cost=4.0
+        ),
+    ]
+    assert history.cost_per_endpoint_day(start=EPOCH + datetime.timedelta(days=1)) == [
+        EndpointDayCost(day=datetime.date(2026, 3, 2), endpoint="/b", calls=4, cost=4.0)
+    ]
+
+    # Latencies are minute % 10 seconds: /a 0, 1, 2; /b 0, 1, 2, 3.
+    assert history.latency_percentiles((50, 100), endpoint="/b") == {50: 1.0, 100: 3.0}
+    assert history.latency_percentiles((50,), endpoint="/c") == {50: None}
+
+
+@pytest.mark.asyncio
+async def test_async_sync(history):
+    api = Api([_call(m) for m in range(15)])
+    client = _client(api, AsyncKittyCAD)
+
+    report = await history.async_sync(client)
+    api.calls.append(_call(15))
+    again = await history.async_sync(client)
+
+    assert report.calls == 15
+    assert again.calls == 2
+    assert history.count() == 16
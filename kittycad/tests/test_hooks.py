@@ -0,0 +1,253 @@
+"""Tests for request lifecycle event hooks."""
+
+from typing import List
+
+import httpx
+import pytest
+
+from kittycad import AsyncKittyCAD, KittyCAD
+from kittycad._transport import OperationInfo
+from kittycad.hooks import (
+    EventHooks,
+    EventHookTransport,
+    RequestEvent,
+    connect_websocket_async,
+)
+from kittycad.retry import RetryPolicy
+
+FAST = RetryPolicy(backoff_base=0.0, jitter=0.0)
+
+
+def _recorder():
+    events: List[RequestEvent] = []
+    hooks = EventHooks()
+    for name in ("on_request_start", "on_response_headers", "on_response_end"):
+        hooks.register(name, events.append)
+    hooks.on_error(events.append)
+    hooks.on_retry(events.append)
+    return hooks, events
+
+
+def _pong(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"message": "pong"})
+
+
+def test_http_lifecycle_events():
+    hooks, events = _recorder()
+    client = KittyCAD(
+        token="t", transport=httpx.MockTransport(_pong), event_hooks=hooks
+    )
+
+    client.meta.ping()
+
+    assert [e.event for e in events] == [
+        "on_request_start",
+        "on_response_headers",
+        "on_response_end",
+    ]
+    for event in events:
+        assert event.operation_id == "ping"
+        assert event.tag == "meta"
+        assert event.url_template == "/ping"
+        assert event.method == "GET"
+        assert event.protocol == "http"
+        assert event.request_bytes == 0
+    end = events[-1]
+    assert end.status_code == 200
+    assert end.response_bytes == len(b'{"message":"pong"}')
+    assert end.ttfb is not None and end.duration is not None
+    assert end.duration >= end.ttfb
+
+
+def test_url_template_hides_ids():
+    hooks, events = _recorder()
+    client = KittyCAD(
+        token="t",
+        transport=httpx.MockTransport(lambda r: httpx.Response(404, json={})),
+        event_hooks=hooks,
+    )
+
+    with pytest.raises(Exception):
+        client.api_calls.get_api_call(id="secret-id")
+
+    assert {e.url_template for e in events} == {"/api-calls/{id}"}
+    assert events[-1].status_code == 404
+
+
+def test_streamed_body_is_counted_when_read():
+    hooks, events = _recorder()
+
+    class Chunked(httpx.BaseTransport):
+        def handle_request(self, request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, stream=httpx.ByteStream(b"x" * 10), request=request
+            )
+
+    http_client = httpx.Client(transport=EventHookTransport(Chunked(), hooks))
+    with http_client.stream("GET", "https://api.zoo.dev/raw") as response:
+        assert [e.event for e in events] == ["on_request_start", "on_response_headers"]
+        response.read()
+
+    assert events[-1].event == "on_response_end"
+    assert events[-1].response_bytes == 10
+    assert events[-1].url_template == "/raw"
+    assert events[-1].operation_id is None
+
+
+def test_transport_errors_are_reported():
+    hooks, events = _recorder()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    client = KittyCAD(
+        token="t", transport=httpx.MockTransport(handler), event_hooks=hooks
+    )
+
+    with pytest.raises(Exception):
+        client.meta.ping()
+
+    assert [e.event for e in events] == ["on_request_start", "on_error"]
+    assert isinstance(events[-1].error, httpx.ConnectError)
+
+
+def test_retries_are_reported():
+    hooks, events = _recorder()
+    statuses = [503, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0), json={"message": "pong"})
+
+    client = KittyCAD(
+        token="t",
+        transport=httpx.MockTransport(handler),
+        retry_policy=FAST,
+        event_hooks=hooks,
+    )
+
+    client.meta.ping()
+
+    retries = [e for e in events if e.event == "on_retry"]
+    assert len(retries) == 1
+    assert retries[0].attempt == 1
+    assert retries[0].status_code == 503
+    assert retries[0].operation_id == "ping"
+    # The hook transport wraps the retries, so the call is one exchange.
+    assert events[-1].event == "on_response_end"
+    assert events[-1].status_code == 200
+
+
+def test_hooks_are_optional_and_replaceable():
+    client = KittyCAD(token="t", transport=httpx.MockTransport(_pong))
+    assert not isinstance(client.get_http_client()._transport, EventHookTransport)
+
+    hooks, events = _recorder()
+    hooked = client.with_event_hooks(hooks)
+    assert isinstance(hooked, KittyCAD)
+    hooked.meta.ping()
+
+    assert hooked.event_hooks is hooks
+    assert len(events) == 3
+
+
+def test_unknown_event_is_rejected():
+    with pytest.raises(ValueError):
+        EventHooks().register("on_nothing", print)
+
+
+def test_websocket_events():
+    hooks, events = _recorder()
+
+    class FakeWS:
+        def send(self, data):
+            pass
+
+        def recv(self, timeout=None):
+            return '{"ok":true}'
+
+        def close(self):
+            pass
+
+    client = KittyCAD(token="t", base_url="https://example.com", event_hooks=hooks)
+    connection = client.executor.create_executor_term(
+        ws_factory=lambda *args, **kwargs: FakeWS()  # type: ignore[arg-type,return-value]
+    )
+    connection.send({"a": 1})
+    assert connection.recv() == {"ok": True}
+    connection.close()
+
+    assert [(e.event, e.method) for e in events] == [
+        ("on_request_start", "GET"),
+        ("on_response_headers", "GET"),
+        ("on_request_start", "SEND"),
+        ("on_response_end", "SEND"),
+        ("on_request_start", "RECV"),
+        ("on_response_end", "RECV"),
+        ("on_response_end", "CLOSE"),
+    ]
+    assert {e.protocol for e in events} == {"websocket"}
+    session = events[0].exchange_id
+    assert events[-1].exchange_id == session and events[-1].count == 2
+    assert {e.parent_id for e in events[2:6]} == {session}
+    assert {e.url_template for e in events} == {"/ws/executor/term"}
+    assert events[1].status_code == 101
+    assert events[2].request_bytes == len(b'{"a":1}')
+    assert events[-2].response_bytes == len(b'{"ok":true}')
+
+
+@pytest.mark.asyncio
+async def test_async_http_lifecycle_events():
+    hooks, events = _recorder()
+    client = AsyncKittyCAD(
+        token="t", transport=httpx.MockTransport(_pong), event_hooks=hooks
+    )
+
+    await client.meta.ping()
+
+    assert [e.event for e in events] == [
+        "on_request_start",
+        "on_response_headers",
+        "on_response_end",
+    ]
+    assert events[-1].operation_id == "ping"
+    assert events[-1].status_code == 200
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_websocket_events():
+    hooks, events = _recorder()
+
+    class FakeWS:
+        async def send(self, data):
+            pass
+
+        async def recv(self):
+            return b"\x00\x01"
+
+        async def close(self):
+            pass
+
+    async def factory(url, **kwargs):
+        return FakeWS()
+
+    operation = OperationInfo("ml_copilot_ws", "ml", "/ws/ml/copilot")
+    async with await connect_websocket_async(
+        hooks, operation, factory, "wss://x"
+    ) as ws:
+        await ws.send("hi")
+        assert await ws.recv() == b"\x00\x01"
+
+    assert [(e.event, e.method) for e in events] == [
+        ("on_request_start", "GET"),
+        ("on_response_headers", "GET"),
+        ("on_request_start", "SEND"),
+        ("on_response_end", "SEND"),
+        ("on_request_start", "RECV"),
+        ("on_response_end", "RECV"),
+        ("on_response_end", "CLOSE"),
+    ]
+    assert events[-2].response_bytes == 2
+    assert (
+        await connect_websocket_async(None, operation, factory, "wss://x") is not None
+    )
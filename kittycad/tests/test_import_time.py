@@ -0,0 +1,114 @@
+"""Import-time regression tests for the lazily-loaded models and API groups."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from kittycad import KittyCAD
+
+
+def _run(code: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+_MEASURE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+models = sum(1 for name in sys.modules if name.startswith("kittycad.models."))
+print(json.dumps({{"elapsed": elapsed, "models": models}}))
+"""
+
+
+def _measure(statement: str, runs: int = 3) -> dict:
+    results = [_run(_MEASURE.format(statement=statement)) for _ in range(runs)]
+    return min(results, key=lambda r: r["elapsed"])
+
+
+def test_import_does_not_load_models():
+    result = _measure("import kittycad", runs=1)
+    assert result["models"] == 0
+
+
+@pytest.mark.benchmark
+def test_lazy_import_is_faster_than_eager():
+    lazy = _measure("import kittycad")
+    eager = _measure("import kittycad; from kittycad.models import *")
+    assert eager["models"] > 100
+    assert lazy["elapsed"] < eager["elapsed"] / 2
+
+
+def test_model_still_importable_from_package():
+    result = _run(
+        "import json, sys\n"
+        "from kittycad import UnitLength\n"
+        "from kittycad.models import ApiCallStatus\n"
+        "loaded = sorted(n for n in sys.modules if n.startswith('kittycad.models.'))\n"
+        "print(json.dumps({'mm': UnitLength.MM.value, 'loaded': loaded}))"
+    )
+    assert result["mm"] == "mm"
+    assert result["loaded"] == [
+        "kittycad.models.api_call_status",
+        "kittycad.models.unit_length",
+    ]
+
+
+def test_unknown_attribute_raises():
+    import kittycad
+    import kittycad.models
+
+    for module in (kittycad, kittycad.models):
+        try:
+            module.NotAModel  # type: ignore[attr-defined]
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError(f"{module.__name__}.NotAModel should not exist")
+
+
+def test_api_groups_built_on_first_access():
+    client = KittyCAD(token="my-token")
+    assert "meta" not in vars(client)
+    meta = client.meta
+    assert client.meta is meta
+    assert "meta" in vars(client)
+
+
+def test_endpoint_lookup_does_not_load_models():
+    # Models are imported by the endpoint methods when they run.
+    result = _run(
+        "import json, sys\n"
+        "from kittycad import KittyCAD\n"
+        "KittyCAD(token='t').meta.get_schema\n"
+        "print(json.dumps({'models': sum(1 for n in sys.modules"
+        " if n.startswith('kittycad.models.'))}))"
+    )
+    assert result["models"] == 0
+
+
+def test_type_hints_resolve_without_importing_models_first():
+    result = _run(
+        "import json, sys, typing\n"
+        "import kittycad\n"
+        "before = sum(1 for n in sys.modules if n.startswith('kittycad.models.'))\n"
+        "hints = typing.get_type_hints(kittycad.UsersAPI.get_user_self)\n"
+        "update = typing.get_type_hints(kittycad.AsyncUsersAPI.update_user_self)\n"
+        "print(json.dumps({'before': before, 'ret': hints['return'].__name__,"
+        " 'body': update['body'].__name__}))"
+    )
+    assert result["before"] == 0
+    assert result["ret"] == "UserResponse"
+    assert result["body"] == "UpdateUser"
+
+
+def test_resolved_models_are_cached_on_the_package():
+    import kittycad
+
+    model = kittycad.UnitLength
+    assert vars(kittycad)["UnitLength"] is model
@@ -0,0 +1,145 @@
+"""Tests for page-level iteration, take() and adaptive page sizes."""
+
+import time
+from typing import Any, Dict, List, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from kittycad.pagination import AdaptivePageSize, AsyncPageIterator, SyncPageIterator
+
+
+class Item(BaseModel):
+    id: int
+
+
+class Page(BaseModel):
+    items: List[Item]
+    next_page: Optional[str] = None
+
+
+class Listing:
+    """A fake listing of ``total`` items served ``limit`` at a time (10 by default)."""
+
+    def __init__(self, total: int, seconds_per_item: float = 0.0) -> None:
+        self.total = total
+        self.seconds_per_item = seconds_per_item
+        self.calls: List[Dict[str, Any]] = []
+
+    def page(self, limit: int = 10, page_token: Optional[str] = None) -> Page:
+        self.calls.append({"limit": limit, "page_token": page_token})
+        start = int(page_token or 0)
+        end = min(self.total, start + limit)
+        return Page(
+            items=[Item(id=i) for i in range(start, end)],
+            next_page=str(end) if end < self.total else None,
+        )
+
+    def __call__(self, **kwargs) -> Page:
+        page = self.page(**kwargs)
+        time.sleep(self.seconds_per_item * len(page.items))
+        return page
+
+    async def fetch(self, **kwargs) -> Page:
+        return self.page(**kwargs)
+
+
+def test_pages_yield_whole_pages():
+    listing = Listing(25)
+    pages: List[Any] = list(SyncPageIterator(listing, {}).pages())
+
+    assert [len(page.items) for page in pages] == [10, 10, 5]
+    assert [page.next_page for page in pages] == ["10", "20", None]
+
+
+def test_take_stops_without_fetching_an_extra_page():
+    listing = Listing(100)
+    items: List[Item] = list(SyncPageIterator(listing, {"limit": 10}).take(20))
+
+    assert [item.id for item in items] == list(range(20))
+    assert len(listing.calls) == 2
+
+
+def test_take_lowers_the_last_limit():
+    listing = Listing(100)
+    items: List[Item] = list(SyncPageIterator(listing, {"limit": 10}).take(25))
+
+    assert len(items) == 25
+    assert [call["limit"] for call in listing.calls] == [10, 10, 5]
+
+
+def test_take_trims_an_oversized_page():
+    # No limit was passed, so the server's page size decides.
+    listing = Listing(100)
+    items: List[Item] = list(SyncPageIterator(listing, {}).take(3))
+
+    assert [item.id for item in items] == [0, 1, 2]
+    assert len(listing.calls) == 1
+
+
+def test_take_zero_fetches_nothing():
+    listing = Listing(100)
+    assert list(SyncPageIterator(listing, {}).take(0)) == []
+    assert listing.calls == []
+    with pytest.raises(ValueError):
+        SyncPageIterator(listing, {}).take(-1)
+
+
+def test_adaptive_grows_toward_the_max():
+    listing = Listing(1000)
+    iterator = SyncPageIterator(listing, {}).adaptive(
+        AdaptivePageSize(initial_limit=10, max_limit=100)
+    )
+
+    assert len(list(iterator)) == 1000
+    assert [call["limit"] for call in listing.calls[:5]] == [10, 20, 40, 80, 100]
+    assert len(listing.calls) == 13
+
+
+def test_adaptive_shrinks_slow_pages():
+    listing = Listing(200, seconds_per_item=0.002)
+    iterator = SyncPageIterator(listing, {"limit": 100}).adaptive(
+        AdaptivePageSize(target_latency=0.05, max_limit=100)
+    )
+
+    list(iterator)
+
+    limits = [call["limit"] for call in listing.calls]
+    assert limits[0] == 100
+    assert max(limits[1:]) <= 30
+
+
+def test_next_limit():
+    policy = AdaptivePageSize(target_latency=1.0, min_limit=5, max_limit=100)
+
+    assert policy.next_limit(20, 0.1) == 40
+    assert policy.next_limit(20, 0.0) == 40
+    assert policy.next_limit(80, 0.1) == 100
+    assert policy.next_limit(40, 2.0) == 20
+    assert policy.next_limit(10, 10.0) == 5
+    with pytest.raises(ValueError):
+        AdaptivePageSize(initial_limit=200, max_limit=100)
+
+
+def test_take_with_prefetch_fetches_only_what_is_needed():
+    listing = Listing(1000)
+    iterator = SyncPageIterator(listing, {"limit": 10}).take(30).prefetch(5)
+
+    assert len(list(iterator)) == 30
+    time.sleep(0.05)
+    assert len(listing.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_pages_take_and_adaptive():
+    listing = Listing(1000)
+    iterator = AsyncPageIterator(listing.fetch, {}).adaptive().take(70)
+
+    pages: List[Any] = [page async for page in iterator.pages()]
+    assert [len(page.items) for page in pages] == [20, 40, 10]
+
+    items: List[Item] = []
+    item: Item
+    async for item in AsyncPageIterator(listing.fetch, {}).take(5):
+        items.append(item)
+    assert [item.id for item in items] == [0, 1, 2, 3, 4]
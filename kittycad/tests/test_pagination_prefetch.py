@@ -0,0 +1,171 @@
+"""Tests for prefetching page iterators."""
+
+import asyncio
+import threading
+import time
+from typing import Any, List, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from kittycad._transport import OperationInfo
+from kittycad.hooks import EventHooks, RequestEvent
+from kittycad.pagination import AsyncPageIterator, SyncPageIterator
+
+
+class Item(BaseModel):
+    id: int
+
+
+class Page(BaseModel):
+    items: List[Item]
+    next_page: Optional[str] = None
+
+
+class Pages:
+    """A fake listing of ``count`` pages of two items, failing at page ``fail``."""
+
+    def __init__(self, count: int, delay: float = 0.0, fail: int = -1) -> None:
+        self.count = count
+        self.delay = delay
+        self.fail = fail
+        self.fetched: List[int] = []
+        self.lock = threading.Lock()
+
+    def page(self, page_token: Optional[str] = None) -> Page:
+        index = int(page_token or 0)
+        with self.lock:
+            self.fetched.append(index)
+        if index == self.fail:
+            raise RuntimeError(f"page {index} failed")
+        last = index == self.count - 1
+        return Page(
+            items=[Item(id=2 * index), Item(id=2 * index + 1)],
+            next_page=None if last else str(index + 1),
+        )
+
+    def __call__(self, **kwargs) -> Page:
+        time.sleep(self.delay)
+        return self.page(kwargs.get("page_token"))
+
+    async def fetch(self, **kwargs) -> Page:
+        await asyncio.sleep(self.delay)
+        return self.page(kwargs.get("page_token"))
+
+
+def test_yields_every_item_in_order():
+    pages = Pages(10)
+    iterator = SyncPageIterator(pages, {}).prefetch(3)
+
+    items: List[Item] = list(iterator)
+
+    assert [item.id for item in items] == list(range(20))
+    assert pages.fetched == list(range(10))
+    assert iterator._exhausted
+
+
+def test_overlaps_fetching_with_consuming():
+    pages = Pages(5, delay=0.05)
+
+    start = time.perf_counter()
+    for _ in SyncPageIterator(pages, {}, prefetch=2):
+        time.sleep(0.025)
+    elapsed = time.perf_counter() - start
+
+    # 5 * (0.05 + 2 * 0.025) = 0.5s one page at a time.
+    assert elapsed < 0.4
+
+
+def test_stays_at_most_depth_pages_ahead():
+    pages = Pages(20)
+    iterator: Any = iter(SyncPageIterator(pages, {}, prefetch=2))
+
+    next(iterator)
+    time.sleep(0.05)
+    # The page being consumed plus two ahead.
+    assert pages.fetched == [0, 1, 2]
+    next(iterator)
+    next(iterator)
+    time.sleep(0.05)
+    assert pages.fetched == [0, 1, 2, 3]
+    iterator.close()
+
+
+def test_stopping_early_stops_fetching():
+    pages = Pages(100, delay=0.01)
+
+    item: Item
+    for item in SyncPageIterator(pages, {}, prefetch=2):
+        if item.id == 3:
+            break
+    time.sleep(0.1)
+
+    assert len(pages.fetched) <= 4
+    assert not any(t.name == "kittycad-prefetch" for t in threading.enumerate())
+
+
+def test_error_surfaces_after_the_pages_before_it():
+    pages = Pages(10, fail=3)
+    seen: List[int] = []
+    item: Item
+    with pytest.raises(RuntimeError, match="page 3"):
+        for item in SyncPageIterator(pages, {}, prefetch=4):
+            seen.append(item.id)
+
+    assert seen == list(range(6))
+
+
+def test_hooks_see_one_exchange_with_child_pages():
+    events: List[RequestEvent] = []
+    hooks = EventHooks(on_response_end=[events.append])
+
+    iterator = SyncPageIterator(
+        Pages(3),
+        {},
+        event_hooks=hooks,
+        operation=OperationInfo("list", "things", "/things"),
+        prefetch=2,
+    )
+    list(iterator)
+
+    assert [(e.method, e.count) for e in events] == [("PAGINATE", 3)]
+
+
+def test_rejects_negative_depth():
+    with pytest.raises(ValueError):
+        SyncPageIterator(Pages(1), {}).prefetch(-1)
+
+
+@pytest.mark.asyncio
+async def test_async_prefetch():
+    pages = Pages(5, delay=0.05)
+
+    start = time.perf_counter()
+    seen: List[int] = []
+    item: Item
+    async for item in AsyncPageIterator(pages.fetch, {}).prefetch(2):
+        seen.append(item.id)
+        if item.id % 2:
+            await asyncio.sleep(0.05)
+    elapsed = time.perf_counter() - start
+
+    assert seen == list(range(10))
+    assert elapsed < 0.4
+
+
+@pytest.mark.asyncio
+async def test_async_error_and_cancellation():
+    pages = Pages(10, fail=2)
+    seen: List[int] = []
+    item: Item
+    with pytest.raises(RuntimeError, match="page 2"):
+        async for item in AsyncPageIterator(pages.fetch, {}, prefetch=3):
+            seen.append(item.id)
+    assert seen == [0, 1, 2, 3]
+
+    pages = Pages(100, delay=0.01)
+    iterator: Any = AsyncPageIterator(pages.fetch, {}, prefetch=2).__aiter__()
+    await iterator.__anext__()
+    await iterator.aclose()
+    await asyncio.sleep(0.05)
+    assert len(pages.fetched) <= 3
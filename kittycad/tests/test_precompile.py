@@ -0,0 +1,75 @@
+"""Tests for deferred model building (``KITTYCAD_DEFER_BUILD``)."""
+
+import json
+import os
+import subprocess
+import sys
+
+from kittycad.models import ModelingCmd, UnitLength
+from kittycad.precompile import build, is_built, precompile
+
+
+def _run(code: str, defer: bool) -> dict:
+    env = dict(os.environ, KITTYCAD_DEFER_BUILD="1" if defer else "0")
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def test_models_are_built_eagerly_by_default():
+    assert is_built(ModelingCmd)
+    assert build(["ModelingCmd", "WebSocketRequest"]) == []
+
+
+def test_deferred_models_build_on_first_use():
+    result = _run(
+        "import json\n"
+        "from kittycad.models import ModelingCmd, Pong\n"
+        "from kittycad.precompile import is_built\n"
+        "before = [is_built(ModelingCmd), is_built(Pong)]\n"
+        "cmd = ModelingCmd.model_validate({'type': 'start_path'})\n"
+        "print(json.dumps({'before': before, 'after': is_built(ModelingCmd),"
+        " 'type': cmd.root.type, 'pong': is_built(Pong)}))",
+        defer=True,
+    )
+    assert result == {
+        "before": [False, False],
+        "after": True,
+        "type": "start_path",
+        "pong": False,
+    }
+
+
+def test_precompile_hot_set_in_background():
+    result = _run(
+        "import json\n"
+        "from kittycad.models import Pong\n"
+        "from kittycad.precompile import is_built, precompile\n"
+        "thread = precompile(['WebSocketResponse', Pong])\n"
+        "thread.join()\n"
+        "print(json.dumps({'name': thread.name, 'built': [is_built('WebSocketResponse'),"
+        " is_built(Pong), is_built('ModelingCmd')]}))",
+        defer=True,
+    )
+    assert result == {"name": "kittycad-precompile", "built": [True, True, False]}
+
+
+def test_deferred_models_serialize_the_same():
+    code = (
+        "import json\n"
+        "from kittycad.models import ModelingCmd\n"
+        "cmd = ModelingCmd.model_validate({'type': 'move_path_pen', 'path': "
+        "'00000000-0000-0000-0000-000000000000', 'to': {'x': 1, 'y': 2, 'z': 3}})\n"
+        "print(json.dumps(cmd.model_dump(mode='json')))"
+    )
+    assert _run(code, defer=True) == _run(code, defer=False)
+
+
+def test_precompile_in_foreground():
+    assert precompile([ModelingCmd, "UnitLengthConversion"], background=False) is None
+    assert UnitLength.MM == "mm"
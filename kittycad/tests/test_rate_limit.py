@@ -0,0 +1,147 @@
+"""Tests for the client-side token-bucket rate limiter."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from kittycad import AsyncKittyCAD, KittyCAD
+from kittycad.exceptions import KittyCADClientError
+from kittycad.models import UserIdentifier
+from kittycad.rate_limit import RateLimiter, TokenBucket
+
+
+def _ok(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"message": "pong"})
+
+
+def test_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate=10.0, capacity=2)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    wait = bucket.reserve()
+
+    assert 0.05 < wait <= 0.1
+    stats = bucket.stats()
+    assert stats.acquired == 3
+    assert stats.delayed == 1
+    assert stats.max_wait == pytest.approx(wait)
+
+
+def test_bucket_rejects_invalid_settings():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, capacity=1)
+
+
+def test_paths_are_grouped_by_pattern():
+    limiter = RateLimiter(
+        default=(100.0, 100), groups={"/file/*": (1.0, 1), "/unit/*": (5.0, 5)}
+    )
+
+    assert limiter.group_for("/file/conversion/stl/obj") == "/file/*"
+    assert limiter.group_for("/unit/conversion/length/m/mm") == "/unit/*"
+    assert limiter.group_for("/ping") == "default"
+    assert RateLimiter(groups={"/file/*": (1.0, 1)}).group_for("/ping") is None
+
+
+def test_every_endpoint_passes_through_limiter():
+    limiter = RateLimiter(groups={"/ping": (50.0, 1)})
+    client = KittyCAD(
+        token="t", transport=httpx.MockTransport(_ok), rate_limiter=limiter
+    )
+
+    for _ in range(3):
+        client.meta.ping()
+
+    stats = limiter.stats()["/ping"]
+    assert stats.acquired == 3
+    assert stats.delayed == 2
+    assert stats.total_wait > 0
+
+
+def test_generated_requests_match_on_url_template():
+    limiter = RateLimiter(default=(100.0, 100), groups={"/users/{id}": (50.0, 1)})
+    client = KittyCAD(
+        token="t",
+        transport=httpx.MockTransport(lambda request: httpx.Response(404, json={})),
+        rate_limiter=limiter,
+    )
+
+    for user in ("alice", "bob"):
+        with pytest.raises(KittyCADClientError):
+            client.users.get_user(id=UserIdentifier(user))
+    # Requests without an operation fall back to the concrete path.
+    client.get_http_client().get("https://api.zoo.dev/users/carol")
+
+    stats = limiter.stats()
+    assert stats["/users/{id}"].acquired == 2
+    assert stats["default"].acquired == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_wait_refunds_token():
+    limiter = RateLimiter(default=(1.0, 1))
+    assert limiter.reserve("/ping") == 0.0
+
+    waiter = asyncio.create_task(limiter.acquire_async("/ping"))
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    # Only the first reservation is outstanding, so the next wait is ~1s, not ~2s.
+    assert 0.9 < limiter.reserve("/ping") <= 1.0
+    stats = limiter.stats()["default"]
+    assert stats.acquired == 2
+    assert stats.delayed == 1
+
+
+def test_limiter_shared_across_threads_enforces_rate():
+    limiter = RateLimiter(default=(50.0, 1))
+    client = KittyCAD(
+        token="t", transport=httpx.MockTransport(_ok), rate_limiter=limiter
+    )
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=client.meta.ping) for _ in range(11)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - start
+
+    # 1 burst token, then 10 more at 50/s -> at least ~0.2s.
+    assert elapsed >= 0.18
+    assert limiter.stats()["default"].acquired == 11
+
+
+@pytest.mark.asyncio
+async def test_limiter_shared_between_sync_and_async_clients():
+    limiter = RateLimiter(default=(20.0, 1))
+    sync_client = KittyCAD(
+        token="t", transport=httpx.MockTransport(_ok), rate_limiter=limiter
+    )
+    async_client = AsyncKittyCAD(
+        token="t", transport=httpx.MockTransport(_ok), rate_limiter=limiter
+    )
+
+    sync_client.meta.ping()
+    await asyncio.gather(*(async_client.meta.ping() for _ in range(4)))
+
+    stats = limiter.stats()["default"]
+    assert stats.acquired == 5
+    assert stats.delayed >= 4
+    await async_client.aclose()
+
+
+def test_websocket_connects_pass_through_limiter():
+    limiter = RateLimiter(groups={"/ws/*": (1000.0, 5)})
+    client = KittyCAD(token="t", rate_limiter=limiter)
+
+    client.modeling.modeling_commands_ws(ws_factory=MagicMock())
+
+    assert limiter.stats()["/ws/*"].acquired == 1
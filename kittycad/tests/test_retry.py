@@ -0,0 +1,242 @@
+"""Tests for the retry policy and retrying transports."""
+
+import io
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from kittycad import AsyncKittyCAD, KittyCAD
+from kittycad.exceptions import KittyCADServerError
+from kittycad.retry import RetryBudget, RetryPolicy, RetryTransport, parse_retry_after
+
+FAST = RetryPolicy(backoff_base=0.0, jitter=0.0)
+
+
+def _flaky(statuses, calls):
+    """Handler answering with the given statuses, then 200 with a pong."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) <= len(statuses):
+            return httpx.Response(statuses[len(calls) - 1], json={"message": "busy"})
+        return httpx.Response(200, json={"message": "pong"})
+
+    return handler
+
+
+def test_get_is_retried_until_success():
+    calls: list = []
+    client = KittyCAD(
+        token="t",
+        transport=httpx.MockTransport(_flaky([503, 429], calls)),
+        retry_policy=FAST,
+    )
+
+    pong = client.meta.ping()
+
+    assert pong.message == "pong"
+    assert len(calls) == 3
+
+
+def test_exhausted_retries_record_attempts_on_error():
+    calls: list = []
+    client = KittyCAD(
+        token="t",
+        transport=httpx.MockTransport(_flaky([502, 502, 502, 502], calls)),
+        retry_policy=FAST,
+    )
+
+    with pytest.raises(KittyCADServerError) as exc_info:
+        client.meta.ping()
+
+    assert len(calls) == 3
+    attempts = exc_info.value.attempts
+    assert [a.attempt for a in attempts] == [1, 2, 3]
+    assert all(a.status_code == 502 for a in attempts)
+    assert all(a.duration >= 0 for a in attempts)
+
+
+def test_no_retry_without_policy():
+    calls: list = []
+    client = KittyCAD(token="t", transport=httpx.MockTransport(_flaky([503], calls)))
+
+    with pytest.raises(KittyCADServerError) as exc_info:
+        client.meta.ping()
+
+    assert len(calls) == 1
+    assert exc_info.value.attempts == []
+
+
+def test_post_not_retried_unless_marked_safe():
+    calls: list = []
+    client = KittyCAD(
+        token="t",
+        transport=httpx.MockTransport(_flaky([503], calls)),
+        retry_policy=FAST,
+    )
+
+    response = client.get_http_client().post("https://api.zoo.dev/thing", content=b"{}")
+
+    assert response.status_code == 503
+    assert len(calls) == 1
+
+
+def test_post_retried_when_operation_marked_safe():
+    from kittycad._transport import OPERATION_EXTENSION, OperationInfo
+
+    calls: list = []
+    client = KittyCAD(
+        token="t",
+        transport=httpx.MockTransport(_flaky([503], calls)),
+        retry_policy=FAST.mark_safe("create_thing"),
+    )
+    request = httpx.Request(
+        "POST",
+        "https://api.zoo.dev/thing",
+        content=b"{}",
+        extensions={
+            OPERATION_EXTENSION: OperationInfo("create_thing", "things", "/thing")
+        },
+    )
+
+    response = client.get_http_client().send(request)
+
+    assert response.status_code == 200
+    assert len(calls) == 2
+
+
+def test_connect_errors_are_retried():
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"message": "pong"})
+
+    client = KittyCAD(
+        token="t", transport=httpx.MockTransport(handler), retry_policy=FAST
+    )
+
+    assert client.meta.ping().message == "pong"
+    assert attempts == 2
+
+
+def test_exhausted_connect_retries_record_attempts_on_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    client = KittyCAD(
+        token="t", transport=httpx.MockTransport(handler), retry_policy=FAST
+    )
+
+    with pytest.raises(httpx.ConnectError) as exc_info:
+        client.meta.ping()
+
+    attempts = exc_info.value.attempts  # type: ignore[attr-defined]
+    assert [a.attempt for a in attempts] == [1, 2, 3]
+    assert all(a.error == "ConnectError: refused" for a in attempts)
+    assert "gave up after 3 attempt(s)" in exc_info.value.__notes__[-1]
+
+
+def test_seekable_upload_body_is_rewound():
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.read())
+        return httpx.Response(503 if len(bodies) == 1 else 200)
+
+    transport = RetryTransport(httpx.MockTransport(handler), FAST, sleep=lambda s: None)
+    upload = io.BytesIO(b"solid cube")
+    with httpx.Client(transport=transport) as http_client:
+        response = http_client.put("https://api.zoo.dev/upload", content=upload)
+
+    assert response.status_code == 200
+    assert bodies == [b"solid cube", b"solid cube"]
+
+
+def test_generator_body_is_not_replayed():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.read())
+        return httpx.Response(503)
+
+    def chunks():
+        yield b"once"
+
+    transport = RetryTransport(httpx.MockTransport(handler), FAST, sleep=lambda s: None)
+    with httpx.Client(transport=transport) as http_client:
+        response = http_client.put("https://api.zoo.dev/upload", content=chunks())
+
+    assert response.status_code == 503
+    assert len(calls) == 1
+
+
+def test_retry_after_seconds_and_dates():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("bogus") is None
+    future = datetime.now(timezone.utc) + timedelta(seconds=30)
+    delay = parse_retry_after(format_datetime(future, usegmt=True))
+    assert delay is not None and 25 < delay <= 30
+
+    response = httpx.Response(429, headers={"Retry-After": "7"})
+    assert RetryPolicy().backoff(1, response) == 7.0
+
+
+def test_retry_after_beyond_cap_is_returned_to_caller():
+    calls: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(429, headers={"Retry-After": "3600"})
+
+    transport = RetryTransport(httpx.MockTransport(handler), FAST, sleep=lambda s: None)
+    with httpx.Client(transport=transport) as http_client:
+        assert http_client.get("https://api.zoo.dev/ping").status_code == 429
+    assert len(calls) == 1
+
+
+def test_backoff_is_exponential_and_capped():
+    policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0, jitter=0.0)
+
+    assert [policy.backoff(n) for n in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 5.0]
+    jittered = RetryPolicy(backoff_base=1.0, jitter=1.0)
+    assert all(0.0 <= jittered.backoff(3) <= 4.0 for _ in range(50))
+
+
+def test_retry_budget_limits_retries():
+    budget = RetryBudget(ratio=0.0, min_retries=1)
+    calls: list = []
+    client = KittyCAD(
+        token="t",
+        transport=httpx.MockTransport(_flaky([503] * 10, calls)),
+        retry_policy=RetryPolicy(backoff_base=0.0, budget=budget),
+    )
+
+    with pytest.raises(KittyCADServerError):
+        client.meta.ping()
+    with pytest.raises(KittyCADServerError):
+        client.meta.ping()
+
+    # One retry for the first call, none left for the second.
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_get_is_retried():
+    calls: list = []
+    client = AsyncKittyCAD(
+        token="t",
+        transport=httpx.MockTransport(_flaky([504], calls)),
+        retry_policy=FAST,
+    )
+
+    pong = await client.meta.ping()
+
+    assert pong.message == "pong"
+    assert len(calls) == 2
+    await client.aclose()
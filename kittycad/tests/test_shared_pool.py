@@ -0,0 +1,111 @@
+"""Tests for sharing one connection pool between derived clients."""
+
+import gc
+from typing import Dict, List
+
+import httpx
+import pytest
+
+from kittycad import AsyncKittyCAD, KittyCAD
+from kittycad.retry import RetryPolicy
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.requests: List[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(200, json={"message": "pong"})
+
+
+def _client(handler, cls=KittyCAD):
+    return cls(token="t", transport=httpx.MockTransport(handler))
+
+
+def test_thousand_derived_clients_reuse_one_pool():
+    recorder = Recorder()
+    parent = _client(recorder)
+
+    for i in range(1000):
+        parent.with_headers({"X-Tenant": str(i)}).meta.ping()
+
+    assert parent.shared_http_client.created == 1
+    assert [r.headers["x-tenant"] for r in recorder.requests] == [
+        str(i) for i in range(1000)
+    ]
+    # The derived clients were collected, so only the parent could hold it.
+    gc.collect()
+    assert parent.shared_http_client.refs == 0
+    parent.meta.ping()
+    assert parent.shared_http_client.created == 1
+    parent.close()
+    assert parent.shared_http_client.http_client is None
+
+
+def test_derived_before_first_use_share_the_pool():
+    parent = _client(Recorder())
+    a = parent.with_base_url("https://a.example")
+    b = parent.with_headers({"X-Org": "b"})
+
+    assert a.get_http_client() is b.get_http_client() is parent.get_http_client()
+    assert parent.shared_http_client.refs == 3
+
+
+def test_closing_a_derived_client_keeps_the_pool_open():
+    parent = _client(Recorder())
+    http_client = parent.get_http_client()
+    derived = parent.with_headers({"X-Org": "a"})
+    derived.meta.ping()
+
+    derived.close()
+    assert not http_client.is_closed
+    parent.meta.ping()
+
+    parent.close()
+    assert http_client.is_closed
+
+
+def test_timeout_and_cookies_apply_per_request():
+    recorder = Recorder()
+    parent = _client(recorder)
+
+    parent.meta.ping()
+    parent.with_timeout(3.0).meta.ping()
+    parent.with_cookies({"session": "s1"}).meta.ping()
+
+    first, timed, cookied = recorder.requests
+    assert first.extensions["timeout"]["read"] == 120.0
+    assert timed.extensions["timeout"]["read"] == 3.0
+    assert "cookie" not in first.headers
+    assert cookied.headers["cookie"] == "session=s1"
+    assert parent.shared_http_client.created == 1
+
+
+def test_transport_changes_get_their_own_pool():
+    parent = _client(Recorder())
+    parent.meta.ping()
+
+    retrying = parent.with_retry_policy(RetryPolicy())
+    retrying.meta.ping()
+
+    assert retrying.shared_http_client is not parent.shared_http_client
+    assert retrying.get_http_client() is not parent.get_http_client()
+
+
+@pytest.mark.asyncio
+async def test_async_derived_clients_share_the_pool():
+    created: Dict[str, int] = {}
+    parent = _client(Recorder(), AsyncKittyCAD)
+    http_client = parent.get_http_client()
+
+    for i in range(100):
+        derived = parent.with_headers({"X-Tenant": str(i)})
+        await derived.meta.ping()
+        await derived.aclose()
+        created[str(i)] = parent.shared_http_client.created
+
+    assert set(created.values()) == {1}
+    assert not http_client.is_closed
+    await parent.aclose()
+    assert http_client.is_closed
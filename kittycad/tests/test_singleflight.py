@@ -0,0 +1,206 @@
+"""Tests for coalescing identical concurrent GETs."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from kittycad import AsyncKittyCAD, KittyCAD
+from kittycad.singleflight import SingleFlight
+
+
+def test_concurrent_threads_share_one_request_and_result():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        release.wait(5)
+        return httpx.Response(200, json={"message": "pong"})
+
+    client = KittyCAD(
+        token="t", transport=httpx.MockTransport(handler), single_flight=single_flight
+    )
+    results = []
+
+    def ping():
+        results.append(client.meta.ping())
+
+    threads = [threading.Thread(target=ping) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    while single_flight.stats().coalesced < 7:
+        threading.Event().wait(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["/ping"]
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+    assert single_flight.stats().requests == 1
+    assert single_flight.stats().coalesced == 7
+
+
+def test_sequential_calls_are_not_coalesced():
+    single_flight = SingleFlight()
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"message": "pong"})
+
+    client = KittyCAD(
+        token="t", transport=httpx.MockTransport(handler), single_flight=single_flight
+    )
+    first = client.meta.ping()
+    second = client.meta.ping()
+
+    assert len(calls) == 2
+    assert first is not second
+    assert single_flight.stats().coalesced == 0
+
+
+def test_requests_differ_by_auth_and_method():
+    def request(method, token):
+        return httpx.Request(
+            method,
+            "https://api.zoo.dev/user",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+    single_flight = SingleFlight()
+    key_for = single_flight.key_for
+    assert key_for(request("GET", "a")) == key_for(request("GET", "a"))
+    assert key_for(request("GET", "a")) != key_for(request("GET", "b"))
+    assert key_for(request("POST", "a")) is None
+
+
+def test_tenants_sharing_a_token_are_not_coalesced():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        tenant = f"{request.headers['x-org']}/{request.headers['cookie']}"
+        calls.append(tenant)
+        release.wait(5)
+        return httpx.Response(200, json={"message": tenant})
+
+    base = KittyCAD(
+        token="shared",
+        transport=httpx.MockTransport(handler),
+        single_flight=single_flight,
+    )
+    tenants = [
+        base.with_headers({"X-Org": "a"}).with_cookies({"session": "1"}),
+        base.with_headers({"X-Org": "a"}).with_cookies({"session": "2"}),
+        base.with_headers({"X-Org": "b"}).with_cookies({"session": "1"}),
+        # Same tenant as the first; only a volatile header differs.
+        base.with_headers({"X-Org": "a", "User-Agent": "other"}).with_cookies(
+            {"session": "1"}
+        ),
+    ]
+    results = [None] * len(tenants)
+
+    def ping(i):
+        results[i] = tenants[i].meta.ping().message
+
+    threads = [threading.Thread(target=ping, args=(i,)) for i in range(len(tenants))]
+    for thread in threads:
+        thread.start()
+    while single_flight.stats().requests + single_flight.stats().coalesced < 4:
+        threading.Event().wait(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(calls) == ["a/session=1", "a/session=2", "b/session=1"]
+    assert results == ["a/session=1", "a/session=2", "b/session=1", "a/session=1"]
+    assert single_flight.stats().coalesced == 1
+
+
+def test_errors_are_raised_in_every_waiter():
+    single_flight = SingleFlight()
+    release = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        release.wait(5)
+        raise httpx.ConnectError("boom", request=request)
+
+    client = KittyCAD(
+        token="t", transport=httpx.MockTransport(handler), single_flight=single_flight
+    )
+    errors = []
+
+    def ping():
+        try:
+            client.meta.ping()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=ping) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    while single_flight.stats().coalesced < 2:
+        threading.Event().wait(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tasks_share_one_request_and_result():
+    single_flight = SingleFlight()
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.headers["authorization"])
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"message": "pong"})
+
+    alice, bob = (
+        AsyncKittyCAD(
+            token=token,
+            transport=httpx.MockTransport(handler),
+            single_flight=single_flight,
+        )
+        for token in ("alice", "bob")
+    )
+
+    results = await asyncio.gather(
+        *(alice.meta.ping() for _ in range(5)),
+        *(bob.meta.ping() for _ in range(5)),
+    )
+
+    assert sorted(calls) == ["Bearer alice", "Bearer bob"]
+    assert all(result is results[0] for result in results[:5])
+    assert results[5] is not results[0]
+    assert single_flight.stats().coalesced == 8
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_waiters():
+    single_flight = SingleFlight()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json={"message": "pong"})
+
+    client = AsyncKittyCAD(
+        token="t", transport=httpx.MockTransport(handler), single_flight=single_flight
+    )
+    leader = asyncio.ensure_future(client.meta.ping())
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(client.meta.ping())
+    await asyncio.sleep(0.005)
+    leader.cancel()
+
+    result = await follower
+
+    assert result.message == "pong"
+    assert single_flight.stats().requests == 1
@@ -0,0 +1,251 @@
+"""Tests for the OpenTelemetry-compatible telemetry module."""
+
+import json
+import uuid
+
+import httpx
+import pytest
+
+from kittycad import AsyncKittyCAD, KittyCAD
+from kittycad.rate_limit import RateLimiter
+from kittycad.retry import RetryPolicy
+from kittycad.telemetry import (
+    BYTES_RECEIVED,
+    BYTES_SENT,
+    IN_FLIGHT,
+    RATE_LIMIT_WAIT,
+    REQUEST_DURATION,
+    RETRIES,
+    SESSION_DURATION,
+    WEBSOCKET_MESSAGES,
+    InMemoryCollector,
+    Telemetry,
+)
+
+NOW = "2024-01-01T00:00:00Z"
+PONG = b'{"message":"pong"}'
+
+
+def _client(handler, **kwargs):
+    collector = InMemoryCollector()
+    client = KittyCAD(
+        token="t",
+        transport=httpx.MockTransport(handler),
+        event_hooks=Telemetry(collector).instrument(),
+        **kwargs,
+    )
+    return client, collector
+
+
+def _pong(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, content=PONG)
+
+
+def _api_call(i: int):
+    return {
+        "completed_at": NOW,
+        "created_at": NOW,
+        "endpoint": "/ping",
+        "id": str(uuid.UUID(int=i)),
+        "method": "GET",
+        "status_code": 200,
+        "token": str(uuid.UUID(int=i)),
+        "updated_at": NOW,
+        "user_agent": "python-httpx",
+        "user_id": str(uuid.UUID(int=i)),
+    }
+
+
+def test_http_span_and_metrics():
+    client, collector = _client(_pong)
+
+    client.meta.ping()
+
+    [span] = collector.spans
+    assert span.name == "GET /ping"
+    assert span.kind == "CLIENT"
+    assert span.parent_span_id is None
+    assert len(span.trace_id) == 32 and len(span.span_id) == 16
+    assert span.attributes["http.request.method"] == "GET"
+    assert span.attributes["url.template"] == "/ping"
+    assert span.attributes["kittycad.operation_id"] == "ping"
+    assert span.attributes["http.response.status_code"] == 200
+    assert span.attributes["http.response.body.size"] == len(PONG)
+    assert span.status == "UNSET"
+    assert span.duration is not None and span.duration >= 0
+
+    ping = {"kittycad.operation_id": "ping"}
+    assert len(collector.observations(REQUEST_DURATION, ping)) == 1
+    assert collector.value(BYTES_RECEIVED, ping) == len(PONG)
+    assert collector.value(IN_FLIGHT) == 0
+
+
+def test_in_flight_while_streaming():
+    class Streaming(httpx.BaseTransport):
+        def handle_request(self, request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, stream=httpx.ByteStream(PONG), request=request)
+
+    collector = InMemoryCollector()
+    client = KittyCAD(
+        token="t",
+        transport=Streaming(),
+        event_hooks=Telemetry(collector).instrument(),
+    )
+
+    with client.get_http_client().stream("GET", "https://api.zoo.dev/raw") as r:
+        assert collector.value(IN_FLIGHT) == 1
+        r.read()
+    assert collector.value(IN_FLIGHT) == 0
+
+
+def test_error_statuses_and_exceptions_mark_spans():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/ping":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(404, json={"message": "nope"})
+
+    client, collector = _client(handler)
+    with pytest.raises(Exception):
+        client.meta.ping()
+    with pytest.raises(Exception):
+        client.api_calls.get_api_call(id="x")
+
+    refused, missing = collector.spans
+    assert refused.status == "ERROR"
+    assert refused.attributes["error.type"] == "ConnectError"
+    assert refused.events[-1].name == "exception"
+    assert missing.status == "ERROR"
+    assert missing.attributes["error.type"] == "404"
+    assert collector.value(IN_FLIGHT) == 0
+
+
+def test_retries_and_rate_limit_waits_are_counted():
+    statuses = [503, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0), content=PONG)
+
+    client, collector = _client(
+        handler,
+        retry_policy=RetryPolicy(backoff_base=0.0, jitter=0.0),
+        rate_limiter=RateLimiter(default=(1000.0, 1)),
+    )
+    client.meta.ping()
+
+    [span] = collector.spans
+    assert collector.value(RETRIES, {"kittycad.operation_id": "ping"}) == 1
+    assert [e.name for e in span.events if e.name == "retry"] == ["retry"]
+    # The retry had to wait for the (single-token) bucket to refill.
+    assert collector.value(RATE_LIMIT_WAIT) > 0
+
+
+def test_uploads_count_bytes_sent():
+    client, collector = _client(lambda r: httpx.Response(404, json={}))
+    with pytest.raises(Exception):
+        client.file.create_file_center_of_mass(
+            src_format="stl",  # type: ignore[arg-type]
+            body=b"x" * 100,
+        )
+    assert collector.value(BYTES_SENT) == 100
+
+
+def test_pagination_span_parents_page_spans():
+    pages = [
+        {"items": [_api_call(0)], "next_page": "p2"},
+        {"items": [_api_call(1)], "next_page": None},
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=json.dumps(pages.pop(0)).encode())
+
+    client, collector = _client(handler)
+    assert len(list(client.api_calls.user_list_api_calls())) == 2
+
+    *page_spans, run = collector.spans
+    assert run.name == "PAGINATE /user/api-calls"
+    assert run.kind == "INTERNAL"
+    assert run.attributes["kittycad.pages"] == 2
+    assert len(page_spans) == 2
+    for span in page_spans:
+        assert span.parent_span_id == run.span_id
+        assert span.trace_id == run.trace_id
+    assert len(collector.observations(SESSION_DURATION)) == 1
+
+
+def test_abandoned_pagination_still_ends():
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = {"items": [_api_call(0), _api_call(1)], "next_page": "more"}
+        return httpx.Response(200, content=json.dumps(page).encode())
+
+    client, collector = _client(handler)
+    iterator = iter(client.api_calls.user_list_api_calls())
+    next(iterator)
+    iterator.close()  # type: ignore[attr-defined]
+
+    assert (
+        collector.find("PAGINATE /user/api-calls")[0].attributes["kittycad.pages"] == 1
+    )
+    assert collector.value(IN_FLIGHT) == 0
+
+
+def test_websocket_session_span():
+    class FakeWS:
+        def send(self, data):
+            pass
+
+        def recv(self, timeout=None):
+            return '{"ok":true}'
+
+        def close(self):
+            pass
+
+    collector = InMemoryCollector()
+    client = KittyCAD(
+        token="t",
+        base_url="https://example.com",
+        event_hooks=Telemetry(collector).instrument(),
+    )
+    connection = client.executor.create_executor_term(
+        ws_factory=lambda *args, **kwargs: FakeWS()  # type: ignore[arg-type,return-value]
+    )
+    connection.send({"a": 1})
+    connection.recv()
+    assert collector.value(IN_FLIGHT) == 1
+    connection.close()
+
+    [span] = collector.spans
+    assert span.name == "GET /ws/executor/term"
+    assert span.attributes["network.protocol.name"] == "websocket"
+    assert span.attributes["kittycad.messages"] == 2
+    assert [e.attributes["message.type"] for e in span.events] == ["SENT", "RECEIVED"]
+    assert collector.value(WEBSOCKET_MESSAGES, {"direction": "sent"}) == 1
+    assert collector.value(BYTES_SENT) == len(b'{"a":1}')
+    assert collector.value(BYTES_RECEIVED) == len(b'{"ok":true}')
+    assert collector.value(IN_FLIGHT) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_client_is_instrumented():
+    collector = InMemoryCollector()
+    client = AsyncKittyCAD(
+        token="t",
+        transport=httpx.MockTransport(_pong),
+        event_hooks=Telemetry(collector).instrument(),
+    )
+    await client.meta.ping()
+    await client.aclose()
+
+    assert [span.name for span in collector.spans] == ["GET /ping"]
+    assert len(collector.observations(REQUEST_DURATION)) == 1
+
+
+def test_opentelemetry_exporter_is_optional():
+    pytest.importorskip("opentelemetry")
+    from kittycad.telemetry import OpenTelemetryExporter
+
+    client = KittyCAD(
+        token="t",
+        transport=httpx.MockTransport(_pong),
+        event_hooks=Telemetry(OpenTelemetryExporter()).instrument(),
+    )
+    client.meta.ping()
@@ -0,0 +1,118 @@
+"""Tests for sharing one client between threads."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import httpx
+import pytest
+
+from kittycad import AsyncKittyCAD, KittyCAD
+from kittycad.client import AsyncClient, Client
+
+THREADS = 32
+
+
+def _pong(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"message": "pong"})
+
+
+@pytest.fixture
+def created(monkeypatch) -> List[httpx.Client]:
+    """Records every pool the clients create, slowly to widen any race."""
+    pools: List[httpx.Client] = []
+    new_http_client = Client._new_http_client
+
+    def slow_new_http_client(self):
+        time.sleep(0.01)
+        pools.append(new_http_client(self))
+        return pools[-1]
+
+    monkeypatch.setattr(Client, "_new_http_client", slow_new_http_client)
+    return pools
+
+
+def test_concurrent_first_use_creates_one_pool(created):
+    client = KittyCAD(token="t", transport=httpx.MockTransport(_pong))
+    barrier = threading.Barrier(THREADS)
+
+    def work(_):
+        barrier.wait()
+        http_client = client.get_http_client()
+        for _ in range(20):
+            assert client.meta.ping().message == "pong"
+        return http_client
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        seen = set(map(id, pool.map(work, range(THREADS))))
+
+    assert len(created) == 1
+    assert seen == {id(created[0])}
+
+
+def test_pool_closes_when_last_user_exits(created):
+    client = KittyCAD(token="t", transport=httpx.MockTransport(_pong))
+    barrier = threading.Barrier(THREADS)
+    errors: List[BaseException] = []
+
+    def work(i):
+        try:
+            with client:
+                barrier.wait()
+                for _ in range(10):
+                    client.meta.ping()
+                # Stagger exits so early leavers overlap late requests.
+                time.sleep(i / 1000)
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(created) == 1
+    assert created[0].is_closed
+    assert client.http_client is None
+
+
+def test_close_still_closes_immediately():
+    client = KittyCAD(token="t", transport=httpx.MockTransport(_pong))
+    with client:
+        http_client = client.get_http_client()
+        client.close()
+        assert http_client.is_closed
+        assert client.http_client is None
+    # Using the client again opens a new pool.
+    assert client.meta.ping().message == "pong"
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_is_shared_by_tasks(monkeypatch):
+    pools: List[httpx.AsyncClient] = []
+    new_http_client = AsyncClient._new_http_client
+
+    def counting(self):
+        pools.append(new_http_client(self))
+        return pools[-1]
+
+    monkeypatch.setattr(AsyncClient, "_new_http_client", counting)
+    client = AsyncKittyCAD(token="t", transport=httpx.MockTransport(_pong))
+
+    async def work():
+        async with client:
+            for _ in range(5):
+                await client.meta.ping()
+                # Mock responses never suspend; let the other tasks in.
+                await asyncio.sleep(0)
+
+    await asyncio.gather(*(work() for _ in range(THREADS)))
+
+    assert len(pools) == 1
+    assert pools[0].is_closed
+    assert client.http_client is None
@@ -0,0 +1,211 @@
+"""Tests for connection timing breakdowns."""
+
+import http.server
+import threading
+import time
+from typing import Iterator, List
+
+import httpx
+import pytest
+
+from kittycad import AsyncKittyCAD, KittyCAD
+from kittycad._transport import iter_transports
+from kittycad.exceptions import KittyCADClientError, KittyCADTimeoutError
+from kittycad.hooks import EventHooks, RequestEvent
+from kittycad.response_helpers import make_request_with_error_handling
+from kittycad.telemetry import PHASE_DURATION, InMemoryCollector, Telemetry
+from kittycad.timing import (
+    AsyncTimingTransport,
+    TimingBreakdown,
+    TimingTransport,
+    get_timing,
+)
+
+# What httpcore emits for a request on a new TLS connection.
+NEW_TLS_CONNECTION = [
+    "connection.connect_tcp",
+    "connection.start_tls",
+    "http11.send_request_headers",
+    "http11.send_request_body",
+    "http11.receive_response_headers",
+]
+
+
+class Traced(httpx.BaseTransport):
+    """Emits httpcore-style trace events, then responds with ``status``."""
+
+    def __init__(self, events=NEW_TLS_CONNECTION, status=200):
+        self.events = events
+        self.status = status
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        trace = request.extensions.get("trace", lambda name, info: None)
+        for name in self.events:
+            trace(f"{name}.started", {})
+            trace(f"{name}.complete", {})
+        return httpx.Response(
+            self.status,
+            json={"message": "pong"},
+            extensions={"http_version": b"HTTP/1.1"},
+        )
+
+
+def test_breakdown_from_trace_events():
+    client = KittyCAD(token="t", transport=Traced(), timing_sample_rate=1.0)
+
+    response = client.get_http_client().get("https://api.zoo.dev/ping")
+
+    timing = get_timing(response)
+    assert isinstance(timing, TimingBreakdown)
+    for phase in ("queue", "connect", "tls", "send", "server", "ttfb", "total"):
+        assert getattr(timing, phase) is not None, phase
+    assert timing.download is None
+    assert timing.reused_connection is False
+    assert timing.http_version == "HTTP/1.1"
+    assert get_timing(response.request) is timing
+    assert "connect=" in str(timing) and "total=" in str(timing)
+
+
+def test_reused_connection_has_no_connect_phase():
+    events = ["http11.send_request_headers", "http11.receive_response_headers"]
+    client = KittyCAD(token="t", transport=Traced(events), timing_sample_rate=1.0)
+
+    timing = get_timing(client.get_http_client().get("https://api.zoo.dev/ping"))
+
+    assert timing is not None
+    assert timing.connect is None and timing.tls is None
+    assert timing.reused_connection is True
+
+
+def test_user_trace_callback_still_called():
+    seen: List[str] = []
+    client = KittyCAD(token="t", transport=Traced(), timing_sample_rate=1.0)
+
+    client.get_http_client().get(
+        "https://api.zoo.dev/ping",
+        extensions={"trace": lambda name, info: seen.append(name)},
+    )
+
+    assert seen[0] == "connection.connect_tcp.started"
+    assert len(seen) == 2 * len(NEW_TLS_CONNECTION)
+
+
+def test_api_errors_carry_timing():
+    client = KittyCAD(token="t", transport=Traced(status=404), timing_sample_rate=1.0)
+
+    with pytest.raises(KittyCADClientError) as info:
+        client.meta.ping()
+
+    assert info.value.timing is not None
+    assert get_timing(info.value) is info.value.timing
+
+
+def test_sampling():
+    draws = iter([0.1, 0.9, 0.2])
+    transport = TimingTransport(Traced(), sample_rate=0.5, random=lambda: next(draws))
+    http_client = httpx.Client(transport=transport)
+
+    sampled = [
+        get_timing(http_client.get("https://api.zoo.dev/ping")) is not None
+        for _ in range(3)
+    ]
+
+    assert sampled == [True, False, True]
+    with pytest.raises(ValueError):
+        TimingTransport(Traced(), sample_rate=1.5)
+
+
+def test_disabled_by_default():
+    client = KittyCAD(token="t", transport=Traced())
+    transports = iter_transports(client.get_http_client()._transport)
+    assert not any(isinstance(t, TimingTransport) for t in transports)
+    assert get_timing(client.get_http_client().get("https://api.zoo.dev/")) is None
+
+    enabled = client.with_timing_sample_rate(1.0)
+    transports = iter_transports(enabled.get_http_client()._transport)
+    assert any(isinstance(t, TimingTransport) for t in transports)
+
+
+def test_hook_events_and_telemetry_carry_timing():
+    events: List[RequestEvent] = []
+    collector = InMemoryCollector()
+    hooks = Telemetry(collector).instrument(EventHooks(on_response_end=[events.append]))
+    client = KittyCAD(
+        token="t", transport=Traced(), timing_sample_rate=1.0, event_hooks=hooks
+    )
+
+    client.meta.ping()
+
+    assert events[-1].timing is not None
+    [span] = collector.spans
+    assert span.attributes["kittycad.timing.connect"] >= 0
+    assert span.attributes["kittycad.timing.reused_connection"] is False
+    assert len(collector.observations(PHASE_DURATION, {"kittycad.phase": "tls"})) == 1
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/slow":
+            time.sleep(0.5)
+        body = b'{"message":"pong"}'
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[str]:
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_real_connection_breakdown(server):
+    with KittyCAD(token="t", base_url=server, timing_sample_rate=1.0) as client:
+        first = get_timing(client.get_http_client().get(f"{server}/ping"))
+        second = get_timing(client.get_http_client().get(f"{server}/ping"))
+
+    assert first is not None and second is not None
+    assert first.connect is not None and first.tls is None
+    assert first.server is not None and first.download is not None
+    assert first.reused_connection is False
+    assert second.reused_connection is True
+
+
+def test_timeouts_say_which_phase_timed_out(server):
+    client = KittyCAD(token="t", base_url=server, timing_sample_rate=1.0)
+    http_client = client.with_timeout(0.1).get_http_client()
+
+    with pytest.raises(KittyCADTimeoutError) as info:
+        make_request_with_error_handling(http_client, "GET", f"{server}/slow")
+
+    assert info.value.timing is not None
+    assert info.value.timing.failed_phase == "server"
+    assert "failed in server" in str(info.value)
+
+
+@pytest.mark.asyncio
+async def test_async_real_connection_breakdown(server):
+    async with AsyncKittyCAD(
+        token="t", base_url=server, timing_sample_rate=1.0
+    ) as client:
+        response = await client.get_http_client().get(f"{server}/ping")
+        assert any(
+            isinstance(t, AsyncTimingTransport)
+            for t in iter_transports(client.get_http_client()._transport)
+        )
+
+    timing = get_timing(response)
+    assert timing is not None
+    assert timing.connect is not None and timing.server is not None
+    assert timing.total is not None
@@ -0,0 +1,114 @@
+"""Tests for the cached ``TypeAdapter`` registry used by generated methods."""
+
+import threading
+import time
+from typing import Any, Callable, List
+
+import httpx
+import pytest
+from pydantic import TypeAdapter
+
+import kittycad
+from kittycad import AsyncKittyCAD, KittyCAD
+from kittycad._adapters import TypeAdapterRegistry
+from kittycad.models import AccountProvider, OrgDataset
+
+
+def test_registry_builds_each_adapter_once():
+    registry = TypeAdapterRegistry()
+    built = []
+
+    def factory() -> Any:
+        built.append(1)
+        return List[int]
+
+    first = registry.get("List[int]", factory)
+    assert registry.get("List[int]", factory) is first
+    assert built == [1]
+    assert "List[int]" in registry
+    assert len(registry) == 1
+    assert first.validate_json(b"[1, 2]") == [1, 2]
+
+
+def test_registry_is_thread_safe():
+    registry = TypeAdapterRegistry()
+    built = []
+    start = threading.Barrier(16)
+    adapters = []
+
+    def factory() -> Any:
+        built.append(1)
+        return List[OrgDataset]
+
+    def get() -> None:
+        start.wait()
+        adapters.append(registry.get("List[OrgDataset]", factory))
+
+    threads = [threading.Thread(target=get) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert built == [1]
+    assert all(adapter is adapters[0] for adapter in adapters)
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=["google", "github"])
+
+
+def test_generated_methods_reuse_adapters():
+    client = KittyCAD(token="t", transport=httpx.MockTransport(_handler))
+    assert client.users.get_oauth2_providers_for_user() == [
+        AccountProvider.GOOGLE,
+        AccountProvider.GITHUB,
+    ]
+    key = "List[AccountProvider]"
+    assert key in kittycad._TYPE_ADAPTERS
+    adapter = kittycad._TYPE_ADAPTERS.get(key, lambda: None)
+    client.users.get_oauth2_providers_for_user()
+    assert kittycad._TYPE_ADAPTERS.get(key, lambda: None) is adapter
+
+
+@pytest.mark.asyncio
+async def test_async_methods_share_the_registry():
+    client = AsyncKittyCAD(token="t", transport=httpx.MockTransport(_handler))
+    assert await client.users.get_oauth2_providers_for_user() == [
+        AccountProvider.GOOGLE,
+        AccountProvider.GITHUB,
+    ]
+    assert "List[AccountProvider]" in kittycad._TYPE_ADAPTERS
+
+
+def _per_call(fn: Callable[[], Any], calls: int = 50) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls
+
+
+@pytest.mark.benchmark
+def test_benchmark_cached_adapter_per_call_overhead():
+    """Fresh ``TypeAdapter`` per call (the old code) vs. the registry.
+
+    Prints the per-call cost (``pytest -s --benchmarks``); a small response is
+    validated, so the cost is dominated by adapter construction when it isn't
+    cached.
+    """
+    registry = TypeAdapterRegistry()
+    body = b"[]"
+
+    def fresh() -> Any:
+        return TypeAdapter(List[OrgDataset]).validate_json(body, extra="ignore")
+
+    def cached() -> Any:
+        return registry.get("List[OrgDataset]", lambda: List[OrgDataset]).validate_json(
+            body, extra="ignore"
+        )
+
+    cached()
+    before = _per_call(fresh)
+    after = _per_call(cached)
+    print(f"per call: fresh {before * 1e6:.0f}us, cached {after * 1e6:.1f}us")
+    assert after * 10 < before
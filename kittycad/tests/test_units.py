@@ -0,0 +1,175 @@
+"""Tests for the offline unit-conversion engine."""
+
+from fractions import Fraction
+
+import httpx
+import pytest
+
+from kittycad import AsyncKittyCAD, KittyCAD
+from kittycad.models import (
+    UnitAngle,
+    UnitArea,
+    UnitCurrent,
+    UnitEnergy,
+    UnitForce,
+    UnitFrequency,
+    UnitLength,
+    UnitLengthConversion,
+    UnitMass,
+    UnitPower,
+    UnitPressure,
+    UnitTemperature,
+    UnitTorque,
+    UnitVolume,
+)
+from kittycad.units import UNIT_KINDS, affine, convert
+
+# Reference values taken from the unit definitions (NIST SP 811), not
+# captured from the live API. Each is wrapped in a response of the shape the
+# /unit/conversion endpoints return, replayed through the HTTP path and
+# compared against local=True.
+_REFERENCE_VALUES = [
+    ("angle", UnitAngle.DEGREES, UnitAngle.RADIANS, 180.0, 3.141592653589793),
+    ("area", UnitArea.FT2, UnitArea.IN2, 1.0, 144.0),
+    ("area", UnitArea.KM2, UnitArea.M2, 2.5, 2500000.0),
+    ("current", UnitCurrent.MILLIAMPERES, UnitCurrent.MICROAMPERES, 3.0, 3000.0),
+    ("energy", UnitEnergy.KILOWATT_HOURS, UnitEnergy.JOULES, 1.0, 3600000.0),
+    ("energy", UnitEnergy.BTU, UnitEnergy.JOULES, 1.0, 1055.05585262),
+    ("energy", UnitEnergy.KILOCALORIES, UnitEnergy.JOULES, 1.0, 4184.0),
+    ("force", UnitForce.POUNDS, UnitForce.NEWTONS, 1.0, 4.4482216152605),
+    ("force", UnitForce.KILOPONDS, UnitForce.NEWTONS, 1.0, 9.80665),
+    ("frequency", UnitFrequency.GIGAHERTZ, UnitFrequency.MEGAHERTZ, 1.5, 1500.0),
+    ("length", UnitLength.IN, UnitLength.MM, 1.0, 25.4),
+    ("length", UnitLength.YD, UnitLength.FT, 2.0, 6.0),
+    ("mass", UnitMass.LB, UnitMass.KG, 1.0, 0.45359237),
+    ("power", UnitPower.HORSEPOWER, UnitPower.WATTS, 1.0, 745.6998715822702),
+    ("power", UnitPower.METRIC_HORSEPOWER, UnitPower.WATTS, 1.0, 735.49875),
+    ("pressure", UnitPressure.ATMOSPHERES, UnitPressure.PASCALS, 1.0, 101325.0),
+    ("pressure", UnitPressure.PSI, UnitPressure.PASCALS, 1.0, 6894.757293168361),
+    ("temperature", UnitTemperature.CELSIUS, UnitTemperature.FAHRENHEIT, 100.0, 212.0),
+    ("temperature", UnitTemperature.FAHRENHEIT, UnitTemperature.KELVIN, 32.0, 273.15),
+    ("temperature", UnitTemperature.RANKINE, UnitTemperature.CELSIUS, 0.0, -273.15),
+    ("torque", UnitTorque.POUND_FOOT, UnitTorque.NEWTON_METRES, 1.0, 1.3558179483314),
+    ("volume", UnitVolume.USGAL, UnitVolume.L, 1.0, 3.785411784),
+    ("volume", UnitVolume.USGAL, UnitVolume.USFLOZ, 1.0, 128.0),
+    ("volume", UnitVolume.FT3, UnitVolume.IN3, 1.0, 1728.0),
+]
+
+
+def _reference_response(kind, input_unit, output_unit, value, output):
+    return {
+        "id": "7b5d4f4e-6e5b-4b8a-9f6a-2f4cda9b1c01",
+        "user_id": "1c4a3f2e-8d7b-4e6a-9b5c-0d3e2f1a4b5c",
+        "status": "completed",
+        "created_at": "2024-05-01T12:00:00Z",
+        "updated_at": "2024-05-01T12:00:00Z",
+        "input": value,
+        "input_unit": input_unit.value,
+        "output": output,
+        "output_unit": output_unit.value,
+    }
+
+
+@pytest.mark.parametrize("kind,input_unit,output_unit,value,output", _REFERENCE_VALUES)
+def test_local_matches_reference_values(kind, input_unit, output_unit, value, output):
+    reference = _reference_response(kind, input_unit, output_unit, value, output)
+    client = KittyCAD(
+        token="t",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json=reference)
+        ),
+    )
+    method = getattr(client.unit, f"get_{kind}_unit_conversion")
+
+    remote = method(input_unit, output_unit, value)
+    local = method(input_unit, output_unit, value, local=True)
+
+    assert type(local) is type(remote)
+    assert local.output == pytest.approx(remote.output, rel=1e-12, abs=1e-12)
+    assert local.input == remote.input
+    assert local.input_unit == remote.input_unit
+    assert local.output_unit == remote.output_unit
+    assert local.status == remote.status
+
+
+def test_local_mode_makes_no_request():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("unexpected request")
+
+    client = KittyCAD(token="t", transport=httpx.MockTransport(handler))
+
+    result = client.unit.get_length_unit_conversion(
+        UnitLength.M, UnitLength.CM, 1.5, local=True
+    )
+
+    assert isinstance(result, UnitLengthConversion)
+    assert result.output == 150.0
+    assert result.completed_at is not None
+
+
+@pytest.mark.asyncio
+async def test_async_local_mode():
+    client = AsyncKittyCAD(token="t")
+
+    result = await client.unit.get_temperature_unit_conversion(
+        UnitTemperature.KELVIN, UnitTemperature.CELSIUS, 0.0, local=True
+    )
+
+    assert result.output == pytest.approx(-273.15)
+
+
+def test_every_enum_member_has_a_factor():
+    for kind in UNIT_KINDS:
+        for src in kind:
+            for dst in kind:
+                affine(src, dst)
+                assert convert(convert(7.25, src, dst), dst, src) == pytest.approx(7.25)
+
+
+def test_sequences_and_scalars():
+    assert convert(3, UnitMass.KG, UnitMass.G) == 3000.0
+    assert convert((1, 2), UnitLength.FT, UnitLength.IN) == [12.0, 24.0]
+    assert convert(
+        [0.0, 100.0], UnitTemperature.CELSIUS, UnitTemperature.KELVIN
+    ) == pytest.approx([273.15, 373.15])
+    half_inch = convert(Fraction(1, 2), UnitLength.IN, UnitLength.MM)
+    assert type(half_inch) is float and half_inch == 12.7
+
+
+def test_mixed_kinds_are_rejected():
+    with pytest.raises(ValueError):
+        convert(1.0, UnitLength.M, UnitMass.KG)
+
+
+def test_numpy_arrays_are_converted_vectorized():
+    np = pytest.importorskip("numpy")
+    values = np.array([0.0, 100.0])
+
+    result = convert(values, UnitTemperature.CELSIUS, UnitTemperature.FAHRENHEIT)
+
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == [32.0, 212.0]
+    assert values.tolist() == [0.0, 100.0]
+
+
+def test_numpy_scalars_are_numbers():
+    np = pytest.importorskip("numpy")
+
+    for value in (np.float32(1.5), np.int64(3), np.float64(2.0)):
+        result = convert(value, UnitLength.FT, UnitLength.IN)
+        assert type(result) is float
+        assert result == float(value) * 12
+
+
+def test_array_likes_are_converted_vectorized():
+    np = pytest.importorskip("numpy")
+
+    class ArrayLike:
+        def __array__(self, dtype=None, copy=None):
+            return np.array([1, 2], dtype=np.int64)
+
+    result = convert(ArrayLike(), UnitLength.FT, UnitLength.IN)
+
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == np.float64
+    assert result.tolist() == [12.0, 24.0]
@@ -0,0 +1,184 @@
+"""Tests for connection warm-up."""
+
+import http.server
+import socket
+import threading
+import time
+from typing import Iterator, List
+
+import httpx
+import pytest
+
+from kittycad import AsyncKittyCAD, KittyCAD
+from kittycad.cache import ResponseCache
+from kittycad.hooks import EventHooks, RequestEvent
+from kittycad.singleflight import SingleFlight
+from kittycad.timing import get_timing
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"message":"pong"}'
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[str]:
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def listener() -> Iterator[socket.socket]:
+    """A bare TCP server standing in for the websocket endpoint."""
+    sock = socket.create_server(("127.0.0.1", 0))
+    yield sock
+    sock.close()
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.requests: List[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(200, json={"message": "pong"})
+
+
+def test_parks_connections_in_the_pool(server):
+    client = KittyCAD(token="t", base_url=server, timing_sample_rate=1.0)
+
+    report = client.warmup(3)
+
+    assert report.opened == 3
+    assert len(report.timings) == 3
+    assert all(t.connect is not None for t in report.timings)
+    assert client.pool_stats().idle_connections == 3
+    response = client.get_http_client().get(f"{server}/ping")
+    timing = get_timing(response)
+    assert timing is not None and timing.reused_connection is True
+    assert client.pool_stats().connections == 3
+    client.close()
+
+
+def test_hooks_see_warmup_requests(server):
+    events: List[RequestEvent] = []
+    client = KittyCAD(
+        token="t",
+        base_url=server,
+        event_hooks=EventHooks(on_response_end=[events.append]),
+    )
+
+    client.warmup(2)
+
+    assert [e.operation_id for e in events] == ["warmup", "warmup"]
+    assert all(e.timing is not None and e.timing.connect is not None for e in events)
+    client.close()
+
+
+def test_not_coalesced_or_cached():
+    recorder = Recorder()
+    client = KittyCAD(
+        token="t",
+        transport=httpx.MockTransport(recorder),
+        single_flight=SingleFlight(),
+        response_cache=ResponseCache(default_ttl=60),
+    )
+
+    client.warmup(4)
+    client.warmup(4)
+
+    assert len(recorder.requests) == 8
+    assert recorder.requests[0].headers["authorization"] == "Bearer t"
+
+
+def test_rejects_what_the_pool_cannot_keep():
+    client = KittyCAD(token="t", max_keepalive_connections=2, keepalive_expiry=5.0)
+    with pytest.raises(ValueError, match="keeps 2"):
+        client.warmup(3)
+    with pytest.raises(ValueError, match="keepalive_expiry"):
+        client.warmup(1, refresh_interval=5.0)
+    with pytest.raises(ValueError):
+        client.warmup(0)
+
+
+def test_refresh_until_closed():
+    recorder = Recorder()
+    client = KittyCAD(
+        token="t", transport=httpx.MockTransport(recorder), keepalive_expiry=1.0
+    )
+
+    client.warmup(2, refresh_interval=0.02)
+    time.sleep(0.2)
+    client.close()
+    sent = len(recorder.requests)
+    time.sleep(0.1)
+
+    assert sent >= 6
+    assert len(recorder.requests) == sent
+
+
+def test_websocket_gets_the_parked_socket(listener):
+    port = listener.getsockname()[1]
+    client = KittyCAD(
+        token="t",
+        base_url=f"http://127.0.0.1:{port}",
+        transport=httpx.MockTransport(Recorder()),
+    )
+
+    report = client.warmup(websocket=True)
+    peer, _ = listener.accept()
+
+    def connect(url, **kwargs):
+        return kwargs
+
+    assert report.websocket_connect is not None
+    sock = client.get_websocket_connect(connect)("ws://unused")["sock"]
+    assert sock.getpeername() == peer.getsockname()
+    # Taken: the next websocket connects on its own.
+    assert client.get_websocket_connect(connect) is connect
+    sock.close()
+    peer.close()
+
+
+def test_closed_parked_socket_is_not_used(listener):
+    port = listener.getsockname()[1]
+    client = KittyCAD(
+        token="t",
+        base_url=f"http://127.0.0.1:{port}",
+        transport=httpx.MockTransport(Recorder()),
+    )
+    client.warmup(websocket=True)
+    peer, _ = listener.accept()
+    peer.close()
+    time.sleep(0.05)
+
+    def connect(url, **kwargs):
+        return kwargs
+
+    assert client.get_websocket_connect(connect) is connect
+
+
+@pytest.mark.asyncio
+async def test_async_warmup(server):
+    client = AsyncKittyCAD(token="t", base_url=server)
+
+    report = await client.warmup(3, refresh_interval=0.02)
+
+    assert report.opened == 3
+    assert client.pool_stats().idle_connections == 3
+    await client.aclose()
+    assert client._warmer is not None and client._warmer._task is None
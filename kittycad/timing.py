@@ -0,0 +1,274 @@
+"""Connection timing breakdowns for the KittyCAD SDK.
+
+Set ``timing_sample_rate`` on :class:`kittycad.client.Client` or
+:class:`kittycad.client.AsyncClient` and a fraction of requests record where
+their time went, from httpcore's ``trace`` events: waiting for a pooled
+connection, connecting (name resolution and TCP), the TLS handshake, sending
+the request, waiting for the server and downloading the body. Requests
+that aren't sampled pay for one random number; a rate of 0 (the default)
+adds nothing at all.
+
+The :class:`TimingBreakdown` of the last attempt is available from the
+response, the request, :class:`kittycad.hooks.RequestEvent` and the
+exceptions of :mod:`kittycad.exceptions` (including timeouts, where
+``failed_phase`` says which phase ran out of time), all through
+:func:`get_timing`.
+
+Example:
+    >>> from kittycad import KittyCAD
+    >>> from kittycad.timing import get_timing
+    >>> client = KittyCAD(token="my-token", timing_sample_rate=0.01)
+    >>> response = client.get_http_client().get("https://api.zoo.dev/ping")  # doctest: +SKIP
+    >>> print(get_timing(response))  # doctest: +SKIP
+    connect=21.3ms tls=48.9ms send=0.1ms server=35.2ms download=0.2ms total=105.9ms
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Any, Callable, Dict, Optional
+
+import attr
+import httpx
+
+from ._transport import _AsyncReleasingStream, _ReleasingStream
+
+TIMING_EXTENSION = "kittycad_timing"
+"""Request and response extension holding the :class:`TimingBreakdown`."""
+
+# httpcore trace event (without its "connection."/"http11."/"http2." prefix)
+# to the phase it belongs to.
+_PHASES = {
+    "connect_tcp": "connect",
+    "connect_unix_socket": "connect",
+    "start_tls": "tls",
+    "send_connection_init": "send",
+    "send_request_headers": "send",
+    "send_request_body": "send",
+    "receive_response_headers": "server",
+    "receive_response_body": "download",
+}
+
+
+@attr.s(auto_attribs=True, slots=True)
+class TimingBreakdown:
+    """Where the time of one request attempt went, in seconds.
+
+    Phases the attempt didn't go through, such as ``connect`` and ``tls`` on
+    a reused connection, are ``None``. So are all the phases when the
+    transport doesn't emit httpcore trace events (e.g. a mock transport).
+    """
+
+    queue: Optional[float] = None
+    """Waiting for a connection from the pool."""
+    connect: Optional[float] = None
+    """Resolving the host name and opening the TCP connection."""
+    tls: Optional[float] = None
+    send: Optional[float] = None
+    """Sending the request headers and body."""
+    server: Optional[float] = None
+    """From the request being sent to the response headers arriving."""
+    download: Optional[float] = None
+    """Reading the response body."""
+    ttfb: Optional[float] = None
+    """From the start of the attempt to the response headers arriving."""
+    total: Optional[float] = None
+    """From the start of the attempt to the body being read or the failure."""
+    reused_connection: Optional[bool] = None
+    http_version: Optional[str] = None
+    failed_phase: Optional[str] = None
+    """The phase in progress when the attempt failed, e.g. ``"connect"``."""
+
+    def phases(self) -> Dict[str, float]:
+        """The recorded phases and totals, in order, skipping unknown ones."""
+        names = ("queue", "connect", "tls", "send", "server", "download", "total")
+        durations = {name: getattr(self, name) for name in names}
+        return {name: value for name, value in durations.items() if value is not None}
+
+    def __str__(self) -> str:
+        parts = [
+            f"{name}={value * 1000:.1f}ms" for name, value in self.phases().items()
+        ]
+        if self.failed_phase is not None:
+            parts.append(f"failed in {self.failed_phase}")
+        return " ".join(parts)
+
+
+def get_timing(obj: Any) -> Optional[TimingBreakdown]:
+    """Get the timing breakdown of a response, request or exception, if sampled.
+
+    Exceptions may be :mod:`kittycad.exceptions` errors or httpx request
+    errors.
+    """
+    timing = getattr(obj, "timing", None)
+    if isinstance(timing, TimingBreakdown):
+        return timing
+    if isinstance(obj, httpx.RequestError):
+        try:
+            obj = obj.request
+        except RuntimeError:
+            return None
+    extensions = getattr(obj, "extensions", None)
+    if isinstance(extensions, dict):
+        return extensions.get(TIMING_EXTENSION)
+    return None
+
+
+class _Timer:
+    """Records the trace events of one attempt into a breakdown."""
+
+    def __init__(self, request: httpx.Request):
+        self.timing = TimingBreakdown()
+        self.start = time.perf_counter()
+        self.first_event: Optional[float] = None
+        self.started: Dict[str, float] = {}
+        # A trace callback set by the caller keeps receiving events.
+        chained = request.extensions.get("trace")
+        if isinstance(getattr(chained, "__self__", None), _Timer):
+            chained = chained.__self__.chained  # type: ignore[union-attr]
+        self.chained: Optional[Callable[..., Any]] = chained
+        request.extensions[TIMING_EXTENSION] = self.timing
+
+    def record(self, name: str, info: Dict[str, Any]) -> None:
+        now = time.perf_counter()
+        event, _, outcome = name.partition(".")[2].rpartition(".")
+        phase = _PHASES.get(event)
+        if phase is None:
+            return
+        if self.first_event is None:
+            self.first_event = now
+            self.timing.queue = now - self.start
+        if outcome == "started":
+            self.started[phase] = now
+            return
+        began = self.started.pop(phase, now)
+        value = getattr(self.timing, phase)
+        setattr(self.timing, phase, (value or 0.0) + now - began)
+        if outcome == "failed":
+            self.timing.failed_phase = phase
+
+    def trace(self, name: str, info: Dict[str, Any]) -> None:
+        self.record(name, info)
+        if self.chained is not None:
+            self.chained(name, info)
+
+    async def atrace(self, name: str, info: Dict[str, Any]) -> None:
+        self.record(name, info)
+        if self.chained is not None:
+            await self.chained(name, info)
+
+    def failed(self, error: Exception) -> None:
+        self.timing.total = time.perf_counter() - self.start
+        if isinstance(error, httpx.PoolTimeout):
+            # Raised before the attempt got a connection, so nothing traced.
+            self.timing.failed_phase = "queue"
+            self.timing.queue = self.timing.total
+        self._settle()
+
+    def headers(self, response: httpx.Response) -> None:
+        self.timing.ttfb = time.perf_counter() - self.start
+        version = response.extensions.get("http_version")
+        if isinstance(version, bytes):
+            self.timing.http_version = version.decode("ascii", "replace")
+        response.extensions[TIMING_EXTENSION] = self.timing
+
+    def end(self) -> None:
+        self.timing.total = time.perf_counter() - self.start
+        self._settle()
+
+    def _settle(self) -> None:
+        if self.first_event is not None:
+            self.timing.reused_connection = self.timing.connect is None
+
+
+class _Sampler:
+    def __init__(self, sample_rate: float, random: Callable[[], float]):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be in [0, 1], got {sample_rate}")
+        self.sample_rate = sample_rate
+        self._random = random
+
+    def sampled(self) -> bool:
+        return self.sample_rate >= 1.0 or self._random() < self.sample_rate
+
+
+class TimingTransport(httpx.BaseTransport):
+    """Transport wrapper recording a :class:`TimingBreakdown` per sampled attempt.
+
+    Wrap the transport that talks to the network, so each retry attempt is
+    timed on its own.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        sample_rate: float = 1.0,
+        random: Callable[[], float] = random.random,
+    ):
+        self.transport = transport
+        self._sampler = _Sampler(sample_rate, random)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not self._sampler.sampled():
+            return self.transport.handle_request(request)
+        timer = _Timer(request)
+        request.extensions["trace"] = timer.trace
+        try:
+            response = self.transport.handle_request(request)
+        except Exception as e:
+            timer.failed(e)
+            raise
+        timer.headers(response)
+        if response.is_closed:
+            timer.end()
+            return response
+        assert isinstance(response.stream, httpx.SyncByteStream)
+        response.stream = _ReleasingStream(response.stream, timer.end)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncTimingTransport(httpx.AsyncBaseTransport):
+    """Async variant of :class:`TimingTransport`."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        sample_rate: float = 1.0,
+        random: Callable[[], float] = random.random,
+    ):
+        self.transport = transport
+        self._sampler = _Sampler(sample_rate, random)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not self._sampler.sampled():
+            return await self.transport.handle_async_request(request)
+        timer = _Timer(request)
+        request.extensions["trace"] = timer.atrace
+        try:
+            response = await self.transport.handle_async_request(request)
+        except Exception as e:
+            timer.failed(e)
+            raise
+        timer.headers(response)
+        if response.is_closed:
+            timer.end()
+            return response
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        response.stream = _AsyncReleasingStream(response.stream, timer.end)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+__all__ = [
+    "TIMING_EXTENSION",
+    "AsyncTimingTransport",
+    "TimingBreakdown",
+    "TimingTransport",
+    "get_timing",
+]
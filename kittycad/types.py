@@ -16,6 +16,8 @@ from typing import (
 import attr
 from pydantic import BaseModel, RootModel
 
+from .codec import JSONCodec
+
 
 class Unset:
     def __bool__(self) -> bool:
@@ -55,12 +57,22 @@ class Response(Generic[T]):
 
 def serialize_request_body(body: Any) -> str:
     """Serialize a request body without dropping explicit API semantics."""
+    return json.dumps(_request_payload(body), separators=(",", ":"))
+
+
+def encode_request_body(body: Any, codec: Optional[JSONCodec] = None) -> bytes:
+    """Like :func:`serialize_request_body`, but straight to bytes with ``codec``."""
+    return (codec or _STDLIB_CODEC).dumps(_request_payload(body))
+
+
+_STDLIB_CODEC = JSONCodec()
+
+
+def _request_payload(body: Any) -> Any:
     if isinstance(body, BaseModel):
         payload = body.model_dump(mode="json", by_alias=True, exclude_none=True)
-        payload = _restore_explicit_nulls(body, payload)
-        return json.dumps(payload, separators=(",", ":"))
-
-    return json.dumps(body, separators=(",", ":"))
+        return _restore_explicit_nulls(body, payload)
+    return body
 
 
 def _restore_explicit_nulls(value: Any, payload: Any) -> Any:
@@ -101,4 +113,10 @@ def _serialized_field_name(field_name: str, field: Any) -> str:
     return field_name
 
 
-__all__ = ["File", "Response", "FileJsonType", "serialize_request_body"]
+__all__ = [
+    "File",
+    "Response",
+    "FileJsonType",
+    "encode_request_body",
+    "serialize_request_body",
+]
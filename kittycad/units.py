@@ -0,0 +1,268 @@
+"""Offline unit conversion for the KittyCAD SDK.
+
+The ``/unit/conversion/*`` endpoints are pure arithmetic, so this module
+reproduces them locally from tables keyed by the ``Unit*`` enums. Every
+conversion is affine (``output = input * scale + offset``); only temperature
+has a non-zero offset. Scale/offset pairs for every unit combination are
+precomputed at import time.
+
+:func:`convert` accepts a single number (including NumPy scalars such as
+``np.float32``), any sequence of numbers, or a NumPy array or other object
+implementing ``__array__`` (converted in one vectorized operation, without
+NumPy being a dependency of this package).
+
+Example:
+    >>> from kittycad.models import UnitLength, UnitTemperature
+    >>> from kittycad.units import convert
+    >>> convert(1.0, UnitLength.IN, UnitLength.MM)
+    25.4
+    >>> convert([0.0, 100.0], UnitTemperature.CELSIUS, UnitTemperature.FAHRENHEIT)
+    [32.0, 212.0]
+
+The generated ``UnitAPI`` methods accept ``local=True`` to use this module and
+still return the usual ``Unit*Conversion`` models.
+"""
+
+from __future__ import annotations
+
+import datetime
+import math
+import numbers
+import uuid
+from enum import Enum
+from fractions import Fraction
+from typing import Any, Dict, Mapping, Sequence, Tuple, Type, TypeVar, Union, overload
+
+from .models.api_call_status import ApiCallStatus
+from .models.unit_angle import UnitAngle
+from .models.unit_area import UnitArea
+from .models.unit_current import UnitCurrent
+from .models.unit_energy import UnitEnergy
+from .models.unit_force import UnitForce
+from .models.unit_frequency import UnitFrequency
+from .models.unit_length import UnitLength
+from .models.unit_mass import UnitMass
+from .models.unit_power import UnitPower
+from .models.unit_pressure import UnitPressure
+from .models.unit_temperature import UnitTemperature
+from .models.unit_torque import UnitTorque
+from .models.unit_volume import UnitVolume
+from .models.uuid import Uuid
+
+F = Fraction
+
+# Exact definitions, so derived factors (e.g. ft -> in) round only once.
+_INCH = F("0.0254")
+_FOOT = 12 * _INCH
+_YARD = 3 * _FOOT
+_POUND = F("0.45359237")
+_GRAVITY = F("9.80665")
+_POUND_FORCE = _POUND * _GRAVITY
+_BTU = F("1055.05585262")
+_US_GALLON = 231 * _INCH**3
+_ZERO = F(0)
+
+# (scale, offset) that take a value in each unit to the kind's base unit.
+_TO_BASE: Dict[Type[Enum], Mapping[Any, Tuple[Fraction, Fraction]]] = {
+    UnitAngle: {
+        UnitAngle.DEGREES: (F(math.pi) / 180, _ZERO),
+        UnitAngle.RADIANS: (F(1), _ZERO),
+    },
+    UnitArea: {
+        UnitArea.CM2: (F("1e-4"), _ZERO),
+        UnitArea.DM2: (F("1e-2"), _ZERO),
+        UnitArea.FT2: (_FOOT**2, _ZERO),
+        UnitArea.IN2: (_INCH**2, _ZERO),
+        UnitArea.KM2: (F("1e6"), _ZERO),
+        UnitArea.M2: (F(1), _ZERO),
+        UnitArea.MM2: (F("1e-6"), _ZERO),
+        UnitArea.YD2: (_YARD**2, _ZERO),
+    },
+    UnitCurrent: {
+        UnitCurrent.AMPERES: (F(1), _ZERO),
+        UnitCurrent.MICROAMPERES: (F("1e-6"), _ZERO),
+        UnitCurrent.MILLIAMPERES: (F("1e-3"), _ZERO),
+        UnitCurrent.NANOAMPERES: (F("1e-9"), _ZERO),
+    },
+    UnitEnergy: {
+        UnitEnergy.BTU: (_BTU, _ZERO),
+        UnitEnergy.ELECTRONVOLTS: (F("1.602176634e-19"), _ZERO),
+        UnitEnergy.JOULES: (F(1), _ZERO),
+        UnitEnergy.KILOCALORIES: (F(4184), _ZERO),
+        UnitEnergy.KILOWATT_HOURS: (F("3.6e6"), _ZERO),
+        UnitEnergy.WATT_HOURS: (F(3600), _ZERO),
+    },
+    UnitForce: {
+        UnitForce.DYNES: (F("1e-5"), _ZERO),
+        UnitForce.KILOPONDS: (_GRAVITY, _ZERO),
+        UnitForce.MICRONEWTONS: (F("1e-6"), _ZERO),
+        UnitForce.MILLINEWTONS: (F("1e-3"), _ZERO),
+        UnitForce.NEWTONS: (F(1), _ZERO),
+        UnitForce.POUNDALS: (_POUND * _FOOT, _ZERO),
+        UnitForce.POUNDS: (_POUND_FORCE, _ZERO),
+    },
+    UnitFrequency: {
+        UnitFrequency.GIGAHERTZ: (F("1e9"), _ZERO),
+        UnitFrequency.HERTZ: (F(1), _ZERO),
+        UnitFrequency.KILOHERTZ: (F("1e3"), _ZERO),
+        UnitFrequency.MEGAHERTZ: (F("1e6"), _ZERO),
+        UnitFrequency.MICROHERTZ: (F("1e-6"), _ZERO),
+        UnitFrequency.MILLIHERTZ: (F("1e-3"), _ZERO),
+        UnitFrequency.NANOHERTZ: (F("1e-9"), _ZERO),
+        UnitFrequency.TERAHERTZ: (F("1e12"), _ZERO),
+    },
+    UnitLength: {
+        UnitLength.CM: (F("1e-2"), _ZERO),
+        UnitLength.FT: (_FOOT, _ZERO),
+        UnitLength.IN: (_INCH, _ZERO),
+        UnitLength.M: (F(1), _ZERO),
+        UnitLength.MM: (F("1e-3"), _ZERO),
+        UnitLength.YD: (_YARD, _ZERO),
+    },
+    UnitMass: {
+        UnitMass.G: (F("1e-3"), _ZERO),
+        UnitMass.KG: (F(1), _ZERO),
+        UnitMass.LB: (_POUND, _ZERO),
+    },
+    UnitPower: {
+        UnitPower.BTU_PER_MINUTE: (_BTU / 60, _ZERO),
+        UnitPower.HORSEPOWER: (550 * _FOOT * _POUND_FORCE, _ZERO),
+        UnitPower.KILOWATTS: (F("1e3"), _ZERO),
+        UnitPower.METRIC_HORSEPOWER: (75 * _GRAVITY, _ZERO),
+        UnitPower.MICROWATTS: (F("1e-6"), _ZERO),
+        UnitPower.MILLIWATTS: (F("1e-3"), _ZERO),
+        UnitPower.WATTS: (F(1), _ZERO),
+    },
+    UnitPressure: {
+        UnitPressure.ATMOSPHERES: (F(101325), _ZERO),
+        UnitPressure.BARS: (F("1e5"), _ZERO),
+        UnitPressure.HECTOPASCALS: (F("1e2"), _ZERO),
+        UnitPressure.KILOPASCALS: (F("1e3"), _ZERO),
+        UnitPressure.MILLIBARS: (F("1e2"), _ZERO),
+        UnitPressure.PASCALS: (F(1), _ZERO),
+        UnitPressure.PSI: (_POUND_FORCE / _INCH**2, _ZERO),
+    },
+    UnitTemperature: {
+        UnitTemperature.CELSIUS: (F(1), F("273.15")),
+        UnitTemperature.FAHRENHEIT: (F(5, 9), F("459.67") * F(5, 9)),
+        UnitTemperature.KELVIN: (F(1), _ZERO),
+        UnitTemperature.RANKINE: (F(5, 9), _ZERO),
+    },
+    UnitTorque: {
+        UnitTorque.NEWTON_METRES: (F(1), _ZERO),
+        UnitTorque.POUND_FOOT: (_POUND_FORCE * _FOOT, _ZERO),
+    },
+    UnitVolume: {
+        UnitVolume.MM3: (F("1e-9"), _ZERO),
+        UnitVolume.CM3: (F("1e-6"), _ZERO),
+        UnitVolume.FT3: (_FOOT**3, _ZERO),
+        UnitVolume.IN3: (_INCH**3, _ZERO),
+        UnitVolume.M3: (F(1), _ZERO),
+        UnitVolume.YD3: (_YARD**3, _ZERO),
+        UnitVolume.USFLOZ: (_US_GALLON / 128, _ZERO),
+        UnitVolume.USGAL: (_US_GALLON, _ZERO),
+        UnitVolume.L: (F("1e-3"), _ZERO),
+        UnitVolume.ML: (F("1e-6"), _ZERO),
+    },
+}
+
+
+def _pair(
+    a: Tuple[Fraction, Fraction], b: Tuple[Fraction, Fraction]
+) -> Tuple[float, float]:
+    # x -> base: x * a_scale + a_offset; base -> y: (base - b_offset) / b_scale
+    return float(a[0] / b[0]), float((a[1] - b[1]) / b[0])
+
+
+_PAIRS: Dict[Tuple[Any, Any], Tuple[float, float]] = {
+    (src, dst): _pair(to_src, to_dst)
+    for table in _TO_BASE.values()
+    for src, to_src in table.items()
+    for dst, to_dst in table.items()
+}
+
+UNIT_KINDS: Tuple[Type[Enum], ...] = tuple(_TO_BASE)
+"""The unit enums supported by :func:`convert`."""
+
+Number = Union[int, float, numbers.Real]
+_T = TypeVar("_T")
+
+
+def affine(input_unit: Enum, output_unit: Enum) -> Tuple[float, float]:
+    """Get ``(scale, offset)`` such that ``output = input * scale + offset``.
+
+    Raises:
+        ValueError: If the units are of different kinds
+    """
+    try:
+        return _PAIRS[(input_unit, output_unit)]
+    except KeyError:
+        raise ValueError(f"cannot convert {input_unit!r} to {output_unit!r}") from None
+
+
+def _is_array(value: Any) -> bool:
+    return hasattr(value, "__array__") and not isinstance(value, numbers.Real)
+
+
+@overload
+def convert(value: Number, input_unit: Enum, output_unit: Enum) -> float: ...
+
+
+@overload
+def convert(
+    value: Sequence[Number], input_unit: Enum, output_unit: Enum
+) -> list[float]: ...
+
+
+@overload
+def convert(value: _T, input_unit: Enum, output_unit: Enum) -> _T: ...
+
+
+def convert(value: Any, input_unit: Enum, output_unit: Enum) -> Any:
+    """Convert a number, a sequence of numbers or an array between units.
+
+    Numbers (any ``numbers.Real``) give a ``float``, sequences a ``list`` and
+    array-likes a new floating-point NumPy array.
+    """
+    scale, offset = affine(input_unit, output_unit)
+    if isinstance(value, numbers.Real):
+        return float(value) * scale + offset
+    if _is_array(value):
+        # Only reachable when the caller already has NumPy (or an array type
+        # built on it) loaded.
+        import numpy
+
+        result = numpy.asarray(value, dtype=float) * scale
+        if offset:
+            result += offset
+        return result
+    if offset:
+        return [v * scale + offset for v in value]
+    return [v * scale for v in value]
+
+
+def local_conversion(
+    model: Type[_T], input_unit: Enum, output_unit: Enum, value: float
+) -> _T:
+    """Build a ``Unit*Conversion`` result like the API would, without calling it.
+
+    The result gets a random id and an empty (nil) ``user_id``, since no API
+    call is recorded.
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return model(  # type: ignore[call-arg]
+        id=Uuid(str(uuid.uuid4())),
+        user_id=Uuid(str(uuid.UUID(int=0))),
+        status=ApiCallStatus.COMPLETED,
+        input=value,
+        input_unit=input_unit,
+        output=convert(value, input_unit, output_unit),
+        output_unit=output_unit,
+        created_at=now,
+        started_at=now,
+        completed_at=now,
+        updated_at=now,
+    )
+
+
+__all__ = ["UNIT_KINDS", "affine", "convert", "local_conversion"]
@@ -0,0 +1,434 @@
+"""Connection warm-up for the KittyCAD SDK.
+
+The first request after a deploy, a scale-up or an idle spell pays for name
+resolution, the TCP connect and the TLS handshake. ``client.warmup(n)`` (or
+``await client.warmup(n)`` on an async client) pays for them up front: it
+sends ``n`` concurrent ``GET /ping`` requests, holding each connection until
+all of them are open, and so parks ``n`` keep-alive connections to
+``base_url`` in the pool.
+
+With ``refresh_interval`` the warm-up repeats in the background (a daemon
+thread, or a task on the running event loop) until the client is closed, so
+keep-alive expiry doesn't close the connections before traffic arrives; pick
+an interval below ``keepalive_expiry``. With ``websocket=True`` it also
+connects a TCP socket for the next websocket the client opens (e.g.
+``/ws/modeling/commands``); that websocket still does its own TLS and
+websocket handshakes on it.
+
+Warm-up requests go through the client like any other request, as operation
+``warmup``, so event hooks and :mod:`kittycad.telemetry` see them (failures
+of background refreshes included). Their
+:class:`~kittycad.timing.TimingBreakdown` is always recorded, attached to
+those events and returned in the :class:`WarmupReport`.
+
+Example:
+    >>> from kittycad import KittyCAD
+    >>> client = KittyCAD(token="my-token")
+    >>> report = client.warmup(4, refresh_interval=4.0)  # doctest: +SKIP
+    >>> report.opened  # doctest: +SKIP
+    4
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
+
+import attr
+import httpx
+from websockets.proxy import get_proxy
+from websockets.uri import parse_uri
+
+from ._transport import OPERATION_EXTENSION, OperationInfo
+from .response_helpers import wrap_httpx_exceptions, wrap_httpx_exceptions_async
+from .timing import TimingBreakdown, _Timer
+
+if TYPE_CHECKING:
+    from .client import AsyncClient, Client
+
+WARMUP_OPERATION = OperationInfo("warmup", "warmup", "/ping")
+"""The operation warm-up requests are reported as."""
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class WarmupReport:
+    """What one warm-up did."""
+
+    timings: List[TimingBreakdown]
+    """One per warm-up request, in the order they were sent."""
+    duration: float
+    """Seconds the whole warm-up took."""
+    websocket_connect: Optional[float] = None
+    """Seconds taken to connect the websocket's socket, if one was opened."""
+
+    @property
+    def opened(self) -> int:
+        """How many new connections the warm-up opened, as opposed to reused."""
+        return sum(1 for timing in self.timings if timing.reused_connection is False)
+
+
+def _check(client: Union[Client, AsyncClient], n_connections: int) -> None:
+    if n_connections < 1:
+        raise ValueError(f"n_connections must be at least 1, got {n_connections}")
+    limits = [
+        client.max_connections,
+        client.max_keepalive_connections,
+        client.max_connections_per_host,
+    ]
+    limit = min((limit for limit in limits if limit is not None), default=None)
+    if limit is not None and n_connections > limit:
+        raise ValueError(
+            f"can't park {n_connections} connections in a pool that keeps {limit}"
+        )
+
+
+def _check_interval(
+    client: Union[Client, AsyncClient], refresh_interval: Optional[float]
+) -> None:
+    if refresh_interval is None:
+        return
+    if refresh_interval <= 0:
+        raise ValueError(f"refresh_interval must be positive, got {refresh_interval}")
+    expiry = client.keepalive_expiry
+    if expiry is not None and refresh_interval >= expiry:
+        raise ValueError(
+            f"refresh_interval ({refresh_interval}s) must be below "
+            f"keepalive_expiry ({expiry}s), or connections expire between refreshes"
+        )
+
+
+def _request(
+    http_client: Union[httpx.Client, httpx.AsyncClient],
+    client: Union[Client, AsyncClient],
+    index: int,
+) -> httpx.Request:
+    # A header unique to each request keeps single-flight from coalescing
+    # them, and ``no-store`` keeps the response cache out of the way.
+    headers = {
+        **client.get_headers(),
+        "Cache-Control": "no-store",
+        "X-KittyCAD-Warmup": str(index),
+    }
+    return http_client.build_request(
+        "GET",
+        f"{client.base_url}/ping",
+        headers=headers,
+        timeout=client.get_timeout(),
+        extensions={OPERATION_EXTENSION: WARMUP_OPERATION},
+    )
+
+
+def _raise_first(results: Sequence[Any]) -> List[TimingBreakdown]:
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return list(results)
+
+
+def _websocket_address(base_url: str) -> Optional[tuple]:
+    """The address to connect the websocket's socket to, unless proxied."""
+    uri = parse_uri(base_url.replace("http", "ws", 1))
+    if get_proxy(uri) is not None:
+        # websockets ignores the proxy when given a socket.
+        return None
+    return uri.host, uri.port
+
+
+def _connect(address: tuple, timeout: float) -> socket.socket:
+    sock = socket.create_connection(address, timeout=timeout)
+    sock.settimeout(None)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    return sock
+
+
+def _is_alive(sock: socket.socket) -> bool:
+    """Whether a parked socket is still open at both ends, and unread."""
+    sock.setblocking(False)
+    try:
+        sock.recv(1, socket.MSG_PEEK)
+    except BlockingIOError:
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.setblocking(True)
+    # Either the peer closed it or sent something no websocket expects.
+    return False
+
+
+class _WarmerBase:
+    """Holds what a client's warm-ups left behind: a refresher and a socket."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._socket: Optional[socket.socket] = None
+
+    def park(self, sock: socket.socket) -> None:
+        with self._lock:
+            old, self._socket = self._socket, sock
+        if old is not None:
+            old.close()
+
+    def needs_socket(self) -> bool:
+        with self._lock:
+            return self._socket is None or not _is_alive(self._socket)
+
+    def take_socket(self) -> Optional[socket.socket]:
+        """Take the parked socket for a websocket, if it's still usable."""
+        with self._lock:
+            sock, self._socket = self._socket, None
+        if sock is not None and not _is_alive(sock):
+            sock.close()
+            return None
+        return sock
+
+    def stop(self) -> None:
+        """Stop refreshing."""
+
+    def forget(self) -> None:
+        """Drop everything in a forked child, closing its copy of the socket.
+
+        The refresher didn't survive the fork: a thread isn't copied, and a
+        task belongs to the parent's event loop.
+        """
+        self._lock = threading.Lock()
+        sock, self._socket = self._socket, None
+        if sock is not None:
+            sock.close()
+
+    def close(self) -> None:
+        """Stop refreshing and close the parked socket."""
+        self.stop()
+        with self._lock:
+            sock, self._socket = self._socket, None
+        if sock is not None:
+            sock.close()
+
+
+class _Warmer(_WarmerBase):
+    """The warm-up state of a sync :class:`~kittycad.client.Client`."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._stop: Optional[threading.Event] = None
+
+    def warm(
+        self,
+        client: Client,
+        n_connections: int,
+        *,
+        refresh_interval: Optional[float] = None,
+        websocket: bool = False,
+    ) -> WarmupReport:
+        _check(client, n_connections)
+        _check_interval(client, refresh_interval)
+        report = self._warm(client, n_connections, websocket)
+        if refresh_interval is not None:
+            self._start(client, n_connections, refresh_interval, websocket)
+        return report
+
+    def _warm(
+        self, client: Client, n_connections: int, websocket: bool
+    ) -> WarmupReport:
+        start = time.perf_counter()
+        http_client = client.get_http_client()
+        barrier = threading.Barrier(n_connections)
+        timeout = client.get_timeout()
+
+        @wrap_httpx_exceptions("GET", f"{client.base_url}/ping")
+        def open_one(index: int) -> TimingBreakdown:
+            request = _request(http_client, client, index)
+            timer = _Timer(request)
+            # Not ``timer.trace``: a TimingTransport would take that for a
+            # timer of its own, left over from a retried attempt, and drop it.
+            request.extensions["trace"] = lambda name, info: timer.record(name, info)
+            try:
+                response = http_client.send(request, stream=True)
+            except Exception as e:
+                timer.failed(e)
+                barrier.abort()
+                raise
+            timer.headers(response)
+            try:
+                # Hold this connection until all of them are open.
+                barrier.wait(timeout)
+            except threading.BrokenBarrierError:
+                pass
+            # Reading the body returns the connection to the pool.
+            try:
+                response.read()
+            finally:
+                response.close()
+                timer.end()
+            return timer.timing
+
+        websocket_connect = None
+        address = _websocket_address(client.base_url) if websocket else None
+        with ThreadPoolExecutor(n_connections) as pool:
+            futures = [pool.submit(open_one, i) for i in range(n_connections)]
+            if address is not None and self.needs_socket():
+                began = time.perf_counter()
+                self.park(_connect(address, timeout))
+                websocket_connect = time.perf_counter() - began
+        timings = _raise_first([f.exception() or f.result() for f in futures])
+        return WarmupReport(
+            timings=timings,
+            duration=time.perf_counter() - start,
+            websocket_connect=websocket_connect,
+        )
+
+    def _start(
+        self, client: Client, n_connections: int, interval: float, websocket: bool
+    ) -> None:
+        self.stop()
+        stop = self._stop = threading.Event()
+        ref = weakref.ref(client)
+
+        def refresh() -> None:
+            while not stop.wait(interval):
+                client = ref()
+                if client is None:
+                    return
+                try:
+                    self._warm(client, n_connections, websocket)
+                except Exception:
+                    # Already reported through the client's event hooks.
+                    pass
+                del client
+
+        threading.Thread(target=refresh, name="kittycad-warmup", daemon=True).start()
+
+    def stop(self) -> None:
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
+
+    def forget(self) -> None:
+        self._stop = None
+        super().forget()
+
+
+class _AsyncWarmer(_WarmerBase):
+    """The warm-up state of an :class:`~kittycad.client.AsyncClient`."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def warm(
+        self,
+        client: AsyncClient,
+        n_connections: int,
+        *,
+        refresh_interval: Optional[float] = None,
+        websocket: bool = False,
+    ) -> WarmupReport:
+        _check(client, n_connections)
+        _check_interval(client, refresh_interval)
+        report = await self._warm(client, n_connections, websocket)
+        if refresh_interval is not None:
+            self._start(client, n_connections, refresh_interval, websocket)
+        return report
+
+    async def _warm(
+        self, client: AsyncClient, n_connections: int, websocket: bool
+    ) -> WarmupReport:
+        start = time.perf_counter()
+        http_client = client.get_http_client()
+        all_open = asyncio.Event()
+        opened = 0
+        timeout = client.get_timeout()
+
+        @wrap_httpx_exceptions_async("GET", f"{client.base_url}/ping")
+        async def open_one(index: int) -> TimingBreakdown:
+            nonlocal opened
+            request = _request(http_client, client, index)
+            timer = _Timer(request)
+
+            async def trace(name: str, info: Dict[str, Any]) -> None:
+                # See the sync warm-up for why this isn't ``timer.atrace``.
+                timer.record(name, info)
+
+            request.extensions["trace"] = trace
+            try:
+                response = await http_client.send(request, stream=True)
+            except Exception as e:
+                timer.failed(e)
+                raise
+            finally:
+                opened += 1
+                if opened == n_connections:
+                    all_open.set()
+            timer.headers(response)
+            try:
+                # Hold this connection until all of them are open.
+                await asyncio.wait_for(all_open.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            # Reading the body returns the connection to the pool.
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+                timer.end()
+            return timer.timing
+
+        async def open_websocket() -> Optional[float]:
+            address = _websocket_address(client.base_url) if websocket else None
+            if address is None or not self.needs_socket():
+                return None
+            began = time.perf_counter()
+            self.park(await asyncio.to_thread(_connect, address, timeout))
+            return time.perf_counter() - began
+
+        *results, websocket_connect = await asyncio.gather(
+            *(open_one(i) for i in range(n_connections)),
+            open_websocket(),
+            return_exceptions=True,
+        )
+        timings = _raise_first(results)
+        if isinstance(websocket_connect, BaseException):
+            raise websocket_connect
+        return WarmupReport(
+            timings=timings,
+            duration=time.perf_counter() - start,
+            websocket_connect=websocket_connect,
+        )
+
+    def _start(
+        self, client: AsyncClient, n_connections: int, interval: float, websocket: bool
+    ) -> None:
+        self.stop()
+        ref = weakref.ref(client)
+
+        async def refresh() -> None:
+            while True:
+                await asyncio.sleep(interval)
+                client = ref()
+                if client is None:
+                    return
+                try:
+                    await self._warm(client, n_connections, websocket)
+                except Exception:
+                    # Already reported through the client's event hooks.
+                    pass
+                del client
+
+        self._task = asyncio.get_running_loop().create_task(refresh())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def forget(self) -> None:
+        self._task = None
+        super().forget()
+
+
+__all__ = ["WARMUP_OPERATION", "WarmupReport"]
@@ -0,0 +1,70 @@
+"""One client per process for ``ProcessPoolExecutor`` and ``multiprocessing``.
+
+Clients are fork-safe on their own: a forked child drops the connection
+pool it inherited and opens its own on first use. What a pool of worker
+processes still needs is a client per process that every task it runs
+reuses, rather than one created (and one pool opened) per task. Pass
+:func:`init_worker_client` as the pool's initializer, with a factory that
+builds the client, and get the client in tasks with :func:`worker_client`.
+
+The factory is pickled for ``spawn`` and ``forkserver`` pools, so make it a
+class or a :func:`functools.partial` rather than a lambda.
+
+Example:
+    >>> import functools
+    >>> from concurrent.futures import ProcessPoolExecutor
+    >>> from kittycad import KittyCAD
+    >>> from kittycad.workers import init_worker_client, worker_client
+    >>> def ping(_):
+    ...     return worker_client(KittyCAD).meta.ping().message
+    >>> factory = functools.partial(KittyCAD, token="my-token")
+    >>> with ProcessPoolExecutor(
+    ...     initializer=init_worker_client, initargs=(factory,)
+    ... ) as pool:  # doctest: +SKIP
+    ...     print(list(pool.map(ping, range(3))))
+    ['pong', 'pong', 'pong']
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Type, TypeVar, Union
+
+from .client import AsyncClient, Client
+
+C = TypeVar("C", bound=Union[Client, AsyncClient])
+
+_client: Any = None
+
+
+def init_worker_client(factory: Callable[[], Union[Client, AsyncClient]]) -> None:
+    """Build this process's client with ``factory``.
+
+    Meant as the ``initializer`` of a process pool, but may be called
+    anywhere; calling it again replaces the client.
+    """
+    global _client
+    _client = factory()
+
+
+def worker_client(cls: Type[C]) -> C:
+    """Get this process's client, which must be an instance of ``cls``.
+
+    Raises:
+        RuntimeError: :func:`init_worker_client` wasn't called in this
+            process (or in the parent it was forked from).
+        TypeError: the factory built something other than a ``cls``.
+    """
+    client = _client
+    if client is None:
+        raise RuntimeError(
+            "no worker client: pass init_worker_client as the process pool's "
+            "initializer"
+        )
+    if not isinstance(client, cls):
+        raise TypeError(
+            f"the worker client is a {type(client).__name__}, not a {cls.__name__}"
+        )
+    return client
+
+
+__all__ = ["init_worker_client", "worker_client"]